@@ -1,13 +1,24 @@
 from util_metadata_generator import question_metadata_generator
 from util_javascript_generator import js_generator
-from util_question_html_generator import question_html_generator
+from util_question_html_generator import question_html_generator, question_html_candidates
 from util_solution_html_generator import question_solution_guide
 from util_validation import validate_question_html_format
+from util_html_repair import repair_question_html
 from util_file_export import export_files, create_folder
 from util_generate_variations import GenerateVariation
 from utils_user_input import gather_user_information
 from utils_user_input import extract_question_image_or_text
 from util_generation_misc import create_variation_solution
+from util_request_governor import get_governor
+from util_hedging import get_hedger
+from util_telemetry import get_telemetry, instrument
+from util_tracing import get_tracer
+from util_warmup import start_warmup
+from util_speculation import SpeculativeGenerator
+from util_concurrency import map_ordered, ItemError
+from util_deduplication import deduplicate_questions
+from util_artifact_reuse import reuse_artifacts
+from util_js_verification import verify_server_js
 from credential import api_key
 
 import os
@@ -54,6 +65,9 @@ def remove_questions(questions_to_process):
 
     Parameters:
     questions_to_process (list): A list of tuples containing questions and solutions.
+
+    Returns:
+    list: The questions that were kept.
     """
     remove_indices = input("""Before generation begins please review the questions. If there is any question you want removed  
                            Enter the number of the question you want to remove (comma-separated), or press Enter to continue: """)
@@ -61,6 +75,7 @@ def remove_questions(questions_to_process):
     if remove_indices:
         indices_to_remove = [int(idx) - 1 for idx in remove_indices.split(",") if idx.isdigit()]
         questions_to_process = [q for idx, q in enumerate(questions_to_process) if idx not in indices_to_remove]
+    return questions_to_process
         
 def update_config_with_user_input(config):
     """
@@ -89,37 +104,98 @@ def update_config_with_user_input(config):
 
     return config
 
-def attempt_generate_html(question, api_key, csv_path, max_attempts=3,additional_instructions=None):
+def attempt_generate_html(question, api_key, csv_path, max_attempts=3,additional_instructions=None, repair=True, n_candidates=1, initial_html=None):
     """
     Attempts to generate HTML for the given question and validates its format.
 
+    With repair enabled, HTML that fails validation is fixed instead of regenerated:
+    locally where the fix is mechanical, otherwise by sending the HTML and the
+    validation error back as a short fix-up request.
+
     Parameters:
     question (str): The question content or text.
     api_key (str): API key for the service.
     csv_path (str): Path to the CSV file.
     max_attempts (int): Maximum number of validation attempts.
+    repair (bool): Repair failed HTML rather than generating it again.
+    n_candidates (int): Number of concurrent candidates per generation, the first valid one is used.
+    initial_html (str, optional): Already generated HTML, e.g. from speculative generation, validated before generating anew.
 
     Returns:
     str: Validated HTML content for the question.
     """
+    question_html = initial_html
     for attempt in range(max_attempts):
-        question_html = question_html_generator(question, api_key, csv_path,additional_instructions)
+        if question_html is None and n_candidates > 1:
+            question_html, valid = question_html_candidates(question, api_key, csv_path, n_candidates, additional_instructions)
+            if valid:
+                return question_html
+        elif question_html is None:
+            question_html = question_html_generator(question, api_key, csv_path,additional_instructions)
         try:
             validate_question_html_format(question_html)
             return question_html
         except ValueError as e:
             print(f"Attempt {attempt + 1}: HTML format validation failed: {e}")
+            if attempt == max_attempts - 1:
+                break
+            if repair:
+                try:
+                    question_html = repair_question_html(question_html, str(e), question, api_key)
+                    continue
+                except Exception as repair_error:
+                    print(f"Repair failed, generating the HTML again: {repair_error}")
+            question_html = None
     raise ValueError("Maximum validation attempts reached. Validation failed.")
 
-def process_question(question: str, config: dict, export_path: str):
+def start_speculative_generation(speculation, questions_to_process, config):
+    """
+    Starts metadata and question.html generation for every listed question while the operator reviews them.
+
+    Whether a question is adaptive is only known from its metadata, so the speculative HTML is the
+    plain question_html_generator output both paths start from. The adaptive path validates and
+    repairs it; the non-adaptive path uses it as is.
+
+    Parameters:
+    speculation (SpeculativeGenerator): The speculative generator.
+    questions_to_process (list): A list of tuples containing questions and solutions.
+    config (dict): The configuration dictionary.
+    """
+    for question, _ in questions_to_process:
+        speculation.submit(
+            question, "metadata", question_metadata_generator,
+            config['api_key'], question, config['created_by'], config['code_language'],
+            fingerprint=(config['created_by'], config['code_language'])
+        )
+        speculation.submit(
+            question, "question_html", question_html_generator,
+            question, config['api_key'], config['csv_file'],
+            additional_instructions=config.get('additional_instructions'),
+            fingerprint=config.get('additional_instructions')
+        )
+
+@instrument("process_question")
+def process_question(question: str, config: dict, export_path: str, speculation=None):
     # Unpack configuration dictionary
     api_key = config['api_key']
     csv_file = config['csv_file']
     created_by = config['created_by']
     code_language = config['code_language']
+    get_tracer().set_attribute("question", question)
+
+    # Clone the files of a nearly identical stored question instead of generating them
+    if not config['force_regeneration'] and reuse_artifacts(question, config, export_path):
+        if speculation:
+            speculation.discard(question)
+        return True
+
+    # Use the results of speculative generation where their inputs are still current
+    meta_data = speculation.take(question, "metadata", (created_by, code_language)) if speculation else None
+    generated_html = speculation.take(question, "question_html", config.get('additional_instructions')) if speculation else None
 
     # Generate metadata and determine the path
-    meta_data = question_metadata_generator(api_key, question, created_by, code_language)
+    if meta_data is None:
+        meta_data = question_metadata_generator(api_key, question, created_by, code_language)
     is_adaptive = meta_data.get("isAdaptive", "").lower()
     question_path = os.path.join(export_path, meta_data.get("title"))
     create_folder(meta_data.get("title"),export_path)
@@ -130,25 +206,35 @@ def process_question(question: str, config: dict, export_path: str):
 
     # Process based on the question type
     if is_adaptive == "true":
-        process_adaptive(question,meta_data, question_path,config=config)
-    else:
-        process_non_adaptive(question, question_path, meta_data=meta_data,config=config)
-def process_adaptive(question, meta_data, question_path, config):
+        return process_adaptive(question,meta_data, question_path,config=config,generated_html=generated_html)
+    process_non_adaptive(question, question_path, meta_data=meta_data,config=config,generated_html=generated_html)
+    return True
+def process_adaptive(question, meta_data, question_path, config, generated_html=None):
 
-    # Generate content once to avoid redundancy
+    # Generate content once to avoid redundancy; speculative HTML is validated like freshly generated HTML
     generated_html = attempt_generate_html(
         question, 
         api_key=config['api_key'], 
         csv_path=config['csv_file'], 
-        additional_instructions=config.get('additional_instructions')
-    )
-    generated_js = js_generator(
-        question=generated_html, 
-        api_key=config['api_key'], 
-        csv_path=config['csv_file'], 
-        solution_guide=config.get('solution_guide'), 
-        retrieval_optimization=config.get('retrieval_optimization', False)
+        additional_instructions=config.get('additional_instructions'),
+        n_candidates=config['html_candidates'],
+        initial_html=generated_html
     )
+    # Run server.js before anything is built on it, and generate it again if its output is broken
+    for attempt in range(config["server_js_attempts"]):
+        generated_js = js_generator(
+            question=generated_html, 
+            api_key=config['api_key'], 
+            csv_path=config['csv_file'], 
+            solution_guide=config.get('solution_guide'), 
+            retrieval_optimization=config.get('retrieval_optimization', False)
+        )
+        if not config["verify_server_js"] or verify_server_js(generated_js, generated_html, samples=config["verification_samples"])["ok"]:
+            break
+        print(f"Attempt {attempt + 1}: server.js failed verification")
+    else:
+        print("server.js failed verification on every attempt, skipping the solution and export for this question")
+        return False
     generated_solution = question_solution_guide(
         question, 
         api_key=config['api_key'], 
@@ -169,15 +255,17 @@ def process_adaptive(question, meta_data, question_path, config):
     for file_name, generator in content_generators.items():
         content = generator()  # Call the generator function to get content
         export_files(file_name, content, question_path, config['api_key'],model_name=config["export_model"])
+    return True
 
-def process_non_adaptive(question, question_path,meta_data, config):
+def process_non_adaptive(question, question_path,meta_data, config, generated_html=None):
     # Generate HTML content
-    generated_html = question_html_generator(
-        question=question, 
-        api_key=config['api_key'], 
-        csv_path=config['csv_file'], 
-        additional_instructions=config.get('additional_instructions')
-    )
+    if generated_html is None:
+        generated_html = question_html_generator(
+            question=question, 
+            api_key=config['api_key'], 
+            csv_path=config['csv_file'], 
+            additional_instructions=config.get('additional_instructions')
+        )
     # Export the generated HTML
     export_files("question.html", generated_html, question_path, config['api_key'],model_name=config["export_model"])
     # Export the metadata as JSON
@@ -194,10 +282,26 @@ def main():
         "solution_guide": None,  # Placeholder for solution guide path or content
         "additional_instructions": None,  # Placeholder for any additional instructions
         "retrieval_optimization": False,  # Placeholder for retrieval optimization flag
-        "export_path": r"question_output\preclass7" # Replace with where you want questions to be exported
+        "export_path": r"question_output\preclass7", # Replace with where you want questions to be exported
+        "request_hedging": False,  # Send a duplicate of slow temperature 0 completions and keep the first answer
+        "metrics_path": "metrics/run_metrics.jsonl",  # Per-stage telemetry, use a .prom extension for Prometheus text
+        "trace_path": "metrics/trace.json",  # Per-question spans for chrome://tracing or Perfetto, use .otlp.json for OTLP
+        "warmup": True,  # Load the dataset, clients and prompts in the background while the questions below are answered
+        "max_concurrency": 4,  # Concurrent calls when fanning out over question variations
+        "variation_mode": "per_known",  # "per_known" requests one variation per known, "batch" all variations of a question at once
+        "deduplication_threshold": None,  # e.g. 0.95 drops variations more similar than this to another question before review, None keeps all
+        "reuse_threshold": 0.98,  # Reuse the stored files of a dataset question this similar with the same text and numbers, None never reuses
+        "force_regeneration": False,  # Generate every question even if a nearly identical one is stored
+        "html_candidates": 1,  # Generate this many question.html candidates concurrently and keep the first valid one
+        "verify_server_js": False,  # Run generate() locally in node before building on it, needs npm install in stable_properties
+        "verification_samples": 200,  # generate() calls per verification
+        "server_js_attempts": 2,  # server.js generations before a question whose module keeps failing is skipped
+        "speculative_generation": False,  # Start metadata and question.html for listed questions while they are being reviewed
     }
+    get_hedger().configure(enabled=config["request_hedging"])
+    warmup = start_warmup(config["api_key"], config["csv_file"]) if config["warmup"] else None
     # Initialize classes
-    variation_generator = GenerateVariation(config["api_key"])
+    variation_generator = GenerateVariation(config["api_key"], llm_options={"model": "gpt-4", "temperature": "0", "max_concurrency": config["max_concurrency"], "variation_mode": config["variation_mode"]})
     
     user_data = gather_user_information()
     
@@ -214,19 +318,38 @@ def main():
     questions_to_process = [(str(question), solution_guide)]
     if generate_variations_response.lower() == "yes":
         question_variations = variation_generator.generate_question_variation(question if isinstance(question, str) else question[0])
-        for data in question_variations:
+        # Write the solution guides of all variations concurrently, keeping their order
+        new_solutions = map_ordered(
+            lambda data: create_variation_solution(question, solution_guide, data.get("question_variation"), data.get("new_unknown"), config["api_key"]),
+            question_variations if solution_guide else [],
+            max_workers=config["max_concurrency"]
+        )
+        for index, data in enumerate(question_variations):
             question_variation = data.get("question_variation")
             new_unknown = data.get("new_unknown")
             print("Solution Guide: \n",solution_guide)
             print("New Unkown: ", new_unknown)
             print("Question Variation:", question)
-            new_solution = create_variation_solution(question, solution_guide, question_variation, new_unknown, config["api_key"]) if solution_guide else None
+            new_solution = new_solutions[index] if solution_guide else None
+            if isinstance(new_solution, ItemError):
+                print(f"Could not create a solution guide for variation {index + 1}: {new_solution.error}")
+                new_solution = None
             questions_to_process.append((question_variation, new_solution))
+        # Drop variations that repeat each other or questions already in the dataset
+        if config["deduplication_threshold"] is not None:
+            questions_to_process = deduplicate_questions(
+                questions_to_process, config["api_key"], config["csv_file"], threshold=config["deduplication_threshold"]
+            )
             
     # Display all questions and solutions
     display_questions(questions_to_process)
+    speculation = SpeculativeGenerator() if config["speculative_generation"] else None
+    if speculation is not None:
+        start_speculative_generation(speculation, questions_to_process, config)
     # Ask user to review and remove questions
-    remove_questions(questions_to_process)
+    questions_to_process = remove_questions(questions_to_process)
+    if speculation is not None:
+        speculation.keep_only([question for question, _ in questions_to_process])
     
     config = update_config_with_user_input(config)
     
@@ -244,11 +367,22 @@ def main():
     
     export_path = config["export_path"]
     print(questions_to_process)
+    if warmup is not None:
+        warmup.wait()
     for question,solutions in questions_to_process:
         config["solution_guide"] = solutions
         
-        if not process_question(question=question,config=config,export_path=export_path):
+        if not process_question(question=question,config=config,export_path=export_path,speculation=speculation):
             print(f"Failed to process question: {question}")
+    if speculation is not None:
+        speculation.shutdown()
+
+    # Report where time and tokens went during this run
+    telemetry = get_telemetry()
+    telemetry.print_summary()
+    telemetry.export(config["metrics_path"], extra={"governor": get_governor().metrics(), "hedging": get_hedger().metrics()})
+    get_tracer().export(config["trace_path"])
+    print(f"Trace written to {config['trace_path']}")
             
             
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+/**
+ * Compiled steam tables: water properties for fast lookups in generated question code.
+ *
+ * Usage:
+ * const { steamProperties, saturatedByPressure, saturatedByTemperature } = require('./steam_tables_compiled');
+ *
+ * Generated by util_steam_tables.compile_steam_tables from saturated_by_pressure_V1.4.json, saturated_by_temperature_V1.5.json, compressed_liquid_and_superheated_steam_V1.3.json; do not edit by hand.
+ * Units: P in MPa, T in °C, v in m^3/kg, rho in kg/m^3, u and h in kJ/kg, s in kJ/(kg K).
+ * Every lookup returns NaN properties outside the tabulated range.
+ */
+
+"use strict";
+
+const SATURATED_BY_PRESSURE = {
+    P: new Float64Array([0.000611657,0.0007,0.0008,0.0009,0.001,0.0012,0.0014,0.0016,0.0018,0.002,0.0024,0.0028,0.0032,0.0036,0.004,0.0045,0.005,0.0055,0.006,0.0065,0.007,0.0075,0.008,0.0085,0.009,0.0095,0.01,0.011,0.012,0.013,0.014,0.016,0.018,0.02,0.024,0.028,0.032,0.036,0.04,0.045,0.05,0.05,0.055,0.06,0.065,0.07,0.075,0.08,0.085,0.09,0.095,0.1,0.11,0.12,0.13,0.14,0.15,0.16,0.17,0.18,0.19,0.2,0.21,0.22,0.23,0.24,0.25,0.26,0.27,0.28,0.29,0.3,0.31,0.32,0.33,0.34,0.35,0.36,0.37,0.38,0.39,0.4,0.4,0.42,0.44,0.46,0.48,0.5,0.52,0.54,0.56,0.58,0.6,0.62,0.64,0.66,0.68,0.7,0.72,0.74,0.76,0.78,0.8,0.82,0.84,0.86,0.88,0.9,0.92,0.94,0.96,0.98,1,1.05,1.1,1.15,1.2,1.25,1.3,1.35,1.4,1.45,1.5,1.5,1.55,1.6,1.65,1.7,1.75,1.8,1.85,1.9,1.95,2,2.1,2.2,2.3,2.4,2.5,2.6,2.7,2.8,2.9,3,3.1,3.2,3.3,3.4,3.5,3.6,3.7,3.8,3.9,4,4.1,4.2,4.3,4.4,4.5,4.6,4.7,4.8,4.9,5,5.1,5.2,5.3,5.4,5.5,5.6,5.7,5.8,5.9,6,6.1,6.2,6.3,6.4,6.5,6.6,6.7,6.8,6.9,7,7.1,7.2,7.3,7.4,7.5,7.6,7.7,7.8,7.9,8,8.1,8.2,8.3,8.4,8.5,8.6,8.7,8.8,8.9,9,9,9.1,9.2,9.3,9.4,9.5,9.6,9.7,9.8,9.9,10,10.2,10.4,10.6,10.8,11,11.2,11.4,11.6,11.8,12,12.2,12.4,12.6,12.8,13,13.2,13.4,13.6,13.8,14,14.2,14.4,14.6,14.8,15,15.2,15.4,15.6,15.8,16,16,16.2,16.4,16.6,16.8,17,17.2,17.4,17.6,17.8,18,18.2,18.4,18.6,18.8,19,19.2,19.4,19.6,19.8,20,20.2,20.4,20.6,20.8,21,21.2,21.4,21.6,21.8,22,22.064]),
+    T: new Float64Array([0.01,1.881,3.761,5.444,6.97,9.654,11.969,14.01,15.837,17.495,20.414,22.935,25.158,27.152,28.96,31.012,32.874,34.581,36.159,37.627,39,40.29,41.509,42.663,43.761,44.807,45.806,47.683,49.419,51.034,52.547,55.313,57.798,60.058,64.053,67.518,70.586,73.345,75.857,78.715,81.317,81.317,83.709,85.926,87.993,89.932,91.758,93.486,95.125,96.687,98.178,99.606,102.292,104.784,107.109,109.292,111.349,113.297,115.148,116.911,118.596,120.21,121.759,123.25,124.686,126.072,127.411,128.708,129.965,131.185,132.37,133.522,134.644,135.737,136.802,137.842,138.857,139.849,140.819,141.769,142.698,143.608,143.608,145.375,147.076,148.716,150.3,151.831,153.314,154.753,156.149,157.506,158.826,160.112,161.365,162.587,163.781,164.946,166.086,167.2,168.291,169.36,170.406,171.433,172.44,173.428,174.398,175.35,176.287,177.207,178.112,179.002,179.878,182.009,184.062,186.043,187.957,189.809,191.605,193.347,195.039,196.685,198.287,198.287,199.848,201.37,202.856,204.307,205.725,207.112,208.469,209.798,211.101,212.377,214.858,217.249,219.557,221.789,223.95,226.046,228.08,230.057,231.98,233.853,235.679,237.459,239.198,240.897,242.557,244.182,245.772,247.33,248.857,250.354,251.823,253.264,254.68,256.07,257.437,258.78,260.101,261.402,262.681,263.941,265.181,266.403,267.608,268.795,269.965,271.12,272.258,273.382,274.49,275.585,276.666,277.733,278.787,279.829,280.858,281.875,282.88,283.874,284.857,285.829,286.79,287.741,288.682,289.614,290.535,291.448,292.351,293.245,294.131,295.008,295.876,296.737,297.589,298.434,299.271,300.1,300.922,301.737,302.544,303.345,303.345,304.139,304.926,305.707,306.481,307.249,308.01,308.766,309.516,310.259,310.997,312.456,313.893,315.308,316.703,318.079,319.434,320.771,322.09,323.391,324.675,325.942,327.194,328.429,329.649,330.854,332.044,333.22,334.382,335.531,336.666,337.789,338.899,339.996,341.082,342.155,343.217,344.268,345.308,346.337,347.355,347.355,348.362,349.36,350.347,351.325,352.293,353.251,354.2,355.14,356.071,356.992,357.906,358.81,359.706,360.594,361.473,362.344,363.208,364.063,364.91,365.749,366.581,367.404,368.22,369.027,369.827,370.619,371.402,372.178,372.946,373.705,373.946]),
+    vf: new Float64Array([0.00100021,0.00100011,0.00100008,0.00100009,0.00100014,0.00100032,0.00100054,0.0010008,0.00100108,0.00100136,0.00100193,0.00100249,0.00100305,0.00100358,0.0010041,0.00100473,0.00100533,0.0010059,0.00100645,0.00100699,0.0010075,0.001008,0.00100848,0.00100895,0.0010094,0.00100984,0.00101027,0.0010111,0.00101188,0.00101263,0.00101335,0.00101471,0.00101597,0.00101716,0.00101934,0.00102131,0.00102312,0.0010248,0.00102638,0.00102821,0.00102993,0.00102993,0.00103154,0.00103307,0.00103452,0.0010359,0.00103723,0.0010385,0.00103972,0.00104091,0.00104205,0.00104315,0.00104527,0.00104727,0.00104917,0.00105099,0.00105273,0.0010544,0.001056,0.00105756,0.00105906,0.00106052,0.00106193,0.0010633,0.00106464,0.00106594,0.00106722,0.00106846,0.00106968,0.00107086,0.00107203,0.00107317,0.00107429,0.00107539,0.00107647,0.00107753,0.00107857,0.0010796,0.00108061,0.00108161,0.00108259,0.00108355,0.00108355,0.00108544,0.00108729,0.00108908,0.00109084,0.00109255,0.00109423,0.00109587,0.00109748,0.00109905,0.0011006,0.00110212,0.00110362,0.00110509,0.00110654,0.00110796,0.00110936,0.00111075,0.00111211,0.00111346,0.00111478,0.00111609,0.00111739,0.00111867,0.00111993,0.00112118,0.00112242,0.00112364,0.00112485,0.00112605,0.00112723,0.00113014,0.00113299,0.00113577,0.0011385,0.00114118,0.0011438,0.00114638,0.00114892,0.00115141,0.00115387,0.00115387,0.00115629,0.00115868,0.00116103,0.00116336,0.00116565,0.00116792,0.00117016,0.00117238,0.00117458,0.00117675,0.00118103,0.00118523,0.00118936,0.00119343,0.00119743,0.00120138,0.00120528,0.00120913,0.00121293,0.00121669,0.00122042,0.0012241,0.00122776,0.00123138,0.00123497,0.00123854,0.00124208,0.00124559,0.00124908,0.00125256,0.00125601,0.00125944,0.00126286,0.00126626,0.00126965,0.00127302,0.00127638,0.00127973,0.00128306,0.00128639,0.00128971,0.00129302,0.00129632,0.00129961,0.0013029,0.00130618,0.00130946,0.00131273,0.001316,0.00131926,0.00132253,0.00132579,0.00132905,0.0013323,0.00133556,0.00133882,0.00134208,0.00134533,0.00134859,0.00135186,0.00135512,0.00135839,0.00136166,0.00136493,0.00136821,0.00137149,0.00137477,0.00137806,0.00138136,0.00138467,0.00138797,0.00139129,0.00139461,0.00139795,0.00140128,0.00140463,0.00140799,0.00141135,0.00141473,0.00141811,0.00141811,0.00142151,0.00142491,0.00142833,0.00143176,0.0014352,0.00143865,0.00144212,0.0014456,0.00144909,0.00145259,0.00145965,0.00146676,0.00147394,0.00148119,0.00148851,0.0014959,0.00150337,0.00151093,0.00151857,0.0015263,0.00153413,0.00154205,0.00155009,0.00155823,0.00156649,0.00157487,0.00158338,0.00159202,0.00160081,0.00160974,0.00161883,0.00162809,0.00163752,0.00164714,0.00165695,0.00166697,0.00167722,0.0016877,0.00169843,0.00170944,0.00170944,0.00172073,0.00173233,0.00174427,0.00175657,0.00176926,0.00178237,0.00179593,0.00181,0.0018246,0.0018398,0.00185564,0.00187219,0.00188951,0.00190767,0.00192677,0.00194689,0.00196814,0.00199064,0.0020145,0.00204,0.0020674,0.0020969,0.0021291,0.0021649,0.0022055,0.0022531,0.0023115,0.002388,0.0024983,0.0027044,0.0031056]),
+    vg: new Float64Array([205.991,181.217,159.64,142.757,129.178,108.67,93.899,82.743,74.011,66.987,56.375,48.729,42.952,38.43,34.791,31.131,28.185,25.762,23.733,22.009,20.524,19.233,18.099,17.095,16.199,15.396,14.67,13.412,12.358,11.462,10.691,9.4306,8.4431,7.648,6.4453,5.5778,4.9215,4.4072,3.993,3.5759,3.24,3.24,2.9635,2.7317,2.5346,2.3648,2.217,2.0871,1.972,1.8694,1.7772,1.6939,1.5495,1.4284,1.3253,1.2366,1.1593,1.0914,1.0312,0.97747,0.92924,0.88568,0.84614,0.81007,0.77704,0.74668,0.71866,0.69273,0.66865,0.64624,0.62533,0.60576,0.58741,0.57017,0.55395,0.53864,0.52418,0.5105,0.49753,0.48522,0.47352,0.46238,0.46238,0.44165,0.42274,0.40542,0.3895,0.37481,0.3612,0.34858,0.33682,0.32585,0.31558,0.30596,0.29691,0.2884,0.28036,0.27277,0.26559,0.25879,0.25233,0.24618,0.24034,0.23477,0.22946,0.22438,0.21953,0.21489,0.21044,0.20617,0.20208,0.19814,0.19436,0.18552,0.17745,0.17006,0.16326,0.15699,0.15119,0.1458,0.14078,0.13609,0.13171,0.13171,0.1276,0.12374,0.1201,0.11667,0.11343,0.11037,0.10746,0.1047,0.10208,0.099585,0.094938,0.090698,0.086815,0.083244,0.079949,0.076899,0.074066,0.071429,0.068968,0.066664,0.064504,0.062475,0.060564,0.058761,0.057058,0.055446,0.053918,0.052467,0.051089,0.049776,0.048525,0.047332,0.046192,0.045102,0.044059,0.043059,0.0421,0.04118,0.040296,0.039446,0.038628,0.03784,0.037081,0.036348,0.035642,0.034959,0.0343,0.033662,0.033045,0.032448,0.03187,0.031309,0.030766,0.030238,0.029727,0.02923,0.028747,0.028278,0.027822,0.027378,0.026947,0.026526,0.026117,0.025718,0.02533,0.024951,0.024581,0.024221,0.023869,0.023526,0.02319,0.022863,0.022542,0.022229,0.021923,0.021624,0.021332,0.021045,0.020765,0.02049,0.02049,0.020221,0.019958,0.0197,0.019447,0.019199,0.018956,0.018718,0.018484,0.018255,0.01803,0.017592,0.01717,0.016763,0.01637,0.01599,0.015622,0.015266,0.014922,0.014588,0.014264,0.01395,0.013645,0.013349,0.013061,0.01278,0.012508,0.012242,0.011983,0.011731,0.011485,0.011245,0.011011,0.010781,0.010557,0.010338,0.010124,0.009914,0.0097083,0.0095067,0.0093088,0.0093088,0.0091147,0.008924,0.0087366,0.0085523,0.0083709,0.0081923,0.0080163,0.0078426,0.0076712,0.0075017,0.0073341,0.0071681,0.0070034,0.0068399,0.0066773,0.0065153,0.0063535,0.0061915,0.006029,0.0058652,0.0056996,0.0055313,0.005359,0.0051814,0.0049961,0.0048,0.004588,0.0043508,0.004068,0.0036475,0.0031056]),
+    uf: new Float64Array([0,7.89,15.81,22.89,29.3,40.57,50.28,58.83,66.49,73.43,85.65,96.19,105.49,113.83,121.39,129.96,137.74,144.87,151.47,157.6,163.34,168.74,173.83,178.66,183.24,187.62,191.8,199.64,206.9,213.66,219.98,231.55,241.94,251.4,268.13,282.63,295.49,307.05,317.58,329.57,340.49,340.49,350.53,359.85,368.53,376.68,384.36,391.63,398.53,405.11,411.38,417.4,428.73,439.23,449.05,458.27,466.97,475.21,483.04,490.51,497.65,504.49,511.07,517.4,523.5,529.38,535.07,540.59,545.95,551.14,556.19,561.11,565.89,570.56,575.1,579.54,583.88,588.13,592.28,596.34,600.32,604.22,604.22,611.79,619.1,626.14,632.95,639.54,645.93,652.13,658.16,664.01,669.72,675.28,680.7,686,691.17,696.22,701.17,706.02,710.76,715.41,719.97,724.44,728.84,733.15,737.38,741.55,745.65,749.67,753.64,757.55,761.39,770.75,779.78,788.51,796.96,805.15,813.11,820.84,828.36,835.68,842.83,842.83,849.8,856.61,863.25,869.76,876.13,882.37,888.49,894.48,900.37,906.15,917.39,928.26,938.79,949.01,958.92,968.55,977.93,987.07,995.99,1004.6,1013.2,1021.5,1029.6,1037.6,1045.5,1053.1,1060.7,1068.1,1075.3,1082.5,1089.6,1096.4,1103.3,1109.9,1116.5,1123,1129.5,1135.8,1142,1148.2,1154.3,1160.3,1166.2,1172.1,1177.9,1183.7,1189.3,1195,1200.5,1206,1211.4,1216.9,1222.1,1227.5,1232.7,1237.9,1243,1248.2,1253.2,1258.2,1263.2,1268.1,1273,1277.8,1282.6,1287.5,1292.2,1297,1301.6,1306.2,1310.9,1315.4,1320,1324.6,1329,1333.5,1338,1342.4,1346.7,1351.1,1351.1,1355.5,1359.8,1364.1,1368.3,1372.6,1376.8,1381,1385.2,1389.4,1393.6,1401.8,1409.9,1418.1,1426.1,1434,1441.9,1449.9,1457.7,1465.4,1473.2,1480.8,1488.5,1496.1,1503.7,1511.1,1518.6,1526.1,1533.5,1541,1548.5,1555.8,1563.3,1570.6,1577.9,1585.3,1592.8,1600.1,1607.5,1614.9,1622.3,1622.3,1629.8,1637.3,1644.7,1652.4,1659.9,1667.6,1675.4,1683.1,1691,1699,1707,1715.3,1723.6,1731.9,1740.6,1749.3,1758.2,1767.4,1776.8,1786.4,1796.3,1806.7,1817.5,1829,1841.3,1854.8,1870.2,1888.8,1912.9,1951.8,2015.8]),
+    ug: new Float64Array([2374.9,2377.4,2380.1,2382.4,2384.5,2388.2,2391.3,2394.1,2396.7,2398.9,2402.9,2406.4,2409.4,2412.1,2414.5,2417.3,2419.8,2422.1,2424.2,2426.2,2428,2429.8,2431.4,2433,2434.4,2435.8,2437.2,2439.7,2442,2444.1,2446.1,2449.7,2453,2455.9,2461.2,2465.6,2469.6,2473.1,2476.4,2480,2483.2,2483.2,2486.2,2489,2491.6,2493.9,2496.1,2498.2,2500.2,2502.1,2503.9,2505.5,2508.8,2511.7,2514.3,2516.9,2519.2,2521.4,2523.5,2525.5,2527.3,2529.1,2530.8,2532.4,2534,2535.4,2536.8,2538.2,2539.5,2540.8,2542,2543.2,2544.3,2545.3,2546.5,2547.5,2548.5,2549.4,2550.4,2551.3,2552.2,2553.1,2553.1,2554.8,2556.4,2557.9,2559.3,2560.7,2562.1,2563.3,2564.5,2565.7,2566.8,2567.9,2568.9,2570,2570.9,2571.9,2572.7,2573.6,2574.4,2575.3,2576,2576.8,2577.6,2578.2,2578.9,2579.6,2580.3,2580.9,2581.5,2582.1,2582.7,2584.1,2585.4,2586.6,2587.8,2588.9,2590,2590.9,2591.7,2592.6,2593.4,2593.4,2594.1,2594.8,2595.5,2596.2,2596.7,2597.2,2597.8,2598.3,2598.7,2599.1,2599.9,2600.6,2601.1,2601.6,2602,2602.4,2602.7,2602.9,2603.1,2603.2,2603.2,2603.2,2603.1,2603.1,2602.9,2602.8,2602.6,2602.3,2602.1,2601.7,2601.3,2601,2600.6,2600.2,2599.6,2599.2,2598.6,2598.1,2597.5,2597,2596.4,2595.7,2595.1,2594.4,2593.7,2592.9,2592.2,2591.5,2590.7,2589.9,2589.1,2588.3,2587.4,2586.6,2585.7,2584.8,2583.8,2582.9,2581.9,2581,2580,2579,2577.9,2577,2575.9,2574.9,2573.8,2572.7,2571.6,2570.5,2569.4,2568.2,2567,2565.9,2564.7,2563.4,2562.2,2561,2559.8,2558.5,2558.5,2557.3,2556,2554.7,2553.4,2552,2550.7,2549.3,2548,2546.6,2545.2,2542.4,2539.4,2536.5,2533.5,2530.4,2527.3,2524.2,2520.9,2517.7,2514.2,2510.8,2507.4,2503.8,2500.2,2496.6,2492.8,2489,2485,2481.1,2477.1,2472.9,2468.7,2464.5,2460.1,2455.6,2451.1,2446.4,2441.7,2436.8,2431.9,2431.9,2426.7,2421.5,2416.3,2410.8,2405.2,2399.5,2393.5,2387.5,2381.3,2374.8,2368.1,2361.3,2354.1,2346.8,2339.1,2331.1,2322.8,2314,2304.8,2295,2284.7,2273.5,2261.5,2248.3,2233.7,2217.1,2197.9,2174.6,2144.2,2092.9,2015.8]),
+    ufg: new Float64Array([2374.9,2369.51,2364.29,2359.51,2355.2,2347.63,2341.02,2335.27,2330.21,2325.47,2317.25,2310.21,2303.91,2298.27,2293.11,2287.34,2282.06,2277.23,2272.73,2268.6,2264.66,2261.06,2257.57,2254.34,2251.16,2248.18,2245.4,2240.06,2235.1,2230.44,2226.12,2218.15,2211.06,2204.5,2193.07,2182.97,2174.11,2166.05,2158.82,2150.43,2142.71,2142.71,2135.67,2129.15,2123.07,2117.22,2111.74,2106.57,2101.67,2096.99,2092.52,2088.1,2080.07,2072.47,2065.25,2058.63,2052.23,2046.19,2040.46,2034.99,2029.65,2024.61,2019.73,2015,2010.5,2006.02,2001.73,1997.61,1993.55,1989.66,1985.81,1982.09,1978.41,1974.74,1971.4,1967.96,1964.62,1961.27,1958.12,1954.96,1951.88,1948.88,1948.88,1943.01,1937.3,1931.76,1926.35,1921.16,1916.17,1911.17,1906.34,1901.69,1897.08,1892.62,1888.2,1884,1879.73,1875.68,1871.53,1867.58,1863.64,1859.89,1856.03,1852.36,1848.76,1845.05,1841.52,1838.05,1834.65,1831.23,1827.86,1824.55,1821.31,1813.35,1805.62,1798.09,1790.84,1783.75,1776.89,1770.06,1763.34,1756.92,1750.57,1750.57,1744.3,1738.19,1732.25,1726.44,1720.57,1714.83,1709.31,1703.82,1698.33,1692.95,1682.51,1672.34,1662.31,1652.59,1643.08,1633.85,1624.77,1615.83,1607.11,1598.6,1590,1581.7,1573.5,1565.5,1557.4,1549.7,1541.9,1534.2,1526.8,1519.2,1511.7,1504.6,1497.3,1490.3,1483.1,1476.2,1469.1,1462.3,1455.5,1448.8,1442.1,1435.4,1428.9,1422.3,1415.8,1409.2,1402.9,1396.5,1390.2,1383.9,1377.7,1371.4,1365.3,1359.1,1353,1346.9,1340.8,1334.7,1328.7,1322.8,1316.8,1310.9,1304.9,1299.2,1293.3,1287.4,1281.6,1275.7,1270,1264.3,1258.5,1252.8,1247,1241.3,1235.7,1229.9,1224.2,1218.6,1213.1,1207.4,1207.4,1201.8,1196.2,1190.6,1185.1,1179.4,1173.9,1168.3,1162.8,1157.2,1151.6,1140.6,1129.5,1118.4,1107.4,1096.4,1085.4,1074.3,1063.2,1052.3,1041,1030,1018.9,1007.7,996.5,985.5,974.2,962.9,951.5,940.1,928.6,917.1,905.4,893.9,882.2,870.3,858.3,846.3,834.2,821.9,809.6,809.6,796.9,784.2,771.6,758.4,745.3,731.9,718.1,704.4,690.3,675.8,661.1,646,630.5,614.9,598.5,581.8,564.6,546.6,528,508.6,488.4,466.8,444,419.3,392.4,362.3,327.7,285.8,231.3,141.1,0]),
+    hf: new Float64Array([0,7.89,15.81,22.89,29.3,40.57,50.28,58.83,66.49,73.43,85.65,96.19,105.49,113.83,121.39,129.96,137.75,144.88,151.48,157.61,163.35,168.75,173.84,178.67,183.25,187.63,191.81,199.65,206.91,213.67,219.99,231.57,241.96,251.42,268.15,282.66,295.52,307.09,317.62,329.62,340.54,340.54,350.59,359.91,368.6,376.75,384.44,391.71,398.62,405.2,411.48,417.5,428.84,439.36,449.19,458.42,467.13,475.38,483.22,490.7,497.85,504.7,511.29,517.63,523.74,529.64,535.34,540.87,546.24,551.44,556.5,561.43,566.22,570.9,575.46,579.91,584.26,588.52,592.68,596.75,600.74,604.65,604.65,612.25,619.58,626.64,633.47,640.09,646.5,652.72,658.77,664.65,670.38,675.96,681.41,686.73,691.92,697,701.97,706.84,711.61,716.28,720.86,725.36,729.78,734.11,738.37,742.56,746.68,750.73,754.72,758.65,762.52,771.94,781.03,789.82,798.33,806.58,814.6,822.39,829.97,837.35,844.56,844.56,851.59,858.46,865.17,871.74,878.17,884.47,890.65,896.71,902.66,908.5,919.87,930.87,941.53,951.87,961.91,971.67,981.18,990.46,999.51,1008.3,1017,1025.4,1033.7,1041.8,1049.8,1057.6,1065.3,1072.8,1080.2,1087.5,1094.7,1101.7,1108.7,1115.5,1122.2,1128.9,1135.5,1141.9,1148.3,1154.6,1160.9,1167,1173.1,1179.1,1185.1,1191,1196.8,1202.6,1208.3,1213.9,1219.5,1225.1,1230.5,1236,1241.4,1246.7,1252,1257.3,1262.5,1267.7,1272.8,1277.9,1282.9,1287.9,1292.9,1297.9,1302.8,1307.7,1312.5,1317.3,1322.1,1326.8,1331.6,1336.3,1340.9,1345.6,1350.2,1354.8,1359.3,1363.9,1363.9,1368.4,1372.9,1377.4,1381.8,1386.2,1390.6,1395,1399.4,1403.7,1408.1,1416.7,1425.2,1433.7,1442.1,1450.4,1458.7,1467,1475.2,1483.3,1491.5,1499.5,1507.6,1515.6,1523.6,1531.5,1539.4,1547.3,1555.2,1563.1,1571,1578.8,1586.7,1594.5,1602.3,1610.2,1618.1,1625.9,1633.8,1641.7,1649.7,1649.7,1657.7,1665.7,1673.7,1681.9,1690,1698.3,1706.6,1715,1723.5,1732.1,1740.8,1749.7,1758.7,1767.8,1777.2,1786.7,1796.4,1806.4,1816.7,1827.2,1838.1,1849.5,1861.4,1874,1887.6,1902.6,1919.7,1940.4,1967.4,2011.3,2084.3]),
+    hg: new Float64Array([2500.9,2504.3,2507.8,2510.9,2513.7,2518.6,2522.8,2526.5,2529.9,2532.9,2538.2,2542.8,2546.8,2550.4,2553.7,2557.4,2560.7,2563.8,2566.6,2569.3,2571.7,2574,2576.2,2578.3,2580.2,2582.1,2583.9,2587.2,2590.3,2593.1,2595.8,2600.6,2605,2608.9,2615.9,2621.8,2627.1,2631.8,2636.1,2640.9,2645.2,2645.2,2649.2,2652.9,2656.3,2659.4,2662.4,2665.2,2667.8,2670.3,2672.7,2674.9,2679.2,2683.1,2686.6,2690,2693.1,2696,2698.8,2701.4,2703.9,2706.2,2708.5,2710.6,2712.7,2714.6,2716.5,2718.3,2720,2721.7,2723.3,2724.9,2726.4,2727.8,2729.3,2730.6,2732,2733.2,2734.5,2735.7,2736.9,2738.1,2738.1,2740.3,2742.4,2744.4,2746.3,2748.1,2749.9,2751.5,2753.1,2754.7,2756.1,2757.6,2758.9,2760.3,2761.5,2762.8,2763.9,2765.1,2766.2,2767.3,2768.3,2769.3,2770.3,2771.2,2772.1,2773,2773.9,2774.7,2775.5,2776.3,2777.1,2778.9,2780.6,2782.2,2783.7,2785.1,2786.5,2787.7,2788.8,2789.9,2791,2791,2791.9,2792.8,2793.7,2794.5,2795.2,2795.9,2796.6,2797.2,2797.8,2798.3,2799.3,2800.1,2800.8,2801.4,2801.9,2802.3,2802.7,2802.9,2803.1,2803.2,2803.2,2803.1,2803,2802.9,2802.6,2802.4,2802.1,2801.7,2801.3,2800.8,2800.3,2799.8,2799.2,2798.6,2797.9,2797.3,2796.5,2795.8,2795,2794.2,2793.4,2792.5,2791.6,2790.7,2789.7,2788.7,2787.7,2786.7,2785.7,2784.6,2783.5,2782.4,2781.2,2780.1,2778.9,2777.7,2776.4,2775.2,2773.9,2772.6,2771.3,2770,2768.6,2767.3,2765.9,2764.5,2763.1,2761.6,2760.2,2758.7,2757.2,2755.7,2754.1,2752.6,2751,2749.4,2747.8,2746.2,2744.6,2742.9,2742.9,2741.3,2739.6,2737.9,2736.2,2734.4,2732.7,2730.9,2729.1,2727.3,2725.5,2721.8,2718,2714.2,2710.3,2706.3,2702.3,2698.2,2694,2689.8,2685.4,2681,2676.6,2672,2667.4,2662.7,2657.9,2653,2648,2643,2637.9,2632.6,2627.3,2621.9,2616.3,2610.7,2605,2599.1,2593.1,2587,2580.8,2580.8,2574.4,2567.9,2561.3,2554.5,2547.5,2540.4,2533,2525.5,2517.8,2509.8,2501.6,2493.2,2484.4,2475.4,2466,2456.2,2446.1,2435.4,2424.2,2412.3,2399.8,2386.3,2371.9,2356.1,2338.6,2318.9,2296.1,2268.6,2232.9,2173.1,2084.3]),
+    hfg: new Float64Array([2500.9,2496.5,2492,2488,2484.4,2478,2472.5,2467.7,2463.4,2459.4,2452.5,2446.6,2441.3,2436.6,2432.3,2427.4,2423,2418.9,2415.2,2411.6,2408.4,2405.3,2402.4,2399.6,2397,2394.5,2392.1,2387.5,2383.4,2379.4,2375.8,2369.1,2363,2357.5,2347.7,2339.2,2331.6,2324.7,2318.4,2311.2,2304.7,2304.7,2298.6,2292.9,2287.7,2282.7,2277.9,2273.5,2269.2,2265.1,2261.2,2257.4,2250.3,2243.7,2237.5,2231.6,2226,2220.7,2215.6,2210.7,2206,2201.5,2197.2,2193,2188.9,2185,2181.1,2177.4,2173.8,2170.3,2166.8,2163.5,2160.2,2157,2153.8,2150.7,2147.7,2144.7,2141.8,2139,2136.2,2133.4,2133.4,2128,2122.8,2117.7,2112.8,2108,2103.4,2098.8,2094.4,2090,2085.8,2081.6,2077.5,2073.5,2069.6,2065.8,2062,2058.2,2054.6,2051,2047.4,2043.9,2040.5,2037.1,2033.8,2030.5,2027.2,2024,2020.8,2017.7,2014.6,2007,1999.6,1992.4,1985.4,1978.6,1971.9,1965.3,1958.9,1952.6,1946.4,1946.4,1940.3,1934.4,1928.5,1922.7,1917,1911.4,1905.9,1900.5,1895.1,1889.8,1879.4,1869.2,1859.3,1849.6,1840,1830.7,1821.5,1812.4,1803.6,1794.8,1786.2,1777.7,1769.3,1761,1752.8,1744.8,1736.8,1728.9,1721.1,1713.3,1705.7,1698.1,1690.6,1683.1,1675.7,1668.4,1661.1,1653.9,1646.7,1639.6,1632.5,1625.5,1618.5,1611.5,1604.6,1597.8,1590.9,1584.1,1577.4,1570.7,1564,1557.3,1550.7,1544.1,1537.5,1530.9,1524.4,1517.9,1511.4,1505,1498.5,1492.1,1485.7,1479.3,1473,1466.6,1460.3,1454,1447.7,1441.4,1435.1,1428.8,1422.6,1416.3,1410.1,1403.9,1397.7,1391.5,1385.3,1379.1,1379.1,1372.9,1366.7,1360.5,1354.4,1348.2,1342,1335.9,1329.7,1323.6,1317.4,1305.1,1292.8,1280.5,1268.2,1255.9,1243.6,1231.2,1218.8,1206.4,1194,1181.5,1169,1156.4,1143.8,1131.2,1118.5,1105.7,1092.8,1079.9,1066.9,1053.8,1040.6,1027.4,1014,1000.5,986.9,973.2,959.3,945.3,931.1,931.1,916.8,902.2,887.5,872.6,857.5,842.1,826.5,810.5,794.3,777.7,760.8,743.5,725.8,707.6,688.9,669.6,649.6,629,607.5,585.1,561.7,536.9,510.5,482.1,451,416.3,376.4,328.2,265.5,161.7,0]),
+    sf: new Float64Array([0,0.02878,0.05748,0.08297,0.10591,0.14595,0.18015,0.21004,0.23662,0.26056,0.30239,0.33816,0.36945,0.39729,0.42239,0.45069,0.4762,0.49945,0.52082,0.5406,0.55903,0.57627,0.59249,0.6078,0.6223,0.63607,0.6492,0.67372,0.69628,0.71717,0.73664,0.77201,0.80355,0.83202,0.88191,0.92472,0.96228,0.99579,1.0261,1.0603,1.0912,1.0912,1.1194,1.1454,1.1696,1.1921,1.2132,1.233,1.2518,1.2696,1.2866,1.3028,1.333,1.3609,1.3868,1.411,1.4337,1.4551,1.4753,1.4945,1.5127,1.5302,1.5469,1.5628,1.5782,1.593,1.6072,1.621,1.6343,1.6471,1.6596,1.6717,1.6835,1.6949,1.706,1.7168,1.7274,1.7377,1.7477,1.7575,1.7671,1.7765,1.7765,1.7946,1.812,1.8287,1.8448,1.8604,1.8754,1.8899,1.904,1.9176,1.9308,1.9437,1.9562,1.9684,1.9802,1.9918,2.0031,2.0141,2.0248,2.0354,2.0457,2.0557,2.0656,2.0753,2.0847,2.094,2.1032,2.1121,2.1209,2.1296,2.1381,2.1587,2.1785,2.1976,2.2159,2.2337,2.2508,2.2674,2.2835,2.2992,2.3143,2.3143,2.3291,2.3435,2.3575,2.3711,2.3845,2.3975,2.4102,2.4227,2.4348,2.4468,2.4699,2.4921,2.5136,2.5343,2.5543,2.5736,2.5924,2.6106,2.6283,2.6455,2.6623,2.6787,2.6946,2.7102,2.7254,2.7403,2.7549,2.7691,2.7831,2.7968,2.8102,2.8234,2.8363,2.849,2.8615,2.8738,2.8859,2.8978,2.9095,2.921,2.9323,2.9435,2.9546,2.9654,2.9762,2.9868,2.9972,3.0075,3.0177,3.0278,3.0377,3.0476,3.0573,3.0669,3.0764,3.0858,3.0951,3.1043,3.1134,3.1224,3.1313,3.1402,3.1489,3.1576,3.1662,3.1747,3.1832,3.1915,3.1998,3.2081,3.2162,3.2243,3.2324,3.2403,3.2483,3.2561,3.2639,3.2717,3.2793,3.287,3.287,3.2946,3.3021,3.3096,3.317,3.3244,3.3317,3.339,3.3463,3.3535,3.3606,3.3749,3.3889,3.4028,3.4166,3.4303,3.4438,3.4572,3.4705,3.4836,3.4967,3.5097,3.5226,3.5354,3.5481,3.5608,3.5734,3.5859,3.5984,3.6108,3.6232,3.6355,3.6478,3.6601,3.6723,3.6846,3.6968,3.709,3.7212,3.7335,3.7457,3.7457,3.758,3.7704,3.7827,3.7952,3.8077,3.8203,3.833,3.8458,3.8587,3.8718,3.8851,3.8985,3.9121,3.926,3.9401,3.9545,3.9692,3.9843,3.9997,4.0156,4.032,4.0491,4.067,4.086,4.1064,4.1291,4.155,4.1864,4.2274,4.2945,4.407]),
+    sg: new Float64Array([9.1555,9.1058,9.0567,9.0135,8.9749,8.9082,8.8521,8.8035,8.7608,8.7226,8.6567,8.6012,8.5533,8.511,8.4734,8.4313,8.3938,8.3599,8.329,8.3007,8.2745,8.2501,8.2273,8.206,8.1858,8.1668,8.1488,8.1154,8.0849,8.057,8.0311,7.9846,7.9437,7.9072,7.8442,7.7912,7.7453,7.705,7.669,7.6288,7.593,7.593,7.5606,7.5311,7.504,7.479,7.4557,7.4339,7.4135,7.3943,7.3761,7.3588,7.3269,7.2977,7.2709,7.2461,7.223,7.2014,7.1812,7.1621,7.144,7.1269,7.1106,7.0951,7.0803,7.0661,7.0524,7.0394,7.0268,7.0146,7.0029,6.9916,6.9807,6.9701,6.9598,6.9498,6.9401,6.9307,6.9216,6.9126,6.904,6.8955,6.8955,6.8791,6.8636,6.8487,6.8344,6.8207,6.8075,6.7948,6.7825,6.7707,6.7592,6.7482,6.7374,6.727,6.7169,6.7071,6.6975,6.6882,6.6791,6.6703,6.6616,6.6532,6.6449,6.6369,6.629,6.6213,6.6137,6.6063,6.5991,6.592,6.585,6.5681,6.552,6.5365,6.5217,6.5074,6.4936,6.4803,6.4675,6.455,6.443,6.443,6.4313,6.4199,6.4089,6.3981,6.3877,6.3775,6.3675,6.3578,6.3483,6.339,6.321,6.3038,6.2872,6.2712,6.2558,6.2409,6.2264,6.2124,6.1988,6.1856,6.1727,6.1602,6.1479,6.136,6.1243,6.1129,6.1018,6.0908,6.0801,6.0696,6.0592,6.0491,6.0391,6.0293,6.0197,6.0102,6.0009,5.9917,5.9826,5.9737,5.9648,5.9561,5.9475,5.9391,5.9307,5.9224,5.9142,5.9061,5.8981,5.8901,5.8823,5.8745,5.8668,5.8592,5.8516,5.8441,5.8367,5.8293,5.822,5.8148,5.8076,5.8004,5.7933,5.7863,5.7793,5.7723,5.7654,5.7586,5.7518,5.745,5.7383,5.7316,5.7249,5.7183,5.7117,5.7051,5.6986,5.6921,5.6856,5.6791,5.6791,5.6727,5.6663,5.6599,5.6536,5.6473,5.641,5.6347,5.6284,5.6222,5.616,5.6035,5.5912,5.5789,5.5667,5.5545,5.5423,5.5302,5.5181,5.506,5.4939,5.4819,5.4698,5.4577,5.4457,5.4336,5.4215,5.4093,5.3972,5.385,5.3727,5.3604,5.3481,5.3356,5.3231,5.3106,5.2979,5.2852,5.2723,5.2594,5.2463,5.2463,5.2331,5.2197,5.2062,5.1925,5.1787,5.1646,5.1504,5.1359,5.1211,5.1061,5.0907,5.075,5.059,5.0425,5.0256,5.0081,4.9901,4.9713,4.9518,4.9314,4.91,4.8872,4.8629,4.8367,4.8079,4.7758,4.739,4.695,4.6383,4.5446,4.407]),
+    sfg: new Float64Array([9.1555,9.077,8.9992,8.9305,8.869,8.7623,8.6719,8.5935,8.5241,8.462,8.3544,8.2631,8.1838,8.1138,8.051,7.9806,7.9176,7.8605,7.8082,7.7601,7.7154,7.6738,7.6348,7.5982,7.5635,7.5308,7.4996,7.4417,7.3887,7.3398,7.2945,7.2126,7.1402,7.0752,6.9623,6.8664,6.783,6.7092,6.6429,6.5686,6.5018,6.5018,6.4412,6.3857,6.3345,6.2869,6.2425,6.2009,6.1617,6.1246,6.0895,6.0561,5.9938,5.9367,5.884,5.8351,5.7893,5.7463,5.7059,5.6676,5.6313,5.5967,5.5638,5.5323,5.5021,5.4731,5.4452,5.4184,5.3925,5.3675,5.3433,5.3199,5.2972,5.2752,5.2538,5.233,5.2128,5.1931,5.1739,5.1551,5.1369,5.119,5.119,5.0846,5.0516,5.0199,4.9895,4.9603,4.9321,4.9049,4.8786,4.8531,4.8284,4.8045,4.7813,4.7587,4.7367,4.7153,4.6944,4.6741,4.6543,4.6349,4.616,4.5975,4.5793,4.5616,4.5443,4.5272,4.5106,4.4942,4.4782,4.4624,4.447,4.4095,4.3735,4.339,4.3058,4.2737,4.2428,4.2129,4.1839,4.1559,4.1286,4.1286,4.1022,4.0765,4.0514,4.027,4.0032,3.98,3.9573,3.9351,3.9135,3.8923,3.8511,3.8116,3.7736,3.7369,3.7015,3.6672,3.634,3.6018,3.5705,3.54,3.5104,3.4815,3.4533,3.4258,3.3989,3.3726,3.3469,3.3217,3.297,3.2728,3.2491,3.2257,3.2028,3.1803,3.1582,3.1364,3.115,3.0939,3.0731,3.0527,3.0325,3.0126,2.993,2.9736,2.9545,2.9356,2.917,2.8985,2.8803,2.8623,2.8445,2.8269,2.8095,2.7923,2.7752,2.7583,2.7416,2.725,2.7086,2.6924,2.6762,2.6603,2.6444,2.6287,2.6131,2.5976,2.5823,2.5671,2.5519,2.5369,2.522,2.5072,2.4925,2.4779,2.4634,2.449,2.4347,2.4204,2.4062,2.3922,2.3922,2.3782,2.3642,2.3504,2.3366,2.3229,2.3092,2.2957,2.2822,2.2687,2.2553,2.2287,2.2023,2.1761,2.1501,2.1242,2.0985,2.073,2.0476,2.0224,1.9972,1.9722,1.9472,1.9223,1.8975,1.8728,1.8481,1.8234,1.7988,1.7742,1.7495,1.7249,1.7002,1.6756,1.6508,1.626,1.6011,1.5762,1.5511,1.5259,1.5006,1.5006,1.475,1.4494,1.4235,1.3974,1.371,1.3443,1.3174,1.2901,1.2624,1.2342,1.2056,1.1765,1.1468,1.1165,1.0855,1.0536,1.0208,0.9871,0.9521,0.9158,0.878,0.8381,0.7959,0.7507,0.7015,0.6467,0.5839,0.5086,0.4109,0.2501,0]),
+};
+
+const SATURATED_BY_TEMPERATURE = {
+    T: new Float64Array([0.01,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,373.946]),
+    P: new Float64Array([0.0006117,0.0006571,0.000706,0.0007581,0.0008135,0.0008726,0.0009354,0.0010021,0.001073,0.0011483,0.0012282,0.001313,0.0014028,0.0014981,0.001599,0.0017058,0.0018188,0.0019384,0.0020647,0.0021983,0.0023393,0.0024882,0.0026453,0.0028111,0.0029858,0.0031699,0.0033639,0.0035681,0.0037831,0.0040092,0.004247,0.0044969,0.0047596,0.0050354,0.0053251,0.005629,0.0059479,0.0062823,0.0066328,0.0070002,0.0073849,0.0077878,0.0082096,0.0086508,0.0091124,0.009595,0.010099,0.010627,0.011177,0.011752,0.012352,0.012978,0.013631,0.014312,0.015022,0.015762,0.016533,0.017336,0.018171,0.019041,0.019946,0.020888,0.021867,0.022885,0.023943,0.025042,0.026183,0.027368,0.028599,0.029876,0.031201,0.032575,0.034,0.035478,0.037009,0.038595,0.040239,0.041941,0.043703,0.045527,0.047414,0.049367,0.051387,0.053476,0.055635,0.057867,0.060173,0.062556,0.065017,0.067558,0.070182,0.07289,0.075684,0.078568,0.081541,0.084608,0.087771,0.09103,0.09439,0.097852,0.10142,0.10509,0.10887,0.11277,0.11678,0.1209,0.12515,0.12952,0.13401,0.13863,0.14338,0.14826,0.15328,0.15844,0.16374,0.16918,0.17477,0.18052,0.18641,0.19246,0.19867,0.20505,0.21159,0.2183,0.22518,0.23224,0.23947,0.24689,0.2545,0.26229,0.27028,0.27846,0.28685,0.29543,0.30423,0.31323,0.32245,0.33188,0.34154,0.35143,0.36154,0.37189,0.38247,0.39329,0.40437,0.41568,0.42726,0.43909,0.45118,0.46354,0.47616,0.48907,0.50225,0.51571,0.52946,0.5435,0.55784,0.57247,0.58742,0.60267,0.61823,0.63412,0.65033,0.66686,0.68373,0.70093,0.71848,0.73638,0.75462,0.77322,0.79219,0.81152,0.83122,0.8513,0.87176,0.8926,0.91384,0.93547,0.95751,0.97995,1.0028,1.0261,1.0498,1.0739,1.0985,1.1235,1.1489,1.1748,1.2011,1.228,1.2552,1.283,1.3112,1.3399,1.3691,1.3988,1.429,1.4597,1.4909,1.5227,1.5549,1.5877,1.621,1.6549,1.6893,1.7243,1.7598,1.7959,1.8326,1.8698,1.9077,1.9461,1.9851,2.0247,2.065,2.1058,2.1473,2.1894,2.2322,2.2756,2.3196,2.3643,2.4096,2.4556,2.5023,2.5497,2.5978,2.6466,2.696,2.7462,2.7971,2.8487,2.901,2.9541,3.008,3.0625,3.1179,3.174,3.2308,3.2885,3.3469,3.4062,3.4662,3.527,3.5887,3.6512,3.7145,3.7786,3.8436,3.9095,3.9762,4.0438,4.1122,4.1815,4.2518,4.3229,4.3949,4.4679,4.5417,4.6165,4.6923,4.7689,4.8466,4.9252,5.0047,5.0853,5.1668,5.2494,5.3329,5.4174,5.503,5.5896,5.6772,5.7659,5.8556,5.9464,6.0383,6.1312,6.2252,6.3203,6.4166,6.5139,6.6124,6.712,6.8128,6.9147,7.0177,7.122,7.2274,7.334,7.4418,7.5508,7.661,7.7725,7.8852,7.9991,8.1143,8.2308,8.3485,8.4676,8.5879,8.7095,8.8325,8.9568,9.0824,9.2094,9.3378,9.4675,9.5986,9.7311,9.8651,10,10.137,10.275,10.415,10.556,10.699,10.843,10.989,11.136,11.284,11.434,11.586,11.74,11.895,12.051,12.209,12.369,12.53,12.693,12.858,13.024,13.193,13.362,13.534,13.707,13.882,14.059,14.238,14.418,14.601,14.785,14.971,15.159,15.349,15.541,15.734,15.93,16.128,16.328,16.529,16.733,16.939,17.147,17.358,17.57,17.785,18.002,18.221,18.442,18.666,18.892,19.121,19.352,19.585,19.821,20.06,20.302,20.546,20.793,21.044,21.297,21.554,21.814,22.064]),
+    vf: new Float64Array([0.00100021,0.00100015,0.00100011,0.00100008,0.00100007,0.00100008,0.00100011,0.00100014,0.0010002,0.00100026,0.00100035,0.00100044,0.00100055,0.00100067,0.0010008,0.00100094,0.0010011,0.00100127,0.00100145,0.00100164,0.00100184,0.00100205,0.00100228,0.00100251,0.00100275,0.00100301,0.00100327,0.00100354,0.00100382,0.00100411,0.00100441,0.00100472,0.00100504,0.00100537,0.0010057,0.00100605,0.0010064,0.00100676,0.00100713,0.0010075,0.00100789,0.00100828,0.00100868,0.00100909,0.0010095,0.00100992,0.00101036,0.00101079,0.00101124,0.00101169,0.00101215,0.00101262,0.00101309,0.00101357,0.00101406,0.00101455,0.00101505,0.00101556,0.00101608,0.0010166,0.00101713,0.00101766,0.00101821,0.00101875,0.00101931,0.00101987,0.00102044,0.00102101,0.00102159,0.00102218,0.00102277,0.00102337,0.00102398,0.00102459,0.00102521,0.00102584,0.00102647,0.0010271,0.00102775,0.0010284,0.00102905,0.00102972,0.00103038,0.00103106,0.00103174,0.00103243,0.00103312,0.00103382,0.00103452,0.00103524,0.00103595,0.00103668,0.00103741,0.00103814,0.00103888,0.00103963,0.00104038,0.00104114,0.00104191,0.00104268,0.00104346,0.00104425,0.00104504,0.00104583,0.00104664,0.00104744,0.00104826,0.00104908,0.00104991,0.00105074,0.00105158,0.00105243,0.00105328,0.00105414,0.001055,0.00105588,0.00105675,0.00105764,0.00105853,0.00105942,0.00106033,0.00106123,0.00106215,0.00106307,0.001064,0.00106494,0.00106588,0.00106683,0.00106778,0.00106874,0.00106971,0.00107068,0.00107166,0.00107265,0.00107365,0.00107465,0.00107566,0.00107667,0.00107769,0.00107872,0.00107976,0.0010808,0.00108185,0.00108291,0.00108397,0.00108504,0.00108612,0.0010872,0.0010883,0.0010894,0.0010905,0.00109162,0.00109274,0.00109387,0.00109501,0.00109615,0.0010973,0.00109846,0.00109963,0.00110081,0.00110199,0.00110318,0.00110438,0.00110559,0.0011068,0.00110803,0.00110926,0.0011105,0.00111175,0.001113,0.00111427,0.00111554,0.00111682,0.00111811,0.00111941,0.00112072,0.00112204,0.00112336,0.0011247,0.00112604,0.0011274,0.00112876,0.00113013,0.00113151,0.0011329,0.0011343,0.00113571,0.00113713,0.00113856,0.00114,0.00114145,0.00114291,0.00114438,0.00114586,0.00114736,0.00114886,0.00115037,0.00115189,0.00115343,0.00115497,0.00115653,0.00115809,0.00115967,0.00116126,0.00116286,0.00116448,0.0011661,0.00116774,0.00116939,0.00117105,0.00117272,0.00117441,0.00117611,0.00117782,0.00117954,0.00118128,0.00118303,0.00118479,0.00118657,0.00118836,0.00119017,0.00119198,0.00119382,0.00119567,0.00119753,0.0011994,0.0012013,0.0012032,0.00120512,0.00120706,0.00120902,0.00121098,0.00121297,0.00121497,0.00121699,0.00121902,0.00122108,0.00122315,0.00122523,0.00122734,0.00122946,0.0012316,0.00123376,0.00123594,0.00123813,0.00124035,0.00124259,0.00124484,0.00124712,0.00124941,0.00125173,0.00125407,0.00125643,0.00125881,0.00126121,0.00126364,0.00126609,0.00126856,0.00127106,0.00127358,0.00127612,0.00127869,0.00128128,0.0012839,0.00128655,0.00128922,0.00129192,0.00129465,0.0012974,0.00130019,0.001303,0.00130584,0.00130871,0.00131161,0.00131455,0.00131751,0.00132051,0.00132354,0.00132661,0.00132971,0.00133284,0.00133602,0.00133922,0.00134247,0.00134575,0.00134907,0.00135243,0.00135584,0.00135928,0.00136277,0.0013663,0.00136987,0.00137349,0.00137716,0.00138087,0.00138464,0.00138845,0.00139231,0.00139623,0.0014002,0.00140423,0.00140831,0.00141245,0.00141665,0.00142091,0.00142524,0.00142963,0.00143408,0.00143861,0.0014432,0.00144787,0.00145261,0.00145743,0.00146232,0.0014673,0.00147236,0.00147751,0.00148275,0.00148809,0.00149351,0.00149904,0.00150467,0.0015104,0.00151625,0.00152221,0.00152829,0.00153449,0.00154081,0.00154727,0.00155387,0.00156061,0.00156751,0.00157456,0.00158177,0.00158915,0.00159671,0.00160447,0.00161241,0.00162057,0.00162895,0.00163755,0.0016464,0.00165551,0.0016649,0.00167457,0.00168456,0.00169488,0.00170556,0.00171662,0.0017281,0.00174002,0.00175243,0.00176536,0.00177888,0.00179302,0.00180786,0.00182347,0.00183993,0.00185733,0.00187578,0.00189541,0.00191635,0.00193879,0.0019629,0.00198894,0.0020172,0.002048,0.0020821,0.0021201,0.0021636,0.0022152,0.0022798,0.0023682,0.0025083,0.0031056]),
+    vg: new Float64Array([205.991,192.439,179.758,168.008,157.116,147.011,137.633,128.923,120.829,113.304,106.303,99.787,93.719,88.064,82.793,77.875,73.286,69.001,64.998,61.256,57.757,54.483,51.418,48.548,45.858,43.337,40.973,38.754,36.672,34.716,32.878,31.151,29.526,27.998,26.56,25.205,23.929,22.727,21.593,20.524,19.515,18.563,17.664,16.814,16.011,15.252,14.534,13.855,13.212,12.603,12.027,11.481,10.963,10.472,10.006,9.5643,9.1448,8.7466,8.3683,8.0089,7.6672,7.3424,7.0335,6.7396,6.4598,6.1935,5.9399,5.6984,5.4682,5.2488,5.0395,4.84,4.6496,4.468,4.2945,4.1289,3.9708,3.8197,3.6752,3.5372,3.4052,3.2789,3.1581,3.0425,2.9318,2.8258,2.7244,2.6271,2.534,2.4447,2.3591,2.277,2.1982,2.1227,2.0502,1.9806,1.9137,1.8496,1.7879,1.7287,1.6718,1.6171,1.5644,1.5139,1.4652,1.4184,1.3733,1.33,1.2882,1.248,1.2093,1.172,1.1361,1.1014,1.068,1.0358,0.99522,0.97486,0.94598,0.91811,0.89121,0.86525,0.84019,0.81598,0.79261,0.77003,0.74821,0.72713,0.70675,0.68705,0.668,0.64959,0.63177,0.61454,0.59786,0.58173,0.56611,0.55099,0.53636,0.52218,0.50845,0.49516,0.48227,0.46979,0.45769,0.44596,0.43459,0.42357,0.41288,0.40251,0.39245,0.38269,0.37323,0.36404,0.35512,0.34646,0.33805,0.32989,0.32196,0.31426,0.30678,0.29951,0.29245,0.28559,0.27892,0.27243,0.26612,0.25999,0.25403,0.24823,0.24259,0.2371,0.23176,0.22656,0.2215,0.21658,0.21179,0.20712,0.20258,0.19815,0.19384,0.18964,0.18555,0.18157,0.17769,0.1739,0.17021,0.16662,0.16311,0.15969,0.15636,0.15311,0.14994,0.14685,0.14383,0.14089,0.13802,0.13522,0.13248,0.12982,0.12721,0.12467,0.12218,0.11976,0.11739,0.11508,0.11282,0.11061,0.10846,0.10635,0.10429,0.10228,0.10031,0.098394,0.096516,0.094679,0.092884,0.091129,0.089413,0.087734,0.086092,0.084486,0.082916,0.081379,0.079875,0.078403,0.076964,0.075554,0.074175,0.072825,0.071503,0.07021,0.068943,0.067702,0.066488,0.065298,0.064133,0.062991,0.061873,0.060778,0.059705,0.058654,0.057623,0.056613,0.055624,0.054654,0.053703,0.052771,0.051857,0.050961,0.050083,0.049222,0.048377,0.047548,0.046736,0.045938,0.045156,0.044389,0.043637,0.042898,0.042173,0.041462,0.040764,0.040079,0.039406,0.038746,0.038098,0.037462,0.036837,0.036223,0.035621,0.035029,0.034448,0.033877,0.033317,0.032766,0.032225,0.031693,0.031171,0.030657,0.030153,0.029657,0.029169,0.02869,0.028219,0.027756,0.027301,0.026853,0.026413,0.025981,0.025555,0.025136,0.024724,0.024319,0.023921,0.023529,0.023143,0.022763,0.02239,0.022022,0.02166,0.021304,0.020953,0.020608,0.020268,0.019933,0.019604,0.019279,0.01896,0.018645,0.018335,0.018029,0.017728,0.017431,0.017139,0.016851,0.016567,0.016287,0.016011,0.015739,0.015471,0.015206,0.014945,0.014688,0.014434,0.014183,0.013936,0.013692,0.013451,0.013213,0.012979,0.012747,0.012518,0.012292,0.012068,0.011847,0.011629,0.011413,0.0112,0.010989,0.010781,0.010574,0.01037,0.010168,0.0099674,0.009769,0.0095724,0.0093776,0.0091844,0.0089927,0.0088024,0.0086134,0.0084257,0.008239,0.0080533,0.0078684,0.0076841,0.0075003,0.0073168,0.0071332,0.0069493,0.0067649,0.0065795,0.0063925,0.0062035,0.0060115,0.0058157,0.0056145,0.0054061,0.0051875,0.0049544,0.0046995,0.0044084,0.004045,0.0031056]),
+    uf: new Float64Array([0,4.18,8.39,12.6,16.81,21.02,25.22,29.43,33.63,37.82,42.02,46.22,50.41,54.6,58.79,62.98,67.17,71.36,75.54,79.73,83.91,88.1,92.28,96.46,100.65,104.83,109.01,113.19,117.37,121.55,125.73,129.91,134.09,138.26,142.44,146.62,150.8,154.98,159.16,163.34,167.52,171.7,175.88,180.06,184.24,188.42,192.61,196.79,200.97,205.15,209.33,213.51,217.7,221.88,226.05,230.24,234.42,238.6,242.79,246.97,251.16,255.35,259.53,263.72,267.91,272.09,276.27,280.46,284.65,288.84,293.04,297.23,301.42,305.6,309.8,313.99,318.18,322.38,326.58,330.76,334.96,339.16,343.36,347.55,351.75,355.95,360.16,364.36,368.56,372.76,376.97,381.17,385.38,389.59,393.8,398,402.21,406.43,410.63,414.85,419.06,423.28,427.5,431.71,435.93,440.14,444.37,448.59,452.81,457.03,461.27,465.49,469.72,473.95,478.18,482.41,486.65,490.89,495.12,499.36,503.6,507.84,512.09,516.33,520.58,524.82,529.07,533.33,537.58,541.84,546.09,550.35,554.61,558.87,563.14,567.4,571.67,575.94,580.22,584.49,588.77,593.05,597.33,601.61,605.9,610.19,614.48,618.77,623.07,627.37,631.66,635.97,640.26,644.58,648.88,653.19,657.51,661.82,666.14,670.47,674.79,679.12,683.45,687.78,692.12,696.46,700.8,705.14,709.49,713.85,718.2,722.55,726.92,731.28,735.65,740.02,744.39,748.77,753.15,757.54,761.92,766.31,770.71,775.1,779.51,783.92,788.33,792.73,797.15,801.57,806,810.42,814.86,819.29,823.74,828.18,832.64,837.09,841.54,846,850.47,854.94,859.42,863.9,868.39,872.87,877.37,881.86,886.37,890.88,895.39,899.91,904.44,908.97,913.5,918.04,922.58,927.14,931.69,936.26,940.82,945.39,949.97,954.55,959.14,963.74,968.34,972.95,977.56,982.19,986.81,991.44,996.08,1000.7,1005.3,1010.1,1014.7,1019.4,1024,1028.8,1033.5,1038.1,1042.8,1047.5,1052.3,1057,1061.8,1066.5,1071.3,1076,1080.8,1085.5,1090.3,1095.1,1099.9,1104.7,1109.6,1114.4,1119.2,1124.1,1129,1133.8,1138.7,1143.6,1148.5,1153.4,1158.3,1163.2,1168.2,1173.2,1178.1,1183.1,1188.1,1193,1198,1203.1,1208.1,1213.2,1218.1,1223.3,1228.3,1233.4,1238.5,1243.7,1248.7,1253.9,1259.1,1264.2,1269.5,1274.6,1279.8,1285.1,1290.4,1295.6,1300.9,1306.2,1311.5,1316.8,1322.1,1327.5,1332.9,1338.3,1343.8,1349.2,1354.7,1360.2,1365.7,1371.2,1376.8,1382.4,1387.9,1393.6,1399.2,1404.9,1410.5,1416.3,1422,1427.8,1433.6,1439.5,1445.3,1451.2,1457.1,1463.1,1469.1,1475.1,1481.2,1487.2,1493.4,1499.6,1505.8,1512.1,1518.3,1524.8,1531.1,1537.6,1544,1550.6,1557.2,1563.9,1570.6,1577.5,1584.3,1591.2,1598.2,1605.3,1612.4,1619.7,1627.1,1634.6,1642.1,1649.8,1657.6,1665.6,1673.7,1681.9,1690.4,1699.1,1707.9,1716.9,1726.3,1735.9,1745.8,1756.1,1766.7,1777.8,1789.4,1801.5,1814.5,1828.5,1844.1,1862,1884.3,1915,2015.8]),
+    ug: new Float64Array([2374.9,2376.2,2377.7,2379,2380.4,2381.8,2383.2,2384.5,2386,2387.3,2388.6,2390,2391.4,2392.8,2394.1,2395.5,2396.9,2398.2,2399.6,2400.9,2402.3,2403.7,2405.1,2406.4,2407.8,2409.1,2410.5,2411.8,2413.2,2414.5,2415.9,2417.2,2418.7,2420,2421.4,2422.6,2424,2425.3,2426.7,2428,2429.4,2430.7,2432.1,2433.4,2434.7,2436.1,2437.4,2438.8,2440.1,2441.4,2442.7,2444.1,2445.4,2446.7,2448,2449.3,2450.6,2452,2453.2,2454.6,2455.9,2457.2,2458.5,2459.8,2461.1,2462.4,2463.7,2465,2466.3,2467.6,2468.9,2470.1,2471.4,2472.7,2474,2475.2,2476.5,2477.8,2479.1,2480.3,2481.5,2482.8,2484.1,2485.3,2486.6,2487.8,2489.1,2490.3,2491.5,2492.7,2493.9,2495.2,2496.4,2497.6,2498.8,2500,2501.2,2502.4,2503.6,2504.8,2506,2507.2,2508.4,2509.6,2510.7,2511.9,2513,2514.2,2515.4,2516.5,2517.7,2518.8,2520,2521.1,2522.2,2523.4,2526.2,2525.5,2526.7,2527.8,2528.8,2530,2531,2532.2,2533.2,2534.3,2535.3,2536.4,2537.4,2538.5,2539.6,2540.6,2541.6,2542.6,2543.6,2544.7,2545.7,2546.6,2547.6,2548.6,2549.6,2550.6,2551.5,2552.5,2553.4,2554.4,2555.3,2556.3,2557.2,2558.1,2559,2559.9,2560.8,2561.8,2562.7,2563.5,2564.4,2565.2,2566.1,2566.9,2567.7,2568.6,2569.4,2570.3,2571.1,2571.8,2572.7,2573.4,2574.2,2575,2575.7,2576.5,2577.3,2577.9,2578.7,2579.4,2580.1,2580.7,2581.4,2582.1,2582.8,2583.5,2584.1,2584.8,2585.4,2586,2586.6,2587.3,2587.9,2588.4,2589,2589.6,2590.1,2590.6,2591.2,2591.7,2592.3,2592.7,2593.3,2593.7,2594.2,2594.7,2595.1,2595.5,2596,2596.4,2596.8,2597.3,2597.5,2597.9,2598.3,2598.7,2599,2599.3,2599.6,2599.9,2600.3,2600.5,2600.7,2601.1,2601.2,2601.4,2601.7,2601.9,2602,2602.2,2602.4,2602.5,2602.7,2602.8,2602.9,2603,2603.1,2603.1,2603.2,2603.2,2603.2,2603.2,2603.2,2603.1,2603.2,2603.1,2603,2602.9,2602.8,2602.6,2602.5,2602.4,2602.2,2602,2601.8,2601.6,2601.4,2601.1,2600.8,2600.5,2600.1,2599.9,2599.5,2599.1,2598.7,2598.3,2597.8,2597.4,2597,2596.5,2596,2595.4,2594.9,2594.3,2593.7,2593,2592.4,2591.8,2591,2590.4,2589.6,2588.8,2588.1,2587.2,2586.4,2585.5,2584.6,2583.7,2582.7,2581.8,2580.8,2579.8,2578.7,2577.7,2576.5,2575.4,2574.2,2573,2571.8,2570.5,2569.2,2567.8,2566.5,2565,2563.6,2562.2,2560.6,2559.1,2557.5,2555.8,2554.1,2552.5,2550.7,2549,2547,2545.2,2543.3,2541.3,2539.3,2537.2,2535,2532.9,2530.7,2528.3,2526,2523.6,2521.1,2518.7,2516,2513.4,2510.7,2507.9,2505.1,2502.2,2499.1,2496.1,2493,2489.7,2486.4,2483,2479.5,2475.8,2472.1,2468.4,2464.4,2460.5,2456.3,2452,2447.6,2443.1,2438.4,2433.6,2428.6,2423.5,2418.1,2412.7,2406.9,2401,2394.8,2388.4,2381.7,2374.8,2367.5,2359.8,2351.8,2343.3,2334.4,2324.9,2314.7,2303.7,2292,2279.1,2264.8,2248.7,2230.2,2208.2,2180.5,2141.6,2015.8]),
+    ufg: new Float64Array([2374.9,2372.02,2369.31,2366.4,2363.59,2360.78,2357.98,2355.07,2352.37,2349.48,2346.58,2343.78,2340.99,2338.2,2335.31,2332.52,2329.73,2326.84,2324.06,2321.17,2318.39,2315.6,2312.82,2309.94,2307.15,2304.27,2301.49,2298.61,2295.83,2292.95,2290.17,2287.29,2284.61,2281.74,2278.96,2275.98,2273.2,2270.32,2267.54,2264.66,2261.88,2259,2256.22,2253.34,2250.46,2247.68,2244.79,2242.01,2239.13,2236.25,2233.37,2230.59,2227.7,2224.82,2221.95,2219.06,2216.18,2213.4,2210.41,2207.63,2204.74,2201.85,2198.97,2196.08,2193.19,2190.31,2187.43,2184.54,2181.65,2178.76,2175.86,2172.87,2169.98,2167.1,2164.2,2161.21,2158.32,2155.42,2152.52,2149.54,2146.54,2143.64,2140.74,2137.75,2134.85,2131.85,2128.94,2125.94,2122.94,2119.94,2116.93,2114.03,2111.02,2108.01,2105,2102,2098.99,2095.97,2092.97,2089.95,2086.94,2083.92,2080.9,2077.89,2074.77,2071.76,2068.63,2065.61,2062.59,2059.47,2056.43,2053.31,2050.28,2047.15,2044.02,2040.99,2039.55,2034.61,2031.58,2028.44,2025.2,2022.16,2018.91,2015.87,2012.62,2009.48,2006.23,2003.07,1999.82,1996.66,1993.51,1990.25,1986.99,1983.73,1980.46,1977.3,1974.03,1970.66,1967.38,1964.11,1960.83,1957.55,1954.17,1950.89,1947.5,1944.21,1940.82,1937.53,1934.13,1930.73,1927.34,1923.93,1920.54,1917.22,1913.82,1910.31,1906.89,1903.38,1899.96,1896.43,1892.91,1889.48,1885.95,1882.52,1878.98,1875.34,1871.9,1868.26,1864.71,1861.15,1857.5,1853.95,1850.38,1846.62,1843.05,1839.38,1835.71,1831.93,1828.25,1824.56,1820.88,1817.19,1813.39,1809.7,1805.89,1802.08,1798.27,1794.57,1790.75,1786.83,1783,1779.18,1775.24,1771.31,1767.46,1763.52,1759.66,1755.61,1751.76,1747.7,1743.73,1739.76,1735.68,1731.6,1727.61,1723.53,1719.43,1715.44,1711.13,1707.02,1702.91,1698.79,1694.56,1690.33,1686.1,1681.86,1677.72,1673.36,1669.01,1664.84,1660.38,1656.01,1651.73,1647.35,1642.86,1638.46,1634.06,1629.55,1625.14,1620.61,1616.09,1611.56,1607.02,1602.4,1597.9,1593.1,1588.5,1583.8,1579.2,1574.3,1569.7,1565,1560.2,1555.4,1550.5,1545.6,1540.7,1535.9,1530.9,1526,1521,1516.1,1511.1,1506,1500.9,1495.8,1490.5,1485.5,1480.3,1475,1469.7,1464.5,1459.1,1453.8,1448.5,1443.1,1437.7,1432.2,1426.7,1421.1,1415.6,1409.9,1404.3,1398.8,1393,1387.3,1381.5,1375.6,1370,1363.9,1358.1,1352.1,1346.1,1340,1334,1327.9,1321.7,1315.6,1309.2,1303.1,1296.7,1290.3,1283.8,1277.4,1270.9,1264.3,1257.7,1251,1244.4,1237.5,1230.7,1223.9,1216.8,1209.9,1202.8,1195.6,1188.4,1181.3,1173.9,1166.6,1159.1,1151.6,1144.1,1136.4,1128.8,1120.9,1113,1105.1,1097.1,1088.8,1080.7,1072.4,1064,1055.6,1046.9,1038.3,1029.5,1020.7,1011.7,1002.6,993.3,984,974.7,964.9,955.3,945.4,935.5,925.2,914.9,904.5,893.8,883,872,860.8,849.4,837.8,826,813.9,801.5,788.9,776,762.9,749.3,735.4,721.1,706.5,691.3,675.7,659.6,642.9,625.5,607.4,588.6,568.8,548,525.9,502.6,477.6,450.3,420.2,386.1,346.2,296.2,226.6,0]),
+    hf: new Float64Array([0,4.18,8.39,12.6,16.81,21.02,25.22,29.43,33.63,37.82,42.02,46.22,50.41,54.6,58.79,62.98,67.17,71.36,75.54,79.73,83.91,88.1,92.28,96.46,100.65,104.83,109.01,113.19,117.37,121.55,125.73,129.91,134.09,138.27,142.45,146.63,150.81,154.99,159.17,163.35,167.53,171.71,175.89,180.07,184.25,188.43,192.62,196.8,200.98,205.16,209.34,213.52,217.71,221.89,226.07,230.26,234.44,238.62,242.81,246.99,251.18,255.37,259.55,263.74,267.93,272.12,276.3,280.49,284.68,288.87,293.07,297.26,301.45,305.64,309.84,314.03,318.22,322.42,326.62,330.81,335.01,339.21,343.41,347.61,351.81,356.01,360.22,364.42,368.63,372.83,377.04,381.25,385.46,389.67,393.88,398.09,402.3,406.52,410.73,414.95,419.17,423.39,427.61,431.83,436.05,440.27,444.5,448.73,452.95,457.18,461.42,465.65,469.88,474.12,478.35,482.59,486.83,491.08,495.32,499.56,503.81,508.06,512.31,516.56,520.82,525.07,529.33,533.59,537.85,542.12,546.38,550.65,554.92,559.19,563.47,567.74,572.02,576.3,580.59,584.87,589.16,593.45,597.74,602.04,606.34,610.64,614.94,619.25,623.56,627.87,632.18,636.5,640.81,645.14,649.46,653.79,658.12,662.45,666.79,671.13,675.47,679.82,684.17,688.52,692.88,697.24,701.6,705.96,710.33,714.71,719.08,723.46,727.85,732.23,736.63,741.02,745.42,749.82,754.23,758.64,763.05,767.47,771.9,776.32,780.75,785.19,789.63,794.07,798.52,802.97,807.43,811.89,816.36,820.83,825.31,829.79,834.28,838.77,843.26,847.76,852.27,856.78,861.3,865.82,870.35,874.88,879.42,883.96,888.51,893.07,897.63,902.2,906.77,911.35,915.94,920.53,925.12,929.73,934.34,938.96,943.58,948.21,952.85,957.49,962.14,966.8,971.46,976.13,980.81,985.5,990.19,994.89,999.6,1004.3,1009,1013.8,1018.5,1023.3,1028,1032.8,1037.6,1042.3,1047.1,1051.9,1056.7,1061.5,1066.4,1071.2,1076.1,1080.9,1085.8,1090.6,1095.5,1100.4,1105.3,1110.2,1115.2,1120.1,1125,1130,1135,1139.9,1144.9,1149.9,1154.9,1160,1165,1170,1175.1,1180.2,1185.3,1190.4,1195.5,1200.6,1205.7,1210.9,1216.1,1221.3,1226.4,1231.7,1236.9,1242.1,1247.4,1252.7,1257.9,1263.2,1268.6,1273.9,1279.3,1284.6,1290,1295.4,1300.9,1306.3,1311.8,1317.3,1322.8,1328.3,1333.8,1339.4,1345,1350.6,1356.3,1361.9,1367.6,1373.3,1379,1384.8,1390.6,1396.4,1402.2,1408.1,1414,1419.9,1425.8,1431.8,1437.8,1443.9,1450,1456.1,1462.2,1468.4,1474.6,1480.9,1487.2,1493.5,1499.9,1506.3,1512.8,1519.3,1525.9,1532.5,1539.1,1545.9,1552.6,1559.5,1566.3,1573.3,1580.3,1587.4,1594.5,1601.8,1609.1,1616.4,1623.9,1631.5,1639.1,1646.9,1654.8,1662.8,1670.9,1679.1,1687.5,1696.1,1704.8,1713.7,1722.8,1732.2,1741.7,1751.5,1761.7,1772.1,1782.9,1794.1,1805.7,1817.8,1830.5,1843.8,1858.1,1873.5,1890.7,1910.6,1935.3,1969.7,2084.3]),
+    hg: new Float64Array([2500.9,2502.7,2504.6,2506.4,2508.2,2510.1,2511.9,2513.7,2515.6,2517.4,2519.2,2521,2522.9,2524.7,2526.5,2528.3,2530.2,2532,2533.8,2535.6,2537.4,2539.3,2541.1,2542.9,2544.7,2546.5,2548.3,2550.1,2551.9,2553.7,2555.5,2557.3,2559.2,2561,2562.8,2564.5,2566.3,2568.1,2569.9,2571.7,2573.5,2575.3,2577.1,2578.9,2580.6,2582.4,2584.2,2586,2587.8,2589.5,2591.3,2593.1,2594.8,2596.6,2598.3,2600.1,2601.8,2603.6,2605.3,2607.1,2608.8,2610.6,2612.3,2614,2615.8,2617.5,2619.2,2621,2622.7,2624.4,2626.1,2627.8,2629.5,2631.2,2632.9,2634.6,2636.3,2638,2639.7,2641.3,2643,2644.7,2646.4,2648,2649.7,2651.3,2653,2654.6,2656.3,2657.9,2659.5,2661.2,2662.8,2664.4,2666,2667.6,2669.2,2670.8,2672.4,2674,2675.6,2677.1,2678.7,2680.3,2681.8,2683.4,2684.9,2686.5,2688,2689.5,2691.1,2692.6,2694.1,2695.6,2697.1,2698.6,2700.1,2701.5,2703,2704.5,2705.9,2707.4,2708.8,2710.3,2711.7,2713.1,2714.5,2715.9,2717.3,2718.7,2720.1,2721.5,2722.8,2724.2,2725.5,2726.9,2728.2,2729.5,2730.8,2732.1,2733.4,2734.7,2736,2737.3,2738.5,2739.8,2741,2742.3,2743.5,2744.7,2745.9,2747.1,2748.3,2749.5,2750.7,2751.8,2753,2754.1,2755.2,2756.3,2757.4,2758.5,2759.6,2760.7,2761.8,2762.8,2763.9,2764.9,2765.9,2766.9,2767.9,2768.9,2769.9,2770.8,2771.8,2772.7,2773.6,2774.5,2775.4,2776.3,2777.2,2778.1,2778.9,2779.8,2780.6,2781.4,2782.2,2783,2783.8,2784.5,2785.3,2786,2786.7,2787.4,2788.1,2788.8,2789.5,2790.1,2790.8,2791.4,2792,2792.6,2793.2,2793.7,2794.3,2794.8,2795.3,2795.9,2796.3,2796.8,2797.3,2797.7,2798.1,2798.5,2798.9,2799.3,2799.7,2800,2800.3,2800.7,2800.9,2801.2,2801.5,2801.7,2801.9,2802.1,2802.3,2802.5,2802.7,2802.8,2802.9,2803,2803.1,2803.1,2803.2,2803.2,2803.2,2803.1,2803.1,2803,2803,2802.9,2802.7,2802.6,2802.4,2802.2,2802,2801.8,2801.5,2801.2,2800.9,2800.6,2800.3,2799.9,2799.5,2799.1,2798.6,2798.2,2797.7,2797.1,2796.6,2796,2795.4,2794.8,2794.2,2793.5,2792.8,2792.1,2791.3,2790.5,2789.7,2788.8,2788,2787.1,2786.1,2785.2,2784.2,2783.1,2782.1,2781,2779.9,2778.7,2777.5,2776.3,2775,2773.7,2772.4,2771,2769.6,2768.2,2766.7,2765.2,2763.6,2762,2760.4,2758.7,2757,2755.2,2753.4,2751.5,2749.6,2747.7,2745.7,2743.7,2741.6,2739.4,2737.2,2735,2732.7,2730.4,2727.9,2725.5,2723,2720.4,2717.8,2715.1,2712.3,2709.5,2706.6,2703.6,2700.6,2697.5,2694.3,2691.1,2687.7,2684.3,2680.8,2677.3,2673.6,2669.9,2666,2662.1,2658.1,2653.9,2649.7,2645.4,2640.9,2636.3,2631.6,2626.8,2621.8,2616.8,2611.5,2606.1,2600.6,2594.9,2589,2583,2576.7,2570.3,2563.6,2556.8,2549.6,2542.3,2534.6,2526.6,2518.4,2509.8,2500.8,2491.4,2481.5,2471.1,2460.2,2448.6,2436.2,2422.9,2408.7,2393.1,2375.9,2356.6,2334.5,2308.3,2275.5,2229.8,2084.3]),
+    hfg: new Float64Array([2500.9,2498.6,2496.2,2493.8,2491.4,2489,2486.7,2484.3,2481.9,2479.6,2477.2,2474.8,2472.5,2470.1,2467.7,2465.4,2463,2460.6,2458.3,2455.9,2453.5,2451.2,2448.8,2446.4,2444,2441.7,2439.3,2436.9,2434.6,2432.2,2429.8,2427.4,2425.1,2422.7,2420.3,2417.9,2415.5,2413.1,2410.8,2408.4,2406,2403.6,2401.2,2398.8,2396.4,2394,2391.6,2389.2,2386.8,2384.4,2381.9,2379.5,2377.1,2374.7,2372.3,2369.8,2367.4,2365,2362.5,2360.1,2357.7,2355.2,2352.8,2350.3,2347.8,2345.4,2342.9,2340.5,2338,2335.5,2333,2330.5,2328.1,2325.6,2323.1,2320.6,2318.1,2315.6,2313,2310.5,2308,2305.5,2302.9,2300.4,2297.9,2295.3,2292.8,2290.2,2287.6,2285.1,2282.5,2279.9,2277.3,2274.7,2272.1,2269.5,2266.9,2264.3,2261.7,2259,2256.4,2253.8,2251.1,2248.5,2245.8,2243.1,2240.4,2237.7,2235.1,2232.4,2229.6,2226.9,2224.2,2221.5,2218.7,2216,2213.2,2210.5,2207.7,2204.9,2202.1,2199.3,2196.5,2193.7,2190.9,2188,2185.2,2182.3,2179.5,2176.6,2173.7,2170.8,2167.9,2165,2162.1,2159.1,2156.2,2153.2,2150.3,2147.3,2144.3,2141.3,2138.3,2135.2,2132.2,2129.2,2126.1,2123,2119.9,2116.9,2113.7,2110.6,2107.5,2104.3,2101.2,2098,2094.8,2091.6,2088.4,2085.2,2082,2078.7,2075.5,2072.2,2068.9,2065.6,2062.3,2058.9,2055.6,2052.2,2048.8,2045.4,2042,2038.6,2035.1,2031.7,2028.2,2024.7,2021.2,2017.7,2014.2,2010.6,2007,2003.4,1999.8,1996.2,1992.6,1988.9,1985.3,1981.6,1977.9,1974.1,1970.4,1966.6,1962.8,1959,1955.2,1951.4,1947.5,1943.6,1939.7,1935.8,1931.9,1927.9,1923.9,1919.9,1915.9,1911.9,1907.8,1903.7,1899.6,1895.5,1891.4,1887.2,1883,1878.8,1874.6,1870.3,1866,1861.7,1857.4,1853,1848.6,1844.2,1839.8,1835.4,1830.9,1826.4,1821.8,1817.3,1812.7,1808.1,1803.5,1798.8,1794.1,1789.4,1784.7,1779.9,1775.1,1770.3,1765.4,1760.5,1755.6,1750.7,1745.7,1740.7,1735.6,1730.6,1725.5,1720.3,1715.2,1710,1704.7,1699.5,1694.2,1688.8,1683.5,1678.1,1672.6,1667.2,1661.6,1656.1,1650.5,1644.9,1639.2,1633.5,1627.8,1622,1616.2,1610.3,1604.4,1598.5,1592.5,1586.5,1580.4,1574.3,1568.1,1561.9,1555.6,1549.3,1543,1536.6,1530.1,1523.6,1517.1,1510.5,1503.8,1497.1,1490.4,1483.5,1476.7,1469.7,1462.7,1455.7,1448.6,1441.4,1434.2,1426.9,1419.5,1412.1,1404.6,1397.1,1389.4,1381.7,1374,1366.1,1358.2,1350.2,1342.1,1334,1325.7,1317.4,1309,1300.5,1291.9,1283.2,1274.5,1265.6,1256.6,1247.5,1238.4,1229.1,1219.7,1210.2,1200.6,1190.8,1180.9,1170.9,1160.8,1150.6,1140.2,1129.6,1118.9,1108.1,1097.1,1085.9,1074.6,1063,1051.3,1039.4,1027.3,1015,1002.5,989.7,976.7,963.4,949.9,936.1,922,907.5,892.7,877.6,862.1,846.2,829.8,812.9,795.5,777.6,759,739.8,719.8,699,677.3,654.5,630.5,605.2,578.2,549.2,517.8,483.1,443.8,397.7,340.3,260.1,0]),
+    sf: new Float64Array([0,0.01526,0.03061,0.04589,0.0611,0.07625,0.09134,0.10637,0.12133,0.13624,0.15109,0.16587,0.18061,0.19528,0.2099,0.22446,0.23897,0.25343,0.26783,0.28218,0.29648,0.31073,0.32493,0.33908,0.35318,0.36722,0.38123,0.39518,0.40908,0.42294,0.43675,0.45052,0.46424,0.47792,0.49155,0.50513,0.51867,0.53217,0.54562,0.55903,0.5724,0.58573,0.59901,0.61225,0.62545,0.63861,0.65173,0.66481,0.67785,0.69085,0.70381,0.71673,0.72961,0.74245,0.75526,0.76802,0.78075,0.79344,0.8061,0.81871,0.83129,0.84384,0.85634,0.86882,0.88125,0.89365,0.90602,0.91835,0.93064,0.94291,0.95513,0.96733,0.97949,0.99161,1.0037,1.0158,1.0278,1.0398,1.0517,1.0637,1.0756,1.0874,1.0993,1.1111,1.1229,1.1346,1.1463,1.158,1.1696,1.1813,1.1929,1.2044,1.216,1.2275,1.2389,1.2504,1.2618,1.2732,1.2846,1.2959,1.3072,1.3185,1.3297,1.341,1.3522,1.3633,1.3745,1.3856,1.3967,1.4078,1.4188,1.4298,1.4408,1.4518,1.4628,1.4737,1.4846,1.4954,1.5063,1.5171,1.5279,1.5387,1.5494,1.5602,1.5709,1.5816,1.5922,1.6029,1.6135,1.6241,1.6346,1.6452,1.6557,1.6662,1.6767,1.6872,1.6976,1.7081,1.7185,1.7289,1.7392,1.7496,1.7599,1.7702,1.7805,1.7907,1.801,1.8112,1.8214,1.8316,1.8418,1.852,1.8621,1.8722,1.8823,1.8924,1.9025,1.9125,1.9225,1.9326,1.9426,1.9525,1.9625,1.9725,1.9824,1.9923,2.0022,2.0121,2.022,2.0318,2.0417,2.0515,2.0613,2.0711,2.0809,2.0906,2.1004,2.1101,2.1198,2.1296,2.1392,2.1489,2.1586,2.1683,2.1779,2.1875,2.1971,2.2067,2.2163,2.2259,2.2355,2.245,2.2546,2.2641,2.2736,2.2832,2.2926,2.3021,2.3116,2.3211,2.3305,2.34,2.3494,2.3588,2.3683,2.3777,2.3871,2.3964,2.4058,2.4152,2.4245,2.4339,2.4432,2.4526,2.4619,2.4712,2.4805,2.4898,2.4991,2.5084,2.5177,2.5269,2.5362,2.5455,2.5547,2.564,2.5732,2.5824,2.5917,2.6009,2.6101,2.6193,2.6285,2.6377,2.6469,2.6561,2.6653,2.6745,2.6836,2.6928,2.702,2.7111,2.7203,2.7295,2.7386,2.7478,2.7569,2.7661,2.7752,2.7844,2.7935,2.8027,2.8118,2.821,2.8301,2.8392,2.8484,2.8575,2.8667,2.8758,2.8849,2.8941,2.9032,2.9124,2.9215,2.9307,2.9398,2.949,2.9582,2.9673,2.9765,2.9857,2.9948,3.004,3.0132,3.0224,3.0316,3.0408,3.05,3.0592,3.0685,3.0777,3.0869,3.0962,3.1054,3.1147,3.124,3.1333,3.1426,3.1519,3.1612,3.1705,3.1799,3.1892,3.1986,3.208,3.2174,3.2268,3.2362,3.2457,3.2552,3.2647,3.2742,3.2837,3.2932,3.3028,3.3124,3.322,3.3316,3.3413,3.351,3.3607,3.3704,3.3802,3.39,3.3998,3.4097,3.4195,3.4295,3.4394,3.4494,3.4595,3.4695,3.4797,3.4898,3.5,3.5103,3.5206,3.5309,3.5413,3.5518,3.5623,3.5729,3.5835,3.5943,3.605,3.6159,3.6268,3.6378,3.6489,3.6601,3.6714,3.6828,3.6943,3.7059,3.7176,3.7295,3.7414,3.7536,3.7659,3.7784,3.791,3.8039,3.817,3.8303,3.8439,3.8577,3.8719,3.8864,3.9014,3.9167,3.9325,3.9488,3.9656,3.9831,4.0014,4.0205,4.0406,4.0621,4.0853,4.1112,4.1412,4.1785,4.2308,4.407]),
+    sg: new Float64Array([9.1555,9.1291,9.1027,9.0765,9.0505,9.0248,8.9993,8.9741,8.9491,8.9243,8.8998,8.8754,8.8513,8.8274,8.8037,8.7803,8.757,8.7339,8.7111,8.6884,8.666,8.6437,8.6217,8.5998,8.5781,8.5566,8.5353,8.5142,8.4933,8.4725,8.452,8.4316,8.4113,8.3913,8.3714,8.3517,8.3321,8.3127,8.2935,8.2745,8.2555,8.2368,8.2182,8.1998,8.1815,8.1633,8.1453,8.1275,8.1098,8.0922,8.0748,8.0576,8.0404,8.0234,8.0066,7.9898,7.9732,7.9568,7.9404,7.9242,7.9081,7.8922,7.8764,7.8607,7.8451,7.8296,7.8142,7.799,7.7839,7.7689,7.754,7.7392,7.7246,7.71,7.6955,7.6812,7.667,7.6528,7.6388,7.6249,7.6111,7.5973,7.5837,7.5702,7.5567,7.5434,7.5302,7.517,7.504,7.491,7.4781,7.4653,7.4526,7.44,7.4275,7.4151,7.4027,7.3904,7.3783,7.3661,7.3541,7.3422,7.3303,7.3185,7.3068,7.2952,7.2836,7.2721,7.2607,7.2493,7.2381,7.2269,7.2157,7.2047,7.1937,7.1828,7.1719,7.1611,7.1504,7.1397,7.1291,7.1186,7.1081,7.0977,7.0873,7.077,7.0668,7.0566,7.0465,7.0364,7.0264,7.0165,7.0066,6.9967,6.9869,6.9772,6.9675,6.9579,6.9483,6.9388,6.9293,6.9199,6.9105,6.9011,6.8919,6.8826,6.8734,6.8643,6.8552,6.8461,6.8371,6.8281,6.8192,6.8103,6.8014,6.7926,6.7838,6.7751,6.7664,6.7578,6.7491,6.7406,6.732,6.7235,6.715,6.7066,6.6982,6.6898,6.6815,6.6732,6.665,6.6567,6.6485,6.6404,6.6322,6.6241,6.6161,6.608,6.6,6.592,6.584,6.5761,6.5682,6.5603,6.5525,6.5447,6.5369,6.5291,6.5213,6.5136,6.5059,6.4982,6.4906,6.483,6.4754,6.4678,6.4602,6.4527,6.4451,6.4376,6.4302,6.4227,6.4152,6.4078,6.4004,6.393,6.3856,6.3783,6.371,6.3636,6.3563,6.349,6.3417,6.3345,6.3272,6.32,6.3128,6.3056,6.2984,6.2912,6.284,6.2768,6.2697,6.2625,6.2554,6.2483,6.2412,6.2341,6.227,6.2199,6.2128,6.2057,6.1987,6.1916,6.1845,6.1775,6.1704,6.1634,6.1564,6.1493,6.1423,6.1353,6.1282,6.1212,6.1142,6.1072,6.1002,6.0931,6.0861,6.0791,6.0721,6.065,6.058,6.051,6.0439,6.0369,6.0298,6.0228,6.0157,6.0087,6.0016,5.9945,5.9874,5.9804,5.9732,5.9661,5.959,5.9519,5.9447,5.9376,5.9304,5.9232,5.916,5.9088,5.9016,5.8944,5.8871,5.8798,5.8725,5.8652,5.8579,5.8506,5.8432,5.8358,5.8284,5.8209,5.8135,5.806,5.7985,5.7909,5.7834,5.7758,5.7681,5.7605,5.7528,5.7451,5.7373,5.7295,5.7217,5.7138,5.7059,5.6979,5.6899,5.6819,5.6738,5.6657,5.6575,5.6493,5.6411,5.6327,5.6244,5.6159,5.6074,5.5989,5.5903,5.5816,5.5729,5.5641,5.5552,5.5462,5.5372,5.5281,5.5189,5.5096,5.5003,5.4908,5.4813,5.4717,5.4619,5.4521,5.4422,5.4321,5.4219,5.4116,5.4012,5.3906,5.3799,5.3691,5.3581,5.3469,5.3356,5.3241,5.3124,5.3005,5.2885,5.2762,5.2636,5.2509,5.2379,5.2246,5.211,5.1971,5.1829,5.1683,5.1534,5.138,5.1222,5.1059,5.0891,5.0717,5.0536,5.0347,5.0151,4.9945,4.9727,4.9497,4.9251,4.8986,4.8697,4.8376,4.8012,4.7586,4.7059,4.6334,4.407]),
+    sfg: new Float64Array([9.1555,9.1138,9.072,9.0306,8.9894,8.9486,8.908,8.8677,8.8278,8.7881,8.7487,8.7096,8.6707,8.6321,8.5938,8.5558,8.518,8.4805,8.4433,8.4063,8.3695,8.333,8.2967,8.2607,8.225,8.1894,8.1541,8.1191,8.0842,8.0496,8.0152,7.981,7.9471,7.9134,7.8799,7.8466,7.8135,7.7806,7.7479,7.7154,7.6831,7.6511,7.6192,7.5875,7.556,7.5247,7.4936,7.4627,7.432,7.4014,7.371,7.3408,7.3108,7.281,7.2513,7.2218,7.1925,7.1633,7.1343,7.1055,7.0769,7.0484,7.02,6.9918,6.9638,6.9359,6.9082,6.8807,6.8532,6.826,6.7989,6.7719,6.7451,6.7184,6.6918,6.6654,6.6392,6.613,6.5871,6.5612,6.5355,6.5099,6.4844,6.4591,6.4339,6.4088,6.3838,6.359,6.3343,6.3097,6.2853,6.2609,6.2367,6.2126,6.1886,6.1647,6.1409,6.1172,6.0937,6.0702,6.0469,6.0237,6.0006,5.9775,5.9546,5.9318,5.9091,5.8865,5.864,5.8416,5.8193,5.797,5.7749,5.7529,5.7309,5.7091,5.6873,5.6657,5.6441,5.6226,5.6012,5.5799,5.5587,5.5375,5.5165,5.4955,5.4746,5.4538,5.433,5.4124,5.3918,5.3713,5.3509,5.3305,5.3102,5.29,5.2699,5.2498,5.2298,5.2099,5.1901,5.1703,5.1506,5.1309,5.1114,5.0919,5.0724,5.053,5.0337,5.0145,4.9953,4.9761,4.9571,4.938,4.9191,4.9002,4.8814,4.8626,4.8439,4.8252,4.8066,4.788,4.7695,4.7511,4.7327,4.7143,4.696,4.6778,4.6596,4.6414,4.6233,4.6053,4.5872,4.5693,4.5514,4.5335,4.5157,4.4979,4.4802,4.4625,4.4448,4.4272,4.4096,4.3921,4.3746,4.3571,4.3397,4.3223,4.305,4.2877,4.2704,4.2532,4.236,4.2188,4.2017,4.1846,4.1676,4.1505,4.1335,4.1166,4.0996,4.0827,4.0658,4.049,4.0322,4.0154,3.9986,3.9819,3.9651,3.9484,3.9318,3.9151,3.8985,3.8819,3.8653,3.8488,3.8323,3.8158,3.7993,3.7828,3.7663,3.7499,3.7335,3.7171,3.7007,3.6843,3.668,3.6516,3.6353,3.619,3.6027,3.5864,3.5702,3.5539,3.5376,3.5214,3.5052,3.489,3.4727,3.4565,3.4403,3.4241,3.4079,3.3918,3.3756,3.3594,3.3432,3.327,3.3109,3.2947,3.2785,3.2624,3.2462,3.23,3.2138,3.1977,3.1815,3.1653,3.1491,3.1329,3.1167,3.1004,3.0842,3.068,3.0517,3.0354,3.0192,3.0029,2.9866,2.9703,2.9539,2.9376,2.9212,2.9048,2.8884,2.872,2.8555,2.839,2.8225,2.806,2.7894,2.7729,2.7563,2.7396,2.7229,2.7062,2.6895,2.6727,2.6559,2.639,2.6222,2.6052,2.5883,2.5712,2.5542,2.5371,2.5199,2.5027,2.4854,2.4681,2.4507,2.4333,2.4158,2.3982,2.3806,2.3629,2.3452,2.3273,2.3094,2.2915,2.2734,2.2553,2.237,2.2187,2.2003,2.1818,2.1632,2.1445,2.1257,2.1068,2.0878,2.0686,2.0494,2.03,2.0105,1.9908,1.971,1.9511,1.931,1.9108,1.8903,1.8698,1.849,1.8281,1.8069,1.7856,1.764,1.7422,1.7202,1.698,1.6755,1.6527,1.6296,1.6063,1.5826,1.5586,1.5342,1.5094,1.4843,1.4587,1.4326,1.4061,1.379,1.3514,1.3231,1.2942,1.2645,1.234,1.2026,1.1703,1.1369,1.1023,1.0663,1.0288,0.9896,0.9483,0.9046,0.858,0.8076,0.7523,0.6901,0.6175,0.5274,0.4026,0]),
+};
+
+// Rows sorted by pressure, then temperature; the rows of PRESSURES[i] are STARTS[i] .. STARTS[i + 1] - 1
+const PRESSURES = new Float64Array([0.01,0.02,0.03,0.04,0.05,0.06,0.07,0.08,0.09,0.1,0.11,0.12,0.13,0.14,0.15,0.16,0.18,0.2,0.22,0.24,0.26,0.28,0.3,0.35,0.4,0.45,0.5,0.55,0.6,0.65,0.7,0.75,0.8,0.9,1,1.1,1.2,1.3,1.4,1.5,1.6,1.8,2,2.2,2.5,3,3.5,4,4.5,5,5.5,6,6.5,7,7.5,8,9,10,11,12,13,14,15,16,17,18,19,20,22,25,30,35,40,45,50,60,70,80,90,100,120,140,160,180,200,250,300,350,400,450,500,600,700,800,900,1000]);
+const STARTS = new Uint32Array([0,106,212,318,424,530,636,742,848,954,1060,1166,1272,1378,1484,1590,1696,1802,1908,2014,2120,2226,2332,2438,2544,2650,2756,2862,2968,3074,3180,3286,3392,3498,3604,3710,3816,3922,4028,4134,4240,4346,4452,4558,4664,4770,4876,4982,5088,5194,5300,5406,5512,5618,5724,5830,5936,6042,6148,6254,6360,6466,6572,6678,6784,6890,6996,7102,7208,7314,7418,7522,7626,7730,7834,7938,8042,8146,8250,8354,8458,8562,8666,8770,8874,8929,8984,9039,9094,9149,9204,9259,9314,9368,9421,9473,9524]);
+const PROPERTIES = {
+    T: new Float64Array([0,5,10,15,20,25,30,35,40,45,45.806,45.806,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,60.058,60.058,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,69.095,69.095,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,75.857,75.857,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,81.317,81.317,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,85.926,85.926,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,89.932,89.932,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,93.486,93.486,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,96.687,96.687,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,99.606,99.606,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,102.292,102.292,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,104.784,104.784,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,107.109,107.109,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,109.292,109.292,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,111.349,111.349,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,113.297,113.297,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,116.911,116.911,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,120.21,120.21,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,123.25,123.25,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,126.072,126.072,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,128.708,128.708,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,131.185,131.185,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,133.522,133.522,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,138.857,138.857,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,143.608,143.608,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,147.903,147.903,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,151.831,151.831,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,155.456,155.456,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,158.826,158.826,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,161.98,161.98,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,164.946,164.946,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,167.749,167.749,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,170.406,170.406,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,175.35,175.35,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,179.878,179.878,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,184.062,184.062,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,187.957,187.957,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,191.605,191.605,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,195.039,195.039,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,198.287,198.287,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,201.37,201.37,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,207.112,207.112,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,212.377,212.377,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,217.249,217.249,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,223.95,223.95,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,233.853,233.853,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,242.557,242.557,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,250.354,250.354,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,257.437,257.437,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,263.941,263.941,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,269.965,269.965,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,275.585,275.585,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,280.858,280.858,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,285.829,285.829,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,290.535,290.535,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,295.008,295.008,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,303.345,303.345,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,310.997,310.997,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,318.079,318.079,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,324.675,324.675,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,330.854,330.854,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,336.666,336.666,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,342.155,342.155,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,347.355,347.355,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,352.293,352.293,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,356.992,356.992,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,361.473,361.473,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,365.749,365.749,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,373.705,373.705,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,5,10,15,20,25,30,35,40,45,50,55,60,65,70,75,80,85,90,95,100,105,110,115,120,125,130,135,140,145,150,155,160,165,170,175,180,185,190,195,200,210,220,230,240,250,260,270,280,290,300,310,320,330,340,350,360,370,380,390,400,410,420,430,440,450,460,470,480,490,500,520,540,560,580,600,620,640,660,680,700,720,740,760,780,800,820,840,860,880,900,920,940,960,980,1000,1100,1200,1300,1400,1500,1600,1800,2000,0,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,0,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,0,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,0,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,0,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,0,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,0,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,0,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,10,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,20,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,25,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000,30,40,50,60,70,80,90,100,110,120,130,140,150,160,170,180,190,200,210,220,230,240,250,260,270,280,290,300,320,340,360,380,400,420,440,460,480,500,550,600,650,700,750,800,900,1000,1200,1400,1600,1800,2000]),
+    v: new Float64Array([0.0010002,0.00100008,0.00100034,0.00100094,0.00100184,0.001003,0.00100441,0.00100604,0.00100789,0.00100992,0.00101027,14.67,14.867,15.101,15.335,15.568,15.801,16.034,16.267,16.5,16.732,16.964,17.196,17.428,17.66,17.892,18.124,18.356,18.587,18.819,19.05,19.282,19.513,19.745,19.976,20.207,20.438,20.67,20.901,21.132,21.363,21.594,21.826,22.288,22.75,23.212,23.674,24.136,24.598,25.06,25.522,25.984,26.446,26.907,27.369,27.831,28.293,28.755,29.216,29.678,30.14,30.601,31.063,31.525,31.986,32.448,32.91,33.371,33.833,34.295,34.756,35.218,35.68,36.603,37.526,38.449,39.372,40.296,41.219,42.142,43.065,43.988,44.911,45.834,46.758,47.681,48.604,49.527,50.45,51.373,52.296,53.219,54.142,55.065,55.989,56.912,57.835,58.758,63.373,67.988,72.604,77.219,81.834,86.45,95.68,104.91,0.0010002,0.0010007,0.00100034,0.00100094,0.00100183,0.001003,0.00100441,0.0010064,0.00100788,0.00100992,0.00101215,0.00101455,0.00101713,0.00101716,7.648,7.7648,7.8826,8.0002,8.1176,8.2348,8.3518,8.4687,8.5855,8.7022,8.8187,8.9352,9.0516,9.1679,9.2841,9.4003,9.5164,9.6325,9.7486,9.8646,9.9805,10.096,10.212,10.328,10.444,10.56,10.676,10.791,10.907,11.139,11.37,11.601,11.833,12.064,12.295,12.526,12.757,12.989,13.22,13.451,13.682,13.913,14.144,14.375,14.606,14.837,15.068,15.299,15.53,15.76,15.991,16.222,16.453,16.684,16.915,17.146,17.377,17.608,17.838,18.3,18.762,19.224,19.685,20.147,20.609,21.07,21.532,21.993,22.455,22.917,23.378,23.84,24.301,24.763,25.225,25.686,26.148,26.609,27.071,27.532,27.994,28.456,28.917,29.379,31.686,33.994,36.302,38.61,40.917,43.225,47.84,52.455,0.00100019,0.00100007,0.00100033,0.00100093,0.00100183,0.00100299,0.0010044,0.00100603,0.00100788,0.00100992,0.00101214,0.00101455,0.00101712,0.00101987,0.00102224,5.2284,5.2428,5.322,5.401,5.4797,5.5583,5.6368,5.7151,5.7933,5.8714,5.9495,6.0274,6.1053,6.183,6.2608,6.3385,6.4161,6.4937,6.5712,6.6487,6.7262,6.8036,6.8811,6.9584,7.0358,7.1131,7.1905,7.2677,7.4223,7.5768,7.7312,7.8855,8.0399,8.1941,8.3484,8.5026,8.6568,8.811,8.9651,9.1192,9.2733,9.4274,9.5815,9.7356,9.8896,10.044,10.198,10.352,10.506,10.66,10.814,10.968,11.122,11.276,11.43,11.584,11.737,11.891,12.199,12.507,12.815,13.123,13.431,13.738,14.046,14.354,14.662,14.97,15.277,15.585,15.893,16.201,16.508,16.816,17.124,17.432,17.739,18.047,18.355,18.663,18.97,19.278,19.586,21.124,22.663,24.201,25.74,27.278,28.817,31.894,34.97,0.00100019,0.00100006,0.00100033,0.00100093,0.00100182,0.00100299,0.0010044,0.00100603,0.00100787,0.00100991,0.00101214,0.00101454,0.00101712,0.00101986,0.00102277,0.00102584,0.00102638,3.993,4.0425,4.1021,4.1615,4.2208,4.2799,4.3389,4.3978,4.4566,4.5153,4.5739,4.6325,4.691,4.7495,4.8079,4.8662,4.9245,4.9828,5.0411,5.0993,5.1575,5.2156,5.2737,5.3319,5.3899,5.448,5.5641,5.6801,5.7961,5.912,6.0278,6.1437,6.2594,6.3752,6.4909,6.6066,6.7223,6.838,6.9536,7.0693,7.1849,7.3005,7.4161,7.5316,7.6472,7.7628,7.8783,7.9938,8.1094,8.2249,8.3404,8.4559,8.5714,8.6869,8.8024,8.9179,9.1488,9.3798,9.6107,9.8416,10.073,10.303,10.534,10.765,10.996,11.227,11.458,11.689,11.919,12.15,12.381,12.612,12.843,13.074,13.304,13.535,13.766,13.997,14.228,14.458,14.689,15.843,16.997,18.151,19.305,20.459,21.613,23.92,26.228,0.00100018,0.00100006,0.00100032,0.00100092,0.00100182,0.00100298,0.00100439,0.00100603,0.00100787,0.00100991,0.00101213,0.00101454,0.00101711,0.00101986,0.00102276,0.00102583,0.00102905,0.00102993,3.24,3.2754,3.3233,3.3711,3.4187,3.4661,3.5135,3.5608,3.608,3.6551,3.7021,3.7491,3.796,3.8429,3.8897,3.9365,3.9833,4.03,4.0766,4.1233,4.1699,4.2165,4.2631,4.3096,4.3562,4.4492,4.5421,4.635,4.7278,4.8206,4.9134,5.0061,5.0988,5.1914,5.284,5.3767,5.4692,5.5618,5.6544,5.7469,5.8394,5.9319,6.0244,6.1169,6.2094,6.3019,6.3943,6.4868,6.5792,6.6717,6.7641,6.8565,6.9489,7.0414,7.1338,7.3186,7.5034,7.6881,7.8729,8.0576,8.2424,8.4271,8.6118,8.7965,8.9812,9.1659,9.3506,9.5353,9.72,9.9047,10.089,10.274,10.459,10.643,10.828,11.013,11.197,11.382,11.567,11.751,12.674,13.598,14.521,15.444,16.367,17.29,19.136,20.982,0.00100018,0.00100005,0.00100032,0.00100092,0.00100182,0.00100298,0.00100439,0.00100602,0.00100786,0.0010099,0.00101213,0.00101453,0.00101711,0.00101985,0.00102276,0.00102583,0.00102905,0.00103243,0.00103307,2.7317,2.7645,2.8046,2.8445,2.8843,2.924,2.9636,3.0031,3.0425,3.0819,3.1212,3.1604,3.1996,3.2387,3.2778,3.3169,3.3559,3.3949,3.4338,3.4728,3.5117,3.5506,3.5894,3.6283,3.7059,3.7834,3.8609,3.9384,4.0158,4.0932,4.1705,4.2478,4.3251,4.4023,4.4795,4.5567,4.6339,4.7111,4.7883,4.8654,4.9425,5.0196,5.0967,5.1738,5.2509,5.328,5.4051,5.4821,5.5592,5.6362,5.7133,5.7903,5.8673,5.9444,6.0984,6.2524,6.4064,6.5604,6.7144,6.8684,7.0223,7.1763,7.3302,7.4841,7.6381,7.792,7.9459,8.0998,8.2537,8.4076,8.5615,8.7154,8.8693,9.0232,9.1771,9.331,9.4849,9.6388,9.7927,10.562,11.331,12.101,12.87,13.639,14.409,15.947,17.485,0.00100017,0.00100005,0.00100031,0.00100091,0.00100181,0.00100298,0.00100438,0.00100602,0.00100786,0.0010099,0.00101212,0.00101453,0.00101711,0.00101985,0.00102276,0.00102582,0.00102904,0.00103242,0.0010359,2.3648,2.3653,2.3999,2.4343,2.4687,2.5029,2.537,2.571,2.6049,2.6388,2.6726,2.7064,2.7401,2.7737,2.8073,2.8409,2.8744,2.9079,2.9414,2.9748,3.0082,3.0416,3.075,3.1083,3.175,3.2415,3.308,3.3745,3.4409,3.5073,3.5736,3.64,3.7062,3.7725,3.8387,3.905,3.9712,4.0373,4.1035,4.1697,4.2358,4.3019,4.368,4.4341,4.5002,4.5663,4.6324,4.6985,4.7645,4.8306,4.8966,4.9627,5.0287,5.0948,5.2268,5.3589,5.4909,5.6229,5.7549,5.8869,6.0189,6.1509,6.2828,6.4148,6.5467,6.6787,6.8106,6.9426,7.0745,7.2064,7.3384,7.4703,7.6022,7.7341,7.866,7.9979,8.1298,8.2617,8.3937,9.0531,9.7126,10.372,11.031,11.691,12.35,13.669,14.988,0.00100017,0.00100004,0.00100031,0.00100091,0.00100181,0.00100297,0.00100438,0.00100601,0.00100785,0.00100989,0.00101212,0.00101452,0.0010171,0.00101984,0.00102275,0.00102582,0.00102904,0.00103242,0.00103595,0.0010385,2.0871,2.0963,2.1267,2.1569,2.187,2.217,2.2469,2.2768,2.3065,2.3362,2.3658,2.3954,2.4249,2.4544,2.4839,2.5133,2.5427,2.572,2.6013,2.6306,2.6599,2.6891,2.7184,2.7768,2.8351,2.8934,2.9516,3.0098,3.0679,3.126,3.1841,3.2421,3.3001,3.3581,3.4161,3.4741,3.532,3.5899,3.6478,3.7057,3.7636,3.8215,3.8794,3.9372,3.9951,4.0529,4.1107,4.1686,4.2264,4.2842,4.342,4.3998,4.4576,4.5732,4.6887,4.8043,4.9198,5.0353,5.1508,5.2663,5.3818,5.4973,5.6128,5.7283,5.8437,5.9592,6.0746,6.1901,6.3055,6.421,6.5364,6.6518,6.7673,6.8827,6.9981,7.1136,7.229,7.3444,7.9215,8.4985,9.0755,9.6525,10.229,10.806,11.96,13.114,0.00100016,0.00100004,0.0010003,0.0010009,0.0010018,0.00100297,0.00100437,0.00100601,0.00100785,0.00100989,0.00101211,0.00101452,0.0010171,0.00101984,0.00102275,0.00102581,0.00102903,0.00103241,0.00103594,0.00103963,0.00104091,1.8694,1.8874,1.9144,1.9413,1.9681,1.9948,2.0215,2.048,2.0745,2.101,2.1273,2.1537,2.18,2.2062,2.2324,2.2586,2.2847,2.3109,2.3369,2.363,2.3891,2.4151,2.4671,2.519,2.5708,2.6227,2.6744,2.7262,2.7779,2.8295,2.8811,2.9328,2.9843,3.0359,3.0875,3.139,3.1905,3.242,3.2935,3.345,3.3964,3.4479,3.4993,3.5508,3.6022,3.6536,3.705,3.7564,3.8078,3.8592,3.9106,3.962,4.0648,4.1675,4.2702,4.3729,4.4756,4.5783,4.681,4.7837,4.8863,4.989,5.0916,5.1943,5.2969,5.3996,5.5022,5.6048,5.7074,5.8101,5.9127,6.0153,6.1179,6.2205,6.3231,6.4257,6.5283,7.0413,7.5542,8.0671,8.58,9.0929,9.6058,10.631,11.657,0.00100016,0.00100003,0.0010003,0.0010009,0.0010018,0.00100296,0.00100437,0.001006,0.00100785,0.00100988,0.00101211,0.00101452,0.00101709,0.00101984,0.00102274,0.00102581,0.00102903,0.00103241,0.00103594,0.00103962,0.00104315,1.6939,1.6959,1.7204,1.7447,1.769,1.7932,1.8172,1.8412,1.8652,1.8891,1.9129,1.9367,1.9604,1.9841,2.0077,2.0313,2.0549,2.0785,2.102,2.1255,2.149,2.1724,2.2193,2.2661,2.3128,2.3595,2.4062,2.4528,2.4993,2.5459,2.5924,2.6388,2.6853,2.7317,2.7782,2.8246,2.871,2.9173,2.9637,3.01,3.0564,3.1027,3.149,3.1953,3.2416,3.2879,3.3342,3.3805,3.4267,3.473,3.5193,3.5655,3.658,3.7505,3.843,3.9354,4.0279,4.1203,4.2127,4.3052,4.3976,4.49,4.5824,4.6747,4.7671,4.8595,4.9519,5.0443,5.1366,5.229,5.3213,5.4137,5.5061,5.5984,5.6908,5.7831,5.8754,6.3371,6.7988,7.2604,7.722,8.1836,8.6452,9.5684,10.491,0.00100015,0.00100003,0.00100029,0.00100089,0.00100179,0.00100296,0.00100437,0.001006,0.00100784,0.00100988,0.00101211,0.00101451,0.00101709,0.00101983,0.00102274,0.0010258,0.00102902,0.0010324,0.00103593,0.00103962,0.00104346,0.00104527,1.5495,1.5616,1.5839,1.6061,1.6281,1.6501,1.672,1.6939,1.7157,1.7374,1.7591,1.7807,1.8023,1.8239,1.8454,1.8669,1.8883,1.9098,1.9312,1.9525,1.9739,2.0166,2.0592,2.1017,2.1442,2.1867,2.2291,2.2714,2.3138,2.3561,2.3984,2.4406,2.4829,2.5251,2.5673,2.6095,2.6517,2.6938,2.736,2.7781,2.8203,2.8624,2.9045,2.9466,2.9887,3.0308,3.0729,3.1149,3.157,3.1991,3.2411,3.3253,3.4093,3.4934,3.5775,3.6615,3.7456,3.8296,3.9136,3.9977,4.0817,4.1657,4.2497,4.3337,4.4177,4.5016,4.5856,4.6696,4.7536,4.8375,4.9215,5.0055,5.0894,5.1734,5.2573,5.3413,5.761,6.1807,6.6004,7.0201,7.4397,7.8593,8.6985,9.5377,0.00100015,0.00100002,0.00100029,0.00100089,0.00100179,0.00100295,0.00100436,0.00100599,0.00100784,0.00100988,0.0010121,0.00101451,0.00101708,0.00101983,0.00102273,0.0010258,0.00102902,0.0010324,0.00103593,0.00103961,0.00104345,0.00104727,1.4284,1.4293,1.4498,1.4703,1.4906,1.5109,1.531,1.5511,1.5712,1.5912,1.6111,1.631,1.6508,1.6706,1.6904,1.7102,1.7299,1.7496,1.7692,1.7888,1.8085,1.8476,1.8867,1.9258,1.9648,2.0037,2.0427,2.0815,2.1204,2.1592,2.198,2.2367,2.2755,2.3142,2.3529,2.3916,2.4303,2.469,2.5076,2.5463,2.5849,2.6235,2.6621,2.7008,2.7394,2.7779,2.8165,2.8551,2.8937,2.9323,2.9708,3.0479,3.125,3.2021,3.2792,3.3563,3.4333,3.5104,3.5874,3.6644,3.7414,3.8184,3.8954,3.9724,4.0494,4.1264,4.2034,4.2804,4.3574,4.4343,4.5113,4.5883,4.6653,4.7422,4.8192,4.8961,5.2809,5.6657,6.0504,6.4351,6.8197,7.2044,7.9737,8.743,0.00100014,0.00100002,0.00100028,0.00100088,0.00100178,0.00100295,0.00100436,0.00100599,0.00100783,0.00100987,0.0010121,0.0010145,0.00101708,0.00101982,0.00102273,0.00102579,0.00102901,0.00103239,0.00103592,0.00103961,0.00104345,0.00104744,0.00104917,1.3253,1.3364,1.3553,1.3742,1.393,1.4117,1.4303,1.4489,1.4674,1.4859,1.5043,1.5227,1.541,1.5593,1.5776,1.5958,1.614,1.6322,1.6503,1.6685,1.7047,1.7408,1.7769,1.813,1.849,1.8849,1.9208,1.9567,1.9926,2.0284,2.0642,2.1,2.1358,2.1715,2.2073,2.243,2.2787,2.3144,2.3501,2.3858,2.4214,2.4571,2.4927,2.5284,2.564,2.5996,2.6353,2.6709,2.7065,2.7421,2.8133,2.8845,2.9556,3.0268,3.0979,3.1691,3.2402,3.3113,3.3824,3.4535,3.5246,3.5957,3.6668,3.7379,3.8089,3.88,3.9511,4.0221,4.0932,4.1642,4.2353,4.3064,4.3774,4.4484,4.5195,4.8747,5.2298,5.585,5.9401,6.2952,6.6502,7.3604,8.0705,0.00100014,0.00100001,0.00100028,0.00100088,0.00100178,0.00100294,0.00100435,0.00100599,0.00100783,0.00100987,0.00101209,0.0010145,0.00101707,0.00101982,0.00102272,0.00102579,0.00102901,0.00103239,0.00103592,0.0010396,0.00104344,0.00104743,0.00105099,1.2366,1.2391,1.2568,1.2745,1.292,1.3094,1.3268,1.3441,1.3613,1.3785,1.3957,1.4128,1.4299,1.4469,1.4639,1.4809,1.4978,1.5147,1.5316,1.5485,1.5822,1.6158,1.6493,1.6828,1.7163,1.7497,1.7831,1.8164,1.8498,1.8831,1.9163,1.9496,1.9828,2.016,2.0492,2.0824,2.1156,2.1488,2.1819,2.2151,2.2482,2.2813,2.3144,2.3475,2.3806,2.4137,2.4468,2.4799,2.513,2.546,2.6122,2.6783,2.7444,2.8105,2.8765,2.9426,3.0086,3.0747,3.1407,3.2067,3.2728,3.3388,3.4048,3.4708,3.5368,3.6028,3.6688,3.7348,3.8008,3.8668,3.9327,3.9987,4.0647,4.1307,4.1966,4.5265,4.8563,5.186,5.5158,5.8455,6.1752,6.8347,7.494,0.00100013,0.00100001,0.00100027,0.00100088,0.00100177,0.00100294,0.00100435,0.00100598,0.00100782,0.00100986,0.00101209,0.00101449,0.00101707,0.00101981,0.00102272,0.00102578,0.00102901,0.00103238,0.00103591,0.0010396,0.00104344,0.00104743,0.00105158,0.00105273,1.1593,1.1714,1.188,1.2044,1.2208,1.237,1.2533,1.2694,1.2855,1.3016,1.3176,1.3335,1.3495,1.3654,1.3813,1.3971,1.4129,1.4287,1.4445,1.476,1.5074,1.5388,1.5701,1.6013,1.6325,1.6637,1.6949,1.726,1.7571,1.7882,1.8192,1.8503,1.8813,1.9123,1.9433,1.9743,2.0052,2.0362,2.0671,2.0981,2.129,2.1599,2.1908,2.2217,2.2526,2.2835,2.3144,2.3453,2.3761,2.4379,2.4996,2.5613,2.623,2.6846,2.7463,2.808,2.8696,2.9312,2.9929,3.0545,3.1161,3.1777,3.2394,3.301,3.3626,3.4242,3.4858,3.5473,3.6089,3.6705,3.7321,3.7937,3.8553,3.9168,4.2247,4.5325,4.8403,5.1481,5.4558,5.7636,6.379,6.9945,0.00100013,0.001,0.00100027,0.00100087,0.00100177,0.00100293,0.00100434,0.00100598,0.00100782,0.00100986,0.00101208,0.00101449,0.00101706,0.00101981,0.00102271,0.00102578,0.001029,0.00103238,0.00103591,0.00103959,0.00104343,0.00104742,0.00105157,0.0010544,1.0914,1.0967,1.1123,1.1278,1.1432,1.1585,1.1738,1.189,1.2041,1.2192,1.2343,1.2493,1.2642,1.2792,1.2941,1.309,1.3238,1.3387,1.3535,1.3831,1.4126,1.442,1.4714,1.5007,1.53,1.5593,1.5885,1.6177,1.6469,1.676,1.7052,1.7343,1.7634,1.7925,1.8215,1.8506,1.8796,1.9087,1.9377,1.9667,1.9957,2.0247,2.0537,2.0826,2.1116,2.1406,2.1695,2.1985,2.2274,2.2853,2.3432,2.4011,2.4589,2.5167,2.5745,2.6324,2.6902,2.748,2.8057,2.8635,2.9213,2.9791,3.0368,3.0946,3.1523,3.2101,3.2679,3.3256,3.3833,3.4411,3.4988,3.5566,3.6143,3.672,3.9606,4.2492,4.5378,4.8263,5.1149,5.4034,5.9804,6.5573,0.00100012,0.00099999,0.00100026,0.00100086,0.00100176,0.00100293,0.00100433,0.00100597,0.00100781,0.00100985,0.00101207,0.00101448,0.00101706,0.0010198,0.0010227,0.00102577,0.00102899,0.00103237,0.0010359,0.00103958,0.00104342,0.00104741,0.00105156,0.00105587,0.00105756,0.97747,0.98612,1,1.0139,1.0276,1.0413,1.0549,1.0684,1.0819,1.0954,1.1088,1.1222,1.1355,1.1488,1.1621,1.1754,1.1886,1.2018,1.2282,1.2545,1.2807,1.3069,1.333,1.3591,1.3852,1.4112,1.4372,1.4632,1.4891,1.5151,1.541,1.5669,1.5927,1.6186,1.6445,1.6703,1.6961,1.7219,1.7477,1.7735,1.7993,1.8251,1.8509,1.8766,1.9024,1.9282,1.9539,1.9797,2.0311,2.0826,2.134,2.1855,2.2369,2.2883,2.3397,2.3911,2.4425,2.4938,2.5452,2.5966,2.6479,2.6993,2.7506,2.802,2.8533,2.9047,2.956,3.0073,3.0587,3.11,3.1613,3.2127,3.264,3.5205,3.7771,4.0336,4.2901,4.5466,4.803,5.3159,5.8288,0.00100011,0.00099998,0.00100025,0.00100085,0.00100175,0.00100292,0.00100433,0.00100596,0.0010078,0.00100984,0.00101207,0.00101447,0.00101705,0.00101979,0.0010227,0.00102576,0.00102898,0.00103236,0.00103589,0.00103957,0.00104341,0.0010474,0.00105155,0.00105586,0.00106032,0.00106052,0.88568,0.89781,0.91037,0.92284,0.93524,0.94758,0.95986,0.97208,0.98426,0.9964,1.0085,1.0206,1.0326,1.0446,1.0566,1.0685,1.0805,1.1043,1.128,1.1517,1.1753,1.1989,1.2224,1.2459,1.2694,1.2928,1.3162,1.3396,1.363,1.3863,1.4097,1.433,1.4563,1.4795,1.5028,1.5261,1.5493,1.5726,1.5958,1.619,1.6422,1.6655,1.6887,1.7119,1.7351,1.7582,1.7814,1.8278,1.8741,1.9204,1.9667,2.013,2.0593,2.1056,2.1518,2.1981,2.2443,2.2906,2.3368,2.383,2.4293,2.4755,2.5217,2.5679,2.6141,2.6603,2.7066,2.7528,2.799,2.8451,2.8913,2.9375,3.1685,3.3994,3.6302,3.8611,4.0919,4.3228,4.7844,5.246,0.0010001,0.00099998,0.00100024,0.00100084,0.00100174,0.00100291,0.00100432,0.00100595,0.00100779,0.00100983,0.00101206,0.00101446,0.00101704,0.00101978,0.00102269,0.00102575,0.00102897,0.00103235,0.00103588,0.00103956,0.0010434,0.00104739,0.00105154,0.00105585,0.00106031,0.0010633,0.81007,0.81414,0.82567,0.83712,0.84848,0.85978,0.87102,0.8822,0.89334,0.90444,0.9155,0.92652,0.93751,0.94847,0.95941,0.97032,0.9812,1.0029,1.0246,1.0461,1.0677,1.0891,1.1106,1.132,1.1533,1.1747,1.196,1.2173,1.2385,1.2598,1.281,1.3022,1.3234,1.3446,1.3658,1.387,1.4081,1.4293,1.4504,1.4715,1.4926,1.5138,1.5349,1.556,1.5771,1.5981,1.6192,1.6614,1.7035,1.7456,1.7877,1.8298,1.8719,1.914,1.9561,1.9981,2.0402,2.0822,2.1243,2.1663,2.2083,2.2504,2.2924,2.3344,2.3764,2.4184,2.4604,2.5025,2.5445,2.5865,2.6285,2.6705,2.8804,3.0903,3.3002,3.5101,3.72,3.9298,4.3495,4.7691,0.00100009,0.00099997,0.00100023,0.00100083,0.00100173,0.0010029,0.00100431,0.00100594,0.00100778,0.00100982,0.00101205,0.00101445,0.00101703,0.00101977,0.00102268,0.00102574,0.00102896,0.00103234,0.00103587,0.00103955,0.00104339,0.00104738,0.00105153,0.00105584,0.0010603,0.00106493,0.00106594,0.74668,0.75507,0.76566,0.77616,0.7866,0.79697,0.80729,0.81757,0.82779,0.83798,0.84814,0.85826,0.86835,0.87841,0.88845,0.89847,0.91843,0.93833,0.95816,0.97794,0.99767,1.0174,1.037,1.0566,1.0762,1.0958,1.1153,1.1348,1.1543,1.1738,1.1933,1.2128,1.2322,1.2516,1.271,1.2904,1.3098,1.3292,1.3486,1.368,1.3873,1.4067,1.426,1.4454,1.4647,1.4841,1.5227,1.5614,1.6,1.6386,1.6772,1.7158,1.7544,1.7929,1.8315,1.8701,1.9086,1.9472,1.9857,2.0242,2.0628,2.1013,2.1398,2.1783,2.2168,2.2554,2.2939,2.3324,2.3709,2.4094,2.4479,2.6404,2.8328,3.0252,3.2176,3.41,3.6023,3.987,4.3717,0.00100008,0.00099996,0.00100022,0.00100082,0.00100172,0.00100289,0.0010043,0.00100593,0.00100777,0.00100981,0.00101204,0.00101444,0.00101702,0.00101976,0.00102267,0.00102573,0.00102895,0.00103233,0.00103586,0.00103954,0.00104338,0.00104737,0.00105152,0.00105583,0.00106029,0.00106492,0.00106846,0.69273,0.6953,0.70517,0.71495,0.72466,0.73431,0.7439,0.75344,0.76293,0.77239,0.78181,0.79119,0.80055,0.80987,0.81917,0.82845,0.84695,0.86537,0.88372,0.90203,0.92028,0.93849,0.95666,0.97481,0.99292,1.011,1.0291,1.0471,1.0651,1.0831,1.1011,1.1191,1.1371,1.155,1.1729,1.1909,1.2088,1.2267,1.2446,1.2625,1.2804,1.2982,1.3161,1.334,1.3518,1.3697,1.4054,1.4411,1.4767,1.5124,1.548,1.5837,1.6193,1.6549,1.6905,1.7261,1.7617,1.7973,1.8329,1.8684,1.904,1.9396,1.9752,2.0107,2.0463,2.0818,2.1174,2.1529,2.1885,2.224,2.2596,2.4372,2.6149,2.7925,2.9701,3.1477,3.3253,3.6804,4.0355,0.00100007,0.00099995,0.00100021,0.00100081,0.00100171,0.00100288,0.00100429,0.00100592,0.00100777,0.0010098,0.00101203,0.00101443,0.00101701,0.00101975,0.00102266,0.00102572,0.00102894,0.00103232,0.00103585,0.00103953,0.00104337,0.00104736,0.00105151,0.00105581,0.00106028,0.00106491,0.0010697,0.00107086,0.64624,0.6533,0.66247,0.67156,0.68059,0.68955,0.69846,0.70733,0.71616,0.72494,0.7337,0.74242,0.75112,0.75979,0.76844,0.78567,0.80282,0.81992,0.83695,0.85394,0.87088,0.88779,0.90467,0.92151,0.93833,0.95512,0.9719,0.98865,1.0054,1.0221,1.0388,1.0555,1.0722,1.0889,1.1055,1.1222,1.1388,1.1554,1.1721,1.1887,1.2053,1.2219,1.2385,1.2551,1.2717,1.3048,1.338,1.3711,1.4042,1.4373,1.4704,1.5035,1.5366,1.5697,1.6027,1.6358,1.6688,1.7019,1.7349,1.768,1.801,1.834,1.867,1.9001,1.9331,1.9661,1.9991,2.0321,2.0651,2.0981,2.2631,2.4281,2.593,2.758,2.9229,3.0878,3.4175,3.7472,0.00100006,0.00099994,0.0010002,0.00100081,0.0010017,0.00100287,0.00100428,0.00100591,0.00100776,0.0010098,0.00101202,0.00101443,0.001017,0.00101974,0.00102265,0.00102571,0.00102893,0.00103231,0.00103584,0.00103952,0.00104336,0.00104735,0.0010515,0.0010558,0.00106027,0.0010649,0.00106969,0.00107317,0.60576,0.60833,0.61697,0.62553,0.63401,0.64244,0.65081,0.65913,0.66742,0.67566,0.68387,0.69205,0.7002,0.70832,0.71642,0.73256,0.74862,0.76461,0.78055,0.79644,0.81229,0.8281,0.84388,0.85962,0.87534,0.89104,0.90672,0.92237,0.93801,0.95363,0.96924,0.98483,1.0004,1.016,1.0315,1.0471,1.0626,1.0782,1.0937,1.1092,1.1247,1.1402,1.1557,1.1712,1.1867,1.2177,1.2486,1.2796,1.3105,1.3414,1.3723,1.4032,1.4341,1.4649,1.4958,1.5266,1.5575,1.5884,1.6192,1.65,1.6809,1.7117,1.7425,1.7733,1.8042,1.835,1.8658,1.8966,1.9274,1.9582,2.1122,2.2662,2.4202,2.5741,2.728,2.8819,3.1897,3.4975,0.00100003,0.00099991,0.00100018,0.00100078,0.00100168,0.00100285,0.00100426,0.00100589,0.00100773,0.00100977,0.001012,0.0010144,0.00101698,0.00101972,0.00102263,0.00102569,0.00102891,0.00103229,0.00103581,0.0010395,0.00104333,0.00104732,0.00105147,0.00105578,0.00106024,0.00106487,0.00106966,0.00107463,0.00107857,0.52418,0.52591,0.53341,0.54083,0.54818,0.55547,0.56272,0.56991,0.57707,0.58419,0.59128,0.59834,0.60537,0.61238,0.62633,0.6402,0.654,0.66775,0.68145,0.6951,0.70872,0.7223,0.73585,0.74937,0.76287,0.77635,0.78981,0.80325,0.81668,0.83009,0.84348,0.85687,0.87024,0.8836,0.89695,0.9103,0.92363,0.93696,0.95028,0.9636,0.9769,0.99021,1.0035,1.0168,1.0434,1.0699,1.0965,1.123,1.1495,1.176,1.2025,1.229,1.2555,1.2819,1.3084,1.3348,1.3613,1.3877,1.4142,1.4406,1.4671,1.4935,1.5199,1.5463,1.5728,1.5992,1.6256,1.652,1.6784,1.8105,1.9425,2.0745,2.2064,2.3383,2.4703,2.7341,2.9979,0.00100001,0.00099989,0.00100015,0.00100076,0.00100166,0.00100283,0.00100424,0.00100587,0.00100771,0.00100975,0.00101198,0.00101438,0.00101696,0.0010197,0.0010226,0.00102567,0.00102889,0.00103226,0.00103579,0.00103947,0.00104331,0.0010473,0.00105144,0.00105575,0.00106021,0.00106484,0.00106963,0.00107459,0.00107973,0.00108355,0.46238,0.46425,0.47088,0.47744,0.48393,0.49037,0.49676,0.5031,0.50941,0.51569,0.52193,0.52814,0.53433,0.54665,0.55888,0.57104,0.58314,0.5952,0.6072,0.61917,0.63111,0.64301,0.65489,0.66674,0.67858,0.69039,0.70218,0.71396,0.72572,0.73747,0.74921,0.76093,0.77264,0.78435,0.79605,0.80773,0.81941,0.83109,0.84275,0.85441,0.86607,0.87771,0.88936,0.91263,0.93589,0.95913,0.98236,1.0056,1.0288,1.052,1.0752,1.0983,1.1215,1.1447,1.1678,1.191,1.2142,1.2373,1.2604,1.2836,1.3067,1.3298,1.353,1.3761,1.3992,1.4223,1.4455,1.4686,1.5841,1.6997,1.8152,1.9306,2.0461,2.1615,2.3924,2.6232,0.00099998,0.00099986,0.00100013,0.00100074,0.00100164,0.0010028,0.00100421,0.00100585,0.00100769,0.00100973,0.00101195,0.00101436,0.00101693,0.00101968,0.00102258,0.00102564,0.00102886,0.00103224,0.00103577,0.00103945,0.00104328,0.00104727,0.00105142,0.00105572,0.00106018,0.00106481,0.0010696,0.00107456,0.0010797,0.00108502,0.00108819,0.4139,0.41642,0.42237,0.42825,0.43406,0.43983,0.44555,0.45123,0.45687,0.46248,0.46806,0.47362,0.48466,0.49561,0.5065,0.51733,0.52811,0.53884,0.54953,0.56018,0.57081,0.5814,0.59198,0.60253,0.61306,0.62357,0.63407,0.64455,0.65501,0.66547,0.67591,0.68634,0.69677,0.70718,0.71759,0.72799,0.73838,0.74876,0.75914,0.76951,0.77988,0.79024,0.81095,0.83164,0.85232,0.87298,0.89364,0.91428,0.93491,0.95554,0.97615,0.99676,1.0174,1.038,1.0586,1.0791,1.0997,1.1203,1.1409,1.1614,1.182,1.2026,1.2231,1.2437,1.2643,1.2848,1.3054,1.4081,1.5108,1.6135,1.7161,1.8188,1.9214,2.1266,2.3318,0.00099995,0.00099984,0.00100011,0.00100071,0.00100161,0.00100278,0.00100419,0.00100582,0.00100767,0.00100971,0.00101193,0.00101434,0.00101691,0.00101965,0.00102256,0.00102562,0.00102884,0.00103221,0.00103574,0.00103942,0.00104326,0.00104725,0.00105139,0.00105569,0.00106016,0.00106478,0.00106957,0.00107453,0.00107967,0.00108499,0.00109049,0.00109255,0.37481,0.37827,0.38366,0.38899,0.39426,0.39948,0.40466,0.4098,0.41491,0.41998,0.42503,0.43506,0.445,0.45487,0.46467,0.47443,0.48414,0.4938,0.50344,0.51304,0.52261,0.53216,0.54169,0.55119,0.56068,0.57015,0.57961,0.58905,0.59848,0.6079,0.6173,0.6267,0.63609,0.64547,0.65484,0.66421,0.67357,0.68292,0.69227,0.70161,0.71094,0.7296,0.74824,0.76687,0.78548,0.80409,0.82268,0.84126,0.85983,0.8784,0.89696,0.91551,0.93405,0.95259,0.97113,0.98966,1.0082,1.0267,1.0452,1.0637,1.0823,1.1008,1.1193,1.1378,1.1563,1.1748,1.2673,1.3597,1.4521,1.5445,1.6369,1.7293,1.914,2.0987,0.00099993,0.00099981,0.00100008,0.00100069,0.00100159,0.00100276,0.00100417,0.0010058,0.00100764,0.00100968,0.00101191,0.00101431,0.00101689,0.00101963,0.00102253,0.0010256,0.00102882,0.00103219,0.00103572,0.0010394,0.00104323,0.00104722,0.00105136,0.00105567,0.00106013,0.00106475,0.00106954,0.0010745,0.00107964,0.00108495,0.00109045,0.00109615,0.00109668,0.3426,0.34715,0.35208,0.35695,0.36177,0.36654,0.37127,0.37597,0.38063,0.38527,0.39447,0.40358,0.41261,0.42159,0.43051,0.43938,0.44821,0.45701,0.46577,0.47451,0.48322,0.49191,0.50057,0.50922,0.51786,0.52647,0.53508,0.54367,0.55225,0.56082,0.56937,0.57792,0.58647,0.595,0.60353,0.61205,0.62056,0.62907,0.63757,0.64607,0.66305,0.68001,0.69696,0.71389,0.73082,0.74773,0.76463,0.78153,0.79842,0.8153,0.83217,0.84904,0.8659,0.88276,0.89961,0.91646,0.9333,0.95015,0.96698,0.98382,1.0007,1.0175,1.0343,1.0511,1.068,1.152,1.2361,1.3201,1.4041,1.4881,1.5721,1.74,1.9079,0.0009999,0.00099979,0.00100006,0.00100067,0.00100157,0.00100273,0.00100415,0.00100578,0.00100762,0.00100966,0.00101189,0.00101429,0.00101687,0.00101961,0.00102251,0.00102557,0.00102879,0.00103217,0.00103569,0.00103937,0.00104321,0.00104719,0.00105134,0.00105564,0.0010601,0.00106472,0.00106951,0.00107447,0.00107961,0.00108492,0.00109042,0.00109611,0.0011006,0.31558,0.31668,0.32129,0.32583,0.33032,0.33475,0.33915,0.3435,0.34783,0.35212,0.36063,0.36905,0.3774,0.38568,0.3939,0.40208,0.41021,0.41831,0.42638,0.43442,0.44243,0.45042,0.45839,0.46634,0.47427,0.48219,0.4901,0.49799,0.50587,0.51374,0.5216,0.52945,0.53729,0.54513,0.55296,0.56078,0.56859,0.5764,0.5842,0.592,0.60758,0.62315,0.6387,0.65424,0.66976,0.68528,0.70078,0.71628,0.73176,0.74725,0.76272,0.77819,0.79365,0.80911,0.82457,0.84002,0.85547,0.87091,0.88635,0.90178,0.91722,0.93265,0.94808,0.96351,0.97893,1.056,1.1331,1.2101,1.2871,1.3641,1.4411,1.5951,1.749,0.00099988,0.00099976,0.00100004,0.00100064,0.00100154,0.00100271,0.00100412,0.00100576,0.0010076,0.00100964,0.00101186,0.00101427,0.00101684,0.00101958,0.00102249,0.00102555,0.00102877,0.00103214,0.00103567,0.00103935,0.00104318,0.00104717,0.00105131,0.00105561,0.00106007,0.00106469,0.00106948,0.00107444,0.00107957,0.00108489,0.00109039,0.00109608,0.00110197,0.00110436,0.29259,0.29521,0.29948,0.30369,0.30784,0.31195,0.31602,0.32006,0.32406,0.33199,0.33983,0.34759,0.35528,0.36292,0.37051,0.37806,0.38557,0.39305,0.40049,0.40792,0.41532,0.4227,0.43006,0.4374,0.44473,0.45204,0.45934,0.46663,0.47391,0.48118,0.48844,0.49569,0.50293,0.51017,0.5174,0.52462,0.53184,0.53905,0.54625,0.56065,0.57503,0.5894,0.60376,0.6181,0.63243,0.64675,0.66106,0.67537,0.68967,0.70396,0.71824,0.73252,0.7468,0.76107,0.77534,0.7896,0.80386,0.81812,0.83237,0.84662,0.86087,0.87512,0.88936,0.9036,0.97478,1.0459,1.117,1.1881,1.2592,1.3303,1.4724,1.6145,0.00099985,0.00099974,0.00100001,0.00100062,0.00100152,0.00100269,0.0010041,0.00100574,0.00100758,0.00100962,0.00101184,0.00101425,0.00101682,0.00101956,0.00102246,0.00102553,0.00102874,0.00103212,0.00103564,0.00103932,0.00104316,0.00104714,0.00105128,0.00105558,0.00106004,0.00106467,0.00106945,0.00107441,0.00107954,0.00108485,0.00109035,0.00109604,0.00110193,0.00110796,0.27277,0.27282,0.27687,0.28084,0.28476,0.28863,0.29245,0.29624,0.3,0.30744,0.31478,0.32204,0.32923,0.33637,0.34345,0.3505,0.3575,0.36447,0.37142,0.37833,0.38523,0.3921,0.39895,0.40579,0.41261,0.41942,0.42621,0.43299,0.43977,0.44653,0.45328,0.46003,0.46676,0.47349,0.48021,0.48693,0.49364,0.50034,0.50704,0.52043,0.53379,0.54715,0.56049,0.57381,0.58713,0.60044,0.61374,0.62703,0.64031,0.65359,0.66686,0.68013,0.69339,0.70664,0.7199,0.73315,0.74639,0.75963,0.77287,0.78611,0.79934,0.81257,0.8258,0.83903,0.90514,0.97121,1.0373,1.1033,1.1693,1.2353,1.3672,1.4992,0.00099983,0.00099971,0.00099999,0.0010006,0.0010015,0.00100267,0.00100408,0.00100571,0.00100756,0.00100959,0.00101182,0.00101422,0.0010168,0.00101954,0.00102244,0.0010255,0.00102872,0.00103209,0.00103562,0.0010393,0.00104313,0.00104712,0.00105126,0.00105556,0.00106002,0.00106464,0.00106942,0.00107438,0.00107951,0.00108482,0.00109032,0.00109601,0.00110189,0.00110799,0.00111143,0.25551,0.25724,0.26102,0.26474,0.2684,0.27202,0.2756,0.27914,0.28615,0.29306,0.29989,0.30665,0.31335,0.32,0.32661,0.33317,0.33971,0.34621,0.35269,0.35915,0.36558,0.372,0.37839,0.38478,0.39115,0.3975,0.40384,0.41018,0.4165,0.42281,0.42912,0.43541,0.4417,0.44799,0.45426,0.46053,0.4668,0.47306,0.48556,0.49805,0.51053,0.52299,0.53543,0.54787,0.5603,0.57272,0.58513,0.59754,0.60994,0.62233,0.63472,0.6471,0.65948,0.67185,0.68422,0.69659,0.70895,0.72131,0.73367,0.74602,0.75837,0.77072,0.78307,0.84478,0.90646,0.96811,1.0297,1.0913,1.1529,1.2761,1.3993,0.0009998,0.00099969,0.00099996,0.00100057,0.00100148,0.00100264,0.00100406,0.00100569,0.00100753,0.00100957,0.0010118,0.0010142,0.00101678,0.00101952,0.00102242,0.00102548,0.0010287,0.00103207,0.00103559,0.00103927,0.0010431,0.00104709,0.00105123,0.00105553,0.00105999,0.00106461,0.00106939,0.00107435,0.00107948,0.00108479,0.00109028,0.00109597,0.00110186,0.00110795,0.00111426,0.00111478,0.24034,0.24366,0.2472,0.25068,0.25412,0.25752,0.26088,0.26752,0.27405,0.2805,0.28688,0.2932,0.29947,0.3057,0.31189,0.31804,0.32416,0.33026,0.33633,0.34238,0.34841,0.35442,0.36042,0.36641,0.37238,0.37834,0.38428,0.39022,0.39615,0.40207,0.40798,0.41389,0.41979,0.42568,0.43157,0.43745,0.44332,0.45506,0.46678,0.47848,0.49017,0.50185,0.51352,0.52518,0.53683,0.54847,0.56011,0.57174,0.58336,0.59498,0.60659,0.6182,0.62981,0.64141,0.653,0.6646,0.67619,0.68778,0.69936,0.71095,0.72253,0.73411,0.79197,0.8498,0.9076,0.96539,1.0232,1.0809,1.1964,1.3118,0.00099975,0.00099964,0.00099992,0.00100053,0.00100143,0.0010026,0.00100401,0.00100565,0.00100749,0.00100953,0.00101175,0.00101416,0.00101673,0.00101947,0.00102237,0.00102543,0.00102865,0.00103202,0.00103555,0.00103922,0.00104305,0.00104704,0.00105118,0.00105547,0.00105993,0.00106455,0.00106933,0.00107429,0.00107942,0.00108472,0.00109022,0.0010959,0.00110179,0.00110788,0.00111418,0.00112072,0.00112118,0.21489,0.21792,0.22112,0.22426,0.22736,0.23042,0.23644,0.24236,0.24818,0.25393,0.25962,0.26526,0.27085,0.2764,0.28192,0.2874,0.29286,0.29829,0.3037,0.30909,0.31447,0.31983,0.32517,0.3305,0.33582,0.34113,0.34643,0.35172,0.357,0.36227,0.36753,0.37279,0.37804,0.38329,0.38853,0.39376,0.40422,0.41465,0.42508,0.43549,0.44588,0.45627,0.46665,0.47702,0.48738,0.49773,0.50808,0.51842,0.52876,0.53909,0.54941,0.55974,0.57005,0.58037,0.59068,0.60099,0.6113,0.6216,0.6319,0.6422,0.6525,0.70395,0.75537,0.80677,0.85814,0.9095,0.96084,1.0635,1.1661,0.0009997,0.00099959,0.00099987,0.00100048,0.00100138,0.00100255,0.00100397,0.0010056,0.00100744,0.00100948,0.00101171,0.00101411,0.00101669,0.00101943,0.00102233,0.00102539,0.0010286,0.00103197,0.0010355,0.00103917,0.001043,0.00104699,0.00105112,0.00105542,0.00105987,0.00106449,0.00106927,0.00107423,0.00107935,0.00108466,0.00109015,0.00109583,0.00110171,0.0011078,0.0011141,0.00112063,0.00112723,0.19436,0.19444,0.19742,0.20034,0.2032,0.20602,0.21156,0.21698,0.22231,0.22756,0.23275,0.23788,0.24296,0.24801,0.25301,0.25799,0.26294,0.26786,0.27276,0.27764,0.2825,0.28735,0.29218,0.297,0.30181,0.30661,0.31139,0.31617,0.32094,0.32569,0.33045,0.33519,0.33993,0.34466,0.34939,0.35411,0.36354,0.37295,0.38235,0.39174,0.40111,0.41047,0.41982,0.42916,0.4385,0.44783,0.45715,0.46647,0.47578,0.48508,0.49438,0.50368,0.51297,0.52226,0.53155,0.54083,0.55011,0.55939,0.56867,0.57794,0.58721,0.63354,0.67983,0.7261,0.77234,0.81857,0.86478,0.95719,1.0496,0.00099965,0.00099954,0.00099982,0.00100043,0.00100134,0.00100251,0.00100392,0.00100556,0.0010074,0.00100944,0.00101166,0.00101407,0.00101664,0.00101938,0.00102228,0.00102534,0.00102856,0.00103192,0.00103545,0.00103912,0.00104295,0.00104693,0.00105107,0.00105537,0.00105982,0.00106443,0.00106922,0.00107417,0.00107929,0.00108459,0.00109008,0.00109576,0.00110164,0.00110773,0.00111403,0.00112055,0.00112731,0.00113299,0.17745,0.17797,0.18072,0.1834,0.18603,0.19118,0.1962,0.20113,0.20597,0.21075,0.21547,0.22014,0.22477,0.22936,0.23392,0.23845,0.24296,0.24744,0.2519,0.25635,0.26078,0.26519,0.26959,0.27398,0.27836,0.28272,0.28708,0.29143,0.29577,0.3001,0.30443,0.30875,0.31306,0.31737,0.32167,0.33026,0.33884,0.3474,0.35594,0.36447,0.373,0.38151,0.39001,0.39851,0.407,0.41548,0.42396,0.43243,0.4409,0.44936,0.45781,0.46627,0.47472,0.48317,0.49161,0.50005,0.50849,0.51693,0.52536,0.53379,0.57593,0.61802,0.66009,0.70214,0.74417,0.78619,0.87021,0.95419,0.0009996,0.00099949,0.00099977,0.00100039,0.00100129,0.00100246,0.00100388,0.00100551,0.00100736,0.00100939,0.00101162,0.00101402,0.0010166,0.00101933,0.00102223,0.00102529,0.00102851,0.00103188,0.0010354,0.00103907,0.0010429,0.00104688,0.00105102,0.00105531,0.00105976,0.00106438,0.00106916,0.0010741,0.00107923,0.00108453,0.00109001,0.00109569,0.00110157,0.00110765,0.00111395,0.00112047,0.00112723,0.00113424,0.0011385,0.16326,0.16432,0.16686,0.16934,0.17417,0.17887,0.18346,0.18797,0.19241,0.19679,0.20111,0.2054,0.20964,0.21386,0.21804,0.2222,0.22634,0.23045,0.23455,0.23863,0.2427,0.24675,0.25079,0.25482,0.25883,0.26284,0.26684,0.27083,0.27482,0.27879,0.28276,0.28673,0.29069,0.29464,0.30253,0.31041,0.31826,0.32611,0.33394,0.34177,0.34958,0.35739,0.36518,0.37297,0.38076,0.38853,0.39631,0.40407,0.41184,0.41959,0.42735,0.4351,0.44285,0.45059,0.45834,0.46608,0.47381,0.48155,0.48928,0.52792,0.56652,0.60509,0.64364,0.68218,0.7207,0.79772,0.87471,0.00099955,0.00099945,0.00099973,0.00100034,0.00100125,0.00100242,0.00100383,0.00100547,0.00100731,0.00100935,0.00101157,0.00101398,0.00101655,0.00101929,0.00102219,0.00102525,0.00102846,0.00103183,0.00103535,0.00103902,0.00104285,0.00104683,0.00105096,0.00105526,0.00105971,0.00106432,0.0010691,0.00107404,0.00107916,0.00108446,0.00108995,0.00109562,0.0011015,0.00110757,0.00111387,0.00112039,0.00112714,0.00113415,0.00114141,0.0011438,0.15119,0.15283,0.15519,0.15976,0.16418,0.1685,0.17273,0.17688,0.18097,0.18501,0.189,0.19296,0.19688,0.20077,0.20464,0.20848,0.2123,0.2161,0.21989,0.22366,0.22742,0.23116,0.2349,0.23862,0.24233,0.24604,0.24973,0.25342,0.2571,0.26077,0.26444,0.26811,0.27176,0.27906,0.28635,0.29362,0.30087,0.30811,0.31534,0.32257,0.32978,0.33698,0.34418,0.35137,0.35856,0.36574,0.37292,0.38009,0.38725,0.39442,0.40158,0.40873,0.41589,0.42304,0.43018,0.43733,0.44447,0.45161,0.48729,0.52293,0.55855,0.59414,0.62972,0.66529,0.73639,0.80746,0.0009995,0.0009994,0.00099968,0.00100029,0.0010012,0.00100237,0.00100379,0.00100542,0.00100727,0.00100931,0.00101153,0.00101393,0.0010165,0.00101924,0.00102214,0.0010252,0.00102841,0.00103178,0.0010353,0.00103897,0.0010428,0.00104678,0.00105091,0.0010552,0.00105965,0.00106426,0.00106904,0.00107398,0.0010791,0.0010844,0.00108988,0.00109555,0.00110142,0.0011075,0.00111379,0.00112031,0.00112706,0.00113406,0.00114132,0.00114886,0.00114892,0.14078,0.14303,0.14738,0.15158,0.15566,0.15965,0.16356,0.16741,0.1712,0.17495,0.17865,0.18232,0.18597,0.18958,0.19317,0.19674,0.20029,0.20383,0.20734,0.21085,0.21434,0.21782,0.22129,0.22475,0.2282,0.23164,0.23508,0.23851,0.24193,0.24534,0.24875,0.25216,0.25895,0.26573,0.27249,0.27923,0.28597,0.29269,0.29941,0.30612,0.31281,0.31951,0.32619,0.33287,0.33954,0.34621,0.35287,0.35953,0.36619,0.37284,0.37949,0.38614,0.39278,0.39942,0.40606,0.4127,0.41933,0.45247,0.48558,0.51866,0.55172,0.58476,0.61779,0.68382,0.74982,0.00099945,0.00099935,0.00099963,0.00100025,0.00100115,0.00100233,0.00100374,0.00100538,0.00100722,0.00100926,0.00101149,0.00101389,0.00101646,0.0010192,0.0010221,0.00102515,0.00102837,0.00103173,0.00103525,0.00103892,0.00104275,0.00104673,0.00105086,0.00105515,0.00105959,0.0010642,0.00106898,0.00107392,0.00107904,0.00108433,0.00108981,0.00109548,0.00110135,0.00110742,0.00111371,0.00112023,0.00112697,0.00113397,0.00114123,0.00114876,0.00115387,0.13171,0.13245,0.13664,0.14065,0.14453,0.14831,0.15201,0.15565,0.15923,0.16276,0.16625,0.16971,0.17313,0.17653,0.1799,0.18325,0.18659,0.1899,0.1932,0.19649,0.19976,0.20302,0.20627,0.20951,0.21274,0.21597,0.21918,0.22239,0.22559,0.22879,0.23198,0.23516,0.24152,0.24785,0.25418,0.26048,0.26678,0.27307,0.27934,0.28561,0.29187,0.29812,0.30436,0.3106,0.31684,0.32306,0.32929,0.33551,0.34173,0.34794,0.35415,0.36036,0.36656,0.37276,0.37896,0.38516,0.39135,0.42229,0.4532,0.48408,0.51494,0.54579,0.57662,0.63826,0.69986,0.0009994,0.0009993,0.00099958,0.0010002,0.00100111,0.00100228,0.0010037,0.00100533,0.00100718,0.00100922,0.00101144,0.00101384,0.00101641,0.00101915,0.00102205,0.00102511,0.00102832,0.00103168,0.0010352,0.00103887,0.0010427,0.00104667,0.0010508,0.00105509,0.00105954,0.00106415,0.00106892,0.00107386,0.00107898,0.00108427,0.00108975,0.00109541,0.00110128,0.00110735,0.00111364,0.00112014,0.00112689,0.00113388,0.00114113,0.00114866,0.00115648,0.00115868,0.12374,0.12722,0.13106,0.13477,0.13838,0.1419,0.14535,0.14875,0.15209,0.15539,0.15866,0.1619,0.16511,0.16829,0.17145,0.17459,0.17772,0.18083,0.18392,0.187,0.19007,0.19313,0.19618,0.19922,0.20225,0.20527,0.20829,0.2113,0.2143,0.2173,0.22029,0.22626,0.23222,0.23815,0.24408,0.24999,0.25589,0.26178,0.26766,0.27354,0.2794,0.28526,0.29112,0.29697,0.30281,0.30865,0.31449,0.32032,0.32615,0.33197,0.3378,0.34361,0.34943,0.35525,0.36106,0.36687,0.39589,0.42487,0.45383,0.48277,0.51169,0.5406,0.59839,0.65615,0.00099929,0.0009992,0.00099949,0.00100011,0.00100102,0.00100219,0.00100361,0.00100525,0.00100709,0.00100913,0.00101135,0.00101375,0.00101632,0.00101906,0.00102196,0.00102501,0.00102822,0.00103159,0.0010351,0.00103877,0.0010426,0.00104657,0.0010507,0.00105498,0.00105943,0.00106403,0.0010688,0.00107374,0.00107885,0.00108414,0.00108961,0.00109527,0.00110113,0.0011072,0.00111348,0.00111998,0.00112672,0.0011337,0.00114095,0.00114847,0.00115628,0.00116792,0.11037,0.11145,0.11505,0.11848,0.1218,0.12502,0.12817,0.13126,0.1343,0.13729,0.14025,0.14317,0.14606,0.14893,0.15177,0.1546,0.15741,0.1602,0.16297,0.16573,0.16849,0.17122,0.17395,0.17667,0.17939,0.18209,0.18479,0.18748,0.19016,0.19284,0.19551,0.20084,0.20615,0.21145,0.21673,0.222,0.22726,0.23251,0.23775,0.24299,0.24821,0.25343,0.25865,0.26386,0.26906,0.27426,0.27945,0.28464,0.28983,0.29502,0.3002,0.30537,0.31055,0.31572,0.32089,0.32606,0.35188,0.37766,0.40341,0.42915,0.45486,0.48057,0.53195,0.5833,0.00099919,0.0009991,0.00099939,0.00100001,0.00100093,0.0010021,0.00100352,0.00100516,0.001007,0.00100904,0.00101126,0.00101366,0.00101623,0.00101897,0.00102187,0.00102492,0.00102813,0.00103149,0.00103501,0.00103867,0.00104249,0.00104647,0.00105059,0.00105487,0.00105931,0.00106392,0.00106868,0.00107362,0.00107872,0.00108401,0.00108948,0.00109513,0.00110099,0.00110705,0.00111332,0.00111982,0.00112655,0.00113353,0.00114076,0.00114827,0.00115607,0.00117262,0.00117675,0.099585,0.10218,0.10541,0.1085,0.1115,0.11441,0.11726,0.12005,0.1228,0.12551,0.12818,0.13082,0.13344,0.13603,0.1386,0.14115,0.14369,0.14621,0.14872,0.15121,0.1537,0.15617,0.15864,0.16109,0.16354,0.16598,0.16842,0.17085,0.17327,0.17568,0.1805,0.1853,0.19009,0.19486,0.19961,0.20436,0.2091,0.21383,0.21855,0.22326,0.22797,0.23267,0.23737,0.24206,0.24674,0.25142,0.2561,0.26078,0.26545,0.27012,0.27478,0.27944,0.28411,0.28876,0.29342,0.31667,0.33989,0.36308,0.38625,0.4094,0.43254,0.47879,0.52501,0.00099909,0.000999,0.0009993,0.00099992,0.00100083,0.00100201,0.00100343,0.00100507,0.00100691,0.00100895,0.00101117,0.00101357,0.00101614,0.00101888,0.00102177,0.00102483,0.00102804,0.0010314,0.00103491,0.00103857,0.00104239,0.00104636,0.00105049,0.00105477,0.0010592,0.0010638,0.00106856,0.00107349,0.0010786,0.00108388,0.00108934,0.001095,0.00110085,0.0011069,0.00111317,0.00111966,0.00112638,0.00113335,0.00114058,0.00114808,0.00115587,0.00117239,0.00118523,0.090698,0.091585,0.094667,0.097592,0.10041,0.10313,0.10579,0.10838,0.11093,0.11344,0.11591,0.11834,0.12075,0.12314,0.12551,0.12785,0.13018,0.13249,0.13479,0.13708,0.13936,0.14162,0.14388,0.14613,0.14837,0.1506,0.15282,0.15504,0.15725,0.15946,0.16386,0.16824,0.17261,0.17696,0.1813,0.18562,0.18994,0.19425,0.19855,0.20285,0.20713,0.21142,0.21569,0.21996,0.22423,0.22849,0.23275,0.23701,0.24126,0.24551,0.24975,0.254,0.25824,0.26247,0.26671,0.28787,0.30898,0.33008,0.35115,0.3722,0.39324,0.4353,0.47733,0.00099894,0.00099886,0.00099915,0.00099978,0.0010007,0.00100188,0.00100329,0.00100493,0.00100678,0.00100882,0.00101104,0.00101344,0.00101601,0.00101874,0.00102164,0.00102469,0.00102789,0.00103125,0.00103476,0.00103843,0.00104224,0.00104621,0.00105033,0.0010546,0.00105904,0.00106363,0.00106839,0.00107331,0.00107841,0.00108368,0.00108914,0.00109479,0.00110063,0.00110668,0.00111293,0.00111942,0.00112613,0.00113309,0.0011403,0.00114779,0.00115556,0.00117205,0.00118994,0.00119743,0.079949,0.081702,0.084445,0.087053,0.089562,0.091992,0.094358,0.09667,0.098937,0.10117,0.10336,0.10553,0.10767,0.10979,0.11188,0.11397,0.11603,0.11808,0.12012,0.12215,0.12416,0.12617,0.12816,0.13015,0.13213,0.13411,0.13607,0.13804,0.13999,0.14389,0.14777,0.15163,0.15548,0.15931,0.16314,0.16695,0.17076,0.17456,0.17835,0.18213,0.18591,0.18968,0.19345,0.19721,0.20097,0.20473,0.20848,0.21223,0.21597,0.21972,0.22346,0.22719,0.23093,0.23466,0.2533,0.2719,0.29047,0.30903,0.32757,0.34609,0.38311,0.42011,0.00099869,0.00099861,0.00099892,0.00099955,0.00100047,0.00100165,0.00100307,0.00100471,0.00100656,0.0010086,0.00101082,0.00101322,0.00101579,0.00101852,0.00102141,0.00102446,0.00102766,0.00103101,0.00103452,0.00103818,0.00104199,0.00104595,0.00105006,0.00105433,0.00105876,0.00106334,0.00106809,0.00107301,0.0010781,0.00108336,0.00108881,0.00109444,0.00110027,0.0011063,0.00111255,0.00111901,0.00112571,0.00113265,0.00113984,0.00114731,0.00115506,0.00117149,0.00118931,0.00120873,0.00121669,0.066664,0.06823,0.070627,0.072895,0.075066,0.077162,0.079196,0.081179,0.083119,0.085022,0.086893,0.088737,0.090556,0.092355,0.094134,0.095897,0.097645,0.099379,0.1011,0.10281,0.10451,0.1062,0.10789,0.10956,0.11123,0.11289,0.11455,0.1162,0.11948,0.12274,0.12599,0.12922,0.13245,0.13566,0.13886,0.14205,0.14523,0.14841,0.15157,0.15474,0.1579,0.16105,0.1642,0.16734,0.17048,0.17362,0.17675,0.17988,0.18301,0.18613,0.18925,0.19237,0.19549,0.21105,0.22657,0.24207,0.25755,0.27301,0.28846,0.31932,0.35017,0.00099844,0.00099837,0.00099868,0.00099932,0.00100024,0.00100143,0.00100285,0.00100449,0.00100634,0.00100838,0.0010106,0.001013,0.00101556,0.00101829,0.00102118,0.00102423,0.00102742,0.00103078,0.00103428,0.00103793,0.00104173,0.00104569,0.0010498,0.00105406,0.00105848,0.00106306,0.0010678,0.00107271,0.00107778,0.00108304,0.00108847,0.0010941,0.00109991,0.00110593,0.00111216,0.00111861,0.00112529,0.00113221,0.00113938,0.00114683,0.00115456,0.00117094,0.00118869,0.00120803,0.00122921,0.00123497,0.057058,0.058757,0.060888,0.062898,0.064817,0.066664,0.068453,0.070194,0.071894,0.073559,0.075194,0.076804,0.07839,0.079956,0.081505,0.083038,0.084556,0.086062,0.087556,0.089039,0.090513,0.091978,0.093435,0.094885,0.096328,0.097764,0.099195,0.10204,0.10487,0.10768,0.11047,0.11325,0.11602,0.11879,0.12154,0.12428,0.12702,0.12975,0.13247,0.13519,0.1379,0.14061,0.14332,0.14602,0.14871,0.15141,0.1541,0.15678,0.15947,0.16215,0.16483,0.16751,0.18087,0.1942,0.2075,0.22078,0.23404,0.24729,0.27376,0.30021,0.00099819,0.00099813,0.00099844,0.00099909,0.00100001,0.0010012,0.00100263,0.00100427,0.00100612,0.00100816,0.00101038,0.00101277,0.00101534,0.00101807,0.00102095,0.00102399,0.00102719,0.00103054,0.00103403,0.00103768,0.00104148,0.00104543,0.00104953,0.00105379,0.0010582,0.00106277,0.00106751,0.0010724,0.00107747,0.00108272,0.00108814,0.00109375,0.00109956,0.00110556,0.00111178,0.00111821,0.00112487,0.00113177,0.00113893,0.00114635,0.00115405,0.00117038,0.00118807,0.00120733,0.00122842,0.00125169,0.00125256,0.049776,0.051777,0.053693,0.055497,0.057217,0.05887,0.060468,0.062021,0.063536,0.065019,0.066473,0.067903,0.069311,0.070701,0.072073,0.073431,0.074776,0.076108,0.077429,0.078741,0.080043,0.081337,0.082623,0.083902,0.085175,0.086442,0.088959,0.091457,0.093938,0.096405,0.098859,0.1013,0.10373,0.10616,0.10857,0.11098,0.11338,0.11577,0.11816,0.12054,0.12292,0.1253,0.12767,0.13003,0.1324,0.13476,0.13712,0.13947,0.14183,0.14418,0.14652,0.15824,0.16992,0.18157,0.1932,0.20481,0.21642,0.23959,0.26274,0.00099793,0.00099789,0.00099821,0.00099885,0.00099979,0.00100098,0.0010024,0.00100405,0.0010059,0.00100794,0.00101016,0.00101255,0.00101511,0.00101784,0.00102072,0.00102376,0.00102696,0.0010303,0.00103379,0.00103744,0.00104123,0.00104517,0.00104927,0.00105352,0.00105793,0.00106249,0.00106721,0.0010721,0.00107716,0.0010824,0.00108781,0.00109341,0.0010992,0.00110519,0.00111139,0.00111781,0.00112445,0.00113134,0.00113847,0.00114587,0.00115355,0.00116983,0.00118745,0.00120663,0.00122763,0.00125077,0.00126965,0.044059,0.044572,0.046451,0.048186,0.049821,0.051378,0.052873,0.054317,0.05572,0.057087,0.058423,0.059733,0.061021,0.062288,0.063538,0.064772,0.065991,0.067199,0.068394,0.06958,0.070756,0.071924,0.073083,0.074236,0.075381,0.076521,0.078784,0.081027,0.083253,0.085464,0.087662,0.089848,0.092024,0.094191,0.096349,0.0985,0.10064,0.10278,0.10491,0.10704,0.10916,0.11128,0.1134,0.11551,0.11762,0.11972,0.12182,0.12392,0.12602,0.12811,0.1302,0.14064,0.15103,0.1614,0.17175,0.18208,0.1924,0.21301,0.2336,0.00099768,0.00099764,0.00099797,0.00099862,0.00099956,0.00100075,0.00100218,0.00100383,0.00100568,0.00100772,0.00100994,0.00101233,0.00101489,0.00101762,0.0010205,0.00102353,0.00102672,0.00103006,0.00103355,0.00103719,0.00104098,0.00104492,0.00104901,0.00105325,0.00105765,0.0010622,0.00106692,0.0010718,0.00107685,0.00108208,0.00108748,0.00109307,0.00109885,0.00110482,0.00111101,0.00111741,0.00112404,0.00113091,0.00113802,0.0011454,0.00115306,0.00116928,0.00118684,0.00120594,0.00122684,0.00124987,0.00127547,0.00128639,0.039446,0.040567,0.042274,0.043856,0.045346,0.046766,0.04813,0.049446,0.050724,0.051969,0.053186,0.054378,0.055549,0.056702,0.057837,0.058958,0.060066,0.061162,0.062248,0.063323,0.06439,0.065449,0.0665,0.067545,0.068583,0.070642,0.072681,0.074703,0.07671,0.078704,0.080685,0.082657,0.084619,0.086572,0.088518,0.090457,0.09239,0.094318,0.09624,0.098158,0.10007,0.10198,0.10389,0.10579,0.10769,0.10958,0.11148,0.11337,0.11526,0.11715,0.12655,0.13592,0.14527,0.15459,0.1639,0.17319,0.19175,0.21029,0.00099743,0.0009974,0.00099774,0.00099839,0.00099933,0.00100053,0.00100196,0.00100361,0.00100546,0.0010075,0.00100972,0.00101211,0.00101467,0.00101739,0.00102027,0.0010233,0.00102649,0.00102982,0.00103331,0.00103694,0.00104073,0.00104466,0.00104875,0.00105298,0.00105737,0.00106192,0.00106663,0.0010715,0.00107654,0.00108176,0.00108715,0.00109273,0.00109849,0.00110446,0.00111063,0.00111701,0.00112363,0.00113047,0.00113757,0.00114493,0.00115256,0.00116873,0.00118623,0.00120525,0.00122606,0.00124897,0.00127442,0.0013029,0.035642,0.035648,0.037367,0.038925,0.040373,0.04174,0.043043,0.044294,0.045502,0.046675,0.047817,0.048934,0.050027,0.051101,0.052158,0.053199,0.054226,0.055241,0.056245,0.057239,0.058224,0.0592,0.060169,0.061131,0.062086,0.063979,0.065852,0.067708,0.069548,0.071374,0.073188,0.074992,0.076787,0.078573,0.080351,0.082123,0.083888,0.085648,0.087403,0.089152,0.090898,0.09264,0.094378,0.096112,0.097844,0.099573,0.1013,0.10302,0.10474,0.10646,0.11503,0.12356,0.13207,0.14055,0.14902,0.15747,0.17436,0.19121,0.00099718,0.00099716,0.0009975,0.00099816,0.00099911,0.00100031,0.00100174,0.00100339,0.00100524,0.00100728,0.0010095,0.00101189,0.00101445,0.00101717,0.00102004,0.00102307,0.00102626,0.00102959,0.00103307,0.0010367,0.00104048,0.00104441,0.00104848,0.00105271,0.0010571,0.00106164,0.00106634,0.0010712,0.00107624,0.00108144,0.00108682,0.00109239,0.00109814,0.00110409,0.00111025,0.00111662,0.00112321,0.00113004,0.00113712,0.00114446,0.00115207,0.00116818,0.00118562,0.00120457,0.00122528,0.00124807,0.00127337,0.00130177,0.00131926,0.032448,0.033199,0.034762,0.036189,0.037521,0.03878,0.039981,0.041135,0.042251,0.043333,0.044388,0.045418,0.046428,0.047419,0.048395,0.049355,0.050303,0.05124,0.052166,0.053083,0.053991,0.054891,0.055784,0.056671,0.058426,0.060161,0.061877,0.063578,0.065265,0.066941,0.068605,0.07026,0.071907,0.073545,0.075177,0.076803,0.078423,0.080038,0.081648,0.083254,0.084856,0.086454,0.088049,0.089641,0.09123,0.092816,0.0944,0.095981,0.09756,0.10543,0.11326,0.12107,0.12885,0.13662,0.14438,0.15986,0.17532,0.00099694,0.00099692,0.00099727,0.00099793,0.00099888,0.00100009,0.00100152,0.00100317,0.00100502,0.00100706,0.00100928,0.00101167,0.00101422,0.00101694,0.00101982,0.00102284,0.00102602,0.00102935,0.00103283,0.00103645,0.00104023,0.00104415,0.00104822,0.00105245,0.00105682,0.00106136,0.00106605,0.00107091,0.00107593,0.00108112,0.00108649,0.00109205,0.00109779,0.00110373,0.00110987,0.00111623,0.0011228,0.00112962,0.00113667,0.00114399,0.00115158,0.00116764,0.00118501,0.00120389,0.00122451,0.00124719,0.00127234,0.00130054,0.0013326,0.00133556,0.029727,0.03118,0.032607,0.03392,0.035149,0.036313,0.037425,0.038494,0.039528,0.040532,0.041511,0.042467,0.043404,0.044325,0.04523,0.046122,0.047002,0.047871,0.04873,0.049581,0.050423,0.051259,0.052087,0.053726,0.055344,0.056943,0.058526,0.060096,0.061653,0.0632,0.064737,0.066266,0.067786,0.0693,0.070808,0.07231,0.073806,0.075298,0.076786,0.078269,0.079749,0.081226,0.082699,0.08417,0.085638,0.087103,0.088566,0.090027,0.097305,0.10455,0.11176,0.11895,0.12613,0.13329,0.14759,0.16187,0.00099669,0.00099668,0.00099703,0.00099771,0.00099866,0.00099986,0.0010013,0.00100295,0.0010048,0.00100684,0.00100906,0.00101145,0.001014,0.00101672,0.00101959,0.00102262,0.00102579,0.00102912,0.00103259,0.00103621,0.00103998,0.0010439,0.00104796,0.00105218,0.00105655,0.00106108,0.00106576,0.00107061,0.00107562,0.00108081,0.00108617,0.00109171,0.00109744,0.00110336,0.00110949,0.00111583,0.00112239,0.00112919,0.00113623,0.00114352,0.00115109,0.0011671,0.00118441,0.00120321,0.00122374,0.00124631,0.00127131,0.00129932,0.00133112,0.00135186,0.027378,0.028043,0.029492,0.030801,0.032012,0.033149,0.034229,0.035262,0.036257,0.037219,0.038155,0.039067,0.039958,0.040832,0.04169,0.042534,0.043366,0.044187,0.044997,0.045799,0.046592,0.047378,0.048157,0.049696,0.051214,0.052713,0.054196,0.055665,0.057121,0.058567,0.060003,0.061431,0.06285,0.064263,0.065669,0.06707,0.068465,0.069855,0.071242,0.072624,0.074003,0.075378,0.07675,0.078119,0.079485,0.080849,0.082211,0.083571,0.090341,0.097074,0.10378,0.11047,0.11714,0.12379,0.13708,0.15034,0.00099644,0.00099644,0.0009968,0.00099748,0.00099843,0.00099964,0.00100108,0.00100273,0.00100458,0.00100662,0.00100884,0.00101123,0.00101378,0.0010165,0.00101937,0.00102239,0.00102556,0.00102888,0.00103235,0.00103597,0.00103973,0.00104364,0.0010477,0.00105191,0.00105628,0.0010608,0.00106547,0.00107031,0.00107532,0.00108049,0.00108584,0.00109137,0.00109709,0.001103,0.00110911,0.00111544,0.00112199,0.00112876,0.00113578,0.00114306,0.0011506,0.00116656,0.00118381,0.00120254,0.00122298,0.00124543,0.0012703,0.00129812,0.00132967,0.00136609,0.00136821,0.02533,0.026742,0.028063,0.029268,0.030388,0.031444,0.032449,0.033412,0.03434,0.035239,0.036113,0.036966,0.037801,0.038619,0.039422,0.040212,0.040992,0.04176,0.04252,0.04327,0.044014,0.04475,0.046203,0.047634,0.049046,0.050442,0.051824,0.053193,0.054552,0.0559,0.05724,0.058572,0.059897,0.061215,0.062528,0.063836,0.065138,0.066437,0.067731,0.069022,0.070309,0.071593,0.072875,0.074153,0.07543,0.076703,0.077975,0.084306,0.0906,0.096866,0.10311,0.10934,0.11556,0.12797,0.14035,0.00099619,0.0009962,0.00099657,0.00099725,0.00099821,0.00099942,0.00100086,0.00100251,0.00100437,0.0010064,0.00100862,0.00101101,0.00101356,0.00101627,0.00101914,0.00102216,0.00102533,0.00102865,0.00103211,0.00103572,0.00103948,0.00104339,0.00104744,0.00105165,0.001056,0.00106052,0.00106519,0.00107002,0.00107501,0.00108017,0.00108551,0.00109103,0.00109674,0.00110264,0.00110874,0.00111505,0.00112158,0.00112834,0.00113534,0.00114259,0.00115011,0.00116603,0.00118322,0.00120187,0.00122222,0.00124457,0.00126929,0.00129693,0.00132823,0.0013643,0.00138467,0.023526,0.024279,0.02563,0.02684,0.027952,0.028992,0.029975,0.030912,0.031812,0.032681,0.033524,0.034344,0.035144,0.035928,0.036696,0.037451,0.038194,0.038926,0.039648,0.040362,0.041068,0.041767,0.043145,0.044501,0.045838,0.047158,0.048463,0.049756,0.051038,0.05231,0.053573,0.054828,0.056077,0.057318,0.058554,0.059785,0.061011,0.062233,0.06345,0.064664,0.065874,0.067082,0.068286,0.069488,0.070687,0.071884,0.073079,0.079025,0.084934,0.090816,0.096678,0.10252,0.10836,0.11999,0.1316,0.00099569,0.00099572,0.0009961,0.00099679,0.00099776,0.00099898,0.00100042,0.00100208,0.00100393,0.00100597,0.00100819,0.00101057,0.00101312,0.00101583,0.00101869,0.0010217,0.00102487,0.00102818,0.00103163,0.00103524,0.00103899,0.00104288,0.00104693,0.00105112,0.00105546,0.00105996,0.00106461,0.00106942,0.0010744,0.00107955,0.00108487,0.00109036,0.00109604,0.00110192,0.00110799,0.00111427,0.00112077,0.00112749,0.00113446,0.00114167,0.00114915,0.00116496,0.00118203,0.00120055,0.00122072,0.00124285,0.0012673,0.00129458,0.0013254,0.0013608,0.00140239,0.00141811,0.02049,0.021448,0.022708,0.023831,0.024859,0.025816,0.026718,0.027577,0.028399,0.029192,0.02996,0.030706,0.031433,0.032144,0.032841,0.033524,0.034197,0.034859,0.035512,0.036156,0.036793,0.038047,0.039278,0.040488,0.041682,0.042861,0.044027,0.045181,0.046326,0.047461,0.048589,0.049709,0.050823,0.051931,0.053034,0.054132,0.055226,0.056315,0.057401,0.058483,0.059562,0.060639,0.061712,0.062783,0.063852,0.064918,0.070224,0.075492,0.080733,0.085954,0.091158,0.09635,0.10671,0.11703,0.0009952,0.00099524,0.00099564,0.00099634,0.00099731,0.00099854,0.00099998,0.00100164,0.0010035,0.00100554,0.00100775,0.00101014,0.00101268,0.00101539,0.00101824,0.00102125,0.00102441,0.00102771,0.00103116,0.00103475,0.00103849,0.00104238,0.00104641,0.00105059,0.00105492,0.0010594,0.00106404,0.00106884,0.0010738,0.00107892,0.00108422,0.0010897,0.00109535,0.0011012,0.00110725,0.0011135,0.00111997,0.00112666,0.00113358,0.00114076,0.00114819,0.0011639,0.00118086,0.00119923,0.00121924,0.00124115,0.00126533,0.00129227,0.00132263,0.00135739,0.00139804,0.00144709,0.00145259,0.01803,0.01927,0.020444,0.021487,0.02244,0.023325,0.024158,0.02495,0.025707,0.026436,0.027142,0.027826,0.028493,0.029144,0.029782,0.030407,0.031022,0.031626,0.032223,0.032811,0.033966,0.035097,0.036207,0.0373,0.038378,0.039442,0.040495,0.041538,0.042572,0.043597,0.044615,0.045627,0.046633,0.047633,0.048629,0.04962,0.050607,0.05159,0.05257,0.053547,0.054521,0.055492,0.05646,0.057426,0.05839,0.063183,0.067938,0.072667,0.077374,0.082066,0.086745,0.096074,0.10538,0.00099471,0.00099477,0.00099517,0.00099588,0.00099687,0.0009981,0.00099955,0.00100121,0.00100306,0.0010051,0.00100732,0.0010097,0.00101224,0.00101494,0.0010178,0.0010208,0.00102395,0.00102725,0.00103069,0.00103427,0.001038,0.00104188,0.0010459,0.00105006,0.00105438,0.00105885,0.00106347,0.00106825,0.00107319,0.0010783,0.00108358,0.00108903,0.00109467,0.00110049,0.00110651,0.00111273,0.00111917,0.00112582,0.00113271,0.00113985,0.00114724,0.00116286,0.0011797,0.00119794,0.00121777,0.00123948,0.0012634,0.00129,0.00131992,0.00135407,0.00139383,0.00144149,0.00148851,0.01599,0.016274,0.017565,0.018656,0.019625,0.020509,0.021331,0.022103,0.022836,0.023537,0.024212,0.024864,0.025496,0.026112,0.026713,0.027301,0.027877,0.028443,0.029,0.029549,0.030624,0.031674,0.032703,0.033714,0.034709,0.035691,0.036661,0.037621,0.038571,0.039513,0.040448,0.041376,0.042298,0.043215,0.044126,0.045034,0.045937,0.046837,0.047733,0.048625,0.049515,0.050402,0.051287,0.052169,0.053049,0.057422,0.061758,0.066067,0.070355,0.074627,0.078886,0.087377,0.09584,0.00099422,0.00099429,0.00099471,0.00099543,0.00099642,0.00099766,0.00099911,0.00100078,0.00100263,0.00100467,0.00100689,0.00100927,0.00101181,0.0010145,0.00101735,0.00102035,0.00102349,0.00102678,0.00103021,0.00103379,0.00103751,0.00104138,0.00104538,0.00104954,0.00105384,0.0010583,0.00106291,0.00106767,0.00107259,0.00107768,0.00108294,0.00108837,0.00109398,0.00109978,0.00110577,0.00111197,0.00111837,0.001125,0.00113185,0.00113895,0.0011463,0.00116182,0.00117855,0.00119665,0.00121633,0.00123783,0.0012615,0.00128778,0.00131727,0.00135083,0.00138976,0.00143613,0.00149366,0.0015263,0.014264,0.015021,0.01621,0.017221,0.018121,0.018943,0.019706,0.020424,0.021106,0.021758,0.022385,0.02299,0.023577,0.024149,0.024707,0.025252,0.025787,0.026312,0.026828,0.027837,0.028821,0.029782,0.030725,0.031651,0.032564,0.033465,0.034356,0.035237,0.036109,0.036975,0.037833,0.038685,0.039532,0.040375,0.041212,0.042045,0.042875,0.043701,0.044524,0.045344,0.046161,0.046976,0.047789,0.048599,0.052622,0.056608,0.060567,0.064505,0.068428,0.072337,0.080129,0.087892,0.00099373,0.00099382,0.00099425,0.00099498,0.00099598,0.00099722,0.00099868,0.00100035,0.0010022,0.00100424,0.00100646,0.00100883,0.00101137,0.00101406,0.00101691,0.0010199,0.00102304,0.00102632,0.00102975,0.00103331,0.00103702,0.00104088,0.00104488,0.00104902,0.00105331,0.00105775,0.00106234,0.00106709,0.001072,0.00107707,0.00108231,0.00108772,0.0010933,0.00109908,0.00110504,0.00111121,0.00111758,0.00112417,0.00113099,0.00113805,0.00114536,0.00116079,0.00117741,0.00119538,0.00121489,0.0012362,0.00125963,0.00128559,0.00131467,0.00134768,0.00138581,0.00143098,0.0014865,0.00155909,0.00156649,0.01278,0.014029,0.015119,0.016053,0.016888,0.017653,0.018364,0.019033,0.019669,0.020276,0.020861,0.021426,0.021974,0.022507,0.023027,0.023535,0.024034,0.024523,0.025477,0.026404,0.027309,0.028194,0.029063,0.029918,0.030761,0.031593,0.032415,0.033229,0.034036,0.034835,0.035629,0.036417,0.0372,0.037978,0.038753,0.039523,0.04029,0.041054,0.041815,0.042573,0.043329,0.044082,0.044833,0.04856,0.052251,0.055914,0.059556,0.063182,0.066796,0.073996,0.081168,0.00099325,0.00099335,0.00099379,0.00099453,0.00099554,0.00099678,0.00099825,0.00099992,0.00100178,0.00100382,0.00100603,0.0010084,0.00101094,0.00101363,0.00101647,0.00101945,0.00102258,0.00102586,0.00102928,0.00103284,0.00103654,0.00104038,0.00104437,0.0010485,0.00105278,0.0010572,0.00106178,0.00106651,0.0010714,0.00107646,0.00108167,0.00108706,0.00109263,0.00109838,0.00110432,0.00111046,0.0011168,0.00112336,0.00113014,0.00113716,0.00114443,0.00115977,0.00117628,0.00119412,0.00121348,0.00123459,0.00125778,0.00128344,0.00131212,0.0013446,0.00138198,0.00142603,0.00147972,0.00154883,0.00160974,0.011485,0.011997,0.013232,0.014228,0.015091,0.015866,0.016577,0.01724,0.017865,0.018459,0.019028,0.019575,0.020104,0.020616,0.021115,0.021602,0.022078,0.022544,0.023452,0.024332,0.025188,0.026025,0.026845,0.02765,0.028443,0.029225,0.029997,0.030761,0.031517,0.032266,0.033009,0.033746,0.034479,0.035207,0.035931,0.03665,0.037367,0.03808,0.03879,0.039498,0.040203,0.040905,0.041605,0.045079,0.048516,0.051925,0.055314,0.058687,0.062047,0.068739,0.075404,0.00099276,0.00099288,0.00099334,0.00099409,0.0009951,0.00099635,0.00099782,0.00099949,0.00100135,0.00100339,0.0010056,0.00100797,0.00101051,0.00101319,0.00101603,0.00101901,0.00102213,0.0010254,0.00102881,0.00103236,0.00103605,0.00103989,0.00104386,0.00104798,0.00105225,0.00105666,0.00106122,0.00106594,0.00107081,0.00107585,0.00108104,0.00108641,0.00109196,0.00109768,0.0011036,0.00110971,0.00111602,0.00112255,0.0011293,0.00113628,0.00114351,0.00115876,0.00117516,0.00119287,0.00121208,0.00123301,0.00125596,0.00128133,0.00130963,0.00134159,0.00137826,0.00142125,0.00147326,0.00153932,0.00163113,0.00165695,0.010338,0.011481,0.012582,0.013493,0.014289,0.015008,0.015671,0.01629,0.016875,0.017431,0.017964,0.018477,0.018973,0.019455,0.019923,0.02038,0.020827,0.021696,0.022534,0.023349,0.024144,0.024921,0.025684,0.026433,0.027172,0.027901,0.028621,0.029334,0.030039,0.030738,0.031432,0.032121,0.032805,0.033485,0.034161,0.034833,0.035503,0.036169,0.036832,0.037493,0.038152,0.038808,0.042062,0.045279,0.048468,0.051637,0.05479,0.057931,0.064183,0.070408,0.00099228,0.00099241,0.00099288,0.00099364,0.00099466,0.00099592,0.00099739,0.00099906,0.00100092,0.00100296,0.00100517,0.00100755,0.00101007,0.00101276,0.00101559,0.00101856,0.00102168,0.00102494,0.00102835,0.00103189,0.00103557,0.00103939,0.00104336,0.00104747,0.00105172,0.00105612,0.00106067,0.00106537,0.00107022,0.00107524,0.00108042,0.00108577,0.00109129,0.00109699,0.00110288,0.00110896,0.00111525,0.00112174,0.00112846,0.0011354,0.00114259,0.00115775,0.00117405,0.00119164,0.00121069,0.00123144,0.00125417,0.00127925,0.00130718,0.00133865,0.00137464,0.00141665,0.00146711,0.00153044,0.0016163,0.00170944,0.0093088,0.0097658,0.011061,0.012046,0.012878,0.013613,0.014281,0.014899,0.015478,0.016026,0.016548,0.017049,0.017531,0.017998,0.018451,0.018892,0.019323,0.020157,0.020961,0.021739,0.022497,0.023238,0.023963,0.024675,0.025376,0.026067,0.026749,0.027423,0.028091,0.028752,0.029407,0.030058,0.030703,0.031345,0.031983,0.032617,0.033247,0.033875,0.0345,0.035123,0.035743,0.036361,0.039422,0.042447,0.045444,0.04842,0.051381,0.054329,0.060197,0.066037,0.00099179,0.00099194,0.00099242,0.00099319,0.00099422,0.00099548,0.00099696,0.00099864,0.0010005,0.00100254,0.00100475,0.00100712,0.00100964,0.00101232,0.00101515,0.00101812,0.00102123,0.00102449,0.00102788,0.00103142,0.00103509,0.0010389,0.00104286,0.00104695,0.00105119,0.00105558,0.00106011,0.0010648,0.00106964,0.00107464,0.0010798,0.00108512,0.00109062,0.0010963,0.00110217,0.00110822,0.00111448,0.00112094,0.00112762,0.00113453,0.00114168,0.00115676,0.00117295,0.00119042,0.00120932,0.00122989,0.0012524,0.0012772,0.00130477,0.00133577,0.00137112,0.00141219,0.00146122,0.00152211,0.00160296,0.00172698,0.00176926,0.0083709,0.0096038,0.010713,0.011598,0.012359,0.013038,0.01366,0.014237,0.014779,0.015293,0.015784,0.016255,0.01671,0.01715,0.017577,0.017994,0.018798,0.019571,0.020318,0.021044,0.021752,0.022444,0.023123,0.023791,0.024449,0.025097,0.025738,0.026372,0.026999,0.027621,0.028237,0.028849,0.029457,0.030061,0.030661,0.031258,0.031852,0.032443,0.033031,0.033618,0.034202,0.037093,0.039948,0.042775,0.045582,0.048373,0.051151,0.056679,0.062181,0.00099131,0.00099148,0.00099197,0.00099275,0.00099378,0.00099505,0.00099653,0.00099821,0.00100008,0.00100212,0.00100432,0.00100669,0.00100922,0.00101189,0.00101471,0.00101768,0.00102079,0.00102403,0.00102742,0.00103095,0.00103461,0.00103841,0.00104236,0.00104644,0.00105067,0.00105504,0.00105956,0.00106423,0.00106905,0.00107403,0.00107918,0.00108448,0.00108996,0.00109562,0.00110146,0.00110749,0.00111371,0.00112015,0.0011268,0.00113367,0.00114078,0.00115577,0.00117186,0.00118921,0.00120797,0.00122836,0.00125065,0.00127518,0.00130241,0.00133296,0.00136769,0.00140789,0.00145558,0.00151426,0.00159081,0.00170299,0.0018398,0.0075017,0.0081112,0.0094535,0.010419,0.011218,0.011916,0.012545,0.013123,0.013663,0.014171,0.014654,0.015117,0.015561,0.01599,0.016406,0.01681,0.017589,0.018335,0.019054,0.019752,0.020431,0.021094,0.021744,0.022382,0.02301,0.023629,0.02424,0.024844,0.025441,0.026033,0.026619,0.027201,0.027779,0.028352,0.028923,0.029489,0.030053,0.030614,0.031173,0.031729,0.032282,0.035023,0.037727,0.040403,0.043059,0.045699,0.048327,0.053553,0.058753,0.00099084,0.00099102,0.00099152,0.00099231,0.00099335,0.00099462,0.00099611,0.00099779,0.00099965,0.00100169,0.0010039,0.00100627,0.00100879,0.00101146,0.00101428,0.00101724,0.00102034,0.00102358,0.00102696,0.00103048,0.00103413,0.00103793,0.00104186,0.00104593,0.00105015,0.00105451,0.00105901,0.00106367,0.00106847,0.00107344,0.00107856,0.00108385,0.0010893,0.00109494,0.00110075,0.00110675,0.00111295,0.00111936,0.00112597,0.00113281,0.00113989,0.00115479,0.00117078,0.00118801,0.00120663,0.00122685,0.00124893,0.0012732,0.0013001,0.0013302,0.00136434,0.00140371,0.00145017,0.00150683,0.00157964,0.00168265,0.00187374,0.00192677,0.0066773,0.0082199,0.009316,0.010168,0.010892,0.011533,0.012117,0.012656,0.013162,0.013639,0.014094,0.01453,0.01495,0.015356,0.01575,0.016506,0.017228,0.017923,0.018595,0.019249,0.019886,0.02051,0.021122,0.021723,0.022316,0.0229,0.023477,0.024048,0.024612,0.025172,0.025727,0.026278,0.026824,0.027367,0.027907,0.028444,0.028978,0.029509,0.030038,0.030565,0.033171,0.03574,0.038281,0.040802,0.043307,0.045799,0.050756,0.055685,0.00099036,0.00099055,0.00099107,0.00099187,0.00099292,0.00099419,0.00099568,0.00099737,0.00099923,0.00100127,0.00100348,0.00100585,0.00100836,0.00101103,0.00101384,0.0010168,0.00101989,0.00102313,0.0010265,0.00103001,0.00103366,0.00103744,0.00104136,0.00104543,0.00104963,0.00105398,0.00105847,0.00106311,0.0010679,0.00107284,0.00107795,0.00108321,0.00108865,0.00109426,0.00110005,0.00110603,0.0011122,0.00111857,0.00112516,0.00113196,0.001139,0.00115381,0.00116971,0.00118682,0.0012053,0.00122536,0.00124723,0.00127125,0.00129782,0.0013275,0.00136108,0.00139966,0.00144496,0.00149978,0.00156929,0.0016649,0.00182479,0.00204,0.0058652,0.0069234,0.0082599,0.0091906,0.0099503,0.01061,0.011201,0.011743,0.012247,0.012721,0.013171,0.0136,0.014012,0.014409,0.014793,0.01553,0.016231,0.016904,0.017554,0.018185,0.018799,0.019399,0.019987,0.020565,0.021133,0.021694,0.022247,0.022793,0.023334,0.023869,0.0244,0.024927,0.025449,0.025968,0.026483,0.026996,0.027506,0.028013,0.028518,0.02902,0.031504,0.033952,0.036371,0.038771,0.041154,0.043525,0.048238,0.052925,0.00098941,0.00098963,0.00099017,0.00099099,0.00099205,0.00099334,0.00099484,0.00099653,0.0009984,0.00100044,0.00100264,0.001005,0.00100752,0.00101018,0.00101298,0.00101593,0.00101901,0.00102223,0.00102559,0.00102908,0.00103271,0.00103648,0.00104038,0.00104442,0.0010486,0.00105292,0.00105738,0.00106199,0.00106675,0.00107166,0.00107673,0.00108196,0.00108735,0.00109292,0.00109866,0.00110458,0.0011107,0.00111701,0.00112354,0.00113027,0.00113724,0.00115189,0.00116759,0.00118448,0.00120269,0.00122242,0.0012439,0.00126743,0.00129338,0.00132227,0.00135478,0.0013919,0.00143509,0.00148666,0.0015506,0.00163487,0.00176012,0.0020286,0.0027044,0.0036475,0.0061234,0.0073787,0.0082556,0.0089702,0.0095893,0.010144,0.010651,0.011123,0.011565,0.011985,0.012385,0.012768,0.013138,0.013842,0.014508,0.015144,0.015755,0.016347,0.016921,0.017481,0.018028,0.018565,0.019092,0.019611,0.020122,0.020627,0.021126,0.02162,0.022109,0.022594,0.023074,0.023551,0.024025,0.024495,0.024963,0.025428,0.025891,0.026352,0.028626,0.030863,0.033073,0.035262,0.037435,0.039596,0.04389,0.048157,0.000988,0.00098826,0.00098884,0.00098968,0.00099077,0.00099207,0.00099358,0.00099527,0.00099715,0.00099919,0.00100139,0.00100375,0.00100625,0.0010089,0.0010117,0.00101463,0.00101769,0.0010209,0.00102423,0.0010277,0.0010313,0.00103504,0.00103891,0.00104292,0.00104706,0.00105134,0.00105577,0.00106033,0.00106505,0.00106991,0.00107492,0.00108009,0.00108543,0.00109093,0.0010966,0.00110245,0.00110849,0.00111472,0.00112115,0.00112778,0.00113464,0.00114906,0.00116449,0.00118104,0.00119887,0.00121814,0.00123906,0.0012619,0.00128699,0.00131478,0.0013459,0.001381,0.0014215,0.001469,0.0015264,0.0015988,0.0016969,0.0018503,0.0022182,0.0046474,0.0060047,0.0068833,0.0075792,0.0081725,0.0086986,0.0091763,0.0096176,0.01003,0.010419,0.010789,0.011143,0.011811,0.012436,0.013029,0.013595,0.01414,0.014667,0.015179,0.015678,0.016165,0.016643,0.017113,0.017574,0.018029,0.018478,0.018922,0.019361,0.019795,0.020225,0.020652,0.021075,0.021496,0.021913,0.022328,0.02274,0.02315,0.025172,0.027157,0.029115,0.031052,0.032974,0.034883,0.038672,0.042436,0.00098567,0.00098601,0.00098664,0.00098753,0.00098865,0.00098998,0.0009915,0.00099321,0.00099509,0.00099714,0.00099933,0.00100168,0.00100417,0.00100681,0.00100958,0.00101249,0.00101553,0.0010187,0.001022,0.00102543,0.00102899,0.00103268,0.00103651,0.00104046,0.00104455,0.00104877,0.00105312,0.00105762,0.00106226,0.00106704,0.00107197,0.00107705,0.00108228,0.00108768,0.00109324,0.00109897,0.00110488,0.00111098,0.00111726,0.00112374,0.00113043,0.00114447,0.00115947,0.00117552,0.00119275,0.00121131,0.00123137,0.00125317,0.00127698,0.00130315,0.0013322,0.0013646,0.0014014,0.0014436,0.0014932,0.0015529,0.0016276,0.0017268,0.0018729,0.0021331,0.0027978,0.0039809,0.0049203,0.0056366,0.0062267,0.0067373,0.0071931,0.0076083,0.0079923,0.0083515,0.0086904,0.00932,0.0099,0.010442,0.010955,0.011445,0.011914,0.012368,0.012808,0.013236,0.013653,0.014062,0.014463,0.014857,0.015245,0.015628,0.016005,0.016378,0.016747,0.017112,0.017473,0.017832,0.018188,0.018541,0.018891,0.01924,0.020953,0.02263,0.024279,0.025908,0.027521,0.029122,0.032296,0.035443,0.00098338,0.00098379,0.00098447,0.0009854,0.00098656,0.00098791,0.00098946,0.00099118,0.00099307,0.00099511,0.00099731,0.00099965,0.00100213,0.00100475,0.0010075,0.00101038,0.00101339,0.00101654,0.0010198,0.0010232,0.00102672,0.00103037,0.00103414,0.00103805,0.00104208,0.00104624,0.00105053,0.00105496,0.00105953,0.00106423,0.00106908,0.00107407,0.00107922,0.00108451,0.00108997,0.00109559,0.00110138,0.00110734,0.00111349,0.00111983,0.00112636,0.00114005,0.00115464,0.00117022,0.0011869,0.00120481,0.00122411,0.00124498,0.00126766,0.00129245,0.0013197,0.0013499,0.0013837,0.001422,0.001466,0.0015174,0.0015791,0.0016554,0.0017546,0.001893,0.0021054,0.0024747,0.0030838,0.00378,0.004412,0.0049572,0.0054336,0.0058588,0.006245,0.0066009,0.0069325,0.0075392,0.0080893,0.0085974,0.0090732,0.0095234,0.0099527,0.010365,0.010762,0.011148,0.011523,0.011888,0.012246,0.012596,0.01294,0.013278,0.013612,0.013941,0.014265,0.014586,0.014904,0.015218,0.01553,0.015839,0.016145,0.01645,0.017942,0.019398,0.020827,0.022235,0.023628,0.025009,0.027742,0.03045,0.00098113,0.0009816,0.00098234,0.00098331,0.0009845,0.00098588,0.00098744,0.00098917,0.00099107,0.00099311,0.00099531,0.00099764,0.00100011,0.00100271,0.00100545,0.00100831,0.00101129,0.00101441,0.00101764,0.001021,0.00102449,0.00102809,0.00103182,0.00103568,0.00103965,0.00104376,0.00104799,0.00105236,0.00105685,0.00106149,0.00106626,0.00107117,0.00107622,0.00108142,0.00108678,0.00109229,0.00109797,0.00110381,0.00110983,0.00111603,0.00112241,0.00113578,0.00114999,0.00116514,0.00118131,0.00119863,0.00121723,0.00123727,0.00125895,0.00128252,0.0013083,0.0013366,0.001368,0.0014032,0.0014429,0.0014884,0.0015415,0.0016046,0.0016819,0.0017801,0.0019108,0.0020934,0.0023601,0.0027437,0.0032092,0.0036915,0.004148,0.0045662,0.0049479,0.0052985,0.0056231,0.0062116,0.0067388,0.0072209,0.0076685,0.0080891,0.0084878,0.0088686,0.0092344,0.0095875,0.0099297,0.010263,0.010587,0.010905,0.011216,0.011521,0.011821,0.012117,0.012408,0.012696,0.01298,0.013261,0.01354,0.013815,0.014089,0.01436,0.015686,0.016976,0.018239,0.019482,0.020709,0.021925,0.024328,0.026705,0.00097892,0.00097945,0.00098024,0.00098125,0.00098247,0.00098387,0.00098545,0.0009872,0.0009891,0.00099114,0.00099333,0.00099566,0.00099812,0.00100071,0.00100342,0.00100626,0.00100923,0.00101231,0.00101552,0.00101884,0.00102229,0.00102585,0.00102954,0.00103335,0.00103728,0.00104133,0.0010455,0.00104981,0.00105424,0.0010588,0.00106349,0.00106832,0.00107329,0.00107841,0.00108367,0.00108908,0.00109465,0.00110037,0.00110627,0.00111234,0.00111858,0.00113164,0.0011455,0.00116024,0.00117595,0.00119272,0.00121068,0.00122997,0.00125076,0.00127325,0.0012977,0.0013244,0.0013538,0.0013864,0.0014228,0.0014638,0.0015108,0.0015652,0.0016294,0.0017071,0.0018034,0.0019267,0.0020879,0.0023016,0.0025808,0.0029154,0.0032774,0.0036415,0.0039922,0.0043229,0.004633,0.0051978,0.0057027,0.006162,0.0065861,0.0069825,0.0073565,0.0077122,0.0080527,0.0083802,0.0086967,0.0090037,0.0093025,0.0095939,0.0098789,0.010158,0.010432,0.010702,0.010967,0.011229,0.011487,0.011743,0.011995,0.012244,0.012492,0.012737,0.013934,0.015094,0.016228,0.017342,0.01844,0.019527,0.021673,0.023793,0.00097673,0.00097733,0.00097816,0.00097922,0.00098047,0.00098189,0.00098349,0.00098525,0.00098715,0.0009892,0.00099139,0.00099371,0.00099616,0.00099873,0.00100143,0.00100425,0.00100719,0.00101025,0.00101343,0.00101672,0.00102013,0.00102365,0.0010273,0.00103106,0.00103494,0.00103894,0.00104306,0.0010473,0.00105167,0.00105616,0.00106079,0.00106554,0.00107043,0.00107546,0.00108063,0.00108594,0.00109141,0.00109703,0.00110281,0.00110875,0.00111486,0.00112763,0.00114116,0.00115553,0.0011708,0.00118707,0.00120444,0.00122305,0.00124303,0.00126457,0.0012879,0.0013132,0.0013409,0.0013713,0.0014049,0.0014425,0.0014848,0.0015329,0.0015884,0.0016534,0.0017307,0.0018247,0.0019409,0.0020856,0.002266,0.0024873,0.0027454,0.0030272,0.0033186,0.0036085,0.00389,0.0044168,0.0048947,0.0053308,0.0057331,0.0061081,0.006461,0.0067956,0.0071149,0.0074213,0.0077166,0.0080025,0.0082801,0.0085504,0.0088143,0.0090724,0.0093255,0.0095741,0.0098185,0.010059,0.010296,0.010531,0.010762,0.010991,0.011217,0.011441,0.012534,0.01359,0.01462,0.015631,0.016626,0.017609,0.019549,0.021464,0.00097247,0.00097318,0.00097411,0.00097524,0.00097654,0.00097802,0.00097965,0.00098143,0.00098334,0.0009854,0.00098758,0.00098989,0.00099232,0.00099486,0.00099753,0.00100031,0.00100321,0.00100621,0.00100933,0.00101257,0.00101591,0.00101936,0.00102292,0.0010266,0.00103039,0.00103429,0.0010383,0.00104243,0.00104668,0.00105105,0.00105554,0.00106015,0.00106489,0.00106976,0.00107476,0.00107989,0.00108517,0.00109058,0.00109615,0.00110186,0.00110773,0.00111997,0.00113289,0.00114657,0.00116106,0.00117643,0.00119277,0.00121018,0.00122876,0.00124866,0.00127,0.001293,0.0013179,0.0013449,0.0013744,0.0014067,0.0014423,0.0014819,0.0015262,0.0015761,0.0016329,0.0016981,0.0017736,0.0018618,0.001965,0.0020855,0.0022249,0.0023839,0.002561,0.0027521,0.0029522,0.0033617,0.0037624,0.0041422,0.0044986,0.004833,0.0051482,0.0054468,0.0057312,0.0060033,0.0062649,0.0065174,0.0067618,0.0069992,0.0072304,0.007456,0.0076766,0.0078928,0.008105,0.0083136,0.0085188,0.008721,0.0089204,0.0091173,0.0093119,0.0095043,0.010439,0.011339,0.012212,0.013067,0.013907,0.014735,0.016366,0.017971,0.00096834,0.00096916,0.00097017,0.00097137,0.00097273,0.00097425,0.00097591,0.00097771,0.00097964,0.00098169,0.00098387,0.00098617,0.00098858,0.0009911,0.00099374,0.00099648,0.00099934,0.0010023,0.00100536,0.00100854,0.00101181,0.0010152,0.00101869,0.00102228,0.00102599,0.0010298,0.00103371,0.00103774,0.00104188,0.00104613,0.0010505,0.00105498,0.00105958,0.0010643,0.00106914,0.00107411,0.00107921,0.00108444,0.00108981,0.00109532,0.00110097,0.00111273,0.00112512,0.00113819,0.00115199,0.00116658,0.00118203,0.00119841,0.00121582,0.00123436,0.0012541,0.0012753,0.001298,0.0013224,0.0013488,0.0013774,0.0014084,0.0014424,0.0014797,0.0015208,0.0015664,0.0016172,0.0016741,0.0017382,0.0018106,0.0018924,0.0019846,0.0020877,0.0022022,0.0023277,0.0024632,0.0027572,0.0030673,0.003379,0.0036829,0.0039749,0.0042538,0.0045198,0.0047742,0.0050179,0.0052523,0.0054784,0.0056971,0.0059093,0.0061156,0.0063167,0.006513,0.0067052,0.0068935,0.0070783,0.0072599,0.0074387,0.0076148,0.0077884,0.0079598,0.0081291,0.0089494,0.0097356,0.010497,0.01124,0.011968,0.012685,0.014094,0.015478,0.00096434,0.00096525,0.00096634,0.0009676,0.00096902,0.00097057,0.00097226,0.00097408,0.00097602,0.00097808,0.00098026,0.00098254,0.00098494,0.00098744,0.00099005,0.00099276,0.00099557,0.00099849,0.00100151,0.00100463,0.00100784,0.00101116,0.00101458,0.0010181,0.00102173,0.00102545,0.00102928,0.00103321,0.00103725,0.00104139,0.00104564,0.00105,0.00105447,0.00105906,0.00106376,0.00106858,0.00107352,0.00107858,0.00108377,0.00108909,0.00109454,0.00110587,0.00111777,0.0011303,0.00114349,0.00115739,0.00117207,0.00118757,0.00120397,0.00122136,0.0012398,0.0012595,0.0012804,0.0013028,0.0013267,0.0013525,0.0013802,0.0014101,0.0014426,0.0014778,0.0015163,0.0015584,0.0016047,0.0016556,0.0017118,0.0017739,0.0018424,0.0019179,0.0020006,0.0020907,0.002188,0.0024024,0.0026376,0.0028846,0.0031354,0.0033838,0.0036262,0.0038609,0.0040874,0.0043058,0.0045165,0.0047202,0.0049175,0.0051089,0.0052951,0.0054765,0.0056536,0.0058267,0.0059963,0.0061625,0.0063258,0.0064864,0.0066444,0.0068001,0.0069537,0.0071053,0.0078381,0.0085381,0.0092143,0.0098724,0.010517,0.01115,0.012392,0.01361,0.00096045,0.00096145,0.00096262,0.00096394,0.0009654,0.000967,0.00096871,0.00097055,0.0009725,0.00097457,0.00097674,0.00097901,0.00098139,0.00098387,0.00098645,0.00098913,0.00099191,0.00099479,0.00099776,0.00100082,0.00100399,0.00100725,0.0010106,0.00101405,0.0010176,0.00102125,0.00102499,0.00102883,0.00103277,0.00103681,0.00104096,0.00104521,0.00104956,0.00105402,0.00105859,0.00106327,0.00106806,0.00107297,0.00107799,0.00108314,0.00108841,0.00109934,0.00111081,0.00112285,0.0011355,0.00114879,0.00116278,0.00117751,0.00119304,0.00120944,0.0012268,0.0012451,0.0012646,0.0012853,0.0013074,0.0013308,0.001356,0.0013829,0.0014117,0.0014428,0.0014763,0.0015126,0.0015518,0.0015944,0.0016407,0.001691,0.0017457,0.0018052,0.0018696,0.0019392,0.002014,0.0021784,0.0023607,0.0025567,0.0027612,0.0029693,0.003177,0.0033818,0.003582,0.0037769,0.0039662,0.00415,0.0043286,0.0045022,0.0046713,0.0048362,0.0049972,0.0051546,0.0053088,0.0054599,0.0056083,0.0057542,0.0058976,0.006039,0.0061782,0.0063157,0.0069789,0.007611,0.0082201,0.0088119,0.0093902,0.009958,0.01107,0.012158,0.00095668,0.00095776,0.000959,0.00096037,0.00096188,0.00096351,0.00096525,0.00096711,0.00096907,0.00097114,0.0009733,0.00097557,0.00097794,0.0009804,0.00098295,0.0009856,0.00098835,0.00099118,0.00099411,0.00099713,0.00100024,0.00100344,0.00100673,0.00101012,0.0010136,0.00101717,0.00102083,0.00102459,0.00102844,0.00103239,0.00103643,0.00104058,0.00104482,0.00104916,0.00105361,0.00105816,0.00106282,0.00106758,0.00107246,0.00107745,0.00108256,0.00109313,0.0011042,0.00111579,0.00112795,0.00114069,0.00115407,0.00116812,0.00118289,0.00119844,0.0012148,0.0012321,0.0012503,0.0012696,0.0012901,0.0013118,0.0013348,0.0013593,0.0013854,0.0014133,0.0014431,0.0014751,0.0015094,0.0015462,0.0015857,0.0016282,0.001674,0.0017232,0.001776,0.0018326,0.001893,0.0020251,0.0021715,0.0023301,0.0024982,0.0026723,0.0028494,0.0030269,0.0032028,0.003376,0.0035456,0.0037114,0.0038732,0.0040311,0.0041852,0.0043358,0.0044829,0.004627,0.0047681,0.0049065,0.0050424,0.005176,0.0053074,0.0054368,0.0055642,0.00569,0.0062963,0.006873,0.0074278,0.007966,0.0084913,0.0090064,0.010013,0.010998,0.00094947,0.00095069,0.00095204,0.00095352,0.00095511,0.0009568,0.00095859,0.00096047,0.00096245,0.00096453,0.00096669,0.00096894,0.00097127,0.0009737,0.00097621,0.0009788,0.00098148,0.00098425,0.00098709,0.00099002,0.00099304,0.00099614,0.00099932,0.00100259,0.00100594,0.00100937,0.00101289,0.00101649,0.00102018,0.00102396,0.00102783,0.00103178,0.00103582,0.00103996,0.00104418,0.0010485,0.00105292,0.00105743,0.00106204,0.00106675,0.00107156,0.00108149,0.00109186,0.00110269,0.00111399,0.0011258,0.00113814,0.00115104,0.00116453,0.00117865,0.0011934,0.001209,0.0012252,0.0012423,0.0012603,0.0012792,0.001299,0.00132,0.0013421,0.0013655,0.0013901,0.0014162,0.0014439,0.0014731,0.0015041,0.001537,0.0015718,0.0016086,0.0016477,0.001689,0.0017325,0.0018267,0.0019302,0.0020423,0.0021619,0.0022879,0.0024185,0.0025524,0.0026881,0.0028243,0.00296,0.0030946,0.0032275,0.0033584,0.0034871,0.0036136,0.0037378,0.0038598,0.0039796,0.0040974,0.0042132,0.0043271,0.0044392,0.0045497,0.0046586,0.004766,0.0052837,0.0057752,0.006247,0.0067037,0.0071484,0.0075836,0.0084325,0.0092603,0.00094265,0.00094399,0.00094545,0.00094701,0.00094866,0.0009504,0.00095223,0.00095415,0.00095614,0.00095822,0.00096037,0.00096261,0.00096492,0.00096731,0.00096978,0.00097233,0.00097495,0.00097765,0.00098042,0.00098327,0.0009862,0.00098921,0.00099229,0.00099545,0.00099869,0.001002,0.00100539,0.00100886,0.00101241,0.00101603,0.00101974,0.00102353,0.0010274,0.00103135,0.00103538,0.0010395,0.0010437,0.00104799,0.00105237,0.00105683,0.00106139,0.00107078,0.00108056,0.00109074,0.00110133,0.00111235,0.00112383,0.00113579,0.00114824,0.00116123,0.0011748,0.0011889,0.0012037,0.0012191,0.0012352,0.001252,0.0012696,0.001288,0.0013073,0.0013276,0.0013488,0.001371,0.0013944,0.0014189,0.0014446,0.0014716,0.0014999,0.0015297,0.0015609,0.0015936,0.0016279,0.0017011,0.0017807,0.0018664,0.0019579,0.0020544,0.0021551,0.0022593,0.0023661,0.0024745,0.002584,0.0026938,0.0028035,0.0029125,0.0030206,0.0031276,0.0032332,0.0033375,0.0034404,0.0035418,0.0036418,0.0037404,0.0038376,0.0039335,0.0040282,0.0041216,0.0045725,0.0050009,0.0054117,0.0058088,0.006195,0.0065724,0.0073072,0.0080223,0.0009362,0.00093764,0.00093918,0.00094081,0.00094252,0.00094431,0.00094617,0.00094811,0.00095012,0.00095219,0.00095434,0.00095656,0.00095885,0.00096121,0.00096364,0.00096614,0.00096871,0.00097135,0.00097406,0.00097685,0.0009797,0.00098262,0.00098561,0.00098867,0.00099181,0.00099501,0.00099829,0.00100164,0.00100506,0.00100855,0.00101211,0.00101575,0.00101946,0.00102325,0.00102712,0.00103106,0.00103507,0.00103917,0.00104334,0.0010476,0.00105193,0.00106086,0.00107012,0.00107974,0.00108972,0.00110008,0.00111084,0.00112201,0.00113361,0.00114566,0.0011582,0.0011712,0.0011847,0.0011988,0.0012135,0.0012287,0.0012446,0.0012611,0.0012783,0.0012963,0.001315,0.0013345,0.0013548,0.001376,0.0013981,0.0014212,0.0014453,0.0014704,0.0014965,0.0015237,0.0015521,0.0016122,0.0016769,0.0017462,0.0018198,0.0018974,0.0019786,0.0020627,0.0021494,0.002238,0.0023281,0.0024191,0.0025106,0.0026023,0.0026938,0.002785,0.0028756,0.0029654,0.0030544,0.0031425,0.0032296,0.0033158,0.003401,0.0034852,0.0035684,0.0036507,0.0040489,0.004428,0.0047918,0.0051432,0.0054847,0.0058182,0.0064665,0.0070964,0.00093008,0.0009316,0.00093321,0.0009349,0.00093666,0.00093849,0.00094038,0.00094233,0.00094435,0.00094643,0.00094857,0.00095078,0.00095304,0.00095538,0.00095777,0.00096023,0.00096275,0.00096534,0.00096799,0.00097071,0.00097349,0.00097633,0.00097924,0.00098222,0.00098526,0.00098837,0.00099154,0.00099478,0.00099808,0.00100145,0.00100489,0.0010084,0.00101197,0.00101562,0.00101933,0.00102311,0.00102696,0.00103089,0.00103488,0.00103895,0.00104309,0.0010516,0.00106041,0.00106954,0.001079,0.00108879,0.00109894,0.00110944,0.00112032,0.00113159,0.0011433,0.0011554,0.0011679,0.0011809,0.0011944,0.0012083,0.0012228,0.0012379,0.0012534,0.0012696,0.0012864,0.0013039,0.0013219,0.0013407,0.0013602,0.0013805,0.0014015,0.0014232,0.0014458,0.0014693,0.0014935,0.0015447,0.0015993,0.0016575,0.001719,0.0017837,0.0018514,0.0019216,0.0019941,0.0020684,0.0021441,0.002221,0.0022987,0.002377,0.0024554,0.0025339,0.0026123,0.0026904,0.002768,0.0028451,0.0029217,0.0029976,0.0030728,0.0031473,0.0032212,0.0032943,0.0036494,0.0039888,0.0043148,0.0046299,0.0049361,0.0052349,0.0058152,0.0063784,0.00092426,0.00092752,0.00093106,0.00093292,0.00093483,0.00093882,0.00094304,0.00094748,0.00095214,0.00095704,0.00096218,0.00096755,0.00097316,0.00097902,0.00098511,0.00099145,0.00099804,0.0010049,0.001012,0.0010193,0.0010269,0.0010348,0.0010429,0.0010513,0.00106,0.001069,0.0010783,0.001088,0.0010979,0.0011081,0.0011187,0.0011297,0.0011527,0.0011773,0.0012036,0.0012317,0.0012618,0.0012939,0.0013283,0.0013651,0.0014044,0.0014463,0.001563,0.0016968,0.0018456,0.0020056,0.0021728,0.0023434,0.0026847,0.0030169,0.0036426,0.004223,0.004771,0.0052964,0.0058057,0.00091089,0.00091437,0.00091806,0.00091997,0.00092192,0.00092595,0.00093013,0.00093449,0.00093902,0.00094374,0.00094865,0.00095375,0.00095905,0.00096456,0.00097026,0.00097616,0.00098228,0.00098859,0.00099512,0.0010019,0.0010088,0.001016,0.0010234,0.001031,0.0010388,0.0010468,0.0010551,0.0010637,0.0010725,0.0010815,0.0010908,0.0011003,0.0011203,0.0011413,0.0011636,0.0011871,0.001212,0.0012382,0.0012659,0.0012951,0.0013259,0.0013583,0.0014468,0.0015458,0.0016548,0.0017721,0.0018955,0.0020227,0.0022816,0.0025391,0.0030348,0.0035016,0.0039443,0.004369,0.0047802,0.00089892,0.00090252,0.0009063,0.00090824,0.00091021,0.00091423,0.00091838,0.00092265,0.00092707,0.00093163,0.00093635,0.00094123,0.00094627,0.00095148,0.00095686,0.00096241,0.00096814,0.00097404,0.00098011,0.00098636,0.00099279,0.0009994,0.0010062,0.0010132,0.0010203,0.0010277,0.0010352,0.0010429,0.0010508,0.001059,0.0010673,0.0010758,0.0010935,0.001112,0.0011315,0.0011519,0.0011732,0.0011956,0.001219,0.0012435,0.001269,0.0012957,0.0013674,0.0014463,0.0015323,0.0016244,0.0017216,0.0018223,0.0020292,0.0022374,0.0026439,0.0030315,0.0034015,0.0037572,0.0041018,0.00088809,0.00089174,0.00089556,0.00089751,0.00089948,0.00090349,0.00090759,0.00091179,0.00091609,0.00092052,0.00092507,0.00092976,0.00093458,0.00093955,0.00094466,0.00094992,0.00095532,0.00096088,0.00096658,0.00097243,0.00097843,0.00098459,0.00099089,0.00099735,0.001004,0.0010107,0.0010177,0.0010247,0.001032,0.0010394,0.001047,0.0010547,0.0010707,0.0010874,0.0011047,0.0011228,0.0011417,0.0011613,0.0011817,0.0012028,0.0012248,0.0012476,0.0013082,0.0013741,0.0014451,0.0015208,0.0016006,0.0016836,0.0018553,0.0020296,0.0023729,0.0027029,0.0030195,0.0033248,0.0036209,0.00087819,0.00088187,0.00088569,0.00088764,0.00088961,0.00089358,0.00089763,0.00090175,0.00090596,0.00091026,0.00091467,0.00091918,0.00092382,0.00092858,0.00093346,0.00093846,0.0009436,0.00094886,0.00095424,0.00095976,0.00096541,0.00097119,0.00097709,0.00098313,0.0009893,0.0009956,0.001002,0.0010086,0.0010153,0.0010221,0.0010291,0.0010362,0.0010508,0.001066,0.0010818,0.0010981,0.0011151,0.0011326,0.0011507,0.0011695,0.0011889,0.0012089,0.0012616,0.0013183,0.0013789,0.0014432,0.0015107,0.001581,0.0017272,0.0018769,0.0021739,0.0024607,0.0027368,0.0030037,0.0032629,0.00086908,0.00087276,0.00087657,0.0008785,0.00088045,0.00088439,0.00088838,0.00089242,0.00089654,0.00090073,0.00090501,0.00090938,0.00091385,0.00091842,0.0009231,0.00092789,0.00093279,0.0009378,0.00094292,0.00094815,0.0009535,0.00095895,0.00096452,0.00097021,0.000976,0.00098191,0.00098793,0.00099407,0.0010003,0.0010067,0.0010132,0.0010197,0.0010333,0.0010473,0.0010618,0.0010767,0.0010921,0.001108,0.0011244,0.0011413,0.0011587,0.0011766,0.0012235,0.0012734,0.0013263,0.0013822,0.0014407,0.0015015,0.0016284,0.0017592,0.0020209,0.0022747,0.0025194,0.0027562,0.0029864,0.00086064,0.0008643,0.00086808,0.00087,0.00087193,0.00087582,0.00087975,0.00088372,0.00088775,0.00089184,0.000896,0.00090024,0.00090456,0.00090897,0.00091347,0.00091807,0.00092277,0.00092756,0.00093244,0.00093743,0.00094252,0.0009477,0.00095298,0.00095836,0.00096383,0.00096941,0.00097508,0.00098085,0.00098672,0.00099269,0.00099875,0.0010049,0.0010175,0.0010305,0.001044,0.0010578,0.001072,0.0010866,0.0011016,0.001117,0.0011328,0.001149,0.0011913,0.001236,0.0012832,0.0013326,0.0013842,0.0014377,0.0015495,0.0016653,0.0018991,0.002127,0.0023468,0.0025596,0.0027665,0.0008454,0.00084901,0.00085272,0.00085459,0.00085648,0.00086026,0.00086407,0.0008679,0.00087177,0.00087567,0.00087963,0.00088363,0.00088771,0.00089184,0.00089605,0.00090033,0.00090468,0.00090911,0.00091361,0.00091819,0.00092284,0.00092758,0.00093238,0.00093727,0.00094223,0.00094726,0.00095237,0.00095755,0.00096281,0.00096815,0.00097355,0.00097903,0.00099022,0.0010017,0.0010135,0.0010255,0.0010379,0.0010505,0.0010634,0.0010766,0.0010901,0.0011038,0.0011394,0.0011766,0.0012155,0.0012558,0.0012976,0.0013408,0.0014308,0.0015243,0.001716,0.0019056,0.0020891,0.0022664,0.0024387,0.00083548,0.0008391,0.00084093,0.00084276,0.00084644,0.00085013,0.00085383,0.00085755,0.00086129,0.00086507,0.00086888,0.00087275,0.00087666,0.00088062,0.00088464,0.00088871,0.00089285,0.00089704,0.0009013,0.00090561,0.00090999,0.00091442,0.00091892,0.00092347,0.00092808,0.00093276,0.00093749,0.00094228,0.00094713,0.00095203,0.00095699,0.00096709,0.00097741,0.00098795,0.00099871,0.0010097,0.0010209,0.0010323,0.0010439,0.0010557,0.0010677,0.0010986,0.0011307,0.0011639,0.0011982,0.0012335,0.0012698,0.0013449,0.0014229,0.0015842,0.0017462,0.0019041,0.0020569,0.0022051,0.00082689,0.00082867,0.00083046,0.00083403,0.0008376,0.00084117,0.00084476,0.00084836,0.00085198,0.00085563,0.00085931,0.00086303,0.00086679,0.00087059,0.00087444,0.00087833,0.00088227,0.00088626,0.00089029,0.00089438,0.00089851,0.00090269,0.00090692,0.00091119,0.00091551,0.00091988,0.0009243,0.00092876,0.00093327,0.00093782,0.00094706,0.00095647,0.00096606,0.00097582,0.00098574,0.00099583,0.0010061,0.0010165,0.0010271,0.0010378,0.0010652,0.0010936,0.0011227,0.0011526,0.0011833,0.0012146,0.0012792,0.001346,0.0014843,0.001625,0.0017637,0.0018984,0.0020289,0.00081757,0.00081931,0.00082277,0.00082624,0.0008297,0.00083316,0.00083663,0.00084011,0.00084361,0.00084714,0.00085069,0.00085427,0.00085789,0.00086154,0.00086523,0.00086895,0.00087272,0.00087652,0.00088036,0.00088424,0.00088816,0.00089211,0.00089611,0.00090014,0.00090421,0.00090832,0.00091247,0.00091665,0.00092087,0.00092941,0.00093809,0.00094692,0.00095587,0.00096496,0.00097418,0.00098353,0.000993,0.0010026,0.0010123,0.0010371,0.0010625,0.0010886,0.0011152,0.0011424,0.0011701,0.0012268,0.0012853,0.001406,0.0015296,0.0016527,0.0017732,0.0018903,0.00080913,0.0008125,0.00081586,0.00081921,0.00082256,0.00082591,0.00082927,0.00083264,0.00083602,0.00083943,0.00084286,0.00084631,0.00084979,0.0008533,0.00085684,0.00086042,0.00086402,0.00086765,0.00087132,0.00087501,0.00087874,0.0008825,0.00088629,0.00089011,0.00089396,0.00089784,0.00090175,0.00090569,0.00091366,0.00092174,0.00092993,0.00093823,0.00094663,0.00095514,0.00096375,0.00097246,0.00098126,0.00099016,0.0010128,0.0010359,0.0010596,0.0010837,0.0011082,0.001133,0.0011838,0.0012357,0.0013427,0.0014524,0.0015627,0.0016715,0.0017777]),
+    rho: new Float64Array([999.8,999.92,999.66,999.06,998.17,997.01,995.61,993.99,992.18,990.17,989.83,0.068166,0.067263,0.06622,0.065211,0.064233,0.063285,0.062366,0.061474,0.06607,0.059766,0.058947,0.058152,0.057378,0.056624,0.05589,0.055176,0.054479,0.0538,0.053138,0.052493,0.051863,0.051247,0.05647,0.0506,0.049487,0.048927,0.04838,0.047845,0.047321,0.046809,0.046308,0.045818,0.044868,0.043956,0.043081,0.04224,0.041432,0.04654,0.039904,0.039182,0.038486,0.037814,0.037164,0.036537,0.035931,0.035345,0.034777,0.034228,0.033695,0.033179,0.032678,0.032193,0.031721,0.031263,0.03818,0.03386,0.029966,0.029557,0.029159,0.028772,0.028395,0.028027,0.02732,0.026648,0.026008,0.025398,0.024817,0.024261,0.023729,0.023221,0.022733,0.022266,0.021818,0.021387,0.02973,0.02575,0.02191,0.019822,0.019465,0.019122,0.01879,0.01847,0.01816,0.017861,0.017571,0.017291,0.017019,0.01578,0.014708,0.013773,0.01295,0.01222,0.011567,0.01452,0.009532,999.8,999.93,999.66,999.06,998.17,997.01,995.61,994,992.18,990.18,988,985.66,983.16,983.13,0.13075,0.12879,0.12686,0.125,0.12319,0.12144,0.11973,0.11808,0.11648,0.11491,0.1134,0.11192,0.1148,0.10908,0.10771,0.10638,0.10508,0.10381,0.10258,0.10137,0.1002,0.09945,0.097921,0.096822,0.095748,0.094698,0.093671,0.092666,0.091682,0.089777,0.08795,0.086197,0.084512,0.082892,0.081333,0.079832,0.078386,0.076991,0.075645,0.074346,0.07309,0.071876,0.07703,0.069566,0.068466,0.0674,0.066367,0.065365,0.064393,0.06345,0.062534,0.061644,0.06779,0.059937,0.059119,0.058323,0.057548,0.056794,0.056059,0.054644,0.0533,0.05202,0.058,0.049636,0.048524,0.047461,0.046443,0.045468,0.044533,0.043636,0.042775,0.041947,0.04115,0.04383,0.039644,0.038931,0.038244,0.037581,0.03694,0.036321,0.035722,0.035142,0.034582,0.034038,0.031559,0.029417,0.027547,0.0259,0.02444,0.023135,0.02903,0.019064,999.81,999.93,999.67,999.07,998.17,997.02,995.62,994,992.19,990.18,988,985.66,983.16,980.52,978.25,0.19126,0.19074,0.1879,0.18515,0.18249,0.17991,0.17741,0.17497,0.17261,0.1732,0.16808,0.16591,0.16379,0.16173,0.15972,0.15777,0.15586,0.154,0.15218,0.154,0.14867,0.14698,0.14533,0.14371,0.14213,0.1458,0.13907,0.13759,0.13473,0.13198,0.12935,0.12681,0.12438,0.12204,0.11978,0.11761,0.11552,0.11349,0.11154,0.10966,0.10784,0.10607,0.10437,0.10272,0.10112,0.099565,0.098062,0.096603,0.095187,0.093811,0.092476,0.091177,0.089915,0.088687,0.087493,0.08633,0.085197,0.084094,0.081972,0.079954,0.078034,0.076203,0.074457,0.072789,0.071193,0.069667,0.068204,0.066802,0.065456,0.064164,0.062921,0.061726,0.06575,0.059467,0.058398,0.057367,0.056372,0.055411,0.054482,0.053583,0.052714,0.051873,0.051058,0.047339,0.044125,0.04132,0.03885,0.036659,0.034702,0.031354,0.028596,999.81,999.94,999.67,999.07,998.18,997.02,995.62,994.01,992.19,990.19,988.01,985.67,983.17,980.52,977.74,974.82,974.3,0.25044,0.24737,0.24378,0.2403,0.23692,0.23365,0.23047,0.22739,0.22439,0.22147,0.21863,0.21587,0.21317,0.21055,0.20799,0.2055,0.20306,0.20069,0.19837,0.19611,0.19389,0.19173,0.18962,0.18755,0.18553,0.18355,0.17972,0.17605,0.17253,0.16915,0.1659,0.16277,0.15976,0.15686,0.15406,0.15136,0.14876,0.14624,0.14381,0.14146,0.13918,0.13698,0.13484,0.13277,0.13077,0.12882,0.12693,0.1251,0.12331,0.12158,0.1199,0.11826,0.11667,0.11512,0.11361,0.11213,0.1093,0.10661,0.10405,0.10161,0.09928,0.097055,0.094928,0.092892,0.090942,0.089072,0.087277,0.085554,0.083897,0.082303,0.080769,0.07929,0.077865,0.07649,0.075163,0.073882,0.072643,0.071445,0.070286,0.069164,0.068077,0.063119,0.058834,0.055093,0.0518,0.048879,0.046269,0.041806,0.038127,999.82,999.94,999.68,999.08,998.18,997.02,995.63,994.01,992.19,990.19,988.01,985.67,983.17,980.53,977.74,974.82,971.77,970.94,0.30864,0.3053,0.3009,0.29664,0.29251,0.2885,0.28462,0.28084,0.27716,0.27359,0.27012,0.26673,0.26343,0.26022,0.25709,0.25403,0.25105,0.24814,0.2453,0.24252,0.23981,0.23716,0.23457,0.23204,0.22956,0.22476,0.22016,0.21575,0.21151,0.20744,0.20353,0.19976,0.19613,0.19263,0.18925,0.18599,0.18284,0.1798,0.17685,0.17401,0.17125,0.16858,0.16599,0.16348,0.16105,0.15868,0.15639,0.15416,0.15199,0.14989,0.14784,0.14585,0.14391,0.14202,0.14018,0.13664,0.13327,0.13007,0.12702,0.12411,0.12132,0.11866,0.11612,0.11368,0.11134,0.1091,0.10694,0.10487,0.10288,0.10096,0.099115,0.097333,0.095614,0.093955,0.092353,0.090805,0.089307,0.087858,0.086456,0.085097,0.078899,0.073542,0.068867,0.06475,0.061098,0.057836,0.052257,0.047659,999.82,999.95,999.68,999.08,998.19,997.03,995.63,994.02,992.2,990.19,988.02,985.68,983.18,980.53,977.75,974.82,971.77,968.59,967.99,0.36607,0.36173,0.35656,0.35156,0.3467,0.342,0.33743,0.33299,0.32868,0.32448,0.3239,0.31642,0.31254,0.30876,0.3058,0.30149,0.29798,0.29456,0.29122,0.28795,0.28476,0.28165,0.2786,0.27561,0.26984,0.26431,0.259,0.25391,0.2492,0.24431,0.23978,0.23542,0.23121,0.22715,0.22324,0.21945,0.2158,0.21226,0.20884,0.20553,0.20233,0.19922,0.1962,0.19328,0.1944,0.18769,0.1851,0.18241,0.17988,0.17742,0.1753,0.1727,0.1744,0.16823,0.16398,0.15994,0.1569,0.15243,0.14893,0.1456,0.1424,0.13935,0.13642,0.13362,0.1392,0.12834,0.12585,0.12346,0.12116,0.11894,0.1168,0.11474,0.11275,0.11083,0.10897,0.10717,0.10543,0.10375,0.10212,0.094679,0.088251,0.08264,0.0777,0.073318,0.069403,0.062708,0.05719,999.83,999.95,999.69,999.09,998.19,997.03,995.64,994.02,992.2,990.2,988.02,985.68,983.18,980.54,977.75,974.83,971.78,968.6,965.34,0.42287,0.42279,0.41669,0.41079,0.40508,0.39954,0.39417,0.38895,0.38389,0.37896,0.37416,0.3695,0.36495,0.36053,0.35621,0.352,0.3479,0.34389,0.33998,0.33616,0.33242,0.32877,0.32521,0.32172,0.31496,0.3085,0.30229,0.29634,0.29062,0.28512,0.27983,0.27473,0.26981,0.26508,0.2605,0.25608,0.25182,0.24769,0.24369,0.23983,0.23608,0.23245,0.22894,0.22552,0.22221,0.21899,0.21587,0.21284,0.20988,0.20701,0.20422,0.2015,0.19886,0.19628,0.19132,0.18661,0.18212,0.17784,0.17376,0.16987,0.16614,0.16258,0.15916,0.15589,0.15275,0.14973,0.14683,0.14404,0.14135,0.13876,0.13627,0.13386,0.13154,0.1293,0.12713,0.12503,0.123,0.12104,0.11914,0.11046,0.10296,0.096413,0.09065,0.085537,0.08097,0.073159,0.066722,999.83,999.96,999.69,999.09,998.2,997.04,995.64,994.02,992.21,990.2,988.03,985.68,983.19,980.54,977.76,974.83,971.78,968.6,965.3,962.93,0.47914,0.47703,0.47022,0.46363,0.45725,0.45106,0.44505,0.43922,0.43356,0.42805,0.42268,0.41746,0.41238,0.40743,0.4026,0.39788,0.39329,0.3888,0.38442,0.38014,0.37595,0.37187,0.36787,0.36013,0.35272,0.34562,0.3388,0.33225,0.32595,0.3199,0.31406,0.30844,0.30302,0.29778,0.29273,0.28785,0.28312,0.27856,0.27413,0.26985,0.2657,0.26168,0.25777,0.25399,0.25031,0.24674,0.24327,0.23989,0.23661,0.23342,0.23031,0.22728,0.22434,0.21867,0.21328,0.20815,0.20326,0.1986,0.19414,0.18989,0.18581,0.18191,0.17816,0.17457,0.17112,0.16781,0.16462,0.16155,0.15859,0.15574,0.15299,0.15033,0.14777,0.14529,0.1429,0.14058,0.13833,0.13616,0.12624,0.11767,0.11019,0.1036,0.097757,0.092537,0.08361,0.076253,999.84,999.96,999.7,999.1,998.2,997.04,995.64,994.03,992.21,990.21,988.03,985.69,983.19,980.55,977.76,974.84,971.79,968.61,965.3,961.88,960.7,0.53494,0.52984,0.52236,0.51511,0.5081,0.50129,0.49469,0.48827,0.48204,0.47597,0.47007,0.46432,0.45872,0.45327,0.44795,0.44275,0.43769,0.43274,0.42791,0.42319,0.41858,0.41407,0.40534,0.39699,0.38898,0.38129,0.37391,0.36682,0.35999,0.35342,0.34708,0.34098,0.33508,0.32939,0.32389,0.31857,0.31343,0.30845,0.30363,0.29896,0.29443,0.29003,0.28577,0.28163,0.27761,0.2737,0.2699,0.26621,0.26262,0.25912,0.25571,0.2524,0.24602,0.23995,0.23418,0.22868,0.22343,0.21842,0.21363,0.20904,0.20465,0.20044,0.1964,0.19252,0.18879,0.1852,0.18175,0.17842,0.17521,0.17212,0.16913,0.16624,0.16345,0.16076,0.15815,0.15562,0.15318,0.14202,0.13238,0.12396,0.11655,0.10998,0.1041,0.09406,0.085784,999.84,999.97,999.7,999.1,998.21,997.05,995.65,994.03,992.22,990.21,988.03,985.69,983.2,980.55,977.76,974.84,971.79,968.61,965.31,961.89,958.63,0.59034,0.58967,0.58127,0.57315,0.56529,0.55767,0.55028,0.54311,0.53614,0.52936,0.52277,0.51636,0.51011,0.50402,0.49808,0.49229,0.48664,0.48113,0.47574,0.47048,0.46534,0.46031,0.45059,0.44129,0.43237,0.42382,0.4156,0.4077,0.40011,0.3928,0.38575,0.37895,0.3724,0.36607,0.35995,0.35404,0.34832,0.34278,0.33742,0.33222,0.32719,0.3223,0.31756,0.31296,0.30849,0.30414,0.29992,0.29582,0.29182,0.28793,0.28415,0.28046,0.27337,0.26663,0.26021,0.2541,0.24827,0.2427,0.23738,0.23228,0.2274,0.22272,0.21823,0.21392,0.20977,0.20578,0.20194,0.19825,0.19468,0.19124,0.18792,0.18472,0.18162,0.17862,0.17572,0.17292,0.1702,0.1578,0.14708,0.13773,0.1295,0.1222,0.11567,0.10451,0.095316,999.85,999.97,999.71,999.11,998.21,997.05,995.65,994.04,992.22,990.22,988.04,985.7,983.2,980.55,977.77,974.85,971.79,968.62,965.31,961.89,958.35,956.69,0.64539,0.64037,0.63136,0.62264,0.6142,0.60601,0.59807,0.59036,0.58286,0.57557,0.56848,0.56157,0.55485,0.54829,0.5419,0.53566,0.52957,0.52363,0.51782,0.51215,0.50661,0.49589,0.48563,0.4758,0.46637,0.45732,0.44862,0.44025,0.43219,0.42443,0.41695,0.40973,0.40276,0.39602,0.38951,0.38322,0.37712,0.37122,0.3655,0.35995,0.35458,0.34936,0.34429,0.33937,0.33459,0.32995,0.32543,0.32103,0.31675,0.31259,0.30853,0.30073,0.29331,0.28625,0.27953,0.27311,0.26698,0.26112,0.25552,0.25015,0.245,0.24006,0.23531,0.23075,0.22636,0.22214,0.21807,0.21415,0.21037,0.20672,0.20319,0.19978,0.19649,0.1933,0.19021,0.18722,0.17358,0.16179,0.15151,0.14245,0.13441,0.12724,0.11496,0.10485,999.85,999.98,999.71,999.11,998.22,997.06,995.66,994.04,992.22,990.22,988.04,985.7,983.2,980.56,977.77,974.85,971.8,968.62,965.32,961.9,958.36,954.86,0.7001,0.69967,0.68974,0.68015,0.67087,0.66187,0.65315,0.64469,0.63646,0.62847,0.62069,0.61313,0.60576,0.59857,0.59157,0.58474,0.57808,0.57158,0.56522,0.55902,0.55296,0.54123,0.53001,0.51927,0.50896,0.49907,0.48956,0.48042,0.47162,0.46314,0.45496,0.44708,0.43947,0.43211,0.425,0.41813,0.41147,0.40503,0.39878,0.39273,0.38686,0.38117,0.37564,0.37027,0.36505,0.35998,0.35505,0.35025,0.34558,0.34103,0.33661,0.32809,0.32,0.31229,0.30495,0.29795,0.29126,0.28487,0.27875,0.2729,0.26728,0.26189,0.25671,0.25173,0.24695,0.24234,0.2379,0.23362,0.2295,0.22551,0.22166,0.21795,0.21435,0.21087,0.2075,0.20424,0.18936,0.1765,0.16528,0.1554,0.14663,0.1388,0.12541,0.11438,999.86,999.98,999.72,999.12,998.22,997.06,995.66,994.05,992.23,990.23,988.05,985.71,983.21,980.56,977.78,974.86,971.8,968.62,965.32,961.9,958.36,954.71,953.13,0.75453,0.7483,0.73782,0.72768,0.71787,0.70836,0.69913,0.69017,0.68147,0.673,0.66477,0.65675,0.64893,0.64132,0.63389,0.62665,0.61958,0.61268,0.60594,0.59935,0.58662,0.57443,0.56277,0.55158,0.54084,0.53053,0.52061,0.51106,0.50186,0.493,0.48444,0.47619,0.46821,0.4605,0.45305,0.44583,0.43885,0.43208,0.42552,0.41915,0.41298,0.40699,0.40117,0.39551,0.39001,0.38467,0.37947,0.37441,0.36948,0.36468,0.35546,0.34668,0.33834,0.33038,0.32279,0.31555,0.30862,0.30199,0.29565,0.28956,0.28372,0.27811,0.27272,0.26753,0.26254,0.25773,0.2531,0.24862,0.24431,0.24014,0.23611,0.23222,0.22845,0.2248,0.22126,0.20514,0.19121,0.17905,0.16835,0.15885,0.15037,0.13586,0.12391,999.86,999.99,999.72,999.12,998.22,997.07,995.67,994.05,992.23,990.23,988.05,985.71,983.21,980.57,977.78,974.86,971.81,968.63,965.33,961.91,958.37,954.71,951.49,0.80869,0.80704,0.79565,0.78465,0.77401,0.7637,0.7537,0.74399,0.73457,0.7254,0.71649,0.70782,0.69937,0.69114,0.68311,0.67528,0.66765,0.66019,0.65291,0.64579,0.63205,0.6189,0.6063,0.59423,0.58265,0.57152,0.56082,0.55052,0.54061,0.53105,0.52183,0.51293,0.50433,0.49602,0.48798,0.48021,0.47268,0.46538,0.45831,0.45146,0.4448,0.43834,0.43207,0.42598,0.42006,0.4143,0.4087,0.40324,0.39794,0.39277,0.38282,0.37337,0.36438,0.35581,0.34764,0.33984,0.33238,0.32524,0.3184,0.31184,0.30555,0.29951,0.2937,0.28812,0.28274,0.27756,0.27257,0.26775,0.2631,0.25861,0.25428,0.25008,0.24602,0.24209,0.23829,0.22092,0.20592,0.19283,0.1813,0.17107,0.16194,0.14631,0.13344,999.87,999.99,999.73,999.13,998.23,997.07,995.67,994.05,992.24,990.23,988.06,985.71,983.22,980.57,977.79,974.86,971.81,968.63,965.33,961.91,958.37,954.72,950.95,949.92,0.8626,0.85365,0.84177,0.83028,0.81916,0.80838,0.79792,0.78777,0.7779,0.76831,0.75897,0.74988,0.74103,0.7324,0.72398,0.71577,0.70776,0.69993,0.69229,0.67752,0.6634,0.64988,0.63692,0.62448,0.61254,0.60106,0.59001,0.57937,0.56912,0.55923,0.54968,0.54046,0.53155,0.52293,0.51459,0.50652,0.4987,0.49112,0.48376,0.47663,0.46971,0.46299,0.45645,0.4501,0.44393,0.43793,0.43208,0.42639,0.42085,0.4102,0.40007,0.39043,0.38125,0.37249,0.36413,0.35613,0.34848,0.34115,0.33413,0.32739,0.32091,0.31469,0.3087,0.30294,0.29739,0.29204,0.28688,0.2819,0.27709,0.27244,0.26795,0.2636,0.25939,0.25531,0.2367,0.22063,0.2066,0.19425,0.18329,0.1735,0.15676,0.14297,999.87,1000,999.73,999.13,998.23,997.07,995.68,994.06,992.24,990.24,988.06,985.72,983.22,980.58,977.79,974.87,971.82,968.64,965.34,961.92,958.38,954.72,950.96,948.41,0.91629,0.91183,0.89904,0.8867,0.87475,0.86318,0.85196,0.84107,0.83049,0.82021,0.81021,0.80047,0.79099,0.78175,0.77274,0.76395,0.75538,0.74701,0.73883,0.72304,0.70794,0.69349,0.67964,0.66635,0.65359,0.64132,0.62952,0.61816,0.60721,0.59664,0.58645,0.57661,0.56709,0.55789,0.54899,0.54037,0.53202,0.52393,0.51608,0.50847,0.50108,0.49391,0.48693,0.48016,0.47357,0.46716,0.46093,0.45486,0.44894,0.43757,0.42677,0.41648,0.40669,0.39734,0.38842,0.37989,0.37172,0.36391,0.35641,0.34922,0.34231,0.33568,0.32929,0.32314,0.31722,0.31152,0.30601,0.3007,0.29557,0.29061,0.28581,0.28117,0.27668,0.27233,0.25248,0.23534,0.22037,0.2072,0.19551,0.18507,0.16721,0.1525,999.88,1000.01,999.74,999.14,998.24,997.08,995.68,994.07,992.25,990.25,988.07,985.73,983.23,980.59,977.8,974.88,971.83,968.65,965.35,961.92,958.39,954.73,950.97,947.09,945.57,1.023,1.0141,0.99996,0.98633,0.97315,0.96037,0.94799,0.93596,0.92428,0.91293,0.90188,0.89113,0.88066,0.87045,0.8605,0.85079,0.84132,0.83207,0.81421,0.79714,0.78081,0.76517,0.75017,0.73576,0.72192,0.70861,0.69579,0.68344,0.67153,0.66004,0.64894,0.63822,0.62785,0.61782,0.60811,0.5987,0.58958,0.58074,0.57217,0.56385,0.55577,0.54792,0.54029,0.53287,0.52565,0.51863,0.51179,0.50514,0.49234,0.48017,0.4686,0.45757,0.44705,0.43701,0.42741,0.41822,0.40942,0.40099,0.39289,0.38512,0.37765,0.37047,0.36355,0.35689,0.35047,0.34427,0.33829,0.33252,0.32694,0.32154,0.31632,0.31127,0.30638,0.28405,0.26475,0.24792,0.2331,0.21995,0.2082,0.18811,0.17156,999.89,1000.02,999.75,999.15,998.25,997.09,995.69,994.08,992.26,990.26,988.08,985.74,983.24,980.59,977.81,974.89,971.83,968.66,965.35,961.93,958.4,954.74,950.98,947.1,943.11,942.94,1.1291,1.1138,1.0985,1.0836,1.0692,1.0553,1.0418,1.0287,1.016,1.0036,0.99157,0.97984,0.96842,0.95729,0.94644,0.93585,0.92551,0.90556,0.8865,0.86828,0.85083,0.8341,0.81805,0.80262,0.78778,0.7735,0.75975,0.74648,0.73369,0.72133,0.70939,0.69785,0.68669,0.67588,0.66542,0.65527,0.64544,0.6359,0.62664,0.61765,0.60892,0.60044,0.59218,0.58416,0.57635,0.56875,0.56135,0.54712,0.53359,0.52072,0.50846,0.49677,0.4856,0.47493,0.46472,0.45494,0.44557,0.43657,0.42793,0.41963,0.41165,0.40396,0.39656,0.38942,0.38254,0.37589,0.36947,0.36327,0.35728,0.35148,0.34586,0.34042,0.31561,0.29417,0.27546,0.25899,0.24438,0.23133,0.20901,0.19062,999.9,1000.02,999.76,999.16,998.26,997.1,995.7,994.09,992.27,990.26,988.09,985.74,983.25,980.6,977.82,974.9,971.84,968.67,965.36,961.94,958.4,954.75,950.99,947.11,943.12,940.47,1.2345,1.2283,1.2111,1.1946,1.1786,1.1631,1.1481,1.1335,1.1194,1.1057,1.0923,1.0793,1.0667,1.0543,1.0423,1.0306,1.0192,0.99709,0.97603,0.9559,0.93663,0.91816,0.90044,0.88341,0.86705,0.8513,0.83613,0.8215,0.8074,0.79378,0.78063,0.76791,0.75561,0.7437,0.73217,0.721,0.71017,0.69966,0.68947,0.67957,0.66995,0.66061,0.65153,0.64269,0.63409,0.62573,0.61758,0.60191,0.58702,0.57286,0.55936,0.5465,0.53421,0.52246,0.51123,0.50047,0.49015,0.48025,0.47075,0.46161,0.45283,0.44437,0.43623,0.42837,0.4208,0.41349,0.40643,0.39961,0.39301,0.38663,0.38045,0.37447,0.34717,0.32359,0.30301,0.28489,0.26882,0.25447,0.22991,0.20968,999.91,1000.03,999.77,999.17,998.27,997.11,995.71,994.09,992.28,990.27,988.1,985.75,983.26,980.61,977.83,974.9,971.85,968.67,965.37,961.95,958.41,954.76,950.99,947.12,943.13,939.03,938.13,1.3393,1.3244,1.3061,1.2884,1.2713,1.2547,1.2387,1.2231,1.208,1.1933,1.1791,1.1652,1.1516,1.1384,1.1256,1.113,1.0888,1.0657,1.0437,1.0226,1.0023,0.98293,0.96431,0.9464,0.92917,0.91258,0.8966,0.88117,0.86629,0.85191,0.83801,0.82457,0.81156,0.79897,0.78676,0.77493,0.76346,0.75232,0.74151,0.73101,0.72081,0.71089,0.70124,0.69186,0.68272,0.67383,0.65672,0.64047,0.62501,0.61028,0.59623,0.58282,0.57001,0.55774,0.546,0.53474,0.52394,0.51357,0.5036,0.49401,0.48479,0.4759,0.46733,0.45907,0.45109,0.44339,0.43594,0.42875,0.42178,0.41504,0.40852,0.37874,0.35301,0.33056,0.31079,0.29326,0.2776,0.25081,0.22874,999.92,1000.04,999.78,999.18,998.28,997.12,995.72,994.1,992.29,990.28,988.1,985.76,983.27,980.62,977.83,974.91,971.86,968.68,965.38,961.96,958.42,954.77,951,947.13,943.14,939.04,935.93,1.4436,1.4382,1.4181,1.3987,1.38,1.3618,1.3443,1.3273,1.3107,1.2947,1.2791,1.2639,1.2491,1.2348,1.2207,1.2071,1.1807,1.1556,1.1316,1.1086,1.0866,1.0655,1.0453,1.0258,1.0071,0.98912,0.97176,0.95501,0.93885,0.92325,0.90817,0.89358,0.87947,0.8658,0.85256,0.83973,0.82728,0.8152,0.80348,0.79209,0.78103,0.77027,0.75981,0.74964,0.73973,0.73009,0.71154,0.69392,0.67717,0.6612,0.64598,0.63144,0.61755,0.60426,0.59154,0.57934,0.56763,0.55639,0.54559,0.5352,0.5252,0.51557,0.50629,0.49734,0.48869,0.48035,0.47228,0.46448,0.45694,0.44964,0.44256,0.4103,0.38243,0.3581,0.33669,0.31769,0.30073,0.27171,0.2478,999.93,1000.05,999.79,999.19,998.29,997.13,995.73,994.11,992.29,990.29,988.11,985.77,983.27,980.63,977.84,974.92,971.87,968.69,965.39,961.97,958.43,954.78,951.01,947.14,943.15,939.05,934.84,933.83,1.5474,1.5307,1.5095,1.4891,1.4693,1.4502,1.4317,1.4138,1.3963,1.3794,1.363,1.3469,1.3313,1.3161,1.3013,1.2728,1.2456,1.2196,1.1948,1.171,1.1483,1.1264,1.1054,1.0852,1.0657,1.047,1.0289,1.0115,0.99464,0.97837,0.96264,0.94741,0.93267,0.9184,0.90456,0.89114,0.87812,0.86548,0.8532,0.84127,0.82968,0.8184,0.80744,0.79676,0.78637,0.76638,0.7474,0.72934,0.71214,0.69573,0.68007,0.66511,0.65079,0.63708,0.62394,0.61133,0.59922,0.58759,0.5764,0.56563,0.55525,0.54525,0.53561,0.5263,0.51731,0.50862,0.50022,0.4921,0.48423,0.47661,0.44186,0.41184,0.38565,0.36259,0.34213,0.32386,0.29261,0.26686,999.94,1000.06,999.8,999.2,998.3,997.14,995.74,994.12,992.3,990.3,988.12,985.78,983.28,980.64,977.85,974.93,971.88,968.7,965.4,961.98,958.44,954.79,951.02,947.15,943.16,939.06,934.85,931.82,1.6508,1.6438,1.6208,1.5986,1.5773,1.5566,1.5365,1.5171,1.4983,1.48,1.4623,1.445,1.4282,1.4118,1.3958,1.3651,1.3358,1.3078,1.2811,1.2556,1.2311,1.2076,1.185,1.1633,1.1424,1.1223,1.1029,1.0842,1.0661,1.0486,1.0317,1.0154,0.99959,0.98427,0.96942,0.95503,0.94106,0.9275,0.91433,0.90154,0.88911,0.87702,0.86526,0.85381,0.84266,0.82124,0.80088,0.78152,0.76308,0.7455,0.72871,0.71267,0.69732,0.68263,0.66854,0.65503,0.64205,0.62958,0.61759,0.60605,0.59493,0.58422,0.57388,0.56391,0.55427,0.54496,0.53596,0.52726,0.51883,0.51066,0.47343,0.44126,0.41319,0.38848,0.36656,0.34699,0.31351,0.28592,999.97,1000.09,999.82,999.22,998.32,997.16,995.76,994.14,992.33,990.32,988.14,985.8,983.3,980.66,977.87,974.95,971.9,968.72,965.42,962,958.47,954.81,951.05,947.17,943.18,939.08,934.88,930.56,927.15,1.9077,1.9015,1.8747,1.849,1.8242,1.8003,1.7771,1.7547,1.7329,1.7118,1.6912,1.6713,1.6519,1.633,1.5966,1.562,1.529,1.4976,1.4675,1.4386,1.411,1.3845,1.359,1.3344,1.3108,1.2881,1.2661,1.2449,1.2245,1.2047,1.1856,1.167,1.1491,1.1317,1.1149,1.0985,1.0827,1.0673,1.0523,1.0378,1.0236,1.0099,0.99651,0.98348,0.95844,0.93465,0.91203,0.89049,0.86995,0.85034,0.83161,0.81369,0.79653,0.78008,0.7643,0.74915,0.73459,0.72059,0.70712,0.69414,0.68164,0.66957,0.65793,0.64669,0.63582,0.62532,0.61516,0.60532,0.59579,0.55234,0.51481,0.48206,0.45323,0.42765,0.40481,0.36575,0.33357,999.99,1000.11,999.85,999.24,998.34,997.18,995.78,994.17,992.35,990.34,988.17,985.82,983.33,980.68,977.9,974.98,971.92,968.75,965.45,962.03,958.49,954.84,951.07,947.2,943.21,939.11,934.9,930.58,926.16,922.89,2.1627,2.154,2.1237,2.0945,2.0664,2.0393,2.0131,1.9877,1.9631,1.9392,1.916,1.8934,1.8715,1.8293,1.7893,1.7512,1.7148,1.6801,1.6469,1.6151,1.5845,1.5552,1.527,1.4998,1.4737,1.4485,1.4241,1.4006,1.3779,1.356,1.3347,1.3142,1.2943,1.2749,1.2562,1.238,1.2204,1.2032,1.1866,1.1704,1.1546,1.1393,1.1244,1.0957,1.0685,1.0426,1.018,0.99446,0.97202,0.95059,0.93009,0.91046,0.89165,0.8736,0.85628,0.83963,0.82362,0.80821,0.79337,0.77907,0.76528,0.75197,0.73911,0.72669,0.71468,0.70306,0.69182,0.68093,0.63126,0.58835,0.55092,0.51797,0.48874,0.46264,0.41799,0.38121,1000.02,1000.14,999.87,999.27,998.37,997.2,995.8,994.19,992.37,990.37,988.19,985.85,983.35,980.7,977.92,975,971.95,968.77,965.47,962.05,958.51,954.86,951.1,947.22,943.23,939.13,934.93,930.61,926.18,921.64,918.96,2.4161,2.4014,2.3676,2.3351,2.3038,2.2736,2.2444,2.2162,2.1888,2.1623,2.1365,2.1114,2.0633,2.0177,1.9743,1.933,1.8936,1.8559,1.8197,1.7851,1.7519,1.72,1.6893,1.6597,1.6312,1.6037,1.5771,1.5515,1.5267,1.5027,1.4795,1.457,1.4352,1.4141,1.3936,1.3737,1.3543,1.3355,1.3173,1.2995,1.2823,1.2654,1.2331,1.2024,1.1733,1.1455,1.119,1.0938,1.0696,1.0465,1.0244,1.0032,0.98293,0.96343,0.94469,0.92666,0.90932,0.89262,0.87652,0.861,0.84601,0.83155,0.81757,0.80405,0.79098,0.77832,0.76607,0.71018,0.6619,0.61978,0.58271,0.54982,0.52046,0.47023,0.42885,1000.05,1000.16,999.89,999.29,998.39,997.23,995.83,994.21,992.39,990.39,988.21,985.87,983.37,980.73,977.94,975.02,971.97,968.79,965.49,962.07,958.54,954.88,951.12,947.24,943.26,939.16,934.95,930.64,926.21,921.67,917.02,915.29,2.668,2.6436,2.6064,2.5708,2.5364,2.5033,2.4712,2.4402,2.4102,2.3811,2.3528,2.2986,2.2472,2.1984,2.152,2.1078,2.0655,2.0251,1.9863,1.9492,1.9135,1.8791,1.8461,1.8143,1.7836,1.7539,1.7253,1.6977,1.6709,1.645,1.6199,1.5957,1.5721,1.5493,1.5271,1.5056,1.4846,1.4643,1.4445,1.4253,1.4066,1.3706,1.3365,1.304,1.2731,1.2436,1.2155,1.1887,1.163,1.1384,1.1149,1.0923,1.0706,1.0498,1.0297,1.0104,0.99188,0.97398,0.95673,0.94007,0.92399,0.90845,0.89343,0.8789,0.86483,0.85121,0.7891,0.73545,0.68864,0.64745,0.61091,0.57828,0.52247,0.47649,1000.07,1000.19,999.92,999.31,998.41,997.25,995.85,994.23,992.41,990.41,988.23,985.89,983.39,980.75,977.96,975.04,971.99,968.81,965.51,962.1,958.56,954.91,951.14,947.27,943.28,939.19,934.98,930.66,926.24,921.7,917.05,912.29,911.85,2.9189,2.8806,2.8403,2.8015,2.7642,2.7282,2.6935,2.6598,2.6272,2.5956,2.5351,2.4778,2.4236,2.372,2.3228,2.2759,2.2311,2.1882,2.147,2.1075,2.0695,2.0329,1.9977,1.9638,1.931,1.8994,1.8689,1.8394,1.8108,1.7831,1.7563,1.7303,1.7051,1.6807,1.6569,1.6339,1.6114,1.5897,1.5685,1.5478,1.5082,1.4706,1.4348,1.4008,1.3683,1.3374,1.3078,1.2795,1.2525,1.2265,1.2017,1.1778,1.1549,1.1328,1.1116,1.0912,1.0715,1.0525,1.0341,1.0164,0.99935,0.98282,0.96683,0.95135,0.93637,0.86802,0.809,0.7575,0.71218,0.67199,0.63609,0.57471,0.52413,1000.1,1000.21,999.94,999.34,998.44,997.27,995.87,994.25,992.44,990.43,988.25,985.91,983.41,980.77,977.98,975.06,972.01,968.84,965.54,962.12,958.58,954.93,951.17,947.29,943.31,939.21,935.01,930.69,926.26,921.73,917.08,912.32,908.59,3.1687,3.1578,3.1124,3.069,3.0274,2.9873,2.9486,2.9112,2.875,2.8399,2.7729,2.7097,2.6497,2.5929,2.5387,2.4871,2.4378,2.3906,2.3453,2.3019,2.2602,2.2201,2.1815,2.1444,2.1085,2.0739,2.0404,2.0081,1.9768,1.9465,1.9172,1.8887,1.8612,1.8344,1.8085,1.7832,1.7587,1.7349,1.7117,1.6892,1.6459,1.6048,1.5657,1.5285,1.4931,1.4593,1.427,1.3961,1.3666,1.3382,1.3111,1.285,1.26,1.2359,1.2128,1.1904,1.169,1.1482,1.1282,1.1089,1.0903,1.0722,1.0548,1.0379,1.0215,0.94695,0.88254,0.82636,0.77692,0.73307,0.69391,0.62694,0.57177,1000.12,1000.24,999.96,999.36,998.46,997.3,995.89,994.28,992.46,990.45,988.27,985.93,983.44,980.79,978.01,975.09,972.04,968.86,965.56,962.14,958.61,954.96,951.19,947.32,943.33,939.24,935.03,930.72,926.29,921.75,917.11,912.35,907.47,905.51,3.4177,3.3874,3.3391,3.2929,3.2484,3.2056,3.1643,3.1244,3.0858,3.0121,2.9426,2.8769,2.8146,2.7554,2.699,2.6451,2.5936,2.5442,2.4969,2.4515,2.4078,2.3658,2.3253,2.2862,2.2486,2.2122,2.177,2.143,2.1101,2.0782,2.0473,2.0174,1.9883,1.9601,1.9328,1.9061,1.8803,1.8551,1.8306,1.7836,1.739,1.6966,1.6563,1.6179,1.5812,1.5462,1.5127,1.4807,1.45,1.4205,1.3923,1.3651,1.339,1.3139,1.2898,1.2665,1.244,1.2223,1.2014,1.1812,1.1616,1.1427,1.1244,1.1067,1.0259,0.95609,0.89522,0.84166,0.79415,0.75172,0.67917,0.6194,1000.15,1000.26,999.99,999.38,998.48,997.32,995.92,994.3,992.48,990.47,988.3,985.95,983.46,980.81,978.03,975.11,972.06,968.88,965.58,962.17,958.63,954.98,951.22,947.34,943.36,939.26,935.06,930.74,926.32,921.78,917.14,912.37,907.5,902.56,3.666,3.6654,3.6118,3.5607,3.5118,3.4647,3.4193,3.3756,3.3333,3.2527,3.1768,3.1052,3.0374,2.9729,2.9116,2.8531,2.7972,2.7437,2.6924,2.6432,2.5959,2.5504,2.5066,2.4643,2.4236,2.3843,2.3462,2.3095,2.2739,2.2395,2.2061,2.1738,2.1424,2.112,2.0824,2.0537,2.0258,1.9986,1.9722,1.9215,1.8734,1.8277,1.7842,1.7427,1.7032,1.6655,1.6294,1.5948,1.5617,1.53,1.4996,1.4703,1.4422,1.4151,1.3891,1.364,1.3398,1.3164,1.2939,1.2721,1.251,1.2307,1.2109,1.1919,1.1048,1.0296,0.96408,0.90639,0.85522,0.80953,0.7314,0.66703,1000.17,1000.29,1000.01,999.41,998.5,997.34,995.94,994.32,992.5,990.5,988.32,985.98,983.48,980.84,978.05,975.13,972.08,968.9,965.61,962.19,958.65,955,951.24,947.37,943.38,939.29,935.08,930.77,926.35,921.81,917.16,912.4,907.53,902.54,899.74,3.9137,3.8874,3.8311,3.7774,3.7258,3.6763,3.6285,3.5824,3.4947,3.4123,3.3346,3.2611,3.1913,3.125,3.0618,3.0014,2.9437,2.8884,2.8353,2.7844,2.7354,2.6882,2.6427,2.5989,2.5566,2.5157,2.4762,2.438,2.401,2.3651,2.3304,2.2967,2.264,2.2322,2.2014,2.1714,2.1423,2.1139,2.0595,2.0078,1.9588,1.9121,1.8676,1.8252,1.7848,1.7461,1.709,1.6735,1.6395,1.6069,1.5755,1.5454,1.5164,1.4884,1.4615,1.4356,1.4105,1.3864,1.363,1.3404,1.3186,1.2975,1.277,1.1837,1.1032,1.0329,0.97112,0.9163,0.86734,0.78363,0.71466,1000.2,1000.31,1000.04,999.43,998.53,997.36,995.96,994.34,992.52,990.52,988.34,986,983.5,980.86,978.07,975.15,972.1,968.93,965.63,962.21,958.68,955.03,951.27,947.39,943.41,939.31,935.11,930.8,926.37,921.84,917.19,912.43,907.56,902.57,897.46,897.04,4.1608,4.1041,4.0453,3.9891,3.9351,3.8832,3.8332,3.7381,3.6489,3.565,3.4857,3.4106,3.3392,3.2712,3.2063,3.1443,3.0849,3.028,2.9733,2.9207,2.8702,2.8215,2.7745,2.7292,2.6855,2.6432,2.6022,2.5626,2.5243,2.4871,2.4511,2.4161,2.3822,2.3492,2.3171,2.286,2.2557,2.1975,2.1423,2.0899,2.0401,1.9926,1.9473,1.9041,1.8628,1.8232,1.7854,1.749,1.7142,1.6807,1.6486,1.6176,1.5878,1.5591,1.5314,1.5047,1.4789,1.454,1.4299,1.4066,1.384,1.3622,1.2627,1.1767,1.1018,1.0359,0.97737,0.92515,0.83585,0.76229,1000.25,1000.36,1000.08,999.48,998.57,997.41,996.01,994.39,992.57,990.56,988.38,986.04,983.54,980.9,978.12,975.2,972.15,968.97,965.67,962.26,958.72,955.08,951.31,947.44,943.46,939.36,935.16,930.85,926.43,921.89,917.25,912.49,907.62,902.63,897.52,892.29,891.92,4.6536,4.5888,4.5224,4.459,4.3983,4.3399,4.2294,4.1262,4.0293,3.938,3.8517,3.7699,3.6921,3.6179,3.5472,3.4795,3.4146,3.3524,3.2927,3.2353,3.18,3.1267,3.0753,3.0257,2.9778,2.9314,2.8866,2.8432,2.8011,2.7604,2.7208,2.6825,2.6452,2.609,2.5738,2.5396,2.4739,2.4116,2.3525,2.2963,2.2427,2.1917,2.1429,2.0964,2.0518,2.0091,1.9682,1.9289,1.8912,1.855,1.8201,1.7866,1.7542,1.723,1.693,1.6639,1.6359,1.6088,1.5825,1.5571,1.5326,1.4205,1.3238,1.2395,1.1653,1.0995,1.0408,0.94029,0.85754,1000.3,1000.41,1000.13,999.52,998.62,997.45,996.05,994.43,992.61,990.61,988.43,986.09,983.59,980.95,978.16,975.24,972.19,969.02,965.72,962.3,958.77,955.12,951.36,947.49,943.51,939.42,935.21,930.9,926.48,921.95,917.31,912.55,907.68,902.69,897.58,892.35,887.13,5.145,5.1431,5.0653,4.9916,4.9212,4.8539,4.7268,4.6087,4.4983,4.3944,4.2965,4.2038,4.1159,4.0322,3.9524,3.8762,3.8032,3.7333,3.6662,3.6018,3.5398,3.4801,3.4225,3.367,3.3133,3.2615,3.2114,3.1629,3.1159,3.0704,3.0262,2.9834,2.9418,2.9014,2.8621,2.824,2.7507,2.6813,2.6154,2.5527,2.4931,2.4362,2.382,2.3301,2.2805,2.233,2.1875,2.1438,2.1018,2.0615,2.0227,1.9854,1.9494,1.9147,1.8813,1.849,1.8178,1.7877,1.7585,1.7303,1.703,1.5784,1.471,1.3772,1.2948,1.2216,1.1564,1.0447,0.95278,1000.35,1000.46,1000.18,999.57,998.66,997.5,996.09,994.47,992.65,990.65,988.47,986.13,983.63,980.99,978.21,975.29,972.24,969.06,965.77,962.35,958.82,955.17,951.41,947.54,943.56,939.47,935.27,930.96,926.53,922,917.36,912.61,907.74,902.75,897.65,892.42,887.06,882.62,5.6354,5.6189,5.5336,5.4527,5.3755,5.2308,5.0968,4.972,4.8551,4.745,4.6411,4.5426,4.449,4.36,4.275,4.1937,4.116,4.0414,3.9698,3.9009,3.8347,3.7709,3.7093,3.6499,3.5925,3.537,3.4833,3.4314,3.381,3.3322,3.2848,3.2389,3.1943,3.1509,3.1088,3.0279,2.9513,2.8786,2.8095,2.7437,2.681,2.6212,2.564,2.5094,2.457,2.4069,2.3587,2.3125,2.2681,2.2254,2.1843,2.1447,2.1065,2.0697,2.0341,1.9998,1.9666,1.9345,1.9035,1.8734,1.7363,1.6181,1.5149,1.4242,1.3438,1.2719,1.1492,1.048,1000.4,1000.51,1000.23,999.62,998.71,997.54,996.14,994.52,992.7,990.69,988.51,986.17,983.68,981.03,978.25,975.33,972.28,969.11,965.81,962.4,958.86,955.22,951.46,947.59,943.61,939.52,935.32,931.01,926.59,922.06,917.42,912.67,907.8,902.81,897.71,892.48,887.13,881.65,878.35,6.1251,6.0857,5.9931,5.9053,5.7415,5.5908,5.4508,5.32,5.1973,5.0817,4.9723,4.8686,4.77,4.676,4.5863,4.5004,4.4182,4.3393,4.2635,4.1906,4.1204,4.0527,3.9874,3.9244,3.8635,3.8046,3.7475,3.6923,3.6388,3.5869,3.5365,3.4876,3.4401,3.394,3.3055,3.2216,3.142,3.0664,2.9945,2.926,2.8606,2.7981,2.7384,2.6812,2.6264,2.5738,2.5233,2.4748,2.4282,2.3833,2.34,2.2983,2.2581,2.2193,2.1818,2.1456,2.1105,2.0766,2.0438,1.8942,1.7652,1.6526,1.5537,1.4659,1.3875,1.2536,1.1432,1000.45,1000.56,1000.27,999.66,998.76,997.59,996.18,994.56,992.74,990.74,988.56,986.22,983.72,981.08,978.29,975.38,972.33,969.15,965.86,962.44,958.91,955.27,951.51,947.64,943.66,939.57,935.37,931.06,926.64,922.12,917.48,912.72,907.86,902.87,897.77,892.55,887.2,881.72,876.11,874.28,6.6144,6.5434,6.4439,6.2595,6.0907,5.9347,5.7895,5.6536,5.5258,5.4051,5.2909,5.1825,5.0792,4.9808,4.8867,4.7966,4.7103,4.6274,4.5477,4.471,4.3972,4.326,4.2572,4.1908,4.1266,4.0645,4.0043,3.946,3.8895,3.8347,3.7815,3.7299,3.6797,3.5834,3.4923,3.4058,3.3237,3.2456,3.1711,3.1001,3.0323,2.9675,2.9054,2.846,2.7889,2.7342,2.6816,2.631,2.5823,2.5354,2.4902,2.4466,2.4045,2.3639,2.3246,2.2866,2.2499,2.2143,2.0522,1.9123,1.7904,1.6831,1.588,1.5031,1.358,1.2384,1000.5,1000.6,1000.32,999.71,998.8,997.63,996.23,994.61,992.79,990.78,988.6,986.26,983.76,981.12,978.34,975.42,972.37,969.2,965.9,962.49,958.96,955.31,951.56,947.69,943.71,939.62,935.42,931.11,926.7,922.17,917.53,912.78,907.92,902.93,897.83,892.61,887.26,881.79,876.18,870.43,870.39,7.1034,6.9918,6.785,6.597,6.4241,6.2637,6.1139,5.9735,5.8411,5.716,5.5975,5.4847,5.3773,5.2748,5.1767,5.0828,4.9927,4.9062,4.8229,4.7427,4.6655,4.5909,4.519,4.4494,4.3821,4.317,4.2539,4.1928,4.1335,4.0759,4.0201,3.9658,3.8617,3.7633,3.6699,3.5812,3.4969,3.4165,3.3399,3.2667,3.1968,3.1298,3.0657,3.0042,2.9451,2.8884,2.8339,2.7814,2.7308,2.6821,2.6351,2.5898,2.5459,2.5036,2.4627,2.4231,2.3848,2.2101,2.0594,1.9281,1.8125,1.7101,1.6187,1.4624,1.3336,1000.55,1000.65,1000.37,999.75,998.85,997.68,996.27,994.65,992.83,990.82,988.64,986.3,983.81,981.16,978.38,975.46,972.42,969.24,965.95,962.53,959,955.36,951.6,947.74,943.76,939.67,935.47,931.17,926.75,922.23,917.59,912.84,907.98,903,897.9,892.68,887.33,881.86,876.25,870.5,866.65,7.5924,7.5498,7.3185,7.11,6.9191,6.7427,6.5785,6.4248,6.2804,6.1441,6.015,5.8925,5.776,5.6648,5.5586,5.4569,5.3594,5.2659,5.1759,5.0894,5.006,4.9256,4.848,4.773,4.7005,4.6303,4.5624,4.4966,4.4328,4.3709,4.3107,4.2524,4.1405,4.0346,3.9343,3.839,3.7484,3.6621,3.5799,3.5013,3.4262,3.3544,3.2856,3.2196,3.1562,3.0954,3.0368,2.9805,2.9263,2.8741,2.8237,2.775,2.7281,2.6827,2.6388,2.5964,2.5553,2.368,2.2065,2.0658,1.942,1.8322,1.7342,1.5668,1.4288,1000.6,1000.7,1000.42,999.8,998.89,997.72,996.32,994.69,992.87,990.87,988.69,986.35,983.85,981.21,978.43,975.51,972.46,969.29,965.99,962.58,959.05,955.41,951.65,947.78,943.81,939.72,935.52,931.22,926.81,922.28,917.65,912.9,908.04,903.06,897.96,892.74,887.4,881.93,876.32,870.58,864.69,863.05,8.0815,7.8605,7.6299,7.4199,7.2267,7.0473,6.8799,6.7229,6.575,6.4352,6.3027,6.1767,6.0567,5.9421,5.8326,5.7276,5.6269,5.5302,5.4371,5.3476,5.2612,5.1779,5.0974,5.0196,4.9444,4.8716,4.801,4.7326,4.6663,4.6019,4.5394,4.4196,4.3063,4.199,4.0971,4.0002,3.9079,3.82,3.736,3.6558,3.579,3.5055,3.435,3.3674,3.3024,3.2399,3.1798,3.1219,3.0661,3.0123,2.9604,2.9102,2.8618,2.815,2.7696,2.7258,2.526,2.3536,2.2035,2.0714,1.9543,1.8498,1.6712,1.524,1000.71,1000.8,1000.51,999.89,998.98,997.81,996.41,994.78,992.96,990.95,988.78,986.43,983.94,981.3,978.51,975.6,972.55,969.38,966.09,962.67,959.15,955.5,951.75,947.88,943.91,939.82,935.63,931.33,926.91,922.39,917.76,913.01,908.15,903.18,898.09,892.87,887.53,882.06,876.46,870.73,864.85,856.22,9.0606,8.9726,8.6921,8.4402,8.2104,7.9986,7.8019,7.6183,7.446,7.2837,7.1302,6.9847,6.8464,6.7146,6.5887,6.4683,6.353,6.2423,6.136,6.0337,5.9352,5.8403,5.7486,5.6601,5.5746,5.4918,5.4116,5.334,5.2587,5.1857,5.1148,4.9791,4.8508,4.7293,4.614,4.5044,4.4002,4.3008,4.206,4.1154,4.0288,3.9458,3.8663,3.7899,3.7167,3.6462,3.5784,3.5132,3.4503,3.3897,3.3312,3.2747,3.2201,3.1673,3.1163,3.0669,2.8419,2.6479,2.4789,2.3302,2.1985,2.0809,1.8799,1.7144,1000.81,1000.9,1000.61,999.99,999.08,997.9,996.49,994.87,993.05,991.04,988.86,986.52,984.02,981.38,978.6,975.69,972.64,969.47,966.18,962.77,959.24,955.6,951.84,947.98,944.01,939.92,935.73,931.43,927.02,922.5,917.87,913.13,908.27,903.3,898.21,893,887.67,882.2,876.61,870.87,865,852.79,849.8,10.042,9.787,9.4871,9.2165,8.9689,8.7404,8.5281,8.3296,8.1433,7.9677,7.8016,7.644,7.4942,7.3514,7.215,7.0845,6.9594,6.8394,6.7241,6.6131,6.5062,6.4031,6.3037,6.2075,6.1146,6.0247,5.9376,5.8533,5.7714,5.6921,5.5401,5.3966,5.2608,5.132,5.0097,4.8933,4.7824,4.6767,4.5756,4.479,4.3866,4.2979,4.2129,4.1313,4.0528,3.9773,3.9047,3.8347,3.7672,3.7021,3.6392,3.5785,3.5198,3.463,3.4081,3.1578,2.9421,2.7542,2.589,2.4426,2.3119,2.0886,1.9047,1000.91,1001,1000.7,1000.08,999.17,997.99,996.58,994.96,993.14,991.13,988.95,986.61,984.11,981.47,978.69,975.77,972.73,969.56,966.27,962.86,959.33,955.69,951.94,948.08,944.11,940.02,935.84,931.54,927.13,922.61,917.98,913.25,908.39,903.42,898.34,893.13,887.8,882.34,876.75,871.02,865.15,852.96,843.72,11.026,10.919,10.563,10.247,9.9596,9.6964,9.453,9.2265,9.0146,8.8155,8.6277,8.45,8.2813,8.1208,7.9678,7.8215,7.6816,7.5475,7.4187,7.2949,7.1758,7.061,6.9503,6.8434,6.7401,6.6402,6.5435,6.4499,6.3592,6.2711,6.1028,5.9439,5.7935,5.6511,5.5158,5.3872,5.2648,5.148,5.0364,4.9298,4.8278,4.73,4.6362,4.5462,4.4597,4.3765,4.2964,4.2193,4.1449,4.0732,4.004,3.9371,3.8724,3.8099,3.7494,3.4738,3.2364,3.0296,2.8478,2.6867,2.543,2.2973,2.095,1001.06,1001.14,1000.85,1000.22,999.3,998.13,996.72,995.09,993.27,991.26,989.08,986.74,984.24,981.6,978.82,975.91,972.86,969.69,966.4,963,959.47,955.83,952.08,948.22,944.26,940.18,935.99,931.7,927.29,922.78,918.15,913.42,908.57,903.61,898.53,893.32,888,882.54,876.96,871.24,865.38,853.2,840.38,835.12,12.508,12.24,11.842,11.487,11.165,10.871,10.598,10.344,10.107,9.8848,9.6749,9.4763,9.2879,9.1087,8.9378,8.7746,8.6184,8.4687,8.3251,8.187,8.0541,7.926,7.8025,7.6833,7.5681,7.4567,7.3489,7.2445,7.1433,6.9498,6.7674,6.595,6.4318,6.2769,6.1297,5.9897,5.8562,5.7288,5.607,5.4905,5.3789,5.2719,5.1693,5.0706,4.9758,4.8845,4.7966,4.7119,4.6302,4.5513,4.4752,4.4015,4.3303,4.2615,3.9479,3.6778,3.4426,3.236,3.0528,2.8894,2.6102,2.3804,1001.31,1001.39,1001.08,1000.45,999.53,998.35,996.94,995.31,993.48,991.48,989.3,986.95,984.46,981.82,979.04,976.13,973.09,969.92,966.63,963.23,959.71,956.07,952.32,948.47,944.5,940.43,936.25,931.96,927.56,923.05,918.44,913.71,908.87,903.91,898.84,893.65,888.33,882.89,877.31,871.61,865.76,853.61,840.82,827.32,821.9,15.001,14.656,14.159,13.718,13.322,12.96,12.627,12.318,12.031,11.762,11.508,11.269,11.043,10.828,10.623,10.428,10.241,10.062,9.8911,9.7265,9.5682,9.4159,9.269,9.1273,8.9904,8.8581,8.7301,8.6062,8.3697,8.1471,7.9371,7.7385,7.5503,7.3716,7.2017,7.0399,6.8856,6.7383,6.5974,6.4625,6.3333,6.2093,6.0903,5.9759,5.8658,5.7599,5.6578,5.5593,5.4643,5.3726,5.284,5.1983,5.1154,4.7382,4.4136,4.131,3.8828,3.6629,3.4667,3.1316,2.8558,1001.57,1001.63,1001.32,1000.68,999.76,998.58,997.16,995.53,993.7,991.69,989.51,987.17,984.68,982.04,979.26,976.35,973.31,970.14,966.86,963.46,959.94,956.31,952.56,948.71,944.75,940.68,936.51,932.22,927.83,923.33,918.72,914,909.16,904.21,899.15,893.97,888.66,883.23,877.67,871.97,866.13,854.02,841.26,827.8,813.53,809.74,17.526,17.019,16.424,15.899,15.428,15.001,14.609,14.246,13.909,13.595,13.299,13.02,12.757,12.507,12.269,12.043,11.826,11.62,11.421,11.231,11.048,10.872,10.703,10.539,10.381,10.229,10.081,9.8001,9.536,9.2871,9.0521,8.8297,8.6189,8.4185,8.2279,8.0463,7.8729,7.7073,7.5488,7.397,7.2515,7.1118,6.9776,6.8486,6.7244,6.6048,6.4895,6.3782,6.2708,6.1671,6.0668,5.9698,5.5288,5.1494,4.8193,4.5294,4.2728,4.0438,3.6528,3.331,1001.82,1001.88,1001.56,1000.92,999.99,998.8,997.38,995.75,993.92,991.91,989.73,987.39,984.89,982.26,979.48,976.57,973.53,970.37,967.09,963.69,960.17,956.54,952.8,948.96,945,940.93,936.76,932.48,928.1,923.6,919,914.28,909.46,904.52,899.46,894.29,888.99,883.57,878.02,872.33,866.51,854.42,841.7,828.28,814.06,798.92,798.37,20.09,19.314,18.624,18.019,17.477,16.987,16.538,16.123,15.739,15.38,15.044,14.727,14.428,14.144,13.875,13.618,13.373,13.139,12.915,12.7,12.493,12.295,12.103,11.919,11.741,11.568,11.241,10.934,10.645,10.373,10.115,9.8716,9.6402,9.4202,9.2107,9.0109,8.8202,8.6377,8.4631,8.2958,8.1352,7.9811,7.8328,7.6903,7.553,7.4206,7.293,7.1699,7.0509,6.936,6.8248,6.3195,5.8852,5.5075,5.176,4.8825,4.6207,4.1738,3.806,1002.07,1002.12,1001.79,1001.15,1000.21,999.02,997.6,995.97,994.14,992.13,989.95,987.6,985.11,982.47,979.7,976.79,973.75,970.59,967.31,963.91,960.4,956.78,953.04,949.2,945.25,941.19,937.02,932.75,928.36,923.88,919.28,914.57,909.75,904.82,899.77,894.61,889.32,883.91,878.37,872.7,866.89,854.83,842.14,828.75,814.58,799.51,787.62,22.697,22.435,21.528,20.753,20.072,19.464,18.913,18.41,17.947,17.517,17.117,16.741,16.388,16.054,15.739,15.439,15.153,14.881,14.621,14.372,14.133,13.904,13.683,13.471,13.266,13.068,12.693,12.342,12.012,11.701,11.407,11.13,10.867,10.617,10.379,10.152,9.936,9.7294,9.5316,9.3422,9.1605,8.9861,8.8186,8.6574,8.5023,8.3528,8.2087,8.0697,7.9355,7.8057,7.6803,7.1106,6.6211,6.1957,5.8224,5.492,5.1974,4.6945,4.2808,1002.32,1002.36,1002.03,1001.38,1000.44,999.25,997.82,996.19,994.36,992.34,990.16,987.82,985.33,982.69,979.92,977.01,973.97,970.82,967.54,964.14,960.63,957.01,953.28,949.44,945.49,941.44,937.28,933.01,928.63,924.15,919.56,914.86,910.05,905.12,900.08,894.93,889.65,884.25,878.72,873.06,867.26,855.23,842.58,829.23,815.1,800.09,784.03,777.37,25.351,24.651,23.655,22.802,22.053,21.383,20.777,20.224,19.714,19.242,18.802,18.39,18.002,17.636,17.29,16.961,16.648,16.35,16.065,15.792,15.53,15.279,15.038,14.805,14.581,14.156,13.759,13.386,13.036,12.706,12.394,12.098,11.818,11.551,11.297,11.055,10.824,10.602,10.391,10.188,9.9929,9.8058,9.6259,9.4528,9.2861,9.1254,8.9703,8.8207,8.6761,8.5364,7.9018,7.3571,6.8838,6.4687,6.1014,5.7739,5.2151,4.7554,1002.57,1002.61,1002.27,1001.61,1000.67,999.47,998.04,996.4,994.57,992.56,990.38,988.04,985.54,982.91,980.13,977.23,974.19,971.04,967.76,964.37,960.87,957.25,953.52,949.68,945.74,941.69,937.53,933.27,928.9,924.42,919.84,915.14,910.34,905.42,900.39,895.24,889.98,884.58,879.07,873.42,867.63,855.63,843.01,829.7,815.62,800.66,784.67,767.52,28.057,28.052,26.762,25.691,24.769,23.958,23.233,22.576,21.977,21.425,20.913,20.436,19.989,19.569,19.173,18.797,18.441,18.102,17.779,17.471,17.175,16.892,16.62,16.358,16.107,15.63,15.185,14.769,14.379,14.011,13.663,13.335,13.023,12.727,12.445,12.177,11.921,11.676,11.441,11.217,11.001,10.795,10.596,10.404,10.22,10.043,9.8718,9.7066,9.5471,9.393,8.6933,8.0931,7.5719,7.1148,6.7106,6.3502,5.7354,5.2298,1002.82,1002.85,1002.5,1001.84,1000.89,999.69,998.26,996.62,994.79,992.78,990.59,988.25,985.76,983.12,980.35,977.45,974.42,971.26,967.99,964.6,961.1,957.48,953.76,949.93,945.99,941.94,937.79,933.53,929.16,924.69,920.11,915.43,910.63,905.72,900.7,895.56,890.3,884.92,879.41,873.78,868,856.03,843.44,830.17,816.14,801.23,785.32,768.19,758,30.818,30.121,28.767,27.632,26.652,25.786,25.012,24.31,23.668,23.077,22.529,22.018,21.539,21.088,20.663,20.261,19.879,19.516,19.17,18.839,18.522,18.218,17.926,17.646,17.116,16.622,16.161,15.729,15.322,14.939,14.576,14.233,13.907,13.597,13.302,13.02,12.751,12.494,12.248,12.011,11.785,11.567,11.357,11.156,10.961,10.774,10.593,10.419,10.25,9.485,8.8291,8.2599,7.7609,7.3196,6.9264,6.2555,5.704,1003.07,1003.09,1002.74,1002.07,1001.12,999.91,998.48,996.84,995.01,992.99,990.81,988.47,985.97,983.34,980.57,977.67,974.64,971.48,968.21,964.83,961.33,957.72,954,950.17,946.23,942.19,938.04,933.79,929.43,924.96,920.39,915.71,910.92,906.02,901.01,895.88,890.63,885.26,879.76,874.13,868.37,856.43,843.87,830.64,816.65,801.8,785.95,768.91,750.41,748.75,33.64,32.072,30.668,29.481,28.45,27.538,26.72,25.978,25.298,24.672,24.09,23.547,23.039,22.561,22.109,21.682,21.276,20.89,20.521,20.169,19.832,19.509,19.199,18.613,18.069,17.561,17.086,16.64,16.22,15.823,15.447,15.091,14.752,14.43,14.123,13.829,13.549,13.281,13.023,12.776,12.539,12.311,12.092,11.881,11.677,11.481,11.291,11.108,10.277,9.5652,8.9478,8.4068,7.9284,7.5023,6.7754,6.1779,1003.32,1003.33,1002.98,1002.3,1001.34,1000.14,998.7,997.06,995.22,993.21,991.02,988.68,986.19,983.56,980.79,977.88,974.86,971.71,968.44,965.05,961.56,957.95,954.23,950.41,946.48,942.44,938.3,934.05,929.69,925.24,920.67,916,911.21,906.32,901.31,896.19,890.95,885.59,880.11,874.49,868.74,856.82,844.3,831.11,817.16,802.37,786.59,769.63,751.25,739.72,36.525,35.659,33.907,32.466,31.238,30.166,29.215,28.359,27.581,26.868,26.209,25.597,25.026,24.491,23.987,23.51,23.06,22.631,22.224,21.835,21.463,21.107,20.765,20.122,19.526,18.971,18.452,17.965,17.507,17.074,16.666,16.279,15.911,15.561,15.228,14.91,14.606,14.315,14.037,13.77,13.513,13.267,13.029,12.801,12.581,12.369,12.164,11.966,11.069,10.301,9.6357,9.0525,8.5371,8.078,7.2951,6.6517,1003.57,1003.57,1003.21,1002.53,1001.57,1000.36,998.92,997.28,995.44,993.42,991.24,988.9,986.41,983.77,981,978.1,975.08,971.93,968.66,965.28,961.79,958.18,954.47,950.65,946.72,942.69,938.55,934.31,929.96,925.51,920.95,916.28,911.5,906.62,901.62,896.51,891.28,885.93,880.45,874.85,869.11,857.22,844.73,831.57,817.67,802.93,787.22,770.35,752.07,732.02,730.88,39.479,37.394,35.634,34.167,32.907,31.802,30.818,29.93,29.121,28.378,27.691,27.052,26.455,25.894,25.367,24.868,24.395,23.946,23.519,23.11,22.72,22.347,21.644,20.993,20.389,19.825,19.296,18.799,18.331,17.889,17.47,17.073,16.695,16.336,15.993,15.665,15.352,15.052,14.764,14.488,14.223,13.968,13.722,13.486,13.257,13.037,12.825,11.862,11.038,10.323,9.6981,9.1456,8.6535,7.8145,7.1252,1003.82,1003.82,1003.45,1002.76,1001.8,1000.58,999.14,997.49,995.65,993.64,991.45,989.11,986.62,983.99,981.22,978.32,975.3,972.15,968.89,965.51,962.02,958.42,954.71,950.89,946.97,942.94,938.8,934.57,930.22,925.78,921.22,916.56,911.79,906.92,901.93,896.82,891.6,886.26,880.79,875.2,869.48,857.61,845.15,832.03,818.18,803.49,787.84,771.05,752.88,732.98,722.2,42.507,41.188,39.016,37.258,35.775,34.493,33.361,32.35,31.434,30.599,29.83,29.117,28.454,27.834,27.251,26.702,26.182,25.69,25.222,24.776,24.35,23.942,23.177,22.471,21.816,21.205,20.634,20.098,19.593,19.117,18.666,18.239,17.833,17.446,17.078,16.727,16.39,16.069,15.76,15.465,15.18,14.907,14.644,14.391,14.147,13.911,13.684,12.654,11.774,11.011,10.344,9.7539,9.2288,8.3338,7.5986,1004.32,1004.3,1003.91,1003.22,1002.25,1001.02,999.58,997.93,996.08,994.07,991.88,989.54,987.05,984.42,981.65,978.76,975.74,972.59,969.34,965.96,962.48,958.88,955.18,951.37,947.45,943.43,939.31,935.08,930.75,926.31,921.77,917.13,912.37,907.51,902.53,897.45,892.24,886.92,881.48,875.91,870.21,858.4,846,832.95,819.19,804.6,789.08,772.45,754.49,734.86,713.07,705.16,48.804,46.625,44.036,41.962,40.228,38.736,37.428,36.263,35.212,34.256,33.378,32.567,31.813,31.11,30.45,29.829,29.243,28.687,28.16,27.658,27.179,26.283,25.46,24.698,23.991,23.331,22.713,22.133,21.586,21.07,20.581,20.117,19.676,19.256,18.856,18.473,18.108,17.757,17.421,17.099,16.789,16.491,16.204,15.928,15.661,15.404,14.24,13.246,12.387,11.634,10.97,10.379,9.3716,8.5446,1004.82,1004.78,1004.38,1003.68,1002.69,1001.47,1000.02,998.36,996.52,994.49,992.31,989.97,987.48,984.85,982.08,979.19,976.17,973.04,969.78,966.41,962.93,959.34,955.65,951.85,947.94,943.93,939.81,935.6,931.28,926.85,922.32,917.69,912.95,908.1,903.14,898.07,892.88,887.58,882.16,876.61,870.94,859.18,846.84,833.87,820.18,805.7,790.3,773.83,756.07,736.71,715.29,691.04,688.42,55.463,51.894,48.913,46.539,44.564,42.873,41.394,40.081,38.9,37.827,36.844,35.937,35.096,34.312,33.578,32.887,32.236,31.619,31.034,30.478,29.441,28.493,27.619,26.809,26.057,25.353,24.694,24.074,23.49,22.937,22.414,21.917,21.444,20.994,20.564,20.153,19.76,19.383,19.022,18.675,18.342,18.021,17.712,17.414,17.126,15.827,14.719,13.761,12.924,12.185,11.528,10.409,9.4897,1005.32,1005.26,1004.85,1004.13,1003.14,1001.91,1000.45,998.79,996.94,994.92,992.73,990.39,987.9,985.28,982.51,979.62,976.61,973.48,970.23,966.86,963.39,959.81,956.12,952.32,948.42,944.42,940.32,936.11,931.8,927.38,922.87,918.25,913.52,908.69,903.74,898.69,893.52,888.24,882.84,877.31,871.66,859.95,847.67,834.77,821.17,806.79,791.51,775.19,757.62,738.52,717.45,693.72,671.81,62.541,61.447,56.931,53.602,50.955,48.758,46.881,45.243,43.79,42.486,41.302,40.219,39.221,38.297,37.435,36.629,35.872,35.158,34.482,33.842,32.654,31.571,30.578,29.661,28.811,28.018,27.277,26.581,25.926,25.308,24.723,24.169,23.642,23.14,22.662,22.206,21.769,21.351,20.95,20.565,20.196,19.84,19.498,19.168,18.85,17.415,16.192,15.136,14.214,13.4,12.676,11.445,10.434,1005.81,1005.74,1005.32,1004.59,1003.59,1002.35,1000.89,999.22,997.37,995.35,993.16,990.82,988.33,985.7,982.94,980.06,977.05,973.92,970.67,967.31,963.84,960.27,956.59,952.8,948.91,944.91,940.82,936.62,932.32,927.92,923.41,918.8,914.09,909.27,904.34,899.31,894.16,888.89,883.51,878,872.37,860.72,848.5,835.67,822.15,807.86,792.71,776.53,759.15,740.28,719.55,696.31,669.5,655.18,70.106,66.572,61.69,58.068,55.185,52.791,50.746,48.961,47.38,45.961,44.674,43.497,42.413,41.41,40.475,39.601,38.78,38.006,37.275,35.923,34.697,33.577,32.547,31.594,30.708,29.882,29.107,28.379,27.694,27.046,26.432,25.849,25.296,24.768,24.265,23.784,23.324,22.883,22.46,22.054,21.663,21.287,20.925,20.577,19.003,17.665,16.511,15.503,14.614,13.824,12.48,11.378,1006.31,1006.22,1005.78,1005.04,1004.04,1002.79,1001.32,999.65,997.8,995.77,993.58,991.24,988.76,986.13,983.37,980.49,977.48,974.36,971.11,967.76,964.3,960.73,957.05,953.27,949.39,945.4,941.32,937.13,932.84,928.45,923.95,919.36,914.66,909.85,904.94,899.92,894.79,889.54,884.18,878.69,873.09,861.48,849.32,836.55,823.12,808.93,793.89,777.85,760.65,742.02,721.6,698.82,672.72,641.4,638.37,78.245,71.282,66.144,62.292,59.212,56.649,54.455,52.54,50.843,49.318,47.936,46.672,45.509,44.431,43.428,42.489,41.609,40.779,39.251,37.873,36.618,35.468,34.408,33.424,32.509,31.653,30.85,30.094,29.381,28.707,28.067,27.46,26.882,26.331,25.805,25.302,24.82,24.358,23.915,23.489,23.079,22.685,22.305,20.593,19.139,17.885,16.791,15.827,14.971,13.514,12.32,1006.8,1006.7,1006.25,1005.5,1004.48,1003.23,1001.75,1000.08,998.23,996.2,994.01,991.67,989.18,986.56,983.8,980.92,977.91,974.79,971.56,968.21,964.75,961.19,957.52,953.74,949.87,945.89,941.81,937.63,933.36,928.98,924.49,919.91,915.22,910.43,905.54,900.53,895.42,890.19,884.84,879.38,873.8,862.24,850.14,837.44,824.08,809.98,795.05,779.16,762.12,743.72,723.6,701.25,675.8,645.65,621.22,87.069,83.356,75.577,70.284,66.264,63.028,60.323,58.003,55.974,54.173,52.554,51.086,49.743,48.505,47.359,46.292,45.294,44.357,42.64,41.098,39.701,38.425,37.252,36.166,35.158,34.218,33.337,32.509,31.729,30.993,30.295,29.633,29.003,28.404,27.831,27.285,26.762,26.261,25.78,25.318,24.874,24.447,24.035,22.183,20.612,19.259,18.079,17.04,16.117,14.548,13.262,1007.29,1007.17,1006.71,1005.95,1004.93,1003.66,1002.19,1000.51,998.65,996.62,994.43,992.09,989.6,986.98,984.23,981.35,978.35,975.23,972,968.65,965.2,961.64,957.98,954.21,950.35,946.38,942.31,938.14,933.87,929.5,925.03,920.46,915.79,911.01,906.13,901.14,896.04,890.83,885.51,880.06,874.5,862.99,850.95,838.31,825.03,811.03,796.2,780.44,763.58,745.39,725.55,703.6,678.77,649.64,613.07,603.52,96.727,87.1,79.476,74.115,69.984,66.63,63.812,61.387,59.26,57.368,55.666,54.121,52.706,51.402,50.193,49.067,48.014,46.092,44.376,42.828,41.419,40.127,38.935,37.831,36.802,35.841,34.939,34.091,33.29,32.533,31.815,31.132,30.483,29.864,29.273,28.708,28.167,27.648,27.15,26.671,26.211,25.768,23.774,22.085,20.632,19.366,18.251,17.262,15.58,14.203,1007.78,1007.65,1007.17,1006.4,1005.37,1004.1,1002.62,1000.94,999.08,997.04,994.85,992.51,990.03,987.4,984.65,981.78,978.78,975.66,972.44,969.1,965.65,962.1,958.44,954.68,950.82,946.86,942.8,938.64,934.38,930.03,925.57,921.01,916.35,911.58,906.72,901.74,896.66,891.47,886.17,880.74,875.2,863.74,851.75,839.18,825.97,812.06,797.34,781.71,765.01,747.02,727.46,705.89,681.61,653.41,618.7,584.99,107.42,102.4,90.407,83.012,77.652,73.457,70.021,67.117,64.606,62.398,60.429,58.654,57.04,55.561,54.197,52.931,51.752,49.61,47.708,45.999,44.45,43.034,41.731,40.527,39.407,38.363,37.385,36.465,35.599,34.78,34.005,33.269,32.57,31.903,31.267,30.659,30.078,29.52,28.985,28.472,27.978,27.502,25.366,23.559,22.005,20.652,19.462,18.406,16.612,15.143,1008.27,1008.12,1007.63,1006.85,1005.81,1004.54,1003.05,1001.37,999.5,997.47,995.27,992.93,990.45,987.83,985.08,982.2,979.21,976.1,972.87,969.54,966.1,962.55,958.9,955.15,951.3,947.35,943.3,939.15,934.9,930.55,926.1,921.55,916.91,912.16,907.3,902.35,897.28,892.11,886.82,881.42,875.9,864.49,852.55,840.04,826.91,813.08,798.47,782.96,766.42,748.63,729.33,708.12,684.36,656.98,623.85,579.05,565.21,119.46,104.12,93.345,86.222,80.914,76.697,73.209,70.241,67.664,65.389,63.356,61.519,59.846,58.31,56.892,55.575,53.197,51.096,49.217,47.519,45.973,44.555,43.246,42.033,40.902,39.845,38.853,37.919,37.038,36.205,35.414,34.663,33.948,33.266,32.615,31.992,31.396,30.823,30.274,29.746,29.238,26.959,25.033,23.378,21.938,20.673,19.55,17.643,16.082,1008.76,1008.59,1008.09,1007.3,1006.25,1004.97,1003.48,1001.79,999.92,997.89,995.69,993.35,990.87,988.25,985.5,982.63,979.64,976.53,973.31,969.98,966.55,963.01,959.36,955.62,951.77,947.83,943.79,939.65,935.41,931.07,926.63,922.1,917.46,912.73,907.89,902.95,897.9,892.74,887.47,882.09,876.59,865.23,853.34,840.9,827.84,814.09,799.58,784.2,767.81,750.21,731.16,710.29,687.01,660.39,628.61,587.2,543.54,133.3,123.29,105.78,95.974,89.143,83.924,79.716,76.202,73.193,70.566,68.239,66.152,64.263,62.538,60.953,59.488,56.854,54.541,52.481,50.628,48.945,47.406,45.989,44.678,43.459,42.321,41.254,40.251,39.306,38.413,37.566,36.763,35.999,35.27,34.575,33.911,33.274,32.665,32.08,31.517,30.977,28.553,26.506,24.75,23.224,21.882,20.693,18.673,17.021,1009.25,1009.07,1008.55,1007.75,1006.69,1005.41,1003.91,1002.22,1000.35,998.31,996.11,993.77,991.29,988.67,985.92,983.05,980.07,976.96,973.75,970.42,966.99,963.46,959.82,956.08,952.25,948.31,944.28,940.14,935.91,931.59,927.16,922.64,918.02,913.29,908.47,903.54,898.51,893.37,888.12,882.76,877.28,865.96,854.13,841.75,828.76,815.1,800.68,785.42,769.17,751.77,732.95,712.4,689.58,663.64,633.06,594.3,533.69,519,149.76,121.66,107.34,98.345,91.81,86.704,82.531,79.013,75.979,73.318,70.95,68.821,66.889,65.121,63.494,60.585,58.044,55.794,53.777,51.951,50.286,48.757,47.344,46.034,44.812,43.668,42.595,41.584,40.63,39.727,38.87,38.055,37.28,36.54,35.833,35.157,34.509,33.887,33.291,32.717,30.147,27.98,26.122,24.509,23.091,21.834,19.702,17.958,1009.74,1009.54,1009.01,1008.2,1007.13,1005.84,1004.34,1002.64,1000.77,998.73,996.53,994.19,991.71,989.09,986.35,983.48,980.49,977.39,974.18,970.86,967.44,963.91,960.28,956.55,952.72,948.79,944.76,940.64,936.42,932.1,927.69,923.18,918.57,913.86,909.05,904.14,899.12,894,888.77,883.42,877.97,866.69,854.91,842.59,829.67,816.09,801.78,786.63,770.52,753.29,734.71,714.46,692.06,666.76,637.23,600.64,548.01,490.19,170.5,144.44,121.07,108.81,100.5,94.255,89.278,85.158,81.652,78.609,75.926,73.53,71.368,69.401,67.598,64.392,61.609,59.156,56.966,54.991,53.194,51.548,50.032,48.626,47.318,46.096,44.95,43.873,42.856,41.895,40.983,40.118,39.294,38.509,37.759,37.043,36.356,35.698,35.066,34.459,31.742,29.454,27.494,25.793,24.299,22.975,20.73,18.895,1010.71,1010.48,1009.93,1009.09,1008.01,1006.7,1005.19,1003.49,1001.61,999.56,997.37,995.02,992.54,989.93,987.19,984.32,981.35,978.25,975.05,971.74,968.32,964.81,961.19,957.47,953.66,949.74,945.73,941.63,937.43,933.13,928.74,924.25,919.67,914.98,910.2,905.32,900.33,895.24,890.05,884.74,879.32,868.14,856.46,844.25,831.47,818.05,803.92,789,773.17,756.28,738.13,718.44,696.82,672.65,644.91,611.67,568.14,492.96,369.77,274.16,163.31,135.52,121.13,111.48,104.28,98.582,93.886,89.907,86.465,83.439,80.744,78.319,76.116,72.245,68.929,66.034,63.471,61.175,59.099,57.206,55.469,53.865,52.378,50.992,49.696,48.479,47.334,46.253,45.23,44.26,43.339,42.461,41.624,40.824,40.059,39.326,38.623,37.948,34.934,32.401,30.236,28.359,26.713,25.255,22.784,20.765,1012.15,1011.88,1011.29,1010.43,1009.32,1007.99,1006.46,1004.75,1002.86,1000.81,998.61,996.27,993.79,991.17,988.44,985.59,982.61,979.53,976.34,973.05,969.65,966.14,962.54,958.85,955.05,951.16,947.18,943.1,938.93,934.66,930.3,925.85,921.3,916.65,911.91,907.07,902.13,897.09,891.94,886.69,881.33,870.28,858.75,846.71,834.12,820.92,807.06,792.46,777.01,760.59,743.02,724.09,703.49,680.74,655.13,625.45,589.31,540.46,450.82,215.18,166.54,145.28,131.94,122.36,114.96,108.98,103.98,99.701,95.976,92.686,89.744,84.67,80.411,76.752,73.555,70.72,68.18,65.881,63.785,61.861,60.084,58.437,56.901,55.465,54.117,52.848,51.651,50.518,49.443,48.421,47.449,46.521,45.635,44.787,43.975,43.196,39.726,36.822,34.346,32.204,30.327,28.668,25.858,23.565,1014.54,1014.19,1013.54,1012.63,1011.48,1010.12,1008.57,1006.83,1004.93,1002.87,1000.67,998.32,995.84,993.24,990.51,987.67,984.71,981.65,978.47,975.2,971.82,968.35,964.78,961.11,957.35,953.5,949.56,945.52,941.39,937.17,932.86,928.46,923.97,919.39,914.71,909.94,905.07,900.11,895.05,889.88,884.62,873.76,862.46,850.69,838.4,825.56,812.1,797.98,783.1,767.37,750.66,732.8,713.58,692.69,669.7,643.95,614.39,579.09,533.93,468.81,357.43,251.2,203.24,177.41,160.6,148.43,139.02,131.44,125.12,119.74,115.07,107.3,101.01,95.763,91.279,87.377,83.931,80.854,78.078,75.553,73.242,71.112,69.141,67.307,65.594,63.99,62.481,61.058,59.714,58.44,57.23,56.079,54.982,53.935,52.934,51.976,47.725,44.189,41.187,38.598,36.335,34.338,30.964,28.214,1016.9,1016.48,1015.77,1014.81,1013.63,1012.23,1010.65,1008.9,1006.98,1004.91,1002.7,1000.35,997.88,995.28,992.56,989.73,986.78,983.73,980.58,977.33,973.97,970.53,966.98,963.35,959.62,955.8,951.9,947.9,943.82,939.64,935.38,931.04,926.6,922.07,917.46,912.75,907.95,903.06,898.08,893,887.82,877.15,866.07,854.54,842.53,830,816.92,803.23,788.85,773.73,757.74,740.78,722.67,703.22,682.13,659.01,633.29,604.08,569.94,528.27,474.97,404.09,324.28,264.55,226.65,201.73,184.04,170.68,160.13,151.49,144.25,132.64,123.62,116.31,110.21,105,100.48,96.48,92.916,89.704,86.786,84.118,81.662,79.391,77.28,75.31,73.466,71.733,70.1,68.557,67.097,65.71,64.392,63.136,61.937,60.792,55.734,51.552,48.015,44.974,42.322,39.986,36.046,32.841,1019.23,1018.74,1017.98,1016.97,1015.75,1014.32,1012.72,1010.94,1009.01,1006.93,1004.72,1002.37,999.89,997.3,994.58,991.76,988.83,985.8,982.66,979.43,976.1,972.68,969.16,965.55,961.86,958.07,954.2,950.25,946.2,942.08,937.86,933.56,929.18,924.71,920.15,915.51,910.77,905.95,901.04,896.04,890.94,880.46,869.57,858.27,846.52,834.29,821.54,808.23,794.31,779.72,764.36,748.16,730.98,712.68,693.06,671.86,648.73,623.2,594.56,561.77,523.34,477.69,423.72,364.47,311.6,270.89,241.08,219,202.11,188.73,177.84,160.99,148.39,138.49,130.4,123.62,117.82,112.76,108.29,104.3,100.71,97.442,94.454,91.705,89.162,86.799,84.595,82.531,80.592,78.765,77.04,75.407,73.857,72.383,70.979,69.64,63.75,58.907,54.827,51.33,48.288,45.611,41.105,37.446,1021.54,1020.98,1020.16,1019.11,1017.85,1016.39,1014.76,1012.97,1011.02,1008.93,1006.71,1004.36,1001.88,999.29,996.59,993.77,990.86,987.84,984.72,981.5,978.2,974.8,971.31,967.73,964.06,960.31,956.48,952.56,948.55,944.47,940.3,936.05,931.71,927.29,922.79,918.21,913.54,908.78,903.94,899.01,893.99,883.67,872.98,861.89,850.38,838.42,825.98,813.03,799.51,785.39,770.59,755.04,738.65,721.3,702.86,683.14,661.92,638.91,613.71,585.8,554.49,519.03,478.95,434.49,387.47,343,305.12,274.61,250.49,231.32,215.84,192.39,175.36,162.29,151.83,143.22,135.93,129.66,124.18,119.33,114.99,111.06,107.5,104.23,101.23,98.443,95.855,93.441,91.179,89.054,87.052,85.161,83.369,81.669,80.053,78.513,71.769,66.251,61.623,57.665,54.229,51.212,46.141,42.03,1023.82,1023.2,1022.32,1021.22,1019.92,1018.44,1016.79,1014.97,1013.01,1010.92,1008.69,1006.33,1003.86,1001.27,998.57,995.77,992.86,989.85,986.75,983.56,980.27,976.89,973.43,969.88,966.24,962.52,958.72,954.83,950.87,946.82,942.7,938.49,934.2,929.83,925.39,920.86,916.25,911.55,906.78,901.92,896.97,886.82,876.3,865.41,854.12,842.41,830.26,817.63,804.48,790.78,776.48,761.5,745.79,729.25,711.78,693.25,673.51,652.36,629.57,604.83,577.79,548.02,515.23,479.47,441.31,402.04,364.24,330.34,301.33,277.13,257.07,226.41,204.3,187.59,174.43,163.72,154.78,147.16,140.55,134.75,129.59,124.96,120.77,116.95,113.45,110.22,107.23,104.45,101.85,99.412,97.121,94.962,92.921,90.987,89.151,87.405,79.785,73.583,68.399,63.977,60.147,56.788,51.153,46.59,1028.3,1027.56,1026.58,1025.39,1024.02,1022.48,1020.77,1018.92,1016.94,1014.82,1012.58,1010.22,1007.74,1005.16,1002.48,999.69,996.8,993.82,990.75,987.59,984.34,981.01,977.59,974.09,970.51,966.85,963.11,959.29,955.4,951.43,947.38,943.26,939.06,934.79,930.44,926.02,921.52,916.94,912.29,907.56,902.74,892.88,882.69,872.17,861.28,850.03,838.38,826.32,813.83,800.86,787.39,773.38,758.78,743.54,727.6,710.88,693.31,674.8,655.22,634.47,612.42,588.91,563.83,537.13,508.91,479.51,449.46,419.48,390.48,363.36,338.73,297.47,265.79,241.42,222.29,206.91,194.24,183.59,174.48,166.57,159.62,153.44,147.89,142.87,138.31,134.12,130.27,126.7,123.38,120.29,117.39,114.67,112.1,109.68,107.39,105.22,95.794,88.195,81.884,76.528,71.906,67.864,61.103,55.644,1032.69,1031.82,1030.75,1029.48,1028.03,1026.43,1024.69,1022.8,1020.79,1018.65,1016.39,1014.03,1011.55,1008.98,1006.3,1003.53,1000.66,997.71,994.66,991.54,988.32,985.03,981.65,978.2,974.67,971.07,967.39,963.63,959.8,955.9,951.93,947.89,943.77,939.59,935.33,931,926.6,922.13,917.59,912.97,908.29,898.69,888.8,878.59,868.06,857.21,846,834.44,822.49,810.14,797.36,784.13,770.42,756.19,741.41,726.03,710.01,693.29,675.83,657.55,638.41,618.35,597.32,575.3,552.3,528.42,503.89,478.99,454.1,429.62,405.97,362.69,326.02,295.95,271.52,251.58,235.09,221.25,209.46,199.29,190.39,182.53,175.53,169.23,163.52,158.31,153.54,149.14,145.06,141.28,137.74,134.43,131.32,128.4,125.63,123.01,111.74,102.72,95.266,88.97,83.556,78.832,70.953,64.606,1036.98,1036,1034.83,1033.48,1031.97,1030.32,1028.53,1026.61,1024.56,1022.41,1020.14,1017.77,1015.29,1012.72,1010.05,1007.29,1004.45,1001.51,998.5,995.4,992.22,988.96,985.63,982.22,978.73,975.18,971.55,967.86,964.09,960.25,956.35,952.38,948.34,944.24,940.06,935.82,931.52,927.14,922.7,918.2,913.62,904.27,894.64,884.72,874.52,864.01,853.19,842.06,830.58,818.76,806.57,793.99,781.01,767.6,753.73,739.39,724.54,709.16,693.21,676.66,659.49,641.66,623.17,604.01,584.18,563.74,542.77,521.4,499.84,478.3,457.04,416.25,379.14,346.66,318.94,295.53,275.77,259.01,244.66,232.25,221.41,211.85,203.36,195.73,188.85,182.6,176.88,171.62,166.77,162.27,158.08,154.17,150.5,147.06,143.81,140.74,127.58,117.12,108.53,101.29,95.087,89.687,80.698,73.475,1041.17,1040.09,1038.83,1037.41,1035.84,1034.13,1032.3,1030.34,1028.27,1026.1,1023.82,1021.44,1018.96,1016.39,1013.73,1010.99,1008.15,1005.24,1002.25,999.18,996.03,992.81,989.51,986.14,982.7,979.2,975.62,971.98,968.27,964.49,960.65,956.75,952.78,948.75,944.66,940.5,936.28,931.99,927.65,923.24,918.77,909.63,900.24,890.59,880.67,870.48,860.01,849.25,838.19,826.83,815.14,803.12,790.75,778.02,764.9,751.4,737.48,723.14,708.34,693.08,677.35,661.13,644.41,627.2,609.51,591.38,572.83,553.96,534.86,515.67,496.53,459.05,423.6,391.13,362.16,336.78,314.76,295.7,279.17,264.77,252.13,240.96,231.02,222.11,214.07,206.77,200.11,194,188.37,183.15,178.31,173.79,169.56,165.59,161.86,158.34,143.29,131.39,121.65,113.48,106.49,100.42,90.337,82.249,1045.28,1044.1,1042.75,1041.26,1039.63,1037.87,1036,1034.01,1031.92,1029.72,1027.43,1025.04,1022.56,1020,1017.34,1014.61,1011.79,1008.9,1005.93,1002.88,999.76,996.57,993.31,989.98,986.58,983.12,979.59,976,972.34,968.63,964.85,961,957.1,953.14,949.12,945.04,940.9,936.7,932.44,928.12,923.74,914.81,905.64,896.22,886.57,876.66,866.5,856.08,845.39,834.42,823.17,811.63,799.79,787.63,775.15,762.34,749.18,735.67,721.8,707.56,692.93,677.92,662.53,646.77,630.63,614.16,597.37,580.32,563.06,545.68,528.28,493.8,460.51,429.16,400.29,374.21,350.95,330.38,312.23,296.21,282.04,269.44,258.18,248.07,238.94,230.64,223.07,216.12,209.73,203.81,198.32,193.2,188.42,183.93,179.72,175.75,158.82,145.5,134.63,125.53,117.77,111.03,99.867,90.926,1053.22,1051.87,1050.37,1048.75,1047,1045.15,1043.2,1041.15,1039.01,1036.78,1034.46,1032.06,1029.58,1027.01,1024.37,1021.66,1018.87,1016.01,1013.08,1010.08,1007.01,1003.88,1000.68,997.42,994.1,990.72,987.28,983.77,980.22,976.6,972.93,969.2,965.42,961.58,957.69,953.74,949.74,945.69,941.59,937.43,933.22,924.65,915.86,906.87,897.67,888.26,878.63,868.78,858.72,848.43,837.91,827.16,816.18,804.95,793.48,781.77,769.8,757.57,745.09,732.35,719.35,706.1,692.59,678.84,664.85,650.64,636.23,621.65,606.92,592.08,577.19,547.42,518.08,489.65,462.55,437.09,413.47,391.78,372.01,354.07,337.84,323.15,309.84,297.76,286.77,276.73,267.54,259.08,251.28,244.06,237.35,231.1,225.26,219.79,214.66,209.82,189.26,173.15,160.08,149.17,139.89,131.86,118.59,107.99,1060.84,1059.33,1057.7,1055.96,1054.12,1052.18,1050.16,1048.06,1045.87,1043.6,1041.26,1038.84,1036.35,1033.79,1031.16,1028.46,1025.7,1022.86,1019.97,1017.01,1013.99,1010.91,1007.77,1004.57,1001.32,998,994.64,991.22,987.75,984.22,980.64,977.01,973.34,969.61,965.83,962,958.13,954.21,950.24,946.22,942.16,933.9,925.45,916.81,908,899,889.81,880.45,870.89,861.16,851.23,841.11,830.81,820.31,809.62,798.73,787.65,776.38,764.92,753.26,741.41,729.38,717.17,704.79,692.24,679.53,666.69,653.72,640.65,627.5,614.3,587.85,561.58,535.78,510.76,486.77,464.01,442.61,422.65,404.12,386.99,371.22,356.7,343.35,331.06,319.74,309.29,299.62,290.67,282.34,274.59,267.35,260.58,254.23,248.25,242.62,218.7,199.96,184.78,172.15,161.42,152.15,136.85,124.65,1068.15,1066.51,1064.76,1062.92,1060.99,1058.98,1056.89,1054.73,1052.5,1050.21,1047.84,1045.41,1042.91,1040.35,1037.73,1035.04,1032.3,1029.49,1026.63,1023.7,1020.72,1017.69,1014.6,1011.46,1008.26,1005.01,1001.72,998.37,994.97,991.52,988.03,984.49,980.91,977.28,973.6,969.88,966.12,962.31,958.46,954.56,950.63,942.64,934.48,926.15,917.67,909.02,900.22,891.26,882.14,872.86,863.42,853.82,844.07,834.16,824.09,813.87,803.49,792.96,782.28,771.45,760.48,749.37,738.12,726.74,715.24,703.63,691.91,680.11,668.23,656.28,644.29,620.27,596.33,572.67,549.51,527.03,505.42,484.79,465.24,446.82,429.54,413.38,398.31,384.28,371.22,359.07,347.76,337.22,327.4,318.22,309.63,301.59,294.03,286.93,280.24,273.92,246.98,225.83,208.69,194.43,182.33,171.87,154.64,140.92,1075.18,1073.42,1071.57,1069.63,1067.62,1065.55,1063.4,1061.2,1058.93,1056.6,1054.22,1051.77,1049.27,1046.71,1044.09,1041.42,1038.69,1035.9,1033.07,1030.18,1027.23,1024.24,1021.2,1018.1,1014.96,1011.77,1008.53,1005.25,1001.92,998.55,995.13,991.67,988.17,984.62,981.04,977.41,973.75,970.04,966.29,962.51,958.69,950.93,943.03,934.98,926.78,918.45,909.97,901.36,892.6,883.71,874.69,865.53,856.24,846.82,837.27,827.59,817.78,807.85,797.8,787.63,777.35,766.96,756.46,745.86,735.17,724.4,713.54,702.62,691.64,680.61,669.55,647.39,625.26,603.33,581.73,560.62,540.14,520.4,501.49,483.47,466.39,450.24,435.02,420.71,407.26,394.64,382.81,371.7,361.27,351.48,342.27,333.6,325.43,317.73,310.45,303.56,274.02,250.7,231.76,215.99,202.59,191.03,171.96,156.78,1081.9,1078.1,1074,1071.9,1069.7,1065.2,1060.4,1055.4,1050.3,1044.9,1039.3,1033.5,1027.6,1021.4,1015.1,1008.6,1002,995.15,988.18,981.06,973.79,966.39,958.84,951.16,943.35,935.41,927.35,919.16,910.85,902.41,893.86,885.19,867.51,849.39,830.83,811.87,792.53,772.83,752.82,732.55,712.06,691.43,639.79,589.36,541.84,498.59,460.23,426.73,372.48,331.46,274.53,236.8,209.6,188.81,172.24,1097.8,1093.7,1089.3,1087,1084.7,1080,1075.1,1070.1,1064.9,1059.6,1054.1,1048.5,1042.7,1036.7,1030.7,1024.4,1018,1011.5,1004.9,998.15,991.27,984.28,977.18,969.97,962.66,955.25,947.74,940.13,932.43,924.64,916.77,908.81,892.64,876.17,859.41,842.38,825.11,807.62,789.95,772.13,754.2,736.2,691.2,646.91,604.3,564.3,527.56,494.38,438.28,393.85,329.51,285.59,253.53,228.89,209.2,1112.4,1108,1103.4,1101,1098.7,1093.8,1088.9,1083.8,1078.7,1073.4,1068,1062.4,1056.8,1051,1045.1,1039.1,1032.9,1026.7,1020.3,1013.8,1007.3,1000.6,993.85,987.01,980.09,973.09,966.01,958.85,951.63,944.33,936.97,929.54,914.51,899.25,883.78,868.14,852.34,836.4,820.34,804.21,788.01,771.79,731.32,691.4,652.63,615.61,580.87,548.76,492.8,446.94,378.23,329.87,293.99,266.16,243.79,1126,1121.4,1116.6,1114.2,1111.7,1106.8,1101.8,1096.7,1091.6,1086.3,1081,1075.5,1070,1064.3,1058.6,1052.7,1046.8,1040.7,1034.6,1028.4,1022,1015.7,1009.2,1002.7,996.05,989.38,982.64,975.85,969,962.09,955.13,948.13,933.98,919.66,905.2,890.6,875.9,861.12,846.27,831.37,816.45,801.53,764.39,727.74,692,657.54,624.76,593.97,538.99,492.7,421.42,369.97,331.18,300.77,276.17,1138.7,1134,1129.1,1126.6,1124.1,1119.1,1114,1109,1103.8,1098.6,1093.3,1087.9,1082.5,1076.9,1071.3,1065.6,1059.8,1053.9,1047.9,1041.9,1035.8,1029.7,1023.4,1017.2,1010.8,1004.4,997.97,991.47,984.93,978.34,971.72,965.05,951.61,938.05,924.38,910.63,896.8,882.92,869,855.06,841.13,827.22,792.62,758.53,725.2,692.92,661.94,632.51,578.96,532.8,460.01,406.38,365.39,332.93,306.47,1150.6,1145.8,1140.8,1138.3,1135.8,1130.7,1125.6,1120.5,1115.4,1110.2,1105,1099.7,1094.3,1088.8,1083.3,1077.7,1072.1,1066.3,1060.5,1054.7,1048.8,1042.8,1036.8,1030.7,1024.6,1018.4,1012.2,1006,999.68,993.37,987.01,980.63,967.79,954.85,941.84,928.76,915.64,902.49,889.33,876.16,863.02,849.9,817.35,785.3,753.95,723.5,694.12,666,614.09,568.44,494.83,439.61,396.92,362.82,334.85,1161.9,1157,1152,1149.4,1146.9,1141.8,1136.7,1131.6,1126.4,1121.3,1116.1,1110.8,1105.5,1100.1,1094.7,1089.2,1083.7,1078.1,1072.4,1066.7,1061,1055.2,1049.3,1043.5,1037.5,1031.6,1025.6,1019.5,1013.5,1007.4,1001.3,995.11,982.77,970.36,957.89,945.39,932.85,920.31,907.77,895.25,882.75,870.3,839.41,809.04,779.33,750.43,722.46,695.55,645.36,600.48,526.57,470.15,426.11,390.69,361.47,1182.9,1177.8,1172.7,1170.1,1167.6,1162.4,1157.3,1152.2,1147.1,1142,1136.8,1131.7,1126.5,1121.3,1116,1110.7,1105.4,1100,1094.6,1089.1,1083.6,1078.1,1072.5,1066.9,1061.3,1055.7,1050,1044.3,1038.6,1032.9,1027.2,1021.4,1009.9,998.31,986.72,975.12,963.53,951.94,940.38,928.85,917.37,905.94,877.65,849.88,822.73,796.29,770.63,745.81,698.93,656.02,582.74,524.77,478.68,441.23,410.06,1196.9,1191.7,1189.2,1186.6,1181.4,1176.3,1171.2,1166.1,1161,1156,1150.9,1145.8,1140.7,1135.6,1130.4,1125.2,1120,1114.8,1109.5,1104.2,1098.9,1093.6,1088.2,1082.9,1077.5,1072.1,1066.7,1061.3,1055.8,1050.4,1044.9,1034,1023.1,1012.2,1001.3,990.41,979.55,968.73,957.96,947.24,936.58,910.23,884.4,859.16,834.58,810.7,787.55,743.57,702.79,631.24,572.69,525.17,486.16,453.5,1209.3,1206.7,1204.2,1199,1193.9,1188.8,1183.8,1178.7,1173.7,1168.7,1163.7,1158.7,1153.7,1148.6,1143.6,1138.5,1133.4,1128.3,1123.2,1118.1,1113,1107.8,1102.6,1097.5,1092.3,1087.1,1081.9,1076.7,1071.5,1066.3,1055.9,1045.5,1035.1,1024.8,1014.5,1004.2,993.95,983.77,973.65,963.59,938.77,914.45,890.71,867.58,845.11,823.3,781.74,742.95,673.7,615.39,567,526.77,492.88,1223.1,1220.5,1215.4,1210.3,1205.3,1200.3,1195.3,1190.3,1185.4,1180.4,1175.5,1170.6,1165.7,1160.7,1155.8,1150.8,1145.8,1140.9,1135.9,1130.9,1125.9,1120.9,1115.9,1110.9,1105.9,1100.9,1095.9,1090.9,1085.9,1076,1066,1056.1,1046.2,1036.3,1026.5,1016.7,1007.1,997.42,987.85,964.26,941.17,918.63,896.68,875.35,854.63,815.1,778.06,711.24,653.78,605.06,563.94,529.02,1235.9,1230.8,1225.7,1220.7,1215.7,1210.8,1205.9,1201,1196.1,1191.3,1186.4,1181.6,1176.8,1171.9,1167.1,1162.2,1157.4,1152.5,1147.7,1142.8,1138,1133.1,1128.3,1123.5,1118.6,1113.8,1109,1104.1,1094.5,1084.9,1075.4,1065.8,1056.4,1047,1037.6,1028.3,1019.1,1009.9,987.37,965.3,943.77,922.79,902.4,882.59,844.75,809.23,744.75,688.5,639.92,598.26,562.52]),
+    u: new Float64Array([-0.040002,21.0199992,42.0199966,62.9799906,83.9099816,104.82997,125.7299559,146.6299396,167.5299211,188.4299008,191.7998973,2437.2,2443.33,2450.59,2457.85,2465.02,2472.29,2479.46,2486.63,2493.9,2501.08,2508.26,2515.54,2522.72,2529.9,2537.18,2544.36,2551.64,2558.83,2566.11,2573.4,2580.58,2587.87,2595.15,2602.54,2609.83,2617.12,2624.5,2631.79,2639.18,2646.57,2653.96,2661.34,2676.22,2691.1,2705.98,2721.06,2736.04,2751.22,2766.4,2781.58,2796.96,2812.24,2827.73,2843.21,2858.69,2874.37,2889.95,2905.74,2921.52,2937.4,2953.29,2969.27,2985.35,3001.54,3017.72,3033.9,3050.29,3066.67,3083.15,3099.64,3116.22,3132.9,3166.47,3200.24,3234.31,3268.68,3303.34,3338.21,3373.48,3408.95,3444.72,3480.79,3517.16,3553.72,3590.69,3627.86,3665.33,3703.1,3741.17,3779.44,3818.01,3856.88,3896.05,3935.41,3975.08,4015.05,4055.22,4259.97,4470.82,4687.36,4909.11,5135.66,5366.6,5840.4,6327.9,-0.040004,21.019986,42.0199932,62.9799812,83.9099634,104.81994,125.7299118,146.629872,167.5198424,188.4198016,209.329757,230.239709,251.1596574,251.3996568,2455.94,2463.304,2470.648,2477.996,2485.348,2492.704,2499.964,2507.226,2514.49,2521.756,2529.026,2536.296,2543.568,2550.842,2558.218,2565.494,2572.772,2580.05,2587.328,2594.708,2601.99,2609.38,2616.66,2624.04,2631.42,2638.8,2646.18,2653.58,2660.96,2675.82,2690.8,2705.78,2720.74,2735.82,2751,2766.18,2781.46,2796.72,2812.1,2827.48,2843.06,2858.54,2874.22,2889.9,2905.58,2921.36,2937.24,2953.22,2969.2,2985.3,3001.38,3017.56,3033.84,3050.22,3066.6,3082.98,3099.56,3116.14,3132.84,3166.4,3200.16,3234.22,3268.6,3303.26,3338.22,3373.4,3408.86,3444.64,3480.7,3517.06,3553.74,3590.6,3627.88,3665.34,3703.1,3741.08,3779.44,3818.02,3856.88,3896.06,3935.42,3975.08,4015.06,4055.22,4259.98,4470.82,4687.36,4909.1,5135.66,5366.6,5840.4,6327.9,-0.0400057,21.0199979,42.0199901,62.9799721,83.9099451,104.8199103,125.729868,146.6298191,167.5197636,188.4197024,209.3296358,230.2395635,251.1594864,272.0894039,289.2393328,2467.648,2469.016,2476.54,2483.97,2491.409,2498.751,2506.196,2513.547,2520.901,2528.158,2535.515,2542.878,2550.141,2557.51,2564.776,2572.145,2579.517,2586.789,2594.164,2601.539,2608.914,2616.292,2623.667,2631.048,2638.426,2645.807,2653.185,2660.669,2675.531,2690.496,2705.464,2720.535,2735.603,2750.777,2765.948,2781.222,2796.496,2811.87,2827.347,2842.824,2858.401,2874.078,2889.755,2905.432,2921.312,2937.18,2953.06,2969.04,2985.12,3001.3,3017.48,3033.76,3050.04,3066.42,3082.9,3099.48,3116.09,3132.77,3166.33,3200.09,3234.15,3268.51,3303.17,3338.16,3373.32,3408.88,3444.64,3480.7,3517.09,3553.65,3590.61,3627.77,3665.26,3703.02,3741.08,3779.34,3818.03,3856.89,3895.95,3935.41,3975.1,4014.96,4055.22,4259.98,4470.81,4687.37,4909,5135.56,5366.59,5840.38,6327.9,-0.0400076,21.0199976,42.0199868,62.9799628,83.9099272,104.8198804,125.729824,146.6197588,167.5196852,188.4196036,209.3295144,230.2394184,251.1593152,272.0892056,293.0290892,313.9889664,317.5789448,2476.38,2482.6,2490.116,2497.64,2505.068,2512.504,2519.944,2527.288,2534.736,2542.088,2549.444,2556.8,2564.16,2571.52,2578.884,2586.252,2593.62,2600.988,2608.456,2615.828,2623.2,2630.576,2638.052,2645.424,2652.904,2660.28,2675.236,2690.196,2705.156,2720.22,2735.388,2750.552,2765.724,2780.992,2796.364,2811.736,2827.208,2842.68,2858.256,2873.928,2889.604,2905.38,2921.156,2937.036,2953.012,2968.988,2985.068,3001.148,3017.424,3033.604,3049.984,3066.364,3082.844,3099.424,3116.004,3132.684,3166.248,3200.008,3234.072,3268.536,3303.08,3338.08,3373.34,3408.8,3444.56,3480.62,3516.98,3553.64,3590.54,3627.8,3665.26,3703.02,3741.08,3779.34,3817.94,3856.8,3895.96,3935.32,3974.98,4014.98,4055.14,4259.98,4470.82,4687.26,4909,5135.54,5366.58,5840.4,6327.88,-0.040009,21.019997,42.019984,62.979954,83.909909,104.819851,125.7297805,146.6196985,167.5196065,188.4195045,209.3193935,230.239273,251.1591445,272.089007,293.028862,313.9887085,334.9585475,340.4885035,2483.2,2488.83,2496.435,2503.945,2511.465,2518.995,2526.425,2533.86,2541.3,2548.745,2556.095,2563.545,2570.9,2578.355,2585.715,2593.175,2600.535,2607.9,2615.37,2622.735,2630.205,2637.575,2645.045,2652.52,2659.99,2674.94,2689.895,2704.95,2720.01,2735.07,2750.33,2765.495,2780.86,2796.13,2811.6,2826.965,2842.54,2858.11,2873.78,2889.455,2905.23,2921.005,2936.88,2952.855,2968.83,2984.905,3001.085,3017.26,3033.54,3049.915,3066.295,3082.775,3099.255,3115.93,3132.61,3166.17,3199.93,3234.095,3268.455,3303.12,3337.98,3373.245,3408.71,3444.575,3480.64,3517.005,3553.57,3590.535,3627.7,3665.165,3702.95,3741,3779.35,3817.95,3856.8,3895.95,3935.35,3975,4014.95,4055.15,4260,4470.8,4687.25,4909,5135.55,5366.6,5840.4,6327.9,-0.0400108,21.019997,42.0199808,62.9799448,83.9098908,104.8198212,125.7197366,146.6196388,167.5195284,188.419406,209.3192722,230.2291282,251.1489734,272.078809,293.0286344,313.9884502,334.958257,355.9580542,359.8480158,2488.998,2495.23,2502.824,2510.43,2518.042,2525.56,2533.084,2540.514,2547.95,2555.386,2562.828,2570.276,2577.724,2585.178,2592.632,2599.986,2607.446,2614.906,2622.372,2629.732,2637.198,2644.664,2652.136,2659.602,2674.546,2689.596,2704.646,2719.696,2734.852,2750.108,2765.27,2780.632,2795.994,2811.362,2826.83,2842.398,2857.966,2873.634,2889.302,2905.076,2920.85,2936.824,2952.698,2968.772,2984.846,3001.02,3017.194,3033.474,3049.748,3066.228,3082.702,3099.182,3115.862,3132.536,3166.096,3199.856,3234.016,3268.376,3303.036,3337.996,3373.162,3408.722,3444.488,3480.554,3516.914,3553.58,3590.446,3627.712,3665.178,3702.944,3741.01,3779.276,3817.942,3856.808,3895.874,3935.34,3975.006,4014.872,4055.138,4259.88,4470.74,4687.24,4909,5135.56,5366.46,5840.38,6327.9,-0.0400119,21.0199965,42.0199783,62.9799363,83.9098733,104.8197914,125.7196934,146.6195786,167.5194498,188.419307,209.3191516,230.2289829,251.1488023,272.0786105,293.0284068,313.9881926,334.9579672,355.9477306,376.677487,2493.864,2494.029,2501.707,2509.399,2516.991,2524.597,2532.21,2539.73,2547.257,2554.784,2562.218,2569.652,2577.193,2584.641,2592.089,2599.537,2606.992,2614.447,2621.902,2629.364,2636.826,2644.288,2651.75,2659.219,2674.25,2689.295,2704.34,2719.485,2734.637,2749.889,2765.148,2780.4,2795.766,2811.225,2826.691,2842.25,2857.816,2873.489,2889.155,2904.921,2920.794,2936.667,2952.64,2968.613,2984.686,3000.859,3017.032,3033.405,3049.685,3066.158,3082.638,3099.111,3115.791,3132.464,3166.024,3199.777,3233.937,3268.297,3302.957,3337.917,3373.177,3408.637,3444.404,3480.464,3516.831,3553.491,3590.458,3627.618,3665.085,3702.852,3740.912,3779.279,3817.846,3856.713,3895.88,3935.247,3974.914,4014.881,4055.041,4259.883,4470.718,4687.26,4909.03,5135.53,5366.5,5840.37,6327.84,-0.0400136,21.0199968,42.0199752,62.9799272,83.9098552,104.8197624,125.7196496,146.6195192,167.519372,188.4192088,209.3190304,230.2288384,251.148632,272.0784128,293.02818,313.9779344,334.9576768,355.9474064,376.967124,391.62692,2498.232,2500.596,2508.364,2516.048,2523.74,2531.34,2538.948,2546.456,2554.08,2561.604,2569.036,2576.568,2584.108,2591.548,2598.988,2606.536,2613.984,2621.44,2628.996,2636.452,2643.908,2651.372,2658.928,2673.956,2688.992,2704.028,2719.172,2734.416,2749.568,2764.92,2780.172,2795.632,2810.992,2826.452,2842.012,2857.672,2873.34,2889.008,2904.776,2920.644,2936.512,2952.48,2968.548,2984.624,3000.792,3016.968,3033.244,3049.612,3065.988,3082.464,3099.04,3115.616,3132.292,3165.944,3199.704,3233.856,3268.216,3302.876,3337.836,3373.096,3408.556,3444.416,3480.476,3516.836,3553.504,3590.364,3627.632,3665.092,3702.86,3740.92,3779.188,3817.856,3856.716,3895.884,3935.252,3974.912,4014.88,4055.048,4259.88,4470.72,4687.26,4909,5135.58,5366.52,5840.4,6327.88,-0.0400144,21.0199964,42.019973,62.979919,83.909838,104.8197327,125.7196067,146.6194591,167.5192935,188.4191099,209.3189101,230.2286932,251.148461,272.0782144,293.0179525,313.9776771,334.9573873,355.9470831,376.9567654,397.9964333,405.1063181,2502.054,2507.234,2515.104,2522.783,2530.471,2538.168,2545.765,2553.38,2560.895,2568.41,2575.943,2583.467,2591,2598.542,2605.984,2613.526,2621.077,2628.519,2636.079,2643.53,2651.081,2658.541,2673.561,2688.69,2703.828,2718.957,2734.104,2749.342,2764.689,2780.045,2795.401,2810.848,2826.313,2841.869,2857.525,2873.19,2888.855,2904.62,2920.485,2936.45,2952.424,2968.389,2984.463,3000.628,3016.902,3033.176,3049.55,3065.924,3082.398,3098.972,3115.546,3132.22,3165.868,3199.625,3233.782,3268.139,3302.896,3337.753,3373.01,3408.567,3444.333,3480.39,3516.756,3553.413,3590.379,3627.536,3665.102,3702.868,3740.834,3779.191,3817.757,3856.623,3895.789,3935.255,3974.921,4014.887,4055.053,4259.883,4470.722,4687.261,4909,5135.539,5366.478,5840.41,6327.87,-0.040016,21.019997,42.01997,62.97991,83.90982,104.819704,125.719563,146.6194,167.519215,188.409012,209.318789,230.228548,251.148291,272.078016,293.017726,313.977419,334.947097,355.946759,376.956406,397.996038,417.395685,2505.51,2506.21,2514.06,2521.83,2529.6,2537.28,2544.98,2552.58,2560.18,2567.79,2575.41,2582.93,2590.46,2597.99,2605.53,2613.07,2620.61,2628.15,2635.6,2643.15,2650.7,2658.26,2673.27,2688.39,2703.52,2718.65,2733.88,2749.12,2764.47,2779.81,2795.16,2810.62,2826.17,2841.73,2857.28,2873.04,2888.7,2904.57,2920.33,2936.3,2952.26,2968.33,2984.4,3000.57,3016.74,3033.11,3049.38,3065.85,3082.33,3098.9,3115.47,3132.15,3165.8,3199.65,3233.7,3268.16,3302.81,3337.77,3373.03,3408.48,3444.24,3480.4,3516.76,3553.43,3590.29,3627.55,3665.01,3702.77,3740.84,3779.2,3817.77,3856.63,3895.79,3935.16,3974.82,4014.79,4055.06,4259.79,4470.72,4687.16,4909,5135.54,5366.48,5840.36,6327.9,-0.0400165,21.0199967,42.0199681,62.9799021,83.9098031,104.8196744,125.7195193,146.61934,167.5091376,188.4089132,209.3186679,230.2284039,251.1481201,272.0778187,293.0174986,313.977162,334.9468078,355.946436,376.9560477,397.9956418,419.0552194,428.7250203,2508.755,2513.024,2520.971,2528.729,2536.509,2544.189,2551.88,2559.571,2567.173,2574.786,2582.399,2589.923,2597.547,2605.071,2612.606,2620.141,2627.687,2635.222,2642.768,2650.325,2657.871,2672.974,2688.088,2703.213,2718.438,2733.663,2748.899,2764.246,2779.582,2795.029,2810.476,2826.034,2841.581,2857.139,2872.897,2888.555,2904.413,2920.282,2936.14,2952.109,2968.167,2984.236,3000.405,3016.674,3032.943,3049.312,3065.781,3082.261,3098.83,3115.399,3132.079,3165.717,3199.577,3233.626,3268.075,3302.735,3337.684,3372.944,3408.404,3444.253,3480.313,3516.673,3553.333,3590.293,3627.453,3665.024,3702.784,3740.844,3779.104,3817.775,3856.635,3895.795,3935.166,3974.826,4014.797,4054.957,4259.79,4470.723,4687.156,4908.889,5135.533,5366.477,5840.265,6327.853,-0.040018,21.0199976,42.0199652,62.9698932,83.8997852,104.819646,125.7194768,146.6192812,167.5090592,188.4088144,209.308548,230.2182588,251.1379504,272.0676204,293.0172724,313.976904,334.9465176,355.936112,376.9556884,397.9952468,419.054786,439.2343276,2511.692,2511.984,2519.924,2527.864,2535.728,2543.492,2551.18,2558.868,2566.556,2574.156,2581.768,2589.38,2597.004,2604.528,2612.152,2619.676,2627.312,2634.848,2642.396,2649.944,2657.48,2672.588,2687.796,2703.004,2718.124,2733.456,2748.676,2764.02,2779.352,2794.796,2810.24,2825.796,2841.34,2856.996,2872.752,2888.408,2904.264,2920.12,2936.088,2952.044,2968.112,2984.18,3000.348,3016.604,3032.872,3049.252,3065.62,3082.188,3098.756,3115.324,3132.004,3165.652,3199.5,3233.548,3267.996,3302.644,3337.604,3372.852,3408.412,3444.172,3480.332,3516.692,3553.352,3590.212,3627.472,3664.932,3702.692,3740.752,3779.112,3817.684,3856.544,3895.704,3935.164,3974.836,4014.796,4054.968,4259.792,4470.616,4687.152,4908.888,5135.536,5366.472,5840.256,6327.84,-0.0400182,21.0199974,42.0199636,62.9698856,83.8997686,104.8196165,125.7194332,146.6192213,167.5089821,188.4087169,209.308427,230.218115,251.1377796,272.0674234,293.0170451,313.9666473,334.9462287,355.9357893,376.9553304,397.9848507,419.0543515,440.1438328,449.0536079,2514.311,2518.968,2527.011,2534.854,2542.71,2550.479,2558.161,2565.943,2573.538,2581.233,2588.841,2596.449,2604.07,2611.691,2619.212,2626.846,2634.38,2642.014,2649.561,2657.095,2672.289,2687.496,2702.703,2717.91,2733.13,2748.463,2763.796,2779.229,2794.662,2810.108,2825.654,2841.2,2856.846,2872.605,2888.351,2904.11,2919.969,2935.928,2951.887,2967.946,2984.018,3000.277,3016.449,3032.808,3049.18,3065.552,3082.011,3098.583,3115.255,3131.927,3165.571,3199.415,3233.572,3267.916,3302.573,3337.617,3372.774,3408.331,3444.188,3480.245,3516.602,3553.259,3590.216,3627.373,3664.943,3702.7,3740.757,3779.027,3817.684,3856.554,3895.711,3935.068,3974.838,4014.708,4054.965,4259.789,4470.626,4687.15,4908.887,5135.424,5366.474,5840.248,6327.835,-0.0400196,21.0199986,42.0199608,62.9698768,83.8997508,104.8195884,125.719391,146.6091614,167.5089038,188.4086182,209.3083074,230.21797,251.1376102,272.0672252,293.0068192,313.9663894,334.9459386,355.9354654,376.9449712,397.984456,419.0539184,440.1433598,458.2728614,2516.876,2518.026,2526.048,2533.97,2541.92,2549.684,2557.548,2565.226,2573.018,2580.61,2588.302,2596.008,2603.614,2611.234,2618.854,2626.374,2634.008,2641.642,2649.176,2656.81,2671.992,2687.188,2702.398,2717.608,2732.918,2748.242,2763.566,2779.004,2794.428,2809.866,2825.418,2841.056,2856.708,2872.46,2888.212,2903.964,2919.816,2935.768,2951.834,2967.786,2983.952,3000.118,3016.384,3032.65,3049.016,3065.482,3081.948,3098.514,3115.18,3131.86,3165.492,3199.338,3233.484,3267.83,3302.59,3337.536,3372.796,3408.242,3444.102,3480.162,3516.608,3553.168,3590.128,3627.388,3664.848,3702.608,3740.668,3779.028,3817.588,3856.548,3895.622,3935.082,3974.742,4014.702,4054.876,4259.69,4470.618,4687.16,4908.888,5135.43,5366.472,5840.242,6327.84,-0.0400195,21.0199985,42.0199595,62.969868,83.8997345,104.819559,125.7193475,146.609103,167.508827,188.408521,209.3081865,230.2178265,251.1374395,272.0670285,293.006592,313.966133,334.9356485,355.935143,376.9446135,397.98406,419.043484,440.1428855,461.262263,466.9720905,2519.205,2525.09,2533.2,2541.14,2548.98,2556.85,2564.605,2572.39,2580.075,2587.76,2595.46,2603.075,2610.775,2618.39,2626.005,2633.635,2641.265,2648.795,2656.425,2671.6,2686.89,2702.08,2717.385,2732.705,2748.025,2763.345,2778.765,2794.2,2809.735,2825.27,2840.92,2856.555,2872.305,2888.055,2903.805,2919.755,2935.62,2951.67,2967.735,2983.785,3000.05,3016.315,3032.58,3048.945,3065.41,3081.875,3098.44,3115.105,3131.785,3165.415,3199.26,3233.405,3267.75,3302.51,3337.455,3372.7,3408.26,3444.02,3480.165,3516.525,3553.185,3590.145,3627.29,3664.85,3702.61,3740.67,3779.03,3817.605,3856.465,3895.625,3935.085,3974.745,4014.705,4054.88,4259.695,4470.625,4687.155,4908.885,5135.43,5366.46,5840.25,6327.825,-0.0400208,21.02,42.0199568,62.9698608,83.8997168,104.8095312,125.7193056,146.6090432,167.5087488,188.4084224,209.3080672,230.2176816,251.1372704,272.0668304,293.0063664,313.9658752,334.93536,355.9248192,376.9442544,397.9836656,419.0430512,440.1324128,461.2617488,475.211296,2521.376,2524.228,2532.332,2540.252,2548.188,2556.14,2563.892,2571.76,2579.444,2587.228,2594.912,2602.612,2610.228,2617.928,2625.544,2633.16,2640.792,2648.408,2656.04,2671.304,2686.584,2701.78,2717.076,2732.388,2747.8,2763.112,2778.54,2794.068,2809.596,2825.14,2840.768,2856.412,2872.056,2887.9,2903.76,2919.604,2935.564,2951.508,2967.568,2983.728,2999.888,3016.148,3032.508,3048.884,3065.344,3081.804,3098.38,3115.04,3131.716,3165.352,3199.188,3233.324,3267.776,3302.428,3337.38,3372.616,3408.168,3444.02,3480.088,3516.44,3553.092,3590.044,3627.312,3664.764,3702.632,3740.684,3778.936,3817.604,3856.472,3895.624,3934.992,3974.744,4014.612,4054.88,4259.704,4470.628,4687.152,4908.892,5135.416,5366.456,5840.236,6327.832,-0.0400216,21.0200018,42.0199532,62.9698452,83.8996832,104.8094726,125.7092206,146.6089254,167.5085942,188.398227,209.3078274,230.2173936,251.1269292,272.056436,293.005914,313.9553614,334.9347818,355.9241734,376.933538,397.9728756,419.0421844,440.1314662,461.2507192,482.4099434,490.5096392,2525.4554,2530.4984,2538.7,2546.698,2554.732,2562.566,2570.518,2578.288,2586.158,2593.828,2601.616,2609.304,2617.01,2624.716,2632.422,2640.028,2647.752,2655.376,2670.624,2685.99,2701.274,2716.558,2731.96,2747.262,2762.764,2778.184,2793.704,2809.224,2824.762,2840.382,2856.12,2871.758,2887.614,2903.452,2919.29,2935.246,2951.302,2967.358,2983.514,2999.67,3015.926,3032.282,3048.638,3065.112,3081.668,3098.224,3114.798,3131.554,3165.202,3199.032,3233.18,3267.61,3302.358,3337.306,3372.554,3408.102,3443.95,3480.016,3516.364,3553.012,3589.978,3627.226,3664.692,3702.54,3740.606,3778.854,3817.52,3856.386,3895.534,3935,3974.666,4014.614,4054.78,4259.61,4470.522,4687.052,4908.882,5135.412,5366.46,5840.238,6327.716,-0.040022,21.020004,42.01995,62.96983,83.89965,104.809416,125.709134,146.608808,167.49844,188.398032,209.297586,230.207106,251.12659,272.056042,292.99546,313.954848,334.924204,355.923528,376.932822,397.972086,419.031318,440.12052,461.24969,482.408828,503.597936,504.487896,2529.064,2537.038,2545.226,2553.232,2561.252,2569.184,2577.128,2584.984,2592.848,2600.62,2608.4,2616.08,2623.88,2631.58,2639.28,2647,2654.6,2669.94,2685.3,2700.66,2716.04,2731.42,2746.82,2762.32,2777.72,2793.24,2808.86,2824.38,2840.1,2855.74,2871.46,2887.3,2903.14,2919.1,2935.04,2951.08,2967.14,2983.28,2999.54,3015.8,3032.06,3048.5,3064.96,3081.42,3097.98,3114.66,3131.42,3165.04,3198.88,3233.02,3267.46,3302.2,3337.14,3372.48,3408.04,3443.78,3479.94,3516.28,3552.94,3589.9,3627.14,3664.7,3702.46,3740.52,3778.88,3817.44,3856.28,3895.44,3934.9,3974.58,4014.54,4054.8,4259.6,4470.52,4687.06,4908.78,5135.42,5366.34,5840.22,6327.7,-0.040022,21.0200044,42.0099472,62.9698152,83.8996172,104.8093598,125.7090496,146.608691,167.4982862,188.3978374,209.2973468,230.2068188,251.1262512,272.0556484,292.9950082,313.954335,334.9236266,355.912883,376.9321064,397.9612968,419.030452,440.1195742,461.2386612,482.397713,503.5967318,517.396074,2532.3846,2535.2892,2543.6526,2551.8336,2559.9344,2567.9484,2575.9756,2583.816,2591.7652,2599.6232,2607.39,2615.1656,2622.9478,2630.7366,2638.4298,2646.2296,2653.936,2669.362,2684.688,2700.158,2715.506,2730.898,2746.368,2761.86,2777.374,2792.866,2808.48,2824.094,2839.73,2855.444,2871.18,2887.016,2902.852,2918.788,2934.824,2950.86,2966.918,2983.054,2999.312,3015.57,3031.928,3048.264,3064.722,3081.28,3097.838,3114.518,3131.276,3164.892,3198.73,3232.968,3267.406,3302.044,3337.082,3372.32,3407.858,3443.718,3479.856,3516.216,3552.854,3589.814,3627.074,3664.612,3702.372,3740.432,3778.792,3817.352,3856.312,3895.45,3934.81,3974.57,4014.53,4054.69,4259.612,4470.434,4687.056,4908.778,5135.3,5366.344,5840.21,6327.698,-0.0400216,21.0200072,42.0099448,62.9698008,83.8995848,104.809304,125.7089656,146.5985744,167.4981328,188.3976432,209.297108,230.206532,251.1259128,272.0452552,292.9945568,313.9438224,334.9230496,355.9122384,376.9213912,397.960508,419.0195864,440.1086288,461.2376328,482.3865984,503.585528,524.8244168,529.3841744,2535.3968,2541.9832,2550.3416,2558.5216,2566.616,2574.7272,2582.7504,2590.6832,2598.5304,2606.4848,2614.2464,2622.1176,2629.896,2637.6816,2645.472,2653.1672,2668.6768,2684.1008,2699.5416,2714.9944,2730.4592,2745.924,2761.42,2776.916,2792.512,2808.108,2823.728,2839.448,2855.168,2870.888,2886.708,2902.628,2918.572,2934.516,2950.56,2966.704,2982.848,2999.092,3015.336,3031.68,3048.148,3064.592,3081.06,3097.704,3114.372,3131.016,3164.752,3198.564,3232.8,3267.236,3301.972,3336.908,3372.244,3407.804,3443.64,3479.676,3516.136,3552.772,3589.732,3626.992,3664.528,3702.288,3740.348,3778.708,3817.368,3856.204,3895.364,3934.824,3974.484,4014.444,4054.704,4259.504,4470.428,4686.952,4908.776,5135.3,5366.348,5840.22,6327.692,-0.0400208,21.0200104,42.0099428,62.9697868,83.8995528,104.8092486,125.708882,146.5984582,167.4979798,188.3874494,209.2968696,230.1962456,251.1155748,272.0448624,292.9841058,313.9433102,334.912473,355.9015942,376.9206764,397.9497196,419.0187212,440.1076838,461.2266048,482.3854842,503.5743246,524.8131208,540.5922004,2538.1902,2540.422,2548.8558,2557.113,2565.3884,2573.4794,2581.586,2589.6056,2597.5382,2605.4786,2613.3294,2621.1906,2629.057,2636.8338,2644.6158,2652.403,2667.993,2683.5038,2698.9328,2714.4722,2729.9272,2745.3926,2760.9684,2776.5494,2792.1408,2807.74,2823.334,2839.054,2854.874,2870.594,2886.414,2902.334,2918.254,2934.3,2950.346,2966.466,2982.612,2998.858,3015.104,3031.45,3047.896,3064.368,3080.914,3097.56,3114.232,3130.878,3164.596,3198.514,3232.658,3267.076,3301.82,3336.838,3372.082,3407.726,3443.57,3479.614,3516.058,3552.702,3589.646,3626.916,3664.46,3702.204,3740.248,3778.618,3817.262,3856.132,3895.276,3934.746,3974.39,4014.36,4054.604,4259.528,4470.426,4686.95,4908.774,5135.298,5366.322,5840.196,6327.67,-0.0400196,21.020014,42.0099412,62.9697732,83.8995212,104.8091936,125.7087988,146.5983424,167.4878244,188.387256,209.2866316,230.1959596,251.1152372,272.04447,292.9836552,313.9327984,334.9118968,355.9009504,376.909962,397.9489316,419.0078564,440.0967392,461.2155772,482.3743732,503.5731216,524.8118252,546.090484,551.1401592,2540.7528,2547.276,2555.7084,2564.0632,2572.2348,2580.426,2588.4312,2596.4476,2604.4752,2612.4168,2620.364,2628.2224,2636.0864,2643.8588,2651.7368,2667.3124,2682.8104,2698.4224,2713.954,2729.3968,2744.9536,2760.5188,2776.0924,2791.6772,2807.3676,2823.0664,2838.768,2854.478,2870.288,2886.212,2902.036,2918.06,2934.084,2950.108,2966.26,2982.384,2998.636,3014.988,3031.312,3047.664,3064.216,3080.768,3097.32,3113.972,3130.724,3164.456,3198.36,3232.492,3267.024,3301.756,3336.788,3372.02,3407.552,3443.384,3479.544,3515.976,3552.636,3589.568,3626.828,3664.36,3702.12,3740.28,3778.54,3817.172,3856.132,3895.292,3934.652,3974.412,4014.372,4054.532,4259.432,4470.332,4686.96,4908.66,5135.288,5366.316,5840.2,6327.684,-0.040018,21.020018,42.00994,62.969757,83.88949,104.799139,125.698716,146.598227,167.487672,188.38706,209.286394,230.195671,251.1149,272.034078,292.983205,313.932287,334.901321,355.890307,376.909248,397.938144,419.006992,440.095795,461.21455,482.37326,503.561919,524.80053,546.079093,561.108049,2543.172,2545.701,2554.309,2562.641,2570.997,2579.168,2587.357,2595.461,2603.474,2611.502,2619.439,2627.385,2635.24,2643.104,2650.974,2666.632,2682.214,2697.817,2713.335,2728.968,2744.513,2760.07,2775.636,2791.314,2806.998,2822.688,2838.384,2854.189,2869.997,2885.911,2901.828,2917.751,2933.78,2949.9,2966.05,2982.17,2998.42,3014.74,3031.09,3047.54,3063.99,3080.54,3097.19,3113.84,3130.59,3164.29,3198.22,3232.42,3266.85,3301.58,3336.61,3371.94,3407.47,3443.33,3479.46,3515.92,3552.55,3589.48,3626.74,3664.3,3702.03,3740.19,3778.55,3817.11,3856.04,3895.2,3934.66,3974.32,4014.28,4054.54,4259.44,4470.34,4686.84,4908.67,5135.3,5366.33,5840.19,6327.65,-0.0400105,21.0200315,42.009937,62.959727,83.889412,104.7990025,125.698509,146.5879385,167.4872945,188.3765805,209.2758,230.18496,251.104057,272.033098,292.9720795,313.9210085,334.8898815,355.8786985,376.8974665,397.926175,418.9848345,440.073438,461.2019855,482.350477,503.548916,524.7872955,546.065619,567.3938795,583.8825005,2548.537,2550.5315,2559.2065,2567.8095,2576.237,2584.4855,2592.748,2600.9315,2609.1255,2617.1335,2625.152,2633.181,2641.1205,2649.067,2664.8845,2680.63,2696.3,2711.9875,2727.6925,2743.315,2758.948,2774.595,2790.3525,2806.0205,2821.7955,2837.5775,2853.3665,2869.2625,2885.162,2901.0685,2917.082,2933.1955,2949.316,2965.44,2981.6675,2997.895,3014.2295,3030.664,3047.102,3063.54,3080.085,3096.7265,3113.475,3130.22,3163.91,3197.835,3232.025,3266.55,3301.275,3336.3,3371.625,3407.25,3443.075,3479.235,3515.66,3552.32,3589.345,3626.605,3664.13,3701.89,3740.015,3778.375,3817.035,3855.895,3895.02,3934.48,3974.24,4014.2,4054.36,4259.325,4470.225,4686.825,4908.56,5135.195,5366.195,5840.065,6327.635,-0.030004,21.020044,42.00994,62.959696,83.889336,104.798868,125.688304,146.587652,167.476916,188.3761,209.275208,230.174248,251.093216,272.02212,292.96096,313.909732,334.878444,355.867096,376.875684,397.914212,418.972676,440.06108,461.179424,482.3377,503.525916,524.764064,546.042148,567.370164,588.758108,604.21658,2553.148,2555.6,2564.448,2573.124,2581.628,2590.052,2598.396,2606.66,2614.836,2623.024,2631.128,2639.144,2647.168,2663.14,2679.048,2694.884,2710.644,2726.42,2742.12,2757.832,2773.556,2789.396,2805.144,2820.904,2836.768,2852.644,2868.528,2884.416,2900.412,2916.512,2932.516,2948.628,2964.844,2981.06,2997.38,3013.708,3030.136,3046.564,3063.1,3079.636,3096.372,3113.016,3129.756,3163.548,3197.544,3231.748,3266.256,3300.96,3336.08,3371.4,3406.92,3442.88,3479,3515.42,3552.18,3589.1,3626.32,3663.88,3701.74,3739.86,3778.22,3816.88,3855.7,3894.86,3934.32,3974.08,4014,4054.26,4259.16,4470.12,4686.72,4908.56,5135.16,5366.2,5840.04,6327.62,-0.029991,21.020063,42.0099415,62.959667,83.889262,104.78874,125.6881055,146.5773675,167.4765395,188.3656215,209.2646225,230.173538,251.0823815,272.011144,292.949839,313.898462,334.867013,355.855492,376.8639035,397.9022475,418.960524,440.0487285,461.166861,482.314926,503.512919,524.7408355,546.02868,567.356448,588.734135,610.171741,622.6503145,2557.145,2560.911,2569.8335,2578.5875,2587.273,2595.7765,2604.2025,2612.4465,2620.8085,2628.984,2637.173,2645.271,2661.403,2677.4755,2693.375,2709.3015,2725.1505,2740.922,2756.7115,2772.519,2788.3355,2804.17,2820.009,2835.8615,2851.823,2867.7935,2883.7685,2899.7525,2915.8455,2931.9385,2948.0405,2964.247,2980.5535,2996.869,3013.1845,3029.6045,3046.129,3062.658,3079.287,3095.9205,3112.654,3129.392,3163.1725,3197.162,3231.356,3265.959,3300.762,3335.774,3371.0905,3406.707,3442.6325,3478.758,3515.17,3551.9,3588.93,3626.205,3663.735,3701.565,3739.595,3778.07,3816.7,3855.53,3894.805,3934.235,3973.865,4013.94,4054.07,4259.055,4470.04,4686.625,4908.455,5135.04,5366.07,5840.03,6327.59,-0.029975,21.02008,42.009945,62.959645,83.879195,104.78861,125.687905,146.57709,167.466165,188.355145,209.254035,230.16283,251.071545,272.000175,292.93872,313.88719,334.85558,355.843895,376.85213,397.89029,418.94837,440.026375,461.144305,482.302155,503.48992,524.72761,546.005215,567.332735,588.710165,610.147505,631.644755,639.543725,2560.695,2566.565,2575.57,2584.405,2593.07,2601.66,2610.07,2618.5,2626.845,2635.11,2643.285,2659.67,2675.8,2691.865,2707.865,2723.785,2739.73,2755.6,2771.48,2787.38,2803.295,2819.12,2835.055,2851.005,2866.96,2883.025,2899.095,2915.175,2931.26,2947.45,2963.65,2979.95,2996.355,3012.665,3029.18,3045.595,3062.215,3078.84,3095.465,3112.195,3129.03,3162.8,3196.78,3231.065,3265.66,3300.455,3335.46,3370.87,3406.485,3442.4,3478.52,3514.945,3551.675,3588.705,3626.035,3663.57,3701.4,3739.45,3777.9,3816.55,3855.45,3894.6,3934.05,3973.8,4013.75,4054,4258.95,4469.95,4686.55,4908.35,5135.05,5366.05,5840,6327.55,-0.0299615,21.0201045,42.009956,62.9596205,83.8791255,104.788482,125.6777065,146.56681,167.455798,188.354676,209.2534495,230.1521295,251.0707105,271.9892035,292.9276085,313.87592,334.844149,355.8322955,376.840354,397.86833,418.9262235,440.014029,461.131752,482.2893815,503.4769285,524.7043875,545.981753,567.309025,588.686198,610.1232775,631.6202525,653.1871175,655.156826,2563.87,2572.3675,2581.456,2590.2775,2599.0265,2607.703,2616.2015,2624.6165,2633.0535,2641.3015,2657.8415,2674.131,2690.3645,2706.4255,2722.5195,2738.541,2754.4845,2770.4445,2786.3265,2802.3195,2818.229,2834.2495,2850.1865,2866.229,2882.277,2898.3415,2914.506,2930.6815,2946.8625,2963.149,2979.4465,2995.744,3012.1415,3028.65,3045.1585,3061.7725,3078.392,3095.0115,3111.8365,3128.5615,3162.4225,3196.3945,3230.772,3265.2605,3300.149,3335.2485,3370.5535,3406.2585,3442.169,3478.285,3514.8065,3551.528,3588.555,3625.782,3663.4145,3701.247,3739.285,3777.7175,3816.361,3855.299,3894.415,3933.875,3973.635,4013.695,4053.9,4258.9,4469.845,4686.545,4908.345,5134.945,5366.045,5839.9,6327.555,-0.02994,21.020126,42.009964,62.949598,83.879058,104.778362,125.67751,146.566532,167.455428,188.344204,209.242866,230.141426,251.059878,271.978234,292.916494,313.864658,334.832726,355.820698,376.828586,397.856378,418.914074,440.001686,461.119196,482.266616,503.45394,524.691168,545.968294,567.285318,588.672234,610.109048,631.605748,653.162334,669.71964,2566.752,2568.992,2578.326,2587.502,2596.408,2605.15,2613.81,2622.4,2630.902,2639.328,2656.022,2672.47,2688.86,2705.092,2721.26,2737.252,2753.374,2769.314,2785.372,2801.348,2817.342,2833.348,2849.366,2865.496,2881.538,2897.686,2913.84,2930.006,2946.278,2962.556,2978.84,2995.23,3011.626,3028.122,3044.724,3061.232,3077.946,3094.66,3111.38,3128.2,3162.052,3196.11,3230.38,3264.956,3299.844,3334.932,3370.332,3405.932,3441.844,3478.05,3514.568,3551.286,3588.31,3625.634,3663.158,3700.988,3739.118,3777.554,3816.19,3855.132,3894.368,3933.81,3973.552,4013.494,4053.742,4258.8,4469.74,4686.44,4908.24,5134.94,5365.94,5839.84,6327.4,-0.029922,21.020156,41.999974,62.949584,83.868999,104.7782385,125.667322,146.556256,167.44506,188.333734,209.232291,230.1407245,251.049054,271.967273,292.9053815,313.8533925,334.8212995,355.809109,376.8168145,397.8444225,418.901933,439.9893395,461.0966485,482.2538535,503.4409545,524.6679515,545.944838,567.271614,588.6482795,610.0848215,631.5812465,653.137548,674.7737195,683.362166,2569.4165,2575.2135,2584.538,2593.7015,2602.604,2611.4325,2620.187,2628.761,2637.361,2654.2065,2670.8105,2687.2665,2703.668,2719.902,2736.0685,2752.161,2768.2795,2784.3175,2800.3815,2816.452,2832.542,2848.645,2864.661,2880.79,2897.0255,2913.174,2929.429,2945.6905,2961.9585,2978.333,2994.714,3011.2015,3027.6955,3044.1895,3060.79,3077.497,3094.204,3110.9175,3127.8375,3161.6775,3195.7305,3230.09,3264.656,3299.535,3334.6205,3370.0125,3405.711,3441.6095,3477.8145,3514.326,3551.044,3588.162,3625.38,3663.0045,3700.829,3738.96,3777.391,3816.022,3854.9595,3894.197,3933.6345,3973.372,4013.416,4053.66,4258.593,4469.665,4686.35,4908.235,5134.82,5365.905,5839.84,6327.375,-0.029895,21.020182,41.999993,62.949566,83.868936,104.768117,125.66713,146.555982,167.444694,188.333266,209.221712,230.130025,251.038226,271.966308,292.894278,313.842129,334.809882,355.797516,376.805052,397.832476,418.889788,439.967002,461.084104,482.231094,503.417972,524.654731,545.921385,567.247913,588.624322,610.060605,631.556755,653.112772,674.748649,696.224428,2571.861,2571.926,2581.591,2590.912,2600.068,2609.059,2617.885,2626.632,2635.3,2652.292,2669.154,2685.772,2702.239,2718.541,2734.785,2751.05,2767.25,2783.371,2799.406,2815.569,2831.639,2847.83,2863.935,2880.147,2896.273,2912.506,2928.753,2945.007,2961.361,2977.729,2994.204,3010.679,3027.168,3043.757,3060.353,3077.049,3093.752,3110.562,3127.372,3161.299,3195.347,3229.795,3264.357,3299.233,3334.409,3369.792,3405.482,3441.379,3477.583,3514.087,3550.898,3587.909,3625.227,3662.852,3700.67,3738.795,3777.227,3815.859,3854.791,3894.023,3933.462,3973.201,4013.24,4053.479,4258.502,4469.553,4686.19,4908.09,5134.79,5365.79,5839.86,6327.36,-0.0298725,21.0202175,42.0000075,62.94955,83.868875,104.7679975,125.65694,146.5457175,167.43433,188.3228075,209.221135,230.119335,251.0274,271.955345,292.88317,313.830875,334.79846,355.7859325,376.793285,397.820525,418.8676525,439.95466,461.071555,482.21833,503.404985,524.63152,545.907935,567.224215,588.6003675,610.036385,631.53226,653.0879925,674.7235825,696.4290075,708.4064275,2573.9675,2578.47,2588.035,2597.345,2606.5,2615.485,2624.4,2633.145,2650.3875,2667.405,2684.1825,2700.7125,2717.1875,2733.6,2749.8425,2766.1225,2782.3175,2798.5425,2814.6825,2830.8375,2847.015,2863.2,2879.4075,2895.615,2911.8375,2928.075,2944.42,2960.765,2977.225,2993.5925,3010.16,3026.6425,3043.225,3059.9075,3076.605,3093.3025,3110.1,3127.005,3160.93,3195.0625,3229.4025,3264.0575,3298.9275,3334.0975,3369.575,3405.26,3441.1525,3477.345,3513.845,3550.6525,3587.76,3625.075,3662.59,3700.5125,3738.635,3777.0575,3815.6875,3854.7175,3893.8475,3933.385,3973.1225,4013.16,4053.3975,4258.415,4469.455,4686.1175,4908.025,5134.725,5365.825,5839.725,6327.325,-0.02984,21.020248,42.000032,62.949544,83.858816,104.767888,125.656752,146.545448,167.433976,188.322344,209.21056,230.10864,251.026576,271.944384,292.872064,313.819616,334.78704,355.774344,376.771528,397.798584,418.85552,439.942328,461.049016,482.195576,503.382008,524.618312,545.884488,567.21052,588.586416,610.012168,631.507776,653.063224,674.698512,696.40364,718.198592,719.968176,2576.028,2585.072,2594.64,2604.056,2613.204,2622.184,2630.996,2648.484,2665.66,2682.6,2699.296,2715.84,2732.324,2748.74,2764.988,2781.268,2797.572,2813.792,2829.936,2846.196,2862.372,2878.664,2894.864,2911.172,2927.496,2943.828,2960.176,2976.624,2993.08,3009.644,3026.216,3042.788,3059.468,3076.156,3092.944,3109.74,3126.644,3160.552,3194.676,3229.116,3263.764,3298.62,3333.784,3369.256,3404.936,3440.924,3477.212,3513.708,3550.512,3587.516,3624.828,3662.44,3700.352,3738.472,3776.9,3815.52,3854.548,3893.776,3933.212,3972.94,4012.976,4053.212,4258.324,4469.36,4686.12,4907.988,5134.64,5365.78,5839.68,6327.36,-0.029775,21.010324,42.000072,62.939523,83.858713,104.75766,125.646391,146.534915,167.413259,188.301423,209.199425,230.097256,251.004943,271.922477,292.859867,313.797113,334.764215,355.751182,376.748005,397.774702,418.831255,439.907664,461.023938,482.170077,503.346063,524.571905,545.847603,567.163139,588.538522,609.963752,631.458802,653.01369,674.648389,696.352908,718.137238,740.011352,741.550938,2579.599,2589.072,2598.792,2608.266,2617.576,2626.722,2644.604,2662.176,2679.338,2696.363,2713.142,2729.766,2746.335,2762.84,2779.272,2795.64,2811.926,2828.239,2844.57,2860.819,2877.177,2893.453,2909.847,2926.25,2942.562,2959.083,2975.513,2992.052,3008.6,3025.157,3041.823,3058.489,3075.264,3092.039,3108.923,3125.816,3159.802,3194.015,3228.428,3263.159,3298.108,3333.257,3368.715,3404.482,3440.458,3476.743,3513.228,3550.022,3587.116,3624.419,3662.131,3699.934,3738.155,3776.567,3815.288,3854.209,3893.43,3932.96,3972.69,4012.72,4052.95,4258.145,4469.167,4685.907,4907.774,5134.55,5365.644,5839.65,6327.31,-0.0197,21.01041,41.99013,62.93952,83.84862,104.74745,125.63603,146.5244,167.40256,188.29052,209.17829,230.07589,250.98331,271.90057,292.83767,313.78461,334.7414,355.71803,376.7245,397.75083,418.797,439.87301,460.98888,482.13458,503.32013,524.53551,545.81073,567.12577,588.50065,609.92534,631.40985,652.96417,674.59829,696.3022,718.0859,739.95937,761.39277,2582.74,2582.96,2593.28,2603.16,2612.8,2622.28,2640.64,2658.52,2676.09,2693.34,2710.35,2727.22,2743.94,2760.59,2777.19,2793.61,2810.06,2826.54,2842.94,2859.26,2875.7,2892.05,2908.52,2924.9,2941.39,2957.89,2974.41,2990.93,3007.56,3024.21,3040.85,3057.61,3074.37,3091.14,3108.01,3124.99,3159.06,3193.25,3227.75,3262.46,3297.49,3332.73,3368.18,3403.94,3440,3476.27,3512.85,3549.63,3586.72,3624.12,3661.72,3699.62,3737.83,3776.24,3814.95,3853.97,3893.19,3932.71,3972.43,4012.46,4052.69,4257.86,4469.07,4685.8,4907.66,5134.43,5365.52,5839.51,6327.2,-0.019615,21.010506,41.990198,62.929527,83.848526,104.737239,125.625688,146.513884,167.39186,188.279616,209.167174,230.064523,250.971696,271.888682,292.815492,313.762126,334.718584,355.694888,376.701005,397.716968,418.772755,439.848377,460.953823,482.099093,503.284198,524.499127,545.773858,567.088413,588.452781,609.876951,631.360912,652.914664,674.538196,696.241497,718.024567,739.897395,761.859959,779.783711,2585.405,2587.433,2597.808,2607.86,2617.667,2636.502,2654.88,2672.757,2690.233,2707.575,2724.683,2741.546,2758.353,2775.104,2791.688,2808.205,2824.744,2841.216,2857.71,2874.215,2890.642,2907.191,2923.651,2940.122,2956.704,2973.308,2989.812,3006.527,3023.153,3039.89,3056.627,3073.475,3090.334,3107.193,3124.163,3158.214,3192.576,3227.06,3261.866,3296.883,3332.1,3367.639,3403.489,3439.439,3475.8,3512.372,3549.244,3586.327,3623.71,3661.304,3699.309,3737.403,3775.908,3814.613,3853.629,3892.845,3932.361,3972.177,4012.204,4052.531,4257.677,4468.878,4685.601,4907.546,5134.313,5365.391,5839.469,6327.091,-0.01952,21.010612,41.990276,62.929532,83.838452,104.737048,125.615344,146.503388,167.381168,188.268732,209.156056,230.043176,250.95008,271.866804,292.793324,313.739652,334.695788,355.671744,376.66752,397.693116,418.73852,439.813744,460.918776,482.063628,503.248288,524.462744,545.727008,567.04108,588.414924,609.828564,631.321988,652.865172,674.488116,696.19082,717.97326,739.835436,761.797324,783.868912,796.9638,2587.788,2592.216,2602.768,2612.892,2632.296,2651.056,2669.348,2687.136,2704.708,2722.052,2739.168,2756.12,2772.932,2789.668,2806.352,2822.96,2839.592,2856.16,2872.74,2889.244,2905.76,2922.3,2938.952,2955.516,2972.104,2988.792,3005.492,3022.204,3038.916,3055.752,3072.588,3089.424,3106.372,3123.332,3157.464,3191.808,3226.388,3261.268,3296.272,3331.576,3367.104,3402.932,3438.984,3475.336,3511.888,3548.764,3585.928,3623.316,3660.992,3698.892,3737.08,3775.58,3814.28,3853.292,3892.592,3932.104,3971.928,4011.94,4052.264,4257.496,4468.676,4685.392,4907.432,5134.184,5365.26,5839.336,6327.048,-0.019415,21.010715,41.990351,62.919558,83.828375,104.726854,125.615021,146.492889,167.370497,188.247845,209.134959,230.031826,250.938485,271.844923,292.771153,313.717175,334.673002,355.648621,376.644045,397.669274,418.714295,439.789121,460.893752,482.028162,503.212377,524.426384,545.69017,567.003748,588.367092,609.790202,631.273065,652.815694,674.43805,696.130159,717.911969,739.773493,761.734718,783.795605,805.966167,813.11306,2589.953,2597.321,2607.853,2628.012,2647.266,2665.85,2683.951,2701.856,2719.339,2736.687,2753.8,2770.752,2787.656,2804.499,2821.268,2837.876,2854.61,2871.17,2887.843,2904.442,2921.054,2937.692,2954.33,2970.994,2987.671,3004.448,3021.151,3037.954,3054.77,3071.699,3088.628,3105.557,3122.612,3156.722,3191.145,3225.794,3260.569,3295.657,3331.058,3366.559,3402.386,3438.526,3474.866,3511.519,3548.372,3585.538,3622.904,3660.583,3698.575,3736.754,3775.246,3814.051,3853.043,3892.248,3931.866,3971.571,4011.689,4052.007,4257.223,4468.491,4685.285,4907.218,5134.064,5365.123,5839.293,6327.002,-0.0193,21.01084,41.980448,62.919594,83.82832,104.716682,125.604694,146.482412,167.359822,188.236966,209.123858,230.010498,250.9169,271.833064,292.749004,313.69472,334.650226,355.625508,376.62058,397.635442,418.68008,439.754508,460.858726,481.99272,503.17649,524.390036,545.653344,566.966428,588.31926,609.74184,631.224168,652.76623,674.388012,696.0795,717.860694,739.721566,761.672116,783.732316,805.902152,828.181596,828.361512,2591.708,2602.758,2623.568,2643.288,2662.276,2680.79,2698.916,2716.626,2734.12,2751.47,2768.69,2785.652,2802.542,2819.488,2836.262,2852.964,2869.694,2886.338,2903.024,2919.71,2936.424,2953.152,2969.894,2986.55,3003.32,3020.204,3036.988,3053.886,3070.798,3087.724,3104.75,3121.776,3155.97,3190.378,3225.114,3259.978,3295.042,3330.434,3366.026,3401.932,3438.066,3474.386,3511.034,3547.982,3585.144,3622.506,3660.282,3698.258,3736.434,3774.924,3813.714,3852.704,3892.008,3931.512,3971.316,4011.42,4051.738,4257.042,4468.288,4685.076,4907.092,5133.936,5365.094,5839.152,6326.952,-0.019175,21.010975,41.980555,62.909625,83.818275,104.706505,125.59439,146.47193,167.34917,188.22611,209.102765,229.999165,250.89531,271.8112,292.73685,313.672275,334.627445,355.602405,376.597125,397.61162,418.655875,439.719905,460.82371,481.967275,503.140615,524.3537,545.61653,566.91912,588.28144,609.703505,631.175285,652.71678,674.337975,696.02887,717.799435,739.659655,761.609545,783.669045,805.828155,828.10686,842.829195,2593.435,2597.325,2618.94,2639.225,2658.705,2677.535,2695.885,2713.925,2731.655,2749.16,2766.425,2783.635,2800.705,2817.605,2834.55,2851.325,2868.115,2884.95,2901.7,2918.465,2935.16,2951.97,2968.695,2985.535,3002.29,3019.145,3036.03,3052.915,3069.915,3086.815,3103.83,3120.96,3155.22,3189.725,3224.43,3259.38,3294.53,3329.895,3365.49,3401.385,3437.595,3473.92,3510.66,3547.5,3584.74,3622.21,3659.865,3697.835,3736.105,3774.59,3813.375,3852.36,3891.66,3931.26,3971.06,4011.16,4051.475,4256.865,4468.1,4684.98,4906.99,5133.815,5364.97,5839.11,6326.81,-0.00904,21.01112,41.980672,62.90968,83.818224,104.706352,125.58408,146.461472,167.328512,188.205248,209.091696,229.977856,250.883744,271.78936,292.71472,313.649824,334.604688,355.579312,376.56368,397.577808,418.62168,439.695328,460.79872,481.931856,503.104736,524.31736,545.569728,566.881824,588.233632,609.655168,631.1264,652.667344,674.287952,695.96824,717.738176,739.597776,761.546976,783.605792,805.764192,828.042144,850.439632,856.606112,2594.816,2614.148,2635.104,2654.968,2674.192,2692.86,2711.14,2729.1,2746.756,2764.276,2781.544,2798.76,2815.824,2832.836,2849.78,2866.656,2883.448,2900.272,2917.128,2933.9,2950.788,2967.592,2984.412,3001.248,3018.1,3035.068,3052.036,3068.92,3086.02,3103.02,3120.136,3154.484,3189.048,3223.76,3258.672,3293.916,3329.276,3364.952,3400.944,3437.036,3473.46,3510.184,3547.108,3584.348,3621.804,3659.46,3697.516,3735.788,3774.26,3813.048,3852.12,3891.424,3931.012,3970.8,4010.904,4051.208,4256.576,4467.908,4684.772,4906.868,5133.696,5364.84,5838.976,6326.76,-0.008722,21.01144,41.970918,62.899802,83.798164,104.686058,125.563502,146.44055,167.307238,188.183566,209.05957,229.94525,250.840624,271.755692,292.670472,313.604982,334.559204,355.523138,376.51682,397.530214,418.56332,439.636174,460.72874,481.861036,503.033026,524.244746,545.49616,566.797268,588.14807,609.568548,631.038702,652.568514,674.177966,695.86704,717.625736,739.484036,761.431904,783.46934,805.62629,827.892754,850.288696,882.367744,2597.234,2604.09,2626.41,2647.336,2667.36,2686.664,2705.494,2723.832,2741.96,2759.778,2777.45,2794.894,2812.192,2829.426,2846.514,2863.52,2880.562,2897.54,2914.454,2931.386,2948.318,2965.304,2982.19,2999.194,3016.098,3033.138,3050.078,3067.136,3084.212,3101.388,3118.482,3152.988,3187.63,3222.39,3257.486,3292.7,3328.232,3363.882,3399.85,3436.118,3472.622,3509.326,3546.23,3583.452,3620.992,3658.732,3696.79,3735.048,3773.606,3812.464,3851.54,3890.834,3930.41,3970.304,4010.398,4050.692,4256.116,4467.512,4684.462,4906.53,5133.352,5364.574,5838.79,6326.66,-0.00838,21.0118,41.97122,62.88998,83.78814,104.6758,125.54296,146.41968,167.286,188.15192,209.03748,229.91268,250.80754,271.71206,292.63626,313.56016,334.51374,355.47702,376.45998,397.47266,418.50502,439.56706,460.66882,481.79026,502.96138,524.16216,545.41264,566.71276,588.06256,609.47198,630.94104,652.47974,674.07802,695.7559,717.51336,739.36036,761.3069,783.34294,805.48848,827.75346,850.13786,895.31476,906.1465,2599.13,2617.24,2639.38,2660.2,2680.2,2699.68,2718.58,2737,2755.2,2773.18,2790.94,2808.46,2825.92,2843.24,2860.5,2877.6,2894.72,2911.78,2928.86,2945.88,2962.9,2979.96,2997.02,3014.12,3031.12,3048.24,3065.36,3082.5,3099.66,3116.84,3151.4,3186.1,3221.02,3256.18,3291.48,3327.08,3362.8,3398.84,3435.1,3471.68,3508.36,3545.46,3582.66,3620.18,3658.02,3696.06,3734.4,3772.94,3811.8,3850.86,3890.24,3929.82,3969.68,4009.88,4050.16,4255.76,4467.22,4684.14,4906.3,5133.1,5364.42,5838.62,6326.48,0.002002,21.0122,41.96154,62.880176,83.778174,104.655578,125.532454,146.388846,167.264798,188.13031,209.005426,229.880146,250.774492,271.678464,292.592106,313.515374,334.468312,355.43092,376.413198,397.415146,418.446742,439.508008,460.598922,481.729506,502.88976,524.08964,545.339168,566.638322,587.97708,609.385464,630.843452,652.381,673.97813,695.64482,717.401026,739.246748,761.181964,783.21663,805.350724,827.614224,849.987086,895.150742,928.262494,2600.5644,2607.513,2630.9326,2652.7976,2673.598,2693.614,2713.062,2732.064,2750.554,2768.832,2786.898,2804.752,2822.35,2839.892,2857.278,2874.63,2891.904,2909.122,2926.362,2943.524,2960.608,2977.736,2994.864,3012.014,3029.186,3046.28,3063.496,3080.712,3097.95,3115.188,3149.908,3184.672,3219.658,3254.888,3290.34,3325.936,3361.732,3397.85,3434.19,3470.73,3507.514,3544.576,3581.882,3619.488,3657.294,3695.422,3733.75,3772.278,3811.128,3850.278,3889.65,3929.3,3969.172,4009.366,4049.738,4255.286,4466.844,4683.824,4905.97,5132.86,5364.172,5838.44,6326.374,0.00265,21.00285,41.962125,62.87055,83.75825,104.6353,125.501775,146.357675,167.22305,188.08795,208.9624,229.8364,250.719975,271.62315,292.5259,313.458275,334.390275,355.351875,376.3331,397.333925,418.3644,439.414475,460.504175,481.6235,502.7824,523.980925,545.219025,566.516725,587.853975,609.2508,630.70715,652.233025,673.818425,695.4833,717.237675,739.07145,760.994675,783.017275,805.14925,827.400525,849.7611,894.899875,940.65515,958.916425,2602.0275,2617.545,2641.1875,2663.2675,2684.295,2704.62,2724.205,2743.425,2762.2575,2780.675,2799,2816.975,2834.825,2852.525,2870.1,2887.575,2905.025,2922.5,2939.8,2957.125,2974.4,2991.675,3008.9,3026.225,3043.475,3060.725,3078.125,3095.4,3112.725,3147.575,3182.575,3217.725,3253,3288.525,3324.25,3360.125,3396.3,3432.7,3469.325,3506.175,3543.325,3580.7,3618.275,3656.175,3694.275,3732.675,3771.3,3810.225,3849.375,3888.8,3928.45,3968.325,4008.475,4048.95,4254.65,4466.25,4683.325,4905.525,5132.475,5363.875,5838.225,6326.125,0.01393,21.00417,41.94324,62.85135,83.72859,104.59505,125.45079,146.30587,167.16032,188.0242,208.88754,229.75034,250.63263,271.52444,292.42577,313.34662,334.27702,355.22697,376.20644,397.19546,418.21403,439.26215,460.34982,481.45701,502.60372,523.79998,545.02573,566.31097,587.6357,609.02992,630.47357,651.98668,673.56919,695.2211,716.95235,738.77297,760.68287,782.69205,804.81048,827.03807,849.39482,894.49553,940.19207,986.60381,1004.64993,2603.208,2619.81,2644.619,2667.715,2689.702,2710.714,2731.012,2750.763,2770.143,2789.134,2807.721,2826.189,2844.432,2862.435,2880.398,2898.209,2915.865,2933.563,2951.1,2968.67,2986.17,3003.7,3021.13,3038.62,3056.11,3073.63,3091.15,3108.6,3143.76,3178.98,3214.33,3249.84,3285.45,3321.32,3357.42,3393.75,3430.31,3466.97,3503.99,3541.18,3578.7,3616.35,3654.3,3692.58,3730.96,3769.64,3808.65,3847.86,3887.27,3927.01,3967.05,4007.19,4047.63,4253.55,4465.29,4682.59,4904.85,5131.87,5363.32,5837.84,6325.79,0.01546,21.005705,41.93462,62.82238,83.69916,104.554995,125.410025,146.254285,167.10781,187.95067,208.8129,229.6745,250.54554,271.435985,292.32587,313.235195,334.16403,355.11227,376.07002,397.057245,418.073945,439.110085,460.1857,481.29079,502.43532,523.60929,544.8327,566.105515,587.42777,608.80936,630.240355,651.74065,673.310315,694.949245,716.67744,738.484865,760.381485,782.377265,804.47217,826.686095,849.01904,894.08171,939.739585,986.091895,1033.297765,1045.477605,2602.897,2624.0505,2649.792,2673.657,2696.3405,2717.976,2738.8145,2759.121,2778.871,2798.2435,2817.221,2835.986,2854.535,2872.954,2891.1325,2909.267,2927.254,2945.083,2962.954,2980.6635,2998.4045,3016.077,3033.7775,3051.5025,3069.152,3086.826,3104.4175,3139.86,3175.255,3210.82,3246.555,3282.525,3318.53,3354.735,3391.21,3427.82,3464.73,3501.775,3539.155,3576.635,3614.45,3652.465,3690.78,3729.23,3768.115,3807.065,3846.35,3885.87,3925.655,3965.675,4005.895,4046.415,4252.555,4464.4,4681.75,4904.17,5131.26,5362.785,5837.34,6325.465,0.02724,20.99748,41.91624,62.80364,83.66996,104.5152,125.35948,146.20292,167.04552,187.88736,208.73848,229.58892,250.45864,271.33772,292.2262,313.13404,334.05124,354.98784,375.94388,396.92928,417.93408,438.96828,460.02188,481.12484,502.2572,523.42892,544.63996,565.9004,587.22012,608.57912,630.00744,651.495,673.05176,694.68776,716.39288,738.18716,760.07052,782.05292,804.13428,826.3346,848.6538,893.66848,939.28772,985.59068,1032.68632,1080.79324,1082.48976,2601.696,2629.992,2656.428,2680.912,2704.132,2726.22,2747.528,2768.216,2788.356,2808.024,2827.408,2846.488,2865.356,2883.996,2902.408,2920.776,2938.996,2957.068,2975.084,2993.036,3011.028,3028.852,3046.708,3064.592,3082.4,3100.232,3135.964,3171.672,3207.448,3243.38,3279.464,3315.7,3352.08,3388.56,3425.42,3462.38,3499.58,3537.02,3574.66,3612.54,3650.62,3689,3727.62,3766.48,3805.5,3844.86,3884.42,3924.22,3964.28,4004.58,4045.12,4251.44,4463.42,4680.92,4903.5,5130.66,5362.22,5836.94,6325.04,0.039315,20.999495,41.908055,62.785175,83.640945,104.48559,125.3192,146.151775,166.98345,187.82427,208.66428,229.513525,250.372005,271.23972,292.12676,313.02308,333.93868,354.86365,375.817945,396.79152,417.784465,438.816735,459.868285,480.95916,502.079315,523.238795,544.447555,565.70555,587.00278,608.3592,629.774855,651.259655,672.8036,694.416645,716.118745,737.899855,759.769975,781.73897,803.806885,825.983585,848.279025,893.265765,938.836475,985.090165,1032.175665,1080.171535,1116.486575,2599.6345,2608.026,2637.6705,2664.463,2689.4055,2712.999,2735.4715,2757.1735,2778.16,2798.6085,2818.5965,2838.2015,2857.5055,2876.604,2895.479,2914.126,2932.7405,2951.1045,2969.427,2987.69,3005.798,3023.942,3042.0265,3060.038,3077.9855,3096.0555,3131.972,3167.9785,3203.9615,3240.112,3276.421,3312.784,3349.292,3386.0405,3422.9295,3460.05,3497.32,3534.89,3572.605,3610.62,3648.78,3687.24,3725.9,3764.805,3803.91,3843.36,3882.91,3922.86,3962.91,4003.305,4043.9,4250.32,4462.565,4680.1,4902.725,5130.04,5361.7,5836.455,6324.7,0.0416,20.9918,41.89015,62.7569,83.6122,104.44625,125.2691,146.10085,166.9216,187.7514,208.5903,229.42835,250.28555,271.1519,292.0275,312.91235,333.8164,354.7497,375.69225,396.65405,417.6451,438.6654,459.70495,480.79375,501.90175,523.059,544.2554,565.501,586.79575,608.1396,629.5426,651.01465,672.54575,694.1559,715.84495,737.60295,759.4598,781.41545,803.4699,825.633,847.9147,892.8636,938.3858,984.5903,1031.5658,1079.45065,1128.52265,1148.16805,2596.97,2616.965,2646.73,2673.72,2698.97,2722.77,2745.55,2767.47,2788.78,2809.455,2829.67,2849.61,2869.155,2888.39,2907.515,2926.41,2945.07,2963.69,2982.16,3000.585,3018.95,3037.155,3055.4,3073.575,3091.785,3127.99,3164.295,3200.585,3236.85,3273.28,3309.875,3346.615,3383.405,3420.44,3457.71,3495.115,3532.75,3570.61,3608.6,3646.91,3685.45,3724.2,3763.15,3802.35,3841.75,3881.5,3921.4,3961.55,4002,4042.55,4249.25,4461.6,4679.35,4902.05,5129.4,5361.15,5836.05,6324.35,0.054135,20.9943,41.88243,62.738855,83.583685,104.407085,125.22922,146.040145,166.85997,187.68875,208.51654,229.353395,250.199315,271.054355,291.928515,312.81185,333.704305,354.62599,375.556795,396.51683,417.505985,438.51437,459.551875,480.61861,501.734465,522.87944,544.063535,565.29675,586.57903,607.92032,629.310675,650.769985,672.298305,693.89547,715.561535,737.316445,759.160035,781.102415,803.133365,825.282885,847.55092,892.451985,937.935735,984.091125,1031.05667,1078.830665,1127.79069,1177.93405,2593.669,2593.836,2627.3815,2657.0125,2684.1485,2709.53,2733.5635,2756.483,2778.639,2800.0875,2821.0065,2841.363,2861.4515,2881.2445,2900.631,2919.9055,2938.957,2957.8745,2976.6525,2995.2855,3013.868,3032.3,3050.7705,3069.0795,3087.427,3124.0155,3160.514,3197.006,3233.586,3270.243,3306.966,3343.844,3380.8715,3418.0485,3455.3695,3492.9235,3530.616,3568.536,3606.6835,3645.064,3683.661,3722.48,3761.521,3800.784,3840.258,3880.0485,3919.95,3960.19,4000.63,4041.37,4248.235,4460.72,4678.515,4901.375,5128.79,5360.615,5835.52,6324.045,0.05692,20.98704,41.865,62.72104,83.54534,104.36814,125.17956,145.98966,166.80856,187.61632,208.443,229.26866,250.1133,270.96698,291.82976,312.70158,333.59244,354.50246,375.43158,396.3798,417.35712,438.36354,459.38912,480.45374,501.5574,522.69016,543.87196,565.1028,586.37256,607.70136,629.08908,650.53566,672.04116,693.62546,715.2885,737.03028,758.86074,780.77976,802.80728,824.93324,847.17758,892.05092,937.49628,983.59258,1030.44832,1078.21158,1127.05978,1177.28938,1205.98444,2589.912,2606.106,2638.928,2668.366,2695.474,2720.92,2745.014,2768.09,2790.394,2812.002,2833.072,2853.592,2873.832,2893.686,2913.33,2932.77,2951.982,2970.96,2989.904,3008.702,3027.454,3046.054,3064.596,3083.074,3119.944,3156.734,3193.538,3230.332,3267.11,3304.054,3341.07,3378.24,3415.558,3453.03,3490.638,3528.482,3566.462,3604.772,3643.212,3681.876,3720.764,3759.876,3799.206,3838.754,3878.52,3918.604,3958.8,3999.314,4040.04,4247.12,4459.74,4677.68,4900.6,5128.18,5360.02,5835.14,6323.68,0.06989,20.98002,41.857745,62.693455,83.51728,104.329415,125.13012,145.939395,166.74737,187.55411,208.36968,229.194145,250.02757,270.86989,291.72117,312.59154,333.48087,354.379225,375.306605,396.253075,417.218505,438.213025,459.23657,480.289075,501.38067,522.51116,543.680675,564.899085,586.166455,607.48272,628.857815,650.291675,671.794365,693.365755,715.015845,736.744505,758.5618,780.46747,802.471645,824.594065,846.81473,891.65034,937.047435,983.104715,1029.940685,1077.593265,1126.42979,1176.44649,1228.1381,1232.71886,2585.6745,2619.33,2651.5545,2680.72,2707.7315,2733.0655,2757.2375,2780.389,2802.768,2824.442,2845.5785,2866.3645,2886.674,2906.6875,2926.405,2946.007,2965.287,2984.4385,3003.555,3022.4235,3041.2505,3060.0165,3078.7345,3115.881,3152.964,3190.0705,3226.981,3264.076,3301.1555,3338.3,3375.6095,3413.071,3450.691,3488.45,3526.348,3564.485,3602.761,3641.363,3680.091,3719.0515,3758.2315,3797.631,3837.2565,3877.095,3917.153,3957.4305,3998.021,4038.8245,4246.0175,4458.825,4676.86,4899.925,5127.555,5359.515,5834.765,6323.245,0.07317,20.98324,41.84079,62.67603,83.48938,104.29098,125.0909,145.88935,166.6864,187.49212,208.29658,229.10985,249.942,270.77296,291.62287,312.49166,333.36947,354.26616,375.18187,396.11653,417.08014,438.0627,459.07428,480.12474,501.21415,522.33244,543.48968,564.69573,585.95066,607.26433,628.62681,650.04803,671.53792,693.10648,714.74357,736.45919,758.25327,780.15567,802.14639,824.24536,846.45237,891.2503,936.60913,982.61753,1029.33382,1076.97583,1125.70083,1175.70476,1227.28216,1258.23698,2580.954,2597.799,2633.456,2664.993,2693.816,2720.657,2745.997,2770.066,2793.201,2815.667,2837.415,2858.631,2879.494,2899.876,2919.97,2939.862,2959.538,2978.991,2998.321,3017.407,3036.456,3055.454,3074.301,3111.828,3149.202,3186.509,3223.728,3260.945,3298.253,3335.531,3372.979,3410.583,3448.25,3486.159,3524.217,3562.41,3600.845,3639.415,3678.306,3717.332,3756.579,3796.054,3835.75,3875.567,3915.705,3956.157,3996.723,4037.503,4244.913,4457.882,4676.14,4899.21,5126.92,5358.97,5834.24,6322.92,0.0867,20.9767,41.824,62.6489,83.461775,104.2527,125.0419,145.829525,166.62565,187.42035,208.2237,229.035775,249.85665,270.68625,291.524725,312.382075,333.2583,354.1434,375.047375,395.980225,416.932025,437.9127,458.92225,479.960675,501.0379,522.154,543.298975,564.502675,585.7451,607.046325,628.3962,649.814725,671.291825,692.8375,714.461675,736.1742,757.955075,779.8343,801.82165,823.89705,846.1005,890.8608,936.171425,982.12095,1028.82765,1076.359275,1124.97275,1174.8641,1226.327475,1279.754325,1282.638425,2575.925,2613.835,2648.3275,2679.19,2707.59,2734.27,2759.4325,2783.41,2806.55,2829.0075,2850.8525,2872.155,2892.9925,2913.4575,2933.735,2953.71,2973.46,2993,3012.4,3031.675,3050.795,3069.875,3107.6775,3145.345,3182.955,3220.385,3257.82,3295.2525,3332.76,3370.35,3408.1,3445.91,3483.8725,3522.0875,3560.34,3598.93,3637.565,3676.5225,3715.6175,3754.935,3794.3825,3834.1525,3874.1375,3914.3525,3954.775,3995.4275,4036.2875,4243.905,4457,4675.305,4898.575,5126.35,5358.4,5833.825,6322.575,0.09048,20.9704,41.81744,62.632,83.42432,104.21464,125.00312,145.77992,166.56504,187.3588,208.15104,228.95192,249.77152,270.58984,291.42688,312.27272,333.13736,354.0208,374.92312,395.84424,416.79416,437.76288,458.77048,479.7968,500.862,521.96584,543.10848,564.29984,585.53992,606.82864,628.17592,649.57176,671.04608,692.57888,714.19008,735.8796,757.65736,779.52328,801.48728,823.55928,845.73912,890.46176,935.73424,981.63504,1028.32224,1075.74344,1124.34568,1174.12456,1225.37416,1278.6856,1306.22264,2570.492,2592.268,2630.36,2663.68,2693.984,2721.964,2748.3,2773.304,2797.304,2820.352,2842.808,2864.648,2885.948,2906.876,2927.432,2947.692,2967.748,2987.592,3007.216,3026.704,3046.156,3065.364,3103.54,3141.592,3179.296,3217.036,3254.696,3292.352,3329.996,3367.72,3405.616,3443.576,3481.684,3519.956,3558.368,3596.92,3635.712,3674.636,3713.9,3753.288,3792.808,3832.644,3872.712,3912.896,3953.404,3994.028,4034.968,4242.8,4456.028,4674.472,4897.776,5125.74,5357.82,5833.48,6322.3,0.09879,20.96852,41.7851,62.58889,83.37016,104.13918,124.90622,145.68128,166.44463,187.22627,208.00629,228.79487,249.59192,270.40753,291.23179,312.0647,332.91617,353.78638,374.67533,395.58284,416.50909,437.46408,458.45763,479.46992,500.52086,521.61036,542.73851,563.90522,585.1204,606.39405,627.71617,649.10676,670.54564,692.06272,713.64809,735.32157,757.06307,778.90259,800.83986,822.87497,845.02765,889.67536,934.86173,980.67505,1027.21352,1074.61435,1122.9943,1172.54878,1223.5714,1276.5528,1331.87849,1351.13701,2558.49,2589.668,2629.628,2664.521,2695.969,2724.956,2752.138,2777.907,2802.509,2826.272,2849.16,2871.546,2893.303,2914.604,2935.631,2956.284,2976.727,2996.869,3016.792,3036.596,3056.263,3095.177,3133.798,3172.108,3210.262,3248.351,3286.357,3324.371,3362.466,3400.551,3438.799,3477.119,3515.593,3554.221,3592.994,3631.912,3671.066,3710.465,3749.891,3789.653,3829.642,3869.749,3910.092,3950.653,3991.432,4032.438,4240.684,4454.172,4672.903,4896.414,5124.478,5356.75,5832.51,6321.63,0.118,20.9576,41.7636,62.5466,83.3069,104.0646,124.8202,145.5736,166.325,187.0946,207.8625,228.6386,249.4232,270.2261,291.0276,311.8575,332.6959,353.5429,374.4184,395.3125,416.2351,437.1762,458.1459,479.1441,500.1808,521.246,542.3596,563.5116,584.712,605.9608,627.2678,648.633,670.0565,691.548,713.1075,734.755,756.4803,778.2834,800.1942,822.2024,844.3181,888.891,934.0014,979.7177,1026.1076,1073.3885,1121.6467,1170.9773,1221.7737,1274.4261,1329.3196,1387.5291,1393.5741,2545.2,2590.1,2631.36,2667.23,2699.6,2729.45,2757.32,2783.7,2808.83,2833.04,2856.48,2879.24,2901.47,2923.16,2944.48,2965.53,2986.28,3006.74,3026.97,3046.99,3086.74,3125.93,3164.83,3203.5,3242.02,3280.38,3318.75,3357.12,3395.58,3434.03,3472.55,3511.33,3550.07,3589.07,3628.21,3667.5,3706.93,3746.6,3786.5,3826.53,3866.79,3907.28,3947.9,3988.74,4029.9,4238.47,4452.32,4671.23,4894.96,5123.24,5355.65,5831.66,6320.8,0.12819,20.94753,41.73313,62.49532,83.24443,103.9909,124.72495,145.46669,166.21634,186.9639,207.71948,228.4833,249.25536,270.03566,290.8342,311.6412,332.46655,353.31025,374.17241,395.05303,415.952,436.87932,457.8351,478.81934,499.84182,520.89265,541.98183,563.11925,584.30491,605.5387,626.82062,648.16067,669.56863,691.03461,712.57839,734.18997,755.88913,777.67598,799.55019,821.53165,843.61036,888.11854,933.1533,978.77266,1025.10453,1072.16572,1120.3026,1169.51,1220.08088,1272.40523,1326.86787,1384.44361,1434.02639,2530.41,2542.086,2593.285,2635.384,2672.025,2705.001,2735.359,2763.767,2790.704,2816.293,2840.868,2864.696,2887.844,2910.368,2932.457,2954.089,2975.353,2996.427,3017.1,3037.661,3078.136,3117.986,3157.467,3196.646,3235.601,3274.399,3313.129,3351.769,3390.519,3429.257,3468.072,3506.964,3545.922,3585.135,3624.414,3663.926,3703.493,3743.293,3783.237,3823.425,3863.835,3904.378,3945.143,3986.141,4027.361,4236.358,4450.462,4669.663,4893.595,5122.003,5354.554,5830.753,6320.16,0.13936,20.93852,41.70348,62.45484,83.18296,103.91808,124.64068,145.36064,166.09844,186.83396,207.57732,228.32876,249.08828,269.856,290.6418,311.4358,332.24812,353.07864,373.91748,394.78452,415.66988,436.58344,457.52544,478.49552,499.50392,520.5404,541.61508,562.73796,583.89892,605.10784,626.37472,647.69956,669.08224,690.52264,712.04076,733.63636,755.30956,777.07,798.9178,820.8626,842.9144,887.34816,932.2974,977.8402,1024.00404,1071.04604,1118.962,1167.94664,1218.29276,1270.39004,1324.52288,1381.46644,1442.57608,1473.1844,2514.232,2547.948,2599.08,2641.448,2678.448,2711.884,2742.728,2771.512,2798.728,2824.704,2849.68,2873.82,2897.176,2920.012,2942.416,2964.276,2985.856,3007.056,3028.064,3069.356,3109.948,3150.016,3189.7,3229.088,3268.332,3307.42,3346.428,3385.356,3424.392,3463.5,3502.604,3541.78,3581.216,3620.6,3660.256,3700.06,3740,3780.088,3820.412,3860.872,3901.568,3942.388,3983.532,4024.812,4234.136,4448.604,4668.096,4892.24,5120.764,5353.456,5829.952,6319.496,0.15151,20.93034,41.68475,62.40526,83.12226,103.83614,124.54716,145.26545,165.9814,186.70488,207.42602,228.16521,248.91219,269.67722,290.44017,311.2313,332.02048,352.83784,373.67325,394.52697,415.39874,436.29856,457.22656,478.17274,499.16697,520.18925,541.24958,562.34783,583.494,604.68809,625.92997,647.22964,668.5971,690.02196,711.51448,733.08427,754.73146,776.45579,798.27713,820.19535,842.22032,886.58973,931.46367,976.91006,1023.00643,1069.9294,1117.62481,1166.48733,1216.60929,1268.38016,1322.18447,1378.59726,1438.8755,1505.13183,1511.13563,2496.56,2556.623,2607.153,2649.411,2686.656,2720.211,2751.268,2780.271,2807.803,2834.012,2859.207,2883.662,2907.338,2930.409,2952.949,2975.145,2996.858,3018.301,3060.499,3101.748,3142.483,3182.678,3222.581,3262.166,3301.607,3340.991,3380.305,3419.523,3458.832,3498.245,3537.623,3577.179,3616.8,3656.686,3696.511,3736.701,3776.93,3817.298,3857.905,3898.751,3939.723,3980.834,4022.171,4232.02,4446.737,4666.418,4890.772,5119.534,5352.352,5829.052,6318.716,0.1645,20.9231,41.65694,62.36658,83.06244,103.76508,124.4645,145.16112,165.86508,186.56652,207.28558,228.0124,248.74684,269.48918,290.24942,311.0177,331.80388,352.60796,373.42008,394.26024,415.11844,436.00468,456.91882,477.861,498.83108,519.8292,540.87508,561.95886,583.0904,604.25956,625.48662,646.77116,668.11318,689.51268,710.98952,732.53356,754.1548,775.86296,797.64804,819.53976,841.52798,885.83322,930.63208,975.99232,1022.01128,1068.71574,1116.39108,1165.03184,1215.03032,1266.4756,1319.85228,1375.83558,1435.28392,1500.21638,1548.46364,2477.11,2504.342,2567.852,2617.308,2659.126,2696.176,2729.822,2760.94,2790.19,2817.774,2844.208,2869.65,2894.244,2918.076,2941.39,2964.172,2986.508,3008.484,3051.472,3093.552,3134.868,3175.55,3215.97,3256,3295.798,3335.55,3375.142,3414.646,3454.262,3493.876,3533.474,3573.256,3613.094,3653.002,3693.066,3733.3,3773.662,3814.28,3854.94,3895.828,3936.958,3978.23,4019.63,4229.794,4444.976,4664.85,4889.404,5118.282,5351.242,5828.154,6318.044,0.1786,20.9168,41.6299,62.31865,83.0035,103.68475,124.3727,145.05765,165.74975,186.43915,207.146,227.86045,248.58235,269.31215,290.05955,310.81485,331.58805,352.369,373.17785,394.0046,414.84925,435.72165,456.6121,477.5403,498.49625,519.4801,540.5117,561.5809,582.68785,603.84225,625.0544,646.31385,667.6306,689.0148,710.466,731.98435,753.5797,775.26175,797.0305,818.8858,840.83735,885.0786,929.8026,975.07695,1021.0188,1067.60485,1115.1606,1163.68005,1213.35555,1264.57615,1317.6261,1373.08125,1431.9011,1495.7102,1567.93305,1585.34575,2455.63,2520.885,2580.97,2629.005,2670.365,2707.08,2740.635,2771.75,2800.875,2828.635,2855.24,2880.745,2905.505,2929.475,2952.955,2975.9,2998.395,3042.36,3085.19,3127.165,3168.44,3209.285,3249.84,3290.005,3330.02,3369.985,3409.785,3449.59,3489.415,3529.33,3569.22,3609.285,3649.325,3689.625,3729.985,3770.505,3811.155,3851.965,3893.02,3934.205,3975.52,4017.08,4227.67,4443.115,4663.28,4887.945,5117.05,5350.135,5827.255,6317.38,0.18352,20.90144,41.59392,62.28176,82.94544,103.61528,124.28176,144.95504,165.63528,186.31264,207.00728,227.6992,248.40888,269.13584,289.86056,310.61304,331.36312,352.14096,372.9364,393.73976,414.57088,435.42976,456.31624,477.22048,498.16248,519.13208,540.14928,561.19408,582.28648,603.42616,624.61328,645.85768,667.15936,688.51816,709.94392,731.43664,753.016,774.66216,796.40464,818.2336,840.15856,884.336,928.9852,974.17376,1020.02896,1066.49696,1113.83328,1162.232,1211.78512,1262.6816,1315.40576,1370.5336,1428.62624,1491.31296,1561.5392,1622.34896,2431.8592,2460.7472,2538.824,2595.664,2642.252,2682.792,2719.104,2752.316,2783.352,2812.584,2840.332,2866.916,2892.504,2917.332,2941.484,2965.028,2988.132,3033.088,3076.724,3119.376,3161.248,3202.592,3243.592,3284.2,3324.584,3364.828,3404.916,3445.032,3485.044,3525.068,3565.188,3605.372,3645.752,3686.08,3726.572,3767.228,3808.048,3849,3890.2,3931.432,3972.912,4014.524,4225.548,4441.248,4661.596,4886.58,5115.804,5349.036,5826.448,6316.608,0.19957,20.89702,41.56886,62.23577,82.88826,103.53684,124.19168,144.85312,165.5115,186.18682,206.85925,227.54896,248.24612,268.95056,289.67245,310.40196,331.14909,351.91367,372.68604,393.48586,414.30347,435.1487,456.01138,476.90185,497.82977,518.78514,539.77813,560.8184,581.88612,603.01112,624.1834,645.40296,666.67946,688.0229,709.42311,730.90026,752.44384,774.07402,795.79046,817.59299,839.49144,883.59508,928.16985,973.27286,1018.94156,1065.39187,1112.6092,1160.7876,1210.11891,1260.89191,1313.29096,1367.89277,1425.45926,1487.22413,1555.64968,1637.24134,1659.92258,2405.1947,2487.8354,2557.779,2611.534,2656.597,2696.254,2731.98,2764.971,2795.857,2824.919,2852.672,2879.265,2904.93,2929.85,2954.091,2977.702,3023.634,3068.093,3111.494,3153.952,3195.916,3237.252,3278.309,3319.053,3359.567,3399.951,3440.354,3480.576,3520.917,3561.243,3601.571,3642.067,3682.631,3723.263,3764.063,3805.014,3846.016,3887.269,3928.673,3970.194,4011.966,4223.319,4439.384,4660.025,4885.206,5114.559,5347.933,5825.557,6315.923,0.20642,20.88336,41.54454,62.1905,82.83196,103.4691,124.10246,144.75222,165.39856,186.06184,206.72224,227.39958,248.08404,268.77598,289.48522,310.20176,330.93578,351.67746,372.44644,393.2329,414.03702,434.85862,455.70752,476.59408,497.49794,518.43928,539.41792,560.43386,581.4971,602.59746,623.74476,644.94936,666.21072,687.52884,708.91372,730.36518,751.88322,773.4873,795.1776,816.94394,838.81596,882.85614,927.36652,972.38422,1017.95654,1064.28952,1111.3883,1159.44676,1208.55662,1259.10672,1311.18158,1365.45798,1422.39956,1483.34332,1550.16542,1628.04618,1698.9836,2374.7694,2420.0984,2513.737,2577.358,2628.376,2671.912,2710.59,2745.786,2778.466,2809.022,2838.028,2865.594,2892.202,2917.88,2942.792,2967.12,3014.098,3059.47,3103.528,3146.664,3189.042,3230.908,3272.408,3313.424,3354.32,3395.078,3435.68,3476.208,3516.662,3557.206,3597.758,3638.382,3679.078,3719.964,3760.786,3801.898,3843.046,3884.448,3925.886,3967.578,4009.424,4221.186,4437.514,4658.446,4883.738,5113.318,5346.814,5824.646,6315.246,0.21404,20.87062,41.51112,62.14611,82.76635,103.39222,124.01391,144.65199,165.28665,185.92789,206.5859,227.24087,247.91299,268.59226,289.28868,309.99244,330.71354,351.45198,372.20776,392.97088,413.76153,434.57933,455.41466,476.27733,497.17715,518.09431,539.05881,560.06027,581.09907,602.18464,623.31736,644.50685,665.7433,687.03614,708.39575,729.83175,751.33395,772.90216,794.56657,816.30661,838.15209,882.12899,926.56518,971.50781,1017.07403,1063.18985,1110.17033,1158.1092,1207.0981,1257.3262,1309.17754,1363.02951,1419.44677,1479.57023,1544.98684,1619.92965,1719.59894,1740.59137,2339.1313,2460.1219,2538.896,2597.508,2645.852,2687.973,2725.777,2760.336,2792.522,2822.859,2851.614,2879.23,2905.75,2931.336,2956.25,3004.386,3050.668,3095.463,3139.295,3182.269,3224.566,3266.41,3307.882,3349.063,3390.096,3430.9,3471.737,3512.388,3553.172,3593.932,3634.687,3675.618,3716.544,3757.627,3798.767,3840.164,3881.618,3923.229,3964.978,4006.865,4219.051,4435.64,4656.861,4882.362,5112.067,5345.719,5823.836,6314.585,0.2228,20.869,41.4886,62.1026,82.7116,103.3162,123.9264,144.5426,165.1754,185.8046,206.4404,227.093,247.7528,268.4194,289.1032,309.794,330.5022,351.2274,371.96,392.7198,413.4968,434.2912,455.1128,475.9714,496.8474,517.7604,538.7006,559.6878,580.712,601.7732,622.891,644.0558,665.277,686.5548,707.889,729.2994,750.776,772.3286,793.9568,815.6808,837.49,881.4038,925.7658,970.6336,1016.094,1062.1928,1109.0554,1156.775,1205.5436,1255.55,1307.1784,1360.6068,1416.6008,1475.9044,1540.2142,1612.702,1703.6042,1786.4,2294.996,2388.032,2494.202,2563.388,2617.894,2664,2704.68,2741.54,2775.46,2807.28,2837.28,2865.8,2893.26,2919.72,2945.34,2994.6,3041.78,3087.32,3131.82,3175.3,3218.12,3260.42,3302.26,3343.8,3385.14,3426.22,3467.26,3508.24,3549.12,3590.12,3631,3672.06,3713.22,3754.34,3795.74,3837.18,3878.68,3920.44,3962.24,4004.3,4216.82,4433.76,4655.18,4880.98,5110.82,5344.6,5822.94,6313.8,0.24298,20.83814,41.42626,62.00822,82.5849,103.16652,123.75352,144.34634,164.9452,185.55032,206.16192,226.79,247.42456,268.06604,288.72444,309.38954,330.07178,350.77094,371.48702,392.21024,412.96038,433.73744,454.53164,475.35276,496.2008,517.07576,537.98764,558.94622,579.9315,600.96348,622.04194,643.16688,664.3483,685.58576,706.87948,728.23924,749.6746,771.17578,792.76212,814.42406,836.18072,879.96842,924.19302,968.90144,1014.14082,1060.00676,1106.6342,1154.11654,1202.54564,1252.21006,1303.19484,1356.0782,1411.12802,1469.09348,1531.2868,1599.93286,1680.67736,1797.8708,1951.8032,2092.855,2369.7852,2481.5686,2554.1768,2611.0556,2659.0354,2701.332,2739.378,2774.494,2807.27,2838.13,2867.53,2895.604,2922.764,2974.476,3023.624,3070.832,3116.69,3161.366,3205.138,3248.318,3290.984,3333.17,3375.076,3416.758,3458.316,3499.706,3541.028,3582.36,3623.702,3665.032,3706.472,3747.878,3789.45,3831.21,3873.014,3914.884,3956.998,3999.156,4212.528,4430.114,4651.994,4878.136,5108.43,5342.488,5821.22,6312.446,0.26,20.8035,41.339,61.878,82.41075,102.94825,123.4905,144.04825,164.60125,185.17025,205.75525,226.33625,246.93375,267.5475,288.1675,308.79425,329.43775,350.0975,370.77425,391.4575,412.1675,432.904,453.65725,474.427,495.2335,516.0665,536.93575,557.84175,578.78375,599.76225,620.787,641.85775,662.97425,684.15675,705.385,726.68875,748.04775,769.482,790.99125,812.5755,834.244,877.8635,921.88775,966.364,1011.32825,1056.9465,1103.2235,1150.3525,1198.32525,1247.3305,1297.6525,1349.575,1403.3625,1459.675,1519.34,1583.93,1656.1775,1743.5425,1880.245,2279.515,2428.4825,2515.0175,2579.92,2633.4875,2679.835,2721.1925,2758.96,2793.85,2826.725,2857.775,2887.325,2943.125,2995.6,3045.475,3093.425,3140,3185.425,3229.925,3273.75,3317.075,3359.925,3402.375,3444.75,3486.875,3528.85,3570.75,3612.575,3654.425,3696.275,3738.2,3780.225,3822.2,3864.375,3906.6,3949,3991.45,4206.1,4424.575,4647.225,4874,5104.65,5339.125,5818.6,6310.3,0.2899,20.7397,41.1908,61.6541,82.1105,102.5806,123.065,143.5537,164.0473,184.5558,205.0701,225.5996,246.1349,266.6857,287.2426,307.8153,328.3941,348.989,369.6,390.2271,410.8703,431.5396,452.2247,472.9262,493.6635,514.4169,535.2164,556.0314,576.8922,597.7888,618.7309,639.7085,660.7416,681.8196,702.9528,724.1409,745.3936,766.7206,788.1022,809.5678,831.1071,874.4359,918.1459,962.2744,1006.9175,1052.0607,1097.7589,1144.2049,1191.4906,1239.6055,1288.934,1339.462,1391.658,1445.792,1502.304,1562.213,1626.772,1698.296,1782.013,1891.307,2068.866,2275.973,2405.291,2493.702,2562.099,2618.881,2668.207,2712.151,2752.231,2789.355,2823.988,2888,2946.6,3001.44,3053.55,3103.35,3151.68,3198.66,3244.56,3289.72,3334.31,3378.34,3421.91,3465.19,3508.35,3551.16,3593.95,3636.66,3679.29,3721.94,3764.61,3807.24,3849.96,3892.77,3935.67,3978.6,4195.21,4415.3,4639.23,4866.96,5098.57,5333.74,5814.22,6306.81,0.3017,20.66735,41.04355,61.421,81.8104,102.22315,122.6389,143.0587,163.50255,183.95115,204.40415,224.87225,245.35545,265.84375,286.3375,306.8467,327.37135,347.9111,368.457,389.018,409.6048,430.19705,450.8151,471.45825,492.1172,512.8116,533.52145,554.2764,575.05645,595.87195,616.7222,637.61755,658.5573,679.54215,700.58105,721.67435,742.8217,764.0331,785.30785,806.64595,828.0574,871.11825,914.5276,958.3223,1002.5585,1047.23165,1092.55615,1138.4257,1185.0319,1232.46425,1280.8105,1330.3535,1381.0705,1433.43,1487.79,1544.491,1604.3315,1668.561,1738.989,1819.145,1914.911,2037.2855,2183.967,2315.3,2417.38,2497.498,2563.424,2619.742,2669.525,2714.2685,2755.2625,2829.028,2894.9745,2955.491,3012.038,3065.581,3116.9555,3166.625,3214.83,3262.02,3308.295,3353.82,3398.79,3443.44,3487.6,3531.57,3575.28,3618.765,3662.225,3705.59,3748.96,3792.27,3835.55,3878.935,3922.325,3965.75,4184.43,4406.07,4631.155,4859.975,5092.42,5328.285,5809.93,6303.35,0.3048,20.586,40.8864,61.1976,81.52,101.8548,122.2124,142.5832,162.9572,183.3456,203.7476,224.1544,244.5756,265.0116,285.452,305.9076,326.3684,346.8436,367.3344,387.84,408.3504,428.8864,449.4472,470.0128,490.614,511.2296,531.8704,552.5456,573.256,593.9904,614.7696,635.5732,656.4312,677.3232,698.2688,719.2684,740.3112,761.4176,782.5768,803.8088,825.1036,867.9088,911.0404,954.4944,998.4476,1042.7548,1087.6108,1132.9092,1178.942,1225.6992,1273.268,1321.836,1371.48,1422.372,1474.884,1529.264,1586.04,1645.716,1709.324,1778.396,1854.968,1941.764,2041.996,2154.752,2265.832,2364.14,2447.48,2518.152,2579.184,2633.06,2681.576,2766.636,2840.848,2907.664,2969.16,3026.836,3081.488,3133.956,3184.624,3233.9,3281.912,3329.08,3375.62,3421.4,3466.76,3511.76,3556.46,3600.92,3645.18,3689.26,3733.3,3777.26,3821.1,3865.1,3908.94,3952.9,4173.66,4396.86,4623.24,4853.02,5086.24,5322.9,5805.58,6299.9,0.2986,20.50475,40.7192,60.96375,81.22885,101.50585,121.79475,142.106,162.4205,182.7587,203.10015,223.4553,243.8246,264.19805,284.5861,304.9783,325.38465,345.80605,366.2316,386.6722,407.13695,427.60675,448.0907,468.59925,489.1324,509.68015,530.2625,550.85855,571.4892,592.154,612.85295,633.5856,654.35195,675.16155,696.01485,716.9214,737.87075,758.87335,779.93785,801.0547,822.2339,864.7962,907.6625,950.8892,994.38225,1038.3276,1082.8194,1127.75135,1173.2158,1219.40375,1266.2035,1313.902,1362.579,1412.312,1463.374,1515.929,1570.314,1626.866,1686.277,1749.0805,1816.547,1889.6985,1969.7445,2057.528,2151.764,2246.407,2335.217,2415.1325,2485.851,2548.5695,2604.715,2701.799,2784.8785,2858.51,2925.3255,2987.2875,3045.4575,3100.851,3154.0285,3205.391,3255.4485,3304.2335,3352.1875,3399.3745,3445.9495,3491.99,3537.66,3583.01,3628.085,3672.895,3717.685,3762.265,3806.725,3851.22,3895.66,3940.135,4162.87,4387.67,4615.34,4846.11,5080.2,5317.485,5801.315,6296.415,0.2935,20.4135,40.562,60.729,80.9265,101.1455,121.3855,141.6275,161.8925,182.17,202.4605,222.7645,243.072,263.3935,283.7285,304.0675,324.4205,344.7775,365.1485,385.534,405.9335,426.3475,446.775,467.217,487.683,508.173,528.677,549.215,569.7765,590.362,610.9805,631.633,652.3185,673.047,693.8185,714.633,735.4895,756.3985,777.3595,798.3725,819.447,861.7785,904.392,947.3235,990.56,1034.1465,1078.178,1122.7475,1167.7485,1213.3715,1259.605,1306.54,1354.355,1403.035,1452.855,1503.975,1556.46,1610.755,1667.08,1725.93,1787.865,1853.465,1923.455,1998.22,2077.5,2160.335,2243.43,2323.44,2397.87,2466.075,2528.1,2636.16,2728.065,2808.46,2880.745,2947.095,3008.95,3067.42,3123.155,3176.835,3228.77,3279.275,3328.695,3377.28,3424.985,3472.18,3518.825,3565.095,3610.975,3656.55,3702,3747.25,3792.4,3837.45,3882.35,3927.35,4152.2,4378.6,4607.4,4839.25,5074.1,5312.15,5797.05,6293,0.2318,20.2092,40.2234,60.2656,80.3476,100.4488,120.571,140.7042,160.8596,181.036,201.2152,221.4166,241.6208,261.8384,282.0582,302.2914,322.5374,342.7874,363.0502,383.3258,403.6054,423.8984,444.2148,464.534,484.8766,505.2326,525.612,546.0142,566.4392,586.887,607.3576,627.861,648.3966,668.9744,689.5744,710.2166,730.8998,751.6252,772.401,793.2184,814.0862,855.9918,898.1266,940.5058,983.2364,1026.2142,1069.5338,1113.2892,1157.4744,1202.0804,1247.3,1293.02,1339.326,1386.406,1434.336,1483.098,1532.862,1583.786,1636.028,1689.734,1745.226,1802.614,1862.184,1924.192,1988.5,2055.07,2123.306,2192.466,2261.34,2328.574,2393.168,2512.198,2616.956,2709.368,2791.884,2866.82,2935.908,3000.392,3061.428,3119.502,3175.406,3229.356,3281.792,3333.048,3383.276,3432.64,3481.304,3529.332,3576.9,3624.084,3670.872,3717.44,3763.776,3809.962,3855.986,3901.942,4130.96,4360.46,4591.78,4825.58,5062.08,5301.5,5788.54,6286.14,0.1462,19.9888,39.8681,59.8041,79.7589,99.7525,119.7663,139.8003,159.8552,179.9317,200.0091,220.1081,240.2094,260.323,280.4482,300.5764,320.7162,340.869,361.0248,381.1822,401.3633,421.546,441.7417,461.9504,482.1707,502.414,522.6703,542.9382,563.2384,583.5509,603.895,624.2514,644.6494,665.069,685.5202,706.0023,726.5253,747.0892,767.6833,788.3176,809.0021,850.5089,892.2216,934.1267,976.3607,1018.8394,1061.5579,1104.6113,1148.0926,1191.8948,1236.113,1280.829,1326.04,1371.732,1418.184,1465.182,1513.012,1561.632,1611.121,1661.644,1713.252,1766.096,1820.313,1875.826,1932.858,1991.232,2050.778,2111.361,2172.246,2233.261,2293.676,2410.296,2518.589,2617.47,2707.297,2789.157,2864.534,2934.714,3000.606,3063.047,3122.639,3180.012,3235.503,3289.349,3342.008,3393.531,3444.19,3494.036,3543.255,3591.919,3640.107,3687.991,3735.564,3782.812,3829.914,3876.863,4109.942,4342.508,4576.31,4812,5050.14,5290.95,5780.12,6279.34,0.0328,19.74,39.5128,59.322,79.1784,99.0744,118.9892,138.9236,158.8784,178.8536,198.8392,218.8368,238.8448,258.8648,278.886,298.9192,318.9644,339.0108,359.0592,379.1296,399.1928,419.2772,439.3636,459.462,479.5716,499.694,519.8376,539.9932,560.16,580.3488,600.5588,620.8,641.0524,661.3352,681.6392,701.9836,722.3484,742.7536,763.1884,783.6528,804.1668,845.3104,886.6284,928.176,969.9208,1011.8088,1054.0344,1096.4944,1139.2824,1182.3912,1225.916,1269.74,1313.968,1358.676,1403.864,1449.5,1495.784,1542.692,1590.192,1638.476,1687.496,1737.328,1788.124,1839.752,1892.356,1945.888,2000.208,2055.268,2110.852,2166.644,2222.36,2332.408,2438.292,2538.132,2631.168,2717.396,2797.404,2871.928,2942.008,3008.336,3071.38,3131.884,3190.2,3246.588,3301.492,3355.18,3407.712,3459.264,3510.096,3560.3,3609.836,3658.988,3707.748,3756.092,3804.204,3852.076,4089.152,4324.852,4560.956,4798.608,5038.34,5280.5,5771.84,6272.6,-0.1005,19.4795,39.1442,58.8454,78.604,98.39,118.2161,138.0605,157.925,177.7987,197.7034,217.6091,237.5249,257.4517,277.3795,297.3183,317.2681,337.2189,357.1716,377.1362,397.1009,417.0775,437.066,457.0655,477.066,497.0775,517.1109,537.1453,557.2007,577.2771,597.3636,617.4711,637.5996,657.7482,677.9269,698.1257,718.3446,738.6027,758.8909,779.2074,799.5531,840.3594,881.3171,922.4435,963.805,1005.3089,1046.9498,1088.9241,1131.1264,1173.6504,1216.388,1259.541,1302.986,1346.723,1390.934,1435.528,1480.56,1526.039,1572.047,1618.648,1665.733,1713.466,1761.838,1810.804,1860.437,1910.71,1961.587,2012.932,2064.736,2116.872,2169.04,2272.744,2374.437,2472.397,2565.592,2653.463,2736.07,2813.738,2886.92,2956.279,3022.342,3085.6,3146.326,3205.202,3262.183,3317.742,3372.152,3425.386,3477.708,3529.309,3580.253,3630.622,3680.416,3729.89,3778.962,3827.787,4068.799,4307.41,4545.891,4785.429,5026.782,5270.18,5763.6,6265.98,-0.268,19.214,38.76,58.373,78.032,97.729,117.455,137.209,156.993,176.786,196.59,216.413,236.236,256.07,275.915,295.77,315.615,335.482,355.339,375.207,395.086,414.966,434.857,454.748,474.65,494.553,514.477,534.411,554.356,574.311,594.287,614.272,634.278,654.314,674.359,694.424,714.518,734.632,754.774,774.945,795.144,835.627,876.26,917.021,958.005,999.031,1040.393,1081.788,1123.511,1165.456,1207.62,1250.09,1292.77,1335.84,1379.19,1422.82,1466.82,1511.17,1555.96,1601.17,1646.79,1692.89,1739.46,1786.48,1833.93,1881.88,1930.3,1979.08,2028.1,2077.44,2126.9,2225.59,2323.05,2418.19,2509.98,2597.87,2681.46,2760.81,2836.12,2907.7,2976.14,3041.56,3104.58,3165.39,3224.28,3281.72,3337.71,3392.5,3446.29,3499.25,3551.36,3602.9,3653.76,3704.22,3754.28,3804,4048.77,4290.3,4531.02,4772.5,5015.27,5259.96,5755.5,6259.4,-0.6464,18.6172,37.9752,57.4076,76.8968,96.424,115.9792,135.5736,155.186,174.8164,194.4572,214.1172,233.7776,253.446,273.1248,292.804,312.4824,332.17,351.8592,371.5476,391.2452,410.9332,430.6416,450.3392,470.0572,489.7656,509.4932,529.2212,548.9584,568.7048,588.4604,608.2364,628.0116,647.8148,667.6184,687.45,707.2896,727.1584,747.0352,766.94,786.8728,826.7912,866.8068,906.9772,947.2212,987.604,1028.1232,1068.7752,1109.5564,1150.562,1191.692,1233.02,1274.576,1316.324,1358.264,1400.496,1442.92,1485.6,1528.448,1571.64,1615.088,1658.756,1702.732,1747.028,1791.508,1836.26,1881.284,1926.568,1971.976,2017.52,2063.1,2154.496,2245.276,2334.924,2422.772,2508.352,2591.28,2671.212,2748.128,2822.084,2893.2,2961.648,3027.8,3091.692,3153.648,3213.968,3272.764,3330.224,3386.548,3441.812,3496.216,3549.748,3602.696,3655.036,3706.868,3758.18,4010.056,4256.976,4502.16,4747.156,4992.892,5240.068,5739.5,6246.464,-1.091,17.9914,37.177,56.4386,75.7676,95.144,114.5578,133.999,153.4604,172.9392,192.4382,211.9346,231.4512,250.9666,270.4808,290.0038,309.527,329.059,348.5812,368.1122,387.632,407.1606,426.6894,446.217,465.7534,485.29,504.8254,524.3696,543.9226,563.4758,583.0364,602.6058,622.184,641.771,661.3668,680.98,700.602,720.2414,739.8882,759.5538,779.2354,818.6508,858.1216,897.6964,937.4138,977.171,1016.9638,1056.9894,1097.0464,1137.2278,1177.528,1218.054,1258.582,1299.326,1340.272,1381.32,1422.456,1463.88,1505.378,1547.036,1588.868,1630.86,1673.084,1715.454,1757.956,1800.576,1843.414,1886.342,1929.374,1972.496,2015.594,2101.946,2188.002,2273.304,2357.594,2440.284,2521.186,2600.098,2676.646,2751.07,2823.14,2892.968,2960.81,3026.55,3090.616,3152.936,3213.752,3273.25,3331.444,3388.648,3444.848,3500.244,3554.836,3608.81,3662.152,3714.976,3973.15,4225.174,4474.362,4722.668,4971.3,5220.764,5723.992,6233.778,-1.582,17.3276,36.3612,55.4804,74.6668,93.9004,113.1828,132.4824,151.8108,171.1496,190.5056,209.8704,229.244,248.6164,267.9976,287.3676,306.7464,326.124,345.5004,364.874,384.238,403.6108,422.9824,442.3528,461.7204,481.0884,500.4636,519.8276,539.2004,558.582,577.9624,597.35,616.7464,636.14,655.5408,674.9504,694.3788,713.8028,733.2456,752.694,772.1612,811.1224,850.1808,889.2416,928.3448,967.5872,1006.8656,1046.1784,1085.6224,1125.1944,1164.788,1204.508,1244.348,1284.292,1324.24,1364.408,1404.564,1444.924,1485.372,1525.892,1566.6,1607.28,1648.132,1689.14,1730.204,1771.308,1812.452,1853.736,1895.06,1936.508,1977.864,2060.548,2143.096,2225.108,2306.332,2386.516,2465.424,2542.768,2618.396,2692.32,2764.404,2834.644,2903.104,2969.832,3034.992,3098.6,3160.704,3221.636,3281.396,3340,3397.664,3454.472,3510.44,3565.668,3620.356,3674.388,3938.176,4194.72,4447.712,4699.188,4950.348,5202.088,5708.96,6221.576,-2.1044,16.652,35.5422,54.528,73.5812,92.6918,111.8416,131.0206,150.227,169.4426,188.6774,207.9096,227.1528,246.3916,265.6314,284.8786,304.115,323.3488,342.5918,361.8222,381.0418,400.2706,419.4868,438.7104,457.9232,477.1434,496.3528,515.5696,534.7756,553.989,573.2098,592.418,611.6454,630.8584,650.0906,669.3202,688.5572,707.7998,727.0516,746.309,765.5738,804.122,842.7262,881.3828,919.98,958.7178,997.4908,1036.4008,1075.2424,1114.2138,1153.206,1192.328,1231.478,1270.738,1310.008,1349.306,1388.796,1428.178,1467.788,1507.372,1547.048,1586.798,1626.658,1666.474,1706.364,1746.31,1786.33,1826.424,1866.456,1906.426,1946.47,2026.554,2106.326,2185.65,2264.48,2342.534,2419.548,2495.412,2569.862,2642.988,2714.662,2784.72,2853.334,2920.44,2986.128,3050.498,3113.586,3175.328,3236.06,3295.782,3354.494,3412.432,3469.496,3525.786,3581.484,3636.626,3905.208,4165.816,4422.236,4676.618,4930.202,5184.118,5694.364,6209.588,-2.642,34.716,72.518,91.516,110.554,148.706,186.922,225.154,263.392,301.622,339.834,378.03,416.198,454.346,492.488,530.61,568.732,606.84,644.97,683.11,721.25,759.41,797.62,835.84,874,912.3,950.64,988.9,1027.32,1065.68,1104.16,1142.66,1219.76,1297.04,1374.48,1452.06,1529.84,1607.72,1685.64,1763.68,1841.72,1919.74,2114,2305.54,2492.18,2671.98,2843.94,3007.92,3315.26,3601.52,4138.48,4654.9,5166.8,5680.32,6198.06,-4.0425,32.6975,69.975,88.7275,107.52,145.1725,182.8775,220.5875,258.275,295.935,333.5675,371.1525,408.7075,446.23,483.715,521.18,558.62,596.0325,633.44,670.825,708.22,745.59,782.95,820.35,857.7,895.1,932.525,969.875,1007.275,1044.725,1082.1,1119.525,1194.325,1269.175,1344,1418.925,1493.7,1568.45,1643.125,1717.725,1792.125,1866.425,2051,2233.45,2412.6,2587.375,2756.825,2920.525,3231.7,3524.725,4076.2,4604.9,5126.125,5647.05,6170.65,-5.406,30.784,67.61,86.148,104.727,141.981,179.256,216.515,253.739,290.921,328.045,365.121,402.139,439.116,476.052,512.937,549.788,586.608,623.407,660.172,696.923,733.68,770.34,807.04,843.71,880.39,917.04,953.63,990.26,1026.9,1063.51,1100.06,1173.15,1246.2,1319.05,1391.93,1464.64,1537.22,1609.6,1681.75,1753.8,1825.49,2003.78,2179.91,2353.41,2523.78,2690.32,2852.61,3164.44,3461.08,4022.23,4560.25,5089.35,5616.54,6145.26,-6.6815,29.001,65.434,83.7915,102.202,139.0885,176.0035,212.8835,249.7185,286.478,323.1655,359.784,396.347,432.8375,469.279,505.668,542.018,578.322,614.587,650.8095,687.0495,723.1935,759.2885,795.4275,831.5,867.555,903.605,939.655,975.6,1011.51,1047.45,1083.355,1155.055,1226.61,1298.055,1369.32,1440.405,1511.245,1582.005,1652.42,1722.62,1792.54,1966.23,2137.765,2307.115,2473.82,2637.59,2798.14,3109.245,3407.54,3975.285,4520.485,5055.975,5588.72,6121.985,-7.836,27.372,63.444,81.644,99.896,136.488,173.088,209.64,246.116,282.516,318.822,355.048,391.192,427.268,463.276,499.226,535.12,570.966,606.774,642.496,678.236,713.924,749.564,785.148,820.78,856.36,891.8,927.26,962.78,998.16,1033.56,1068.82,1139.38,1209.8,1279.98,1349.96,1419.76,1489.36,1558.72,1627.8,1696.54,1765.14,1935.26,2103.38,2269.34,2433.12,2594.52,2753.3,3062.82,3361.84,3934.14,4485.02,5025.88,5563.22,6100.44,-8.846,25.908,61.6535,79.715,97.8275,134.1545,170.479,206.741,242.917,278.9815,314.9455,350.819,386.6075,422.301,457.925,493.4895,528.9845,564.42,599.786,635.1325,670.425,705.6725,740.966,776.1055,811.2,846.3405,881.3315,916.3685,951.365,986.285,1021.16,1056.035,1125.615,1195.015,1264.19,1333.085,1401.855,1470.4,1538.62,1606.615,1674.385,1741.83,1909.125,2074.47,2237.965,2399.21,2558.485,2715.725,3023.42,3322.36,3897.795,4453.285,4998.57,5539.91,6080.62,-9.72,24.61,60.06,77.98,95.975,132.06,168.145,204.15,240.045,275.83,311.49,347.05,382.5,417.865,453.145,488.355,523.485,558.52,593.58,628.585,663.44,698.35,733.21,767.92,802.685,837.395,872.06,906.675,941.24,975.755,1010.225,1044.65,1113.45,1181.95,1250.2,1318.3,1386.1,1453.8,1521.1,1588.2,1655,1721.6,1886.65,2049.8,2211.1,2370.5,2528,2683.65,2989.45,3287.95,3865.45,4424.6,4973.7,5518.5,6062.45,-11.05,22.504,57.398,75.086,92.862,128.534,164.198,199.77,235.208,270.498,305.642,340.662,375.544,410.326,445.01,479.602,514.092,548.534,582.934,617.286,651.596,685.752,719.972,754.038,788.162,822.144,856.178,890.07,924.014,957.81,991.57,1025.382,1092.668,1159.78,1226.7,1293.4,1359.76,1426,1491.86,1557.54,1622.94,1688.12,1849.66,2009.54,2167.6,2324.02,2478.84,2632.12,2934.22,3231.12,3810.5,4374.94,4930.14,5480.96,6030.08,20.994,55.4,72.889,90.478,125.792,161.119,196.329,231.375,266.267,300.981,335.544,369.955,404.238,438.466,472.552,506.503,540.505,574.272,608.09,641.873,675.507,709.106,742.756,776.271,809.744,843.168,876.557,909.904,943.209,976.379,1009.607,1075.837,1141.813,1207.635,1273.203,1338.51,1403.57,1468.39,1532.97,1597.31,1661.41,1820.38,1977.81,2133.57,2287.86,2440.65,2592.14,2891.47,3186.47,3765.76,4333.46,4893.43,5448.87,6002.43,53.988,71.304,88.722,123.736,158.76,193.674,228.402,262.942,297.296,331.496,365.552,399.376,433.168,466.828,500.348,533.836,567.284,600.592,633.868,667.096,700.292,733.348,766.464,799.448,832.492,865.396,898.26,931.092,963.884,996.544,1061.952,1127.024,1191.852,1256.544,1321.008,1385.236,1449.12,1512.9,1576.32,1639.56,1796.64,1952.12,2106.14,2258.82,2410.16,2560.32,2857.34,3150.8,3729.16,4298.7,4861.94,5421.28,5978.58,70.247,87.531,122.287,157.044,191.69,226.146,260.433,294.401,328.351,361.974,395.479,428.957,462.199,495.414,528.493,561.545,594.452,627.332,660.176,692.984,725.656,758.301,791.001,823.574,856.111,888.612,920.977,953.415,985.717,1050.331,1114.719,1178.772,1242.717,1306.436,1369.938,1433.223,1496.2,1558.96,1621.53,1777.01,1931.05,2083.66,2235.02,2385.24,2534.31,2829.68,3121.73,3699,4269.46,4835.07,5397.42,5957.83,86.83,121.35,155.89,190.29,224.54,258.49,292.33,325.86,359.28,392.47,425.54,458.49,491.41,524.1,556.86,589.48,621.98,654.45,686.88,719.29,751.66,783.9,816.21,848.39,880.54,912.66,944.75,976.71,1040.64,1104.36,1167.87,1231.17,1294.27,1357.16,1419.75,1482.24,1544.44,1606.44,1760.6,1913.4,2064.9,2215.2,2364.4,2512.8,2806.7,3097.8,3674,4244.8,4812,5376.7,5939.8]),
+    h: new Float64Array([-0.03,21.03,42.03,62.99,83.92,104.84,125.74,146.64,167.54,188.44,191.81,2583.9,2592,2601.6,2611.2,2620.7,2630.3,2639.8,2649.3,2658.9,2668.4,2677.9,2687.5,2697,2706.5,2716.1,2725.6,2735.2,2744.7,2754.3,2763.9,2773.4,2783,2792.6,2802.3,2811.9,2821.5,2831.2,2840.8,2850.5,2860.2,2869.9,2879.6,2899.1,2918.6,2938.1,2957.8,2977.4,2997.2,3017,3036.8,3056.8,3076.7,3096.8,3116.9,3137,3157.3,3177.5,3197.9,3218.3,3238.8,3259.3,3279.9,3300.6,3321.4,3342.2,3363,3384,3405,3426.1,3447.2,3468.4,3489.7,3532.5,3575.5,3618.8,3662.4,3706.3,3750.4,3794.9,3839.6,3884.6,3929.9,3975.5,4021.3,4067.5,4113.9,4160.6,4207.6,4254.9,4302.4,4350.2,4398.3,4446.7,4495.3,4544.2,4593.4,4642.8,4893.7,5150.7,5413.4,5681.3,5954,6231.1,6797.2,7377,-0.02,21.04,42.04,63,83.93,104.84,125.75,146.65,167.54,188.44,209.35,230.26,251.18,251.42,2608.9,2618.6,2628.3,2638,2647.7,2657.4,2667,2676.6,2686.2,2695.8,2705.4,2715,2724.6,2734.2,2743.9,2753.5,2763.1,2772.7,2782.3,2792,2801.6,2811.3,2820.9,2830.6,2840.3,2850,2859.7,2869.4,2879.1,2898.6,2918.2,2937.8,2957.4,2977.1,2996.9,3016.7,3036.6,3056.5,3076.5,3096.5,3116.7,3136.8,3157.1,3177.4,3197.7,3218.1,3238.6,3259.2,3279.8,3300.5,3321.2,3342,3362.9,3383.9,3404.9,3425.9,3447.1,3468.3,3489.6,3532.4,3575.4,3618.7,3662.3,3706.2,3750.4,3794.8,3839.5,3884.5,3929.8,3975.4,4021.3,4067.4,4113.9,4160.6,4207.6,4254.8,4302.4,4350.2,4398.3,4446.7,4495.3,4544.2,4593.4,4642.8,4893.7,5150.7,5413.4,5681.3,5954,6231.1,6797.2,7377,-0.01,21.05,42.05,63.01,83.94,104.85,125.76,146.66,167.55,188.45,209.36,230.27,251.19,272.12,289.27,2624.5,2626.3,2636.2,2646,2655.8,2665.5,2675.3,2685,2694.7,2704.3,2714,2723.7,2733.3,2743,2752.6,2762.3,2772,2781.6,2791.3,2801,2810.7,2820.4,2830.1,2839.8,2849.5,2859.2,2868.9,2878.7,2898.2,2917.8,2937.4,2957.1,2976.8,2996.6,3016.4,3036.3,3056.2,3076.2,3096.3,3116.4,3136.6,3156.9,3177.2,3197.5,3218,3238.5,3259,3279.6,3300.3,3321.1,3341.9,3362.8,3383.7,3404.7,3425.8,3447,3468.2,3489.5,3532.3,3575.3,3618.6,3662.2,3706.1,3750.3,3794.7,3839.5,3884.5,3929.8,3975.4,4021.2,4067.4,4113.8,4160.5,4207.5,4254.8,4302.3,4350.2,4398.3,4446.6,4495.3,4544.2,4593.3,4642.8,4893.7,5150.7,5413.4,5681.2,5953.9,6231.1,6797.2,7377,0,21.06,42.06,63.02,83.95,104.86,125.77,146.66,167.56,188.46,209.37,230.28,251.2,272.13,293.07,314.03,317.62,2636.1,2644.3,2654.2,2664.1,2673.9,2683.7,2693.5,2703.2,2713,2722.7,2732.4,2742.1,2751.8,2761.5,2771.2,2780.9,2790.6,2800.3,2810.1,2819.8,2829.5,2839.2,2849,2858.7,2868.5,2878.2,2897.8,2917.4,2937,2956.7,2976.5,2996.3,3016.1,3036,3056,3076,3096.1,3116.2,3136.4,3156.7,3177,3197.4,3217.8,3238.3,3258.9,3279.5,3300.2,3320.9,3341.8,3362.6,3383.6,3404.6,3425.7,3446.9,3468.1,3489.4,3532.2,3575.2,3618.5,3662.2,3706,3750.2,3794.7,3839.4,3884.4,3929.7,3975.3,4021.2,4067.3,4113.8,4160.5,4207.5,4254.8,4302.3,4350.1,4398.2,4446.6,4495.2,4544.1,4593.3,4642.7,4893.7,5150.7,5413.3,5681.2,5953.9,6231.1,6797.2,7377,0.01,21.07,42.07,63.03,83.96,104.87,125.78,146.67,167.57,188.47,209.37,230.29,251.21,272.14,293.08,314.04,335.01,340.54,2645.2,2652.6,2662.6,2672.5,2682.4,2692.3,2702.1,2711.9,2721.7,2731.5,2741.2,2751,2760.7,2770.5,2780.2,2790,2799.7,2809.4,2819.2,2828.9,2838.7,2848.4,2858.2,2868,2877.8,2897.4,2917,2936.7,2956.4,2976.1,2996,3015.8,3035.8,3055.7,3075.8,3095.8,3116,3136.2,3156.5,3176.8,3197.2,3217.6,3238.1,3258.7,3279.3,3300,3320.8,3341.6,3362.5,3383.5,3404.5,3425.6,3446.7,3468,3489.3,3532.1,3575.1,3618.5,3662.1,3706,3750.1,3794.6,3839.3,3884.4,3929.7,3975.3,4021.1,4067.3,4113.7,4160.4,4207.4,4254.7,4302.3,4350.1,4398.2,4446.6,4495.2,4544.1,4593.3,4642.7,4893.7,5150.7,5413.3,5681.2,5953.9,6231.1,6797.2,7377,0.02,21.08,42.08,63.04,83.97,104.88,125.78,146.68,167.58,188.48,209.38,230.29,251.21,272.14,293.09,314.05,335.02,356.02,359.91,2652.9,2661.1,2671.1,2681.1,2691.1,2701,2710.9,2720.7,2730.5,2740.3,2750.1,2759.9,2769.7,2779.5,2789.3,2799,2808.8,2818.6,2828.4,2838.1,2847.9,2857.7,2867.5,2877.3,2896.9,2916.6,2936.3,2956,2975.8,2995.7,3015.5,3035.5,3055.5,3075.5,3095.6,3115.8,3136,3156.3,3176.6,3197,3217.4,3238,3258.5,3279.2,3299.9,3320.7,3341.5,3362.4,3383.3,3404.4,3425.5,3446.6,3467.9,3489.2,3532,3575,3618.4,3662,3705.9,3750.1,3794.5,3839.3,3884.3,3929.6,3975.2,4021.1,4067.2,4113.7,4160.4,4207.4,4254.7,4302.2,4350.1,4398.2,4446.5,4495.2,4544.1,4593.2,4642.7,4893.6,5150.6,5413.3,5681.2,5953.9,6231,6797.2,7377,0.03,21.09,42.09,63.05,83.98,104.89,125.79,146.69,167.59,188.49,209.39,230.3,251.22,272.15,293.1,314.06,335.03,356.02,376.75,2659.4,2659.6,2669.7,2679.8,2689.8,2699.8,2709.8,2719.7,2729.6,2739.5,2749.3,2759.1,2769,2778.8,2788.6,2798.4,2808.2,2818,2827.8,2837.6,2847.4,2857.2,2867,2876.8,2896.5,2916.2,2935.9,2955.7,2975.5,2995.4,3015.3,3035.2,3055.2,3075.3,3095.4,3115.6,3135.8,3156.1,3176.4,3196.8,3217.3,3237.8,3258.4,3279,3299.7,3320.5,3341.3,3362.3,3383.2,3404.3,3425.4,3446.5,3467.8,3489.1,3531.9,3574.9,3618.3,3661.9,3705.8,3750,3794.5,3839.2,3884.2,3929.5,3975.1,4021,4067.2,4113.6,4160.3,4207.3,4254.6,4302.2,4350,4398.1,4446.5,4495.1,4544,4593.2,4642.6,4893.6,5150.6,5413.3,5681.2,5953.9,6231,6797.2,7377,0.04,21.1,42.1,63.06,83.99,104.9,125.8,146.7,167.6,188.5,209.4,230.31,251.23,272.16,293.11,314.06,335.04,356.03,377.05,391.71,2665.2,2668.3,2678.5,2688.6,2698.7,2708.7,2718.7,2728.6,2738.6,2748.5,2758.3,2768.2,2778.1,2787.9,2797.7,2807.6,2817.4,2827.2,2837.1,2846.9,2856.7,2866.5,2876.4,2896.1,2915.8,2935.5,2955.3,2975.2,2995,3015,3034.9,3055,3075,3095.1,3115.3,3135.6,3155.9,3176.2,3196.6,3217.1,3237.6,3258.2,3278.9,3299.6,3320.4,3341.2,3362.1,3383.1,3404.1,3425.2,3446.4,3467.6,3488.9,3531.8,3574.8,3618.2,3661.8,3705.7,3749.9,3794.4,3839.1,3884.2,3929.5,3975.1,4021,4067.1,4113.6,4160.3,4207.3,4254.6,4302.1,4350,4398.1,4446.5,4495.1,4544,4593.2,4642.6,4893.6,5150.6,5413.3,5681.2,5953.9,6231,6797.2,7377,0.05,21.11,42.11,63.07,84,104.91,125.81,146.71,167.61,188.51,209.41,230.32,251.24,272.17,293.11,314.07,335.05,356.04,377.05,398.09,405.2,2670.3,2677.1,2687.4,2697.5,2707.6,2717.7,2727.7,2737.7,2747.6,2757.5,2767.4,2777.3,2787.2,2797.1,2806.9,2816.8,2826.7,2836.5,2846.4,2856.2,2866.1,2875.9,2895.6,2915.4,2935.2,2955,2974.8,2994.7,3014.7,3034.7,3054.7,3074.8,3094.9,3115.1,3135.4,3155.7,3176,3196.4,3216.9,3237.5,3258.1,3278.7,3299.4,3320.2,3341.1,3362,3383,3404,3425.1,3446.3,3467.5,3488.8,3531.7,3574.7,3618.1,3661.7,3705.7,3749.8,3794.3,3839.1,3884.1,3929.4,3975,4020.9,4067.1,4113.5,4160.3,4207.3,4254.5,4302.1,4349.9,4398,4446.4,4495.1,4544,4593.2,4642.6,4893.6,5150.6,5413.3,5681.2,5953.9,6231,6797.2,7377,0.06,21.12,42.12,63.08,84.01,104.92,125.82,146.72,167.62,188.51,209.42,230.33,251.25,272.18,293.12,314.08,335.05,356.05,377.06,398.1,417.5,2674.9,2675.8,2686.1,2696.3,2706.5,2716.6,2726.7,2736.7,2746.7,2756.7,2766.7,2776.6,2786.5,2796.4,2806.3,2816.2,2826.1,2836,2845.8,2855.7,2865.6,2875.5,2895.2,2915,2934.8,2954.6,2974.5,2994.4,3014.4,3034.4,3054.4,3074.5,3094.7,3114.9,3135.1,3155.5,3175.8,3196.3,3216.7,3237.3,3257.9,3278.6,3299.3,3320.1,3340.9,3361.9,3382.8,3403.9,3425,3446.2,3467.4,3488.7,3531.6,3574.7,3618,3661.7,3705.6,3749.8,3794.3,3839,3884,3929.4,3975,4020.9,4067,4113.5,4160.2,4207.2,4254.5,4302.1,4349.9,4398,4446.4,4495,4543.9,4593.1,4642.6,4893.5,5150.6,5413.2,5681.2,5953.9,6231,6797.2,7377,0.07,21.13,42.13,63.09,84.02,104.93,125.83,146.73,167.62,188.52,209.43,230.34,251.26,272.19,293.13,314.09,335.06,356.06,377.07,398.11,419.17,428.84,2679.2,2684.8,2695.2,2705.4,2715.6,2725.7,2735.8,2745.9,2755.9,2765.9,2775.9,2785.8,2795.8,2805.7,2815.6,2825.5,2835.4,2845.3,2855.2,2865.1,2875,2894.8,2914.6,2934.4,2954.3,2974.2,2994.1,3014.1,3034.1,3054.2,3074.3,3094.5,3114.7,3134.9,3155.3,3175.6,3196.1,3216.6,3237.1,3257.7,3278.4,3299.1,3319.9,3340.8,3361.7,3382.7,3403.8,3424.9,3446.1,3467.3,3488.6,3531.5,3574.6,3617.9,3661.6,3705.5,3749.7,3794.2,3838.9,3884,3929.3,3974.9,4020.8,4067,4113.4,4160.2,4207.2,4254.5,4302,4349.9,4398,4446.4,4495,4543.9,4593.1,4642.5,4893.5,5150.6,5413.2,5681.1,5953.9,6231,6797.1,7377,0.08,21.14,42.14,63.09,84.02,104.94,125.84,146.74,167.63,188.53,209.43,230.34,251.26,272.19,293.14,314.1,335.07,356.06,377.08,398.12,419.18,439.36,2683.1,2683.5,2693.9,2704.3,2714.6,2724.8,2734.9,2745,2755.1,2765.1,2775.1,2785.1,2795.1,2805,2815,2824.9,2834.9,2844.8,2854.7,2864.6,2874.5,2894.3,2914.2,2934.1,2953.9,2973.9,2993.8,3013.8,3033.8,3053.9,3074,3094.2,3114.4,3134.7,3155.1,3175.4,3195.9,3216.4,3237,3257.6,3278.3,3299,3319.8,3340.7,3361.6,3382.6,3403.6,3424.8,3446,3467.2,3488.5,3531.4,3574.5,3617.8,3661.5,3705.4,3749.6,3794.1,3838.9,3883.9,3929.3,3974.9,4020.8,4066.9,4113.4,4160.1,4207.1,4254.4,4302,4349.8,4397.9,4446.3,4495,4543.9,4593.1,4642.5,4893.5,5150.5,5413.2,5681.1,5953.9,6231,6797.1,7377,0.09,21.15,42.15,63.1,84.03,104.95,125.85,146.75,167.64,188.54,209.44,230.35,251.27,272.2,293.15,314.1,335.08,356.07,377.09,398.12,419.19,440.28,449.19,2686.6,2692.7,2703.2,2713.5,2723.8,2734,2744.1,2754.3,2764.3,2774.4,2784.4,2794.4,2804.4,2814.4,2824.3,2834.3,2844.2,2854.2,2864.1,2874,2893.9,2913.8,2933.7,2953.6,2973.5,2993.5,3013.5,3033.6,3053.7,3073.8,3094,3114.2,3134.5,3154.9,3175.3,3195.7,3216.2,3236.8,3257.4,3278.1,3298.8,3319.7,3340.5,3361.5,3382.5,3403.5,3424.6,3445.8,3467.1,3488.4,3531.3,3574.4,3617.8,3661.4,3705.3,3749.6,3794,3838.8,3883.9,3929.2,3974.8,4020.7,4066.9,4113.3,4160.1,4207.1,4254.4,4301.9,4349.8,4397.9,4446.3,4494.9,4543.9,4593,4642.5,4893.5,5150.5,5413.2,5681.1,5953.8,6231,6797.1,7377,0.1,21.16,42.16,63.11,84.04,104.96,125.86,146.75,167.65,188.55,209.45,230.36,251.28,272.21,293.15,314.11,335.09,356.08,377.09,398.13,419.2,440.29,458.42,2690,2691.5,2702,2712.4,2722.8,2733,2743.3,2753.4,2763.6,2773.6,2783.7,2793.8,2803.8,2813.8,2823.8,2833.7,2843.7,2853.7,2863.6,2873.6,2893.5,2913.4,2933.3,2953.2,2973.2,2993.2,3013.2,3033.3,3053.4,3073.5,3093.7,3114,3134.3,3154.7,3175.1,3195.5,3216,3236.6,3257.3,3277.9,3298.7,3319.5,3340.4,3361.3,3382.3,3403.4,3424.5,3445.7,3467,3488.3,3531.2,3574.3,3617.7,3661.3,3705.3,3749.5,3794,3838.7,3883.8,3929.1,3974.8,4020.6,4066.8,4113.3,4160,4207,4254.3,4301.9,4349.7,4397.9,4446.2,4494.9,4543.8,4593,4642.4,4893.4,5150.5,5413.2,5681.1,5953.8,6231,6797.1,7377,0.11,21.17,42.17,63.12,84.05,104.97,125.87,146.76,167.66,188.56,209.46,230.37,251.29,272.22,293.16,314.12,335.09,356.09,377.1,398.14,419.2,440.3,461.42,467.13,2693.1,2700.8,2711.4,2721.8,2732.1,2742.4,2752.6,2762.8,2772.9,2783,2793.1,2803.1,2813.2,2823.2,2833.2,2843.2,2853.2,2863.1,2873.1,2893,2913,2932.9,2952.9,2972.9,2992.9,3012.9,3033,3053.1,3073.3,3093.5,3113.8,3134.1,3154.5,3174.9,3195.3,3215.9,3236.4,3257.1,3277.8,3298.5,3319.4,3340.3,3361.2,3382.2,3403.3,3424.4,3445.6,3466.9,3488.2,3531.1,3574.2,3617.6,3661.2,3705.2,3749.4,3793.9,3838.7,3883.7,3929.1,3974.7,4020.6,4066.8,4113.2,4160,4207,4254.3,4301.9,4349.7,4397.8,4446.2,4494.9,4543.8,4593,4642.4,4893.4,5150.5,5413.2,5681.1,5953.8,6231,6797.1,7377,0.12,21.18,42.18,63.13,84.06,104.97,125.88,146.77,167.67,188.57,209.47,230.38,251.3,272.23,293.17,314.13,335.1,356.09,377.11,398.15,419.21,440.3,461.43,475.38,2696,2699.7,2710.3,2720.7,2731.1,2741.5,2751.7,2762,2772.1,2782.3,2792.4,2802.5,2812.5,2822.6,2832.6,2842.6,2852.6,2862.6,2872.6,2892.6,2912.6,2932.5,2952.5,2972.5,2992.6,3012.6,3032.7,3052.9,3073.1,3093.3,3113.6,3133.9,3154.2,3174.7,3195.2,3215.7,3236.3,3256.9,3277.6,3298.4,3319.2,3340.1,3361.1,3382.1,3403.2,3424.3,3445.5,3466.8,3488.1,3531,3574.1,3617.5,3661.2,3705.1,3749.3,3793.8,3838.6,3883.7,3929,3974.6,4020.5,4066.7,4113.2,4159.9,4207,4254.3,4301.8,4349.7,4397.8,4446.2,4494.8,4543.8,4592.9,4642.4,4893.4,5150.5,5413.2,5681.1,5953.8,6231,6797.1,7377,0.14,21.2,42.2,63.15,84.08,104.99,125.89,146.79,167.69,188.58,209.49,230.4,251.31,272.24,293.19,314.14,335.12,356.11,377.12,398.16,419.23,440.32,461.44,482.6,490.7,2701.4,2708,2718.7,2729.2,2739.7,2750,2760.4,2770.6,2780.9,2791,2801.2,2811.3,2821.4,2831.5,2841.6,2851.6,2861.7,2871.7,2891.7,2911.8,2931.8,2951.8,2971.9,2991.9,3012.1,3032.2,3052.4,3072.6,3092.8,3113.1,3133.5,3153.8,3174.3,3194.8,3215.3,3235.9,3256.6,3277.3,3298.1,3318.9,3339.8,3360.8,3381.8,3402.9,3424.1,3445.3,3466.5,3487.9,3530.8,3573.9,3617.3,3661,3705,3749.2,3793.7,3838.5,3883.6,3928.9,3974.5,4020.4,4066.6,4113.1,4159.8,4206.9,4254.2,4301.7,4349.6,4397.7,4446.1,4494.8,4543.7,4592.9,4642.3,4893.3,5150.4,5413.1,5681.1,5953.8,6231,6797.1,7376.9,0.16,21.22,42.22,63.17,84.1,105.01,125.91,146.81,167.7,188.6,209.5,230.41,251.33,272.26,293.2,314.16,335.13,356.13,377.14,398.18,419.24,440.33,461.46,482.62,503.81,504.7,2706.2,2716.6,2727.3,2737.8,2748.3,2758.7,2769.1,2779.4,2789.7,2799.9,2810.1,2820.2,2830.4,2840.5,2850.6,2860.7,2870.7,2890.8,2910.9,2931,2951.1,2971.2,2991.3,3011.5,3031.6,3051.8,3072.1,3092.3,3112.7,3133,3153.4,3173.9,3194.4,3215,3235.6,3256.3,3277,3297.8,3318.7,3339.6,3360.5,3381.6,3402.7,3423.8,3445,3466.3,3487.7,3530.6,3573.7,3617.1,3660.8,3704.8,3749,3793.6,3838.4,3883.4,3928.8,3974.4,4020.3,4066.5,4113,4159.8,4206.8,4254.1,4301.7,4349.5,4397.6,4446,4494.7,4543.6,4592.8,4642.3,4893.3,5150.4,5413.1,5681,5953.8,6230.9,6797.1,7376.9,0.18,21.24,42.23,63.19,84.12,105.03,125.93,146.83,167.72,188.62,209.52,230.43,251.35,272.28,293.22,314.18,335.15,356.14,377.16,398.19,419.26,440.35,461.47,482.63,503.83,517.63,2710.6,2714.4,2725.3,2736,2746.6,2757.1,2767.6,2777.9,2788.3,2798.6,2808.8,2819,2829.2,2839.4,2849.5,2859.7,2869.8,2890,2910.1,2930.3,2950.4,2970.5,2990.7,3010.9,3031.1,3051.3,3071.6,3091.9,3112.2,3132.6,3153,3173.5,3194,3214.6,3235.3,3256,3276.7,3297.5,3318.4,3339.3,3360.3,3381.3,3402.4,3423.6,3444.8,3466.1,3487.5,3530.4,3573.5,3617,3660.7,3704.6,3748.9,3793.4,3838.2,3883.3,3928.7,3974.3,4020.2,4066.4,4112.9,4159.7,4206.7,4254,4301.6,4349.4,4397.6,4446,4494.6,4543.6,4592.8,4642.2,4893.3,5150.3,5413.1,5681,5953.7,6230.9,6797.1,7376.9,0.2,21.26,42.25,63.21,84.14,105.05,125.95,146.84,167.74,188.64,209.54,230.45,251.37,272.29,293.24,314.19,335.17,356.16,377.17,398.21,419.27,440.36,461.49,482.64,503.84,525.08,529.64,2714.6,2723.2,2734.1,2744.8,2755.4,2766,2776.5,2786.9,2797.2,2807.6,2817.8,2828.1,2838.3,2848.5,2858.7,2868.8,2889.1,2909.3,2929.5,2949.7,2969.9,2990.1,3010.3,3030.5,3050.8,3071.1,3091.4,3111.8,3132.2,3152.6,3173.1,3193.7,3214.3,3234.9,3255.6,3276.4,3297.2,3318.1,3339,3360,3381.1,3402.2,3423.3,3444.6,3465.9,3487.2,3530.2,3573.3,3616.8,3660.5,3704.5,3748.7,3793.3,3838.1,3883.2,3928.5,3974.2,4020.1,4066.3,4112.8,4159.6,4206.6,4253.9,4301.5,4349.4,4397.5,4445.9,4494.6,4543.5,4592.7,4642.2,4893.2,5150.3,5413,5681,5953.7,6230.9,6797.1,7376.9,0.22,21.28,42.27,63.23,84.16,105.07,125.97,146.86,167.76,188.65,209.56,230.46,251.38,272.31,293.25,314.21,335.18,356.17,377.19,398.22,419.29,440.38,461.5,482.66,503.85,525.09,540.87,2718.3,2721.2,2732.2,2743,2753.8,2764.4,2775,2785.5,2795.9,2806.3,2816.6,2826.9,2837.2,2847.4,2857.6,2867.8,2888.2,2908.5,2928.7,2949,2969.2,2989.4,3009.7,3030,3050.3,3070.6,3090.9,3111.3,3131.8,3152.2,3172.7,3193.3,3213.9,3234.6,3255.3,3276.1,3296.9,3317.8,3338.7,3359.7,3380.8,3401.9,3423.1,3444.4,3465.7,3487,3530,3573.2,3616.6,3660.3,3704.3,3748.6,3793.1,3838,3883.1,3928.4,3974.1,4020,4066.2,4112.7,4159.5,4206.5,4253.8,4301.4,4349.3,4397.4,4445.8,4494.5,4543.4,4592.6,4642.1,4893.2,5150.3,5413,5681,5953.7,6230.9,6797.1,7376.9,0.24,21.3,42.29,63.25,84.18,105.09,125.99,146.88,167.77,188.67,209.57,230.48,251.4,272.33,293.27,314.22,335.2,356.19,377.2,398.24,419.3,440.39,461.51,482.67,503.87,525.11,546.39,551.44,2721.7,2730.2,2741.2,2752.1,2762.8,2773.5,2784,2794.5,2805,2815.4,2825.8,2836.1,2846.4,2856.6,2866.9,2887.3,2907.6,2928,2948.3,2968.5,2988.8,3009.1,3029.4,3049.7,3070.1,3090.5,3110.9,3131.3,3151.8,3172.4,3192.9,3213.6,3234.3,3255,3275.8,3296.6,3317.5,3338.5,3359.5,3380.5,3401.7,3422.9,3444.1,3465.4,3486.8,3529.8,3573,3616.4,3660.2,3704.2,3748.5,3793,3837.8,3882.9,3928.3,3974,4019.9,4066.1,4112.6,4159.4,4206.4,4253.8,4301.3,4349.2,4397.4,4445.8,4494.4,4543.4,4592.6,4642,4893.1,5150.2,5413,5680.9,5953.7,6230.9,6797.1,7376.9,0.26,21.32,42.31,63.27,84.19,105.1,126,146.9,167.79,188.69,209.59,230.5,251.42,272.34,293.29,314.24,335.21,356.2,377.22,398.25,419.32,440.41,461.53,482.69,503.88,525.12,546.4,561.43,2724.9,2728.2,2739.4,2750.3,2761.2,2771.9,2782.6,2793.2,2803.7,2814.2,2824.6,2835,2845.3,2855.6,2865.9,2886.4,2906.8,2927.2,2947.5,2967.9,2988.2,3008.5,3028.8,3049.2,3069.6,3090,3110.4,3130.9,3151.4,3172,3192.6,3213.2,3233.9,3254.7,3275.5,3296.3,3317.2,3338.2,3359.2,3380.3,3401.4,3422.6,3443.9,3465.2,3486.6,3529.6,3572.8,3616.3,3660,3704,3748.3,3792.9,3837.7,3882.8,3928.2,3973.9,4019.8,4066,4112.5,4159.3,4206.3,4253.7,4301.3,4349.1,4397.3,4445.7,4494.4,4543.3,4592.5,4642,4893.1,5150.2,5412.9,5680.9,5953.7,6230.9,6797.1,7376.9,0.31,21.37,42.36,63.31,84.24,105.15,126.05,146.94,167.84,188.73,209.63,230.54,251.46,272.39,293.33,314.28,335.25,356.24,377.26,398.29,419.35,440.44,461.57,482.72,503.92,525.16,546.44,567.77,584.26,2732,2734.6,2745.9,2757.1,2768.1,2778.9,2789.7,2800.4,2811.1,2821.6,2832.1,2842.6,2853,2863.4,2884.1,2904.7,2925.2,2945.7,2966.2,2986.6,3007,3027.4,3047.9,3068.3,3088.8,3109.3,3129.8,3150.4,3171,3191.6,3212.3,3233.1,3253.9,3274.7,3295.6,3316.5,3337.5,3358.6,3379.7,3400.8,3422,3443.3,3464.7,3486.1,3529.1,3572.3,3615.8,3659.6,3703.6,3747.9,3792.5,3837.4,3882.5,3927.9,3973.6,4019.5,4065.8,4112.3,4159.1,4206.1,4253.5,4301.1,4349,4397.1,4445.5,4494.2,4543.2,4592.4,4641.8,4893,5150.1,5412.9,5680.8,5953.6,6230.8,6797,7376.9,0.37,21.42,42.41,63.36,84.29,105.2,126.09,146.99,167.88,188.78,209.68,230.58,251.5,272.43,293.37,314.32,335.29,356.28,377.29,398.33,419.39,440.48,461.6,482.76,503.95,525.19,546.47,567.8,589.19,604.65,2738.1,2741.3,2752.8,2764.1,2775.2,2786.2,2797.1,2807.9,2818.6,2829.3,2839.9,2850.4,2860.9,2881.8,2902.6,2923.3,2943.9,2964.5,2985,3005.5,3026,3046.6,3067.1,3087.6,3108.2,3128.8,3149.4,3170,3190.7,3211.5,3232.2,3253,3273.9,3294.8,3315.8,3336.8,3357.9,3379,3400.2,3421.4,3442.8,3464.1,3485.5,3528.6,3571.9,3615.4,3659.2,3703.2,3747.6,3792.2,3837,3882.2,3927.6,3973.3,4019.3,4065.5,4112,4158.8,4205.9,4253.3,4300.9,4348.8,4396.9,4445.3,4494,4543,4592.2,4641.7,4892.8,5150,5412.8,5680.8,5953.6,6230.8,6797,7376.9,0.42,21.47,42.46,63.41,84.34,105.24,126.14,147.03,167.93,188.82,209.72,230.63,251.54,272.47,293.41,314.36,335.33,356.32,377.33,398.37,419.43,440.52,461.64,482.79,503.99,525.22,546.51,567.84,589.22,610.66,623.14,2743.4,2748.3,2759.9,2771.3,2782.6,2793.7,2804.7,2815.5,2826.4,2837.1,2847.8,2858.4,2879.5,2900.5,2921.3,2942.1,2962.8,2983.4,3004,3024.6,3045.2,3065.8,3086.4,3107,3127.7,3148.4,3169.1,3189.8,3210.6,3231.4,3252.2,3273.1,3294.1,3315.1,3336.1,3357.2,3378.4,3399.6,3420.9,3442.2,3463.6,3485,3528.1,3571.4,3614.9,3658.8,3702.9,3747.2,3791.8,3836.7,3881.9,3927.3,3973,4019,4065.3,4111.8,4158.6,4205.7,4253,4300.7,4348.6,4396.7,4445.2,4493.9,4542.8,4592.1,4641.5,4892.7,5149.9,5412.7,5680.7,5953.5,6230.7,6797,7376.9,0.47,21.52,42.51,63.46,84.38,105.29,126.19,147.08,167.97,188.86,209.76,230.67,251.58,272.51,293.45,314.4,335.37,356.36,377.37,398.41,419.47,440.55,461.67,482.83,504.02,525.26,546.54,567.87,589.25,610.69,632.19,640.09,2748.1,2755.7,2767.4,2778.9,2790.2,2801.4,2812.4,2823.4,2834.3,2845.1,2855.8,2877.2,2898.3,2919.3,2940.2,2961,2981.8,3002.5,3023.2,3043.9,3064.6,3085.2,3105.9,3126.6,3147.3,3168.1,3188.9,3209.7,3230.5,3251.4,3272.3,3293.3,3314.4,3335.4,3356.6,3377.7,3399,3420.3,3441.6,3463,3484.5,3527.6,3570.9,3614.5,3658.4,3702.5,3746.8,3791.5,3836.4,3881.6,3927,3972.7,4018.7,4065,4111.6,4158.4,4205.5,4252.8,4300.5,4348.4,4396.6,4445,4493.7,4542.7,4591.9,4641.4,4892.6,5149.8,5412.6,5680.6,5953.5,6230.7,6797,7376.9,0.52,21.57,42.56,63.51,84.43,105.34,126.23,147.12,168.01,188.91,209.81,230.71,251.63,272.55,293.49,314.44,335.41,356.4,377.41,398.44,419.5,440.59,461.71,482.87,504.06,525.29,546.57,567.9,589.28,610.72,632.22,653.79,655.76,2752.3,2763.3,2775.1,2786.6,2798,2809.3,2820.4,2831.4,2842.4,2853.2,2874.8,2896.1,2917.3,2938.3,2959.3,2980.2,3001,3021.8,3042.5,3063.3,3084,3104.8,3125.5,3146.3,3167.1,3187.9,3208.8,3229.7,3250.6,3271.6,3292.6,3313.6,3334.7,3355.9,3377.1,3398.4,3419.7,3441,3462.5,3483.9,3527.1,3570.4,3614.1,3657.9,3702.1,3746.5,3791.1,3836.1,3881.3,3926.7,3972.5,4018.5,4064.8,4111.3,4158.2,4205.3,4252.6,4300.3,4348.2,4396.4,4444.8,4493.5,4542.5,4591.8,4641.3,4892.5,5149.7,5412.6,5680.6,5953.4,6230.7,6796.9,7376.9,0.57,21.62,42.61,63.55,84.48,105.38,126.28,147.17,168.06,188.95,209.85,230.75,251.67,272.59,293.53,314.48,335.45,356.44,377.45,398.48,419.54,440.63,461.75,482.9,504.09,525.33,546.61,567.93,589.32,610.76,632.26,653.82,670.38,2756.1,2759,2771.1,2783,2794.6,2806,2817.3,2828.5,2839.6,2850.6,2872.4,2893.9,2915.3,2936.5,2957.6,2978.5,2999.5,3020.3,3041.2,3062,3082.8,3103.6,3124.4,3145.3,3166.1,3187,3207.9,3228.8,3249.8,3270.8,3291.8,3312.9,3334,3355.2,3376.5,3397.7,3419.1,3440.5,3461.9,3483.4,3526.6,3570,3613.6,3657.5,3701.7,3746.1,3790.8,3835.7,3880.9,3926.4,3972.2,4018.2,4064.5,4111.1,4157.9,4205,4252.4,4300.1,4348,4396.2,4444.7,4493.4,4542.4,4591.6,4641.1,4892.4,5149.6,5412.5,5680.5,5953.4,6230.6,6796.9,7376.8,0.62,21.67,42.65,63.6,84.52,105.43,126.32,147.21,168.1,188.99,209.89,230.8,251.71,272.63,293.57,314.52,335.49,356.48,377.49,398.52,419.58,440.67,461.78,482.94,504.13,525.36,546.64,567.97,589.35,610.79,632.29,653.85,675.49,684.08,2759.6,2767.1,2779.2,2791.1,2802.7,2814.2,2825.6,2836.8,2848,2870,2891.7,2913.2,2934.6,2955.8,2976.9,2997.9,3018.9,3039.8,3060.7,3081.6,3102.5,3123.4,3144.2,3165.1,3186.1,3207,3228,3249,3270,3291.1,3312.2,3333.4,3354.6,3375.8,3397.1,3418.5,3439.9,3461.3,3482.9,3526.1,3569.5,3613.2,3657.1,3701.3,3745.7,3790.4,3835.4,3880.6,3926.1,3971.9,4017.9,4064.3,4110.8,4157.7,4204.8,4252.2,4299.9,4347.8,4396,4444.5,4493.2,4542.2,4591.5,4641,4892.2,5149.5,5412.4,5680.5,5953.3,6230.6,6796.9,7376.8,0.67,21.72,42.7,63.65,84.57,105.47,126.37,147.26,168.15,189.04,209.93,230.84,251.75,272.68,293.61,314.56,335.53,356.52,377.53,398.56,419.62,440.7,461.82,482.97,504.16,525.4,546.67,568,589.38,610.82,632.32,653.88,675.52,697,2762.8,2762.9,2775.4,2787.5,2799.4,2811.1,2822.6,2834,2845.3,2867.5,2889.5,2911.2,2932.7,2954,2975.2,2996.4,3017.5,3038.5,3059.4,3080.4,3101.3,3122.3,3143.2,3164.2,3185.1,3206.1,3227.1,3248.1,3269.2,3290.3,3311.5,3332.7,3353.9,3375.2,3396.5,3417.9,3439.3,3460.8,3482.3,3525.6,3569,3612.8,3656.7,3700.9,3745.4,3790.1,3835.1,3880.3,3925.8,3971.6,4017.7,4064,4110.6,4157.5,4204.6,4252,4299.7,4347.6,4395.8,4444.3,4493,4542,4591.3,4640.8,4892.1,5149.4,5412.3,5680.4,5953.3,6230.5,6796.9,7376.8,0.72,21.77,42.75,63.7,84.62,105.52,126.41,147.3,168.19,189.08,209.98,230.88,251.79,272.72,293.65,314.6,335.57,356.56,377.57,398.6,419.65,440.74,461.86,483.01,504.2,525.43,546.71,568.03,589.41,610.85,632.35,653.91,675.55,697.26,709.24,2765.6,2771.4,2783.8,2795.9,2807.8,2819.5,2831.1,2842.5,2865,2887.2,2909.1,2930.7,2952.2,2973.6,2994.8,3016,3037.1,3058.2,3079.2,3100.2,3121.2,3142.2,3163.2,3184.2,3205.2,3226.2,3247.3,3268.4,3289.6,3310.7,3332,3353.2,3374.5,3395.9,3417.3,3438.7,3460.2,3481.8,3525.1,3568.6,3612.3,3656.3,3700.5,3745,3789.8,3834.8,3880,3925.5,3971.3,4017.4,4063.8,4110.4,4157.2,4204.4,4251.8,4299.5,4347.4,4395.7,4444.1,4492.9,4541.9,4591.2,4640.7,4892,5149.3,5412.2,5680.3,5953.2,6230.5,6796.8,7376.8,0.77,21.82,42.8,63.75,84.66,105.57,126.46,147.35,168.24,189.13,210.02,230.92,251.84,272.76,293.69,314.64,335.61,356.6,377.6,398.63,419.69,440.78,461.89,483.04,504.23,525.47,546.74,568.07,589.45,610.88,632.38,653.94,675.58,697.29,719.09,720.86,2768.3,2780,2792.4,2804.6,2816.5,2828.2,2839.7,2862.5,2884.9,2907,2928.8,2950.4,2971.9,2993.3,3014.5,3035.7,3056.9,3078,3099,3120.1,3141.1,3162.2,3183.2,3204.3,3225.4,3246.5,3267.6,3288.8,3310,3331.3,3352.6,3373.9,3395.3,3416.7,3438.2,3459.7,3481.3,3524.6,3568.1,3611.9,3655.9,3700.1,3744.6,3789.4,3834.4,3879.7,3925.3,3971.1,4017.2,4063.5,4110.1,4157,4204.2,4251.6,4299.3,4347.2,4395.5,4444,4492.7,4541.7,4591,4640.5,4891.9,5149.2,5412.2,5680.3,5953.2,6230.5,6796.8,7376.8,0.87,21.91,42.9,63.84,84.76,105.66,126.55,147.44,168.32,189.21,210.11,231.01,251.92,272.84,293.78,314.72,335.69,356.68,377.68,398.71,419.77,440.85,461.97,483.12,504.3,525.53,546.81,568.13,589.51,610.94,632.44,654,675.64,697.35,719.14,741.02,742.56,2773,2785.2,2797.8,2810.1,2822.2,2834.1,2857.4,2880.3,2902.7,2924.9,2946.8,2968.5,2990.1,3011.6,3033,3054.3,3075.5,3096.7,3117.9,3139,3160.2,3181.3,3202.5,3223.7,3244.8,3266.1,3287.3,3308.6,3329.9,3351.2,3372.6,3394,3415.5,3437,3458.6,3480.2,3523.6,3567.2,3611,3655.1,3699.4,3743.9,3788.7,3833.8,3879.1,3924.7,3970.5,4016.6,4063,4109.6,4156.6,4203.7,4251.2,4298.9,4346.9,4395.1,4443.6,4492.4,4541.4,4590.7,4640.2,4891.7,5149,5412,5680.1,5953.1,6230.4,6796.8,7376.8,0.98,22.01,42.99,63.94,84.85,105.75,126.64,147.53,168.41,189.3,210.19,231.09,252,272.92,293.86,314.81,335.77,356.75,377.76,398.79,419.84,440.92,462.04,483.19,504.38,525.6,546.88,568.2,589.58,611.01,632.5,654.06,675.7,697.41,719.2,741.08,762.52,2777.1,2777.4,2790.7,2803.5,2816,2828.3,2852.2,2875.5,2898.4,2920.9,2943.1,2965.1,2986.9,3008.6,3030.2,3051.6,3073,3094.4,3115.7,3136.9,3158.2,3179.4,3200.7,3221.9,3243.2,3264.5,3285.8,3307.1,3328.5,3349.9,3371.3,3392.8,3414.3,3435.8,3457.4,3479.1,3522.6,3566.2,3610.1,3654.2,3698.6,3743.2,3788,3833.1,3878.5,3924.1,3970,4016.1,4062.5,4109.2,4156.1,4203.3,4250.8,4298.5,4346.5,4394.8,4443.3,4492.1,4541.1,4590.4,4639.9,4891.4,5148.9,5411.9,5680,5953,6230.3,6796.7,7376.8,1.08,22.11,43.09,64.03,84.95,105.84,126.73,147.62,168.5,189.39,210.28,231.18,252.09,273.01,293.94,314.89,335.85,356.83,377.84,398.86,419.92,441,462.11,483.26,504.45,525.67,546.95,568.27,589.64,611.07,632.56,654.12,675.75,697.46,719.25,741.13,763.1,781.03,2780.6,2783.2,2796.6,2809.6,2822.3,2846.8,2870.7,2894,2916.8,2939.4,2961.7,2983.7,3005.6,3027.4,3049,3070.5,3092,3113.4,3134.8,3156.2,3177.5,3198.9,3220.2,3241.5,3262.9,3284.3,3305.6,3327.1,3348.5,3370,3391.5,3413.1,3434.7,3456.3,3478,3521.5,3565.3,3609.2,3653.4,3697.8,3742.4,3787.3,3832.5,3877.8,3923.5,3969.4,4015.6,4062,4108.7,4155.6,4202.9,4250.3,4298.1,4346.1,4394.4,4442.9,4491.7,4540.8,4590.1,4639.7,4891.2,5148.7,5411.7,5679.9,5952.9,6230.2,6796.7,7376.7,1.18,22.21,43.19,64.13,85.04,105.94,126.82,147.71,168.59,189.48,210.37,231.26,252.17,273.09,294.02,314.97,335.93,356.91,377.91,398.94,419.99,441.07,462.18,483.33,504.52,525.74,547.01,568.33,589.71,611.13,632.63,654.18,675.81,697.52,719.31,741.18,763.15,785.23,798.33,2783.7,2789.4,2803,2816.1,2841.3,2865.7,2889.5,2912.7,2935.6,2958.2,2980.5,3002.6,3024.5,3046.3,3068,3089.6,3111.2,3132.7,3154.2,3175.6,3197,3218.4,3239.9,3261.3,3282.7,3304.2,3325.7,3347.2,3368.7,3390.3,3411.9,3433.5,3455.2,3476.9,3520.5,3564.3,3608.3,3652.6,3697,3741.7,3786.6,3831.8,3877.2,3922.9,3968.8,4015,4061.5,4108.2,4155.2,4202.4,4249.9,4297.7,4345.7,4394,4442.6,4491.4,4540.5,4589.8,4639.4,4891,5148.5,5411.5,5679.8,5952.8,6230.1,6796.6,7376.7,1.28,22.31,43.29,64.22,85.13,106.03,126.92,147.8,168.68,189.56,210.45,231.35,252.26,273.17,294.1,315.05,336.01,356.99,377.99,399.02,420.07,441.15,462.26,483.4,504.59,525.81,547.08,568.4,589.77,611.2,632.69,654.24,675.87,697.57,719.36,741.23,763.2,785.27,807.45,814.6,2786.5,2796,2809.6,2835.7,2860.7,2884.9,2908.5,2931.8,2954.6,2977.2,2999.5,3021.6,3043.6,3065.5,3087.3,3108.9,3130.6,3152.1,3173.7,3195.2,3216.7,3238.2,3259.7,3281.2,3302.7,3324.3,3345.8,3367.4,3389,3410.7,3432.4,3454.1,3475.9,3519.5,3563.4,3607.5,3651.7,3696.2,3741,3785.9,3831.1,3876.6,3922.3,3968.3,4014.5,4061,4107.7,4154.7,4202,4249.5,4297.3,4345.4,4393.7,4442.2,4491.1,4540.1,4589.5,4639.1,4890.7,5148.3,5411.4,5679.6,5952.7,6230,6796.6,7376.7,1.38,22.41,43.38,64.32,85.23,106.12,127.01,147.89,168.77,189.65,210.54,231.43,252.34,273.26,294.18,315.13,336.09,357.07,378.07,399.09,420.14,441.22,462.33,483.47,504.66,525.88,547.15,568.47,589.83,611.26,632.75,654.3,675.93,697.63,719.42,741.29,763.25,785.32,807.5,829.79,829.97,2788.8,2803,2829.9,2855.5,2880.2,2904.3,2927.9,2951,2973.8,2996.4,3018.8,3040.9,3062.9,3084.9,3106.7,3128.4,3150.1,3171.7,3193.3,3214.9,3236.5,3258.1,3279.7,3301.2,3322.8,3344.5,3366.1,3387.8,3409.5,3431.2,3453,3474.8,3518.5,3562.4,3606.6,3650.9,3695.4,3740.2,3785.2,3830.5,3876,3921.7,3967.7,4014,4060.5,4107.2,4154.3,4201.6,4249.1,4296.9,4345,4393.3,4441.9,4490.7,4539.8,4589.2,4638.8,4890.5,5148.1,5411.2,5679.5,5952.6,6230,6796.5,7376.7,1.48,22.51,43.48,64.41,85.32,106.21,127.1,147.98,168.86,189.74,210.62,231.52,252.42,273.34,294.27,315.21,336.17,357.15,378.15,399.17,420.22,441.29,462.4,483.55,504.73,525.95,547.22,568.53,589.9,611.33,632.81,654.36,675.99,697.69,719.47,741.34,763.3,785.37,807.54,829.83,844.56,2791,2796,2823.9,2850.2,2875.5,2900,2923.9,2947.4,2970.5,2993.3,3015.8,3038.2,3060.4,3082.4,3104.4,3126.2,3148,3169.8,3191.5,3213.2,3234.8,3256.5,3278.1,3299.8,3321.4,3343.1,3364.8,3386.5,3408.3,3430,3451.8,3473.7,3517.5,3561.5,3605.7,3650.1,3694.7,3739.5,3784.5,3829.8,3875.4,3921.1,3967.2,4013.4,4060,4106.8,4153.8,4201.1,4248.7,4296.5,4344.6,4392.9,4441.5,4490.4,4539.5,4588.9,4638.5,4890.3,5147.9,5411.1,5679.4,5952.5,6229.9,6796.5,7376.6,1.59,22.61,43.58,64.51,85.42,106.31,127.19,148.07,168.94,189.82,210.71,231.6,252.51,273.42,294.35,315.29,336.25,357.23,378.22,399.24,420.29,441.37,462.48,483.62,504.8,526.02,547.28,568.6,589.96,611.39,632.87,654.42,676.05,697.74,719.52,741.39,763.35,785.42,807.59,829.88,852.29,858.46,2792.8,2817.7,2844.8,2870.6,2895.6,2919.9,2943.7,2967.1,2990.1,3012.9,3035.4,3057.8,3080,3102.1,3124.1,3146,3167.8,3189.6,3211.4,3233.1,3254.9,3276.6,3298.3,3320,3341.7,3363.5,3385.3,3407,3428.9,3450.7,3472.6,3516.5,3560.6,3604.8,3649.2,3693.9,3738.7,3783.8,3829.2,3874.7,3920.5,3966.6,4012.9,4059.5,4106.3,4153.3,4200.7,4248.3,4296.1,4344.2,4392.6,4441.2,4490.1,4539.2,4588.6,4638.2,4890,5147.7,5410.9,5679.3,5952.4,6229.8,6796.4,7376.6,1.79,22.81,43.77,64.7,85.6,106.49,127.37,148.25,169.12,190,210.88,231.77,252.67,273.59,294.51,315.45,336.41,357.38,378.38,399.4,420.44,441.52,462.62,483.76,504.94,526.16,547.42,568.73,590.09,611.52,633,654.54,676.16,697.86,719.63,741.5,763.46,785.51,807.68,829.96,852.37,884.47,2795.9,2804.7,2833.5,2860.6,2886.6,2911.7,2936.2,2960.1,2983.7,3006.9,3029.9,3052.6,3075.1,3097.5,3119.7,3141.8,3163.9,3185.9,3207.8,3229.7,3251.6,3273.5,3295.3,3317.2,3339,3360.9,3382.7,3404.6,3426.5,3448.5,3470.4,3514.5,3558.7,3603,3647.6,3692.3,3737.3,3782.4,3827.8,3873.5,3919.4,3965.5,4011.8,4058.4,4105.3,4152.4,4199.8,4247.4,4295.3,4343.5,4391.9,4440.5,4489.4,4538.6,4588,4637.6,4889.5,5147.3,5410.6,5679,5952.1,6229.6,6796.3,7376.6,1.99,23.01,43.97,64.89,85.79,106.68,127.55,148.43,169.3,190.17,211.06,231.94,252.84,273.75,294.68,315.61,336.57,357.54,378.53,399.55,420.59,441.66,462.77,483.9,505.08,526.29,547.55,568.86,590.22,611.64,633.12,654.67,676.28,697.97,719.74,741.6,763.56,785.61,807.77,830.05,852.45,897.66,908.5,2798.3,2821.6,2850.2,2877.2,2903.2,2928.5,2953.1,2977.1,3000.8,3024.2,3047.3,3070.1,3092.8,3115.3,3137.7,3159.9,3182.1,3204.2,3226.3,3248.3,3270.3,3292.3,3314.3,3336.3,3358.2,3380.2,3402.2,3424.2,3446.2,3468.2,3512.4,3556.7,3601.2,3645.9,3690.7,3735.8,3781,3826.5,3872.2,3918.2,3964.3,4010.8,4057.4,4104.3,4151.5,4198.9,4246.6,4294.5,4342.7,4391.1,4439.8,4488.7,4537.9,4587.4,4637,4889.1,5147,5410.3,5678.8,5951.9,6229.5,6796.2,7376.5,2.2,23.21,44.16,65.08,85.98,106.86,127.74,148.6,169.48,190.35,211.23,232.11,253.01,273.92,294.84,315.77,336.73,357.7,378.69,399.7,420.74,441.81,462.91,484.05,505.22,526.43,547.69,569,590.35,611.77,633.24,654.79,676.4,698.08,719.85,741.71,763.66,785.71,807.86,830.14,852.53,897.73,930.87,2800.1,2809,2839.2,2867.5,2894.5,2920.5,2945.8,2970.5,2994.6,3018.4,3041.9,3065.1,3088,3110.8,3133.4,3155.9,3178.3,3200.6,3222.9,3245.1,3267.2,3289.3,3311.4,3333.5,3355.6,3377.6,3399.7,3421.8,3443.9,3466,3510.4,3554.8,3599.4,3644.2,3689.2,3734.3,3779.6,3825.2,3871,3917,3963.2,4009.7,4056.4,4103.4,4150.6,4198.1,4245.8,4293.7,4341.9,4390.4,4439.1,4488.1,4537.3,4586.8,4636.5,4888.6,5146.6,5410,5678.5,5951.7,6229.3,6796.1,7376.5,2.5,23.5,44.46,65.37,86.26,107.14,128.01,148.87,169.74,190.61,211.49,232.37,253.26,274.17,295.08,316.02,336.96,357.93,378.92,399.93,420.97,442.03,463.13,484.26,505.43,526.64,547.89,569.2,590.55,611.96,633.43,654.97,676.57,698.25,720.02,741.87,763.81,785.85,808,830.27,852.65,897.83,943.63,961.91,2801.9,2821.8,2852.3,2880.9,2908.2,2934.6,2960.1,2985.1,3009.6,3033.6,3057.4,3080.8,3104,3127,3149.8,3172.5,3195.1,3217.7,3240.1,3262.5,3284.8,3307.1,3329.3,3351.6,3373.8,3396,3418.3,3440.5,3462.7,3507.3,3552,3596.8,3641.7,3686.8,3732.1,3777.5,3823.2,3869.1,3915.2,3961.5,4008.1,4054.9,4101.9,4149.2,4196.7,4244.5,4292.5,4340.8,4389.3,4438.1,4487.1,4536.3,4585.8,4635.6,4887.9,5146,5409.5,5678.1,5951.4,6229.1,6796,7376.4,3.01,24,44.94,65.85,86.73,107.6,128.46,149.32,170.18,191.05,211.92,232.79,253.68,274.58,295.49,316.42,337.36,358.32,379.31,400.31,421.34,442.4,463.5,484.62,505.78,526.99,548.23,569.53,590.87,612.28,633.74,655.27,676.87,698.54,720.29,742.13,764.06,786.09,808.23,830.48,852.86,898.01,943.76,990.23,1008.3,2803.2,2824.5,2856.5,2886.4,2914.9,2942.2,2968.6,2994.3,3019.5,3044.2,3068.4,3092.4,3116.1,3139.5,3162.8,3185.9,3208.8,3231.7,3254.4,3277.1,3299.7,3322.3,3344.8,3367.3,3389.8,3412.3,3434.8,3457.2,3502.2,3547.2,3592.3,3637.5,3682.8,3728.3,3774,3819.9,3866,3912.2,3958.7,4005.4,4052.4,4099.5,4146.9,4194.6,4242.4,4290.5,4338.9,4387.5,4436.3,4485.4,4534.8,4584.3,4634.1,4886.7,5145,5408.8,5677.5,5950.9,6228.7,6795.8,7376.3,3.51,24.5,45.43,66.32,87.2,108.06,128.92,149.77,170.63,191.48,212.35,233.22,254.1,275,295.9,316.82,337.76,358.72,379.69,400.69,421.72,442.77,463.86,484.98,506.14,527.33,548.57,569.86,591.2,612.6,634.05,655.57,677.16,698.82,720.57,742.4,764.32,786.34,808.46,830.7,853.06,898.18,943.9,990.32,1037.6,1049.8,2802.6,2829.7,2862.9,2893.8,2923.2,2951.3,2978.4,3004.8,3030.5,3055.7,3080.4,3104.8,3128.9,3152.8,3176.4,3199.9,3223.2,3246.3,3269.4,3292.3,3315.2,3338,3360.8,3383.6,3406.3,3429,3451.6,3497,3542.3,3587.7,3633.2,3678.9,3724.6,3770.5,3816.6,3862.8,3909.3,3955.9,4002.8,4049.8,4097.1,4144.6,4192.4,4240.3,4288.6,4337,4385.7,4434.6,4483.8,4533.2,4582.8,4632.7,4885.6,5144.1,5408,5676.9,5950.4,6228.3,6795.5,7376.2,4.02,24.99,45.91,66.8,87.67,108.52,129.37,150.22,171.07,191.92,212.78,233.64,254.52,275.41,296.31,317.23,338.16,359.11,380.08,401.08,422.1,443.15,464.22,485.34,506.49,527.68,548.91,570.19,591.53,612.91,634.36,655.87,677.45,699.11,720.84,742.66,764.57,786.58,808.69,830.92,853.27,898.35,944.04,990.42,1037.6,1085.8,1087.5,2800.8,2837.1,2871.2,2902.9,2933,2961.7,2989.4,3016.3,3042.5,3068.1,3093.3,3118.1,3142.6,3166.8,3190.7,3214.5,3238.1,3261.5,3284.8,3308,3331.2,3354.2,3377.2,3400.2,3423.1,3446,3491.8,3537.5,3583.2,3629,3674.9,3720.9,3767,3813.2,3859.7,3906.3,3953.1,4000.1,4047.3,4094.7,4142.3,4190.2,4238.3,4286.6,4335.1,4383.9,4432.9,4482.1,4531.6,4581.3,4631.2,4884.4,5143.1,5407.2,5676.3,5949.9,6227.9,6795.3,7376,4.53,25.49,46.4,67.28,88.14,108.99,129.83,150.67,171.51,192.36,213.21,234.07,254.94,275.82,296.72,317.63,338.56,359.5,380.47,401.46,422.47,443.52,464.59,485.7,506.84,528.02,549.25,570.53,591.85,613.23,634.67,656.18,677.75,699.39,721.12,742.93,764.83,786.83,808.93,831.14,853.47,898.53,944.18,990.52,1037.7,1085.8,1122.2,2797.9,2808.6,2846.7,2881.3,2913.6,2944.2,2973.4,3001.6,3028.9,3055.5,3081.5,3107,3132.1,3156.9,3181.4,3205.6,3229.7,3253.5,3277.2,3300.8,3324.2,3347.6,3370.9,3394.1,3417.2,3440.4,3486.5,3532.6,3578.6,3624.7,3670.9,3717.1,3763.4,3809.9,3856.5,3903.3,3950.2,3997.4,4044.7,4092.3,4140,4188,4236.2,4284.6,4333.2,4382.1,4431.1,4480.5,4530,4579.8,4629.8,4883.2,5142.2,5406.4,5675.6,5949.4,6227.5,6795,7375.9,5.03,25.98,46.88,67.75,88.61,109.45,130.28,151.12,171.95,192.79,213.64,234.49,255.36,276.24,297.13,318.03,338.95,359.9,380.86,401.84,422.85,443.89,464.95,486.06,507.19,528.37,549.59,570.86,592.18,613.55,634.98,656.48,678.04,699.68,721.4,743.19,765.08,787.07,809.16,831.36,853.68,898.71,944.32,990.62,1037.7,1085.7,1134.9,1154.6,2794.2,2819.8,2858.1,2893,2925.7,2956.6,2986.2,3014.7,3042.4,3069.3,3095.6,3121.5,3146.9,3171.9,3196.7,3221.2,3245.4,3269.5,3293.4,3317.2,3340.9,3364.4,3387.9,3411.3,3434.7,3481.2,3527.7,3574.1,3620.4,3666.8,3713.3,3759.9,3806.5,3853.3,3900.3,3947.4,3994.7,4042.2,4089.8,4137.7,4185.8,4234.1,4282.6,4331.3,4380.2,4429.4,4478.8,4528.4,4578.3,4628.3,4882,5141.2,5405.7,5675,5948.9,6227.1,6794.8,7375.8,5.54,26.48,47.37,68.23,89.08,109.91,130.74,151.56,172.39,193.23,214.07,234.92,255.78,276.65,297.54,318.44,339.35,360.29,381.24,402.22,423.23,444.26,465.32,486.41,507.55,528.72,549.93,571.19,592.5,613.87,635.29,656.78,678.34,699.97,721.67,743.46,765.34,787.32,809.39,831.58,853.89,898.88,944.46,990.72,1037.8,1085.7,1134.8,1185.1,2789.7,2789.9,2832.9,2871.1,2906.2,2939.1,2970.3,3000.1,3028.9,3056.8,3084,3110.5,3136.6,3162.3,3187.5,3212.5,3237.2,3261.7,3286,3310.1,3334.1,3357.9,3381.7,3405.3,3428.9,3475.9,3522.7,3569.4,3616.1,3662.8,3709.5,3756.3,3803.2,3850.2,3897.3,3944.6,3992,4039.6,4087.4,4135.4,4183.6,4232,4280.6,4329.4,4378.4,4427.7,4477.1,4526.8,4576.7,4626.9,4880.9,5140.3,5404.9,5674.4,5948.4,6226.7,6794.5,7375.7,6.04,26.97,47.85,68.71,89.54,110.37,131.19,152.01,172.84,193.66,214.5,235.34,256.2,277.07,297.95,318.84,339.75,360.68,381.63,402.6,423.6,444.63,465.68,486.77,507.9,529.06,550.27,571.53,592.83,614.19,635.61,657.09,678.63,700.25,721.95,743.73,765.6,787.56,809.63,831.8,854.09,899.06,944.61,990.82,1037.8,1085.7,1134.7,1185.1,1213.9,2784.6,2805.3,2847.5,2885.5,2920.6,2953.6,2984.9,3014.9,3043.9,3072,3099.4,3126.1,3152.4,3178.2,3203.7,3228.9,3253.8,3278.4,3302.9,3327.2,3351.4,3375.4,3399.3,3423.1,3470.5,3517.7,3564.8,3611.8,3658.7,3705.7,3752.7,3799.8,3847,3894.3,3941.7,3989.3,4037,4085,4133.1,4181.4,4229.9,4278.6,4327.5,4376.6,4425.9,4475.5,4525.2,4575.2,4625.4,4879.7,5139.3,5404.1,5673.7,5947.9,6226.3,6794.3,7375.6,6.55,27.46,48.34,69.18,90.01,110.83,131.64,152.46,173.28,194.1,214.93,235.77,256.62,277.48,298.35,319.24,340.15,361.07,382.02,402.99,423.98,445,466.05,487.13,508.25,529.41,550.61,571.86,593.16,614.51,635.92,657.39,678.93,700.54,722.23,744,765.86,787.81,809.86,832.03,854.3,899.24,944.75,990.93,1037.9,1085.7,1134.7,1184.9,1236.8,1241.4,2778.9,2822,2863.5,2901.2,2936.2,2969.1,3000.5,3030.6,3059.7,3087.9,3115.4,3142.4,3168.8,3194.8,3220.4,3245.8,3270.8,3295.6,3320.3,3344.7,3369,3393.2,3417.3,3465.1,3512.7,3560.2,3607.4,3654.7,3701.9,3749.1,3796.4,3843.8,3891.3,3938.9,3986.6,4034.5,4082.5,4130.8,4179.2,4227.8,4276.6,4325.6,4374.8,4424.2,4473.8,4523.6,4573.7,4624,4878.5,5138.4,5403.3,5673.1,5947.4,6225.9,6794.1,7375.4,7.05,27.96,48.82,69.66,90.48,111.29,132.1,152.91,173.72,194.54,215.36,236.19,257.04,277.89,298.76,319.65,340.55,361.47,382.41,403.37,424.36,445.37,466.41,487.49,508.61,529.76,550.95,572.19,593.48,614.83,636.23,657.69,679.22,700.83,722.51,744.27,766.11,788.06,810.1,832.25,854.51,899.42,944.9,991.04,1037.9,1085.7,1134.6,1184.8,1236.6,1267.7,2772.6,2794.1,2839.9,2880.6,2917.9,2952.7,2985.6,3016.9,3047,3076.2,3104.5,3132.1,3159.2,3185.7,3211.8,3237.6,3263.1,3288.3,3313.3,3338,3362.6,3387.1,3411.4,3459.7,3507.7,3555.5,3603.1,3650.6,3698.1,3745.5,3793,3840.6,3888.2,3936,3983.9,4031.9,4080.1,4128.4,4177,4225.7,4274.6,4323.7,4373,4422.4,4472.1,4522.1,4572.2,4622.5,4877.3,5137.4,5402.6,5672.5,5946.9,6225.5,6793.8,7375.3,7.56,28.45,49.3,70.13,90.95,111.75,132.55,153.35,174.16,194.97,215.79,236.62,257.46,278.31,299.17,320.05,340.95,361.86,382.79,403.75,424.73,445.74,466.78,487.85,508.96,530.11,551.29,572.53,593.81,615.15,636.54,658,679.52,701.11,722.78,744.54,766.37,788.3,810.34,832.47,854.73,899.61,945.05,991.14,1038,1085.7,1134.5,1184.6,1236.3,1290,1292.9,2765.9,2814.4,2858.8,2898.7,2935.5,2970.1,3002.8,3034,3064.1,3093.3,3121.7,3149.4,3176.5,3203.1,3229.4,3255.3,3280.9,3306.2,3331.3,3356.2,3380.9,3405.5,3454.2,3502.6,3550.8,3598.7,3646.5,3694.2,3741.9,3789.6,3837.4,3885.2,3933.1,3981.2,4029.3,4077.7,4126.1,4174.8,4223.6,4272.6,4321.7,4371.1,4420.7,4470.5,4520.5,4570.7,4621.1,4876.2,5136.5,5401.8,5671.9,5946.4,6225.1,6793.6,7375.2,8.06,28.94,49.79,70.61,91.41,112.21,133.01,153.8,174.6,195.41,216.22,237.04,257.88,278.72,299.58,320.45,341.34,362.25,383.18,404.13,425.11,446.11,467.15,488.21,509.31,530.45,551.63,572.86,594.14,615.47,636.86,658.3,679.82,701.4,723.06,744.8,766.63,788.55,810.57,832.7,854.94,899.79,945.2,991.25,1038.1,1085.7,1134.5,1184.5,1236,1289.6,1317.3,2758.7,2786.5,2835.4,2878.4,2917.6,2953.9,2988.1,3020.6,3051.8,3081.8,3111,3139.4,3167.1,3194.3,3221,3247.3,3273.3,3299,3324.4,3349.6,3374.7,3399.5,3448.7,3497.6,3546,3594.3,3642.4,3690.4,3738.3,3786.2,3834.2,3882.2,3930.3,3978.5,4026.8,4075.2,4123.8,4172.5,4221.5,4270.6,4319.8,4369.3,4419,4468.8,4518.9,4569.1,4619.6,4875,5135.5,5401,5671.2,5945.9,6224.7,6793.4,7375.1,9.06,29.93,50.75,71.56,92.35,113.13,133.91,154.7,175.48,196.28,217.08,237.89,258.71,279.55,300.4,321.26,342.14,363.04,383.96,404.9,425.86,446.85,467.88,488.93,510.02,531.15,552.32,573.53,594.79,616.11,637.48,658.92,680.41,701.98,723.62,745.35,767.15,789.05,811.05,833.15,855.37,900.16,945.5,991.48,1038.2,1085.8,1134.4,1184.2,1235.5,1288.8,1344.5,1363.9,2742.9,2782.7,2834,2879,2919.7,2957.3,2992.6,3026.1,3058.1,3089,3118.8,3147.9,3176.2,3203.9,3231.2,3258,3284.5,3310.6,3336.4,3362,3387.4,3437.6,3487.3,3536.5,3585.4,3634.1,3682.6,3731,3779.4,3827.7,3876.1,3924.5,3973,4021.6,4070.3,4119.1,4168.1,4217.3,4266.5,4316,4365.7,4415.5,4465.5,4515.7,4566.1,4616.7,4872.7,5133.6,5399.5,5670,5944.9,6223.9,6792.9,7374.9,10.07,30.91,51.72,72.51,93.28,114.05,134.82,155.59,176.36,197.15,217.94,238.74,259.55,280.38,301.21,322.07,342.94,363.82,384.73,405.66,426.62,447.6,468.61,489.65,510.73,531.84,553,574.2,595.45,616.75,638.11,659.53,681.01,702.56,724.18,745.89,767.68,789.55,811.53,833.61,855.8,900.53,945.81,991.71,1038.3,1085.8,1134.3,1183.9,1235,1288,1343.3,1402,1408.1,2725.5,2782.8,2835.8,2882.1,2924,2962.7,2998.9,3033.2,3065.9,3097.4,3127.9,3157.5,3186.4,3214.6,3242.3,3269.6,3296.5,3323,3349.2,3375.1,3426.4,3476.9,3526.9,3576.5,3625.8,3674.8,3723.7,3772.5,3821.3,3870,3918.7,3967.6,4016.4,4065.4,4114.5,4163.7,4213,4262.5,4312.2,4362,4412,4462.2,4512.5,4563,4613.8,4870.3,5131.7,5397.9,5668.7,5943.9,6223.1,6792.4,7374.6,11.07,31.89,52.68,73.45,94.21,114.97,135.72,156.48,177.25,198.02,218.8,239.59,260.39,281.2,302.03,322.87,343.73,364.61,385.51,406.43,427.37,448.34,469.34,490.37,511.44,532.54,553.68,574.87,596.11,617.4,638.74,660.14,681.61,703.14,724.75,746.43,768.2,790.06,812.01,834.07,856.23,900.91,946.13,991.95,1038.5,1085.8,1134.2,1183.7,1234.6,1287.3,1342.2,1400.3,1450.4,2706.3,2721.1,2786.5,2840.6,2887.9,2930.6,2970,3006.9,3041.9,3075.2,3107.2,3138.2,3168.3,3197.6,3226.3,3254.4,3282,3309.3,3336.1,3362.7,3415,3466.4,3517.2,3567.5,3617.4,3667,3716.4,3765.6,3814.8,3863.9,3913,3962.1,4011.2,4060.5,4109.8,4159.3,4208.8,4258.5,4308.3,4358.3,4408.5,4458.8,4509.3,4560,4610.9,4868,5129.8,5396.4,5667.5,5942.9,6222.3,6791.9,7374.4,12.07,32.87,53.64,74.4,95.14,115.89,136.63,157.37,178.13,198.89,219.66,240.44,261.23,282.03,302.85,323.68,344.53,365.4,386.28,407.19,428.12,449.08,470.07,491.09,512.15,533.24,554.37,575.55,596.77,618.04,639.37,660.76,682.21,703.72,725.31,746.98,768.73,790.57,812.5,834.53,856.67,901.29,946.44,992.2,1038.6,1085.9,1134.1,1183.4,1234.1,1286.6,1341.2,1398.7,1460.5,1491.5,2685.4,2728.2,2793.6,2848.1,2895.9,2939.2,2979.2,3016.6,3052,3085.8,3118.3,3149.7,3180.1,3209.8,3238.9,3267.3,3295.3,3322.8,3350,3403.4,3455.8,3507.4,3558.4,3608.9,3659.1,3709,3758.7,3808.2,3857.7,3907.2,3956.6,4006,4055.6,4105.1,4154.8,4204.6,4254.5,4304.5,4354.7,4405,4455.5,4506.1,4557,4608,4865.6,5127.9,5394.9,5666.3,5941.9,6221.5,6791.5,7374.2,13.07,33.85,54.61,75.34,96.07,116.8,137.53,158.27,179.01,199.76,220.51,241.28,262.06,282.86,303.66,324.49,345.32,366.18,387.06,407.96,428.88,449.83,470.81,491.81,512.86,533.94,555.06,576.22,597.43,618.69,640,661.37,682.81,704.31,725.88,747.53,769.26,791.07,812.98,834.99,857.11,901.68,946.77,992.45,1038.8,1086,1134,1183.2,1233.7,1285.9,1340.2,1397.2,1458.2,1525.4,1531.5,2662.7,2739,2803.7,2858.1,2906.2,2949.7,2990,3027.7,3063.5,3097.6,3130.4,3162.2,3193,3223,3252.3,3281.1,3309.3,3337.1,3391.7,3445,3497.5,3549.2,3600.4,3651.1,3701.5,3751.7,3801.7,3851.5,3901.3,3951.1,4000.8,4050.6,4100.4,4150.4,4200.3,4250.5,4300.7,4351,4401.5,4452.2,4503,4553.9,4605,4863.3,5126,5393.3,5665,5940.9,6220.7,6791,7373.9,14.07,34.83,55.57,76.29,97,117.72,138.44,159.16,179.89,200.62,221.37,242.13,262.9,283.68,304.48,325.29,346.12,366.97,387.83,408.72,429.63,450.57,471.54,492.54,513.57,534.63,555.74,576.89,598.09,619.33,640.63,661.99,683.41,704.89,726.45,748.08,769.79,791.59,813.47,835.46,857.55,902.07,947.1,992.71,1039,1086,1134,1183,1233.4,1285.3,1339.2,1395.8,1456,1521.9,1571,2637.9,2672.3,2753.1,2816.5,2870.4,2918.3,2961.9,3002.3,3040.3,3076.2,3110.6,3143.7,3175.7,3206.7,3237,3266.6,3295.6,3324.1,3379.8,3434.2,3487.5,3539.9,3591.8,3643.1,3694,3744.7,3795.1,3845.3,3895.5,3945.6,3995.6,4045.7,4095.8,4145.9,4196.1,4246.4,4296.8,4347.4,4398,4448.8,4499.8,4550.9,4602.1,4860.9,5124.2,5391.8,5663.8,5939.9,6219.9,6790.5,7373.7,15.07,35.81,56.53,77.23,97.93,118.63,139.34,160.05,180.77,201.49,222.23,242.98,263.74,284.51,305.3,326.1,346.92,367.75,388.61,409.49,430.39,451.32,472.27,493.26,514.28,535.33,556.43,577.57,598.75,619.98,641.27,662.61,684.01,705.48,727.02,748.63,770.32,792.1,813.97,835.93,857.99,902.46,947.43,992.97,1039.2,1086.1,1134,1182.9,1233,1284.7,1338.3,1394.4,1454,1518.8,1592.4,1610.2,2610.7,2693.1,2769.7,2831.4,2884.7,2932.2,2975.7,3016.1,3054,3090.1,3124.7,3157.9,3190.1,3221.3,3251.8,3281.6,3310.8,3367.8,3423.2,3477.4,3530.6,3583.1,3635.1,3686.5,3737.6,3788.5,3839.1,3889.6,3940,3990.4,4040.7,4091.1,4141.4,4191.9,4242.4,4293,4343.7,4394.5,4445.5,4496.6,4547.8,4599.2,4858.6,5122.3,5390.3,5662.5,5938.9,6219.1,6790,7373.5,16.06,36.78,57.48,78.18,98.86,119.55,140.24,160.94,181.65,202.36,223.09,243.82,264.57,285.34,306.11,326.91,347.71,368.54,389.39,410.25,431.14,452.06,473.01,493.98,514.99,536.03,557.12,578.24,599.41,620.63,641.9,663.23,684.62,706.07,727.59,749.18,770.86,792.61,814.46,836.4,858.44,902.86,947.77,993.24,1039.4,1086.2,1133.9,1182.7,1232.7,1284.1,1337.4,1393.2,1452.1,1515.8,1587.4,1649.7,2580.8,2617,2715.8,2788.4,2848.3,2900.6,2947.6,2990.7,3031,3069,3105.1,3139.7,3173,3205.3,3236.7,3267.3,3297.3,3355.6,3412.1,3467.2,3521.2,3574.4,3627,3679,3730.6,3781.9,3832.9,3883.8,3934.5,3985.1,4035.7,4086.3,4137,4187.6,4238.3,4289.1,4340,4391,4442.2,4493.4,4544.8,4596.3,4856.3,5120.4,5388.7,5661.3,5937.9,6218.3,6789.6,7373.2,17.06,37.76,58.44,79.12,99.79,120.46,141.14,161.83,182.52,203.23,223.94,244.67,265.41,286.16,306.93,327.71,348.51,369.33,390.16,411.02,431.9,452.81,473.74,494.7,515.7,536.73,557.8,578.92,600.07,621.28,642.54,663.85,685.22,706.66,728.16,749.74,771.39,793.13,814.96,836.88,858.9,903.26,948.11,993.51,1039.5,1086.3,1133.9,1182.5,1232.3,1283.6,1336.6,1391.9,1450.3,1513.1,1582.9,1666.6,1690,2547.5,2651.1,2739.9,2808.7,2866.7,2917.9,2964.2,3007,3047.1,3084.9,3121,3155.6,3189,3221.4,3252.9,3283.6,3343.2,3400.8,3456.9,3511.7,3565.7,3618.8,3671.4,3723.5,3775.2,3826.6,3877.9,3928.9,3979.9,4030.8,4081.6,4132.5,4183.4,4234.3,4285.3,4336.4,4387.5,4438.8,4490.2,4541.7,4593.4,4853.9,5118.5,5387.2,5660.1,5936.9,6217.5,6789.1,7373,18.05,38.73,59.4,80.06,100.72,121.38,142.04,162.72,183.4,204.1,224.8,245.52,266.25,286.99,307.75,328.52,349.31,370.11,390.94,411.79,432.66,453.55,474.47,495.43,516.41,537.43,558.49,579.59,600.74,621.93,643.17,664.47,685.83,707.25,728.74,750.3,771.93,793.65,815.46,837.35,859.35,903.66,948.46,993.79,1039.7,1086.4,1133.9,1182.4,1232,1283.1,1335.8,1390.8,1448.6,1510.6,1578.8,1658.7,1732.1,2509.8,2566.1,2683.9,2764.9,2830.3,2886.4,2936.4,2982,3024.4,3064.1,3101.8,3137.7,3172.3,3205.7,3238.1,3269.7,3330.7,3389.5,3446.5,3502.2,3556.8,3610.6,3663.8,3716.3,3768.5,3820.4,3872,3923.4,3974.6,4025.8,4076.9,4128,4179.1,4230.3,4281.4,4332.7,4384,4435.5,4487,4538.7,4590.5,4851.6,5116.6,5385.7,5658.8,5935.9,6216.7,6788.6,7372.8,19.04,39.7,60.35,81,101.64,122.29,142.94,163.61,184.28,204.96,225.66,246.36,267.08,287.81,308.56,329.32,350.1,370.9,391.72,412.55,433.41,454.3,475.21,496.15,517.13,538.13,559.18,580.27,601.4,622.58,643.81,665.1,686.44,707.84,729.31,750.86,772.48,794.17,815.96,837.83,859.81,904.07,948.81,994.08,1040,1086.5,1133.9,1182.3,1231.8,1282.6,1335.1,1389.7,1447,1508.2,1575,1651.9,1755.2,1777.2,2466,2616.3,2715.9,2790.7,2852.8,2907.1,2956,3000.8,3042.6,3082,3119.4,3155.3,3189.8,3223.1,3255.5,3318,3378,3436,3492.6,3548,3602.4,3656.1,3709.2,3761.8,3814.1,3866,3917.8,3969.3,4020.8,4072.2,4123.5,4174.9,4226.2,4277.6,4329,4380.6,4432.2,4483.9,4535.7,4587.6,4849.3,5114.7,5384.2,5657.6,5934.9,6215.9,6788.2,7372.6,20.03,40.68,61.31,81.94,102.57,123.2,143.84,164.49,185.16,205.83,226.51,247.21,267.92,288.64,309.38,330.13,350.9,371.69,392.49,413.32,434.17,455.04,475.94,496.88,517.84,538.84,559.87,580.95,602.07,623.23,644.45,665.72,687.05,708.44,729.89,751.42,773.02,794.7,816.46,838.32,860.27,904.48,949.16,994.37,1040.2,1086.7,1134,1182.2,1231.5,1282.1,1334.4,1388.6,1445.5,1505.9,1571.6,1646,1740.1,1827.2,2412.3,2526.5,2659.4,2747.2,2816.9,2876.2,2928.7,2976.4,3020.4,3061.7,3100.7,3137.8,3173.5,3207.9,3241.2,3305.2,3366.4,3425.4,3482.9,3539,3594.1,3648.4,3702,3755.1,3807.8,3860.1,3912.2,3964.1,4015.8,4067.5,4119,4170.6,4222.2,4273.7,4325.4,4377.1,4428.8,4480.7,4532.6,4584.7,4846.9,5112.8,5382.6,5656.4,5933.9,6215.1,6787.7,7372.3,22.01,42.61,63.21,83.81,104.41,125.02,145.64,166.27,186.91,207.56,228.22,248.9,269.59,290.29,311.01,331.74,352.49,373.26,394.05,414.85,435.68,456.54,477.42,498.33,519.27,540.24,561.25,582.31,603.4,624.54,645.73,666.97,688.27,709.63,731.05,752.54,774.11,795.75,817.48,839.29,861.2,905.31,949.88,994.96,1040.6,1086.9,1134,1182,1231,1281.3,1333,1386.7,1442.7,1501.8,1565.4,1635.9,1719.4,1842.5,2011.3,2173.1,2504.5,2643.9,2735.8,2808.4,2870,2924.5,2973.7,3019.2,3061.7,3101.8,3140,3176.5,3211.8,3279,3342.8,3404,3463.3,3521,3577.4,3632.9,3687.6,3741.6,3795.1,3848.2,3901,3953.5,4005.8,4058,4110.1,4162.1,4214.1,4266,4318,4370.1,4422.2,4474.3,4526.6,4578.9,4842.3,5109.1,5379.6,5653.9,5932,6213.6,6786.8,7371.9,24.96,45.51,66.06,86.62,107.18,127.75,148.33,168.93,189.53,210.15,230.79,251.43,272.09,292.77,313.46,334.16,354.88,375.62,396.38,417.15,437.95,458.78,479.63,500.5,521.41,542.35,563.33,584.35,605.41,626.51,647.66,668.86,690.11,711.43,732.8,754.25,775.76,797.35,819.02,840.77,862.61,906.59,951,995.89,1041.3,1087.4,1134.2,1181.9,1230.5,1280.2,1331.3,1384.1,1438.9,1496.4,1557.5,1623.9,1698.6,1789.8,1935.7,2395.7,2578.6,2687.1,2769.4,2837.8,2897.3,2950.6,2999.4,3044.6,3087.2,3127.5,3165.9,3238.4,3306.5,3371.2,3433.3,3493.5,3552.1,3609.4,3665.7,3721.2,3776,3830.2,3884.1,3937.6,3990.8,4043.8,4096.6,4149.3,4201.9,4254.5,4307.1,4359.6,4412.2,4464.8,4517.5,4570.2,4835.4,5103.5,5375.1,5650.3,5929,6211.2,6785.4,7371.2,29.86,50.32,70.79,91.28,111.77,132.28,152.81,173.35,193.9,214.47,235.05,255.65,276.26,296.89,317.53,338.19,358.86,379.55,400.26,420.99,441.74,462.52,483.32,504.14,525,545.88,566.81,587.76,608.76,629.8,650.89,672.02,693.21,714.45,735.75,757.11,778.54,800.05,821.62,843.28,865.02,908.77,952.93,997.54,1042.7,1088.4,1134.7,1181.8,1229.8,1278.7,1328.9,1380.4,1433.7,1489.1,1547.1,1608.8,1675.6,1750.1,1838.2,1955.3,2152.8,2395.4,2552.9,2662.8,2748.9,2821,2884,2940.4,2992,3039.9,3084.7,3167.6,3243.6,3314.7,3382.2,3446.7,3509.1,3569.7,3628.8,3686.8,3743.9,3800.2,3855.8,3910.9,3965.7,4020,4074.1,4128,4181.7,4235.3,4288.8,4342.2,4395.6,4449,4502.4,4555.8,4823.8,5094.2,5367.6,5644.2,5924.2,6207.4,6783.1,7370.1,34.72,55.1,75.5,95.91,116.34,136.8,157.27,177.75,198.26,218.78,239.31,259.86,280.43,301.01,321.6,342.21,362.84,383.49,404.15,424.83,445.54,466.26,487.01,507.79,528.59,549.43,570.29,591.2,612.14,633.12,654.14,675.21,696.33,717.5,738.73,760.02,781.37,802.79,824.28,845.84,867.48,911.02,954.94,999.28,1044.1,1089.4,1135.4,1182,1229.4,1277.7,1327,1377.6,1429.5,1483.2,1539.1,1597.6,1659.6,1726.5,1800.4,1885.4,1988.6,2123.9,2291.9,2447.6,2571.8,2671,2753.6,2824.8,2888.1,2945.3,2997.9,3092.9,3178.1,3256.4,3329.6,3398.9,3465.3,3529.4,3591.5,3652.2,3711.6,3769.9,3827.4,3884.3,3940.5,3996.3,4051.7,4106.7,4161.5,4216.1,4270.6,4324.9,4379.1,4433.3,4487.4,4541.5,4812.4,5085,5360.1,5638.2,5919.4,6203.6,6780.9,7369.1,39.55,59.85,80.18,100.53,120.9,141.29,161.71,182.15,202.6,223.07,243.56,264.06,284.58,305.12,325.67,346.24,366.82,387.42,408.04,428.68,449.33,470.01,490.72,511.44,532.2,552.98,573.79,594.64,615.53,636.45,657.42,678.42,699.48,720.58,741.74,762.96,784.23,805.57,826.97,848.45,870,913.34,957.04,1001.1,1045.7,1090.7,1136.3,1182.4,1229.3,1277,1325.6,1375.3,1426.2,1478.5,1532.6,1588.8,1647.7,1709.9,1776.6,1849.6,1931.4,2025.5,2136.4,2264.5,2394.2,2511.8,2613.4,2700.8,2777.1,2845,2906.5,3015.1,3110.4,3196.5,3275.9,3350.4,3421,3488.7,3554,3617.4,3679.1,3739.6,3799.1,3857.6,3915.4,3972.6,4029.3,4085.6,4141.5,4197.1,4252.5,4307.7,4362.7,4417.7,4472.5,4527.3,4801.1,5075.9,5352.8,5632.3,5914.6,6199.9,6778.7,7368.1,44.35,64.58,84.83,105.12,125.44,145.78,166.14,186.53,206.93,227.36,247.8,268.26,288.74,309.23,329.74,350.26,370.8,391.36,411.93,432.52,453.14,473.77,494.42,515.1,535.81,556.54,577.31,598.1,618.93,639.8,660.71,681.66,702.65,723.69,744.78,765.93,787.13,808.39,829.72,851.11,872.57,915.72,959.21,1003.1,1047.3,1092,1137.3,1183.1,1229.5,1276.7,1324.6,1373.5,1423.5,1474.7,1527.4,1581.8,1638.3,1697.3,1759.6,1825.9,1897.7,1976.4,2063.7,2161.1,2267.9,2377.6,2482.7,2579,2665.5,2743.1,2813.2,2935.7,3041.5,3135.8,3221.7,3301.5,3376.5,3447.9,3516.4,3582.5,3646.8,3709.4,3770.8,3831.1,3890.5,3949.1,4007.1,4064.6,4121.6,4178.2,4234.6,4290.7,4346.5,4402.2,4457.8,4513.3,4789.9,5066.9,5345.6,5626.5,5910,6196.2,6776.6,7367.1,49.13,69.28,89.47,109.69,129.95,150.24,170.56,190.89,211.25,231.63,252.03,272.45,292.88,313.33,333.8,354.28,374.78,395.29,415.82,436.37,456.94,477.53,498.14,518.77,539.43,560.12,580.83,601.58,622.36,643.17,664.02,684.91,705.84,726.82,747.85,768.93,790.06,811.25,832.5,853.81,875.19,918.16,961.45,1005.1,1049.1,1093.5,1138.4,1183.9,1229.9,1276.6,1324,1372.2,1421.4,1471.6,1523.1,1576.1,1630.7,1687.4,1746.5,1808.6,1874.4,1944.7,2020.5,2102.5,2190.8,2284.7,2380.7,2474.8,2563.8,2646.5,2722.6,2857,2972.8,3075,3167.4,3252.5,3332,3407.2,3478.9,3547.9,3614.6,3679.4,3742.7,3804.8,3865.7,3925.8,3985.1,4043.8,4101.9,4159.5,4216.8,4273.8,4330.5,4387,4443.2,4499.4,4778.9,5058.1,5338.4,5620.8,5905.4,6192.6,6774.5,7366.2,58.58,78.6,98.67,118.78,138.94,159.13,179.35,199.59,219.86,240.16,260.47,280.81,301.16,321.53,341.91,362.31,382.73,403.16,423.61,444.08,464.56,485.06,505.59,526.13,546.7,567.29,587.91,608.56,629.24,649.95,670.69,691.47,712.29,733.16,754.06,775.01,796.01,817.06,838.17,859.33,880.55,923.19,966.1,1009.3,1052.9,1096.8,1141.1,1185.9,1231.2,1277,1323.5,1370.6,1418.4,1467.1,1516.8,1567.5,1619.4,1672.7,1727.6,1784.3,1843.2,1904.5,1968.6,2035.9,2106.4,2180.2,2256.8,2335.5,2415,2493.7,2570.3,2713.9,2842.7,2957.9,3061.8,3156.8,3244.8,3327.2,3405.3,3479.7,3551.3,3620.4,3687.5,3753,3817.1,3880,3941.9,4002.9,4063.2,4122.9,4182,4240.7,4299,4357,4414.7,4472.2,4757.3,5040.8,5324.5,5609.6,5896.5,6185.6,6770.5,7364.4,67.93,87.83,107.78,127.8,147.85,167.95,188.08,208.24,228.43,248.65,268.88,289.14,309.41,329.7,350.01,370.33,390.67,411.03,431.4,451.78,472.19,492.61,513.05,533.51,553.99,574.5,595.03,615.58,636.17,656.78,677.43,698.1,718.82,739.57,760.36,781.19,802.07,823,843.97,864.99,886.07,928.4,970.98,1013.8,1057,1100.5,1144.3,1188.5,1233.2,1278.3,1323.9,1370.1,1416.9,1464.3,1512.6,1561.6,1611.6,1662.6,1714.7,1768.1,1822.9,1879.3,1937.5,1997.5,2059.6,2123.7,2189.7,2257.5,2326.4,2396.2,2466.1,2603.3,2733.3,2854,2965.1,3067.4,3162.3,3251.1,3334.8,3414.3,3490.3,3563.5,3634.3,3703,3770.1,3835.7,3900.1,3963.4,4025.8,4087.4,4148.3,4208.7,4268.6,4328,4387.1,4445.9,4736.4,5024,5311.1,5598.8,5887.9,6178.9,6766.7,7362.8,77.18,96.96,116.82,136.73,156.7,176.72,196.77,216.85,236.96,257.1,277.26,297.44,317.64,337.86,358.09,378.34,398.61,418.89,439.18,459.5,479.82,500.17,520.53,540.91,561.31,581.73,602.18,622.65,643.14,663.66,684.21,704.8,725.41,746.06,766.74,787.47,808.23,829.04,849.89,870.78,891.73,933.78,976.05,1018.6,1061.4,1104.4,1147.8,1191.5,1235.6,1280.1,1325.1,1370.5,1416.4,1462.9,1510,1557.7,1606.2,1655.5,1705.6,1756.7,1808.8,1862,1916.5,1972.2,2029.3,2087.8,2147.6,2208.7,2270.9,2333.9,2397.4,2524.6,2649.3,2768.9,2882,2988.1,3087.5,3180.8,3269,3352.8,3432.7,3509.5,3583.6,3655.3,3725.1,3793.3,3860,3925.4,3989.8,4053.3,4115.9,4177.9,4239.3,4300.1,4360.5,4420.5,4716.2,5007.9,5298.1,5588.4,5879.7,6172.5,6763.2,7361.4,86.34,106.01,125.78,145.6,165.49,185.42,205.4,225.41,245.45,265.51,285.61,305.72,325.85,346,366.16,386.34,406.54,426.75,446.97,467.21,487.46,507.73,528.02,548.33,568.65,588.99,609.36,629.74,650.15,670.59,691.05,711.54,732.06,752.61,773.2,793.82,814.47,835.17,855.91,876.69,897.51,939.3,981.29,1023.5,1066,1108.7,1151.6,1194.9,1238.5,1282.5,1326.8,1371.6,1416.8,1462.4,1508.6,1555.3,1602.6,1650.5,1699.1,1748.5,1798.6,1849.6,1901.5,1954.3,2008.1,2062.9,2118.7,2175.4,2233,2291.4,2350.3,2468.8,2586.9,2702.5,2814.1,2920.7,3022,3118.1,3209.3,3296.2,3379.3,3459.1,3535.9,3610.4,3682.6,3753,3821.9,3889.3,3955.5,4020.7,4085,4148.5,4211.2,4273.4,4335,4396.2,4696.9,4992.4,5285.7,5578.5,5871.9,6166.4,6759.9,7360.2,95.4,114.99,134.66,154.41,174.22,194.08,213.98,233.92,253.9,273.9,293.92,313.97,334.03,354.11,374.21,394.33,414.45,434.6,454.75,474.92,495.11,515.31,535.53,555.76,576.01,596.27,616.56,636.87,657.2,677.55,697.93,718.33,738.76,759.23,779.72,800.24,820.8,841.39,862.02,882.69,903.4,944.94,986.68,1028.6,1070.8,1113.1,1155.8,1198.6,1241.8,1285.3,1329.1,1373.3,1417.8,1462.8,1508.2,1554,1600.3,1647.1,1694.5,1742.5,1791.1,1840.4,1890.4,1941.1,1992.5,2044.7,2097.7,2151.4,2205.7,2260.7,2316.2,2428.1,2540.2,2651.2,2759.8,2865.1,2966.4,3063.5,3156.4,3245.3,3330.7,3412.7,3491.9,3568.5,3642.8,3715.3,3786,3855.2,3923.1,3989.9,4055.6,4120.5,4184.5,4247.9,4310.7,4373,4678.4,4977.6,5273.8,5569.1,5864.4,6160.6,6756.8,7359.2,113.29,132.7,152.22,171.83,191.51,211.24,231.01,250.83,270.68,290.56,310.46,330.39,350.33,370.29,390.27,410.26,430.26,450.28,470.31,490.35,510.41,530.47,550.56,570.65,590.77,610.89,631.04,651.2,671.38,691.58,711.8,732.05,752.31,772.61,792.92,813.27,833.64,854.05,874.48,894.95,915.46,956.57,997.83,1039.3,1080.9,1122.7,1164.7,1206.9,1249.3,1292,1334.9,1378.1,1421.6,1465.4,1509.5,1554,1598.8,1644,1689.5,1735.5,1781.9,1828.7,1876,1923.8,1972,2020.7,2069.9,2119.6,2169.7,2220.2,2271,2373.7,2476.9,2580,2682.2,2782.9,2881.5,2977.5,3070.7,3161,3248.4,3333,3415.1,3494.7,3572.1,3647.6,3721.3,3793.4,3864.1,3933.5,4001.8,4069,4135.4,4201,4265.9,4330.1,4644.1,4950,5251.8,5551.6,5850.7,6150.1,6751.4,7357.7,130.88,150.15,169.54,189.02,208.58,228.2,247.87,267.58,287.32,307.09,326.89,346.7,366.54,386.39,406.25,426.13,446.02,465.93,485.84,505.77,525.7,545.65,565.61,585.58,605.57,625.57,645.58,665.61,685.66,705.72,725.8,745.9,766.02,786.16,806.32,826.51,846.72,866.96,887.22,907.51,927.83,968.56,1009.4,1050.4,1091.6,1132.9,1174.3,1216,1257.8,1299.8,1342,1384.5,1427.1,1470,1513.2,1556.6,1600.2,1644.2,1688.4,1732.9,1777.7,1822.8,1868.3,1914.1,1960.2,2006.6,2053.4,2100.5,2147.9,2195.6,2243.5,2340.1,2437.3,2534.6,2631.7,2727.9,2822.9,2916.4,3007.9,3097.5,3184.9,3270.1,3353.3,3434.3,3513.5,3590.8,3666.4,3740.5,3813.1,3884.5,3954.7,4023.9,4092.1,4159.5,4226.1,4292,4613.3,4925.3,5232,5535.9,5838.6,6140.9,6747,7356.9,148.21,167.35,186.63,206.01,225.47,244.99,264.57,284.18,303.83,323.5,343.2,362.92,382.66,402.41,422.18,441.95,461.74,481.54,501.35,521.17,540.99,560.83,580.68,600.54,620.41,640.29,660.19,680.09,700.01,719.95,739.9,759.87,779.86,799.86,819.88,839.92,859.99,880.07,900.18,920.31,940.47,980.86,1021.4,1062,1102.7,1143.6,1184.6,1225.7,1267,1308.5,1350.1,1391.9,1433.9,1476.1,1518.4,1561,1603.7,1646.7,1689.9,1733.3,1777,1820.8,1864.9,1909.3,1953.9,1998.7,2043.7,2089,2134.5,2180.3,2226.2,2318.5,2411.4,2504.5,2597.5,2690.1,2782,2872.8,2962.3,3050.4,3136.9,3221.7,3304.8,3386.2,3466,3544.2,3620.8,3696.1,3770.1,3842.8,3914.4,3985,4054.6,4123.3,4191.3,4258.5,4586,4903.2,5214.4,5522.1,5827.9,6133,6743.6,7357,165.31,184.34,203.52,222.81,242.18,261.62,281.11,300.64,320.21,339.8,359.42,379.05,398.7,418.36,438.03,457.72,477.41,497.11,516.83,536.55,556.27,576.01,595.75,615.51,635.27,655.05,674.83,694.63,714.43,734.25,754.09,773.93,793.8,813.67,833.57,853.48,873.41,893.36,913.33,933.32,953.33,993.41,1033.6,1073.9,1114.2,1154.7,1195.3,1236.1,1276.9,1317.9,1359,1400.3,1441.7,1483.3,1525,1566.8,1608.9,1651,1693.4,1735.9,1778.6,1821.5,1864.6,1907.8,1951.2,1994.8,2038.6,2082.6,2126.7,2170.9,2215.3,2304.6,2394.2,2484,2573.9,2663.6,2752.8,2841.3,2928.8,3015.3,3100.6,3184.5,3267.1,3348.3,3428.1,3506.6,3583.8,3659.6,3734.3,3807.9,3880.4,3952,4022.6,4092.3,4161.3,4229.6,4562.1,4883.8,5198.9,5510,5818.7,6126.4,6741.1,7357.7,182.21,220.22,258.73,278.1,297.52,336.47,375.53,414.65,453.82,493.03,532.27,571.54,610.83,650.15,689.51,728.9,768.34,807.82,847.37,886.97,926.63,966.37,1006.2,1046.1,1086,1126.1,1166.3,1206.5,1246.9,1287.3,1327.9,1368.6,1450.3,1532.5,1615.2,1698.4,1782.2,1866.5,1951.3,2036.7,2122.6,2209,2426.6,2644.9,2861.3,3073.1,3278.5,3476.6,3852.2,4204.9,4867,5499.5,6121,6739.6,7359.2,223.68,261.29,299.49,318.72,338,376.66,415.41,454.21,493.03,531.87,570.73,609.59,648.47,687.37,726.28,765.22,804.19,843.18,882.22,921.3,960.42,999.59,1038.8,1078.1,1117.4,1156.8,1196.3,1235.8,1275.4,1315.1,1354.8,1394.6,1474.4,1554.5,1634.9,1715.7,1796.7,1878,1959.6,2041.5,2123.6,2206,2412.7,2619.9,2826.3,3030.4,3230.7,3426.2,3802.1,4159.5,4834.9,5480.3,6112.2,6739.3,7365.7,264.27,301.54,339.5,358.62,377.79,416.25,454.77,493.31,531.86,570.41,608.95,647.49,686.02,724.56,763.11,801.66,840.23,878.82,917.44,956.08,994.76,1033.5,1072.2,1111,1149.8,1188.7,1227.6,1266.5,1305.5,1344.6,1383.7,1422.8,1501.2,1579.8,1658.5,1737.5,1816.6,1895.9,1975.3,2054.8,2134.5,2214.2,2414,2613.8,2813.1,3011.1,3206.8,3399.3,3773.2,4132.3,4815.4,5469.7,6109.8,6743.7,7375.8,304.15,341.11,378.88,397.92,417.02,455.31,493.66,532.01,570.35,608.66,646.94,685.2,723.45,761.68,799.91,838.14,876.38,914.63,952.89,991.16,1029.5,1067.8,1106.1,1144.5,1182.9,1221.3,1259.8,1298.3,1336.8,1375.3,1413.9,1452.5,1529.8,1607.2,1684.7,1762.3,1840,1917.7,1995.6,2073.4,2151.3,2229.2,2424.1,2618.7,2812.9,3006.1,3197.8,3387.4,3758.6,4117.9,4805.8,5466.5,6112.8,6752.4,7389.3,343.44,380.12,417.72,436.7,455.74,493.92,532.14,570.34,608.5,646.62,684.69,722.72,760.72,798.7,836.66,874.61,912.56,950.51,988.47,1026.4,1064.4,1102.4,1140.4,1178.4,1216.5,1254.6,1292.6,1330.7,1368.9,1407,1445.2,1483.3,1559.7,1636.2,1712.7,1789.2,1865.8,1942.4,2019,2095.6,2172.1,2248.7,2439.9,2630.7,2820.9,3010.4,3198.8,3385.7,3753.7,4112.6,4803.7,5469.3,6120.6,6764.7,7405.6,382.24,418.65,456.11,475.04,494.03,532.13,570.25,608.33,646.36,684.31,722.2,760.04,797.84,835.59,873.32,911.04,948.74,986.43,1024.1,1061.8,1099.5,1137.2,1175,1212.7,1250.4,1288.2,1325.9,1363.7,1401.5,1439.3,1477.1,1514.9,1590.6,1666.3,1742,1817.6,1893.3,1969,2044.6,2120.2,2195.8,2271.3,2459.7,2647.5,2834.8,3021.2,3206.8,3391.4,3756.2,4114,4807.2,5476.9,6132.3,6780.2,7424.5,420.6,456.76,494.1,512.98,531.94,569.97,608.02,646.01,683.92,721.75,759.49,797.17,834.78,872.35,909.88,947.39,984.87,1022.3,1059.8,1097.3,1134.7,1172.2,1209.7,1247.1,1284.6,1322.1,1359.6,1397.1,1434.6,1472.1,1509.6,1547.1,1622.2,1697.2,1772.2,1847.2,1922.1,1997.1,2071.9,2146.7,2221.4,2296.1,2482.3,2667.8,2852.7,3036.8,3220.1,3402.5,3764.2,4120.6,4815,5488.1,6147.1,6798.3,7445.7,496.19,531.91,569.03,587.84,606.75,644.69,682.64,720.51,758.27,795.9,833.42,870.84,908.17,945.43,982.64,1019.8,1056.9,1094,1131.1,1168.2,1205.3,1242.3,1279.4,1316.4,1353.5,1390.5,1427.6,1464.6,1501.7,1538.7,1575.7,1612.8,1686.8,1760.8,1834.8,1908.7,1982.5,2056.3,2129.9,2203.5,2277,2350.4,2533.3,2715.5,2896.9,3077.5,3257.4,3436.6,3792.7,4145.7,4840.1,5518.3,6183.6,6840.8,7493.3,605.83,642.77,661.54,680.41,718.3,756.21,794.01,831.66,869.17,906.53,943.76,980.88,1017.9,1054.9,1091.8,1128.6,1165.5,1202.2,1239,1275.8,1312.5,1349.2,1386,1422.7,1459.4,1496.1,1532.8,1569.5,1606.2,1642.8,1679.5,1752.8,1826,1899.2,1972.3,2045.3,2118.2,2191,2263.7,2336.3,2408.8,2589.4,2769.3,2948.3,3126.6,3304.1,3481,3832.9,4182.5,4874.7,5555.8,6226.3,6888.7,7546,715.5,734.24,753.09,790.96,828.84,866.61,904.21,941.63,978.88,1016,1053,1089.8,1126.6,1163.3,1199.9,1236.5,1273.1,1309.6,1346.1,1382.6,1419.1,1455.5,1492,1528.4,1564.9,1601.3,1637.7,1674.1,1710.5,1746.8,1819.6,1892.2,1964.7,2037.2,2109.6,2181.9,2254,2326.1,2398,2469.8,2648.8,2827,3004.3,3180.9,3356.8,3532,3880.7,4227.6,4916.6,5598.7,6272.9,6940,7601.7,806.06,824.91,862.78,900.66,938.42,975.99,1013.4,1050.5,1087.6,1124.4,1161.1,1197.8,1234.3,1270.8,1307.2,1343.6,1379.9,1416.2,1452.5,1488.8,1525,1561.2,1597.5,1633.7,1669.9,1706.1,1742.2,1778.4,1814.5,1886.8,1959,2031,2103,2174.9,2246.7,2318.4,2389.9,2461.3,2532.6,2710.4,2887.3,3063.4,3238.7,3413.4,3587.4,3933.8,4278.5,4964.4,5646.1,6322.5,6993.3,7659.1,895.96,933.85,971.75,1009.5,1047.1,1084.4,1121.6,1158.5,1195.3,1231.9,1268.4,1304.8,1341.2,1377.4,1413.7,1449.9,1486,1522.1,1558.2,1594.3,1630.4,1666.4,1702.5,1738.5,1774.5,1810.5,1846.5,1882.4,1954.3,2026.1,2097.8,2169.4,2240.9,2312.3,2383.5,2454.7,2525.7,2596.6,2773.4,2949.3,3124.5,3298.9,3472.6,3645.8,3990.5,4333.5,5016.7,5697.2,6374.7,7048.2,7717.5]),
+    s: new Float64Array([-0.00015,0.07625,0.15109,0.22446,0.29648,0.36722,0.43675,0.50513,0.5724,0.63861,0.6492,8.1488,8.1741,8.2036,8.2326,8.2611,8.2891,8.3167,8.3439,8.3707,8.3971,8.4232,8.4489,8.4742,8.4993,8.524,8.5484,8.5726,8.5964,8.62,8.6434,8.6664,8.6892,8.7118,8.7341,8.7562,8.7781,8.7997,8.8212,8.8424,8.8634,8.8843,8.9049,8.9456,8.9856,9.0248,9.0635,9.1015,9.1388,9.1756,9.2118,9.2475,9.2827,9.3173,9.3515,9.3852,9.4185,9.4513,9.4837,9.5157,9.5473,9.5785,9.6094,9.6398,9.67,9.6998,9.7293,9.7584,9.7873,9.8158,9.8441,9.8721,9.8998,9.9544,10.008,10.061,10.112,10.163,10.213,10.262,10.311,10.358,10.406,10.452,10.498,10.543,10.587,10.631,10.675,10.717,10.76,10.802,10.843,10.884,10.924,10.964,11.004,11.043,11.233,11.413,11.586,11.751,11.909,12.061,12.348,12.615,0.00015,0.07625,0.15109,0.22446,0.29648,0.36722,0.43675,0.50513,0.5724,0.63861,0.70381,0.76802,0.83129,0.83202,7.9072,7.936,7.9646,7.9927,8.0202,8.0474,8.0741,8.1004,8.1263,8.1519,8.1771,8.202,8.2266,8.2509,8.2749,8.2986,8.322,8.3451,8.368,8.3907,8.4131,8.4352,8.4572,8.4789,8.5004,8.5216,8.5427,8.5636,8.5843,8.625,8.6651,8.7044,8.7431,8.7811,8.8185,8.8553,8.8916,8.9273,8.9625,8.9972,9.0314,9.0651,9.0983,9.1312,9.1636,9.1956,9.2272,9.2584,9.2893,9.3198,9.3499,9.3797,9.4092,9.4384,9.4672,9.4958,9.5241,9.552,9.5798,9.6344,9.688,9.7406,9.7923,9.8431,9.8932,9.9424,9.9908,10.039,10.086,10.132,10.178,10.223,10.267,10.311,10.355,10.397,10.44,10.482,10.523,10.564,10.604,10.644,10.684,10.723,10.913,11.093,11.266,11.431,11.589,11.741,12.028,12.295,0.00015,0.07625,0.1518,0.22446,0.29648,0.36722,0.43675,0.50512,0.57239,0.63861,0.7038,0.7682,0.83129,0.89365,0.94407,7.7675,7.7727,7.8013,7.8292,7.8567,7.8837,7.9103,7.9365,7.9623,7.9877,8.0128,8.0375,8.062,8.0861,8.1099,8.1334,8.1566,8.1796,8.2023,8.2248,8.247,8.269,8.2908,8.3123,8.3337,8.3548,8.3757,8.3964,8.4372,8.4773,8.5167,8.5554,8.5935,8.6309,8.6678,8.7041,8.7398,8.775,8.8097,8.8439,8.8777,8.911,8.9438,8.9763,9.0083,9.0399,9.0711,9.102,9.1325,9.1627,9.1925,9.222,9.2511,9.28,9.3086,9.3368,9.3648,9.3925,9.4471,9.5007,9.5534,9.6051,9.6559,9.706,9.7552,9.8036,9.8514,9.8984,9.9448,9.9905,10.036,10.08,10.124,10.167,10.21,10.253,10.294,10.336,10.377,10.417,10.457,10.497,10.536,10.725,10.906,11.079,11.244,11.402,11.554,11.841,12.108,-0.00015,0.07625,0.15108,0.22446,0.29648,0.36722,0.43674,0.50512,0.57239,0.6386,0.7038,0.76801,0.83128,0.89364,0.95513,1.0158,1.0261,7.669,7.6925,7.7204,7.7477,7.7746,7.801,7.827,7.8527,7.8779,7.9028,7.9274,7.9516,7.9755,7.9992,8.0225,8.0456,8.0684,8.0909,8.1132,8.1353,8.1571,8.1787,8.2,8.2212,8.2421,8.2629,8.3038,8.344,8.3834,8.4222,8.4603,8.4977,8.5346,8.5709,8.6067,8.6419,8.6767,8.7109,8.7447,8.778,8.8108,8.8433,8.8753,8.9069,8.9382,8.9691,8.9996,9.0297,9.0596,9.0891,9.1182,9.1471,9.1757,9.2039,9.2319,9.2596,9.3143,9.3679,9.4205,9.4723,9.5231,9.5731,9.6223,9.6708,9.7185,9.7656,9.8119,9.8577,9.9028,9.9473,9.9912,10.035,10.077,10.12,10.162,10.203,10.244,10.284,10.324,10.364,10.403,10.593,10.773,10.946,11.111,11.269,11.421,11.708,11.975,-0.00015,0.07625,0.15108,0.22446,0.29647,0.36721,0.43674,0.50511,0.57239,0.6386,0.70379,0.76801,0.83128,0.89364,0.95512,1.0158,1.0756,1.0912,7.593,7.6138,7.6415,7.6686,7.6953,7.7215,7.7474,7.7728,7.7978,7.8225,7.8469,7.871,7.8947,7.9181,7.9413,7.9642,7.9868,8.0091,8.0312,8.0531,8.0748,8.0962,8.1174,8.1384,8.1592,8.2001,8.2404,8.2799,8.3187,8.3568,8.3943,8.4313,8.4676,8.5034,8.5386,8.5734,8.6076,8.6414,8.6747,8.7076,8.7401,8.7721,8.8038,8.835,8.8659,8.8964,8.9266,8.9564,8.9859,9.0151,9.044,9.0726,9.1008,9.1288,9.1566,9.2112,9.2648,9.3175,9.3692,9.4201,9.4701,9.5193,9.5678,9.6155,9.6625,9.7089,9.7546,9.7998,9.8443,9.8882,9.9316,9.9745,10.017,10.059,10.1,10.141,10.181,10.221,10.261,10.3,10.49,10.67,10.843,11.008,11.166,11.318,11.605,11.872,0.00015,0.07625,0.15108,0.22445,0.29647,0.36721,0.43674,0.50511,0.57238,0.63859,0.70379,0.768,0.83127,0.89363,0.95512,1.0158,1.0756,1.1346,1.1454,7.5311,7.554,7.5814,7.6084,7.6348,7.6609,7.6865,7.7117,7.7365,7.761,7.7852,7.809,7.8326,7.8558,7.8788,7.9015,7.9239,7.9461,7.968,7.9897,8.0112,8.0324,8.0535,8.0743,8.1153,8.1556,8.1952,8.234,8.2722,8.3098,8.3467,8.3831,8.4189,8.4542,8.4889,8.5232,8.557,8.5904,8.6232,8.6557,8.6878,8.7194,8.7507,8.7816,8.8121,8.8423,8.8721,8.9017,8.9308,8.9597,8.9883,9.0166,9.0446,9.0723,9.127,9.1806,9.2332,9.285,9.3358,9.3859,9.4351,9.4836,9.5313,9.5784,9.6247,9.6705,9.7156,9.7601,9.804,9.8474,9.8903,9.9326,9.9745,10.016,10.057,10.097,10.137,10.177,10.216,10.406,10.586,10.759,10.924,11.082,11.234,11.521,11.788,-0.00015,0.07625,0.15108,0.22445,0.29647,0.36721,0.43673,0.50511,0.57238,0.63859,0.70378,0.768,0.83127,0.89363,0.95511,1.0157,1.0756,1.1346,1.1921,7.479,7.4794,7.5072,7.5344,7.5611,7.5874,7.6132,7.6385,7.6635,7.6882,7.7124,7.7364,7.76,7.7834,7.8064,7.8292,7.8517,7.8739,7.8959,7.9177,7.9392,7.9605,7.9815,8.0024,8.0435,8.0839,8.1235,8.1624,8.2006,8.2382,8.2752,8.3116,8.3474,8.3827,8.4175,8.4518,8.4856,8.519,8.5519,8.5844,8.6164,8.6481,8.6794,8.7103,8.7408,8.771,8.8009,8.8304,8.8596,8.8885,8.917,8.9453,8.9733,9.0011,9.0557,9.1094,9.162,9.2138,9.2646,9.3147,9.3639,9.4124,9.4601,9.5072,9.5535,9.5993,9.6444,9.6889,9.7329,9.7763,9.8191,9.8615,9.9033,9.9447,9.9855,10.026,10.066,10.106,10.145,10.334,10.515,10.688,10.853,11.011,11.163,11.45,11.717,-0.00015,0.07625,0.15108,0.22445,0.29647,0.36721,0.43673,0.5051,0.57237,0.63858,0.70378,0.76799,0.83126,0.89362,0.9551,1.0157,1.0756,1.1346,1.1929,1.233,7.4339,7.4424,7.4699,7.4969,7.5233,7.5493,7.5749,7.6,7.6248,7.6492,7.6733,7.697,7.7204,7.7435,7.7664,7.7889,7.8113,7.8333,7.8551,7.8767,7.898,7.9191,7.94,7.9812,8.0216,8.0613,8.1002,8.1385,8.1761,8.2131,8.2496,8.2854,8.3208,8.3556,8.3899,8.4237,8.4571,8.49,8.5225,8.5546,8.5863,8.6176,8.6485,8.679,8.7092,8.7391,8.7686,8.7978,8.8267,8.8553,8.8836,8.9116,8.9393,8.994,9.0476,9.1003,9.1521,9.2029,9.253,9.3022,9.3507,9.3984,9.4455,9.4919,9.5376,9.5827,9.6273,9.6712,9.7146,9.7575,9.7998,9.8416,9.883,9.9239,9.9643,10.004,10.044,10.083,10.273,10.453,10.626,10.791,10.949,11.101,11.388,11.655,-0.00015,0.07625,0.15108,0.22445,0.29647,0.3672,0.43673,0.5051,0.57237,0.63858,0.70377,0.76799,0.83126,0.89362,0.9551,1.0157,1.0756,1.1346,1.1929,1.2504,1.2696,7.3943,7.4126,7.4399,7.4665,7.4927,7.5185,7.5438,7.5687,7.5932,7.6174,7.6412,7.6647,7.6879,7.7108,7.7335,7.7559,7.778,7.7998,7.8214,7.8428,7.864,7.8849,7.9262,7.9667,8.0064,8.0454,8.0837,8.1213,8.1584,8.1949,8.2307,8.2661,8.3009,8.3353,8.3691,8.4025,8.4354,8.4679,8.5,8.5317,8.563,8.5939,8.6245,8.6547,8.6846,8.7141,8.7433,8.7722,8.8008,8.8291,8.8571,8.8849,8.9396,8.9932,9.0459,9.0976,9.1485,9.1986,9.2478,9.2963,9.344,9.3911,9.4375,9.4832,9.5283,9.5729,9.6168,9.6602,9.7031,9.7454,9.7873,9.8286,9.8695,9.9099,9.9499,9.9895,10.029,10.218,10.399,10.572,10.737,10.895,11.047,11.334,11.601,-0.00015,0.07625,0.15108,0.22445,0.29646,0.3672,0.43673,0.5051,0.57237,0.63858,0.70377,0.76798,0.83125,0.89361,0.95509,1.0157,1.0755,1.1346,1.1928,1.2504,1.3028,7.3588,7.361,7.3885,7.4155,7.4418,7.4678,7.4932,7.5183,7.5429,7.5672,7.5911,7.6148,7.638,7.661,7.6838,7.7062,7.7284,7.7503,7.7719,7.7934,7.8146,7.8356,7.8769,7.9174,7.9572,7.9962,8.0346,8.0723,8.1094,8.1459,8.1818,8.2172,8.252,8.2864,8.3202,8.3536,8.3866,8.4191,8.4512,8.4829,8.5142,8.5452,8.5757,8.6059,8.6358,8.6653,8.6946,8.7235,8.7521,8.7804,8.8084,8.8361,8.8908,8.9445,8.9972,9.0489,9.0998,9.1499,9.1991,9.2476,9.2954,9.3424,9.3888,9.4345,9.4797,9.5242,9.5681,9.6115,9.6544,9.6968,9.7386,9.78,9.8209,9.8613,9.9013,9.9408,9.98,10.17,10.35,10.523,10.688,10.846,10.998,11.285,11.552,-0.00015,0.07625,0.15108,0.22445,0.29646,0.3672,0.43672,0.50509,0.57236,0.63857,0.70376,0.76798,0.83125,0.8936,0.95509,1.0157,1.0755,1.1346,1.1928,1.2504,1.3072,1.333,7.3269,7.3418,7.369,7.3956,7.4217,7.4473,7.4725,7.4973,7.5217,7.5457,7.5694,7.5928,7.6159,7.6387,7.6612,7.6834,7.7054,7.7271,7.7486,7.7698,7.7908,7.8322,7.8728,7.9126,7.9517,7.9901,8.0279,8.065,8.1015,8.1374,8.1729,8.2077,8.2421,8.276,8.3094,8.3424,8.3749,8.407,8.4387,8.4701,8.501,8.5316,8.5618,8.5917,8.6212,8.6504,8.6794,8.708,8.7363,8.7643,8.7921,8.8467,8.9004,8.9531,9.0049,9.0558,9.1058,9.1551,9.2036,9.2513,9.2984,9.3448,9.3905,9.4356,9.4802,9.5241,9.5675,9.6104,9.6527,9.6946,9.736,9.7768,9.8173,9.8573,9.8968,9.936,10.126,10.306,10.479,10.644,10.802,10.954,11.241,11.508,-0.00015,0.07625,0.15108,0.22445,0.29646,0.36719,0.43672,0.50509,0.57236,0.63857,0.70376,0.76797,0.83124,0.8936,0.95508,1.0157,1.0755,1.1346,1.1928,1.2504,1.3072,1.3609,7.2977,7.2989,7.3263,7.3531,7.3794,7.4052,7.4305,7.4554,7.48,7.5041,7.5279,7.5514,7.5745,7.5974,7.6199,7.6422,7.6643,7.686,7.7076,7.7289,7.7499,7.7914,7.832,7.8719,7.9111,7.9495,7.9873,8.0244,8.061,8.097,8.1324,8.1673,8.2017,8.2356,8.269,8.302,8.3345,8.3667,8.3984,8.4297,8.4607,8.4913,8.5215,8.5514,8.5809,8.6102,8.6391,8.6677,8.696,8.724,8.7518,8.8065,8.8602,8.9129,8.9646,9.0155,9.0656,9.1149,9.1633,9.2111,9.2582,9.3046,9.3503,9.3954,9.44,9.4839,9.5273,9.5702,9.6126,9.6544,9.6958,9.7367,9.7771,9.8171,9.8567,9.8958,10.086,10.266,10.439,10.604,10.762,10.914,11.201,11.468,-0.00015,0.07625,0.15107,0.22444,0.29646,0.36719,0.43672,0.50509,0.57235,0.63856,0.70375,0.76797,0.83123,0.89359,0.95507,1.0157,1.0755,1.1346,1.1928,1.2504,1.3072,1.3633,1.3868,7.2709,7.2868,7.3138,7.3403,7.3663,7.3917,7.4168,7.4414,7.4657,7.4896,7.5132,7.5364,7.5593,7.5819,7.6043,7.6264,7.6482,7.6698,7.6911,7.7122,7.7538,7.7945,7.8344,7.8736,7.9121,7.9499,7.9871,8.0237,8.0597,8.0951,8.13,8.1644,8.1984,8.2318,8.2648,8.2974,8.3295,8.3613,8.3926,8.4236,8.4542,8.4844,8.5143,8.5439,8.5731,8.602,8.6306,8.659,8.687,8.7148,8.7695,8.8231,8.8759,8.9276,8.9785,9.0286,9.0779,9.1264,9.1741,9.2212,9.2676,9.3133,9.3585,9.403,9.447,9.4904,9.5332,9.5756,9.6174,9.6588,9.6997,9.7401,9.7801,9.8197,9.8588,10.049,10.229,10.402,10.567,10.725,10.877,11.164,11.431,-0.00015,0.07625,0.15107,0.22444,0.29645,0.36719,0.43671,0.50508,0.57235,0.63856,0.70375,0.76796,0.83123,0.89359,0.95507,1.0157,1.0755,1.1345,1.1928,1.2504,1.3072,1.3633,1.411,7.2461,7.25,7.2773,7.3039,7.3301,7.3557,7.3809,7.4057,7.43,7.454,7.4777,7.501,7.524,7.5467,7.5691,7.5912,7.6131,7.6347,7.6561,7.6773,7.7189,7.7597,7.7996,7.8389,7.8774,7.9153,7.9525,7.9891,8.0251,8.0606,8.0955,8.13,8.1639,8.1974,8.2304,8.263,8.2951,8.3269,8.3582,8.3892,8.4198,8.45,8.4799,8.5095,8.5388,8.5677,8.5963,8.6246,8.6527,8.6804,8.7352,8.7889,8.8416,8.8934,8.9443,8.9943,9.0436,9.0921,9.1399,9.1869,9.2333,9.2791,9.3242,9.3688,9.4127,9.4561,9.499,9.5414,9.5832,9.6246,9.6655,9.7059,9.7459,9.7855,9.8246,10.014,10.195,10.368,10.533,10.691,10.843,11.13,11.397,-0.00014,0.07625,0.15107,0.22444,0.29645,0.36719,0.43671,0.50508,0.57235,0.63855,0.70374,0.76796,0.83122,0.89358,0.95506,1.0157,1.0755,1.1345,1.1928,1.2503,1.3072,1.3633,1.4188,1.4337,7.223,7.243,7.2699,7.2962,7.322,7.3473,7.3722,7.3967,7.4208,7.4445,7.4679,7.491,7.5138,7.5363,7.5585,7.5804,7.6021,7.6235,7.6447,7.6864,7.7272,7.7672,7.8065,7.8451,7.883,7.9202,7.9569,7.9929,8.0284,8.0634,8.0978,8.1318,8.1653,8.1983,8.2309,8.2631,8.2948,8.3262,8.3572,8.3878,8.418,8.448,8.4775,8.5068,8.5357,8.5644,8.5927,8.6207,8.6485,8.7032,8.7569,8.8096,8.8614,8.9124,8.9624,9.0117,9.0602,9.108,9.155,9.2014,9.2472,9.2923,9.3369,9.3808,9.4243,9.4671,9.5095,9.5513,9.5927,9.6336,9.674,9.714,9.7536,9.7927,9.9825,10.163,10.336,10.501,10.659,10.811,11.098,11.365,-0.00014,0.07625,0.15107,0.22444,0.29645,0.36718,0.43671,0.50508,0.57234,0.63855,0.70374,0.76795,0.83122,0.89358,0.95506,1.0157,1.0755,1.1345,1.1928,1.2503,1.3072,1.3633,1.4188,1.4551,7.2014,7.2108,7.2379,7.2644,7.2904,7.3158,7.3408,7.3654,7.3896,7.4135,7.4369,7.4601,7.4829,7.5055,7.5277,7.5497,7.5714,7.5929,7.6141,7.6559,7.6968,7.7369,7.7762,7.8148,7.8528,7.8901,7.9267,7.9628,7.9983,8.0333,8.0678,8.1018,8.1353,8.1683,8.2009,8.2331,8.2649,8.2962,8.3272,8.3578,8.3881,8.418,8.4476,8.4769,8.5058,8.5344,8.5628,8.5908,8.6186,8.6734,8.7271,8.7798,8.8316,8.8825,8.9326,8.9819,9.0304,9.0781,9.1252,9.1716,9.2174,9.2625,9.3071,9.351,9.3944,9.4373,9.4797,9.5215,9.5629,9.6038,9.6442,9.6842,9.7238,9.7629,9.9527,10.133,10.306,10.471,10.629,10.781,11.068,11.335,-0.00014,0.07625,0.15107,0.22444,0.29645,0.36718,0.4367,0.50507,0.57233,0.63854,0.70373,0.76794,0.83121,0.89356,0.95504,1.0157,1.0755,1.1345,1.1928,1.2503,1.3071,1.3633,1.4188,1.4737,1.4945,7.1621,7.179,7.2059,7.2322,7.258,7.2832,7.3081,7.3325,7.3565,7.3801,7.4034,7.4264,7.4491,7.4714,7.4935,7.5154,7.5369,7.5582,7.6002,7.6412,7.6814,7.7208,7.7595,7.7975,7.8349,7.8716,7.9078,7.9433,7.9784,8.0129,8.0469,8.0804,8.1135,8.1461,8.1783,8.2101,8.2415,8.2725,8.3032,8.3334,8.3634,8.393,8.4222,8.4512,8.4799,8.5082,8.5363,8.5641,8.6188,8.6725,8.7253,8.7771,8.828,8.8781,8.9274,8.9759,9.0237,9.0708,9.1172,9.1629,9.2081,9.2526,9.2966,9.34,9.3829,9.4253,9.4671,9.5085,9.5494,9.5898,9.6298,9.6694,9.7085,9.8983,10.079,10.252,10.417,10.575,10.727,11.014,11.281,-0.00014,0.07625,0.15107,0.22443,0.29644,0.36717,0.4367,0.50506,0.57233,0.63853,0.70372,0.76793,0.8312,0.89355,0.95503,1.0157,1.0755,1.1345,1.1928,1.2503,1.3071,1.3633,1.4188,1.4736,1.5279,1.5302,7.1269,7.1531,7.1797,7.2058,7.2313,7.2564,7.281,7.3052,7.329,7.3525,7.3756,7.3984,7.4209,7.4431,7.465,7.4867,7.5081,7.5501,7.5913,7.6316,7.6712,7.71,7.748,7.7855,7.8223,7.8584,7.8941,7.9291,7.9637,7.9977,8.0313,8.0644,8.0971,8.1293,8.1611,8.1925,8.2236,8.2542,8.2845,8.3145,8.3441,8.3734,8.4023,8.431,8.4594,8.4874,8.5152,8.57,8.6237,8.6765,8.7283,8.7792,8.8293,8.8786,8.9272,8.975,9.022,9.0685,9.1142,9.1594,9.2039,9.2479,9.2913,9.3342,9.3766,9.4184,9.4598,9.5007,9.5412,9.5812,9.6207,9.6599,9.8497,10.03,10.203,10.368,10.526,10.678,10.965,11.232,-0.00014,0.07625,0.15107,0.22443,0.29644,0.36717,0.43669,0.50506,0.57232,0.63852,0.70371,0.76792,0.83119,0.89354,0.95502,1.0157,1.0755,1.1345,1.1928,1.2503,1.3071,1.3633,1.4188,1.4736,1.5279,1.5628,7.0951,7.1047,7.1318,7.1582,7.184,7.2093,7.2341,7.2585,7.2825,7.3062,7.3294,7.3524,7.375,7.3973,7.4193,7.4411,7.4625,7.5048,7.5461,7.5865,7.6261,7.665,7.7032,7.7407,7.7775,7.8138,7.8494,7.8845,7.9191,7.9532,7.9868,8.02,8.0526,8.0849,8.1167,8.1482,8.1792,8.2099,8.2402,8.2702,8.2998,8.3291,8.3581,8.3868,8.4151,8.4432,8.471,8.5258,8.5796,8.6323,8.6842,8.7351,8.7852,8.8345,8.8831,8.9309,8.978,9.0244,9.0702,9.1153,9.1599,9.2039,9.2473,9.2902,9.3325,9.3744,9.4158,9.4567,9.4971,9.5371,9.5767,9.6159,9.8056,9.9863,10.159,10.324,10.482,10.634,10.921,11.188,-0.00014,0.07625,0.15106,0.22443,0.29643,0.36716,0.43668,0.50505,0.57231,0.63852,0.7037,0.76791,0.83118,0.89353,0.95501,1.0156,1.0755,1.1345,1.1927,1.2503,1.3071,1.3633,1.4187,1.4736,1.5279,1.5816,1.593,7.0661,7.0876,7.1143,7.1405,7.166,7.1911,7.2157,7.2399,7.2636,7.2871,7.3101,7.3329,7.3553,7.3774,7.3993,7.4208,7.4632,7.5046,7.5452,7.5849,7.6239,7.6621,7.6997,7.7366,7.7729,7.8086,7.8438,7.8784,7.9125,7.9462,7.9793,8.0121,8.0443,8.0762,8.1077,8.1387,8.1694,8.1998,8.2297,8.2594,8.2887,8.3177,8.3464,8.3748,8.4029,8.4307,8.4855,8.5392,8.592,8.6439,8.6948,8.7449,8.7943,8.8428,8.8906,8.9377,8.9841,9.0299,9.0751,9.1196,9.1636,9.2071,9.2499,9.2923,9.3342,9.3756,9.4165,9.4569,9.4969,9.5365,9.5757,9.7655,9.9462,10.119,10.284,10.442,10.594,10.881,11.148,-0.00014,0.07625,0.15106,0.22442,0.29643,0.36716,0.43668,0.50504,0.5723,0.63851,0.70369,0.7679,0.83117,0.89352,0.955,1.0156,1.0754,1.1345,1.1927,1.2503,1.3071,1.3632,1.4187,1.4736,1.5279,1.5815,1.621,7.0394,7.0465,7.0736,7.1001,7.1259,7.1512,7.176,7.2004,7.2243,7.2479,7.2711,7.294,7.3165,7.3387,7.3607,7.3823,7.4249,7.4664,7.5071,7.5469,7.586,7.6243,7.6619,7.6989,7.7353,7.771,7.8063,7.8409,7.8751,7.9087,7.9419,7.9747,8.007,8.0389,8.0704,8.1014,8.1322,8.1625,8.1925,8.2222,8.2515,8.2805,8.3092,8.3376,8.3657,8.3935,8.4483,8.5021,8.5549,8.6068,8.6578,8.7079,8.7572,8.8057,8.8536,8.9007,8.9471,8.9929,9.0381,9.0826,9.1266,9.17,9.2129,9.2553,9.2972,9.3386,9.3795,9.4199,9.4599,9.4995,9.5387,9.7285,9.9092,10.082,10.247,10.405,10.557,10.844,11.111,-0.00014,0.07625,0.15106,0.22442,0.29643,0.36715,0.43667,0.50503,0.5723,0.6385,0.70368,0.76789,0.83115,0.89351,0.95498,1.0156,1.0754,1.1344,1.1927,1.2502,1.3071,1.3632,1.4187,1.4736,1.5278,1.5815,1.6346,1.6471,7.0146,7.0356,7.0624,7.0885,7.114,7.139,7.1636,7.1877,7.2114,7.2348,7.2578,7.2804,7.3028,7.3248,7.3465,7.3893,7.431,7.4717,7.5117,7.5508,7.5892,7.6269,7.664,7.7004,7.7362,7.7714,7.8062,7.8404,7.8741,7.9073,7.94,7.9724,8.0043,8.0358,8.0669,8.0976,8.128,8.158,8.1877,8.217,8.246,8.2748,8.3032,8.3313,8.3591,8.414,8.4677,8.5206,8.5724,8.6234,8.6736,8.7229,8.7714,8.8193,8.8664,8.9128,8.9586,9.0038,9.0484,9.0923,9.1358,9.1787,9.2211,9.2629,9.3043,9.3452,9.3857,9.4257,9.4653,9.5044,9.6943,9.875,10.048,10.213,10.371,10.523,10.81,11.077,-0.00013,0.07625,0.15106,0.22442,0.29642,0.36715,0.43666,0.50503,0.57229,0.63849,0.70368,0.76788,0.83114,0.8935,0.95497,1.0156,1.0754,1.1344,1.1927,1.2502,1.3071,1.3632,1.4187,1.4736,1.5278,1.5815,1.6346,1.6717,6.9916,6.9998,7.0269,7.0533,7.0791,7.1044,7.1291,7.1534,7.1773,7.2008,7.2239,7.2467,7.2691,7.2913,7.3131,7.356,7.3978,7.4387,7.4788,7.518,7.5565,7.5943,7.6314,7.6678,7.7037,7.739,7.7738,7.808,7.8417,7.875,7.9078,7.9401,7.9721,8.0036,8.0347,8.0655,8.0959,8.1259,8.1556,8.1849,8.214,8.2427,8.2711,8.2992,8.3271,8.3819,8.4357,8.4886,8.5404,8.5914,8.6416,8.6909,8.7395,8.7873,8.8344,8.8809,8.9267,8.9719,9.0164,9.0604,9.1039,9.1468,9.1892,9.231,9.2724,9.3133,9.3538,9.3938,9.4334,9.4726,9.6624,9.8431,10.016,10.181,10.339,10.491,10.778,11.045,-0.00013,0.07625,0.15106,0.22441,0.29641,0.36714,0.43665,0.50501,0.57227,0.63847,0.70365,0.76786,0.83112,0.89347,0.95494,1.0156,1.0754,1.1344,1.1927,1.2502,1.307,1.3632,1.4187,1.4735,1.5278,1.5814,1.6346,1.6872,1.7274,6.9401,6.9465,6.9738,7.0003,7.0261,7.0514,7.0761,7.1004,7.1243,7.1477,7.1708,7.1935,7.2159,7.238,7.2813,7.3235,7.3647,7.405,7.4444,7.4831,7.5211,7.5583,7.5949,7.6309,7.6664,7.7012,7.7355,7.7693,7.8027,7.8355,7.868,7.9,7.9315,7.9627,7.9935,8.0239,8.054,8.0837,8.1131,8.1422,8.1709,8.1994,8.2275,8.2554,8.3103,8.3642,8.417,8.4689,8.52,8.5701,8.6195,8.6681,8.7159,8.7631,8.8095,8.8553,8.9005,8.9451,8.9891,9.0326,9.0755,9.1179,9.1598,9.2012,9.2421,9.2825,9.3226,9.3621,9.4013,9.5912,9.7719,9.9445,10.11,10.268,10.42,10.707,10.974,-0.00013,0.07625,0.15105,0.2244,0.2964,0.36712,0.43663,0.50499,0.57225,0.63845,0.70363,0.76783,0.83109,0.89344,0.95491,1.0155,1.0753,1.1344,1.1926,1.2502,1.307,1.3631,1.4186,1.4735,1.5277,1.5814,1.6345,1.6871,1.7392,1.7765,6.8955,6.9033,6.9306,6.9571,6.9829,7.0081,7.0329,7.0571,7.0809,7.1043,7.1273,7.15,7.1723,7.216,7.2586,7.3001,7.3407,7.3804,7.4193,7.4574,7.4948,7.5316,7.5677,7.6032,7.6382,7.6726,7.7065,7.7399,7.7728,7.8053,7.8374,7.869,7.9002,7.9311,7.9615,7.9917,8.0214,8.0508,8.0799,8.1087,8.1372,8.1654,8.1933,8.2482,8.3021,8.355,8.4069,8.458,8.5082,8.5576,8.6062,8.654,8.7012,8.7477,8.7935,8.8387,8.8833,8.9273,8.9708,9.0137,9.0561,9.098,9.1394,9.1803,9.2208,9.2608,9.3004,9.3396,9.5295,9.7102,9.8828,10.048,10.206,10.358,10.645,10.912,-0.00012,0.07625,0.15105,0.2244,0.29639,0.36711,0.43662,0.50498,0.57223,0.63843,0.70361,0.76781,0.83106,0.89341,0.95488,1.0155,1.0753,1.1343,1.1926,1.2501,1.3069,1.3631,1.4186,1.4734,1.5277,1.5814,1.6345,1.6871,1.7391,1.7907,1.8205,6.856,6.8678,6.895,6.9215,6.9473,6.9725,6.9971,7.0213,7.045,7.0683,7.0913,7.1138,7.158,7.2009,7.2428,7.2836,7.3235,7.3626,7.401,7.4385,7.4754,7.5117,7.5473,7.5824,7.6169,7.6509,7.6844,7.7174,7.7499,7.782,7.8137,7.845,7.8759,7.9064,7.9366,7.9664,7.9958,8.025,8.0538,8.0823,8.1105,8.1384,8.1934,8.2473,8.3002,8.3522,8.4033,8.4535,8.5029,8.5515,8.5994,8.6466,8.6931,8.7389,8.7842,8.8288,8.8728,8.9163,8.9592,9.0016,9.0435,9.0849,9.1258,9.1663,9.2064,9.246,9.2851,9.475,9.6558,9.8284,9.9935,10.152,10.304,10.591,10.858,-0.00012,0.07625,0.15104,0.22439,0.29638,0.3671,0.4366,0.50496,0.57221,0.6384,0.70358,0.76778,0.83104,0.89338,0.95485,1.0155,1.0753,1.1343,1.1926,1.2501,1.3069,1.363,1.4185,1.4734,1.5276,1.5813,1.6344,1.687,1.7391,1.7907,1.8418,1.8604,6.8207,6.8384,6.8656,6.8919,6.9176,6.9427,6.9673,6.9913,7.015,7.0382,7.061,7.1056,7.1489,7.1911,7.2322,7.2724,7.3117,7.3502,7.388,7.425,7.4614,7.4972,7.5323,7.5669,7.601,7.6346,7.6677,7.7003,7.7325,7.7642,7.7955,7.8265,7.857,7.8872,7.917,7.9465,7.9757,8.0045,8.0331,8.0613,8.0892,8.1443,8.1983,8.2512,8.3032,8.3543,8.4046,8.454,8.5027,8.5506,8.5977,8.6443,8.6901,8.7353,8.78,8.824,8.8675,8.9104,8.9528,8.9947,9.0362,9.0771,9.1176,9.1576,9.1972,9.2364,9.4263,9.6071,9.7797,9.9448,10.103,10.255,10.542,10.809,-0.00012,0.07624,0.15104,0.22438,0.29637,0.36708,0.43659,0.50494,0.57219,0.63838,0.70356,0.76776,0.83101,0.89336,0.95482,1.0154,1.0752,1.1343,1.1925,1.25,1.3069,1.363,1.4185,1.4733,1.5276,1.5813,1.6344,1.687,1.739,1.7906,1.8417,1.8924,1.897,6.7886,6.814,6.841,6.8673,6.8928,6.9178,6.9422,6.9662,6.9897,7.0128,7.0579,7.1016,7.1441,7.1855,7.2259,7.2655,7.3041,7.3421,7.3793,7.4158,7.4517,7.4869,7.5216,7.5558,7.5894,7.6226,7.6553,7.6875,7.7193,7.7507,7.7817,7.8123,7.8425,7.8724,7.9019,7.9311,7.96,7.9885,8.0168,8.0447,8.0998,8.1538,8.2068,8.2589,8.31,8.3603,8.4097,8.4584,8.5063,8.5535,8.6,8.6459,8.6912,8.7358,8.7798,8.8233,8.8663,8.9087,8.9506,8.992,9.033,9.0735,9.1135,9.1531,9.1923,9.3822,9.563,9.7356,9.9008,10.059,10.211,10.498,10.765,-0.00011,0.07624,0.15103,0.22437,0.29636,0.36707,0.43657,0.50492,0.57217,0.63836,0.70354,0.76773,0.83098,0.89333,0.95479,1.0154,1.0752,1.1342,1.1925,1.25,1.3068,1.363,1.4184,1.4733,1.5275,1.5812,1.6343,1.6869,1.739,1.7905,1.8417,1.8923,1.9308,6.7592,6.7659,6.7937,6.8206,6.8466,6.872,6.8968,6.9211,6.9449,6.9683,7.0139,7.058,7.1008,7.1426,7.1832,7.223,7.2619,7.3,7.3373,7.374,7.41,7.4453,7.4801,7.5144,7.5481,7.5813,7.6141,7.6464,7.6782,7.7097,7.7407,7.7713,7.8016,7.8315,7.8611,7.8903,7.9192,7.9478,7.9761,8.0041,8.0592,8.1132,8.1663,8.2183,8.2695,8.3198,8.3693,8.418,8.4659,8.5131,8.5597,8.6056,8.6508,8.6954,8.7395,8.783,8.826,8.8684,8.9103,8.9518,8.9927,9.0332,9.0733,9.1129,9.1521,9.342,9.5228,9.6954,9.8606,10.019,10.171,10.458,10.725,-0.00011,0.07624,0.15103,0.22437,0.29635,0.36706,0.43656,0.50491,0.57215,0.63834,0.70351,0.76771,0.83096,0.8933,0.95476,1.0154,1.0752,1.1342,1.1924,1.25,1.3068,1.3629,1.4184,1.4733,1.5275,1.5812,1.6343,1.6869,1.7389,1.7905,1.8416,1.8923,1.9425,1.9623,6.7322,6.7494,6.7769,6.8035,6.8293,6.8546,6.8792,6.9033,6.927,6.9731,7.0176,7.0608,7.1028,7.1437,7.1837,7.2228,7.2611,7.2986,7.3353,7.3715,7.407,7.4419,7.4762,7.51,7.5433,7.5761,7.6085,7.6404,7.6719,7.7029,7.7336,7.7639,7.7939,7.8235,7.8527,7.8817,7.9103,7.9386,7.9666,8.0218,8.0759,8.1289,8.181,8.2322,8.2825,8.332,8.3808,8.4287,8.476,8.5225,8.5684,8.6137,8.6583,8.7024,8.7459,8.7889,8.8313,8.8732,8.9147,8.9556,8.9962,9.0362,9.0758,9.115,9.305,9.4858,9.6584,9.8236,9.982,10.134,10.421,10.688,-0.00011,0.07624,0.15102,0.22436,0.29634,0.36704,0.43654,0.50489,0.57213,0.63832,0.70349,0.76768,0.83093,0.89327,0.95473,1.0153,1.0751,1.1342,1.1924,1.2499,1.3067,1.3629,1.4184,1.4732,1.5275,1.5811,1.6342,1.6868,1.7389,1.7904,1.8416,1.8922,1.9425,1.9918,6.7071,6.7074,6.7357,6.7629,6.7893,6.8149,6.8399,6.8644,6.8884,6.9349,6.9799,7.0234,7.0658,7.107,7.1472,7.1865,7.2249,7.2625,7.2995,7.3357,7.3713,7.4063,7.4407,7.4746,7.508,7.5409,7.5733,7.6053,7.6368,7.6679,7.6986,7.729,7.759,7.7886,7.8179,7.8469,7.8755,7.9038,7.9319,7.9871,8.0412,8.0943,8.1465,8.1977,8.248,8.2976,8.3463,8.3943,8.4415,8.4881,8.534,8.5793,8.6239,8.668,8.7115,8.7545,8.797,8.8389,8.8804,8.9213,8.9618,9.0019,9.0415,9.0807,9.2707,9.4516,9.6242,9.7894,9.9478,10.1,10.387,10.654,-0.0001,0.07624,0.15102,0.22435,0.29633,0.36703,0.43653,0.50487,0.57211,0.6383,0.70347,0.76766,0.8309,0.89324,0.9547,1.0153,1.0751,1.1341,1.1924,1.2499,1.3067,1.3628,1.4183,1.4732,1.5274,1.5811,1.6342,1.6868,1.7388,1.7904,1.8415,1.8922,1.9424,1.9922,2.0195,6.6836,6.6966,6.7245,6.7514,6.7775,6.8029,6.8277,6.852,6.8991,6.9445,6.9884,7.0311,7.0725,7.113,7.1525,7.1911,7.2289,7.2659,7.3023,7.338,7.3731,7.4076,7.4416,7.475,7.508,7.5405,7.5725,7.6041,7.6353,7.666,7.6964,7.7264,7.7561,7.7854,7.8144,7.8431,7.8715,7.8995,7.9548,8.009,8.0621,8.1143,8.1655,8.2159,8.2654,8.3142,8.3622,8.4094,8.456,8.5019,8.5472,8.5919,8.636,8.6795,8.7225,8.765,8.8069,8.8484,8.8894,8.9299,8.9699,9.0096,9.0488,9.2388,9.4197,9.5923,9.7575,9.9159,10.068,10.355,10.622,-0.0001,0.07624,0.15101,0.22434,0.29632,0.36702,0.43651,0.50485,0.57209,0.63828,0.70344,0.76763,0.83088,0.89321,0.95467,1.0153,1.0751,1.1341,1.1923,1.2499,1.3067,1.3628,1.4183,1.4731,1.5274,1.581,1.6341,1.6867,1.7388,1.7903,1.8414,1.8921,1.9423,1.9922,2.0416,2.0457,6.6616,6.6879,6.7154,6.742,6.7679,6.793,6.8176,6.8653,6.9111,6.9554,6.9984,7.0401,7.0808,7.1205,7.1593,7.1973,7.2345,7.271,7.3068,7.342,7.3766,7.4106,7.4441,7.4772,7.5097,7.5418,7.5734,7.6046,7.6355,7.6659,7.696,7.7257,7.755,7.784,7.8127,7.8411,7.8692,7.9245,7.9787,8.0319,8.0841,8.1354,8.1858,8.2353,8.2841,8.3321,8.3794,8.426,8.472,8.5173,8.5619,8.6061,8.6496,8.6926,8.7351,8.777,8.8185,8.8595,8.9,8.94,8.9797,9.0189,9.2089,9.3898,9.5625,9.7277,9.8861,10.038,10.325,10.592,-9e-05,0.07624,0.15101,0.22433,0.2963,0.36699,0.43648,0.50482,0.57205,0.63823,0.7034,0.76758,0.83082,0.89316,0.95461,1.0152,1.075,1.134,1.1923,1.2498,1.3066,1.3627,1.4182,1.473,1.5273,1.5809,1.634,1.6866,1.7387,1.7902,1.8413,1.892,1.9422,1.9921,2.0415,2.0906,2.094,6.6213,6.6482,6.6759,6.7027,6.7286,6.7539,6.8027,6.8495,6.8946,6.9382,6.9805,7.0216,7.0618,7.1009,7.1392,7.1767,7.2134,7.2495,7.2849,7.3197,7.3539,7.3876,7.4207,7.4534,7.4856,7.5173,7.5486,7.5795,7.6101,7.6402,7.67,7.6994,7.7285,7.7572,7.7857,7.8138,7.8692,7.9235,7.9768,8.029,8.0803,8.1308,8.1804,8.2292,8.2773,8.3246,8.3712,8.4172,8.4625,8.5072,8.5514,8.5949,8.6379,8.6804,8.7224,8.7639,8.8049,8.8454,8.8855,8.9251,8.9643,9.1544,9.3353,9.508,9.6732,9.8316,9.9838,10.271,10.538,-9e-05,0.07624,0.151,0.22431,0.29628,0.36697,0.43645,0.50478,0.57202,0.63819,0.70335,0.76753,0.83077,0.8931,0.95455,1.0152,1.075,1.134,1.1922,1.2497,1.3065,1.3626,1.4181,1.4729,1.5272,1.5808,1.6339,1.6865,1.7386,1.7901,1.8412,1.8919,1.9421,1.9919,2.0414,2.0905,2.1381,6.585,6.5857,6.6148,6.6427,6.6695,6.6955,6.7456,6.7934,6.8393,6.8836,6.9265,6.9681,7.0087,7.0482,7.0868,7.1246,7.1616,7.1979,7.2335,7.2685,7.3029,7.3367,7.37,7.4028,7.4351,7.4669,7.4984,7.5294,7.56,7.5902,7.62,7.6495,7.6786,7.7075,7.736,7.7641,7.8196,7.874,7.9273,7.9796,8.031,8.0815,8.1312,8.18,8.2281,8.2755,8.3221,8.3681,8.4135,8.4582,8.5024,8.546,8.589,8.6315,8.6735,8.715,8.756,8.7965,8.8366,8.8763,8.9155,9.1056,9.2866,9.4593,9.6245,9.783,9.9351,10.222,10.489,-8e-05,0.07623,0.15099,0.2243,0.29626,0.36694,0.43642,0.50475,0.57198,0.63815,0.7033,0.76748,0.83072,0.89305,0.95449,1.0151,1.0749,1.1339,1.1921,1.2496,1.3064,1.3626,1.418,1.4729,1.5271,1.5807,1.6338,1.6864,1.7384,1.79,1.8411,1.8918,1.942,1.9918,2.0413,2.0904,2.1391,2.1785,6.552,6.5576,6.5868,6.6146,6.6415,6.6929,6.7417,6.7885,6.8335,6.877,6.9192,6.9602,7.0001,7.0391,7.0772,7.1144,7.1509,7.1868,7.2219,7.2565,7.2905,7.3239,7.3568,7.3892,7.4212,7.4527,7.4838,7.5145,7.5448,7.5747,7.6042,7.6335,7.6623,7.6909,7.7191,7.7747,7.8291,7.8825,7.9349,7.9864,8.0369,8.0866,8.1355,8.1836,8.231,8.2777,8.3237,8.3691,8.4139,8.4581,8.5017,8.5447,8.5872,8.6292,8.6707,8.7117,8.7523,8.7924,8.8321,8.8713,9.0615,9.2425,9.4152,9.5805,9.7389,9.8911,10.178,10.445,-8e-05,0.07623,0.15098,0.22428,0.29623,0.36692,0.43639,0.50471,0.57194,0.63811,0.70326,0.76743,0.83067,0.89299,0.95444,1.015,1.0748,1.1338,1.1921,1.2496,1.3064,1.3625,1.4179,1.4728,1.527,1.5806,1.6337,1.6863,1.7383,1.7899,1.841,1.8916,1.9419,1.9917,2.0411,2.0902,2.139,2.1874,2.2159,6.5217,6.534,6.5631,6.5909,6.6437,6.6937,6.7414,6.7872,6.8313,6.874,6.9155,6.9558,6.9951,7.0335,7.071,7.1078,7.1438,7.1792,7.2139,7.248,7.2816,7.3147,7.3472,7.3793,7.4109,7.4421,7.4728,7.5032,7.5332,7.5628,7.5921,7.621,7.6496,7.6779,7.7336,7.7881,7.8416,7.894,7.9455,7.9961,8.0459,8.0948,8.143,8.1904,8.2371,8.2832,8.3286,8.3734,8.4176,8.4612,8.5042,8.5468,8.5888,8.6303,8.6713,8.7119,8.752,8.7917,8.831,9.0212,9.2022,9.3749,9.5402,9.6987,9.8508,10.138,10.405,-7e-05,0.07623,0.15097,0.22427,0.29621,0.36689,0.43636,0.50468,0.5719,0.63806,0.70321,0.76738,0.83061,0.89293,0.95438,1.015,1.0748,1.1337,1.192,1.2495,1.3063,1.3624,1.4178,1.4727,1.5269,1.5806,1.6336,1.6862,1.7382,1.7898,1.8409,1.8915,1.9417,1.9916,2.041,2.0901,2.1388,2.1873,2.2354,2.2508,6.4936,6.5141,6.5431,6.5975,6.6487,6.6973,6.7439,6.7887,6.832,6.8739,6.9146,6.9543,6.993,7.0308,7.0678,7.1041,7.1396,7.1745,7.2088,7.2425,7.2757,7.3084,7.3406,7.3723,7.4036,7.4344,7.4649,7.4949,7.5246,7.5539,7.5829,7.6116,7.6399,7.6957,7.7503,7.8038,7.8563,7.9079,7.9586,8.0083,8.0573,8.1055,8.153,8.1997,8.2458,8.2912,8.3361,8.3803,8.4239,8.467,8.5095,8.5516,8.5931,8.6342,8.6747,8.7149,8.7546,8.7938,8.9841,9.1651,9.3379,9.5032,9.6617,9.8138,10.101,10.368,-6e-05,0.07623,0.15096,0.22425,0.29619,0.36686,0.43633,0.50464,0.57186,0.63802,0.70317,0.76733,0.83056,0.89288,0.95432,1.0149,1.0747,1.1337,1.1919,1.2494,1.3062,1.3623,1.4178,1.4726,1.5268,1.5805,1.6335,1.6861,1.7381,1.7897,1.8408,1.8914,1.9416,1.9914,2.0409,2.09,2.1387,2.1871,2.2353,2.2831,2.2835,6.4675,6.4975,6.5538,6.6062,6.6559,6.7033,6.7488,6.7926,6.835,6.8762,6.9162,6.9552,6.9933,7.0306,7.0671,7.1028,7.1379,7.1723,7.2062,7.2395,7.2723,7.3046,7.3364,7.3678,7.3987,7.4292,7.4594,7.4891,7.5185,7.5476,7.5763,7.6047,7.6605,7.7152,7.7688,7.8214,7.873,7.9237,7.9736,8.0226,8.0708,8.1183,8.1651,8.2112,8.2567,8.3015,8.3457,8.3894,8.4325,8.4751,8.5171,8.5587,8.5997,8.6403,8.6805,8.7202,8.7594,8.9497,9.1308,9.3036,9.4689,9.6274,9.7796,10.067,10.334,-6e-05,0.07623,0.15095,0.22424,0.29617,0.36684,0.4363,0.50461,0.57182,0.63798,0.70312,0.76728,0.83051,0.89282,0.95426,1.0148,1.0746,1.1336,1.1918,1.2493,1.3061,1.3622,1.4177,1.4725,1.5267,1.5804,1.6334,1.686,1.738,1.7896,1.8407,1.8913,1.9415,1.9913,2.0407,2.0898,2.1386,2.187,2.2351,2.283,2.3143,6.443,6.4536,6.512,6.5659,6.6166,6.6649,6.7111,6.7555,6.7984,6.84,6.8804,6.9198,6.9582,6.9957,7.0324,7.0683,7.1036,7.1382,7.1722,7.2057,7.2386,7.271,7.3029,7.3343,7.3654,7.396,7.4262,7.456,7.4855,7.5146,7.5433,7.5718,7.6277,7.6825,7.7362,7.7888,7.8405,7.8912,7.9411,7.9902,8.0385,8.086,8.1328,8.1789,8.2244,8.2693,8.3135,8.3572,8.4003,8.4429,8.485,8.5266,8.5676,8.6082,8.6484,8.6881,8.7274,8.9177,9.0988,9.2716,9.437,9.5955,9.7477,10.035,10.302,-5e-05,0.07622,0.15094,0.22422,0.29615,0.36681,0.43627,0.50458,0.57178,0.63794,0.70307,0.76723,0.83045,0.89276,0.9542,1.0148,1.0746,1.1335,1.1918,1.2493,1.306,1.3621,1.4176,1.4724,1.5266,1.5803,1.6334,1.6859,1.7379,1.7895,1.8405,1.8912,1.9414,1.9912,2.0406,2.0897,2.1384,2.1868,2.235,2.2828,2.3305,2.3435,6.4199,6.472,6.5274,6.5792,6.6284,6.6753,6.7204,6.7638,6.8059,6.8467,6.8863,6.925,6.9628,6.9997,7.0359,7.0713,7.1061,7.1403,7.1738,7.2069,7.2394,7.2714,7.303,7.3341,7.3648,7.395,7.4249,7.4545,7.4836,7.5124,7.5409,7.597,7.6518,7.7056,7.7583,7.81,7.8608,7.9108,7.9599,8.0082,8.0557,8.1026,8.1487,8.1943,8.2391,8.2834,8.3271,8.3702,8.4128,8.4549,8.4965,8.5376,8.5782,8.6184,8.6581,8.6974,8.8878,9.0689,9.2417,9.4071,9.5656,9.7178,10.005,10.272,-4e-05,0.07622,0.15092,0.22419,0.29611,0.36676,0.43621,0.50451,0.57171,0.63785,0.70298,0.76713,0.83035,0.89265,0.95408,1.0147,1.0744,1.1334,1.1916,1.2491,1.3059,1.362,1.4174,1.4722,1.5265,1.5801,1.6332,1.6857,1.7377,1.7893,1.8403,1.8909,1.9411,1.9909,2.0404,2.0894,2.1382,2.1866,2.2347,2.2825,2.3301,2.3975,6.3775,6.3958,6.4548,6.5092,6.5602,6.6087,6.6551,6.6996,6.7426,6.7842,6.8246,6.8639,6.9022,6.9396,6.9761,7.012,7.0471,7.0815,7.1154,7.1487,7.1814,7.2136,7.2454,7.2767,7.3075,7.338,7.368,7.3976,7.4269,7.4559,7.4845,7.5407,7.5957,7.6496,7.7025,7.7543,7.8052,7.8552,7.9044,7.9528,8.0004,8.0473,8.0936,8.1391,8.184,8.2284,8.2721,8.3153,8.3579,8.4,8.4416,8.4828,8.5234,8.5636,8.6033,8.6426,8.8331,9.0143,9.1872,9.3526,9.5111,9.6634,9.9507,10.218,-3e-05,0.07622,0.15091,0.22416,0.29607,0.36671,0.43615,0.50444,0.57163,0.63776,0.70289,0.76704,0.83024,0.89254,0.95396,1.0145,1.0743,1.1333,1.1915,1.249,1.3057,1.3618,1.4173,1.4721,1.5263,1.5799,1.633,1.6855,1.7375,1.789,1.8401,1.8907,1.9409,1.9907,2.0401,2.0892,2.1379,2.1863,2.2344,2.2822,2.3298,2.4244,2.4468,6.339,6.3867,6.444,6.4973,6.5475,6.5952,6.6409,6.6849,6.7273,6.7684,6.8083,6.8472,6.8851,6.9221,6.9583,6.9937,7.0285,7.0627,7.0962,7.1292,7.1616,7.1935,7.225,7.256,7.2866,7.3168,7.3466,7.376,7.405,7.4337,7.4901,7.5453,7.5994,7.6523,7.7043,7.7553,7.8054,7.8547,7.9032,7.9509,7.9978,8.0441,8.0897,8.1347,8.179,8.2228,8.266,8.3087,8.3509,8.3925,8.4336,8.4743,8.5145,8.5543,8.5936,8.7842,8.9654,9.1384,9.3038,9.4624,9.6146,9.902,10.169,-1e-05,0.07621,0.15089,0.22413,0.29603,0.36666,0.43608,0.50437,0.57155,0.63768,0.7028,0.76694,0.83013,0.89243,0.95384,1.0144,1.0742,1.1331,1.1913,1.2488,1.3056,1.3617,1.4171,1.4719,1.5261,1.5797,1.6328,1.6853,1.7373,1.7888,1.8399,1.8905,1.9407,1.9905,2.0399,2.0889,2.1376,2.186,2.2341,2.2819,2.3295,2.424,2.4921,6.3038,6.3218,6.3826,6.4383,6.4903,6.5396,6.5866,6.6316,6.6749,6.7167,6.7573,6.7967,6.8351,6.8726,6.9092,6.945,6.9801,7.0145,7.0483,7.0815,7.1142,7.1463,7.178,7.2091,7.2399,7.2702,7.3001,7.3296,7.3588,7.3876,7.4442,7.4996,7.5538,7.6069,7.6589,7.71,7.7603,7.8096,7.8581,7.9059,7.9529,7.9993,8.0449,8.09,8.1344,8.1782,8.2214,8.2641,8.3063,8.348,8.3892,8.4299,8.4701,8.5099,8.5492,8.7399,8.9212,9.0942,9.2596,9.4182,9.5705,9.858,10.125,0,0.07621,0.15086,0.22408,0.29596,0.36658,0.43599,0.50426,0.57143,0.63755,0.70266,0.76679,0.82998,0.89226,0.95366,1.0142,1.074,1.1329,1.1911,1.2486,1.3053,1.3614,1.4168,1.4716,1.5258,1.5794,1.6325,1.685,1.737,1.7885,1.8395,1.8901,1.9403,1.9901,2.0395,2.0885,2.1372,2.1856,2.2337,2.2815,2.329,2.4235,2.5173,2.5543,6.2558,6.2955,6.3555,6.4107,6.4625,6.5114,6.5581,6.6028,6.6459,6.6875,6.7278,6.767,6.8052,6.8424,6.8788,6.9143,6.9492,6.9834,7.017,7.05,7.0824,7.1143,7.1458,7.1767,7.2073,7.2374,7.2671,7.2964,7.3254,7.3823,7.4379,7.4923,7.5456,7.5979,7.6491,7.6995,7.749,7.7976,7.8455,7.8926,7.939,7.9848,8.0299,8.0743,8.1182,8.1615,8.2043,8.2465,8.2882,8.3294,8.3702,8.4104,8.4503,8.4896,8.6804,8.8618,9.0349,9.2004,9.359,9.5113,9.7988,10.066,3e-05,0.07619,0.15081,0.224,0.29586,0.36645,0.43584,0.50409,0.57124,0.63734,0.70243,0.76654,0.82971,0.89198,0.95336,1.0139,1.0736,1.1326,1.1908,1.2482,1.305,1.361,1.4164,1.4712,1.5254,1.579,1.632,1.6845,1.7365,1.788,1.839,1.8896,1.9397,1.9895,2.0388,2.0878,2.1365,2.1849,2.2329,2.2807,2.3282,2.4227,2.5164,2.6097,2.6455,6.1856,6.2274,6.2893,6.3459,6.3987,6.4486,6.4959,6.5412,6.5847,6.6266,6.6672,6.7066,6.7449,6.7823,6.8187,6.8544,6.8892,6.9234,6.957,6.99,7.0224,7.0542,7.0856,7.1165,7.147,7.177,7.2066,7.2359,7.2933,7.3493,7.4041,7.4577,7.5103,7.5618,7.6124,7.6621,7.7109,7.759,7.8062,7.8528,7.8987,7.9439,7.9885,8.0325,8.0759,8.1187,8.161,8.2028,8.2441,8.2849,8.3252,8.3651,8.4045,8.5955,8.777,8.9502,9.1158,9.2745,9.4269,9.7145,9.9818,6e-05,0.07618,0.15076,0.22392,0.29575,0.36632,0.43569,0.50391,0.57104,0.63713,0.70219,0.76629,0.82945,0.89169,0.95307,1.0136,1.0733,1.1322,1.1904,1.2478,1.3046,1.3606,1.416,1.4708,1.5249,1.5785,1.6315,1.684,1.736,1.7874,1.8384,1.889,1.9391,1.9889,2.0382,2.0872,2.1358,2.1842,2.2322,2.2799,2.3275,2.4218,2.5155,2.6087,2.7016,2.7254,6.1243,6.1764,6.2393,6.2968,6.3503,6.4006,6.4484,6.494,6.5377,6.5799,6.6206,6.6601,6.6984,6.7358,6.7723,6.8079,6.8427,6.8769,6.9104,6.9433,6.9756,7.0074,7.0387,7.0695,7.0998,7.1298,7.1593,7.2172,7.2737,7.3288,7.3828,7.4356,7.4874,7.5383,7.5882,7.6372,7.6854,7.7329,7.7796,7.8256,7.8709,7.9156,7.9597,8.0032,8.0461,8.0885,8.1303,8.1717,8.2126,8.2529,8.2929,8.3324,8.5235,8.7053,8.8785,9.0443,9.203,9.3555,9.6431,9.9105,9e-05,0.07617,0.15072,0.22385,0.29564,0.36619,0.43553,0.50374,0.57085,0.63691,0.70196,0.76604,0.82918,0.89141,0.95277,1.0133,1.073,1.1319,1.19,1.2475,1.3042,1.3602,1.4156,1.4703,1.5245,1.578,1.631,1.6835,1.7354,1.7869,1.8379,1.8884,1.9385,1.9882,2.0376,2.0865,2.1352,2.1835,2.2315,2.2792,2.3267,2.421,2.5146,2.6077,2.7005,2.7935,2.7968,6.0696,6.1383,6.2016,6.2595,6.3133,6.3639,6.4118,6.4576,6.5014,6.5435,6.5843,6.6238,6.6621,6.6994,6.7358,6.7714,6.8061,6.8402,6.8736,6.9064,6.9386,6.9703,7.0015,7.0321,7.0624,7.0922,7.1506,7.2075,7.2631,7.3174,7.3705,7.4226,7.4737,7.5238,7.573,7.6214,7.669,7.7159,7.762,7.8074,7.8523,7.8964,7.94,7.983,8.0255,8.0674,8.1088,8.1498,8.1902,8.2302,8.2697,8.4611,8.643,8.8164,8.9822,9.1411,9.2935,9.5813,9.8487,0.00011,0.07615,0.15067,0.22377,0.29554,0.36605,0.43538,0.50356,0.57066,0.6367,0.70173,0.76579,0.82892,0.89113,0.95247,1.013,1.0727,1.1315,1.1897,1.2471,1.3038,1.3598,1.4152,1.4699,1.524,1.5776,1.6305,1.683,1.7349,1.7864,1.8373,1.8879,1.9379,1.9876,2.0369,2.0859,2.1345,2.1827,2.2307,2.2784,2.3259,2.4201,2.5136,2.6067,2.6994,2.7922,2.8615,6.0197,6.0397,6.1105,6.1737,6.2316,6.2854,6.3359,6.3838,6.4295,6.4732,6.5153,6.556,6.5953,6.6336,6.6708,6.707,6.7425,6.7771,6.8111,6.8443,6.877,6.9091,6.9406,6.9716,7.0022,7.0323,7.0912,7.1486,7.2046,7.2592,7.3127,7.365,7.4163,7.4666,7.5161,7.5646,7.6124,7.6594,7.7057,7.7512,7.7962,7.8404,7.8841,7.9272,7.9698,8.0118,8.0533,8.0942,8.1348,8.1748,8.2144,8.406,8.588,8.7615,8.9274,9.0863,9.2389,9.5267,9.7942,0.00014,0.07614,0.15062,0.22369,0.29543,0.36592,0.43522,0.50339,0.57046,0.63649,0.7015,0.76555,0.82865,0.89085,0.95218,1.0127,1.0723,1.1312,1.1893,1.2467,1.3034,1.3594,1.4147,1.4695,1.5236,1.5771,1.6301,1.6825,1.7344,1.7858,1.8368,1.8873,1.9374,1.987,2.0363,2.0852,2.1338,2.1821,2.23,2.2777,2.3251,2.4193,2.5127,2.6057,2.6983,2.791,2.8841,2.921,5.9737,6.0211,6.0909,6.1536,6.211,6.2646,6.3149,6.3626,6.408,6.4516,6.4935,6.534,6.5732,6.6112,6.6483,6.6844,6.7196,6.7541,6.7879,6.821,6.8535,6.8854,6.9168,6.9477,6.9781,7.0375,7.0954,7.1517,7.2067,7.2605,7.3131,7.3647,7.4152,7.4649,7.5136,7.5615,7.6087,7.6551,7.7008,7.7458,7.7902,7.834,7.8771,7.9198,7.9618,8.0034,8.0445,8.085,8.1251,8.1648,8.3566,8.5388,8.7124,8.8784,9.0374,9.19,9.4779,9.7454,0.00016,0.07612,0.15057,0.22361,0.29532,0.36579,0.43507,0.50321,0.57027,0.63627,0.70127,0.7653,0.82839,0.89057,0.95188,1.0123,1.072,1.1309,1.189,1.2463,1.303,1.359,1.4143,1.469,1.5231,1.5766,1.6296,1.682,1.7339,1.7853,1.8362,1.8867,1.9368,1.9864,2.0357,2.0846,2.1331,2.1814,2.2293,2.2769,2.3243,2.4184,2.5118,2.6047,2.6972,2.7898,2.8828,2.9762,5.9307,5.931,6.0095,6.0779,6.1397,6.1966,6.2496,6.2995,6.3468,6.392,6.4352,6.4769,6.5171,6.5561,6.5939,6.6307,6.6666,6.7017,6.736,6.7696,6.8025,6.8348,6.8666,6.8978,6.9285,6.9885,7.0468,7.1035,7.1589,7.213,7.2659,7.3177,7.3685,7.4183,7.4672,7.5153,7.5626,7.6091,7.6549,7.7001,7.7446,7.7884,7.8317,7.8744,7.9166,7.9582,7.9993,8.0399,8.0801,8.1198,8.3118,8.4941,8.6679,8.834,8.993,9.1457,9.4337,9.7012,0.00019,0.07611,0.15052,0.22353,0.29522,0.36566,0.43492,0.50304,0.57007,0.63606,0.70104,0.76505,0.82812,0.89029,0.95159,1.012,1.0717,1.1305,1.1886,1.246,1.3026,1.3586,1.4139,1.4686,1.5227,1.5762,1.6291,1.6815,1.7334,1.7848,1.8357,1.8862,1.9362,1.9858,2.0351,2.0839,2.1325,2.1807,2.2286,2.2762,2.3235,2.4176,2.5109,2.6037,2.6961,2.7886,2.8814,2.975,3.0278,5.8901,5.9277,6.0034,6.0703,6.131,6.1871,6.2395,6.2888,6.3357,6.3804,6.4233,6.4646,6.5045,6.5432,6.5807,6.6173,6.653,6.6878,6.7219,6.7552,6.788,6.8201,6.8516,6.8826,6.9432,7.002,7.0591,7.1149,7.1693,7.2224,7.2745,7.3255,7.3755,7.4246,7.4729,7.5203,7.567,7.6129,7.6582,7.7028,7.7467,7.7901,7.8329,7.8751,7.9168,7.958,7.9987,8.0389,8.0786,8.2709,8.4534,8.6272,8.7934,8.9525,9.1052,9.3933,9.6609,0.00021,0.07609,0.15047,0.22345,0.29511,0.36553,0.43476,0.50286,0.56988,0.63585,0.70081,0.7648,0.82786,0.89001,0.95129,1.0117,1.0713,1.1302,1.1883,1.2456,1.3022,1.3582,1.4135,1.4682,1.5222,1.5757,1.6286,1.681,1.7329,1.7842,1.8351,1.8856,1.9356,1.9852,2.0344,2.0833,2.1318,2.18,2.2278,2.2754,2.3228,2.4168,2.51,2.6027,2.6951,2.7874,2.8801,2.9735,3.0682,3.0764,5.8516,5.9289,6.0019,6.0671,6.1266,6.1817,6.2333,6.282,6.3283,6.3725,6.415,6.4559,6.4954,6.5338,6.571,6.6073,6.6427,6.6773,6.7111,6.7442,6.7767,6.8086,6.8399,6.9011,6.9603,7.0179,7.074,7.1288,7.1822,7.2345,7.2858,7.336,7.3853,7.4337,7.4813,7.5281,7.5741,7.6195,7.6642,7.7083,7.7517,7.7946,7.8369,7.8786,7.9199,7.9606,8.0009,8.0407,8.2331,8.4158,8.5898,8.756,8.9152,9.068,9.3562,9.6238,0.00023,0.07607,0.15041,0.22336,0.295,0.3654,0.43461,0.50269,0.56968,0.63563,0.70058,0.76456,0.8276,0.88973,0.951,1.0114,1.071,1.1298,1.1879,1.2452,1.3019,1.3578,1.4131,1.4677,1.5218,1.5753,1.6282,1.6805,1.7324,1.7837,1.8346,1.885,1.935,1.9846,2.0338,2.0826,2.1311,2.1793,2.2271,2.2747,2.322,2.4159,2.5091,2.6017,2.694,2.7862,2.8788,2.972,3.0665,3.1224,5.8148,5.8529,5.9337,6.0041,6.0675,6.1257,6.1797,6.2304,6.2784,6.3241,6.3677,6.4097,6.4502,6.4894,6.5273,6.5643,6.6002,6.6353,6.6696,6.7032,6.736,6.7683,6.8,6.8617,6.9214,6.9794,7.0359,7.091,7.1447,7.1973,7.2487,7.2992,7.3486,7.3972,7.445,7.4919,7.5381,7.5836,7.6284,7.6725,7.716,7.759,7.8014,7.8432,7.8845,7.9253,7.9656,8.0055,8.1981,8.381,8.5551,8.7214,8.8807,9.0335,9.3217,9.5895,0.00025,0.07605,0.15036,0.22328,0.29489,0.36526,0.43445,0.50251,0.56949,0.63542,0.70035,0.76431,0.82733,0.88945,0.9507,1.0111,1.0707,1.1295,1.1876,1.2449,1.3015,1.3574,1.4127,1.4673,1.5213,1.5748,1.6277,1.68,1.7319,1.7832,1.8341,1.8845,1.9344,1.984,2.0332,2.082,2.1304,2.1786,2.2264,2.2739,2.3212,2.4151,2.5082,2.6007,2.6929,2.7851,2.8775,2.9705,3.0648,3.161,3.1662,5.7793,5.8646,5.9414,6.0093,6.0709,6.1277,6.1806,6.2304,6.2776,6.3225,6.3656,6.4071,6.4471,6.4858,6.5234,6.56,6.5956,6.6304,6.6644,6.6977,6.7303,6.7623,6.8246,6.8848,6.9433,7.0001,7.0555,7.1096,7.1624,7.2141,7.2647,7.3144,7.3631,7.411,7.4581,7.5044,7.55,7.5949,7.6391,7.6828,7.7258,7.7682,7.8101,7.8515,7.8924,7.9327,7.9726,8.1655,8.3485,8.5227,8.6891,8.8485,9.0014,9.2897,9.5575,0.00027,0.07603,0.15031,0.2232,0.29478,0.36513,0.4343,0.50234,0.56929,0.63521,0.70012,0.76406,0.82707,0.88917,0.95041,1.0108,1.0704,1.1292,1.1872,1.2445,1.3011,1.357,1.4123,1.4669,1.5209,1.5743,1.6272,1.6795,1.7313,1.7827,1.8335,1.8839,1.9339,1.9834,2.0326,2.0813,2.1298,2.1779,2.2257,2.2732,2.3205,2.4143,2.5073,2.5997,2.6919,2.7839,2.8761,2.969,3.0631,3.159,3.2081,5.745,5.7937,5.8783,5.9515,6.017,6.0768,6.1321,6.1838,6.2327,6.279,6.3233,6.3658,6.4067,6.4462,6.4845,6.5217,6.5579,6.5931,6.6276,6.6613,6.6942,6.7266,6.7895,6.8503,6.9092,6.9664,7.0221,7.0764,7.1295,7.1814,7.2323,7.2821,7.331,7.3791,7.4263,7.4727,7.5184,7.5635,7.6078,7.6515,7.6946,7.7371,7.7791,7.8206,7.8615,7.9019,7.9419,8.135,8.3181,8.4924,8.6589,8.8184,8.9713,9.2597,9.5275,0.00031,0.07599,0.1502,0.22303,0.29457,0.36486,0.43399,0.50199,0.5689,0.63478,0.69966,0.76357,0.82654,0.88862,0.94982,1.0102,1.0697,1.1285,1.1865,1.2438,1.3003,1.3562,1.4114,1.466,1.52,1.5734,1.6263,1.6786,1.7303,1.7816,1.8324,1.8828,1.9327,1.9822,2.0313,2.0801,2.1285,2.1765,2.2243,2.2717,2.3189,2.4126,2.5055,2.5978,2.6897,2.7815,2.8736,2.9661,3.0598,3.1552,3.2533,3.287,5.6791,5.7478,5.835,5.9101,5.9771,6.038,6.0942,6.1467,6.1961,6.2429,6.2876,6.3304,6.3716,6.4114,6.4499,6.4872,6.5235,6.5589,6.5935,6.6272,6.6603,6.7244,6.7862,6.8461,6.9041,6.9605,7.0154,7.069,7.1214,7.1726,7.2229,7.2721,7.3205,7.368,7.4147,7.4606,7.5058,7.5503,7.5942,7.6375,7.6802,7.7223,7.7639,7.8049,7.8454,7.8855,8.079,8.2625,8.437,8.6037,8.7633,8.9163,9.2049,9.4729,0.00034,0.07595,0.15009,0.22287,0.29435,0.3646,0.43368,0.50163,0.56851,0.63436,0.6992,0.76307,0.82602,0.88806,0.94923,1.0096,1.0691,1.1278,1.1858,1.243,1.2996,1.3554,1.4106,1.4652,1.5191,1.5725,1.6253,1.6776,1.7293,1.7806,1.8313,1.8817,1.9315,1.981,2.0301,2.0788,2.1271,2.1752,2.2229,2.2703,2.3174,2.411,2.5037,2.5959,2.6876,2.7792,2.871,2.9633,3.0565,3.1514,3.2488,3.3502,3.3606,5.616,5.7133,5.8019,5.8782,5.9459,6.0075,6.0642,6.1172,6.1669,6.2141,6.259,6.302,6.3434,6.3833,6.4219,6.4593,6.4957,6.5311,6.5657,6.5995,6.6649,6.7278,6.7886,6.8474,6.9045,6.96,7.0142,7.067,7.1187,7.1693,7.2189,7.2676,7.3153,7.3623,7.4085,7.4539,7.4986,7.5427,7.5861,7.629,7.6712,7.7129,7.7541,7.7947,7.8349,8.0288,8.2126,8.3874,8.5543,8.714,8.8671,9.1559,9.4239,0.00037,0.0759,0.14998,0.2227,0.29412,0.36433,0.43337,0.50128,0.56812,0.63393,0.69874,0.76258,0.82549,0.8875,0.94865,1.0089,1.0684,1.1271,1.1851,1.2423,1.2988,1.3546,1.4098,1.4643,1.5183,1.5716,1.6244,1.6766,1.7283,1.7795,1.8303,1.8806,1.9304,1.9798,2.0289,2.0775,2.1258,2.1738,2.2215,2.2688,2.3159,2.4094,2.502,2.594,2.6855,2.7769,2.8685,2.9604,3.0533,3.1477,3.2444,3.3449,3.4303,5.5545,5.5793,5.6888,5.7777,5.8542,5.9223,5.984,6.041,6.0941,6.144,6.1912,6.2362,6.2793,6.3207,6.3607,6.3993,6.4367,6.4731,6.5085,6.5431,6.6099,6.6739,6.7356,6.7953,6.8531,6.9092,6.9639,7.0173,7.0694,7.1204,7.1703,7.2193,7.2673,7.3146,7.361,7.4066,7.4515,7.4958,7.5394,7.5824,7.6247,7.6666,7.7079,7.7486,7.7889,7.9833,8.1673,8.3424,8.5095,8.6693,8.8226,9.1115,9.3796,0.00039,0.07585,0.14987,0.22252,0.2939,0.36406,0.43305,0.50093,0.56773,0.6335,0.69828,0.76209,0.82497,0.88695,0.94806,1.0083,1.0678,1.1265,1.1844,1.2416,1.298,1.3538,1.409,1.4635,1.5174,1.5707,1.6234,1.6756,1.7273,1.7785,1.8292,1.8794,1.9293,1.9786,2.0276,2.0763,2.1245,2.1724,2.2201,2.2674,2.3144,2.4077,2.5002,2.5921,2.6835,2.7747,2.866,2.9576,3.0501,3.144,3.2401,3.3397,3.4447,3.4967,5.4939,5.5651,5.6727,5.7609,5.8371,5.9049,5.9665,6.0234,6.0764,6.1262,6.1734,6.2184,6.2614,6.3028,6.3427,6.3812,6.4186,6.4549,6.4903,6.5585,6.6237,6.6864,6.7469,6.8054,6.8622,6.9175,6.9713,7.0239,7.0753,7.1256,7.1748,7.2232,7.2706,7.3173,7.3631,7.4083,7.4527,7.4965,7.5396,7.5821,7.6241,7.6655,7.7064,7.7467,7.9416,8.1259,8.3012,8.4685,8.6284,8.7818,9.0709,9.3392,0.00041,0.0758,0.14975,0.22235,0.29368,0.36379,0.43274,0.50058,0.56734,0.63308,0.69782,0.7616,0.82444,0.88639,0.94748,1.0077,1.0671,1.1258,1.1837,1.2408,1.2973,1.3531,1.4082,1.4626,1.5165,1.5698,1.6225,1.6747,1.7263,1.7775,1.8281,1.8783,1.9281,1.9775,2.0264,2.075,2.1232,2.1711,2.2187,2.2659,2.3129,2.4061,2.4985,2.5902,2.6814,2.7724,2.8635,2.9549,3.047,3.1405,3.236,3.3346,3.4383,3.5506,3.5608,5.4336,5.5591,5.6638,5.7504,5.8257,5.8929,5.9541,6.0106,6.0633,6.1129,6.1599,6.2047,6.2476,6.2888,6.3286,6.367,6.4043,6.4405,6.5101,6.5766,6.6403,6.7016,6.7609,6.8184,6.8742,6.9286,6.9816,7.0333,7.084,7.1336,7.1822,7.2299,7.2768,7.3229,7.3682,7.4128,7.4567,7.5,7.5427,7.5848,7.6263,7.6673,7.7078,7.903,8.0877,8.2633,8.4307,8.5908,8.7443,9.0335,9.3019,0.00043,0.07574,0.14963,0.22218,0.29345,0.36352,0.43243,0.50022,0.56695,0.63265,0.69736,0.7611,0.82392,0.88584,0.94689,1.0071,1.0665,1.1251,1.183,1.2401,1.2965,1.3523,1.4073,1.4618,1.5156,1.5689,1.6216,1.6737,1.7253,1.7764,1.8271,1.8772,1.927,1.9763,2.0252,2.0738,2.1219,2.1698,2.2173,2.2645,2.3114,2.4045,2.4968,2.5883,2.6794,2.7702,2.861,2.9521,3.044,3.137,3.2319,3.3297,3.4322,3.5423,3.6232,5.3727,5.429,5.5598,5.6607,5.7453,5.8192,5.8855,5.9459,6.0019,6.0542,6.1034,6.1501,6.1946,6.2373,6.2783,6.3178,6.3561,6.3932,6.4643,6.532,6.5968,6.6591,6.7191,6.7772,6.8336,6.8885,6.9419,6.9941,7.0451,7.095,7.144,7.192,7.2391,7.2854,7.3309,7.3757,7.4198,7.4632,7.506,7.5483,7.5899,7.631,7.6716,7.8673,8.0523,8.228,8.3956,8.5559,8.7095,8.9989,9.2674,0.00045,0.07569,0.14951,0.222,0.29323,0.36325,0.43211,0.49987,0.56656,0.63223,0.6969,0.76061,0.8234,0.88529,0.94631,1.0065,1.0659,1.1245,1.1823,1.2394,1.2958,1.3515,1.4065,1.461,1.5148,1.568,1.6206,1.6727,1.7243,1.7754,1.826,1.8762,1.9259,1.9751,2.024,2.0725,2.1206,2.1684,2.2159,2.2631,2.31,2.403,2.4951,2.5865,2.6774,2.768,2.8586,2.9495,3.0409,3.1335,3.2279,3.325,3.4263,3.5345,3.6555,3.6846,5.3106,5.4437,5.5657,5.6625,5.7446,5.8168,5.8819,5.9415,5.9967,6.0484,6.0971,6.1434,6.1876,6.2299,6.2706,6.3099,6.348,6.4207,6.4897,6.5556,6.6187,6.6796,6.7384,6.7954,6.8508,6.9047,6.9572,7.0086,7.0589,7.1081,7.1563,7.2037,7.2502,7.2959,7.3409,7.3852,7.4288,7.4717,7.5141,7.5559,7.5971,7.6378,7.8339,8.0192,8.1952,8.363,8.5234,8.6771,8.9666,9.2353,0.00046,0.07563,0.14939,0.22182,0.293,0.36297,0.4318,0.49952,0.56617,0.6318,0.69644,0.76012,0.82288,0.88474,0.94573,1.0059,1.0652,1.1238,1.1816,1.2387,1.295,1.3507,1.4057,1.4601,1.5139,1.5671,1.6197,1.6718,1.7233,1.7744,1.825,1.8751,1.9247,1.974,2.0228,2.0713,2.1194,2.1671,2.2145,2.2617,2.3085,2.4014,2.4934,2.5847,2.6754,2.7658,2.8562,2.9468,3.038,3.1302,3.224,3.3204,3.4206,3.5271,3.6447,3.7457,5.2463,5.3045,5.4619,5.5756,5.6681,5.7476,5.8179,5.8816,5.9401,5.9945,6.0455,6.0937,6.1395,6.1832,6.2252,6.2656,6.3046,6.379,6.4493,6.5163,6.5804,6.6421,6.7016,6.7591,6.815,6.8694,6.9224,6.9741,7.0247,7.0742,7.1227,7.1703,7.2171,7.263,7.3082,7.3526,7.3964,7.4395,7.4819,7.5238,7.5652,7.606,7.8025,7.9882,8.1644,8.3323,8.4929,8.6467,8.9364,9.2052,0.00047,0.07556,0.14926,0.22164,0.29277,0.3627,0.43148,0.49916,0.56578,0.63138,0.69598,0.75963,0.82236,0.88419,0.94515,1.0053,1.0646,1.1231,1.1809,1.2379,1.2943,1.3499,1.4049,1.4593,1.513,1.5662,1.6188,1.6708,1.7224,1.7734,1.8239,1.874,1.9236,1.9728,2.0216,2.07,2.1181,2.1658,2.2132,2.2602,2.307,2.3998,2.4917,2.5828,2.6734,2.7637,2.8538,2.9442,3.035,3.1268,3.2202,3.3158,3.4151,3.5201,3.6347,3.7702,3.8077,5.1787,5.3434,5.4826,5.5888,5.677,5.7536,5.8219,5.8841,5.9414,5.9949,6.0451,6.0927,6.1379,6.1812,6.2227,6.2628,6.3389,6.4106,6.4787,6.5438,6.6063,6.6665,6.7247,6.7811,6.836,6.8894,6.9415,6.9924,7.0422,7.091,7.1388,7.1858,7.2319,7.2772,7.3218,7.3658,7.409,7.4516,7.4936,7.5351,7.576,7.773,7.9589,8.1354,8.3035,8.4642,8.6182,8.908,9.1769,0.00047,0.0755,0.14914,0.22146,0.29254,0.36242,0.43117,0.49881,0.56539,0.63095,0.69553,0.75914,0.82184,0.88364,0.94457,1.0047,1.064,1.1225,1.1802,1.2372,1.2935,1.3492,1.4041,1.4585,1.5122,1.5653,1.6179,1.6699,1.7214,1.7724,1.8229,1.8729,1.9225,1.9717,2.0204,2.0688,2.1168,2.1645,2.2118,2.2588,2.3056,2.3983,2.49,2.581,2.6715,2.7615,2.8515,2.9416,3.0321,3.1236,3.2164,3.3114,3.4098,3.5133,3.6255,3.7547,3.8718,5.1061,5.1952,5.3799,5.505,5.6042,5.6883,5.762,5.8283,5.889,5.9451,5.9975,6.0469,6.0938,6.1384,6.1812,6.2223,6.3002,6.3734,6.4427,6.5087,6.572,6.6329,6.6918,6.7487,6.8041,6.8579,6.9104,6.9616,7.0117,7.0608,7.1089,7.156,7.2024,7.2479,7.2927,7.3368,7.3801,7.4229,7.465,7.5066,7.5476,7.745,7.9313,8.108,8.2763,8.4372,8.5912,8.8813,9.1502,0.00047,0.07543,0.14901,0.22128,0.29231,0.36215,0.43085,0.49845,0.565,0.63053,0.69507,0.75865,0.82132,0.88309,0.94399,1.0041,1.0633,1.1218,1.1795,1.2365,1.2928,1.3484,1.4033,1.4576,1.5113,1.5644,1.6169,1.6689,1.7204,1.7713,1.8218,1.8718,1.9214,1.9705,2.0192,2.0676,2.1156,2.1632,2.2105,2.2574,2.3041,2.3967,2.4884,2.5792,2.6695,2.7594,2.8492,2.939,3.0293,3.1203,3.2127,3.3071,3.4046,3.5068,3.6168,3.7412,3.9054,3.9401,5.0256,5.261,5.4147,5.5284,5.6215,5.7015,5.7725,5.8368,5.8958,5.9506,6.002,6.0506,6.0967,6.1407,6.1829,6.2627,6.3374,6.4079,6.475,6.5391,6.6008,6.6603,6.7178,6.7736,6.8278,6.8807,6.9323,6.9827,7.032,7.0803,7.1277,7.1743,7.22,7.2649,7.3092,7.3527,7.3956,7.4379,7.4796,7.5207,7.7185,7.9051,8.082,8.2505,8.4115,8.5657,8.8559,9.1249,0.00047,0.07536,0.14888,0.22109,0.29207,0.36187,0.43053,0.4981,0.56461,0.6301,0.69461,0.75817,0.8208,0.88254,0.94341,1.0035,1.0627,1.1211,1.1788,1.2358,1.292,1.3476,1.4025,1.4568,1.5105,1.5635,1.616,1.668,1.7194,1.7703,1.8208,1.8707,1.9203,1.9694,2.0181,2.0664,2.1143,2.1619,2.2091,2.2561,2.3027,2.3952,2.4867,2.5774,2.6676,2.7573,2.8469,2.9365,3.0265,3.1172,3.2091,3.3029,3.3996,3.5006,3.6086,3.729,3.8787,4.0156,4.9314,5.1097,5.3149,5.4483,5.5525,5.64,5.7163,5.7847,5.8469,5.9043,5.9579,6.0082,6.0559,6.1012,6.1446,6.2263,6.3025,6.3743,6.4424,6.5075,6.5699,6.63,6.6881,6.7443,6.799,6.8523,6.9042,6.9549,7.0045,7.0531,7.1007,7.1475,7.1934,7.2385,7.2829,7.3266,7.3696,7.412,7.4538,7.495,7.6933,7.8802,8.0574,8.226,8.3871,8.5414,8.8318,9.101,0.00046,0.07521,0.14861,0.22072,0.29161,0.36132,0.4299,0.49739,0.56383,0.62925,0.6937,0.75719,0.81976,0.88144,0.94226,1.0022,1.0614,1.1198,1.1775,1.2344,1.2906,1.3461,1.4009,1.4551,1.5088,1.5618,1.6142,1.6661,1.7175,1.7683,1.8187,1.8686,1.9181,1.9671,2.0157,2.0639,2.1118,2.1593,2.2065,2.2533,2.2999,2.3921,2.4834,2.5739,2.6638,2.7532,2.8423,2.9315,3.0209,3.111,3.2021,3.2948,3.39,3.4889,3.5934,3.7075,3.8404,4.0332,4.2945,4.5446,5.0555,5.2675,5.4051,5.5122,5.6018,5.6798,5.7494,5.8127,5.871,5.9254,5.9764,6.0246,6.0705,6.1563,6.2358,6.3102,6.3805,6.4473,6.5113,6.5727,6.6319,6.6892,6.7447,6.7988,6.8514,6.9027,6.9529,7.002,7.05,7.0972,7.1435,7.1889,7.2336,7.2776,7.3209,7.3636,7.4056,7.447,7.6462,7.8337,8.0113,8.1804,8.3418,8.4963,8.787,9.0564,0.00041,0.07496,0.14819,0.22015,0.29089,0.36047,0.42894,0.49632,0.56265,0.62798,0.69233,0.75573,0.81821,0.87981,0.94054,1.0004,1.0595,1.1178,1.1754,1.2322,1.2883,1.3438,1.3986,1.4527,1.5062,1.5591,1.6115,1.6633,1.7146,1.7654,1.8156,1.8654,1.9148,1.9637,2.0122,2.0604,2.1081,2.1555,2.2025,2.2492,2.2956,2.3876,2.4786,2.5687,2.6582,2.7471,2.8357,2.9242,3.0129,3.102,3.1919,3.2832,3.3764,3.4726,3.5731,3.6804,3.7993,3.9423,4.1671,4.866,5.14,5.3,5.4197,5.5176,5.6016,5.6759,5.7428,5.8042,5.861,5.9142,5.9642,6.0569,6.1416,6.2202,6.294,6.3637,6.43,6.4935,6.5545,6.6133,6.6702,6.7254,6.7791,6.8313,6.8823,6.9322,6.981,7.0287,7.0756,7.1216,7.1668,7.2112,7.2549,7.2979,7.3403,7.382,7.5825,7.771,7.9493,8.1189,8.2807,8.4356,8.7267,8.9965,0.00027,0.0745,0.14745,0.21916,0.28968,0.35905,0.42732,0.49452,0.56069,0.62586,0.69005,0.7533,0.81564,0.8771,0.93769,0.99746,1.0564,1.1146,1.172,1.2287,1.2847,1.34,1.3946,1.4486,1.502,1.5548,1.607,1.6587,1.7098,1.7605,1.8106,1.8602,1.9094,1.9582,2.0065,2.0545,2.102,2.1492,2.1961,2.2426,2.2888,2.3803,2.4707,2.5603,2.6491,2.7373,2.825,2.9126,3.0001,3.0878,3.176,3.2652,3.3557,3.4483,3.5438,3.6436,3.7498,3.8666,4.0025,4.1804,4.4757,4.8336,5.0627,5.22,5.3416,5.4421,5.5286,5.6051,5.6741,5.7372,5.7956,5.9014,5.9961,6.0825,6.1625,6.2373,6.3079,6.375,6.4391,6.5006,6.5598,6.6171,6.6726,6.7264,6.7789,6.83,6.88,6.9288,6.9766,7.0235,7.0695,7.1147,7.1591,7.2027,7.2457,7.288,7.4906,7.6807,7.8602,8.0307,8.1932,8.3485,8.6405,8.9108,5e-05,0.07398,0.14666,0.21813,0.28844,0.35761,0.4257,0.49272,0.55873,0.62374,0.68778,0.75089,0.81308,0.8744,0.93486,0.9945,1.0533,1.1114,1.1687,1.2252,1.2811,1.3363,1.3908,1.4447,1.4979,1.5506,1.6027,1.6542,1.7052,1.7557,1.8056,1.8551,1.9042,1.9528,2.0009,2.0487,2.0961,2.1431,2.1897,2.2361,2.282,2.3731,2.4631,2.5521,2.6403,2.7278,2.8148,2.9014,2.9879,3.0744,3.1612,3.2486,3.337,3.4268,3.5186,3.6132,3.712,3.8168,3.9308,4.0599,4.2143,4.4138,4.6579,4.8809,5.0564,5.1945,5.308,5.4046,5.4891,5.5646,5.6331,5.7544,5.8605,5.9556,6.0425,6.1228,6.198,6.2689,6.3363,6.4006,6.4622,6.5216,6.5789,6.6345,6.6884,6.7409,6.792,6.8419,6.8907,6.9385,6.9853,7.0312,7.0763,7.1205,7.1641,7.2069,7.4118,7.6034,7.7841,7.9554,8.1186,8.2746,8.5673,8.8382,-0.00024,0.0734,0.14582,0.21707,0.28716,0.35615,0.42405,0.49091,0.55676,0.62161,0.68551,0.74848,0.81054,0.87172,0.93205,0.99156,1.0503,1.1082,1.1654,1.2218,1.2775,1.3326,1.387,1.4407,1.4938,1.5464,1.5983,1.6497,1.7006,1.7509,1.8008,1.8501,1.899,1.9474,1.9955,2.0431,2.0903,2.1371,2.1836,2.2297,2.2755,2.3661,2.4556,2.5442,2.6318,2.7187,2.805,2.8908,2.9764,3.0618,3.1473,3.2332,3.3198,3.4073,3.4962,3.5871,3.6808,3.7783,3.8813,3.9921,4.1145,4.2533,4.4144,4.5979,4.781,4.9448,5.0844,5.2028,5.3048,5.3944,5.4744,5.6132,5.7319,5.8365,5.9307,6.017,6.097,6.1719,6.2427,6.3098,6.374,6.4355,6.4948,6.552,6.6074,6.6612,6.7136,6.7646,6.8144,6.863,6.9106,6.9573,7.003,7.048,7.0921,7.1355,7.3425,7.5357,7.7175,7.8897,8.0536,8.2101,8.5037,8.775,-0.0006,0.07276,0.14494,0.21597,0.28586,0.35466,0.4224,0.4891,0.55479,0.6195,0.68325,0.74608,0.80801,0.86906,0.92927,0.98865,1.0472,1.105,1.1621,1.2184,1.274,1.3289,1.3832,1.4368,1.4898,1.5422,1.5941,1.6453,1.696,1.7462,1.796,1.8452,1.8939,1.9422,1.9901,2.0375,2.0846,2.1312,2.1775,2.2235,2.2691,2.3593,2.4484,2.5364,2.6236,2.7099,2.7955,2.8806,2.9653,3.0498,3.1342,3.2188,3.3038,3.3894,3.476,3.564,3.6539,3.7464,3.8425,3.9433,4.0507,4.1667,4.2937,4.4331,4.5839,4.7367,4.881,5.0115,5.1272,5.2295,5.3207,5.4773,5.6091,5.7236,5.8255,5.9179,6.0029,6.082,6.1562,6.2263,6.293,6.3568,6.4179,6.4769,6.5338,6.5889,6.6425,6.6946,6.7454,6.7949,6.8433,6.8907,6.9372,6.9827,7.0274,7.0713,7.2805,7.4753,7.6583,7.8314,7.9959,8.1529,8.4473,8.7192,-0.00103,0.07207,0.14402,0.21483,0.28454,0.35316,0.42073,0.48727,0.55281,0.61738,0.681,0.74369,0.80549,0.86642,0.9265,0.98575,1.0442,1.1019,1.1588,1.215,1.2705,1.3253,1.3795,1.433,1.4859,1.5381,1.5898,1.641,1.6916,1.7417,1.7912,1.8403,1.8889,1.9371,1.9848,2.0321,2.079,2.1255,2.1716,2.2174,2.2628,2.3527,2.4414,2.5289,2.6156,2.7013,2.7864,2.8708,2.9547,3.0383,3.1218,3.2052,3.2888,3.3728,3.4575,3.5431,3.6301,3.7189,3.8101,3.9045,4.0029,4.1066,4.2168,4.3342,4.4589,4.5896,4.7215,4.8489,4.968,5.0771,5.1762,5.3479,5.492,5.6163,5.7259,5.8245,5.9145,5.9978,6.0755,6.1486,6.2178,6.2838,6.3469,6.4076,6.466,6.5225,6.5773,6.6304,6.6822,6.7326,6.7819,6.83,6.8772,6.9233,6.9686,7.0131,7.2244,7.4207,7.6048,7.7788,7.944,8.1015,8.3967,8.6691,-0.00208,0.07053,0.14204,0.21246,0.2818,0.35009,0.41734,0.48359,0.54885,0.61314,0.6765,0.73894,0.80049,0.86117,0.92101,0.98004,1.0383,1.0957,1.1524,1.2084,1.2637,1.3182,1.3721,1.4254,1.4781,1.5301,1.5816,1.6325,1.6828,1.7327,1.782,1.8308,1.8792,1.927,1.9745,2.0215,2.0681,2.1143,2.1601,2.2056,2.2507,2.3398,2.4277,2.5145,2.6002,2.685,2.769,2.8522,2.9348,3.0169,3.0986,3.1801,3.2615,3.3429,3.4245,3.5065,3.5892,3.6727,3.7574,3.8436,3.9317,4.0221,4.1153,4.2116,4.3112,4.414,4.5191,4.6257,4.732,4.8358,4.9356,5.1189,5.2794,5.4193,5.5426,5.6527,5.7524,5.8437,5.9282,6.0071,6.0814,6.1518,6.2187,6.2827,6.3441,6.4033,6.4604,6.5158,6.5694,6.6217,6.6725,6.7221,6.7706,6.818,6.8644,6.9099,7.1255,7.3248,7.5111,7.6868,7.8533,8.0119,8.3086,8.582,-0.00338,0.06879,0.1399,0.20996,0.27897,0.34694,0.41391,0.47987,0.54487,0.6089,0.67201,0.73422,0.79553,0.85599,0.9156,0.9744,1.0324,1.0896,1.1461,1.2019,1.2569,1.3113,1.365,1.418,1.4705,1.5223,1.5735,1.6242,1.6743,1.7239,1.773,1.8216,1.8697,1.9173,1.9645,2.0113,2.0576,2.1035,2.149,2.1942,2.239,2.3275,2.4147,2.5008,2.5857,2.6696,2.7526,2.8348,2.9162,2.997,3.0773,3.1572,3.2368,3.3162,3.3954,3.4748,3.5543,3.6342,3.7147,3.7958,3.8779,3.961,4.0455,4.1315,4.2192,4.3084,4.3991,4.4909,4.5831,4.6751,4.766,4.9412,5.1032,5.2499,5.3816,5.5002,5.6077,5.706,5.7966,5.8809,5.9599,6.0343,6.1049,6.1721,6.2364,6.2981,6.3576,6.415,6.4705,6.5244,6.5768,6.6279,6.6776,6.7262,6.7737,6.8203,7.0399,7.2421,7.4307,7.608,7.7758,7.9354,8.2336,8.5081,-0.00489,0.06686,0.13761,0.20733,0.27604,0.34373,0.41042,0.47613,0.54087,0.60467,0.66755,0.72952,0.79061,0.85085,0.91025,0.96884,1.0266,1.0837,1.1399,1.1955,1.2503,1.3045,1.358,1.4108,1.463,1.5147,1.5657,1.6162,1.6661,1.7154,1.7643,1.8126,1.8605,1.9079,1.9549,2.0014,2.0474,2.0931,2.1384,2.1832,2.2277,2.3157,2.4023,2.4876,2.5718,2.655,2.7371,2.8184,2.8988,2.9785,3.0576,3.1362,3.2142,3.2919,3.3694,3.4466,3.5238,3.601,3.6784,3.756,3.834,3.9125,3.9916,4.0714,4.152,4.2335,4.3156,4.3984,4.4815,4.5647,4.6473,4.8097,4.965,5.1104,5.2445,5.3674,5.48,5.5834,5.6789,5.7677,5.8507,5.9288,6.0027,6.0728,6.1397,6.2038,6.2654,6.3248,6.3821,6.4376,6.4915,6.5439,6.5949,6.6446,6.6932,6.7407,6.9643,7.1693,7.36,7.5389,7.708,7.8686,8.1682,8.4436,-0.00661,0.06477,0.13518,0.2046,0.27302,0.34045,0.40688,0.47235,0.53686,0.60044,0.66309,0.72485,0.78574,0.84577,0.90496,0.96335,1.0209,1.0778,1.1338,1.1892,1.2438,1.2978,1.3511,1.4038,1.4558,1.5072,1.558,1.6083,1.658,1.7071,1.7558,1.8039,1.8516,1.8988,1.9455,1.9917,2.0376,2.083,2.128,2.1726,2.2169,2.3043,2.3903,2.475,2.5586,2.641,2.7224,2.8028,2.8824,2.9612,3.0392,3.1166,3.1934,3.2697,3.3456,3.4212,3.4965,3.5716,3.6466,3.7216,3.7966,3.8718,3.9472,4.0228,4.0988,4.1751,4.2517,4.3286,4.4056,4.4826,4.5592,4.7106,4.8576,4.9981,5.1304,5.254,5.3687,5.4751,5.574,5.6661,5.7524,5.8335,5.9102,5.9829,6.0522,6.1184,6.182,6.2431,6.3021,6.3591,6.4144,6.468,6.5202,6.571,6.6206,6.669,6.8964,7.1042,7.2968,7.4773,7.6476,7.8091,8.1101,8.3865,-0.00851,0.06252,0.13263,0.20176,0.26992,0.3371,0.40331,0.46855,0.53284,0.5962,0.65865,0.72021,0.78089,0.84073,0.89973,0.95792,1.0153,1.072,1.1279,1.183,1.2375,1.2913,1.3444,1.3968,1.4487,1.4999,1.5505,1.6006,1.6501,1.6991,1.7475,1.7954,1.8429,1.8898,1.9364,1.9824,2.028,2.0732,2.118,2.1624,2.2064,2.2933,2.3788,2.4629,2.5459,2.6277,2.7084,2.7881,2.8669,2.9448,3.0219,3.0983,3.174,3.2492,3.3238,3.3979,3.4717,3.5451,3.6182,3.6911,3.7639,3.8365,3.9091,3.9818,4.0544,4.1271,4.1998,4.2725,4.3452,4.4177,4.49,4.6329,4.7724,4.9073,5.0361,5.1581,5.2728,5.3803,5.481,5.5753,5.6639,5.7474,5.8263,5.9012,5.9725,6.0406,6.1059,6.1686,6.2291,6.2875,6.344,6.3988,6.4521,6.5039,6.5545,6.6038,6.8347,7.045,7.2396,7.4216,7.593,7.7555,8.0579,8.3352,-0.01282,0.05761,0.12717,0.19581,0.2635,0.33024,0.39602,0.46086,0.52476,0.58773,0.6498,0.71099,0.77131,0.83078,0.88942,0.94726,1.0043,1.0606,1.1161,1.1709,1.2251,1.2785,1.3312,1.3833,1.4348,1.4857,1.536,1.5857,1.6348,1.6834,1.7315,1.7791,1.8261,1.8727,1.9188,1.9645,2.0097,2.0545,2.0988,2.1428,2.1863,2.2723,2.3569,2.44,2.5219,2.6026,2.6821,2.7605,2.838,2.9144,2.99,3.0647,3.1387,3.2119,3.2845,3.3564,3.4277,3.4985,3.5688,3.6386,3.7081,3.7771,3.8458,3.9142,3.9823,4.0502,4.1177,4.185,4.252,4.3186,4.3848,4.5159,4.6444,4.7697,4.8909,5.0076,5.1192,5.2255,5.3265,5.4222,5.513,5.5991,5.6809,5.7587,5.8329,5.9039,5.972,6.0373,6.1003,6.161,6.2197,6.2766,6.3317,6.3854,6.4375,6.4884,6.7258,6.9409,7.1391,7.3239,7.4975,7.6618,7.9668,8.2459,-0.01768,0.05222,0.12131,0.18952,0.25682,0.32318,0.3886,0.45308,0.51663,0.57927,0.641,0.70186,0.76184,0.82099,0.8793,0.93682,0.99354,1.0495,1.1047,1.1592,1.213,1.2661,1.3186,1.3703,1.4215,1.4721,1.522,1.5714,1.6202,1.6685,1.7162,1.7634,1.8101,1.8564,1.9021,1.9474,1.9923,2.0367,2.0807,2.1243,2.1674,2.2526,2.3363,2.4186,2.4996,2.5793,2.6578,2.7352,2.8115,2.8868,2.9611,3.0345,3.107,3.1787,3.2497,3.3199,3.3894,3.4582,3.5265,3.5941,3.6612,3.7277,3.7938,3.8594,3.9245,3.9892,4.0534,4.1172,4.1805,4.2434,4.3059,4.4292,4.5502,4.6685,4.7835,4.8951,5.0026,5.1061,5.2053,5.3003,5.391,5.4778,5.5606,5.6399,5.7157,5.7884,5.8582,5.9254,5.9901,6.0525,6.1129,6.1714,6.2281,6.2832,6.3367,6.3889,6.6319,6.8513,7.0527,7.24,7.4157,7.5816,7.889,8.1699,-0.02302,0.04642,0.11511,0.18296,0.24991,0.31595,0.38105,0.44523,0.50847,0.57081,0.63224,0.6928,0.75249,0.81134,0.86936,0.92658,0.98301,1.0387,1.0936,1.1478,1.2013,1.2541,1.3063,1.3578,1.4086,1.4589,1.5085,1.5576,1.6061,1.6541,1.7015,1.7484,1.7948,1.8407,1.8862,1.9312,1.9757,2.0198,2.0634,2.1067,2.1495,2.234,2.3169,2.3985,2.4786,2.5575,2.6352,2.7116,2.787,2.8613,2.9345,3.0068,3.0782,3.1487,3.2183,3.2872,3.3553,3.4226,3.4892,3.5552,3.6205,3.6852,3.7493,3.8128,3.8758,3.9382,4.0001,4.0614,4.1222,4.1826,4.2423,4.3603,4.4759,4.589,4.6993,4.8066,4.9106,5.0112,5.1082,5.2016,5.2913,5.3776,5.4605,5.54,5.6165,5.6901,5.7609,5.8291,5.895,5.9586,6.0202,6.0798,6.1377,6.1939,6.2485,6.3018,6.5494,6.7725,6.9769,7.1665,7.344,7.5114,7.8211,8.1036,-0.02874,0.04029,0.10863,0.17616,0.24282,0.30857,0.37341,0.43731,0.50029,0.56236,0.62353,0.68382,0.74324,0.80182,0.85958,0.91653,0.97269,1.0281,1.0828,1.1367,1.1899,1.2424,1.2943,1.3455,1.3961,1.4461,1.4955,1.5443,1.5925,1.6402,1.6874,1.734,1.7801,1.8257,1.8709,1.9156,1.9598,2.0036,2.0469,2.0899,2.1324,2.2162,2.2985,2.3794,2.4588,2.537,2.6139,2.6896,2.7641,2.8375,2.9099,2.9813,3.0517,3.1211,3.1897,3.2575,3.3244,3.3905,3.4558,3.5205,3.5844,3.6476,3.7102,3.7721,3.8334,3.8941,3.9543,4.0138,4.0727,4.1311,4.189,4.3029,4.4145,4.5236,4.6302,4.7341,4.8351,4.9331,5.028,5.1197,5.2082,5.2936,5.3759,5.4553,5.5318,5.6056,5.6769,5.7457,5.8122,5.8765,5.9389,5.9993,6.058,6.1151,6.1706,6.2246,6.4761,6.7023,6.9093,7.101,7.2802,7.449,7.7608,8.0447,-0.03477,0.10191,0.23557,0.30108,0.36567,0.49209,0.61486,0.73409,0.84994,0.96257,1.0721,1.1788,1.2827,1.384,1.4829,1.5794,1.6737,1.7659,1.8562,1.9446,2.0311,2.116,2.1993,2.281,2.3612,2.4401,2.5176,2.5938,2.6688,2.7426,2.8153,2.8869,3.027,3.1633,3.2961,3.4255,3.5518,3.6752,3.7959,3.914,4.0296,4.1428,4.4154,4.6729,4.9139,5.1374,5.3432,5.5323,5.8671,6.1558,6.6391,7.0419,7.3928,7.7066,7.9919,-0.05087,0.08435,0.21694,0.28196,0.34608,0.47156,0.59337,0.71161,0.82643,0.93801,1.0465,1.1521,1.2549,1.3551,1.4529,1.5483,1.6414,1.7325,1.8216,1.9088,1.9942,2.0779,2.1599,2.2404,2.3194,2.3969,2.4731,2.5479,2.6215,2.6938,2.765,2.835,2.9719,3.1048,3.2338,3.3594,3.4815,3.6006,3.7166,3.8299,3.9404,4.0483,4.3074,4.5518,4.7817,4.997,5.1977,5.3843,5.7193,6.0118,6.5049,6.9158,7.2726,7.5907,7.8791,-0.06791,0.06608,0.19783,0.26251,0.32629,0.45108,0.57217,0.68964,0.80366,0.91439,1.022,1.1267,1.2286,1.3279,1.4247,1.5192,1.6114,1.7016,1.7897,1.8759,1.9603,2.043,2.1241,2.2035,2.2814,2.3579,2.433,2.5068,2.5792,2.6505,2.7205,2.7894,2.9238,3.0541,3.1805,3.3033,3.4226,3.5386,3.6516,3.7616,3.8688,3.9733,4.2236,4.4593,4.6813,4.8902,5.0862,5.27,5.6032,5.897,6.3957,6.8123,7.1737,7.4953,7.7864,-0.08545,0.04742,0.17851,0.24292,0.30644,0.43073,0.55128,0.66816,0.78154,0.89158,0.99848,1.1024,1.2036,1.3021,1.3981,1.4918,1.5832,1.6725,1.7599,1.8453,1.9289,2.0107,2.0909,2.1696,2.2466,2.3223,2.3965,2.4694,2.5409,2.6113,2.6804,2.7483,2.8809,3.0092,3.1336,3.2543,3.3714,3.4852,3.5959,3.7036,3.8084,3.9105,4.1547,4.3843,4.6005,4.8043,4.9964,5.1774,5.5081,5.8021,6.3043,6.725,7.09,7.4144,7.7077,-0.10324,0.02861,0.15913,0.22332,0.28666,0.41057,0.53071,0.64714,0.76,0.86948,0.97579,1.0791,1.1796,1.2774,1.3728,1.4658,1.5565,1.6452,1.7318,1.8165,1.8994,1.9806,2.0601,2.138,2.2144,2.2893,2.3628,2.4349,2.5058,2.5753,2.6437,2.7109,2.8419,2.9687,3.0915,3.2105,3.326,3.4381,3.547,3.6529,3.756,3.8563,4.0959,4.321,4.5328,4.7327,4.9215,5.0998,5.4278,5.7214,6.2259,6.6497,7.0174,7.3442,7.6393,-0.12111,0.00979,0.1398,0.20382,0.26701,0.39064,0.51047,0.62654,0.73899,0.84802,0.95383,1.0566,1.1566,1.2538,1.3486,1.441,1.5312,1.6192,1.7053,1.7894,1.8717,1.9522,2.0311,2.1084,2.1842,2.2585,2.3314,2.4029,2.4731,2.5421,2.6098,2.6764,2.8061,2.9316,3.0531,3.1708,3.2849,3.3957,3.5032,3.6078,3.7095,3.8084,4.0445,4.2661,4.4746,4.6713,4.8573,5.0334,5.3585,5.6512,6.1572,6.5836,6.9536,7.2823,7.579,-0.13897,-0.00896,0.1206,0.18448,0.24755,0.37097,0.49056,0.60635,0.71848,0.82713,0.93253,1.0349,1.1344,1.2311,1.3254,1.4173,1.507,1.5945,1.68,1.7636,1.8454,1.9254,2.0037,2.0805,2.1558,2.2295,2.3019,2.3729,2.4426,2.511,2.5782,2.6442,2.7729,2.8973,3.0177,3.1343,3.2474,3.357,3.4635,3.5669,3.6675,3.7653,3.9986,4.2175,4.4234,4.6176,4.8013,4.9754,5.2977,5.5892,6.096,6.5246,6.8967,7.227,7.5252,-0.17446,-0.04604,0.08276,0.14641,0.20931,0.33244,0.45173,0.56715,0.67881,0.78691,0.89167,0.99331,1.092,1.1881,1.2815,1.3726,1.4614,1.548,1.6327,1.7154,1.7963,1.8755,1.953,2.0289,2.1033,2.1762,2.2477,2.3178,2.3867,2.4542,2.5206,2.5858,2.7127,2.8355,2.9541,3.0691,3.1804,3.2884,3.3931,3.4949,3.5938,3.6899,3.9192,4.1341,4.3361,4.5267,4.7069,4.8779,5.1952,5.484,5.9907,6.4225,6.7982,7.1316,7.4321,-0.08239,0.04581,0.10929,0.17207,0.29504,0.41418,0.52938,0.64075,0.74849,0.85281,0.95395,1.0521,1.1475,1.2404,1.3308,1.4189,1.5049,1.5889,1.671,1.7512,1.8297,1.9065,1.9817,2.0554,2.1277,2.1985,2.268,2.3362,2.4031,2.4688,2.5333,2.659,2.7805,2.8979,3.0115,3.1216,3.2284,3.3319,3.4325,3.5302,3.6251,3.8516,4.0637,4.2631,4.4511,4.629,4.7978,5.1113,5.3974,5.9024,6.3361,6.7146,7.0507,7.3534,0.00978,0.07316,0.13588,0.25878,0.37786,0.49296,0.60416,0.71166,0.81568,0.91646,1.0142,1.1092,1.2016,1.2915,1.3791,1.4646,1.548,1.6295,1.7092,1.7872,1.8634,1.9381,2.0113,2.083,2.1533,2.2223,2.29,2.3564,2.4216,2.4856,2.6103,2.7307,2.8472,2.9599,3.069,3.1748,3.2775,3.3771,3.4739,3.568,3.7923,4.0025,4.2,4.3863,4.5625,4.7297,5.0404,5.3241,5.8269,6.2611,6.6418,6.9802,7.2849,0.03801,0.1007,0.2236,0.34269,0.45776,0.56889,0.67624,0.78006,0.88058,0.97806,1.0727,1.1647,1.2542,1.3414,1.4265,1.5095,1.5906,1.6698,1.7474,1.8232,1.8975,1.9702,2.0415,2.1114,2.1799,2.2472,2.3132,2.378,2.4416,2.5655,2.6851,2.8008,2.9128,3.0212,3.1263,3.2282,3.3271,3.4233,3.5167,3.7394,3.9481,4.1442,4.3292,4.5042,4.6703,4.9789,5.2609,5.7613,6.1952,6.5772,6.9174,7.2241,0.06652,0.18948,0.30862,0.42372,0.53482,0.6421,0.7458,0.84615,0.9434,1.0378,1.1295,1.2187,1.3056,1.3903,1.473,1.5538,1.6327,1.7098,1.7853,1.8593,1.9317,2.0026,2.0721,2.1404,2.2073,2.2729,2.3374,2.4007,2.5239,2.643,2.758,2.8694,2.9772,3.0817,3.1831,3.2815,3.3771,3.47,3.6915,3.899,4.0941,4.2781,4.4522,4.6174,4.9245,5.2052,5.7036,6.1368,6.5193,6.8609,7.1691]),
+    phase: new Uint8Array([0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2]),
+};
+const PHASE_NAMES = ["liquid", "vapor", "supercritical fluid"];
+const SATURATED_PROPERTIES = ["vf", "vg", "uf", "ug", "ufg", "hf", "hg", "hfg", "sf", "sg", "sfg"];
+const PROPERTY_COLUMNS = ["v", "rho", "u", "h", "s"];
+
+// Index of the first element of values[lo .. hi - 1] greater than value
+function upperBound(values, value, lo, hi) {
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (values[mid] <= value) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+
+// Bracketing rows lower/upper of value within rows start .. end - 1 of the sorted column keys
+function bracket(keys, value, start, end) {
+    const upper = Math.min(Math.max(upperBound(keys, value, start, end), start + 1), end - 1);
+    const lower = upper - 1;
+    const width = keys[upper] - keys[lower];
+    return {
+        lower,
+        upper,
+        weight: width !== 0 ? (value - keys[lower]) / width : 0,
+        inside: value >= keys[start] && value <= keys[end - 1],
+    };
+}
+
+function saturated(table, key, other, value) {
+    const keys = table[key];
+    const { lower, upper, weight, inside } = bracket(keys, value, 0, keys.length);
+    const result = {};
+    for (const column of [key, other, ...SATURATED_PROPERTIES]) {
+        result[column] = inside ? table[column][lower] + (table[column][upper] - table[column][lower]) * weight : NaN;
+    }
+    return result;
+}
+
+/**
+ * const { saturatedByPressure } = require('./steam_tables_compiled');
+ * Saturated water and steam properties at a pressure, interpolated linearly in P.
+ * @param {number} P - Pressure in MPa.
+ * @returns {Object} { P, T, vf, vg, uf, ug, ufg, hf, hg, hfg, sf, sg, sfg }: saturation temperature in °C and the liquid (f), vapor (g) and vaporization (fg) properties.
+ */
+function saturatedByPressure(P) {
+    return saturated(SATURATED_BY_PRESSURE, "P", "T", P);
+}
+
+/**
+ * const { saturatedByTemperature } = require('./steam_tables_compiled');
+ * Saturated water and steam properties at a temperature, interpolated linearly in T.
+ * @param {number} T - Temperature in °C.
+ * @returns {Object} { T, P, vf, vg, uf, ug, ufg, hf, hg, hfg, sf, sg, sfg }: saturation pressure in MPa and the liquid (f), vapor (g) and vaporization (fg) properties.
+ */
+function saturatedByTemperature(T) {
+    return saturated(SATURATED_BY_TEMPERATURE, "T", "P", T);
+}
+
+/**
+ * const { steamProperties } = require('./steam_tables_compiled');
+ * Compressed liquid, superheated steam or supercritical water properties at a pressure and temperature,
+ * interpolated bilinearly in T and P. Points between a liquid and a vapor table row (across the
+ * saturation line) have no single-phase value: use saturatedByPressure or saturatedByTemperature there.
+ * @param {number} P - Pressure in MPa.
+ * @param {number} T - Temperature in °C.
+ * @returns {Object} { P, T, v, rho, u, h, s, phase }: phase is "liquid", "vapor", "supercritical fluid", or "mixed" with NaN properties when the point cannot be interpolated.
+ */
+function steamProperties(P, T) {
+    const result = { P, T, v: NaN, rho: NaN, u: NaN, h: NaN, s: NaN, phase: "mixed" };
+    const last = PRESSURES.length - 1;
+    if (!(P >= PRESSURES[0] && P <= PRESSURES[last])) {
+        return result;
+    }
+    const low = Math.min(Math.max(upperBound(PRESSURES, P, 0, PRESSURES.length) - 1, 0), last - 1);
+    const pressureWeight = (P - PRESSURES[low]) / (PRESSURES[low + 1] - PRESSURES[low]);
+    const corners = [[low, 1 - pressureWeight], [low + 1, pressureWeight]];
+    const values = [0, 0, 0, 0, 0];
+    let liquid = false;
+    let vapor = false;
+    for (const [index, share] of corners) {
+        // A pressure without weight, e.g. the other one on an exact pressure match, is ignored
+        if (share <= 0) {
+            continue;
+        }
+        const { lower, upper, weight, inside } = bracket(PROPERTIES.T, T, STARTS[index], STARTS[index + 1]);
+        if (!inside) {
+            return result;
+        }
+        for (const [row, rowShare] of [[lower, 1 - weight], [upper, weight]]) {
+            if (rowShare <= 0) {
+                continue;
+            }
+            liquid = liquid || PROPERTIES.phase[row] === 0;
+            vapor = vapor || PROPERTIES.phase[row] === 1;
+        }
+        PROPERTY_COLUMNS.forEach((column, position) => {
+            const data = PROPERTIES[column];
+            values[position] += share * (data[lower] + (data[upper] - data[lower]) * weight);
+        });
+    }
+    if (liquid && vapor) {
+        return result;
+    }
+    PROPERTY_COLUMNS.forEach((column, position) => {
+        result[column] = values[position];
+    });
+    result.phase = PHASE_NAMES[vapor ? 1 : liquid ? 0 : 2];
+    return result;
+}
+
+/**
+ * const { steamTableRange } = require('./steam_tables_compiled');
+ * The tabulated pressures and the temperature range at each, for picking random states that steamProperties can evaluate.
+ * @returns {Object} { pressures: number[], temperatures: Array<[number, number]> } with pressures in MPa and [min, max] temperatures in °C.
+ */
+function steamTableRange() {
+    return {
+        pressures: Array.from(PRESSURES),
+        temperatures: Array.from(PRESSURES, (_, index) => [PROPERTIES.T[STARTS[index]], PROPERTIES.T[STARTS[index + 1] - 1]]),
+    };
+}
+
+module.exports = {
+    steamProperties,
+    saturatedByPressure,
+    saturatedByTemperature,
+    steamTableRange
+};
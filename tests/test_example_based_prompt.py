@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import pandas as pd
+
+from util_example_based_prompt import ExampleBasedPromptFormatter, rendered_column_name
+from util_semantic_search import SemanticSearch
+
+ROWS = [
+    {"question": "A car travels {d} km in 2 h, find its speed.", "question.html": "<pl-question-panel>{{params.d}} km { 2 } h</pl-question-panel>", "question_embedding": "[1.0, 0.0]"},
+    {"question": "Find the stress in a wire.", "question.html": "<pl-number-input answers-name=\"sigma\"></pl-number-input>", "question_embedding": "[0.8, 0.6]"},
+    {"question": "Unrelated question.", "question.html": "<p>unused</p>", "question_embedding": "[0.0, 1.0]"},
+]
+
+
+class FakeEmbeddings:
+    def create(self, input, model):
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[1.0, 0.0])])
+
+
+def extract(csv_path: str) -> list:
+    search = SemanticSearch(csv_path, "question_embedding", "test-embedding", api_key="test")
+    # Embeddings of the query come from a fixed vector instead of the API
+    search.client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return search.extract_examples("A car question", "question", "question.html", n_examples=2)
+
+
+class RenderedExamplesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.directory.name, "dataset.csv")
+        self.rendered_path = os.path.join(self.directory.name, "dataset_rendered.csv")
+        pd.DataFrame(ROWS).to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_extract_examples_uses_stored_rendering_and_prompt_is_unchanged(self):
+        ExampleBasedPromptFormatter.store_rendered_examples(self.csv_path, [("question", "question.html")], self.rendered_path)
+
+        plain = extract(self.csv_path)
+        rendered = extract(self.rendered_path)
+
+        self.assertEqual(rendered_column_name("question", "question.html"), "rendered[question->question.html]v1")
+        self.assertEqual(len(rendered), 2)
+        self.assertTrue(all("rendered" in example for example in rendered))
+        self.assertFalse(any("rendered" in example for example in plain))
+        template = "Generate a html code based on {the} following examples"
+        self.assertEqual(
+            ExampleBasedPromptFormatter.run(rendered, template).encode(),
+            ExampleBasedPromptFormatter.run(plain, template).encode(),
+        )
+
+    def test_store_rendered_examples_never_overwrites_the_dataset(self):
+        with open(self.csv_path, "rb") as file:
+            original = file.read()
+        with self.assertRaises(ValueError):
+            ExampleBasedPromptFormatter.store_rendered_examples(self.csv_path, [("question", "question.html")], self.csv_path)
+        with open(self.csv_path, "rb") as file:
+            self.assertEqual(file.read(), original)
+
+
+if __name__ == "__main__":
+    unittest.main()
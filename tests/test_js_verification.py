@@ -0,0 +1,49 @@
+import os
+import unittest
+
+from util_js_verification import VERIFICATION_OPTIONS, check_samples, missing_package, verify_server_js
+from util_node_pool import node_available
+
+MATHJS_INSTALLED = os.path.isdir(os.path.join(os.path.dirname(VERIFICATION_OPTIONS["filename"]), "node_modules", "mathjs"))
+
+
+class MissingPackageTest(unittest.TestCase):
+    def test_only_bare_package_names_count(self):
+        self.assertEqual(missing_package("Error: Cannot find module 'mathjs'\nRequire stack:"), "mathjs")
+        self.assertIsNone(missing_package("Error: Cannot find module './UnitConverter'"))
+        self.assertIsNone(missing_package("Error: Cannot find module '/abs/helper.js'"))
+        self.assertIsNone(missing_package("TypeError: x is not a function"))
+
+
+class CheckSamplesTest(unittest.TestCase):
+    def test_constant_numeric_answer_is_only_a_warning(self):
+        samples = [{"params": {"x": x}, "correct_answers": {"g": 9.81, "unit": "m/s^2", "y": 2 * x}} for x in (1, 2, 3)]
+
+        report = check_samples(samples)
+
+        self.assertTrue(report["ok"])
+        self.assertEqual(report["warnings"], ["correct_answers never vary although params do: g"])
+
+
+@unittest.skipUnless(node_available(), "node is not installed")
+class VerifyServerJsTest(unittest.TestCase):
+    @unittest.skipIf(MATHJS_INSTALLED, "mathjs is installed")
+    def test_missing_npm_package_is_skipped(self):
+        source = "const math = require('mathjs');\nmodule.exports = { generate: () => ({ params: {}, correct_answers: {} }) };"
+
+        report = verify_server_js(source, samples=2)
+
+        self.assertTrue(report["ok"])
+        self.assertTrue(report["skipped"])
+
+    def test_missing_relative_module_is_rejected(self):
+        source = "const helper = require('./no_such_helper');\nmodule.exports = { generate: () => ({ params: {}, correct_answers: {} }) };"
+
+        report = verify_server_js(source, samples=2)
+
+        self.assertFalse(report["ok"])
+        self.assertFalse(report["skipped"])
+
+
+if __name__ == "__main__":
+    unittest.main()
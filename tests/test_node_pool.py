@@ -0,0 +1,46 @@
+import threading
+import unittest
+
+from util_node_pool import NodeWorkerPool, node_available
+
+
+@unittest.skipUnless(node_available(), "node is not installed")
+class NodeWorkerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = NodeWorkerPool(workers=1)
+        self.addCleanup(self.pool.close)
+
+    def test_direct_stdout_writes_are_returned_as_logs(self):
+        source = 'process.stdout.write("progress 50%\\n"); module.exports = { generate: () => 42 };'
+
+        result = self.pool.run(source=source, runs=2)
+
+        self.assertTrue(result["ok"], result["error"])
+        self.assertEqual(result["results"], [42, 42])
+        self.assertIn("progress 50%", result["logs"])
+        # The worker went back to the pool with nothing left unread
+        self.assertEqual(self.pool.run(source="module.exports = () => 1;")["results"], [1])
+
+    def test_waiter_is_woken_when_replacement_cannot_start(self):
+        worker = self.pool._acquire()
+        self.pool.options["node"] = "/nonexistent/node"
+        outcome = []
+
+        def acquire():
+            try:
+                outcome.append(self.pool._acquire())
+            except OSError as e:
+                outcome.append(e)
+
+        waiter = threading.Thread(target=acquire, daemon=True)
+        waiter.start()
+        worker.kill()
+        self.pool._release(worker)
+        waiter.join(5)
+
+        self.assertFalse(waiter.is_alive())
+        self.assertIsInstance(outcome[0], FileNotFoundError)
+
+
+if __name__ == "__main__":
+    unittest.main()
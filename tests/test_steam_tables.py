@@ -0,0 +1,91 @@
+import math
+import os
+import unittest
+
+from util_js_verification import VERIFICATION_OPTIONS
+from util_node_pool import get_node_pool, node_available
+from util_steam_tables import COMPILED_MODULE, PHASE_NAMES, get_steam_tables
+
+# (P in MPa, T in °C) covering both phases, exact table pressures, interpolated ones and invalid states
+PARITY_STATES = [
+    (1, 300), (0.1, 105), (0.1, 99), (0.15, 105), (0.125, 100), (1, 179), (1, 181), (2.75, 640.5),
+    (30, 400), (0.105, 100.5), (0.005, 300), (1, 2500), (1, -10),
+]
+PROPERTIES = ["v", "rho", "u", "h", "s"]
+
+
+def same(expected, actual) -> bool:
+    if math.isnan(expected):
+        return math.isnan(actual)
+    return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-12)
+
+
+class SteamTablesTest(unittest.TestCase):
+    def setUp(self):
+        self.tables = get_steam_tables()
+
+    def test_known_superheated_point(self):
+        result = self.tables.properties(1, 300)
+
+        self.assertAlmostEqual(result["h"][0], 3051.6)
+        self.assertAlmostEqual(result["v"][0], 0.25799)
+        self.assertEqual(result["phase"][0], "vapor")
+
+    def test_exact_pressure_match_ignores_the_neighbouring_pressure(self):
+        result = self.tables.properties([0.1, 0.1], [99, 105])
+
+        self.assertEqual(list(result["phase"]), ["liquid", "vapor"])
+        self.assertAlmostEqual(result["v"][1], 1.7204)
+
+    def test_saturated_by_pressure(self):
+        result = self.tables.saturated_by_pressure(1)
+
+        self.assertAlmostEqual(result["T"][0], 179.878)
+        self.assertAlmostEqual(result["hg"][0], 2777.1)
+
+    def test_across_saturation_line_is_nan(self):
+        # At 0.1 MPa 100.5 °C is vapour, at 0.11 MPa it is liquid
+        result = self.tables.properties(0.105, 100.5)
+
+        self.assertTrue(math.isnan(result["h"][0]))
+        self.assertEqual(result["phase"][0], PHASE_NAMES[-1])
+
+    def test_outside_table_is_nan(self):
+        result = self.tables.properties([0.005, 1, 1, float("nan")], [300, 2500, -10, 300])
+
+        self.assertTrue(all(math.isnan(value) for value in result["v"]))
+        self.assertEqual(set(result["phase"]), {PHASE_NAMES[-1]})
+        self.assertTrue(math.isnan(self.tables.saturated_by_pressure(1000)["T"][0]))
+
+
+@unittest.skipUnless(node_available(), "node is not installed")
+class CompiledSteamTablesTest(unittest.TestCase):
+    def test_compiled_module_matches_python(self):
+        source = (
+            f"const {{ steamProperties, saturatedByPressure }} = require('./{os.path.splitext(COMPILED_MODULE)[0]}');\n"
+            f"const states = {[list(state) for state in PARITY_STATES]};\n"
+            "module.exports = () => ({\n"
+            "    properties: states.map(([P, T]) => steamProperties(P, T)),\n"
+            "    saturated: states.map(([P]) => saturatedByPressure(P)),\n"
+            "});\n"
+        )
+
+        result = get_node_pool().run(source=source, filename=VERIFICATION_OPTIONS["filename"])
+
+        self.assertTrue(result["ok"], result["error"])
+        compiled = result["results"][0]
+        pressures, temperatures = zip(*PARITY_STATES)
+        expected = get_steam_tables().properties(pressures, temperatures)
+        saturated = get_steam_tables().saturated_by_pressure(pressures)
+        for index, state in enumerate(PARITY_STATES):
+            with self.subTest(state=state):
+                actual = compiled["properties"][index]
+                self.assertEqual(actual["phase"], expected["phase"][index])
+                for name in PROPERTIES:
+                    self.assertTrue(same(expected[name][index], actual[name]), f"{name}: {expected[name][index]} != {actual[name]}")
+                for name in ("T", "hf", "hg"):
+                    self.assertTrue(same(saturated[name][index], compiled["saturated"][index][name]), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import unittest
+
+import httpx
+import openai
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_openai import ChatOpenAI
+
+from util_clients import GovernedOpenAI
+from util_request_governor import get_governor
+from util_streaming import FenceParser, stream_until_fence
+from util_telemetry import get_telemetry
+
+
+class FakeCompletionBody(httpx.SyncByteStream):
+    """
+    A server-sent event body that streams `chunks` as chat completion deltas and records how far it got.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+        self.closed = False
+
+    def __iter__(self):
+        for text in self.chunks:
+            self.sent += 1
+            chunk = {
+                "id": "chatcmpl-test",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "test-model",
+                "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+            }
+            yield f"data: {json.dumps(chunk)}\n\n".encode()
+        yield b"data: [DONE]\n\n"
+
+    def close(self):
+        self.closed = True
+
+
+def fake_chat_model(body: FakeCompletionBody, requests: list) -> ChatOpenAI:
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, stream=body)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    client = GovernedOpenAI(openai.OpenAI(api_key="test", base_url="http://test/v1", http_client=http_client, max_retries=0))
+    return ChatOpenAI(model="test-model", api_key="test", temperature=0.0, client=client.chat.completions)
+
+
+class StreamUntilFenceTest(unittest.TestCase):
+    def test_closes_response_after_closing_fence(self):
+        prose = ["Some explanation of the code. "] * 200
+        body = FakeCompletionBody(["Here it is:\n", "```java", "script\nconst a = 1;\n", "```", "\n"] + prose)
+        requests = []
+        llm = fake_chat_model(body, requests)
+
+        text = stream_until_fence(llm, [SystemMessage(content="static"), HumanMessage(content="question")], "javascript")
+
+        self.assertEqual(text, "Here it is:\n```javascript\nconst a = 1;\n```")
+        self.assertTrue(body.closed)
+        self.assertLess(body.sent, len(body.chunks))
+        self.assertEqual(get_governor().metrics()["test-model"]["in_flight"], 0)
+        self.assertEqual(requests[0]["messages"], [{"role": "system", "content": "static"}, {"role": "user", "content": "question"}])
+        self.assertTrue(requests[0]["stream"])
+
+    def test_returns_whole_completion_without_block(self):
+        body = FakeCompletionBody(["no ", "code ", "here"])
+        llm = fake_chat_model(body, [])
+
+        self.assertEqual(stream_until_fence(llm, "prompt", "html"), "no code here")
+        self.assertTrue(body.closed)
+        self.assertEqual(get_governor().metrics()["test-model"]["in_flight"], 0)
+
+    def test_records_stage_and_estimated_tokens_when_stream_closes(self):
+        body = FakeCompletionBody(["```html\n", "<p>done</p>\n", "```", " trailing prose"])
+        llm = fake_chat_model(body, [])
+        seen = len(get_telemetry().events())
+
+        stream_until_fence(llm, "p" * 40, "html")
+
+        events = get_telemetry().events()[seen:]
+        stages = [event for event in events if event["type"] == "stage" and event["stage"] == "llm_call:test-model"]
+        tokens = [event for event in events if event["type"] == "tokens" and event["model"] == "test-model"]
+        self.assertEqual(len(stages), 1)
+        self.assertTrue(stages[0]["ok"])
+        self.assertEqual(len(tokens), 1)
+        self.assertEqual(tokens[0]["prompt_tokens"], 10)
+        self.assertEqual(tokens[0]["completion_tokens"], 6)
+
+
+class FenceParserTest(unittest.TestCase):
+    def test_skips_blocks_of_other_languages(self):
+        parser = FenceParser(["html"])
+        self.assertFalse(parser.feed("```python\nprint(1)\n``` then ``"))
+        self.assertTrue(parser.feed("`html\n<pl-question-panel></pl-question-panel>\n```"))
+        self.assertEqual(parser.block, "<pl-question-panel></pl-question-panel>\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
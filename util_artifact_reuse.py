@@ -0,0 +1,161 @@
+import json
+import os
+import re
+import uuid
+
+from util_deduplication import dataset_matrix, embed_texts
+from util_file_export import create_folder
+from util_telemetry import get_telemetry, instrument
+from util_tracing import get_tracer
+
+# Default behaviour of reusing the stored files of a question that is already in the dataset
+REUSE_OPTIONS = {
+    "threshold": 0.98,
+    "embedding_model": "text-embedding-ada-002",
+    "embedding_column": "question_embedding",
+    "text_column": "question",  # The stored question text, which must match the incoming question besides its embedding
+    "artifact_columns": ["question.html", "server.js", "server.py", "solution.html"],
+}
+
+NUMBER_PATTERN = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def normalise_question(text: str) -> str:
+    """
+    Returns the question text without markup, punctuation, case and whitespace differences.
+    Numbers are replaced by "#", they are compared by numeric_tokens().
+    """
+    text = NUMBER_PATTERN.sub(" # ", TAG_PATTERN.sub(" ", str(text)).lower())
+    return " ".join(re.findall(r"[a-z#]+", text))
+
+
+def numeric_tokens(text: str) -> list:
+    """
+    Returns the numbers in a question, in order, as floats.
+    """
+    return [float(number) for number in NUMBER_PATTERN.findall(TAG_PATTERN.sub(" ", str(text)))]
+
+
+def same_question(question: str, stored_question: str) -> bool:
+    """
+    Returns True if two questions have the same normalised text and the same numbers.
+
+    Questions that differ only in their values ("5 kg" and "7 kg") embed almost identically,
+    so the embedding similarity alone cannot tell that the stored files would be wrong.
+    """
+    return numeric_tokens(question) == numeric_tokens(stored_question) and normalise_question(question) == normalise_question(stored_question)
+
+
+def find_reusable_artifacts(question: str, api_key: str, csv_path: str, **options):
+    """
+    Looks for a dataset question that is nearly identical to `question` and returns its stored files.
+
+    Parameters:
+    question (str): The incoming question.
+    api_key (str): API key for the service.
+    csv_path (str): Path to the example dataset with precomputed embeddings.
+    **options: Overrides of REUSE_OPTIONS.
+
+    Returns:
+    dict: {"similarity", "metadata" (the stored info.json as a dict), "files" ({file name: content})},
+          or None when no row is similar enough, its text or numbers differ, or it lacks question.html or a valid info.json.
+    """
+    options = {**REUSE_OPTIONS, **options}
+    if options["threshold"] is None:
+        return None
+    dataframe, labels, matrix = dataset_matrix(csv_path, options["embedding_column"])
+    if not labels or options["text_column"] not in dataframe.columns:
+        return None
+    embedding = embed_texts([str(question)], api_key, options["embedding_model"])[0]
+    if matrix.shape[1] != embedding.shape[0]:
+        return None
+    similarities = matrix @ embedding
+    # Only a row above the threshold whose text and numbers match is the same question
+    row, similarity = None, None
+    for index in similarities.argsort()[::-1]:
+        if similarities[index] < options["threshold"]:
+            break
+        candidate = dataframe.loc[labels[index]]
+        if same_question(question, candidate[options["text_column"]]):
+            row, similarity = candidate, float(similarities[index])
+            break
+        print(f"Stored question with similarity {similarities[index]:.3f} differs in its text or values, not reusing it")
+    if row is None:
+        return None
+
+    files = {
+        column: row[column] for column in options["artifact_columns"]
+        if column in row.index and isinstance(row[column], str) and row[column].strip()
+    }
+    try:
+        metadata = json.loads(row["info.json"])
+    except (KeyError, TypeError, ValueError):
+        metadata = None
+    if "question.html" not in files or not isinstance(metadata, dict):
+        print(f"Found a stored question with similarity {similarity:.3f}, but its files are incomplete; generating instead")
+        return None
+    return {"similarity": similarity, "metadata": metadata, "files": files}
+
+
+def rewrite_metadata(metadata: dict, title: str, created_by: str, code_language: str) -> dict:
+    """
+    Returns a copy of stored metadata that identifies the new question: a fresh uuid, the new title and author.
+
+    Parameters:
+    metadata (dict): The stored info.json.
+    title (str): The title of the new question.
+    created_by (str): The identifier for who created the question.
+    code_language (str): The code language associated with the question.
+
+    Returns:
+    dict: The rewritten metadata.
+    """
+    return {
+        **metadata,
+        "uuid": str(uuid.uuid4()),
+        "title": title,
+        "createdBy": created_by,
+        "updatedBy": "",
+        "codelang": code_language,
+    }
+
+
+@instrument("reuse")
+def reuse_artifacts(question: str, config: dict, export_path: str) -> bool:
+    """
+    Exports the stored files of a nearly identical dataset question instead of generating new ones.
+
+    The files are written as stored; only info.json is rewritten. They are copied
+    directly, without the export agent, so a reused question makes no completion calls.
+
+    Parameters:
+    question (str): The incoming question.
+    config (dict): The configuration dictionary.
+    export_path (str): Where the question folder is created.
+
+    Returns:
+    bool: True if the question was exported from stored files, False if it has to be generated.
+    """
+    try:
+        match = find_reusable_artifacts(question, config['api_key'], config['csv_file'], threshold=config['reuse_threshold'])
+    except Exception as e:
+        print(f"Could not look for stored files to reuse: {e}")
+        return False
+    if match is None:
+        return False
+
+    stored_title = match["metadata"].get("title") or "reused_question"
+    question_path = create_folder(stored_title, export_path)
+    if question_path is None:
+        return False
+    metadata = rewrite_metadata(match["metadata"], os.path.basename(question_path), config['created_by'], config['code_language'])
+    files = {**match["files"], "info.json": json.dumps(metadata, indent=4)}
+    for file_name, content in files.items():
+        with open(os.path.join(question_path, file_name), "w", encoding="utf-8") as file:
+            file.write(content)
+
+    print(f"Reused the stored files of '{stored_title}' (similarity {match['similarity']:.3f}) for {question_path}")
+    get_tracer().set_attribute("reused_from", stored_title)
+    get_telemetry().increment("artifacts_reused")
+    return True
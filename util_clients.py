@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+from util_lazy_import import lazy_import
+from util_request_governor import get_governor
+from util_telemetry import cached_prompt_tokens, get_telemetry
+from util_tracing import get_tracer
+
+# The SDKs take most of the start up time, so they load when the first client is built
+httpx = lazy_import("httpx")
+requests = lazy_import("requests")
+openai = lazy_import("openai")
+langchain_openai = lazy_import("langchain_openai")
+
+# Connection pool settings shared by every client handed out by this module
+POOL_OPTIONS = {
+    "max_connections": 64,
+    "max_keepalive_connections": 32,
+    "keepalive_expiry": 120.0,
+}
+TIMEOUT_OPTIONS = {
+    "timeout": 600.0,
+    "connect": 10.0,
+}
+
+
+class MeteredStream:
+    """
+    A streamed chat completion that records its llm_call stage, span and token usage
+    once it is exhausted or closed, so the time spent reading the body is counted.
+
+    Streamed responses carry no usage block, so the prompt and completion tokens are
+    estimated from the request messages and the text received.
+    """
+
+    def __init__(self, stream, name: str, model: str, stage: str, messages: list, span, start: float):
+        self._stream = stream
+        self._name = name
+        self._model = model
+        self._stage = stage
+        self._messages = messages
+        self._span = span
+        self._start = start
+        self._parts = []
+        self._recorded = False
+        self._lock = threading.Lock()
+
+    def _record(self, ok: bool):
+        with self._lock:
+            if self._recorded:
+                return
+            self._recorded = True
+        from util_example_based_prompt import estimate_tokens
+
+        prompt_tokens = estimate_tokens("".join(str(message.get("content") or "") for message in self._messages))
+        completion_tokens = estimate_tokens("".join(self._parts))
+        self._span.attributes.update(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cached_tokens=0)
+        self._span.end(ok)
+        telemetry = get_telemetry()
+        telemetry.record_stage(self._name, time.perf_counter() - self._start, ok)
+        telemetry.record_tokens(prompt_tokens, completion_tokens, model=self._model, stage=self._stage)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            chunk = next(self._stream)
+        except StopIteration:
+            self._record(True)
+            raise
+        except BaseException:
+            self._record(False)
+            raise
+        for choice in getattr(chunk, "choices", None) or []:
+            content = getattr(choice.delta, "content", None)
+            if content:
+                self._parts.append(content)
+        return chunk
+
+    def close(self):
+        """
+        Closes the stream, releasing its governor slot, and records what was received.
+        """
+        try:
+            self._stream.close()
+        finally:
+            self._record(True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            self._stream.close()
+        finally:
+            self._record(exc_type is None)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class GovernedResource:
+    """
+    Wraps an OpenAI API resource (chat completions, embeddings) so every create()
+    call is admitted, retried and backed off by the shared request governor, and its
+    latency and token usage are recorded by the pipeline telemetry.
+    """
+
+    def __init__(self, resource):
+        self._resource = resource
+
+    def create(self, **kwargs):
+        model = kwargs.get("model")
+        telemetry = get_telemetry()
+        stage = telemetry.current_stage()
+        if kwargs.get("stream"):
+            return self._open_stream(model, stage, kwargs)
+        with telemetry.stage(f"llm_call:{model}"):
+            response = get_governor().call(model, self._resource.create, **kwargs)
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                get_tracer().set_attribute("prompt_tokens", usage.prompt_tokens)
+                get_tracer().set_attribute("completion_tokens", usage.completion_tokens)
+                get_tracer().set_attribute("cached_tokens", cached_prompt_tokens(usage))
+        telemetry.record_usage(response, model=model, stage=stage)
+        return response
+
+    def _open_stream(self, model: str, stage: str, kwargs: dict) -> MeteredStream:
+        name = f"llm_call:{model}"
+        start = time.perf_counter()
+        with get_tracer().span(name) as span:
+            try:
+                # The governor slot is held until the caller exhausts or closes the stream
+                stream = get_governor().open_stream(model, self._resource.create, **kwargs)
+            except Exception:
+                get_telemetry().record_stage(name, time.perf_counter() - start, ok=False)
+                raise
+        return MeteredStream(stream, name, model, stage, kwargs.get("messages") or [], span, start)
+
+    def __getattr__(self, name):
+        return getattr(self._resource, name)
+
+
+class GovernedOpenAI:
+    """
+    An OpenAI client whose chat completions and embeddings go through the request governor.
+    Retries are left to the governor, so the underlying client never retries on its own.
+    """
+
+    def __init__(self, client: openai.OpenAI):
+        self._client = client
+        self.chat = SimpleNamespace(completions=GovernedResource(client.chat.completions))
+        self.embeddings = GovernedResource(client.embeddings)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+_lock = threading.RLock()
+_http_client = None
+_requests_session = None
+_openai_clients = {}
+_chat_models = {}
+_embedding_models = {}
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Returns the process-wide httpx client used underneath every OpenAI client.
+
+    The client keeps connections alive between calls so the TLS handshake is paid
+    once per connection instead of once per generation stage.
+
+    Returns:
+    httpx.Client: The shared HTTP client.
+    """
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                limits=httpx.Limits(**POOL_OPTIONS),
+                timeout=httpx.Timeout(TIMEOUT_OPTIONS["timeout"], connect=TIMEOUT_OPTIONS["connect"]),
+            )
+        return _http_client
+
+
+def get_requests_session() -> requests.Session:
+    """
+    Returns the process-wide requests session for endpoints called without the OpenAI SDK.
+
+    Returns:
+    requests.Session: A session with a pooled, keep-alive HTTPS adapter mounted.
+    """
+    global _requests_session
+    with _lock:
+        if _requests_session is None:
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_OPTIONS["max_keepalive_connections"],
+                pool_maxsize=POOL_OPTIONS["max_connections"],
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _requests_session = session
+        return _requests_session
+
+
+def get_openai_client(api_key: str) -> GovernedOpenAI:
+    """
+    Returns the shared OpenAI client for the given API key.
+
+    Parameters:
+    api_key (str): API key for the service.
+
+    Returns:
+    GovernedOpenAI: A client bound to the shared connection pool and the request governor.
+    """
+    with _lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            client = GovernedOpenAI(openai.OpenAI(api_key=api_key, http_client=get_http_client(), max_retries=0))
+            _openai_clients[api_key] = client
+        return client
+
+
+def get_chat_model(model: str, api_key: str, temperature=0.7) -> langchain_openai.ChatOpenAI:
+    """
+    Returns the shared LangChain chat model for a (model, key, temperature) combination.
+
+    Parameters:
+    model (str): The name of the chat model.
+    api_key (str): API key for the service.
+    temperature (float or str): Sampling temperature for the model.
+
+    Returns:
+    ChatOpenAI: A chat model whose requests go through the shared, governed OpenAI client.
+    """
+    key = (model, api_key, float(temperature))
+    with _lock:
+        llm = _chat_models.get(key)
+        if llm is None:
+            llm = langchain_openai.ChatOpenAI(
+                model=model,
+                api_key=api_key,
+                temperature=float(temperature),
+                client=get_openai_client(api_key).chat.completions,
+            )
+            _chat_models[key] = llm
+        return llm
+
+
+def get_embeddings_model(api_key: str, model: str = "text-embedding-ada-002") -> langchain_openai.OpenAIEmbeddings:
+    """
+    Returns the shared LangChain embeddings model for the given key.
+
+    Parameters:
+    api_key (str): API key for the service.
+    model (str): The name of the embedding model.
+
+    Returns:
+    OpenAIEmbeddings: An embeddings model whose requests go through the shared, governed OpenAI client.
+    """
+    key = (model, api_key)
+    with _lock:
+        embeddings = _embedding_models.get(key)
+        if embeddings is None:
+            embeddings = langchain_openai.OpenAIEmbeddings(
+                model=model,
+                api_key=api_key,
+                client=get_openai_client(api_key).embeddings,
+            )
+            _embedding_models[key] = embeddings
+        return embeddings
+
+
+def close_clients():
+    """
+    Closes the shared connection pools and forgets every cached client.
+    """
+    global _http_client, _requests_session
+    with _lock:
+        if _http_client is not None:
+            _http_client.close()
+        if _requests_session is not None:
+            _requests_session.close()
+        _http_client = None
+        _requests_session = None
+        _openai_clients.clear()
+        _chat_models.clear()
+        _embedding_models.clear()
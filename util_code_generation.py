@@ -3,20 +3,21 @@ from typing import List, Optional, Union, Type
 import logging
 
 from langchain.chains import LLMChain
-from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 from langchain.tools import BaseTool
-from openai import OpenAI
 
 
 # My Module Imports
 from util_example_based_prompt import ExampleBasedPromptFormatter
 from util_semantic_search import CSVDataHandler, SemanticSearch
+from util_clients import get_chat_model, get_openai_client
+from util_telemetry import instrument
 import asyncio
 from langchain_core.output_parsers import StrOutputParser
 from util_validation import validate_question_html_format
 from util_javascript_generator import js_generator
 from util_string_extraction import extract_javascript_generate_code
+from util_streaming import stream_until_fence
 output_parser = StrOutputParser()
 
 class PromptFormatterFromRepository():
@@ -33,8 +34,9 @@ class PromptFormatterFromRepository():
         "embedding_model": str
     }
     
-    def __init__(self, api_key: str, csv_path: str, example_options: dict, llm_options: dict,prompt):
+    def __init__(self, api_key: str, csv_path: str, example_options: dict, llm_options: dict,prompt, stream_fence: str = None):
         # super().__init__()  # Call this only if inheriting from another class
+        # stream_fence: a util_streaming.FENCE_LANGUAGES key; the completion is streamed and cut off after that block
 
         self._validate_options(example_options, self.EXAMPLE_OPTIONS_STRUCTURE, "Example Options")
         self._validate_options(llm_options, self.LLM_OPTIONS_STRUCTURE, "LLM Options")
@@ -44,6 +46,7 @@ class PromptFormatterFromRepository():
         self.example_options = example_options
         self.llm_options = llm_options
         self.prompt = prompt
+        self.stream_fence = stream_fence
 
         self.data_handler = CSVDataHandler(csv_path=self.csv_path, embedding_column_name=self.example_options["embedding_column"])
         self.semantic_search_instance = SemanticSearch(csv_path=self.csv_path, embedding_column_name=self.example_options["embedding_column"], embedding_engine=self.llm_options["embedding_model"],api_key=self.api_key)
@@ -70,11 +73,14 @@ class PromptFormatterFromRepository():
         combined_prompt = f"{prompt}\ninput: {{input}}"
         prompt_instance = PromptTemplate(template=combined_prompt, input_variables=["input"])
         
-        LLM = ChatOpenAI(
-            model=self.llm_options["llm_model"],
-            temperature=self.llm_options["temperature"],
-            openai_api_key=self.api_key  # Assuming API key is used here
+        LLM = get_chat_model(
+            self.llm_options["llm_model"],
+            self.api_key,
+            temperature=self.llm_options["temperature"]
         )
+        if self.stream_fence:
+            text = stream_until_fence(LLM, prompt_instance.format(input=input_question), self.stream_fence)
+            return {"input": input_question, "text": text}
 
         chain = LLMChain(
             llm=LLM,
@@ -109,6 +115,7 @@ class PromptFormatterFromRepository():
             return response["text"]
     
 
+@instrument("question_html")
 def builder_question_html(question:str,api_key:str,csv_path:str):
     example_options = {
         "embedding_column": "question_embedding",
@@ -132,6 +139,7 @@ def builder_question_html(question:str,api_key:str,csv_path:str):
 
 
 
+@instrument("server_js")
 def builder_server_js(question_html, api_key, csv_path, solution_guide=None, external_data=None):
     example_options = {
         "embedding_column": "question_embedding",
@@ -158,11 +166,11 @@ def builder_server_js(question_html, api_key, csv_path, solution_guide=None, ext
                     "// External Data Integration:\n"
                     "// If required, import external data properties or insert placeholder values as applicable.\n")
 
-    base_template = f"""
+    base_template = """
         Design a robust JavaScript module adept at generating computational problems for various STEM disciplines. This module will ingest an HTML file containing a structured query and will output a JavaScript snippet that carries out the calculation for the problem described. The JavaScript code must conform to the following outline:
 
         const generate = () => {{
-            {data_section}
+            // External Data Integration: follow the notes after this outline.
             // 1. Dynamic Parameter Selection:
             // - Thoroughly analyze the HTML or data source to identify an extensive range of categories and units for computation.
             // - Ensure the inclusion of a wide variety of units and values, covering different global measurement systems.
@@ -202,11 +210,13 @@ def builder_server_js(question_html, api_key, csv_path, solution_guide=None, ext
         
         ```insert code here```
         """
-    prompt = guide_section + base_template
+    # Static instructions first so the prompt prefix is identical across questions
+    prompt = base_template + guide_section + data_section
 
-    code_generator = PromptFormatterFromRepository(api_key=api_key, csv_path=csv_path, example_options=example_options, llm_options=llm_options, prompt=prompt)
+    code_generator = PromptFormatterFromRepository(api_key=api_key, csv_path=csv_path, example_options=example_options, llm_options=llm_options, prompt=prompt, stream_fence="javascript")
     
     return asyncio.run(code_generator._arun(question_html))
+@instrument("server_py")
 def builder_server_py(question_html, api_key, csv_path, solution_guide=None, external_data=None):
     example_options = {
         "embedding_column": "question_embedding",
@@ -237,11 +247,11 @@ def builder_server_py(question_html, api_key, csv_path, solution_guide=None, ext
         data_section = "# External Data Integration:\n" \
                        "# If required, import external data properties or insert placeholder values as applicable.\n"
 
-        base_template = f"""
+    base_template = """
         Develop a Python module skilled in generating computational problems for various STEM disciplines. This module will process a structured query and will output a Python dictionary containing the parameters and solutions to the problem. Adhere to the following structure in the Python function:
 
         def generate_problem():
-            {data_section}
+            # External Data Integration: follow the notes after this outline.
             # Initialize the data dictionary to store parameters and answers
             data = {{'params': {{}}, 'correct_answers': {{}}}}
 
@@ -271,7 +281,8 @@ def builder_server_py(question_html, api_key, csv_path, solution_guide=None, ext
         Your responsibility is to complete the 'generate_problem' function following this framework. It must dynamically select parameters and units, perform transformations, generate values, and calculate a correct solution. The function should return a dictionary with 'params' and 'correct_answers' keys, abiding by the outlined structure. This methodology ensures a cohesive link between the structured query and the Python computation. Below is an illustration of how it might be implemented:
         """
 
-    prompt = guide_section + base_template
+    # Static instructions first so the prompt prefix is identical across questions
+    prompt = base_template + guide_section + data_section
 
     code_generator = PromptFormatterFromRepository(api_key=api_key, csv_path=csv_path, example_options=example_options, llm_options=llm_options, prompt=prompt)
     
@@ -299,7 +310,7 @@ def improve_solution(solution_html: str, code_reference:str,api_key:str,MODEL:st
     enhancement of user interaction, and ensuring clarity within the guide. The result is an updated
     HTML code that should be effectively integrated with the provided code snippet.
     """
-    client = OpenAI(api_key=api_key)
+    client = get_openai_client(api_key)
     
     prompt = f"""
         Given the current HTML module for STEM problem-solving, your task is to enhance it using the provided code as a foundational guide. This code is designed to dynamically generate problem parameters and their correct answers. Your objective is to integrate these elements into the HTML solution guide effectively.
@@ -329,6 +340,7 @@ def improve_solution(solution_html: str, code_reference:str,api_key:str,MODEL:st
 
 
 
+@instrument("solution_html")
 def builder_solution_html(question_html, api_key, csv_path, solution_guide=None,code_reference=None):
     example_options = {
         "embedding_column": "question_embedding",
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter, Language
+from langchain_community.document_loaders.generic import GenericLoader
+from langchain_community.document_loaders.parsers import LanguageParser
+from langchain_community.vectorstores import Chroma
+
+from util_clients import get_embeddings_model
+from util_telemetry import get_telemetry
+
+# How the stable_properties code base is split and where its index is kept
+CODE_INDEX_OPTIONS = {
+    "source_path": "stable_properties",
+    "suffixes": [".js"],
+    "exclude": ["steam_tables_compiled.js"],  # Generated data module; its helpers are found through the symbol index
+    "persist_directory": os.path.join("db", "stable_properties_index"),
+    "collection_name": "stable_properties",
+    "chunk_size": 500,
+    "chunk_overlap": 200,
+    "embedding_model": "text-embedding-ada-002",
+}
+FINGERPRINT_FILE = "fingerprint.json"
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def source_fingerprint(options: dict) -> str:
+    """
+    Hashes the indexed source files together with the settings that shape the index.
+
+    Parameters:
+    options (dict): Code index options, see CODE_INDEX_OPTIONS.
+
+    Returns:
+    str: A hex digest that changes whenever a source file, the chunking or the embedding model changes.
+    """
+    digest = hashlib.sha256()
+    for key in ("suffixes", "exclude", "chunk_size", "chunk_overlap", "embedding_model", "collection_name"):
+        digest.update(f"{key}={options[key]};".encode())
+    for name in sorted(os.listdir(options["source_path"])):
+        path = os.path.join(options["source_path"], name)
+        if os.path.isfile(path) and os.path.splitext(name)[1] in options["suffixes"] and name not in options["exclude"]:
+            digest.update(name.encode())
+            with open(path, "rb") as file:
+                digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
+
+
+def _stored_fingerprint(persist_directory: str) -> str:
+    try:
+        with open(os.path.join(persist_directory, FINGERPRINT_FILE)) as file:
+            return json.load(file).get("fingerprint")
+    except (OSError, ValueError):
+        return None
+
+
+def _build_index(options: dict, embeddings, fingerprint: str) -> Chroma:
+    """
+    Loads, splits and embeds the source files into a fresh persisted Chroma collection.
+    """
+    persist_directory = options["persist_directory"]
+    if os.path.isdir(persist_directory):
+        shutil.rmtree(persist_directory)
+    os.makedirs(persist_directory)
+
+    loader = GenericLoader.from_filesystem(
+        path=options["source_path"],
+        glob="*",
+        suffixes=options["suffixes"],
+        exclude=options["exclude"],
+        parser=LanguageParser(language=Language.JS)
+    )
+    documents = loader.load()
+    code_splitter = RecursiveCharacterTextSplitter.from_language(
+        language=Language.JS, chunk_size=options["chunk_size"], chunk_overlap=options["chunk_overlap"]
+    )
+    texts = code_splitter.split_documents(documents)
+    db = Chroma.from_documents(
+        texts,
+        embeddings,
+        collection_name=options["collection_name"],
+        persist_directory=persist_directory,
+    )
+    db.persist()
+    with open(os.path.join(persist_directory, FINGERPRINT_FILE), "w") as file:
+        json.dump({"fingerprint": fingerprint, "chunks": len(texts)}, file)
+    print(f"Built code index for {options['source_path']} ({len(texts)} chunks) in {persist_directory}")
+    return db
+
+
+def load_code_index(api_key: str, **options) -> Chroma:
+    """
+    Returns the vector index over the stable_properties code base, building it only when needed.
+
+    The index is persisted on disk next to a fingerprint of the source files. It is
+    reused as long as the fingerprint matches and rebuilt (re-embedding every chunk)
+    only after a source file or an index setting changes. Within a process the
+    loaded index is kept in memory.
+
+    Parameters:
+    api_key (str): API key for the embeddings service.
+    **options: Overrides for CODE_INDEX_OPTIONS.
+
+    Returns:
+    Chroma: The vector store holding the embedded code chunks.
+    """
+    options = {**CODE_INDEX_OPTIONS, **options}
+    fingerprint = source_fingerprint(options)
+    key = (os.path.abspath(options["persist_directory"]), options["collection_name"], fingerprint)
+    with _lock:
+        db = _indexes.get(key)
+        if db is not None:
+            return db
+
+        embeddings = get_embeddings_model(api_key, model=options["embedding_model"])
+        if _stored_fingerprint(options["persist_directory"]) == fingerprint:
+            get_telemetry().increment("cache_hits")
+            db = Chroma(
+                collection_name=options["collection_name"],
+                embedding_function=embeddings,
+                persist_directory=options["persist_directory"],
+            )
+        else:
+            get_telemetry().increment("cache_misses")
+            with get_telemetry().stage("code_index_build"):
+                db = _build_index(options, embeddings, fingerprint)
+        _indexes[key] = db
+        return db
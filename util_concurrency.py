@@ -0,0 +1,78 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+# Concurrent calls a single fan-out may have in flight; the request governor still applies per model limits
+DEFAULT_MAX_WORKERS = 4
+
+
+class ItemError:
+    """
+    Stands in for the result of an item whose call raised, so one failure does not lose the batch.
+
+    Attributes:
+        item: The input the call was made with.
+        error (Exception): The exception it raised.
+    """
+
+    def __init__(self, item, error: Exception):
+        self.item = item
+        self.error = error
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return f"ItemError({self.item!r}, {self.error!r})"
+
+
+def map_ordered(fn, items, max_workers: int = DEFAULT_MAX_WORKERS) -> list:
+    """
+    Calls `fn(item)` for every item concurrently and returns the results in input order.
+
+    Each call runs in a copy of the caller's context, so telemetry stages and trace
+    spans nest under the caller. An exception is caught per item and returned as an
+    ItemError in that item's position.
+
+    Parameters:
+    fn (callable): The function to call for each item.
+    items (iterable): The inputs.
+    max_workers (int): Maximum number of concurrent calls.
+
+    Returns:
+    list: The result (or ItemError) for each item, in the order of `items`.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item):
+        try:
+            return fn(item)
+        except Exception as e:
+            return ItemError(item, e)
+
+    if max_workers <= 1 or len(items) == 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="fanout") as executor:
+        futures = [executor.submit(contextvars.copy_context().run, call, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def successful(results: list, label: str = "item") -> list:
+    """
+    Drops the ItemError entries of a map_ordered result, printing each failure.
+
+    Parameters:
+    results (list): The results returned by map_ordered.
+    label (str): How to describe an item in the failure message.
+
+    Returns:
+    list: The successful results, in order.
+    """
+    kept = []
+    for result in results:
+        if isinstance(result, ItemError):
+            print(f"Skipping {label} {result.item!r}: {result.error}")
+        else:
+            kept.append(result)
+    return kept
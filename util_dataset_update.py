@@ -1,9 +1,10 @@
 import ast
-from openai import OpenAI
 import pandas as pd
 import os 
 import datetime
 
+from util_clients import get_openai_client
+
 class QuestionProcessor:
     def __init__(self, model_name:str, embedding_model:str,api_key:str):
         """
@@ -16,7 +17,7 @@ class QuestionProcessor:
         Returns:
         - None
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = model_name
         self.embedding_model = embedding_model
 
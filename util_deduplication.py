@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+
+from util_lazy_import import lazy_import
+
+from util_clients import get_openai_client
+from util_telemetry import get_telemetry, instrument
+
+np = lazy_import("numpy")
+
+# Default behaviour of the de-duplication stage run before questions are generated
+DEDUPLICATION_OPTIONS = {
+    "threshold": 0.95,
+    "embedding_model": "text-embedding-ada-002",
+    "embedding_column": "question_embedding",
+    "compare_dataset": True,
+}
+
+# Normalised embedding matrices of the example datasets, keyed by the identity of the cached dataframe
+_dataset_matrices = {}
+_dataset_matrices_lock = threading.Lock()
+
+
+def _normalise(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def embed_texts(texts: list, api_key: str, model: str = DEDUPLICATION_OPTIONS["embedding_model"]) -> np.ndarray:
+    """
+    Embeds several texts with a single embeddings request.
+
+    Parameters:
+    texts (list): The texts to embed.
+    api_key (str): API key for the service.
+    model (str): The embedding model.
+
+    Returns:
+    np.ndarray: One unit length row per text, in the order of `texts`.
+    """
+    if not texts:
+        return np.zeros((0, 0))
+    with get_telemetry().stage("embed"):
+        response = get_openai_client(api_key).embeddings.create(input=list(texts), model=model)
+    rows = sorted(response.data, key=lambda item: item.index)
+    return _normalise(np.array([row.embedding for row in rows], dtype=float))
+
+
+def dataset_matrix(csv_path: str, embedding_column: str = DEDUPLICATION_OPTIONS["embedding_column"]):
+    """
+    Returns the example dataset together with its embeddings as one normalised matrix.
+
+    Parameters:
+    csv_path (str): Path to the example dataset with precomputed embeddings.
+    embedding_column (str): The column holding the embeddings.
+
+    Returns:
+    tuple: (dataframe, labels, matrix) where row i of `matrix` is the embedding of the
+           dataframe row labelled `labels[i]`. Rows without an embedding are left out.
+    """
+    from util_semantic_search import CSVDataHandler
+
+    dataframe = CSVDataHandler(csv_path, embedding_column).dataframe()
+    key = (id(dataframe), embedding_column)
+    with _dataset_matrices_lock:
+        cached = _dataset_matrices.get(key)
+        if cached is None or cached[0] is not dataframe:
+            if embedding_column not in dataframe.columns:
+                raise ValueError(f"'{embedding_column}' is not a valid column name in the DataFrame.")
+            rows = [(label, value) for label, value in dataframe[embedding_column].items() if isinstance(value, list)]
+            labels = [label for label, _ in rows]
+            matrix = _normalise(np.array([value for _, value in rows], dtype=float)) if rows else np.zeros((0, 0))
+            cached = (dataframe, labels, matrix)
+            _dataset_matrices[key] = cached
+    return cached
+
+
+@instrument("deduplication")
+def deduplicate_questions(questions_to_process: list, api_key: str, csv_path: str, protected: int = 1, **options) -> list:
+    """
+    Drops questions that are near-identical to an earlier question or to a question in the example dataset.
+
+    All questions are embedded in one request. Going through them in order, a question
+    is dropped when its cosine similarity to a question already kept, or to any dataset
+    row, exceeds the threshold. The first `protected` entries (the operator's own
+    question) are always kept and only serve as comparison.
+
+    Parameters:
+    questions_to_process (list): A list of tuples containing questions and solutions.
+    api_key (str): API key for the service.
+    csv_path (str): Path to the example dataset with precomputed embeddings.
+    protected (int): Number of leading entries that are never dropped.
+    **options: Overrides of DEDUPLICATION_OPTIONS.
+
+    Returns:
+    list: The questions that were kept, in their original order.
+    """
+    options = {**DEDUPLICATION_OPTIONS, **options}
+    if len(questions_to_process) <= protected or options["threshold"] is None:
+        return questions_to_process
+
+    try:
+        embeddings = embed_texts([str(question) for question, _ in questions_to_process], api_key, options["embedding_model"])
+        dataset = dataset_matrix(csv_path, options["embedding_column"])[2] if options["compare_dataset"] else None
+    except Exception as e:
+        print(f"De-duplication skipped: {e}")
+        return questions_to_process
+
+    threshold = options["threshold"]
+    kept = list(range(protected))
+    for index in range(protected, len(questions_to_process)):
+        embedding = embeddings[index]
+        similarity_to_kept = float(np.max(embeddings[kept] @ embedding)) if kept else 0.0
+        if similarity_to_kept > threshold:
+            print(f"Dropping question {index + 1}, it duplicates an earlier question (similarity {similarity_to_kept:.3f})")
+            continue
+        if dataset is not None and len(dataset) and dataset.shape[1] == embedding.shape[0]:
+            similarity_to_dataset = float(np.max(dataset @ embedding))
+            if similarity_to_dataset > threshold:
+                print(f"Dropping question {index + 1}, it duplicates a question in the dataset (similarity {similarity_to_dataset:.3f})")
+                continue
+        kept.append(index)
+
+    dropped = len(questions_to_process) - len(kept)
+    if dropped:
+        get_telemetry().increment("duplicates_dropped", dropped)
+    return [questions_to_process[index] for index in kept]
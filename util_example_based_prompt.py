@@ -1,11 +1,87 @@
 # Standard Library Imports
 from typing import List, Optional, Union, Type
 import logging
+import os
 import sys
 import re
+import threading
 
 from util_semantic_search import SemanticSearch
-import pandas as pd
+from util_telemetry import get_telemetry, instrument
+from util_lazy_import import lazy_import
+from util_string_extraction import extract_generate_function
+
+pd = lazy_import("pandas")
+
+# Rough token estimate used for budgeting, close enough for English text and code with the GPT tokenizers
+CHARS_PER_TOKEN = 4
+# Prompt budgets in tokens per generation stage
+PROMPT_BUDGETS = {
+    "question_html": 5000,
+    "server_js": 10000,
+    "solution_html": 10000,
+    "code_guide": 1500,
+}
+# An example whose output would have to be cut below this many tokens is left out instead
+MIN_EXAMPLE_TOKENS = 200
+TRUNCATION_MARKER = "\n... [truncated]"
+
+# Bump whenever the rendering of an example block changes, so cached and stored blocks are not reused
+FORMATTER_VERSION = 1
+
+# Rendered example blocks keyed by (dataset, row id, search column, output column, formatter version)
+_rendered_examples = {}
+_rendered_examples_lock = threading.Lock()
+
+
+def rendered_column_name(search_column: str, output_column: str) -> str:
+    """
+    Returns the dataset column that stores the rendered example blocks for a search and output column.
+    """
+    return f"rendered[{search_column}->{output_column}]v{FORMATTER_VERSION}"
+
+
+def rendered_example_key(example: dict):
+    """
+    Returns the cache key of an example returned by SemanticSearch.extract_examples, or None if it has no row id.
+    """
+    if "row_id" not in example:
+        return None
+    return (example.get("source"), example["row_id"], example.get("search_column"), example.get("output_column"), FORMATTER_VERSION)
+
+
+def estimate_tokens(text) -> int:
+    """
+    Estimates the number of tokens of a text without calling a tokenizer.
+
+    Parameters:
+    text (str): The text.
+
+    Returns:
+    int: The estimated token count.
+    """
+    return -(-len(str(text)) // CHARS_PER_TOKEN)
+
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Shortens text to roughly `max_tokens`. JavaScript is first reduced to its generate() function.
+
+    Parameters:
+    text (str): The text or code.
+    max_tokens (int): The token budget.
+
+    Returns:
+    str: The text itself if it fits, otherwise its shortened form.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    generate_function = extract_generate_function(text)
+    if generate_function:
+        text = generate_function
+        if estimate_tokens(text) <= max_tokens:
+            return text
+    return text[:max(0, max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER))] + TRUNCATION_MARKER
 
 
 import re
@@ -66,13 +142,37 @@ class ExampleBasedPromptFormatter:
         """
         formatted_examples = []
         for example in example_set:
-            ExampleBasedPromptFormatter._validate_example(example)
-            if pd.isna(example['output']):
-                example['output'] = "PLACEHOLDER"
-            formatted_example = f"input: {ExampleBasedPromptFormatter._escape_curly_brackets(example['input'])}\noutput: {ExampleBasedPromptFormatter._escape_curly_brackets(str(example['output']).strip())}"
+            # Examples straight from the dataset are rendered once per row and reused
+            if isinstance(example, dict) and isinstance(example.get('rendered'), str):
+                formatted_examples.append(example['rendered'])
+                continue
+            key = rendered_example_key(example) if isinstance(example, dict) else None
+            with _rendered_examples_lock:
+                formatted_example = _rendered_examples.get(key) if key is not None else None
+            if formatted_example is None:
+                formatted_example = ExampleBasedPromptFormatter._render_example(example)
+                if key is not None:
+                    with _rendered_examples_lock:
+                        _rendered_examples[key] = formatted_example
             formatted_examples.append(formatted_example)
         return "\n\n".join(formatted_examples)
 
+    @staticmethod
+    def _render_example(example):
+        """
+        Validates and renders a single example block.
+
+        Args:
+            example (dict): The example dictionary.
+
+        Returns:
+            str: The example block with curly brackets escaped.
+        """
+        ExampleBasedPromptFormatter._validate_example(example)
+        if pd.isna(example['output']):
+            example['output'] = "PLACEHOLDER"
+        return f"input: {ExampleBasedPromptFormatter._escape_curly_brackets(example['input'])}\noutput: {ExampleBasedPromptFormatter._escape_curly_brackets(str(example['output']).strip())}"
+
     @staticmethod
     def _escape_curly_brackets(text):
         """
@@ -86,6 +186,37 @@ class ExampleBasedPromptFormatter:
         """
         return re.sub(r'(?<!\{)\{(?!\{)', '{{', re.sub(r'(?<!\})\}(?!\})', '}}', text))
 
+    @staticmethod
+    def store_rendered_examples(csv_path, column_pairs, output_path):
+        """
+        Renders the example block of every row once and writes a copy of the dataset with it as
+        an extra column, so prompt assembly for examples from that copy only joins stored strings.
+
+        Args:
+            csv_path (str): Path to the example dataset.
+            column_pairs (list): (search_column, output_column) pairs to render, e.g. [("question", "question.html")].
+            output_path (str): Where to write the copy; it must not be `csv_path`, the shared dataset is never overwritten.
+
+        Returns:
+            pd.DataFrame: The dataset with the rendered columns added.
+
+        Raises:
+            ValueError: If `output_path` is the dataset itself.
+        """
+        if os.path.abspath(output_path) == os.path.abspath(csv_path):
+            raise ValueError(f"Refusing to overwrite the example dataset {csv_path}, write the rendered copy to another path.")
+        dataframe = pd.read_csv(csv_path)
+        for search_column, output_column in column_pairs:
+            rendered = []
+            for search_value, output_value in zip(dataframe[search_column], dataframe[output_column]):
+                if isinstance(search_value, str) and isinstance(output_value, str):
+                    rendered.append(ExampleBasedPromptFormatter._render_example({'input': search_value, 'output': output_value}))
+                else:
+                    rendered.append(None)
+            dataframe[rendered_column_name(search_column, output_column)] = rendered
+        dataframe.to_csv(output_path, index=False)
+        return dataframe
+
     @staticmethod
     def _generate_prompt(formatted_example, template_text):
         """
@@ -101,18 +232,72 @@ class ExampleBasedPromptFormatter:
         return [f"{ExampleBasedPromptFormatter._escape_curly_brackets(template_text)}\n{formatted_example}\n"]
 
     @staticmethod
-    def run(examples, template_text):
+    def _fit_to_budget(examples, template_text, token_budget):
+        """
+        Shortens or leaves out examples so the template and examples fit the token budget.
+
+        Examples are kept in their retrieval order, so the most similar ones are kept whole
+        first. An output that does not fit is reduced to its generate() function if it is
+        JavaScript, then truncated. An example that would keep fewer than MIN_EXAMPLE_TOKENS
+        of its output is left out.
+
+        Args:
+            examples (list): A list of example dictionaries.
+            template_text (str): The template text for prompt generation.
+            token_budget (int): The token budget of template and examples together.
+
+        Returns:
+            tuple: (examples that fit, report dict with "budget", "original_tokens",
+                   "final_tokens", "trimmed_examples" and "dropped_examples").
+        """
+        remaining = token_budget - estimate_tokens(template_text)
+        report = {"budget": token_budget, "original_tokens": estimate_tokens(template_text), "final_tokens": estimate_tokens(template_text), "trimmed_examples": 0, "dropped_examples": 0}
+        fitted = []
+        for example in examples:
+            if not isinstance(example, dict) or not isinstance(example.get('output'), str) or not isinstance(example.get('input'), str):
+                fitted.append(example)
+                continue
+            input_tokens = estimate_tokens(example['input'])
+            output_tokens = estimate_tokens(example['output'])
+            report["original_tokens"] += input_tokens + output_tokens
+            available = remaining - input_tokens
+            if output_tokens <= available:
+                output = example['output']
+            elif available >= MIN_EXAMPLE_TOKENS:
+                output = trim_to_tokens(example['output'], available)
+                report["trimmed_examples"] += 1
+                # A shortened example no longer matches its cached rendering
+                example = {key: value for key, value in example.items() if key not in ('row_id', 'rendered')}
+            else:
+                report["dropped_examples"] += 1
+                continue
+            fitted.append({**example, 'output': output})
+            remaining -= input_tokens + estimate_tokens(output)
+            report["final_tokens"] += input_tokens + estimate_tokens(output)
+        return fitted, report
+
+    @staticmethod
+    @instrument("prompt_formatting")
+    def run(examples, template_text, token_budget=None):
         """
         Main method to run the prompt formatter.
 
         Args:
             examples (list): A list of example dictionaries.
             template_text (str): The template text for prompt generation.
+            token_budget (int, optional): Token budget for template and examples; examples are trimmed to fit.
 
         Returns:
             str: The generated prompt.
         """
         ExampleBasedPromptFormatter._validate_input(examples, template_text)
+        if token_budget is not None:
+            examples, report = ExampleBasedPromptFormatter._fit_to_budget(examples, template_text, token_budget)
+            trimmed_tokens = report["original_tokens"] - report["final_tokens"]
+            if trimmed_tokens > 0:
+                print(f"Prompt trimmed to its {report['budget']} token budget: {report['original_tokens']} -> {report['final_tokens']} estimated tokens, "
+                      f"{report['trimmed_examples']} examples shortened, {report['dropped_examples']} left out")
+                get_telemetry().increment("prompt_tokens_trimmed", trimmed_tokens)
         formatted_examples = ExampleBasedPromptFormatter._format_example_set(examples)
         prompt = ExampleBasedPromptFormatter._generate_prompt(formatted_examples, template_text)
         return prompt[0]
@@ -1,15 +1,29 @@
 import os
-from langchain.agents import initialize_agent
-from langchain_openai import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
-from langchain_community.agent_toolkits import FileManagementToolkit
-from langchain.agents import create_openai_functions_agent, AgentExecutor
+import threading
+from util_clients import get_chat_model
+from util_telemetry import instrument
+from util_tracing import get_tracer
 import asyncio
-# Set up file management tools
-file_tools = FileManagementToolkit(selected_tools=["read_file", "write_file", "list_directory"]).get_tools()
-total_tools = file_tools 
 
-from langchain import hub
+_file_tools = None
+_file_tools_lock = threading.Lock()
+
+
+def get_file_tools():
+    """
+    Returns the file management tools used by the export agent, building them on first use.
+
+    Returns:
+    list: The read_file, write_file and list_directory tools.
+    """
+    global _file_tools
+    with _file_tools_lock:
+        if _file_tools is None:
+            from langchain_community.agent_toolkits import FileManagementToolkit
+
+            _file_tools = FileManagementToolkit(selected_tools=["read_file", "write_file", "list_directory"]).get_tools()
+        return _file_tools
+
 
 
 def create_folder(folder_name, target_path):
@@ -46,6 +60,7 @@ def create_folder(folder_name, target_path):
     return None
 
 
+@instrument("export")
 def export_files(file_name: str, file_content: str, file_location: str, api_key: str, model_name: str):
     """
     Asynchronously exports file content to a specified location with a given file name, using a conversational AI agent.
@@ -61,14 +76,19 @@ def export_files(file_name: str, file_content: str, file_location: str, api_key:
     The output from the conversational AI agent after processing the export command.
     
     """
+    get_tracer().set_attribute("file_name", file_name)
+
+    from langchain.agents import create_openai_functions_agent, AgentExecutor
+    from util_prompt_cache import pull_prompt
+
     # Set up ChatOpenAI parameters
-    llm = ChatOpenAI(temperature=0, model_name=model_name, api_key=api_key)
+    llm = get_chat_model(model_name, api_key, temperature=0)
     
     # Define the tools (replace 'tools' with actual tools)
-    tools = total_tools
+    tools = get_file_tools()
     
     # Get the prompt to use - you can modify this!
-    prompt = hub.pull("hwchase17/openai-functions-agent")
+    prompt = pull_prompt("hwchase17/openai-functions-agent")
 
     # Set up the agent
     agent = create_openai_functions_agent(llm, tools,prompt)
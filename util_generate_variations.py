@@ -1,11 +1,12 @@
 import json
 from pydantic import BaseModel, Field, validator,root_validator
 from typing import List
-from langchain.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
 import os
 
+from util_clients import get_chat_model
+from util_telemetry import instrument
+from util_concurrency import DEFAULT_MAX_WORKERS, ItemError, map_ordered, successful
+
 class QuestionKnownsUnknownsExtractor(BaseModel):
     # The original question from which the information is extracted.
     question: str = Field(description = "This is the original input question")
@@ -52,12 +53,14 @@ class QuestionExtractor:
         }
 
         # Initialize Pydantic parser and LLM
+        from langchain.output_parsers import PydanticOutputParser
+
         self.pydantic_parser = PydanticOutputParser(pydantic_object=QuestionKnownsUnknownsExtractor)
         self.template_string = self._construct_template()
-        self.llm = ChatOpenAI(
-            model=self.LLM_OPTIONS["model"],
-            temperature=self.LLM_OPTIONS["temperature"],
-            api_key=self.api_key)
+        self.llm = get_chat_model(
+            self.LLM_OPTIONS["model"],
+            self.api_key,
+            temperature=self.LLM_OPTIONS["temperature"])
         
     def _construct_template(self):
         """
@@ -101,6 +104,8 @@ class QuestionExtractor:
         Returns:
         dict: Extracted knowns and unknown or None in case of an error.
         """
+        from langchain.prompts import ChatPromptTemplate
+
         format_instructions = self.pydantic_parser.get_format_instructions()
         prompt = ChatPromptTemplate.from_template(template=self.template_string)
         messages = prompt.format_messages(question=question, format_instructions=format_instructions)
@@ -148,6 +153,9 @@ class VariationExtractor(BaseModel):
         if question == question_variation:
             raise ValueError('The variation is the same as the original question')
         return values
+
+class VariationListExtractor(BaseModel):
+    variations: List[VariationExtractor] = Field(description="One variation per requested new unknown, in the order the new unknowns were given.")
     
 class GenerateVariation:
     def __init__(self, api_key=None, llm_options=None):
@@ -161,11 +169,16 @@ class GenerateVariation:
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         self.LLM_OPTIONS = llm_options or {
             "model": "gpt-4",
-            "temperature": "0"
+            "temperature": "0",
+            "max_concurrency": DEFAULT_MAX_WORKERS,
+            "variation_mode": "per_known"
         }
 
+        from langchain.output_parsers import PydanticOutputParser
+
         self.pydantic_parser = PydanticOutputParser(pydantic_object=VariationExtractor)
-        self.template_string = (
+        self.list_parser = PydanticOutputParser(pydantic_object=VariationListExtractor)
+        self.instructions = (
         """
       
         In this task, you are required to modify a given question to create a new variation. The goal is to change one specific parameter in the original question, making it the new unknown, while adhering to the following criteria:
@@ -194,21 +207,32 @@ class GenerateVariation:
         - Input Question: 'When 2 moles of oxygen react with 4 moles of hydrogen, 2 moles of water are produced. If 3 moles of oxygen are available, how many moles of water will be produced?'
         - New Unknown: Hydrogen
         - Generated Variation: 'When oxygen reacts with an unknown amount of hydrogen, 2 moles of water are produced. If you start with 2 moles of oxygen, determine the amount of hydrogen needed.'
-        Input Question: {question}.\n
+        """
+        )
+        self.template_string = self.instructions + (
+        """Input Question: {question}.\n
         New Unknown: {unknown}\n
         {format_instructions}"""
         )
-        self.llm = ChatOpenAI(
-            model=self.LLM_OPTIONS["model"],
-            temperature=self.LLM_OPTIONS["temperature"],
-            api_key=self.api_key)
+        # Asks for every variation in one response so the instructions and examples are sent once
+        self.batch_template_string = self.instructions + (
+        """Input Question: {question}.\n
+        Create one variation for each of the following new unknowns, in this order: {unknowns}\n
+        {format_instructions}"""
+        )
+        self.llm = get_chat_model(
+            self.LLM_OPTIONS["model"],
+            self.api_key,
+            temperature=self.LLM_OPTIONS["temperature"])
         self.Extractor = QuestionExtractor(api_key=self.api_key)
 
     def _generate_variation(self, question, new_unknown, format_instructions):
         """Generate a single question variation given a new unknown"""
+        from langchain.prompts import ChatPromptTemplate
+
         prompt = ChatPromptTemplate.from_template(template=self.template_string)
         messages = prompt.format_messages(question=question, unknown=new_unknown, format_instructions=format_instructions)
-        output = self.llm(messages)
+        output = self.llm.invoke(messages)
 
         # Remove '```json' and leading/trailing whitespace
         content = output.content.replace('```json', '').replace('```', '').strip()
@@ -216,16 +240,93 @@ class GenerateVariation:
         
         return json.loads(content)
 
+    def _generate_variations_batch(self, question, knowns):
+        """
+        Generates the variations for all knowns in a single request.
+
+        Every returned item is validated against VariationExtractor. Only the knowns whose
+        item is missing or invalid are requested again, one at a time.
+
+        Parameters:
+        question (str): The original question.
+        knowns (list): The knowns to turn into the new unknown, one variation each.
+
+        Returns:
+        list: The variations as dicts, in the order of `knowns`.
+        """
+        from langchain.prompts import ChatPromptTemplate
+
+        prompt = ChatPromptTemplate.from_template(template=self.batch_template_string)
+        messages = prompt.format_messages(
+            question=question,
+            unknowns="; ".join(knowns),
+            format_instructions=self.list_parser.get_format_instructions())
+        try:
+            content = self.llm.invoke(messages).content
+            content = content.replace('```json', '').replace('```', '').strip()
+            items = json.loads(content)
+            items = items.get("variations", []) if isinstance(items, dict) else items
+        except Exception as e:
+            print(f"Batch variation request failed, requesting each variation separately: {e}")
+            items = []
+
+        # Match items to knowns by their new unknown; an item without one is matched by its position
+        by_unknown = {
+            str(item.get("new_unknown", "")).strip().lower(): item
+            for item in items if isinstance(item, dict)
+        }
+        variations = []
+        to_repair = []
+        for index, known in enumerate(knowns):
+            item = by_unknown.get(known.strip().lower())
+            if item is None and index < len(items) and isinstance(items[index], dict) and not str(items[index].get("new_unknown", "")).strip():
+                item = items[index]
+            try:
+                # The original question and the known are fixed, whatever the model echoed back
+                variation = VariationExtractor.parse_obj({**(item or {}), "question": question, "new_unknown": known})
+                variations.append(variation.dict())
+            except Exception as e:
+                print(f"Variation for known {known!r} is invalid, requesting it again: {e}")
+                variations.append(None)
+                to_repair.append(index)
+
+        format_instructions = self.pydantic_parser.get_format_instructions()
+
+        def repair(index):
+            item = self._generate_variation(question, knowns[index], format_instructions)
+            return VariationExtractor.parse_obj({**item, "question": question, "new_unknown": knowns[index]}).dict()
+
+        repaired = map_ordered(repair, to_repair, max_workers=self.LLM_OPTIONS.get("max_concurrency", DEFAULT_MAX_WORKERS))
+        for index, result in zip(to_repair, repaired):
+            variations[index] = result
+        return successful([
+            variation if variation is not None else ItemError(knowns[index], ValueError("no valid variation"))
+            for index, variation in enumerate(variations)
+        ], label="variation for known")
+
+    @instrument("variations")
     def generate_question_variation(self, question):
-        """Generates multiple question variations by altering the unknowns"""
+        """
+        Generates multiple question variations by altering the unknowns.
+
+        In "per_known" mode one variation is requested per known, concurrently. In "batch"
+        mode all variations are requested in one response and only the invalid ones are
+        requested again. A variation whose request or JSON fails is skipped without losing
+        the others, and the order of the knowns is kept.
+        """
         format_instructions = self.pydantic_parser.get_format_instructions()
         question_data = self.Extractor.extract(question)
         print("Question data",question_data)
-        variations = [
-            self._generate_variation(question, known, format_instructions) 
-            for known in question_data["knowns"]
-        ]
-        return variations
+        if not question_data:
+            return []
+        if self.LLM_OPTIONS.get("variation_mode") == "batch":
+            return self._generate_variations_batch(question, question_data["knowns"])
+        results = map_ordered(
+            lambda known: self._generate_variation(question, known, format_instructions),
+            question_data["knowns"],
+            max_workers=self.LLM_OPTIONS.get("max_concurrency", DEFAULT_MAX_WORKERS)
+        )
+        return successful(results, label="variation for known")
         
     
     
@@ -1,6 +1,9 @@
-from openai import OpenAI
+from util_clients import get_openai_client
+from util_telemetry import instrument
+
+@instrument("variation_solution")
 def create_variation_solution(original_question,original_solution_guide,question_variation,new_unknown,api_key):
-    client = OpenAI(api_key=api_key)
+    client = get_openai_client(api_key)
     prompt = """
     Original Question: {original_question}
         Solution Guide: {original_solution_guide}
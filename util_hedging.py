@@ -0,0 +1,148 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from util_lazy_import import lazy_import
+from util_telemetry import get_telemetry
+
+np = lazy_import("numpy")
+
+# Default behaviour of the shared hedger, hedging is opt-in
+HEDGING_OPTIONS = {
+    "enabled": False,
+    "percentile": 90,        # Fire the duplicate once a call is slower than this percentile
+    "min_samples": 10,       # Observed latencies needed per model before hedging starts
+    "window": 200,           # Latencies kept per model
+    "max_hedge_ratio": 0.1,  # At most this fraction of calls may send a duplicate request
+    "max_workers": 16,
+}
+
+
+class RequestHedger:
+    """
+    Sends a duplicate of a slow, idempotent request and keeps whichever answer arrives first.
+
+    Only temperature 0 calls are hedged, since only those are interchangeable. The
+    hedge fires once the call has been outstanding longer than the configured
+    percentile of the latencies observed for that model, and the number of
+    duplicates is capped at `max_hedge_ratio` of all calls so the extra spend is bounded.
+    A duplicate that has not started yet is cancelled; one already sent cannot be
+    recalled, so its result is simply dropped.
+    """
+
+    def __init__(self, **options):
+        self.options = {**HEDGING_OPTIONS, **options}
+        self._latencies = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.options["max_workers"], thread_name_prefix="hedge")
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def configure(self, **options):
+        """
+        Updates the hedging options, e.g. configure(enabled=True, percentile=95).
+        """
+        with self._lock:
+            self.options.update(options)
+
+    def _record(self, model: str, latency: float):
+        with self._lock:
+            latencies = self._latencies.setdefault(model, deque(maxlen=self.options["window"]))
+            latencies.append(latency)
+
+    def hedge_delay(self, model: str) -> float:
+        """
+        Returns how long a call to `model` may run before a duplicate is sent, or None
+        if not enough latencies have been observed yet.
+        """
+        with self._lock:
+            latencies = list(self._latencies.get(model, ()))
+        if len(latencies) < self.options["min_samples"]:
+            return None
+        return float(np.percentile(latencies, self.options["percentile"]))
+
+    def _budget_allows(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.options["max_hedge_ratio"] * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+    def call(self, model: str, temperature, fn, /, *args, **kwargs):
+        """
+        Runs `fn(*args, **kwargs)`, hedging it when it is eligible.
+
+        Parameters:
+        model (str): The model the request goes to; latencies are tracked per model.
+        temperature (float or str): The sampling temperature of the request.
+        fn (callable): The function performing the request.
+
+        Returns:
+        The return value of whichever request finished first.
+        """
+        with self._lock:
+            self.calls += 1
+        eligible = self.options["enabled"] and float(temperature) == 0
+
+        def timed():
+            start = time.monotonic()
+            result = fn(*args, **kwargs)
+            self._record(model, time.monotonic() - start)
+            return result
+
+        if not eligible:
+            return timed()
+
+        delay = self.hedge_delay(model)
+        primary = self._executor.submit(contextvars.copy_context().run, timed)
+        if delay is None:
+            return primary.result()
+
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._budget_allows():
+            return primary.result()
+
+        print(f"Request to {model} exceeded p{self.options['percentile']} latency ({delay:.1f}s), sending hedged request")
+        get_telemetry().increment("hedges")
+        hedge = self._executor.submit(contextvars.copy_context().run, timed)
+        pending = {primary, hedge}
+        first_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                first_error = first_error or future.exception()
+        raise first_error
+
+    def metrics(self) -> dict:
+        """
+        Returns hedging counters and the current hedge delay for every model seen so far.
+        """
+        with self._lock:
+            models = list(self._latencies)
+            counters = {"calls": self.calls, "hedges": self.hedges, "hedge_wins": self.hedge_wins}
+        return {**counters, "hedge_delay": {model: self.hedge_delay(model) for model in models}}
+
+
+_hedger = None
+_hedger_lock = threading.Lock()
+
+
+def get_hedger() -> RequestHedger:
+    """
+    Returns the process-wide request hedger.
+    """
+    global _hedger
+    with _hedger_lock:
+        if _hedger is None:
+            _hedger = RequestHedger()
+        return _hedger
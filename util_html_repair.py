@@ -0,0 +1,83 @@
+import re
+
+from util_clients import get_chat_model
+from util_telemetry import get_telemetry, instrument
+from util_validation import validate_question_html_format
+
+# Model used for fix-up requests; the request only carries the failed html and the validation error
+HTML_REPAIR_OPTIONS = {
+    "model": "gpt-4",
+    "temperature": 0,
+}
+
+REPAIR_TEMPLATE = """The following question.html for PrairieLearn failed validation.
+
+Validation error: {error}
+
+Original question: {question}
+
+Failed html:
+{html}
+
+Fix only what the validation error describes and keep everything else unchanged. Values that the question gives as numbers must be written as {{{{params.<name>}}}} placeholders, and the question must use PrairieLearn elements such as <pl-question-panel> and <pl-number-input>. Return the corrected html delimited with ```insert_code_here```"""
+
+# Placeholders written with single braces or inner spaces, e.g. {params.m} or {{ params.m }}
+LOOSE_PLACEHOLDER = re.compile(r"\{\{?\s*(params\.[\w.]+)\s*\}?\}")
+
+
+def apply_local_fixes(html: str) -> str:
+    """
+    Applies the fixes that do not need the model: normalises loosely written params placeholders.
+
+    Missing PrairieLearn elements are left to the model, since wrapping the html in a panel
+    would pass validation without adding the answer element the question needs.
+
+    Parameters:
+    html (str): The generated question.html, with or without its code fence.
+
+    Returns:
+    str: The fixed html.
+    """
+    return LOOSE_PLACEHOLDER.sub(lambda match: "{{" + match.group(1) + "}}", html)
+
+
+def request_html_fix(html: str, error: str, question: str, api_key: str) -> str:
+    """
+    Sends the failed html and its validation error back to the model as a short fix-up request.
+
+    Parameters:
+    html (str): The html that failed validation.
+    error (str): The validation error.
+    question (str): The question the html was generated for.
+    api_key (str): API key for the service.
+
+    Returns:
+    str: The corrected html as returned by the model.
+    """
+    llm = get_chat_model(HTML_REPAIR_OPTIONS["model"], api_key, temperature=HTML_REPAIR_OPTIONS["temperature"])
+    return llm.invoke(REPAIR_TEMPLATE.format(error=error, question=question, html=html)).content
+
+
+@instrument("html_repair")
+def repair_question_html(html: str, error: str, question: str, api_key: str) -> str:
+    """
+    Repairs html that failed validate_question_html_format, locally where possible and otherwise with a fix-up request.
+
+    Parameters:
+    html (str): The html that failed validation.
+    error (str): The validation error.
+    question (str): The question the html was generated for.
+    api_key (str): API key for the service.
+
+    Returns:
+    str: The repaired html. It is not validated again here.
+    """
+    fixed = apply_local_fixes(html)
+    try:
+        validate_question_html_format(fixed)
+        get_telemetry().increment("html_local_repairs")
+        return fixed
+    except ValueError as e:
+        error = str(e)
+    get_telemetry().increment("html_model_repairs")
+    return request_html_fix(fixed, error, question, api_key)
@@ -1,8 +1,9 @@
 import base64
-import requests
 import sys
 
 from util_string_extraction import extract_content_from_triple_quote
+from util_clients import get_requests_session
+from util_request_governor import get_governor, parse_retry_after, RetryableHTTPError
     
 # Function to encode the image
 def encode_image(image_path):
@@ -51,8 +52,13 @@ def encode_image_and_send_request(text, image_paths, api_key, max_tokens=1000):
         "temperature": 0,
         "max_tokens": max_tokens
     }
-    # Sending the request
-    response = requests.post("https://api.openai.com/v1/chat/completions", headers=headers, json=payload)
+    # Sending the request, rate limited and server errors are retried by the governor
+    def send_request():
+        response = get_requests_session().post("https://api.openai.com/v1/chat/completions", headers=headers, json=payload)
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableHTTPError(response.status_code, parse_retry_after(response.headers))
+        return response
+    response = get_governor().call(payload["model"], send_request)
 
     # Parsing the JSON response
     data = response.json()
@@ -0,0 +1,104 @@
+import argparse
+import re
+import subprocess
+import sys
+import time
+
+# Entry points whose cold start matters: the CLI and the modules a worker process imports
+BENCHMARK_MODULES = [
+    "main",
+    "util_metadata_generator",
+    "util_question_html_generator",
+    "util_javascript_generator",
+    "util_solution_html_generator",
+    "util_generate_variations",
+    "util_file_export",
+    "util_semantic_search",
+    "util_clients",
+]
+IMPORTTIME_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_import(module: str, python: str = sys.executable) -> dict:
+    """
+    Imports `module` in a fresh interpreter and reports how long it took.
+
+    Parameters:
+    module (str): The module to import.
+    python (str): The interpreter to use.
+
+    Returns:
+    dict: {"module", "ok", "wall_seconds" (including interpreter start up),
+           "import_seconds" (cumulative import time of the module), "imports" (list of
+           (cumulative seconds, name) for its direct imports), "error"}
+    """
+    start = time.perf_counter()
+    process = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True)
+    wall_seconds = time.perf_counter() - start
+
+    # -X importtime prints a module after everything it imports, indented two spaces per level
+    import_seconds = None
+    children = []
+    imports = []
+    for line in process.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)) / 1e6, len(match.group(3)), match.group(4)
+        if indent == 3:
+            children.append((cumulative, name))
+        elif indent == 1:
+            if name == module:
+                import_seconds = cumulative
+                imports = children
+            children = []
+
+    error = None
+    if process.returncode != 0:
+        error = (process.stderr.strip().splitlines() or ["unknown error"])[-1]
+    return {
+        "module": module,
+        "ok": process.returncode == 0,
+        "wall_seconds": wall_seconds,
+        "import_seconds": import_seconds,
+        "imports": sorted(imports, reverse=True),
+        "error": error,
+    }
+
+
+def run_benchmark(modules: list = None, budget: float = None, top: int = 5) -> bool:
+    """
+    Measures the cold import time of each module and prints a table with the heaviest dependencies.
+
+    Parameters:
+    modules (list, optional): Modules to measure, defaults to BENCHMARK_MODULES.
+    budget (float, optional): Maximum allowed wall time in seconds per module.
+    top (int): Number of heaviest imports shown per module.
+
+    Returns:
+    bool: True if every module imported and stayed within the budget.
+    """
+    passed = True
+    print(f"{'Module':<32}{'Wall (s)':>10}{'Import (s)':>12}  Heaviest imports")
+    print("-" * 100)
+    for module in modules or BENCHMARK_MODULES:
+        result = measure_import(module)
+        if not result["ok"]:
+            passed = False
+            print(f"{module:<32}{'failed':>10}{'':>12}  {result['error']}")
+            continue
+        heaviest = ", ".join(f"{name} {seconds:.2f}" for seconds, name in result["imports"][:top])
+        over_budget = budget is not None and result["wall_seconds"] > budget
+        passed = passed and not over_budget
+        import_seconds = f"{result['import_seconds']:.3f}" if result["import_seconds"] is not None else "-"
+        print(f"{module:<32}{result['wall_seconds']:>10.3f}{import_seconds:>12}  {heaviest}{'  OVER BUDGET' if over_budget else ''}")
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the cold import time of the pipeline entry points.")
+    parser.add_argument("modules", nargs="*", help="Modules to import (default: the CLI and generator modules).")
+    parser.add_argument("--budget", type=float, default=None, help="Fail if a module takes longer than this many seconds.")
+    parser.add_argument("--top", type=int, default=5, help="Number of heaviest imports to list per module.")
+    arguments = parser.parse_args()
+    sys.exit(0 if run_benchmark(arguments.modules, arguments.budget, arguments.top) else 1)
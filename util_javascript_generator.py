@@ -8,38 +8,55 @@ from pprint import pprint
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
-# Third-party library imports
-import bs4
-
-# langchain imports
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain import hub
-from langchain.tools.retriever import create_retriever_tool
-from langchain.text_splitter import RecursiveCharacterTextSplitter, Language
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain.agents import create_openai_functions_agent
-from langchain.agents import AgentExecutor
-from util_question_html_generator import question_html_generator
-# langchain_community imports
-from langchain_community.document_loaders.generic import GenericLoader
-from langchain_community.document_loaders.parsers import LanguageParser
-from langchain_community.vectorstores import Chroma
-from langchain.storage import InMemoryStore
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import TextLoader
-from langchain_community.vectorstores import Chroma
-from langchain_openai import OpenAIEmbeddings
-from langchain.retrievers import ParentDocumentRetriever
-from langchain_community.chat_message_histories import ChatMessageHistory
-from langchain_core.runnables.history import RunnableWithMessageHistory
 # Utility imports
 from util_semantic_search import SemanticSearch
-from util_example_based_prompt import ExampleBasedPromptFormatter
-from langchain.retrievers.multi_query import MultiQueryRetriever
-
-from langchain_community.vectorstores import FAISS
+from util_example_based_prompt import ExampleBasedPromptFormatter, PROMPT_BUDGETS, estimate_tokens
+from util_clients import get_chat_model
+from util_symbol_index import get_symbol_index
+from util_hedging import get_hedger
+from util_streaming import stream_until_fence
+from util_telemetry import instrument
+
+
+def code_base_section(question: str, solution_guide: str, api_key: str, embedding_model: str) -> str:
+    """
+    Builds the prompt section listing the stable_properties helpers relevant to the question.
+
+    Helpers are looked up in the keyword symbol index. Only when no helper matches does
+    this fall back to a similarity search over the persisted vector index.
+
+    Parameters:
+    question (str): The question HTML.
+    solution_guide (str): The step-by-step guide, if any.
+    api_key (str): API key for the embeddings service, used by the fallback.
+    embedding_model (str): The embedding model of the vector index.
+
+    Returns:
+    str: The prompt section, or an empty string when nothing relevant was found.
+    """
+    snippets = get_symbol_index().format_snippets(f"{question}\n{solution_guide or ''}")
+    if not snippets:
+        # The vector index pulls in Chroma and the LangChain loaders, so it is only imported when needed
+        from util_code_index import load_code_index
+
+        db = load_code_index(api_key, embedding_model=embedding_model)
+        documents = db.max_marginal_relevance_search(question, k=3)
+        snippets = "\n\n".join(document.page_content for document in documents)
+    if not snippets:
+        return ""
+    return f"""
+        Our code base provides the helpers below. Where one of them supplies a value or computation the problem needs:
+            - Import it with the require statement shown instead of copying its content or inventing the data.
+            - Draw tabular values (specific gravity, latent heat, thermodynamic properties of water, etc.) from these sources rather than generating random data.
+            - Do not import anything that is not listed here or not needed to perform the calculation.
+
+        ```javascript
+        {snippets}
+        ```
+        """
 
 
+@instrument("server_js")
 def js_generator(question:str, api_key:str, csv_path:str,retrieval_optimization:bool,solution_guide:str=None,):
 
     example_options = {
@@ -53,9 +70,9 @@ def js_generator(question:str, api_key:str, csv_path:str,retrieval_optimization:
         "agent_model": "gpt-4-turbo-preview",
         "retriever_model": "gpt-3.5-turbo-0125",
         "temperature": 0,  # Assuming temperature should be an integer or float, not a string
-        "embedding_model": "text-embedding-ada-002"
+        "embedding_model": "text-embedding-ada-002",
+        "stream": True  # Stop reading the completion once the ```javascript block is complete
     }
-    retriever_path = r"stable_properties"
     
     semantic_search_instance = SemanticSearch(
         csv_path=csv_path,
@@ -117,108 +134,32 @@ def js_generator(question:str, api_key:str, csv_path:str,retrieval_optimization:
             generate
         }}
 
+        When the problem needs properties of water or steam, require them from the compiled steam tables: const {{ steamProperties, saturatedByPressure, saturatedByTemperature, steamTableRange }} = require('./steam_tables_compiled');
+        steamProperties(P, T) covers compressed liquid, superheated and supercritical states; the saturated helpers cover the saturation line (P in MPa, T in °C). Never require, parse or loop over the *_V1.x.json steam table files inside generate(). Pick states within steamTableRange() and draw a new state when a returned property is NaN.
+
         Your mission is to flesh out the 'generate' function within this framework. It should dynamically select parameters and units, apply necessary transformations, spawn values, and deduce a legitimate solution. The function must return an object containing 'params' and 'correct_answers' properties, which abide by the prescribed structure. This alignment ensures that the HTML and JavaScript components integrate seamlessly. Below is a sample illustration:
         
         ```insert code here```
         """
     # Completes prompt for code generation 
-    complete = guide_section+base_template
-    template = ExampleBasedPromptFormatter.run(examples,complete)
-    complete_template = f"{template}\ninput: {question}"
+    code_base = code_base_section(question, solution_guide, api_key, llm_options["embedding_model"]) if retrieval_optimization else ""
+    # The static instructions go first and unchanged in every call so the provider can cache them as a prefix
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    budget = PROMPT_BUDGETS["server_js"] - estimate_tokens(base_template)
+    template = ExampleBasedPromptFormatter.run(examples,guide_section+code_base,token_budget=budget)
+    complete_template = [SystemMessage(content=base_template), HumanMessage(content=f"{template}\ninput: {question}")]
     
     # LLM Code Generation Set Up 
-    llm = ChatOpenAI(openai_api_key=api_key,model=llm_options["llm_code_generation_model"])
-    generated_code = llm.invoke(complete_template)
+    llm = get_chat_model(llm_options["llm_code_generation_model"], api_key, temperature=llm_options["temperature"])
+    if llm_options["stream"]:
+        from langchain_core.messages import AIMessage
+
+        content = get_hedger().call(llm_options["llm_code_generation_model"], llm_options["temperature"], stream_until_fence, llm, complete_template, "javascript")
+        generated_code = AIMessage(content=content)
+    else:
+        generated_code = get_hedger().call(llm_options["llm_code_generation_model"], llm_options["temperature"], llm.invoke, complete_template)
     #print("This is the original code \n", generated_code,"\n")
-    if retrieval_optimization:
-        # Set Up Retriever 
-        # Load documents from the filesystem with specific criteria (JS files)
-        loader = GenericLoader.from_filesystem(
-            path=retriever_path,
-            glob="*",
-            suffixes=[".js"],
-            parser=LanguageParser(language=Language.JS)
-        )
-        documents = loader.load()
-        code_spiltter = RecursiveCharacterTextSplitter.from_language(language=Language.JS, chunk_size=500, chunk_overlap=200)
-        texts = code_spiltter.split_documents(documents)
-        embeddings = OpenAIEmbeddings(api_key=api_key)
-        db =Chroma.from_documents(texts, embeddings)
-        
-        retriever = db.as_retriever(search_type="mmr", search_kwargs={"k": 3,"score_threshold":0.7})
-        template = """As a developer with access to our extensive code database, your goal is to effectively find and utilize information for the tasks at hand. This concise guide outlines a streamlined approach to optimize your workflow:
-        1. Understanding the Query: Grasp the essence of the provided question or task.
-        2. Accessing the Code Database: Conduct a targeted search within the database.
-        3. Evaluating the Results: Assess the relevance and utility of each potential match.
-        4. Handling Unknown Answers: Acknowledge the absence of direct answers without speculation.
-        You will return any information about the code base
-        {context}
-
-
-        Answer:"""
-        
-        # Intiailize Agent 
-        retriever_tool = create_retriever_tool(
-        retriever,
-        "Database_Retriever",
-        template,
-        )
-        tools = [retriever_tool]
-        message_history = ChatMessageHistory()
-        agent_llm = ChatOpenAI(model=llm_options["agent_model"], temperature=0,)
-        prompt = hub.pull("hwchase17/openai-functions-agent")
-        agent = create_openai_functions_agent(agent_llm, tools, prompt)
-        agent_executor = AgentExecutor(agent=agent, tools=tools, verbose=True,)
-        agent_with_chat_history = RunnableWithMessageHistory(
-            agent_executor,
-            lambda session_id: message_history,
-            input_message_key = "input",
-            history_messages_key="chat_history"
-        )
-        # Define the search query question
-        text_step1 = f"""
-        Step 1: Database Query Integration:
-            - Utilize the Database_Retriever tool to generate 3 search queries aimed at improving the provided code by finding  ways to utilize our existing code base.
-            - Search specifically for modules, classes, and functions that are relevant to your task. 
-            - If the import syntax is unclear, use the Database_Retriever to look up the correct format.
-            - To ensure you're importing correctly, formulate your query like this: 'How to import [item to import]'.
-            - Verify that imports are implemented as per the documentation, and maintain the structural integrity of the pre-existing code.
-            - To maintain data integrity, the search query must focus on checking the database for the required tabular data, ensuring that specific values are drawn from accurate sources rather than using random data.Be specific of what value you need
-            for example "I need tabular data on ex 'specific gravity,latent heat, thermodynamic properties of water etc"
-            - Only use modules sourced from our database, if non exit that match the functionality you are trying to achieve do not import them or referebce them
-
-        HTML Question Reference:
-        {question}
-
-        Previous Code:
-        {generated_code}
-        """
-
-        query_search = agent_with_chat_history.invoke({"input": text_step1},config={"configurable": {"session_id": "<foo>"}},)
-        
-        text_step2 = f"""
-        Step 2: Code Generation:
-            - Using the search queries utilize the database_retriever tool
-            - Develop an upgraded version of the code that integrates the  identified components.
-            - Confirm that all imported modules are sourced from the database; refrain from including external or non-existent imports.
-            - The updated code should reflect the desired functionality and include any new optimizations.
-            - Document any modifications and provide instructions for the updated code's usage.
-            - Focus on importing these elements into your current codebase instead of copying their content
-            - To maintain data integrity, ensure that specific values are either defined or  drawn from accurate sources rather than using random data/generation
-            - Do not import anything that is not needed to perform the calculation
-            - Preserve the original code's structure and functionality throughout the update process.
-
-        HTML Question Reference:
-        {question}
-
-        Previous Code:
-        {generated_code}
-
-        Only return the code, and Please enclose the finalized version of the improved code within the 'improved code' markers for clarity and seamless integration.
-        """
-
-        content = agent_with_chat_history.invoke({"input": text_step2},config={"configurable": {"session_id": "<foo>"}},)
-        generated_code = content["output"]
     return generated_code
 
 # def js_generator_old(question:str, api_key:str, csv_path:str,retrieval_optimization:bool,solution_guide:str=None,):
@@ -0,0 +1,173 @@
+import math
+import os
+import re
+
+from util_node_pool import get_node_pool, node_available
+from util_symbol_index import SYMBOL_INDEX_OPTIONS
+from util_telemetry import get_telemetry, instrument
+
+# Default settings of the server.js verification stage
+VERIFICATION_OPTIONS = {
+    "samples": 200,
+    "timeout": 10.0,
+    # Generated code requires the stable_properties helpers as './Module', so it runs as if it lived there
+    "filename": os.path.join(os.path.abspath(SYMBOL_INDEX_OPTIONS["source_path"]), "generated_server.js"),
+}
+
+PARAMS_PLACEHOLDER = re.compile(r"\{\{\s*params\.([A-Za-z_$][\w$]*)")
+JAVASCRIPT_BLOCK = re.compile(r"```(?:javascript|js)\s*\n(.*?)```", re.DOTALL)
+MISSING_MODULE = re.compile(r"Cannot find module '([^']+)'")
+
+
+def extract_server_code(generated_js) -> str:
+    """
+    Returns the complete module from a js_generator completion: the first ```javascript block, or the text itself.
+
+    Parameters:
+    generated_js (str or AIMessage): The completion.
+
+    Returns:
+    str: The module source.
+    """
+    text = str(getattr(generated_js, "content", generated_js))
+    match = JAVASCRIPT_BLOCK.search(text)
+    return match.group(1) if match else text
+
+
+def params_placeholders(question_html: str) -> set:
+    """
+    Returns the names used in {{params.<name>}} placeholders of question.html.
+    """
+    return set(PARAMS_PLACEHOLDER.findall(str(question_html or "")))
+
+
+def sigfig_tolerance(sigfigs) -> float:
+    """
+    Returns the relative tolerance at which two answers agree to `sigfigs` significant figures.
+    """
+    return 0.5 * 10 ** (1 - int(sigfigs or 3))
+
+
+def missing_package(error: str) -> str:
+    """
+    Returns the npm package a failed module load could not find, or None.
+
+    Relative and absolute requires that fail are mistakes in the generated code and
+    are not reported here; only bare package names (e.g. 'mathjs') are.
+    """
+    match = MISSING_MODULE.search(str(error or ""))
+    if match and not match.group(1).startswith((".", "/")):
+        return match.group(1)
+    return None
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def check_samples(samples: list, question_html: str = None, reference=None) -> dict:
+    """
+    Checks the return values of repeated generate() calls.
+
+    Parameters:
+    samples (list): The return values.
+    question_html (str, optional): The question; every {{params.<name>}} it uses must be returned.
+    reference (callable, optional): Computes the expected correct_answers from a sample's params,
+                                    e.g. from the solution guide or a property table; answers are
+                                    compared within the sample's sigfigs.
+
+    Returns:
+    dict: {"ok", "errors" (list of str), "warnings" (list of str), "samples" (int)}
+    """
+    errors, warnings = [], []
+    shaped = [sample for sample in samples if isinstance(sample, dict) and isinstance(sample.get("params"), dict) and isinstance(sample.get("correct_answers"), dict)]
+    if len(shaped) < len(samples):
+        errors.append(f"{len(samples) - len(shaped)} of {len(samples)} samples do not return params and correct_answers objects")
+    if not shaped:
+        return {"ok": False, "errors": errors or ["generate() returned no samples"], "warnings": warnings, "samples": len(samples)}
+
+    # Every answer must be a finite number on every sample (non-numeric answers, e.g. choices, are left alone)
+    for name in sorted({name for sample in shaped for name in sample["correct_answers"]}):
+        values = [sample["correct_answers"].get(name) for sample in shaped]
+        bad = sum(1 for value in values if value is None or (_is_number(value) and not math.isfinite(value)))
+        if bad:
+            errors.append(f"correct_answers.{name} is missing, NaN or infinite in {bad} of {len(shaped)} samples")
+
+    missing = {name for name in params_placeholders(question_html) if any(name not in sample["params"] for sample in shaped)}
+    if missing:
+        errors.append("question.html uses params that generate() does not return: " + ", ".join(sorted(missing)))
+
+    # Degenerate output: answers that never change although the inputs do
+    if len(shaped) > 1:
+        def constant(values):
+            return all(value == values[0] for value in values[1:])
+
+        varying_params = [name for name in shaped[0]["params"] if not constant([sample["params"].get(name) for sample in shaped])]
+        constant_params = [name for name in shaped[0]["params"] if name not in varying_params and _is_number(shaped[0]["params"][name])]
+        if constant_params:
+            warnings.append("params never vary: " + ", ".join(sorted(constant_params)))
+        # Only numeric answers are expected to follow the params; a choice or a fixed constant may legitimately repeat
+        constant_answers = [
+            name for name, value in shaped[0]["correct_answers"].items()
+            if _is_number(value) and constant([sample["correct_answers"].get(name) for sample in shaped])
+        ]
+        if varying_params and constant_answers:
+            warnings.append("correct_answers never vary although params do: " + ", ".join(sorted(constant_answers)))
+
+    if reference is not None:
+        mismatches = 0
+        for sample in shaped:
+            expected = reference(sample["params"])
+            tolerance = sigfig_tolerance(sample.get("sigfigs"))
+            for name, value in (expected or {}).items():
+                actual = sample["correct_answers"].get(name)
+                if not (_is_number(actual) and _is_number(value)) or not math.isclose(actual, value, rel_tol=tolerance, abs_tol=1e-12):
+                    mismatches += 1
+                    break
+        if mismatches:
+            errors.append(f"correct_answers differ from the reference beyond sigfigs in {mismatches} of {len(shaped)} samples")
+
+    return {"ok": not errors, "errors": errors, "warnings": warnings, "samples": len(samples)}
+
+
+@instrument("verify_server_js")
+def verify_server_js(generated_js, question_html: str = None, reference=None, **options) -> dict:
+    """
+    Runs the generated module many times in the Node worker pool and checks its output.
+
+    Parameters:
+    generated_js (str or AIMessage): The js_generator completion or the module source.
+    question_html (str, optional): The question the module generates values for.
+    reference (callable, optional): Expected correct_answers for a sample's params, see check_samples.
+    **options: Overrides of VERIFICATION_OPTIONS.
+
+    Returns:
+    dict: {"ok", "errors", "warnings", "samples", "skipped"}; "skipped" is True when node or an npm
+          package the module requires is not installed.
+    """
+    options = {**VERIFICATION_OPTIONS, **options}
+    if not node_available():
+        print("node was not found, skipping server.js verification")
+        return {"ok": True, "errors": [], "warnings": ["node not found"], "samples": 0, "skipped": True}
+
+    result = get_node_pool().run(
+        source=extract_server_code(generated_js),
+        filename=options["filename"],
+        runs=options["samples"],
+        timeout=options["timeout"],
+    )
+    package = missing_package(result["error"]) if not result["ok"] else None
+    if package is not None:
+        print(f"npm package '{package}' is not installed, skipping server.js verification (run npm install in {os.path.dirname(options['filename'])})")
+        return {"ok": True, "errors": [], "warnings": [f"{package} not installed"], "samples": 0, "skipped": True}
+    if not result["ok"]:
+        report = {"ok": False, "errors": [f"generate() failed: {result['error']}"], "warnings": [], "samples": 0}
+    else:
+        report = check_samples(result["results"], question_html, reference)
+    report["skipped"] = False
+    get_telemetry().increment("server_js_verified" if report["ok"] else "server_js_rejected")
+    for message in report["errors"]:
+        print(f"server.js verification: {message}")
+    for message in report["warnings"]:
+        print(f"server.js verification warning: {message}")
+    return report
@@ -1,6 +1,8 @@
-from openai import OpenAI
 import json
 
+from util_clients import get_openai_client
+from util_telemetry import instrument
+
 def parse_json_from_markdown(content):
     # Check for and remove Markdown code block syntax
     if content.startswith("```json") and content.endswith("```"):
@@ -22,7 +24,7 @@ class QuestionMetaDataGenerator:
     Attributes:
         system_template (str): A preset template message for the system role.
         user_template (str): A preset template message for the user role, detailing the expected metadata fields.
-        client (OpenAI): An instance of the OpenAI client for API interaction.
+        client (OpenAI): The shared OpenAI client for API interaction.
 
     Methods:
         __init__(self): Initializes the QuestionMetaDataGenerator class with default templates and OpenAI client.
@@ -61,7 +63,7 @@ class QuestionMetaDataGenerator:
         - prereqs: Prerequisites needed to access or understand the content
         - isAdaptive: Designates whether the content necessitates any form of numerical computation. Assign as 'true' if the question involves any numerical computation; return 'false' if no computational effort is required. Note: This is a string value, not a boolean.
         """.strip()
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
 
     def generate_question_metadata(self, question):
         response = self.client.chat.completions.create(
@@ -124,6 +126,7 @@ class QuestionMetaDataGenerator:
         # If retries are exhausted and metadata is still empty
         raise ValueError("Failed to generate non-empty metadata after retries.")
 
+@instrument("metadata")
 def question_metadata_generator(api_key, question, created_by, code_lang):
     """
     Test function to generate metadata for a question.
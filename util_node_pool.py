@@ -0,0 +1,230 @@
+import atexit
+import itertools
+import json
+import os
+import queue
+import shutil
+import subprocess
+import threading
+
+from util_telemetry import get_telemetry, instrument
+
+# Default settings of the Node worker pool that executes generated server.js modules
+NODE_POOL_OPTIONS = {
+    "node": "node",
+    "workers": 4,
+    "timeout": 10.0,  # Seconds a single job may take before its worker is killed and replaced
+    "max_old_space_size": 256,  # Heap limit per worker in MB
+    "worker_script": os.path.join(os.path.dirname(os.path.abspath(__file__)), "util_node_worker.js"),
+}
+
+
+class NodeWorker:
+    """
+    One long-lived `node` process speaking the JSON-lines protocol of util_node_worker.js.
+
+    A reader thread moves every line the worker prints into a queue, so a job can wait
+    for its result with a timeout. A worker that times out or dies is killed; the pool
+    replaces it with a fresh one.
+    """
+
+    def __init__(self, options: dict):
+        self.options = options
+        self.process = subprocess.Popen(
+            [options["node"], f"--max-old-space-size={options['max_old_space_size']}", options["worker_script"]],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self._lines = queue.Queue()
+        self._reader = threading.Thread(target=self._read, name="node-worker-reader", daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run(self, job: dict, timeout: float) -> dict:
+        """
+        Sends a job and waits for its result.
+
+        Raises:
+        TimeoutError: If no result arrives within `timeout` seconds.
+        RuntimeError: If the worker exited, e.g. after exceeding its heap limit.
+        """
+        self.process.stdin.write(json.dumps(job) + "\n")
+        self.process.stdin.flush()
+        while True:
+            try:
+                line = self._lines.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(f"Job did not finish within {timeout:.1f}s")
+            if line is None:
+                raise RuntimeError(f"Node worker exited with code {self.process.wait()}")
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # Output that bypassed the worker's stdout redirection is not a result
+                continue
+            # A late result of an earlier job is skipped
+            if isinstance(result, dict) and result.get("id") == job["id"]:
+                return result
+
+    def kill(self):
+        if self.alive():
+            self.process.kill()
+        self.process.wait()
+
+
+class NodeWorkerPool:
+    """
+    A pool of warm Node.js processes that load a generated module and call its generate() function.
+
+    Starting node takes far longer than running a generate() function, so the processes
+    are kept between jobs. Each job runs in one worker at a time with a timeout and a
+    per-process heap limit; a worker that times out, crashes or runs out of memory is
+    replaced and the job is reported as failed.
+    """
+
+    def __init__(self, **options):
+        self.options = {**NODE_POOL_OPTIONS, **options}
+        self._idle = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._closed = False
+
+    def _acquire(self) -> NodeWorker:
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if len(self._workers) < self.options["workers"]:
+                        worker = NodeWorker(self.options)
+                        self._workers.append(worker)
+                        return worker
+                worker = self._idle.get()
+            # None stands for a lost worker that could not be replaced, its place is free again
+            if worker is not None:
+                return worker
+
+    def _release(self, worker: NodeWorker):
+        if worker.alive() and not self._closed:
+            self._idle.put(worker)
+            return
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            if self._closed:
+                return
+            try:
+                replacement = NodeWorker(self.options)
+            except Exception as e:
+                print(f"Could not replace a Node worker, the next job will start one: {e}")
+                replacement = None
+            else:
+                self._workers.append(replacement)
+        # Hand a fresh worker, or the free place, to anyone waiting for the one that was lost
+        self._idle.put(replacement)
+
+    @instrument("node_run")
+    def run(self, path: str = None, source: str = None, runs: int = 1, filename: str = None, timeout: float = None, export: str = "generate") -> dict:
+        """
+        Loads a module and calls its exported function `runs` times.
+
+        Parameters:
+        path (str, optional): Path of the module file.
+        source (str, optional): Module source, used instead of `path`.
+        runs (int): Number of calls.
+        filename (str, optional): Path the source is treated as living at, so its relative require() calls resolve.
+        timeout (float, optional): Seconds the job may take, defaults to the pool setting.
+        export (str): Name of the exported function.
+
+        Returns:
+        dict: {"ok", "results" (one return value per call), "error", "logs", "ms"}
+        """
+        if (path is None) == (source is None):
+            raise ValueError("Pass exactly one of path or source.")
+        job = {"id": next(self._ids), "runs": runs, "export": export}
+        if source is not None:
+            job.update(source=source, filename=os.path.abspath(filename) if filename else None)
+        else:
+            job["path"] = os.path.abspath(path)
+
+        timeout = timeout or self.options["timeout"]
+        worker = self._acquire()
+        try:
+            result = worker.run(job, timeout)
+        except (TimeoutError, RuntimeError) as e:
+            worker.kill()
+            get_telemetry().increment("node_worker_restarts")
+            result = {"id": job["id"], "ok": False, "error": str(e), "logs": [], "results": []}
+        finally:
+            self._release(worker)
+        result.setdefault("results", [])
+        result.setdefault("error", None)
+        return result
+
+    def map(self, jobs: list) -> list:
+        """
+        Runs several jobs concurrently across the workers.
+
+        Parameters:
+        jobs (list): Keyword argument dicts for run(), e.g. [{"path": "a/server.js", "runs": 100}].
+
+        Returns:
+        list: The result of each job, in order.
+        """
+        from util_concurrency import map_ordered
+
+        results = map_ordered(lambda job: self.run(**job), jobs, max_workers=self.options["workers"])
+        return [
+            result if isinstance(result, dict) else {"ok": False, "results": [], "error": str(result.error), "logs": []}
+            for result in results
+        ]
+
+    def close(self):
+        """
+        Stops every worker process.
+        """
+        self._closed = True
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.process.stdin.close()
+            except OSError:
+                pass
+            worker.kill()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def node_available(node: str = NODE_POOL_OPTIONS["node"]) -> bool:
+    """
+    Returns True if the node executable can be found.
+    """
+    return shutil.which(node) is not None
+
+
+def get_node_pool() -> NodeWorkerPool:
+    """
+    Returns the process-wide Node worker pool, creating it on first use.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = NodeWorkerPool()
+            atexit.register(_pool.close)
+        return _pool
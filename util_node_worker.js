@@ -0,0 +1,117 @@
+// Long-lived worker for util_node_pool.py.
+//
+// Reads one JSON job per line on stdin and writes one JSON result per line on stdout:
+//   job:    {"id": 1, "path": "/abs/server.js"} or {"id": 1, "source": "...", "filename": "/abs/dir/server.js"},
+//           plus "runs" (number of generate() calls, default 1) and "export" (default "generate")
+//   result: {"id": 1, "ok": true, "results": [...], "logs": [...], "ms": 12.3}
+//        or {"id": 1, "ok": false, "error": "...", "logs": [...], "ms": 0.4}
+// Non-finite numbers are written as the bare NaN / Infinity / -Infinity tokens that Python's json accepts.
+
+const Module = require("module");
+const path = require("path");
+const readline = require("readline");
+
+const write = process.stdout.write.bind(process.stdout);
+const MAX_LOGS = 20;
+let logs = [];
+
+// Generated code may log freely; keep that off the protocol stream and return it with the result
+for (const level of ["log", "info", "warn", "error", "debug"]) {
+    console[level] = (...args) => {
+        if (logs.length < MAX_LOGS) {
+            logs.push(args.map((arg) => (typeof arg === "string" ? arg : safeStringify(arg))).join(" "));
+        }
+    };
+}
+
+// Direct writes to stdout would end up in the protocol stream as well, so they are logged too
+process.stdout.write = (chunk, encoding, callback) => {
+    if (logs.length < MAX_LOGS) {
+        logs.push(String(chunk).replace(/\n$/, ""));
+    }
+    const done = typeof encoding === "function" ? encoding : callback;
+    if (typeof done === "function") {
+        done();
+    }
+    return true;
+};
+
+function safeStringify(value) {
+    try {
+        return JSON.stringify(value);
+    } catch (error) {
+        return String(value);
+    }
+}
+
+function encode(value) {
+    const text = JSON.stringify(value, (key, item) => {
+        if (typeof item === "number" && !Number.isFinite(item)) {
+            return `__${item}__`;
+        }
+        if (typeof item === "bigint") {
+            return Number(item);
+        }
+        return item;
+    });
+    return text.replace(/"__(NaN|Infinity|-Infinity)__"/g, "$1");
+}
+
+function loadModule(job) {
+    if (job.source !== undefined) {
+        const filename = path.resolve(job.filename || path.join(process.cwd(), "generated_server.js"));
+        const module = new Module(filename, null);
+        module.filename = filename;
+        module.paths = Module._nodeModulePaths(path.dirname(filename));
+        module._compile(job.source, filename);
+        return module.exports;
+    }
+    const filename = require.resolve(path.resolve(job.path));
+    // Load the current file contents rather than a cached copy from an earlier job
+    delete require.cache[filename];
+    return require(filename);
+}
+
+function runJob(job) {
+    const exports = loadModule(job);
+    const name = job.export || "generate";
+    const generate = typeof exports === "function" && name === "generate" ? exports : exports[name];
+    if (typeof generate !== "function") {
+        throw new Error(`Module does not export a '${name}' function`);
+    }
+    const results = [];
+    for (let run = 0; run < (job.runs || 1); run++) {
+        results.push(generate());
+    }
+    return results;
+}
+
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+    if (!line.trim()) {
+        return;
+    }
+    let job;
+    try {
+        job = JSON.parse(line);
+    } catch (error) {
+        write(encode({ id: null, ok: false, error: `Invalid job: ${error.message}`, logs: [] }) + "\n");
+        return;
+    }
+    logs = [];
+    const start = process.hrtime.bigint();
+    let response;
+    try {
+        response = { id: job.id, ok: true, results: runJob(job) };
+    } catch (error) {
+        response = { id: job.id, ok: false, error: error && error.stack ? error.stack.split("\n").slice(0, 3).join("\n") : String(error) };
+    }
+    response.logs = logs;
+    response.ms = Number(process.hrtime.bigint() - start) / 1e6;
+    let encoded;
+    try {
+        encoded = encode(response);
+    } catch (error) {
+        encoded = encode({ id: job.id, ok: false, error: `Result is not serialisable: ${error.message}`, logs, ms: response.ms });
+    }
+    write(encoded + "\n");
+});
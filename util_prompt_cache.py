@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import threading
+
+from langchain_core.load import dumpd, load
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+# Where prompts pulled from the LangChain hub are kept between runs
+PROMPT_CACHE_DIRECTORY = "prompt_cache"
+# Prompts the pipeline pulls, refreshed together by `python util_prompt_cache.py --refresh`
+HUB_PROMPTS = ["hwchase17/openai-functions-agent"]
+
+
+def _openai_functions_agent_prompt() -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", "You are a helpful assistant"),
+        MessagesPlaceholder(variable_name="chat_history", optional=True),
+        ("human", "{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+
+
+# Local copies used when a prompt is neither cached nor reachable on the hub
+VENDORED_PROMPTS = {
+    "hwchase17/openai-functions-agent": _openai_functions_agent_prompt,
+}
+
+_prompts = {}
+_lock = threading.Lock()
+
+
+def _cache_path(name: str) -> str:
+    return os.path.join(PROMPT_CACHE_DIRECTORY, name.replace("/", "__") + ".json")
+
+
+def _pull_from_hub(name: str):
+    """
+    Fetches `name` from the LangChain hub and stores it in the disk cache.
+    """
+    from langchain import hub
+
+    prompt = hub.pull(name)
+    os.makedirs(PROMPT_CACHE_DIRECTORY, exist_ok=True)
+    with open(_cache_path(name), "w") as file:
+        json.dump(dumpd(prompt), file, indent=2)
+    return prompt
+
+
+def pull_prompt(name: str, refresh: bool = False):
+    """
+    Returns a LangChain hub prompt without a network fetch on every call.
+
+    The prompt is looked up in a process-level memo, then in the disk cache, and
+    only then pulled from the hub (which fills the cache). If the hub cannot be
+    reached and a vendored copy exists, that copy is used instead.
+
+    Parameters:
+    name (str): The hub handle, e.g. "hwchase17/openai-functions-agent".
+    refresh (bool): Pull from the hub even if the prompt is cached.
+
+    Returns:
+    BasePromptTemplate: The prompt.
+    """
+    with _lock:
+        if not refresh and name in _prompts:
+            return _prompts[name]
+
+        prompt = None
+        if not refresh and os.path.isfile(_cache_path(name)):
+            try:
+                with open(_cache_path(name)) as file:
+                    prompt = load(json.load(file))
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable cached prompt {name}: {e}")
+        if prompt is None:
+            try:
+                prompt = _pull_from_hub(name)
+            except Exception as e:
+                if name not in VENDORED_PROMPTS:
+                    raise
+                print(f"Could not pull {name} from the hub ({e}), using the vendored copy")
+                prompt = VENDORED_PROMPTS[name]()
+        _prompts[name] = prompt
+        return prompt
+
+
+def refresh_prompts(names: list = None) -> list:
+    """
+    Pulls every listed prompt (default: HUB_PROMPTS) from the hub again and rewrites its cache file.
+
+    Returns:
+    list: The names that were refreshed.
+    """
+    names = names or HUB_PROMPTS
+    with _lock:
+        for name in names:
+            _prompts[name] = _pull_from_hub(name)
+            print(f"Refreshed {name} -> {_cache_path(name)}")
+    return names
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the local cache of LangChain hub prompts.")
+    parser.add_argument("--refresh", action="store_true", help="Pull the prompts from the hub again and overwrite the cache.")
+    parser.add_argument("names", nargs="*", help=f"Prompts to refresh (default: {', '.join(HUB_PROMPTS)}).")
+    arguments = parser.parse_args()
+    if arguments.refresh:
+        refresh_prompts(arguments.names)
+    else:
+        for name in arguments.names or HUB_PROMPTS:
+            print(f"{name}: {'cached' if os.path.isfile(_cache_path(name)) else 'not cached'} ({_cache_path(name)})")
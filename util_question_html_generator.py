@@ -2,55 +2,51 @@
 import os
 import re
 import warnings
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pprint import pprint
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
-# Third-party library imports
-import bs4
+# Utility imports
+from util_semantic_search import SemanticSearch
+from util_example_based_prompt import ExampleBasedPromptFormatter, PROMPT_BUDGETS
+from util_clients import get_chat_model
+from util_streaming import stream_until_fence
+from util_telemetry import get_telemetry, instrument
+from util_validation import validate_question_html_format
 
-# Langchain imports
-from langchain import hub
-from langchain.agents import create_openai_functions_agent, AgentExecutor, create_openai_tools_agent
-from langchain.chains.combine_documents import create_stuff_documents_chain
-from langchain.tools.retriever import create_retriever_tool
-from langchain.text_splitter import RecursiveCharacterTextSplitter, Language
-from langchain_core.output_parsers import StrOutputParser
+# Temperatures of the concurrent candidates, the first one keeps the deterministic setting
+CANDIDATE_TEMPERATURES = [0, 0.2, 0.4, 0.6, 0.8]
 
-# Langchain OpenAI imports
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
-# Langchain Community imports
-from langchain_community.vectorstores import Chroma
-from langchain_community.document_loaders import WebBaseLoader
+def build_question_html_prompt(question: str, api_key: str, csv_path: str, additional_instructions: str = None) -> str:
+    """
+    Retrieves similar examples and builds the question.html prompt.
 
-# Utility imports
-from util_semantic_search import SemanticSearch
-from util_example_based_prompt import ExampleBasedPromptFormatter
-from credential import api_key
+    Parameters:
+    question (str): The question content or text.
+    api_key (str): API key for the service.
+    csv_path (str): Path to the CSV file.
+    additional_instructions (str, optional): Extra instructions from the operator.
 
-def question_html_generator(question: str, api_key: str, csv_path: str, additional_instructions: str = None) -> str:
+    Returns:
+    str: The prompt.
+    """
     example_options = {
         "embedding_column": "question_embedding",
         "search_column": "question",
         "output_column": "question.html",
         "n_examples": 3
     }
-
-    llm_options = {
-        "llm_code_generation_model": "gpt-4",
-        "agent_model": "gpt-3.5-turbo-0125",
-        "retriever_model": "gpt-3.5-turbo-0125",
-        "temperature": 0,
-        "embedding_model": "text-embedding-ada-002"
-    }
+    embedding_model = "text-embedding-ada-002"
 
     # Initialize SemanticSearch instance
     semantic_search_instance = SemanticSearch(
         csv_path=csv_path,
         embedding_column_name=example_options["embedding_column"],
-        embedding_engine=llm_options["embedding_model"],
+        embedding_engine=embedding_model,
         api_key=api_key
     )
 
@@ -65,19 +61,105 @@ def question_html_generator(question: str, api_key: str, csv_path: str, addition
     examples_dict = extract_examples(question)
     
     base_template = "Generate a html code based on the following examples"
-    prompt = ExampleBasedPromptFormatter.run(examples_dict, base_template) + \
+    prompt = ExampleBasedPromptFormatter.run(examples_dict, base_template, token_budget=PROMPT_BUDGETS["question_html"]) + \
              f"\n new_question_input = {question}  delimit the generated html with ```insert_code_here```"
-    
+    return prompt
+
+
+def complete_question_html(prompt: str, api_key: str, temperature: float = None) -> str:
+    """
+    Runs the question.html completion for a prompt built by build_question_html_prompt.
+
+    Parameters:
+    prompt (str): The prompt.
+    api_key (str): API key for the service.
+    temperature (float, optional): Sampling temperature, defaults to the configured one.
+
+    Returns:
+    str: The generated html.
+    """
+    llm_options = {
+        "llm_code_generation_model": "gpt-4",
+        "agent_model": "gpt-3.5-turbo-0125",
+        "retriever_model": "gpt-3.5-turbo-0125",
+        "temperature": 0,
+        "embedding_model": "text-embedding-ada-002",
+        "stream": True  # Stop reading the completion once the html block is complete
+    }
+    if temperature is None:
+        temperature = llm_options["temperature"]
+
     # Define LLM and chain for HTML generation
-    llm = ChatOpenAI(model=llm_options["llm_code_generation_model"], api_key=api_key, temperature=llm_options["temperature"])
+    llm = get_chat_model(llm_options["llm_code_generation_model"], api_key, temperature=temperature)
+    if llm_options["stream"]:
+        return stream_until_fence(llm, prompt, "html")
+    from langchain_core.output_parsers import StrOutputParser
+
     output_parser = StrOutputParser()
     chain = llm | output_parser
-    html_generated = chain.invoke(prompt)
-    
-    return html_generated
+    return chain.invoke(prompt)
+
+
+@instrument("question_html")
+def question_html_generator(question: str, api_key: str, csv_path: str, additional_instructions: str = None) -> str:
+    prompt = build_question_html_prompt(question, api_key, csv_path, additional_instructions)
+    return complete_question_html(prompt, api_key)
+
+
+@instrument("question_html_candidates")
+def question_html_candidates(question: str, api_key: str, csv_path: str, n_candidates: int = 3, additional_instructions: str = None):
+    """
+    Generates several question.html candidates concurrently and returns the first one that passes validation.
+
+    The prompt is built once and the candidates only differ in temperature. Every
+    candidate runs on its own worker, so all requests start together; once a valid
+    one arrives the remaining requests are left to finish in the background and their
+    results are ignored.
+
+    Parameters:
+    question (str): The question content or text.
+    api_key (str): API key for the service.
+    csv_path (str): Path to the CSV file.
+    n_candidates (int): Number of concurrent candidates.
+    additional_instructions (str, optional): Extra instructions from the operator.
+
+    Returns:
+    tuple: (html, valid) with the first valid candidate, or the first candidate that
+           completed and False if none passed validation.
+    """
+    prompt = build_question_html_prompt(question, api_key, csv_path, additional_instructions)
+    temperatures = [CANDIDATE_TEMPERATURES[index % len(CANDIDATE_TEMPERATURES)] for index in range(n_candidates)]
+    executor = ThreadPoolExecutor(max_workers=n_candidates, thread_name_prefix="html_candidate")
+    futures = [
+        executor.submit(contextvars.copy_context().run, complete_question_html, prompt, api_key, temperature)
+        for temperature in temperatures
+    ]
+    first_completed = None
+    try:
+        for future in as_completed(futures):
+            try:
+                html = future.result()
+            except Exception as e:
+                print(f"question.html candidate failed: {e}")
+                continue
+            if first_completed is None:
+                first_completed = html
+            try:
+                validate_question_html_format(html)
+            except ValueError as e:
+                print(f"question.html candidate failed validation: {e}")
+                continue
+            get_telemetry().increment("html_candidates_discarded", sum(not other.done() for other in futures))
+            return html, True
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    if first_completed is None:
+        raise ValueError("Every question.html candidate failed.")
+    return first_completed, False
 
-# Example usage of the function
-csv_path = "Question_Embedding_20240128.csv"  # Replace with your actual CSV path
-question = "A car travels for a distance of 5mph for 30 minutes what is the distance traveled?"  # Replace with your actual question
-print(question_html_generator(question, api_key, csv_path))
+# # Example usage of the function
+# from credential import api_key
+# csv_path = "Question_Embedding_20240128.csv"  # Replace with your actual CSV path
+# question = "A car travels for a distance of 5mph for 30 minutes what is the distance traveled?"  # Replace with your actual question
+# print(question_html_generator(question, api_key, csv_path))
 
@@ -0,0 +1,328 @@
+import random
+import sys
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from util_telemetry import get_telemetry
+
+# Default behaviour of the shared governor
+GOVERNOR_OPTIONS = {
+    "initial_limit": 4,        # Concurrent requests allowed per model at start up
+    "min_limit": 1,
+    "max_limit": 32,
+    "max_retries": 5,          # Retries for rate limited or transient failures
+    "base_delay": 1.0,         # Seconds, first backoff step
+    "max_delay": 60.0,         # Seconds, cap for a single backoff step
+    "decrease_factor": 0.5,    # Multiplicative decrease when a 429 is observed
+}
+
+
+class RetryableHTTPError(Exception):
+    """
+    Raised by callers that talk to the API without the OpenAI SDK when a response
+    should be retried (429 or 5xx).
+
+    Attributes:
+        status_code (int): The HTTP status code of the response.
+        retry_after (float): Seconds the server asked us to wait, if it said so.
+    """
+
+    def __init__(self, status_code: int, retry_after: float = None):
+        super().__init__(f"Retryable HTTP status {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def parse_retry_after(headers) -> float:
+    """
+    Reads the wait time requested by the server from response headers.
+
+    Parameters:
+    headers (Mapping): Response headers.
+
+    Returns:
+    float: Seconds to wait, or None if the headers do not say.
+    """
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(error: Exception):
+    """
+    Decides whether a failed request should be retried.
+
+    Parameters:
+    error (Exception): The error raised by the request.
+
+    Returns:
+    tuple: (retryable, throttled, retry_after) where throttled is True for 429 responses.
+    """
+    if isinstance(error, RetryableHTTPError):
+        return True, error.status_code == 429, error.retry_after
+    # An OpenAI error can only have been raised once the SDK is imported, so there is no need to import it here
+    openai = sys.modules.get("openai")
+    if openai is None:
+        return False, False, None
+    if isinstance(error, openai.RateLimitError):
+        return True, True, parse_retry_after(error.response.headers)
+    if isinstance(error, openai.APIStatusError):
+        retry_after = parse_retry_after(error.response.headers)
+        return error.status_code >= 500 or error.status_code == 409, False, retry_after
+    if isinstance(error, openai.APIConnectionError):
+        return True, False, None
+    return False, False, None
+
+
+class ModelLimiter:
+    """
+    Tracks the concurrency limit for a single model and adjusts it AIMD-style:
+    the limit grows by roughly one slot per window of successful calls and is cut
+    multiplicatively when the API throttles us.
+
+    Latency is only reported, not used to cut the limit: short metadata calls and long
+    streamed generations share a model, so a slow call is not a sign of congestion.
+    """
+
+    def __init__(self, options: dict):
+        self.options = options
+        self.limit = float(options["initial_limit"])
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.average_latency = None
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            self.requests += 1
+
+    def release(self, latency: float, throttled: bool):
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self.limit = max(self.options["min_limit"], self.limit * self.options["decrease_factor"])
+            else:
+                self.limit = min(self.options["max_limit"], self.limit + 1 / self.limit)
+            if not throttled:
+                self.average_latency = latency if self.average_latency is None else 0.8 * self.average_latency + 0.2 * latency
+            self._condition.notify_all()
+
+    def record_retry(self):
+        with self._condition:
+            self.retries += 1
+
+    def metrics(self) -> dict:
+        with self._condition:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "retries": self.retries,
+                "average_latency": self.average_latency,
+            }
+
+
+class GovernedStream:
+    """
+    A streamed response that keeps its governor slot until it is exhausted or closed.
+
+    Iterating, closing and the context manager protocol are passed to the wrapped
+    stream; the slot is released exactly once, when iteration ends, fails or the
+    stream is closed.
+    """
+
+    def __init__(self, stream, release):
+        self._stream = stream
+        self._iterator = iter(stream)
+        self._release = release
+        self._released = False
+        self._lock = threading.Lock()
+
+    def _finish(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._release()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            self._finish()
+            raise
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        """
+        Closes the wrapped stream, which ends the HTTP response, and releases the slot.
+        """
+        try:
+            close = getattr(self._stream, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._finish()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class RequestGovernor:
+    """
+    Shared gate for every API request made by the pipeline.
+
+    Each model gets its own ModelLimiter. Calls wait for a free slot, failed calls
+    are retried with exponential backoff and full jitter, and a server supplied
+    Retry-After always takes precedence over the computed delay.
+    """
+
+    def __init__(self, **options):
+        self.options = {**GOVERNOR_OPTIONS, **options}
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def _limiter(self, model: str) -> ModelLimiter:
+        with self._lock:
+            limiter = self._limiters.get(model)
+            if limiter is None:
+                limiter = ModelLimiter(self.options)
+                self._limiters[model] = limiter
+            return limiter
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Returns a full-jitter exponential backoff delay for the given attempt (0 based).
+        """
+        ceiling = min(self.options["max_delay"], self.options["base_delay"] * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Sleeps before retry number `attempt` of a caller side retry loop.
+
+        Parameters:
+        attempt (int): Zero based index of the attempt that just failed.
+
+        Returns:
+        float: The number of seconds slept.
+        """
+        delay = self.backoff_delay(attempt)
+        get_telemetry().increment("retries")
+        time.sleep(delay)
+        return delay
+
+    def call(self, model: str, fn, /, *args, **kwargs):
+        """
+        Runs `fn(*args, **kwargs)` as a request against `model`.
+
+        Parameters:
+        model (str): The model the request is billed against; limits are kept per model.
+        fn (callable): The function performing the request.
+
+        Returns:
+        The return value of `fn`.
+
+        Raises:
+        Exception: The last error once retries are exhausted, or any non retryable error.
+        """
+        return self._call(model, fn, args, kwargs, stream=False)
+
+    def open_stream(self, model: str, fn, /, *args, **kwargs) -> GovernedStream:
+        """
+        Runs `fn(*args, **kwargs)`, a request that returns a streamed response, against `model`.
+
+        Opening the stream is retried like call(), but the slot stays taken while the body
+        is read, so long streamed generations count against the model's concurrency limit.
+
+        Returns:
+        GovernedStream: The stream; exhaust or close it to release the slot.
+        """
+        return self._call(model, fn, args, kwargs, stream=True)
+
+    def _call(self, model: str, fn, args: tuple, kwargs: dict, stream: bool):
+        limiter = self._limiter(model or "default")
+        attempt = 0
+        while True:
+            limiter.acquire()
+            start = time.monotonic()
+            throttled = False
+            held = False
+            try:
+                result = fn(*args, **kwargs)
+                if stream:
+                    held = True
+                    return GovernedStream(result, lambda start=start: limiter.release(time.monotonic() - start, False))
+                return result
+            except Exception as e:
+                retryable, throttled, retry_after = classify_error(e)
+                if not retryable or attempt >= self.options["max_retries"]:
+                    raise
+            finally:
+                if not held:
+                    limiter.release(time.monotonic() - start, throttled)
+
+            delay = retry_after if retry_after is not None else self.backoff_delay(attempt)
+            limiter.record_retry()
+            get_telemetry().increment("retries")
+            print(f"Request to {model} failed ({'rate limited' if throttled else 'transient error'}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+    def metrics(self) -> dict:
+        """
+        Returns the current limit and counters for every model seen so far.
+        """
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {model: limiter.metrics() for model, limiter in limiters.items()}
+
+
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> RequestGovernor:
+    """
+    Returns the process-wide request governor.
+    """
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = RequestGovernor()
+        return _governor
@@ -1,11 +1,24 @@
+from __future__ import annotations
+
 import sys
 import os
 import logging
-import pandas as pd
 import ast
 import re
-from openai import OpenAI
-import numpy as np
+import threading
+
+from util_lazy_import import lazy_import
+
+from util_clients import get_openai_client
+from util_telemetry import get_telemetry, instrument
+from util_tracing import get_tracer
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+# Processed dataframes shared by every CSVDataHandler, keyed by file, embedding column and file version
+_dataframe_cache = {}
+_dataframe_cache_lock = threading.Lock()
 
 
 
@@ -185,12 +198,32 @@ class CSVDataHandler:
             self._load_and_process_data()
         return self._dataframe
 
-    def _load_and_process_data(self):
+    def _cache_key(self):
+        path = self.file_handler.csv_path
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), self.embedding_column_name, stat.st_mtime_ns, stat.st_size)
+
+    def _load_and_process_data(self, use_cache: bool = True):
         """
         Private method to load data from the CSV file and process it using the EmbeddingColumnProcessor.
-        """
-        self._dataframe = self.file_handler.load_data()
-        self._dataframe = self.embedding_processor.process_dataframe(self._dataframe)
+
+        Parsing the embedding column dominates start up, so the processed DataFrame is shared
+        between handlers of the same file until the file changes on disk.
+        """
+        key = self._cache_key()
+        with _dataframe_cache_lock:
+            if use_cache and key is not None and key in _dataframe_cache:
+                self._dataframe = _dataframe_cache[key]
+                return
+            self._dataframe = self.file_handler.load_data()
+            self._dataframe = self.embedding_processor.process_dataframe(self._dataframe)
+            if key is not None:
+                for stale in [cached for cached in _dataframe_cache if cached[:2] == key[:2]]:
+                    del _dataframe_cache[stale]
+                _dataframe_cache[key] = self._dataframe
 
     def refresh_data(self):
         """
@@ -198,7 +231,7 @@ class CSVDataHandler:
         This is useful if the CSV file has been updated or if a reprocessing is required.
         """
         self._dataframe = None
-        self._load_and_process_data()
+        self._load_and_process_data(use_cache=False)
         
 
 
@@ -231,7 +264,7 @@ class SemanticSearch:
         self.embedding_engine = embedding_engine
         self.csv_data_handler = CSVDataHandler(csv_path, embedding_column_name)
         self.dataframe = self.csv_data_handler.dataframe()
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
 
     def _validate_column(self, column_name: str):
         """
@@ -259,6 +292,7 @@ class SemanticSearch:
         if not isinstance(input_string, str):
             raise TypeError("Expected input to be a string.")
 
+    @instrument("retrieval")
     def semantic_search(self, input_string: str, search_column: str, n_examples: int, similarity_threshold=0.7):
         """
         Performs a semantic search on the DataFrame, returning examples similar to the input string.
@@ -285,18 +319,21 @@ class SemanticSearch:
 
         try:
             # Replace the following line with actual embedding generation using the specified engine
-            question_embedding_response = self.client.embeddings.create(input = input_string, model=self.embedding_engine)  # Placeholder function
+            with get_telemetry().stage("embed"):
+                question_embedding_response = self.client.embeddings.create(input = input_string, model=self.embedding_engine)  # Placeholder function
 
             question_embedding = question_embedding_response.data[0].embedding
              
-            similarities = [
-                (index, row[search_column], np.dot(row[self.embedding_column_name], question_embedding))
-                for index, row in self.dataframe.iterrows() 
-                if self.embedding_column_name in row and isinstance(row[self.embedding_column_name], list)
-            ]
+            with get_telemetry().stage("score"):
+                similarities = [
+                    (index, row[search_column], np.dot(row[self.embedding_column_name], question_embedding))
+                    for index, row in self.dataframe.iterrows() 
+                    if self.embedding_column_name in row and isinstance(row[self.embedding_column_name], list)
+                ]
 
-            filtered_similarities = [entry for entry in similarities if entry[2] >= similarity_threshold]
-            sorted_matches = sorted(filtered_similarities, key=lambda x: x[2], reverse=True)[:n_examples]
+                filtered_similarities = [entry for entry in similarities if entry[2] >= similarity_threshold]
+                sorted_matches = sorted(filtered_similarities, key=lambda x: x[2], reverse=True)[:n_examples]
+                get_tracer().set_attribute("matches", len(sorted_matches))
 
             return sorted_matches
 
@@ -327,14 +364,25 @@ class SemanticSearch:
 
         semantic_results = self.semantic_search(input_string, search_column, n_examples)
 
+        # The row identity lets the prompt formatter reuse the example block it rendered before
+        from util_example_based_prompt import rendered_column_name
+
+        source = self.csv_data_handler._cache_key()
+        rendered_column = rendered_column_name(search_column, output_column)
         all_examples = []
         for results in semantic_results:
             if isinstance(results, tuple) and len(results) == 3:
                 index, input_answer, _ = results
                 example = {
                     "input": input_answer,
-                    "output": self.dataframe.loc[index, output_column]
+                    "output": self.dataframe.loc[index, output_column],
+                    "row_id": index,
+                    "source": source,
+                    "search_column": search_column,
+                    "output_column": output_column
                 }
+                if rendered_column in self.dataframe.columns and isinstance(self.dataframe.loc[index, rendered_column], str):
+                    example["rendered"] = self.dataframe.loc[index, rendered_column]
                 all_examples.append(example)
             else:
                 print(f"Unexpected format for 'results': {results}")
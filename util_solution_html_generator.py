@@ -8,20 +8,16 @@ from pprint import pprint
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
-# Third-party library imports
-import bs4
-
-# langchain imports
-from langchain import hub
-from langchain.tools.retriever import create_retriever_tool
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-# langchain_community imports
-from langchain_core.output_parsers import StrOutputParser
 # Utility imports
 from util_semantic_search import SemanticSearch
-from util_example_based_prompt import ExampleBasedPromptFormatter
+from util_example_based_prompt import ExampleBasedPromptFormatter, PROMPT_BUDGETS, estimate_tokens, trim_to_tokens
+from util_clients import get_chat_model
+from util_hedging import get_hedger
+from util_telemetry import instrument
+from util_string_extraction import extract_generate_function
 
 
+@instrument("solution_html")
 def question_solution_guide(question:str,api_key:str,csv_path:str,solution_guide:str=None,code_guide:str=None):
     example_options = {
     "embedding_column": "question_embedding",
@@ -52,9 +48,11 @@ def question_solution_guide(question:str,api_key:str,csv_path:str,solution_guide
         return examples
     examples_dict = extract_examples(question)
     
+    # Static instructions go first and unchanged in every call so the provider can cache them as a prefix
     base_template = ""
+    guide_section = ""
     if solution_guide:
-        template_with_guide = f"""
+        template_with_guide = """
         Objective:
         Develop an HTML module to generate comprehensive solutions and step-by-step guides for STEM problems. Utilize specific HTML tags for structural organization and LaTeX for mathematical equations and symbols.
 
@@ -84,12 +82,12 @@ def question_solution_guide(question:str,api_key:str,csv_path:str,solution_guide
 
         Task:
         - Develop an HTML module to create solutions and guides for STEM problems based on structured HTML questions.
-        - The provided solution guide format is as follows: {solution_guide}.
-        - Analyze example HTML questions and create guides that align with the provided format.
+        - Analyze example HTML questions and create guides that align with the provided solution guide format given below.
         
         delimit the html  in ```insert_html_solution_guide```
         """
         base_template = template_with_guide
+        guide_section = f"The provided solution guide format is as follows: {solution_guide}.\n"
         
         # print(base_template)
 
@@ -102,26 +100,42 @@ def question_solution_guide(question:str,api_key:str,csv_path:str,solution_guide
         delimit the html  in ```insert_html_solution_guide```
         """
     
-    prompt=ExampleBasedPromptFormatter.run(examples_dict,base_template) + f"\n new_question_input = {question}  delimit the generated html with ```insert_code_here```"
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    budget = PROMPT_BUDGETS["solution_html"] - estimate_tokens(base_template)
+    examples_section = ExampleBasedPromptFormatter.run(examples_dict,guide_section,token_budget=budget) + f"\n new_question_input = {question}  delimit the generated html with ```insert_code_here```"
+    prompt = [SystemMessage(content=base_template), HumanMessage(content=examples_section)]
     # Define LLM 
     # print(prompt)
-    llm = ChatOpenAI(model = llm_options["llm_code_generation_model"],api_key=api_key,temperature=llm_options["temperature"])
+    llm = get_chat_model(llm_options["llm_code_generation_model"], api_key, temperature=llm_options["temperature"])
+    from langchain_core.output_parsers import StrOutputParser
+
     output_parser = StrOutputParser()
     chain = llm | output_parser
-    solution_generated = chain.invoke(prompt)
+    hedger = get_hedger()
+    solution_generated = hedger.call(llm_options["llm_code_generation_model"], llm_options["temperature"], chain.invoke, prompt)
     
     if code_guide:
-        solution_improvement= f"""Given the current HTML module for STEM problem-solving, your task is to enhance it using the provided code as a foundational guide. This code is designed to dynamically generate problem parameters and their correct answers. Your objective is to integrate these elements into the HTML solution guide effectively.
+        # Only the generate() function is needed to place the params and correct_answers placeholders
+        code_guide = str(getattr(code_guide, "content", code_guide))
+        code_guide = trim_to_tokens(extract_generate_function(code_guide) or code_guide, PROMPT_BUDGETS["code_guide"])
+        improvement_instructions = """Given the current HTML module for STEM problem-solving, your task is to enhance it using the provided code as a foundational guide. This code is designed to dynamically generate problem parameters and their correct answers. Your objective is to integrate these elements into the HTML solution guide effectively.
         Your Specific Tasks:
         1. **Review the Current ssolution guide  **: 
-        Begin by examining the provided HTML solution guide  {solution_generated}. 
-        2. **Integrate Dynamic Content Using Placeholders**: Insert placeholders into the HTML that correspond to the outputs of the code found in the params datastructure. Use placeholders like `{{params.placeholder_value}}` or `{{correct_answers.placeholder_value}}` that align with the variable names and data formats in the code. This ensures the HTML will dynamically display the correct data when the module runs.
+        Begin by examining the provided HTML solution guide below. 
+        2. **Integrate Dynamic Content Using Placeholders**: Insert placeholders into the HTML that correspond to the outputs of the code found in the params datastructure. Use placeholders like `{params.placeholder_value}` or `{correct_answers.placeholder_value}` that align with the variable names and data formats in the code. This ensures the HTML will dynamically display the correct data when the module runs.
+        """
+        solution_improvement = [
+            SystemMessage(content=improvement_instructions),
+            HumanMessage(content=f"""HTML solution guide:
+         {solution_generated}
          Reference Code for Integration:
          {code_guide}
           Include your revised HTML code below:
         ```insert revised html code here```
-        """
-        solution_generated = chain.invoke(solution_improvement)
+        """)
+        ]
+        solution_generated = hedger.call(llm_options["llm_code_generation_model"], llm_options["temperature"], chain.invoke, solution_improvement)
     # print(code_guide)
     return solution_generated.replace("{", "{{").replace("}", "}}")
 
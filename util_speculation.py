@@ -0,0 +1,112 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from util_telemetry import get_telemetry
+
+# Default behaviour of speculative generation, which is opt-in
+SPECULATION_OPTIONS = {
+    "max_workers": 8,
+}
+
+
+class SpeculativeGenerator:
+    """
+    Starts generation stages for questions before the operator has confirmed them.
+
+    Each stage is submitted under the question it belongs to, together with a
+    fingerprint of the inputs that may still change (e.g. additional instructions).
+    When the pipeline later reaches that stage it calls take(): a finished or running
+    result with a matching fingerprint is used, anything else is discarded and the
+    stage runs normally.
+
+    Discarding a question cancels its stages that have not started. A request that is
+    already in flight cannot be recalled, so its result is simply dropped.
+    """
+
+    def __init__(self, **options):
+        self.options = {**SPECULATION_OPTIONS, **options}
+        self._executor = ThreadPoolExecutor(max_workers=self.options["max_workers"], thread_name_prefix="speculative")
+        self._tasks = {}
+        self._lock = threading.Lock()
+
+    def submit(self, question: str, stage: str, fn, *args, fingerprint=None, **kwargs):
+        """
+        Starts `fn(*args, **kwargs)` in the background as `stage` of `question`.
+
+        Parameters:
+        question (str): The question the stage belongs to.
+        stage (str): The stage name, e.g. "metadata" or "question_html".
+        fn (callable): The function performing the stage.
+        fingerprint (hashable, optional): The inputs the result depends on that may still change.
+        """
+        def run():
+            with get_telemetry().stage(f"speculative:{stage}"):
+                return fn(*args, **kwargs)
+
+        with self._lock:
+            future = self._executor.submit(contextvars.copy_context().run, run)
+            self._tasks[(question, stage)] = (future, fingerprint)
+
+    def take(self, question: str, stage: str, fingerprint=None):
+        """
+        Returns the speculative result of `stage` for `question`, waiting for it if it is still running.
+
+        Parameters:
+        question (str): The question.
+        stage (str): The stage name.
+        fingerprint (hashable, optional): The inputs the caller is about to use.
+
+        Returns:
+        The result, or None if there is no usable result and the stage has to run normally.
+        """
+        with self._lock:
+            task = self._tasks.pop((question, stage), None)
+        if task is None:
+            return None
+        future, expected = task
+        if expected != fingerprint:
+            future.cancel()
+            get_telemetry().increment("speculation_misses")
+            print(f"Discarding speculative {stage}: its inputs changed")
+            return None
+        try:
+            result = future.result()
+        except Exception as e:
+            get_telemetry().increment("speculation_misses")
+            print(f"Speculative {stage} failed, running it again: {e}")
+            return None
+        get_telemetry().increment("speculation_hits")
+        return result
+
+    def discard(self, question: str):
+        """
+        Cancels and forgets every stage started for `question`.
+        """
+        with self._lock:
+            keys = [key for key in self._tasks if key[0] == question]
+            tasks = [self._tasks.pop(key) for key in keys]
+        for future, _ in tasks:
+            future.cancel()
+        if tasks:
+            get_telemetry().increment("speculation_discarded", len(tasks))
+
+    def keep_only(self, questions: list):
+        """
+        Discards the speculative work of every question not in `questions`.
+        """
+        with self._lock:
+            started = {question for question, _ in self._tasks}
+        for question in started - set(questions):
+            self.discard(question)
+
+    def shutdown(self):
+        """
+        Cancels whatever has not started and releases the worker threads.
+        """
+        with self._lock:
+            tasks = list(self._tasks.values())
+            self._tasks.clear()
+        for future, _ in tasks:
+            future.cancel()
+        self._executor.shutdown(wait=False)
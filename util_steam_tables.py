@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+
+from util_lazy_import import lazy_import
+from util_symbol_index import SYMBOL_INDEX_OPTIONS, load_data_table
+
+np = lazy_import("numpy")
+
+# Steam table files in stable_properties and the short names of their columns
+STEAM_TABLE_FILES = {
+    "saturated_by_pressure": "saturated_by_pressure_V1.4.json",
+    "saturated_by_temperature": "saturated_by_temperature_V1.5.json",
+    "compressed_superheated": "compressed_liquid_and_superheated_steam_V1.3.json",
+}
+SATURATED_PROPERTIES = ["vf", "vg", "uf", "ug", "ufg", "hf", "hg", "hfg", "sf", "sg", "sfg"]
+STEAM_TABLE_COLUMNS = {
+    "saturated_by_pressure": ["P", "T"] + SATURATED_PROPERTIES,
+    "saturated_by_temperature": ["T", "P"] + SATURATED_PROPERTIES,
+    "compressed_superheated": ["P", "T", "v", "rho", "u", "h", "s", "phase"],
+}
+# Phases of the compressed liquid and superheated table, grouped so interpolation never crosses the saturation line
+PHASE_GROUPS = {
+    "liquid": 0,
+    "saturated liquid": 0,
+    "vapor": 1,
+    "saturated vapor": 1,
+    "supercritical fluid": 2,
+}
+PHASE_NAMES = {0: "liquid", 1: "vapor", 2: "supercritical fluid", -1: "mixed"}
+# The module compile_steam_tables() writes for generated server.js code, next to the tables it is compiled from
+COMPILED_MODULE = "steam_tables_compiled.js"
+# The function of the compiled module that looks values up in each table
+COMPILED_LOOKUPS = {
+    "saturated_by_pressure": "saturatedByPressure",
+    "saturated_by_temperature": "saturatedByTemperature",
+    "compressed_superheated": "steamProperties",
+}
+
+
+def _interpolate_1d(x_table: np.ndarray, y_table: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Linear interpolation of every column of `y_table` at each x, NaN outside the table.
+
+    `x_table` must be ascending; repeated values (e.g. the saturation rows) are allowed.
+    """
+    upper = np.clip(np.searchsorted(x_table, x, side="right"), 1, len(x_table) - 1)
+    lower = upper - 1
+    width = x_table[upper] - x_table[lower]
+    weight = np.divide(x - x_table[lower], width, out=np.zeros_like(x, dtype=float), where=width != 0)
+    values = y_table[lower] + (y_table[upper] - y_table[lower]) * weight[:, None]
+    outside = (x < x_table[0]) | (x > x_table[-1]) | np.isnan(x)
+    values[outside] = np.nan
+    return values
+
+
+class SteamTables:
+    """
+    The stable_properties steam tables as sorted NumPy arrays with vectorised lookups.
+
+    The saturated tables are interpolated linearly in their first column. The compressed
+    liquid and superheated table is sorted by the combined key (pressure index, temperature)
+    so one searchsorted call brackets the temperature of every query at both neighbouring
+    pressures; the four corners are then interpolated bilinearly. A query whose corners lie
+    on both sides of the saturation line, or outside the tabulated range, returns NaN.
+    """
+
+    def __init__(self, source_path: str = SYMBOL_INDEX_OPTIONS["source_path"]):
+        self.source_path = source_path
+        self.saturated = {}
+        for name in ("saturated_by_pressure", "saturated_by_temperature"):
+            _, _, table = load_data_table(os.path.join(source_path, STEAM_TABLE_FILES[name]))
+            rows = np.array(table["data"], dtype=float)
+            self.saturated[name] = rows[np.argsort(rows[:, 0], kind="stable")]
+
+        _, _, table = load_data_table(os.path.join(source_path, STEAM_TABLE_FILES["compressed_superheated"]))
+        rows = table["data"]
+        values = np.array([row[:7] for row in rows], dtype=float)
+        phases = np.array([PHASE_GROUPS.get(row[7], -1) for row in rows], dtype=np.int8)
+        order = np.lexsort((values[:, 1], values[:, 0]))
+        self.values = values[order]
+        self.phases = phases[order]
+        self.pressures, self.segment_starts = np.unique(self.values[:, 0], return_index=True)
+        self.segment_ends = np.append(self.segment_starts[1:], len(self.values))
+        # Temperatures of different pressures never overlap in the combined key
+        self._span = float(self.values[:, 1].max() - self.values[:, 1].min()) + 1.0
+        pressure_index = np.repeat(np.arange(len(self.pressures)), self.segment_ends - self.segment_starts)
+        self._keys = pressure_index * self._span + self.values[:, 1]
+
+    def saturated_by_pressure(self, pressure) -> dict:
+        """
+        Saturation properties at the given pressures in MPa.
+
+        Parameters:
+        pressure (float or array-like): Pressures in MPa.
+
+        Returns:
+        dict: {column: np.ndarray} for the columns of STEAM_TABLE_COLUMNS["saturated_by_pressure"].
+        """
+        return self._saturated("saturated_by_pressure", pressure)
+
+    def saturated_by_temperature(self, temperature) -> dict:
+        """
+        Saturation properties at the given temperatures in °C.
+
+        Parameters:
+        temperature (float or array-like): Temperatures in °C.
+
+        Returns:
+        dict: {column: np.ndarray} for the columns of STEAM_TABLE_COLUMNS["saturated_by_temperature"].
+        """
+        return self._saturated("saturated_by_temperature", temperature)
+
+    def _saturated(self, name: str, x) -> dict:
+        table = self.saturated[name]
+        values = _interpolate_1d(table[:, 0], table, np.atleast_1d(np.asarray(x, dtype=float)))
+        return {column: values[:, index] for index, column in enumerate(STEAM_TABLE_COLUMNS[name])}
+
+    def _bracket_temperature(self, pressure_index: np.ndarray, temperature: np.ndarray):
+        """
+        Returns the rows bracketing each temperature within the segment of each pressure index,
+        the interpolation weight and whether the temperature lies inside the segment.
+        """
+        starts = self.segment_starts[pressure_index]
+        ends = self.segment_ends[pressure_index]
+        upper = np.searchsorted(self._keys, pressure_index * self._span + temperature, side="right")
+        upper = np.clip(upper, starts + 1, ends - 1)
+        lower = upper - 1
+        t_lower, t_upper = self.values[lower, 1], self.values[upper, 1]
+        inside = (temperature >= self.values[starts, 1]) & (temperature <= self.values[ends - 1, 1])
+        width = t_upper - t_lower
+        weight = np.divide(temperature - t_lower, width, out=np.zeros_like(temperature), where=width != 0)
+        return lower, upper, weight, inside
+
+    def properties(self, pressure, temperature) -> dict:
+        """
+        Compressed liquid, superheated vapour or supercritical properties at (P, T) pairs.
+
+        Parameters:
+        pressure (float or array-like): Pressures in MPa.
+        temperature (float or array-like): Temperatures in °C, broadcast against `pressure`.
+
+        Returns:
+        dict: {"P", "T", "v", "rho", "u", "h", "s": np.ndarray, "phase": np.ndarray of str}.
+              Rows outside the table or across the saturation line are NaN with phase "mixed".
+        """
+        pressure, temperature = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(pressure, dtype=float)),
+            np.atleast_1d(np.asarray(temperature, dtype=float)),
+        )
+        pressure = pressure.astype(float).ravel()
+        temperature = temperature.astype(float).ravel()
+
+        low = np.clip(np.searchsorted(self.pressures, pressure, side="right") - 1, 0, len(self.pressures) - 2)
+        high = low + 1
+        p_width = self.pressures[high] - self.pressures[low]
+        p_weight = (pressure - self.pressures[low]) / p_width
+        in_range = (pressure >= self.pressures[0]) & (pressure <= self.pressures[-1])
+
+        corners, corner_phases, corner_used, inside = [], [], [], in_range.copy()
+        for pressure_index, used in ((low, p_weight < 1), (high, p_weight > 0)):
+            lower, upper, weight, segment_inside = self._bracket_temperature(pressure_index, temperature)
+            corners.append(self.values[lower] + (self.values[upper] - self.values[lower]) * weight[:, None])
+            corner_phases += [self.phases[lower], self.phases[upper]]
+            # A corner without weight, e.g. the other pressure on an exact pressure match, is ignored
+            corner_used += [used & (weight < 1), used & (weight > 0)]
+            inside &= segment_inside | ~used
+        values = corners[0] + (corners[1] - corners[0]) * p_weight[:, None]
+        values[:, 0], values[:, 1] = pressure, temperature
+
+        corner_phases = np.stack(corner_phases, axis=1)
+        corner_used = np.stack(corner_used, axis=1)
+        has_liquid = ((corner_phases == 0) & corner_used).any(axis=1)
+        has_vapor = ((corner_phases == 1) & corner_used).any(axis=1)
+        unknown = ((corner_phases < 0) & corner_used).any(axis=1)
+        valid = inside & ~(has_liquid & has_vapor) & ~unknown
+        values[~valid, 2:] = np.nan
+
+        dominant = np.where(has_vapor, 1, np.where(has_liquid, 0, 2))
+        phase = np.array([PHASE_NAMES[group] for group in np.where(valid, dominant, -1)])
+        result = {column: values[:, index] for index, column in enumerate(STEAM_TABLE_COLUMNS["compressed_superheated"][:-1])}
+        result["phase"] = phase
+        return result
+
+
+def _js_array(kind: str, values) -> str:
+    numbers = ",".join(repr(float(value)).removesuffix(".0") for value in values)
+    return f"new {kind}([{numbers}])"
+
+
+def _js_columns(table: np.ndarray, columns: list, indent: str = "    ") -> str:
+    return "\n".join(f"{indent}{column}: {_js_array('Float64Array', table[:, index])}," for index, column in enumerate(columns))
+
+
+def compile_steam_tables(source_path: str = SYMBOL_INDEX_OPTIONS["source_path"], output_path: str = None) -> str:
+    """
+    Writes the steam tables as a self-contained CommonJS module of pre-sorted typed arrays with lookup helpers.
+
+    Generated server.js code requires this module instead of parsing the JSON tables and scanning
+    them row by row on every generate() call. Its lookups use binary search and the same
+    interpolation rules as SteamTables, so SteamTables can check their answers. Rerun it whenever
+    a table in `source_path` changes.
+
+    Parameters:
+    source_path (str): Directory holding the steam table files.
+    output_path (str, optional): The module to write, defaults to COMPILED_MODULE in `source_path`.
+
+    Returns:
+    str: The path of the written module.
+    """
+    tables = SteamTables(source_path)
+    if (tables.phases < 0).any():
+        raise ValueError(f"Unknown phase in {STEAM_TABLE_FILES['compressed_superheated']}, expected one of {sorted(PHASE_GROUPS)}")
+    output_path = output_path or os.path.join(source_path, COMPILED_MODULE)
+    sources = ", ".join(STEAM_TABLE_FILES.values())
+    module = COMPILED_MODULE_TEMPLATE.format(
+        sources=sources,
+        saturated_by_pressure=_js_columns(tables.saturated["saturated_by_pressure"], STEAM_TABLE_COLUMNS["saturated_by_pressure"]),
+        saturated_by_temperature=_js_columns(tables.saturated["saturated_by_temperature"], STEAM_TABLE_COLUMNS["saturated_by_temperature"]),
+        pressures=_js_array("Float64Array", tables.pressures),
+        starts=_js_array("Uint32Array", np.append(tables.segment_starts, len(tables.values))),
+        superheated=_js_columns(tables.values[:, 1:], STEAM_TABLE_COLUMNS["compressed_superheated"][1:-1]),
+        phases=_js_array("Uint8Array", tables.phases),
+        phase_names=", ".join(f'"{PHASE_NAMES[group]}"' for group in range(3)),
+    )
+    with open(output_path, "w", encoding="utf-8") as file:
+        file.write(module)
+    print(f"Compiled {len(tables.values)} property rows and {sum(len(table) for table in tables.saturated.values())} saturation rows into {output_path} ({len(module) // 1024} KB)")
+    return output_path
+
+
+COMPILED_MODULE_TEMPLATE = """/**
+ * Compiled steam tables: water properties for fast lookups in generated question code.
+ *
+ * Usage:
+ * const {{ steamProperties, saturatedByPressure, saturatedByTemperature }} = require('./steam_tables_compiled');
+ *
+ * Generated by util_steam_tables.compile_steam_tables from {sources}; do not edit by hand.
+ * Units: P in MPa, T in °C, v in m^3/kg, rho in kg/m^3, u and h in kJ/kg, s in kJ/(kg K).
+ * Every lookup returns NaN properties outside the tabulated range.
+ */
+
+"use strict";
+
+const SATURATED_BY_PRESSURE = {{
+{saturated_by_pressure}
+}};
+
+const SATURATED_BY_TEMPERATURE = {{
+{saturated_by_temperature}
+}};
+
+// Rows sorted by pressure, then temperature; the rows of PRESSURES[i] are STARTS[i] .. STARTS[i + 1] - 1
+const PRESSURES = {pressures};
+const STARTS = {starts};
+const PROPERTIES = {{
+{superheated}
+    phase: {phases},
+}};
+const PHASE_NAMES = [{phase_names}];
+const SATURATED_PROPERTIES = ["vf", "vg", "uf", "ug", "ufg", "hf", "hg", "hfg", "sf", "sg", "sfg"];
+const PROPERTY_COLUMNS = ["v", "rho", "u", "h", "s"];
+
+// Index of the first element of values[lo .. hi - 1] greater than value
+function upperBound(values, value, lo, hi) {{
+    while (lo < hi) {{
+        const mid = (lo + hi) >>> 1;
+        if (values[mid] <= value) {{
+            lo = mid + 1;
+        }} else {{
+            hi = mid;
+        }}
+    }}
+    return lo;
+}}
+
+// Bracketing rows lower/upper of value within rows start .. end - 1 of the sorted column keys
+function bracket(keys, value, start, end) {{
+    const upper = Math.min(Math.max(upperBound(keys, value, start, end), start + 1), end - 1);
+    const lower = upper - 1;
+    const width = keys[upper] - keys[lower];
+    return {{
+        lower,
+        upper,
+        weight: width !== 0 ? (value - keys[lower]) / width : 0,
+        inside: value >= keys[start] && value <= keys[end - 1],
+    }};
+}}
+
+function saturated(table, key, other, value) {{
+    const keys = table[key];
+    const {{ lower, upper, weight, inside }} = bracket(keys, value, 0, keys.length);
+    const result = {{}};
+    for (const column of [key, other, ...SATURATED_PROPERTIES]) {{
+        result[column] = inside ? table[column][lower] + (table[column][upper] - table[column][lower]) * weight : NaN;
+    }}
+    return result;
+}}
+
+/**
+ * const {{ saturatedByPressure }} = require('./steam_tables_compiled');
+ * Saturated water and steam properties at a pressure, interpolated linearly in P.
+ * @param {{number}} P - Pressure in MPa.
+ * @returns {{Object}} {{ P, T, vf, vg, uf, ug, ufg, hf, hg, hfg, sf, sg, sfg }}: saturation temperature in °C and the liquid (f), vapor (g) and vaporization (fg) properties.
+ */
+function saturatedByPressure(P) {{
+    return saturated(SATURATED_BY_PRESSURE, "P", "T", P);
+}}
+
+/**
+ * const {{ saturatedByTemperature }} = require('./steam_tables_compiled');
+ * Saturated water and steam properties at a temperature, interpolated linearly in T.
+ * @param {{number}} T - Temperature in °C.
+ * @returns {{Object}} {{ T, P, vf, vg, uf, ug, ufg, hf, hg, hfg, sf, sg, sfg }}: saturation pressure in MPa and the liquid (f), vapor (g) and vaporization (fg) properties.
+ */
+function saturatedByTemperature(T) {{
+    return saturated(SATURATED_BY_TEMPERATURE, "T", "P", T);
+}}
+
+/**
+ * const {{ steamProperties }} = require('./steam_tables_compiled');
+ * Compressed liquid, superheated steam or supercritical water properties at a pressure and temperature,
+ * interpolated bilinearly in T and P. Points between a liquid and a vapor table row (across the
+ * saturation line) have no single-phase value: use saturatedByPressure or saturatedByTemperature there.
+ * @param {{number}} P - Pressure in MPa.
+ * @param {{number}} T - Temperature in °C.
+ * @returns {{Object}} {{ P, T, v, rho, u, h, s, phase }}: phase is "liquid", "vapor", "supercritical fluid", or "mixed" with NaN properties when the point cannot be interpolated.
+ */
+function steamProperties(P, T) {{
+    const result = {{ P, T, v: NaN, rho: NaN, u: NaN, h: NaN, s: NaN, phase: "mixed" }};
+    const last = PRESSURES.length - 1;
+    if (!(P >= PRESSURES[0] && P <= PRESSURES[last])) {{
+        return result;
+    }}
+    const low = Math.min(Math.max(upperBound(PRESSURES, P, 0, PRESSURES.length) - 1, 0), last - 1);
+    const pressureWeight = (P - PRESSURES[low]) / (PRESSURES[low + 1] - PRESSURES[low]);
+    const corners = [[low, 1 - pressureWeight], [low + 1, pressureWeight]];
+    const values = [0, 0, 0, 0, 0];
+    let liquid = false;
+    let vapor = false;
+    for (const [index, share] of corners) {{
+        // A pressure without weight, e.g. the other one on an exact pressure match, is ignored
+        if (share <= 0) {{
+            continue;
+        }}
+        const {{ lower, upper, weight, inside }} = bracket(PROPERTIES.T, T, STARTS[index], STARTS[index + 1]);
+        if (!inside) {{
+            return result;
+        }}
+        for (const [row, rowShare] of [[lower, 1 - weight], [upper, weight]]) {{
+            if (rowShare <= 0) {{
+                continue;
+            }}
+            liquid = liquid || PROPERTIES.phase[row] === 0;
+            vapor = vapor || PROPERTIES.phase[row] === 1;
+        }}
+        PROPERTY_COLUMNS.forEach((column, position) => {{
+            const data = PROPERTIES[column];
+            values[position] += share * (data[lower] + (data[upper] - data[lower]) * weight);
+        }});
+    }}
+    if (liquid && vapor) {{
+        return result;
+    }}
+    PROPERTY_COLUMNS.forEach((column, position) => {{
+        result[column] = values[position];
+    }});
+    result.phase = PHASE_NAMES[vapor ? 1 : liquid ? 0 : 2];
+    return result;
+}}
+
+/**
+ * const {{ steamTableRange }} = require('./steam_tables_compiled');
+ * The tabulated pressures and the temperature range at each, for picking random states that steamProperties can evaluate.
+ * @returns {{Object}} {{ pressures: number[], temperatures: Array<[number, number]> }} with pressures in MPa and [min, max] temperatures in °C.
+ */
+function steamTableRange() {{
+    return {{
+        pressures: Array.from(PRESSURES),
+        temperatures: Array.from(PRESSURES, (_, index) => [PROPERTIES.T[STARTS[index]], PROPERTIES.T[STARTS[index + 1] - 1]]),
+    }};
+}}
+
+module.exports = {{
+    steamProperties,
+    saturatedByPressure,
+    saturatedByTemperature,
+    steamTableRange
+}};
+"""
+
+
+_steam_tables = None
+_steam_tables_lock = threading.Lock()
+
+
+def get_steam_tables() -> SteamTables:
+    """
+    Returns the process-wide steam tables, loading them on first use.
+    """
+    global _steam_tables
+    with _steam_tables_lock:
+        if _steam_tables is None:
+            _steam_tables = SteamTables()
+        return _steam_tables
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Look up water properties in the stable_properties steam tables.")
+    parser.add_argument("pressure", type=float, nargs="?", help="Pressure in MPa.")
+    parser.add_argument("temperature", type=float, nargs="?", help="Temperature in °C; omit for saturation properties at the pressure.")
+    parser.add_argument("--compile", action="store_true", help=f"Write {COMPILED_MODULE} for generated server.js code instead of looking up a state.")
+    arguments = parser.parse_args()
+    if arguments.compile:
+        compile_steam_tables()
+        raise SystemExit(0)
+    if arguments.pressure is None:
+        parser.error("the pressure is required unless --compile is given")
+    tables = get_steam_tables()
+    if arguments.temperature is None:
+        result = tables.saturated_by_pressure(arguments.pressure)
+    else:
+        result = tables.properties(arguments.pressure, arguments.temperature)
+    for column, values in result.items():
+        print(f"{column:<6}{values[0]}")
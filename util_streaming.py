@@ -0,0 +1,117 @@
+from util_telemetry import get_telemetry
+
+# Info strings of the fences that hold each kind of artifact
+FENCE_LANGUAGES = {
+    "javascript": ("javascript", "js"),
+    "html": ("html", "insert_code_here"),
+}
+
+# OpenAI roles of the LangChain message types used in prompts
+MESSAGE_ROLES = {
+    "system": "system",
+    "human": "user",
+    "ai": "assistant",
+}
+
+
+class FenceParser:
+    """
+    Finds the first fenced code block of the given languages in text that arrives in chunks.
+
+    Fences of other languages are skipped whole. Once the closing fence of a matching
+    block has arrived, feed() returns True and `block` holds the code between the fences.
+    """
+
+    def __init__(self, languages):
+        self.languages = tuple(language.lower() for language in languages)
+        self.text = ""
+        self.block = None
+        self.end = None
+        self._scan = 0
+        self._body_start = None
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Adds a chunk of the completion.
+
+        Parameters:
+        chunk (str): The next piece of text.
+
+        Returns:
+        bool: True once a complete matching block has been seen.
+        """
+        self.text += chunk
+        if self.block is not None:
+            return True
+        while self._body_start is None:
+            start = self.text.find("```", self._scan)
+            if start < 0:
+                # Keep the last two characters, they may be the start of a split fence
+                self._scan = max(0, len(self.text) - 2)
+                return False
+            line_end = self.text.find("\n", start)
+            if line_end < 0:
+                self._scan = start
+                return False
+            info = self.text[start + 3:line_end].strip().lower()
+            if info in self.languages:
+                self._body_start = self._scan = line_end + 1
+                break
+            close = self.text.find("```", line_end + 1)
+            if close < 0:
+                self._scan = start
+                return False
+            self._scan = close + 3
+
+        close = self.text.find("```", self._scan)
+        if close < 0:
+            self._scan = max(self._body_start, len(self.text) - 2)
+            return False
+        self.block = self.text[self._body_start:close]
+        self.end = close + 3
+        return True
+
+
+def chat_messages(prompt) -> list:
+    """
+    Converts a prompt as accepted by a LangChain chat model into OpenAI chat messages.
+
+    Parameters:
+    prompt (str or list): A string, or a list of LangChain messages.
+
+    Returns:
+    list: [{"role", "content"}] dicts.
+    """
+    if isinstance(prompt, str):
+        return [{"role": "user", "content": prompt}]
+    return [{"role": MESSAGE_ROLES[message.type], "content": message.content} for message in prompt]
+
+
+def stream_until_fence(llm, prompt, kind: str) -> str:
+    """
+    Streams a chat completion and stops reading as soon as the first code block of `kind` is complete.
+
+    The request goes straight to the governed OpenAI client of `llm`, so the stream can be
+    closed when the block is complete: closing ends the HTTP response, the model stops
+    generating the prose after the code and the connection goes back to the pool.
+
+    Parameters:
+    llm (ChatOpenAI): The chat model, as returned by get_chat_model().
+    prompt: The prompt, a string or a list of LangChain messages.
+    kind (str): A key of FENCE_LANGUAGES, e.g. "javascript" or "html".
+
+    Returns:
+    str: The completion up to and including the closing fence, or the whole completion
+         if no complete block was found.
+    """
+    parser = FenceParser(FENCE_LANGUAGES[kind])
+    params = {"model": llm.model_name, "temperature": llm.temperature, **llm.model_kwargs}
+    if llm.max_tokens is not None:
+        params["max_tokens"] = llm.max_tokens
+    with llm.client.create(messages=chat_messages(prompt), stream=True, **params) as stream:
+        for chunk in stream:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content and parser.feed(content):
+                get_telemetry().increment("stream_early_stops")
+                return parser.text[:parser.end]
+    return parser.text
@@ -69,4 +69,20 @@ def extract_content_from_triple_quote(input_string):
     # Extracting content inside the triple quotes
     extracted_contents = [match[3:-3] for match in matches]
 
-    return extracted_contents
\ No newline at end of file
+    return extracted_contents
+
+def extract_generate_function(code):
+    """
+    Extracts the 'generate' function from JavaScript code, fenced or not, dropping the
+    requires above it and the exports below it.
+
+    Parameters:
+    code (str): JavaScript source or a completion containing it.
+
+    Returns:
+    str: The code from 'const generate =' up to 'module.exports', or None if it is not found.
+    """
+    generate_function_match = re.search(r'(const generate\s*=.*?)(?:module\.exports|```|$)', code, re.DOTALL)
+    if generate_function_match:
+        return generate_function_match.group(1).strip()
+    return None
@@ -0,0 +1,386 @@
+import json
+import math
+import os
+import re
+import threading
+
+# What the symbol index reads and how many snippets it hands to a prompt
+SYMBOL_INDEX_OPTIONS = {
+    "source_path": "stable_properties",
+    "max_symbols": 4,
+    "min_score": 1.0,
+    "name_weight": 3.0,       # A query term matching the symbol name counts this much more than one in the docs
+    "example_rows": 2,        # Rows of each steam table shown in its snippet
+    "exclude": ["package.json", "package-lock.json"],  # npm manifests, not data tables
+}
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "get", "given", "has", "if", "in", "is", "it",
+    "its", "of", "on", "or", "that", "the", "this", "to", "was", "what", "which", "with", "you", "your", "value",
+    "values", "number", "const", "let", "var", "return", "function", "require", "module", "exports", "param",
+    "returns", "object", "string", "div", "span", "class", "pl", "question", "panel", "answer", "label", "true",
+}
+
+JSDOC_PATTERN = re.compile(r"/\*\*(.*?)\*/", re.S)
+DECLARATION_PATTERN = re.compile(
+    r"\s*(?:(?:const|let|var)\s+(?P<const>\w+)\s*=\s*(?P<rhs>\(|function|\{|\[|async)"
+    r"|function\s+(?P<function>\w+)\s*\("
+    r"|class\s+(?P<class>\w+))"
+)
+METHOD_PATTERN = re.compile(r"/\*\*(.*?)\*/\s*(?P<name>\w+)\s*\((?P<args>[^)]*)\)\s*\{", re.S)
+EXPORTS_PATTERN = re.compile(r"module\.exports\s*=\s*\{(.*?)\}", re.S)
+PROPERTY_NAME_PATTERN = re.compile(r"[\"']?(\w[\w ]*?)[\"']?\s*:")
+
+
+def tokenize(text: str) -> list:
+    """
+    Splits text, identifiers and markup into lower case search terms.
+
+    camelCase and snake_case identifiers are split into their words, so
+    "getFluidProperties" yields "fluid" and "properties".
+
+    Parameters:
+    text (str): The text to tokenize.
+
+    Returns:
+    list: The search terms, stopwords removed.
+    """
+    text = re.sub(r"<[^>]+>", " ", text)
+    text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
+    terms = []
+    for word in re.findall(r"[A-Za-z]+", text):
+        word = word.lower()
+        if len(word) > 1 and word not in STOPWORDS:
+            terms.append(word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word)
+    return terms
+
+
+def _clean_doc(doc: str) -> str:
+    lines = [re.sub(r"^\s*\*+ ?", "", line).rstrip() for line in doc.strip().splitlines()]
+    return "\n".join(line for line in lines if line.strip()).strip()
+
+
+def _mask_comments(source: str) -> str:
+    """
+    Blanks out comments while keeping every offset, so declarations quoted in doc comments are not matched.
+    """
+    return re.sub(r"/\*.*?\*/|//[^\n]*", lambda match: re.sub(r"[^\n]", " ", match.group(0)), source, flags=re.S)
+
+
+def _matching_brace(source: str, start: int) -> int:
+    """
+    Returns the index just past the bracket closing the one at `start`, skipping strings and comments.
+    """
+    pairs = {"{": "}", "[": "]", "(": ")"}
+    stack = []
+    i = start
+    while i < len(source):
+        char = source[i]
+        if char in "\"'`":
+            end = i + 1
+            while end < len(source) and source[end] != char:
+                end += 2 if source[end] == "\\" else 1
+            i = end
+        elif source.startswith("//", i):
+            i = source.find("\n", i)
+            i = len(source) if i < 0 else i
+        elif source.startswith("/*", i):
+            i = source.find("*/", i)
+            i = len(source) if i < 0 else i + 1
+        elif char in pairs:
+            stack.append(pairs[char])
+        elif stack and char == stack[-1]:
+            stack.pop()
+            if not stack:
+                return i + 1
+        i += 1
+    return len(source)
+
+
+class CodeSymbol:
+    """
+    An exported helper, data object or data table from the stable_properties code base.
+
+    Attributes:
+        name (str): The exported name, e.g. "getFluidProperties" or "UnitConverter.convert".
+        kind (str): "function", "class", "method", "data" or "table".
+        file (str): The file the symbol is defined in.
+        usage (str): How generated code imports the symbol.
+        doc (str): The doc comment, or a generated description for tables.
+        signature (str): The declaration line.
+        keywords (list): Extra search terms such as property names or table headers.
+    """
+
+    def __init__(self, name, kind, file, usage, doc="", signature="", keywords=None):
+        self.name = name
+        self.kind = kind
+        self.file = file
+        self.usage = usage
+        self.doc = doc
+        self.signature = signature
+        self.keywords = list(keywords or [])
+        self.name_terms = set(tokenize(name))
+        self.terms = set(tokenize(" ".join([name, doc, " ".join(self.keywords)])))
+
+    def snippet(self) -> str:
+        """
+        Returns the text injected into the generation prompt for this symbol.
+        """
+        parts = [f"// {self.name} ({self.kind}, {self.file})", self.usage]
+        if self.doc:
+            parts.append("/**\n" + "\n".join(f" * {line}" for line in self.doc.splitlines()) + "\n */")
+        if self.signature:
+            parts.append(self.signature)
+        return "\n".join(parts)
+
+
+def parse_js_module(path: str) -> list:
+    """
+    Extracts the exported functions, classes (with their documented methods) and data
+    objects of a CommonJS module together with their JSDoc comments.
+
+    Parameters:
+    path (str): Path to the .js file.
+
+    Returns:
+    list: CodeSymbol entries for every exported name that could be located.
+    """
+    with open(path, encoding="utf-8-sig") as file:
+        source = file.read()
+    file_name = os.path.basename(path)
+    module = os.path.splitext(file_name)[0]
+    exports_match = EXPORTS_PATTERN.search(source)
+    if not exports_match:
+        return []
+    exported = [re.sub(r"//.*", "", name).strip() for name in re.sub(r"//[^\n]*", "", exports_match.group(1)).split(",")]
+    exported = [name.split(":")[0].strip() for name in exported if name.strip()]
+
+    code = _mask_comments(source)
+    docs = {}
+    for match in JSDOC_PATTERN.finditer(source):
+        declaration = DECLARATION_PATTERN.match(source, match.end())
+        if declaration:
+            name = declaration.group("const") or declaration.group("function") or declaration.group("class")
+            docs[name] = _clean_doc(match.group(1))
+    # A module exporting a single class documents it in the file header
+    header = JSDOC_PATTERN.match(source.lstrip())
+    if header and len(exported) == 1 and exported[0] not in docs:
+        docs[exported[0]] = _clean_doc(header.group(1))
+
+    symbols = []
+    for name in exported:
+        declaration = re.search(rf"(?:(?:const|let|var)\s+{name}\s*=|function\s+{name}\s*\(|class\s+{name}\b)", code)
+        if not declaration:
+            continue
+        doc = docs.get(name, "")
+        line_end = source.find("\n", declaration.start())
+        signature = source[declaration.start():line_end if line_end > 0 else None].strip()
+        usage = f"const {{ {name} }} = require('./{module}');"
+        body_start = code.find("{", declaration.end() - 1)
+        body = source[body_start:_matching_brace(source, body_start)] if body_start >= 0 else ""
+
+        if signature.startswith("class"):
+            symbols.append(CodeSymbol(name, "class", file_name, usage, doc, signature.rstrip("{ ").strip()))
+            for method in METHOD_PATTERN.finditer(body):
+                symbols.append(CodeSymbol(
+                    f"{name}.{method.group('name')}",
+                    "method",
+                    file_name,
+                    f"{usage}\nconst instance = new {name}();",
+                    _clean_doc(method.group(1)),
+                    f"{method.group('name')}({method.group('args').strip()})",
+                ))
+        elif re.search(rf"{name}\s*=\s*\{{", signature):
+            keys = sorted({key.strip() for key in PROPERTY_NAME_PATTERN.findall(body)})
+            entries = ", ".join(keys)
+            symbols.append(CodeSymbol(name, "data", file_name, usage, doc, f"const {name} = {{ /* keys: {entries} */ }}", keys))
+        else:
+            identifiers = sorted(set(re.findall(r"[A-Za-z_]\w{3,}", _mask_comments(body))))
+            symbols.append(CodeSymbol(name, "function", file_name, usage, doc, signature.rstrip("{ ").strip(), identifiers))
+    return symbols
+
+
+def load_data_table(path: str) -> tuple:
+    """
+    Reads one of the steam table files, which are JSON objects wrapped as JavaScript:
+    an optional byte order mark, a JSDoc header and a `const name =` prefix.
+
+    Parameters:
+    path (str): Path to the table file.
+
+    Returns:
+    tuple: (const name, header doc, parsed JSON object).
+    """
+    with open(path, encoding="utf-8-sig") as file:
+        source = file.read()
+    doc_match = JSDOC_PATTERN.search(source)
+    doc = _clean_doc(doc_match.group(1)) if doc_match else ""
+    declaration = re.search(r"(?:const|let|var)\s+(\w+)\s*=", source)
+    if not declaration:
+        raise ValueError(f"No table declaration found in {path}")
+    body_start = source.index("{", declaration.end())
+    table = json.loads(source[body_start:_matching_brace(source, body_start)])
+    return declaration.group(1), doc, table
+
+
+def parse_data_table(path: str, example_rows: int = 2) -> list:
+    """
+    Describes a steam table file by its title, column headers and the range of each numeric column.
+
+    Parameters:
+    path (str): Path to the table file.
+    example_rows (int): Number of rows to quote in the description.
+
+    Returns:
+    list: A single CodeSymbol of kind "table".
+    """
+    name, doc, table = load_data_table(path)
+    headers = table.get("headers", [])
+    rows = table.get("data", [])
+    columns = []
+    for index, header in enumerate(headers):
+        numbers = [row[index] for row in rows if index < len(row) and isinstance(row[index], (int, float))]
+        if numbers:
+            columns.append(f"{index}: {header} [{min(numbers)} .. {max(numbers)}]")
+        else:
+            values = sorted({str(row[index]) for row in rows if index < len(row)})
+            columns.append(f"{index}: {header} {{{', '.join(values)}}}")
+    description = "\n".join(
+        [f"{table.get('title', name)} (version {table.get('version', '?')}), {len(rows)} rows. Columns:"]
+        + columns
+        + ["Example rows:"]
+        + [json.dumps(row) for row in rows[:example_rows]]
+    )
+    file_name = os.path.basename(path)
+    usage = f"// Table `{name}` from {file_name}: rows are arrays ordered like the columns below."
+    summary = doc.split("\n\n")[0] if doc else ""
+    keywords = headers + [table.get("title", "")] + [summary]
+    return [CodeSymbol(name, "table", file_name, usage, description, "", keywords)]
+
+
+def link_compiled_tables(symbols: list) -> list:
+    """
+    Points each steam table at its lookup helper in the compiled table module, when both are indexed.
+
+    The helper takes over the table's search terms, so questions about the table find it, and
+    the table's usage line tells generated code to call the helper instead of loading the file.
+
+    Parameters:
+    symbols (list): CodeSymbol entries of the code base.
+
+    Returns:
+    list: The same symbols.
+    """
+    from util_steam_tables import COMPILED_LOOKUPS, COMPILED_MODULE, STEAM_TABLE_FILES
+
+    by_file = {(symbol.file, symbol.name): symbol for symbol in symbols}
+    tables = {symbol.file: symbol for symbol in symbols if symbol.kind == "table"}
+    for table_key, helper_name in COMPILED_LOOKUPS.items():
+        helper = by_file.get((COMPILED_MODULE, helper_name))
+        table = tables.get(STEAM_TABLE_FILES[table_key])
+        if helper is None or table is None:
+            continue
+        helper.keywords += table.keywords
+        helper.terms |= set(tokenize(" ".join(table.keywords)))
+        table.usage = f"// Table `{table.name}` from {table.file}. Do not load or search it in generate(); call {helper_name}() instead:\n{helper.usage}"
+    return symbols
+
+
+class SymbolIndex:
+    """
+    A deterministic keyword index over the stable_properties helpers.
+
+    Every exported function, class method and data object of the .js modules is
+    indexed with its JSDoc comment and property names, and every steam table with
+    its title and column headers. A query is scored with TF-IDF style weights, so the
+    snippets relevant to a question can be put straight into the generation prompt
+    instead of being looked up by an agent.
+    """
+
+    def __init__(self, symbols: list, **options):
+        self.options = {**SYMBOL_INDEX_OPTIONS, **options}
+        self.symbols = symbols
+        document_frequency = {}
+        for symbol in symbols:
+            for term in symbol.terms:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        self.idf = {term: math.log(1 + len(symbols) / count) for term, count in document_frequency.items()}
+
+    @classmethod
+    def build(cls, source_path: str = None, **options):
+        """
+        Parses every .js module and steam table in `source_path`.
+
+        Parameters:
+        source_path (str, optional): Directory holding the helpers, defaults to SYMBOL_INDEX_OPTIONS["source_path"].
+
+        Returns:
+        SymbolIndex: The index.
+        """
+        options = {**SYMBOL_INDEX_OPTIONS, **options}
+        source_path = source_path or options["source_path"]
+        symbols = []
+        for file_name in sorted(os.listdir(source_path)):
+            path = os.path.join(source_path, file_name)
+            if file_name in options["exclude"]:
+                continue
+            try:
+                if file_name.endswith(".js"):
+                    symbols += parse_js_module(path)
+                elif file_name.endswith(".json"):
+                    symbols += parse_data_table(path, options["example_rows"])
+            except (OSError, ValueError) as e:
+                print(f"Skipping {file_name} in symbol index: {e}")
+        return cls(link_compiled_tables(symbols), **options)
+
+    def score(self, symbol: CodeSymbol, query_terms: set) -> float:
+        score = 0.0
+        for term in query_terms & symbol.terms:
+            weight = self.idf.get(term, 0.0)
+            score += weight * (self.options["name_weight"] if term in symbol.name_terms else 1.0)
+        return score
+
+    def search(self, query: str, k: int = None) -> list:
+        """
+        Returns the symbols most relevant to `query`.
+
+        Parameters:
+        query (str): The question, its HTML or a solution guide.
+        k (int, optional): Maximum number of symbols, defaults to the max_symbols option.
+
+        Returns:
+        list: (symbol, score) tuples sorted by descending score, above the min_score option.
+        """
+        query_terms = set(tokenize(query))
+        scored = [(symbol, self.score(symbol, query_terms)) for symbol in self.symbols]
+        scored = [entry for entry in scored if entry[1] >= self.options["min_score"]]
+        scored.sort(key=lambda entry: (-entry[1], entry[0].name))
+        return scored[:k or self.options["max_symbols"]]
+
+    def format_snippets(self, query: str, k: int = None) -> str:
+        """
+        Returns the snippets of the symbols relevant to `query`, ready to paste into a prompt,
+        or an empty string if nothing scored high enough.
+        """
+        return "\n\n".join(symbol.snippet() for symbol, _ in self.search(query, k))
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def get_symbol_index(source_path: str = None) -> SymbolIndex:
+    """
+    Returns the symbol index for `source_path`, rebuilding it when a file in it has changed.
+    """
+    source_path = source_path or SYMBOL_INDEX_OPTIONS["source_path"]
+    stamp = tuple(
+        (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in sorted(os.scandir(source_path), key=lambda entry: entry.name)
+    )
+    with _lock:
+        cached = _indexes.get(source_path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, SymbolIndex.build(source_path))
+            _indexes[source_path] = cached
+        return cached[1]
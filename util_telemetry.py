@@ -0,0 +1,260 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from util_lazy_import import lazy_import
+from util_tracing import get_tracer
+
+np = lazy_import("numpy")
+
+SUMMARY_PERCENTILES = (50, 95, 99)
+
+
+def cached_prompt_tokens(usage) -> int:
+    """
+    Returns `usage.prompt_tokens_details.cached_tokens`, the prompt tokens served from the provider's prefix cache.
+
+    Older SDK versions keep the field as a plain dict, so both shapes are read. Responses
+    without the field count as 0.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    if details is None and isinstance(usage, dict):
+        details = usage.get("prompt_tokens_details")
+    if isinstance(details, dict):
+        return details.get("cached_tokens") or 0
+    return getattr(details, "cached_tokens", 0) or 0
+
+
+class PipelineTelemetry:
+    """
+    Collects per-stage wall time, token usage and counters (retries, cache hits) for a run
+    of the generation pipeline, and exports them locally as JSON lines or in the
+    Prometheus text format.
+
+    Stages nest: tokens and counters are attributed to the innermost open stage. The
+    stage stack lives in a context variable, so work submitted to a thread pool with
+    contextvars.copy_context().run keeps the stage of the code that submitted it.
+    Every stage is also opened as a span of the process-wide tracer, and counters are
+    added to the current span as events.
+    """
+
+    def __init__(self):
+        self._events = []
+        self._lock = threading.Lock()
+        self._stages = contextvars.ContextVar("telemetry_stages", default=())
+
+    def current_stage(self) -> str:
+        """
+        Returns the innermost open stage, or None.
+        """
+        stages = self._stages.get()
+        return stages[-1] if stages else None
+
+    def _add(self, event: dict):
+        event["timestamp"] = time.time()
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Times the enclosed block as one occurrence of stage `name`.
+
+        Parameters:
+        name (str): The stage name, e.g. "retrieval" or "question_html".
+        """
+        token = self._stages.set(self._stages.get() + (name,))
+        start = time.perf_counter()
+        ok = False
+        try:
+            with get_tracer().span(name):
+                yield
+            ok = True
+        finally:
+            self._stages.reset(token)
+            self.record_stage(name, time.perf_counter() - start, ok)
+
+    def record_stage(self, name: str, seconds: float, ok: bool = True):
+        """
+        Records one occurrence of stage `name` timed by the caller, for work such as a
+        streamed response that does not fit in a single with block.
+        """
+        self._add({"type": "stage", "stage": name, "seconds": seconds, "ok": ok})
+
+    def record_tokens(self, prompt_tokens: int, completion_tokens: int, model: str = None, stage: str = None, cached_tokens: int = 0):
+        """
+        Records token usage of one API call against `stage` (default: the current stage).
+        `cached_tokens` is the part of the prompt the provider served from its prefix cache.
+        """
+        self._add({
+            "type": "tokens",
+            "stage": stage or self.current_stage(),
+            "model": model,
+            "prompt_tokens": prompt_tokens or 0,
+            "completion_tokens": completion_tokens or 0,
+            "cached_tokens": cached_tokens or 0,
+        })
+
+    def record_usage(self, response, model: str = None, stage: str = None):
+        """
+        Records the `usage` block of an OpenAI response, if it has one.
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        self.record_tokens(
+            getattr(usage, "prompt_tokens", 0),
+            getattr(usage, "completion_tokens", 0),
+            model=model or getattr(response, "model", None),
+            stage=stage,
+            cached_tokens=cached_prompt_tokens(usage),
+        )
+
+    def increment(self, counter: str, amount: int = 1, stage: str = None):
+        """
+        Increments a named counter such as "retries" or "cache_hits".
+        """
+        self._add({"type": "counter", "counter": counter, "stage": stage or self.current_stage(), "value": amount})
+        get_tracer().add_event(counter, value=amount)
+
+    def events(self) -> list:
+        with self._lock:
+            return list(self._events)
+
+    def summary(self) -> dict:
+        """
+        Summarises the run per stage.
+
+        Returns:
+        dict: {stage: {"count", "total_seconds", "p50", "p95", "p99", "prompt_tokens",
+               "completion_tokens", "cached_tokens", "events": {counter: total}}}
+        """
+        stages = {}
+
+        def entry(stage):
+            return stages.setdefault(stage or "unstaged", {"durations": [], "prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0, "events": {}})
+
+        for event in self.events():
+            if event["type"] == "stage":
+                entry(event["stage"])["durations"].append(event["seconds"])
+            elif event["type"] == "tokens":
+                stats = entry(event["stage"])
+                stats["prompt_tokens"] += event["prompt_tokens"]
+                stats["completion_tokens"] += event["completion_tokens"]
+                stats["cached_tokens"] += event.get("cached_tokens", 0)
+            elif event["type"] == "counter":
+                counters = entry(event["stage"])["events"]
+                counters[event["counter"]] = counters.get(event["counter"], 0) + event["value"]
+
+        summary = {}
+        for stage, stats in stages.items():
+            durations = stats.pop("durations")
+            summary[stage] = {"count": len(durations), "total_seconds": float(np.sum(durations)) if durations else 0.0}
+            for percentile in SUMMARY_PERCENTILES:
+                summary[stage][f"p{percentile}"] = float(np.percentile(durations, percentile)) if durations else None
+            summary[stage].update(stats)
+        return summary
+
+    def write_jsonl(self, path: str, extra: dict = None):
+        """
+        Writes every recorded event as one JSON object per line, followed by a summary line.
+
+        Parameters:
+        path (str): The output file.
+        extra (dict, optional): Additional metrics (e.g. governor limits) to include in the summary line.
+        """
+        with open(path, "w") as file:
+            for event in self.events():
+                file.write(json.dumps(event) + "\n")
+            file.write(json.dumps({"type": "summary", "stages": self.summary(), **(extra or {})}) + "\n")
+
+    def write_prometheus(self, path: str, gauges: dict = None):
+        """
+        Writes the run summary in the Prometheus text exposition format.
+
+        Parameters:
+        path (str): The output file.
+        gauges (dict, optional): {metric_name: {label_value: value}} for additional gauges,
+                                 exported with a `model` label.
+        """
+        lines = [
+            "# HELP pipeline_stage_seconds Wall time spent in each pipeline stage.",
+            "# TYPE pipeline_stage_seconds summary",
+        ]
+        summary = self.summary()
+        for stage, stats in summary.items():
+            for percentile in SUMMARY_PERCENTILES:
+                if stats[f"p{percentile}"] is not None:
+                    lines.append(f'pipeline_stage_seconds{{stage="{stage}",quantile="{percentile / 100}"}} {stats[f"p{percentile}"]}')
+            lines.append(f'pipeline_stage_seconds_sum{{stage="{stage}"}} {stats["total_seconds"]}')
+            lines.append(f'pipeline_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+        lines += ["# HELP pipeline_tokens_total Tokens consumed per stage.", "# TYPE pipeline_tokens_total counter"]
+        for stage, stats in summary.items():
+            lines.append(f'pipeline_tokens_total{{stage="{stage}",kind="prompt"}} {stats["prompt_tokens"]}')
+            lines.append(f'pipeline_tokens_total{{stage="{stage}",kind="completion"}} {stats["completion_tokens"]}')
+            lines.append(f'pipeline_tokens_total{{stage="{stage}",kind="cached_prompt"}} {stats["cached_tokens"]}')
+        lines += ["# HELP pipeline_events_total Retries, cache hits and other counted events per stage.", "# TYPE pipeline_events_total counter"]
+        for stage, stats in summary.items():
+            for counter, value in stats["events"].items():
+                lines.append(f'pipeline_events_total{{stage="{stage}",event="{counter}"}} {value}')
+        for metric, values in (gauges or {}).items():
+            lines.append(f"# TYPE {metric} gauge")
+            for label, value in values.items():
+                if value is not None:
+                    lines.append(f'{metric}{{model="{label}"}} {value}')
+        with open(path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def export(self, path: str, extra: dict = None):
+        """
+        Exports the run to `path`, as Prometheus text for a .prom file and JSON lines otherwise.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if path.endswith(".prom"):
+            gauges = {}
+            for model, metrics in (extra or {}).get("governor", {}).items():
+                gauges.setdefault("request_governor_limit", {})[model] = metrics["limit"]
+                gauges.setdefault("request_governor_throttled", {})[model] = metrics["throttled"]
+            self.write_prometheus(path, gauges)
+        else:
+            self.write_jsonl(path, extra)
+
+    def print_summary(self):
+        """
+        Prints a p50/p95/p99 table of every stage.
+        """
+        summary = self.summary()
+        print(f"{'Stage':<32}{'Count':>7}{'Total (s)':>11}{'p50':>9}{'p95':>9}{'p99':>9}{'Prompt tok':>12}{'Cached tok':>12}{'Compl tok':>11}")
+        print("-" * 112)
+        for stage, stats in sorted(summary.items(), key=lambda item: -item[1]["total_seconds"]):
+            p50, p95, p99 = (f"{stats[f'p{p}']:.2f}" if stats[f"p{p}"] is not None else "-" for p in SUMMARY_PERCENTILES)
+            print(f"{stage:<32}{stats['count']:>7}{stats['total_seconds']:>11.2f}{p50:>9}{p95:>9}{p99:>9}{stats['prompt_tokens']:>12}{stats['cached_tokens']:>12}{stats['completion_tokens']:>11}")
+
+
+_telemetry = PipelineTelemetry()
+
+
+def get_telemetry() -> PipelineTelemetry:
+    """
+    Returns the process-wide telemetry collector.
+    """
+    return _telemetry
+
+
+def instrument(stage_name: str):
+    """
+    Decorator that records every call of the wrapped function as stage `stage_name`.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with get_telemetry().stage(stage_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -15,7 +15,6 @@ from langchain_community.vectorstores import Chroma
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough, RunnableParallel
 from langchain_core.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.messages import AIMessage, HumanMessage
 from util_code_generation import PromptFormatterFromRepository,builder_server_js
 import asyncio
@@ -23,6 +22,7 @@ from util_semantic_search import SemanticSearch
 from util_example_based_prompt import ExampleBasedPromptFormatter
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from util_semantic_search import CSVDataHandler, SemanticSearch
+from util_clients import get_chat_model, get_embeddings_model
 # Suppress warnings
 from typing import List, Optional, Union, Type
 warnings.filterwarnings("ignore")
@@ -44,7 +44,7 @@ def js_generator(question, api_key, csv_path=None,solution_guide=None):
         "temperature": 0,  # Assuming temperature should be an integer or float, not a string
         "embedding_model": "text-embedding-ada-002"
     }
-    llm = ChatOpenAI(model_name=llm_options["llm_model"], temperature=0,api_key=api_key)
+    llm = get_chat_model(llm_options["llm_model"], api_key, temperature=0)
     contextualize_q_system_prompt = """Given a chat history and the latest user question \
     which might reference context in the chat history, formulate a standalone question \
     which can be understood without the chat history. Do NOT answer the question, \
@@ -84,9 +84,10 @@ def js_generator(question, api_key, csv_path=None,solution_guide=None):
     "stable_properties",
     glob="*",
     suffixes=[".js"],
+    exclude=["steam_tables_compiled.js"],
     parser=LanguageParser(),)
     docs = loader.load()
-    vectorstore = Chroma.from_documents(documents=docs, embedding=OpenAIEmbeddings(api_key=api_key))
+    vectorstore = Chroma.from_documents(documents=docs, embedding=get_embeddings_model(api_key, model=llm_options["embedding_model"]))
     retriever = vectorstore.as_retriever(search_type="similarity", search_kwargs={"k": 6},api_key=api_key)
     
     rag_chain = (
@@ -0,0 +1,223 @@
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+
+# How the root span of each trace is labelled in the trace viewer
+TRACE_LABEL_ATTRIBUTES = ("question",)
+TRACE_LABEL_LENGTH = 80
+
+
+class Span:
+    """
+    A single timed operation, shaped like an OpenTelemetry span.
+
+    Attributes:
+        name (str): The operation name.
+        trace_id (str): 32 hex character id shared by every span of one trace.
+        span_id (str): 16 hex character id of this span.
+        parent_span_id (str): The span_id of the enclosing span, or None for a root span.
+        attributes (dict): Key/value annotations, e.g. the model or the token counts.
+        events (list): Point-in-time annotations such as retries, as (name, time_unix_nano, attributes).
+    """
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: str = None, attributes: dict = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.attributes = dict(attributes or {})
+        self.events = []
+        self.status = "UNSET"
+        self.thread_id = threading.get_native_id()
+        self.thread_name = threading.current_thread().name
+        self.start_time_unix_nano = time.time_ns()
+        self.end_time_unix_nano = None
+        self._start = time.perf_counter_ns()
+
+    def end(self, ok: bool = True):
+        self.end_time_unix_nano = self.start_time_unix_nano + time.perf_counter_ns() - self._start
+        self.status = "OK" if ok else "ERROR"
+
+    def to_otel(self) -> dict:
+        """
+        Returns the span in the OTLP JSON span layout.
+        """
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano),
+            "attributes": [{"key": key, "value": _otel_value(value)} for key, value in self.attributes.items()],
+            "events": [
+                {
+                    "name": name,
+                    "timeUnixNano": str(timestamp),
+                    "attributes": [{"key": key, "value": _otel_value(value)} for key, value in attributes.items()],
+                }
+                for name, timestamp, attributes in self.events
+            ],
+            "status": {"code": f"STATUS_CODE_{self.status}"},
+        }
+
+
+def _otel_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Tracer:
+    """
+    Records nested spans for each question the pipeline processes, without needing a collector.
+
+    A span opened while no other span is open starts a new trace, so every call of
+    process_question becomes its own trace. The current span lives in a context
+    variable, so spans opened in worker threads started with contextvars.copy_context().run
+    nest under the span that submitted the work.
+
+    Finished spans are written as a Chrome trace (chrome://tracing, Perfetto) with one
+    process row per trace, or as OTLP JSON.
+    """
+
+    def __init__(self):
+        self._spans = []
+        self._lock = threading.Lock()
+        self._current = contextvars.ContextVar("tracer_current_span", default=None)
+
+    def current_span(self) -> Span:
+        """
+        Returns the innermost open span, or None.
+        """
+        return self._current.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """
+        Opens a span around the enclosed block.
+
+        Parameters:
+        name (str): The span name, e.g. "retrieval" or "llm_call:gpt-4".
+        **attributes: Initial span attributes.
+
+        Returns:
+        Span: The open span, yielded to the block.
+        """
+        parent = self._current.get()
+        trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        span = Span(name, trace_id, parent.span_id if parent else None, attributes)
+        token = self._current.set(span)
+        ok = False
+        try:
+            yield span
+            ok = True
+        finally:
+            self._current.reset(token)
+            span.end(ok)
+            with self._lock:
+                self._spans.append(span)
+
+    def set_attribute(self, key: str, value):
+        """
+        Sets an attribute on the current span, if there is one.
+        """
+        span = self._current.get()
+        if span is not None:
+            span.attributes[key] = value
+
+    def add_event(self, name: str, **attributes):
+        """
+        Adds a point-in-time event (e.g. a retry) to the current span, if there is one.
+        """
+        span = self._current.get()
+        if span is not None:
+            span.events.append((name, time.time_ns(), attributes))
+
+    def spans(self) -> list:
+        with self._lock:
+            return list(self._spans)
+
+    def chrome_trace(self) -> dict:
+        """
+        Returns the finished spans in the Chrome trace event format.
+
+        Each trace is shown as its own process, labelled with its root span, so a run
+        over several questions shows one flame chart per question.
+        """
+        spans = sorted(self.spans(), key=lambda span: span.start_time_unix_nano)
+        pids = {}
+        events = []
+        threads = set()
+        for span in spans:
+            if span.trace_id not in pids:
+                pids[span.trace_id] = len(pids) + 1
+            pid = pids[span.trace_id]
+            if span.parent_span_id is None:
+                label = span.name
+                for key in TRACE_LABEL_ATTRIBUTES:
+                    if key in span.attributes:
+                        label = f"{label}: {str(span.attributes[key])[:TRACE_LABEL_LENGTH]}"
+                events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": label}})
+            if (pid, span.thread_id) not in threads:
+                threads.add((pid, span.thread_id))
+                events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": span.thread_id, "args": {"name": span.thread_name}})
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(":")[0],
+                "ph": "X",
+                "ts": span.start_time_unix_nano / 1000,
+                "dur": (span.end_time_unix_nano - span.start_time_unix_nano) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_span_id": span.parent_span_id,
+                    "status": span.status,
+                    **span.attributes,
+                },
+            })
+            for name, timestamp, attributes in span.events:
+                events.append({"name": name, "ph": "i", "s": "t", "ts": timestamp / 1000, "pid": pid, "tid": span.thread_id, "args": attributes})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def otlp_json(self) -> dict:
+        """
+        Returns the finished spans in the OTLP JSON layout, as accepted by OpenTelemetry collectors.
+        """
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "question-generator"}}]},
+                "scopeSpans": [{"scope": {"name": "util_tracing"}, "spans": [span.to_otel() for span in self.spans()]}],
+            }]
+        }
+
+    def export(self, path: str):
+        """
+        Writes the finished spans to `path`, as OTLP JSON for a .otlp.json file and as a Chrome trace otherwise.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        trace = self.otlp_json() if path.endswith(".otlp.json") else self.chrome_trace()
+        with open(path, "w") as file:
+            json.dump(trace, file, default=str)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Returns the process-wide tracer.
+    """
+    return _tracer
@@ -1,6 +1,8 @@
 import re
 import os
 
+from util_telemetry import instrument
+
 def validate_image_path(image_path:str):
     """Process image path, if successful prints out message
 
@@ -32,6 +34,7 @@ def validate_email(email:str)->bool:
     return re.match(pattern=pattern,string = email) is not None
 
 
+@instrument("validation")
 def validate_question_html_format(html_string:str):
     """
     Validates if the provided HTML string contains specific required patterns.
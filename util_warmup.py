@@ -0,0 +1,122 @@
+import importlib
+import threading
+import time
+
+from util_telemetry import get_telemetry
+
+# Models the generation stages use, constructed ahead of the first stage
+WARMUP_CHAT_MODELS = [
+    ("gpt-4", 0),
+    ("gpt-4-turbo-preview", 0),
+]
+WARMUP_EMBEDDING_COLUMN = "question_embedding"
+
+
+class Warmup:
+    """
+    Runs the cold start work of the pipeline on a background thread.
+
+    The interactive CLI spends most of its first minute waiting for the operator, so
+    loading the example dataset, building the pooled clients and loading the prompts
+    and helper indexes happens in that time instead of in the first generation stage.
+    Every step is optional: a failing step is reported and skipped, and the code that
+    needs the resource later simply builds it itself.
+    """
+
+    def __init__(self, api_key: str, csv_path: str):
+        self.api_key = api_key
+        self.csv_path = csv_path
+        self.timings = {}
+        self.errors = {}
+        self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+
+    def _steps(self):
+        return [
+            ("dataset", self._load_dataset),
+            ("clients", self._build_clients),
+            ("prompts", self._load_prompts),
+            ("symbol_index", self._build_symbol_index),
+            ("export_agent", self._import_export_agent),
+        ]
+
+    def _load_dataset(self):
+        from util_semantic_search import CSVDataHandler
+
+        CSVDataHandler(self.csv_path, WARMUP_EMBEDDING_COLUMN).dataframe()
+
+    def _build_clients(self):
+        from util_clients import get_chat_model, get_embeddings_model, get_openai_client, get_requests_session
+
+        get_openai_client(self.api_key)
+        get_requests_session()
+        get_embeddings_model(self.api_key)
+        for model, temperature in WARMUP_CHAT_MODELS:
+            get_chat_model(model, self.api_key, temperature=temperature)
+
+    def _load_prompts(self):
+        from util_prompt_cache import HUB_PROMPTS, pull_prompt
+
+        for name in HUB_PROMPTS:
+            pull_prompt(name)
+
+    def _build_symbol_index(self):
+        from util_symbol_index import get_symbol_index
+
+        get_symbol_index()
+
+    def _import_export_agent(self):
+        # Only loaded for its import time, the export agent itself is built on first use
+        importlib.import_module("langchain.agents")
+        from util_file_export import get_file_tools
+
+        get_file_tools()
+
+    def _run(self):
+        telemetry = get_telemetry()
+        for name, step in self._steps():
+            start = time.perf_counter()
+            try:
+                with telemetry.stage(f"warmup:{name}"):
+                    step()
+            except Exception as e:
+                self.errors[name] = e
+                print(f"Warm-up step '{name}' failed, it will be done on first use instead: {e}")
+            self.timings[name] = time.perf_counter() - start
+
+    def start(self):
+        """
+        Starts the warm-up thread and returns immediately.
+        """
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Waits for the warm-up to finish.
+
+        Parameters:
+        timeout (float, optional): Maximum number of seconds to wait.
+
+        Returns:
+        bool: True if the warm-up has finished.
+        """
+        if self._thread.ident is not None:
+            self._thread.join(timeout)
+        finished = not self._thread.is_alive()
+        if finished and self.timings:
+            print("Warm-up finished: " + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in self.timings.items()))
+        return finished
+
+
+def start_warmup(api_key: str, csv_path: str) -> Warmup:
+    """
+    Starts warming up the dataset, clients, prompts and indexes in the background.
+
+    Parameters:
+    api_key (str): API key for the service.
+    csv_path (str): Path to the example dataset with precomputed embeddings.
+
+    Returns:
+    Warmup: The running warm-up; call wait() before the first generation stage.
+    """
+    return Warmup(api_key, csv_path).start()